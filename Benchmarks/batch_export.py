@@ -0,0 +1,52 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Learn files export time by number of worker processes (1/3-octave dual-band pattern on a synthetic source).
+# Usage: python -m Benchmarks.batch_export [max workers]
+
+import os
+import sys
+import time
+from tempfile import TemporaryDirectory
+import numpy as np
+from Model.AudioEngine.drill_export import export_drills
+from Model.audiodrill_gen import EQ2_freq
+from Model.exercise_gen import ExampleGenerator
+
+
+def run(max_workers=None, drills=112, samplerate=48000, slice_length=10, extension='.wav'):
+    max_workers = max_workers or os.cpu_count()
+    slice_length_fr = samplerate * slice_length
+    rng = np.random.default_rng(0)
+    audio = (rng.standard_normal((2, slice_length_fr * 4)) * 0.1).astype(np.float32)
+    exgen = ExampleGenerator(EQ2_freq, '+-', True, 'asc', inf_cycle=False)
+    freqs = exgen.seqGen()[:drills]
+    workers_options = sorted({1, *[2 ** i for i in range(1, max_workers.bit_length())], max_workers})
+    base = None
+    for workers in workers_options:
+        with TemporaryDirectory() as tmp_dir:
+            jobs = [(os.path.join(tmp_dir, f'{i}{extension}'), i % 4, freq, 12, 4.32, 40) for i, freq in
+                    enumerate(freqs)]
+            start = time.perf_counter()
+            export_drills(audio, samplerate, slice_length_fr, jobs, workers=workers, tmp_dir=tmp_dir)
+            elapsed = time.perf_counter() - start
+        base = base or elapsed
+        print(f'{workers} worker(s): {len(jobs)} files in {elapsed:.2f} s, speedup x{base / elapsed:.2f}')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else None)
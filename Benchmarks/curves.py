@@ -0,0 +1,75 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Fade / crossfade curves per drill: full-length curves (as eq_proc built them before) vs. the edge ramps eq_proc
+# applies now, with rampCurve uncached and cached: time and peak memory allocated (tracemalloc) per drill.
+# Usage: python -m Benchmarks.curves [number of drills]
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+from Model.AudioEngine.process import _crossfade_edges, _fade_edges, rampCurve
+
+
+def _full_length_curves(dry: np.ndarray, wet: np.ndarray, trans_len_fr: int, fade_len_fr: int):
+    # The former eq_proc: gain and fade curves as long as the drill, multiplied over every sample
+    duration_fr = wet[0].size
+    curve = np.ones(duration_fr, dtype=wet.dtype)
+    curve[:trans_len_fr] = np.linspace(0, 1, trans_len_fr)
+    curve[duration_fr - trans_len_fr:] = np.linspace(1, 0, trans_len_fr)
+    fade_in, fade_out = np.ones(duration_fr, dtype=wet.dtype), np.ones(duration_fr, dtype=wet.dtype)
+    fade_in[:fade_len_fr] = np.linspace(0, 1, fade_len_fr)
+    fade_out[duration_fr - fade_len_fr:] = np.linspace(1, 0, fade_len_fr)
+    return (wet * curve + dry * (1 - curve)) * fade_in * fade_out
+
+
+def _edge_curves(dry: np.ndarray, wet: np.ndarray, trans_len_fr: int, fade_len_fr: int):
+    _crossfade_edges(dry, wet, trans_len_fr)
+    return _fade_edges(wet, fade_len_fr)
+
+
+def run(drills=100, samplerate=96000, slice_length=30):
+    trans_len_fr, fade_len_fr = int(samplerate * 0.035), int(samplerate * 0.005)
+    dry = np.random.default_rng(0).uniform(-1, 1, (2, samplerate * slice_length)).astype(np.float32)
+    variants = (('full-length curves', _full_length_curves, False),
+                ('edge ramps, uncached', _edge_curves, False),
+                ('edge ramps, cached', _edge_curves, True))
+    for name, apply, cached in variants:
+        rampCurve.cache_clear()
+        elapsed = 0.0
+        for _ in range(drills):
+            wet = dry.copy()
+            if not cached:
+                rampCurve.cache_clear()
+            start = time.perf_counter()
+            apply(dry, wet, trans_len_fr, fade_len_fr)
+            elapsed += time.perf_counter() - start
+        # one more drill traced separately, as tracing slows allocations down
+        wet = dry.copy()
+        if not cached:
+            rampCurve.cache_clear()
+        tracemalloc.start()
+        apply(dry, wet, trans_len_fr, fade_len_fr)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{name}: {elapsed / drills * 1000:.3f} ms/drill, '
+              f'peak allocations {peak / 1024:.1f} KB/drill (drill: {dry.nbytes / 1024:.0f} KB)')
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
@@ -0,0 +1,46 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Cost of one drill rendered by eq_proc (Pedalboard chain): time and peak allocations, with the processed region
+# filtered alone and with the whole slice processed.
+# Usage: python -m Benchmarks.eq_engine [slice length, sec]
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+from Model.AudioEngine.process import eq_proc
+
+
+def run_drill_cost(slice_length=30, samplerate=96000, repeats=5):
+    audio = (np.random.default_rng(0).standard_normal((2, samplerate * slice_length)) * 0.2).astype(np.float32)
+    for proc_t_perc in (40, 100):
+        eq_proc(audio, samplerate, 1000, 63, proc_t_perc=proc_t_perc)
+        start = time.perf_counter()
+        for _ in range(repeats):
+            eq_proc(audio, samplerate, -1000, 63, proc_t_perc=proc_t_perc)
+        drill_time = (time.perf_counter() - start) / repeats
+        tracemalloc.start()
+        eq_proc(audio, samplerate, -1000, 63, proc_t_perc=proc_t_perc)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{samplerate} Hz, {slice_length} s stereo, {proc_t_perc}% processed: {drill_time * 1000:.1f} ms/drill, '
+              f'peak allocations {peak / 1024 ** 2:.1f} MB (slice: {audio.nbytes / 1024 ** 2:.1f} MB)')
+
+
+if __name__ == '__main__':
+    run_drill_cost(int(sys.argv[1]) if len(sys.argv) > 1 else 30)
@@ -0,0 +1,57 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Import-time report: the slowest modules (cumulative import time, from python -X importtime) and the peak resident
+# memory of importing a module in a fresh interpreter.
+# Usage: python -m Benchmarks.import_time [module (default: GUI.MainWindow.Contr.mw_contr)] [number of rows]
+
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure(module: str):
+    code = f'import resource, {module}; print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)'
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], capture_output=True, text=True,
+                          cwd=ROOT_DIR, env=env)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    timings = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        timings.append((int(cumulative_us), int(self_us), name.rstrip()))
+    max_rss_kb = int(proc.stdout.split()[-1])
+    if sys.platform == 'darwin':
+        max_rss_kb //= 1024  # bytes on macOS
+    return timings, max_rss_kb
+
+
+def run(module='GUI.MainWindow.Contr.mw_contr', rows=15):
+    timings, max_rss_kb = measure(module)
+    total_us = max(timings)[0] if timings else 0
+    print(f'{module}: {total_us / 1000:.1f} ms, peak RSS {max_rss_kb / 1024:.1f} MB')
+    print(f'{"cumulative ms":>14} {"self ms":>8}  module')
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:rows]:
+        print(f'{cumulative_us / 1000:14.1f} {self_us / 1000:8.1f}  {name}')
+
+
+if __name__ == '__main__':
+    run(*sys.argv[1:2], *[int(arg) for arg in sys.argv[2:3]])
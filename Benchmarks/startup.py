@@ -0,0 +1,64 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Startup regression check: starts the application with startup tracing (see Utilities/startup_trace.py) until the
+# audio sources are restored, prints the phases and the slowest imports and fails if the cold start (the first run)
+# exceeds the budget.
+# Usage: python -m Benchmarks.startup [budget in ms (default: 4000)] [number of runs (default: 3)]
+
+import json
+import os
+import subprocess
+import sys
+import time
+from tempfile import TemporaryDirectory
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def start_once(report_path: str, timeout=120):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, os.path.join(ROOT_DIR, 'main.py'), f'--trace-startup={report_path}',
+                    '--quit-after-startup'], cwd=ROOT_DIR, timeout=timeout, check=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    with open(report_path, encoding='utf-8') as f:
+        return wall_ms, json.load(f)
+
+
+def run(budget_ms=4000, runs=3, top_imports=10):
+    results = []
+    with TemporaryDirectory() as tmp_dir:
+        for i in range(runs):
+            results.append(start_once(os.path.join(tmp_dir, f'startup_{i}.json')))
+    cold_wall_ms, cold_report = results[0]
+    print(f'{"run":>4} {"process ms":>11} {"traced ms":>10}')
+    for i, (wall_ms, report) in enumerate(results):
+        print(f'{i + 1:>4} {wall_ms:11.0f} {report["Total_ms"]:10.0f}' + ('  (cold)' if i == 0 else ''))
+    print('\nCold start phases:')
+    for phase in cold_report['Phases']:
+        print(f'{phase["Start_ms"]:10.1f} ms  {phase["Duration_ms"]:9.1f} ms  {phase["Name"]}')
+    print('\nSlowest imports (cumulative / self ms):')
+    for imp in cold_report['Imports'][:top_imports]:
+        print(f'{imp["Cumulative_ms"]:10.1f} {imp["Self_ms"]:9.1f}  {imp["Module"]}')
+    if cold_wall_ms > budget_ms:
+        print(f'\nFAILED: cold start {cold_wall_ms:.0f} ms exceeds the budget of {budget_ms} ms')
+        return False
+    print(f'\nOK: cold start {cold_wall_ms:.0f} ms within the budget of {budget_ms} ms')
+    return True
+
+
+if __name__ == '__main__':
+    sys.exit(0 if run(*[int(arg) for arg in sys.argv[1:3]]) else 1)
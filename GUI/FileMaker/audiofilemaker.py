@@ -15,16 +15,19 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from PyQt6.QtCore import QUrl, QItemSelection, QItemSelectionModel, QObject, QTimer
+from GUI import globals as gb
 from GUI.ConvertToWAV_AIFF.convert_dialog_contr import ConvertFilesDialogContr
 from GUI.FileMaker.FileCreationSuccessDialog import SuccessDialog
 from GUI.MakeLearnTestFiles.make_learn_test_dialog_contr import MakeLearnTestDialogContr
 from GUI.Misc.tracked_proc import ProcTrackControl
 from GUI.Playlist.plsong import PlSong
-from Model.AudioEngine.convert_audio import convert_audio
+from Model.AudioEngine.convert_audio import convert_files
+from Model.AudioEngine.pinknoise_gen import PN_DEFAULT_FORMAT
 from Model.AudioEngine.sine_wav_gen import generateCalibrationSineTones
 from Model.make_learntest_files import makeLearnFiles, makeTestFiles
 from Utilities.Q_extract import Qextr
 from Utilities.exceptions import InterruptedException
+from definitions import PN
 
 
 class AudioFileMaker(QObject):
@@ -41,37 +44,40 @@ class AudioFileMaker(QObject):
         Dialog = ConvertFilesDialogContr()
         if not Dialog.exec():
             return
-        proc_list = []
-        for ind, S in enumerate(self.parent.mw_view.PlaylistView.selectedItems):
-            if not S.exists or not S.samplerate or not S.duration:
-                continue
-            Proc = ProcTrackControl(convert_audio, [S.path, S.samplerate],
-                                    {'target_samplerate_mode': Dialog.target_samplerate_mode,
-                                     'audio_format': Dialog.audio_format})
-            cur_row = self.parent.mw_view.PlaylistView.selectionModel().selectedRows()[ind]
-            Proc.track_ind = self.parent.mw_view.PlaylistView.model().mapToSource(cur_row).row()
-            if not Proc.exec():
-                self.parent.isErrorInProcess(Proc)
-                break
-            if Proc.return_obj is not None:
-                proc_list.append(Proc)
-        self._addConvertedFilesToPlaylist(proc_list)
+        pl_model = self.parent.PlaylistContr.playlistModel
+        songs = [S for S in self.parent.mw_view.PlaylistView.selectedItems if S.exists and S.samplerate and S.duration]
+        if not songs:
+            return
+        songs.sort(key=pl_model.rowOf)
+        converted, errors = {}, []
+        Proc = ProcTrackControl(convert_files, [[(S.path, S.samplerate) for S in songs]],
+                                {'target_samplerate_mode': Dialog.target_samplerate_mode,
+                                 'audio_format': Dialog.audio_format,
+                                 'block_s': gb.convert_block_s,
+                                 'workers': gb.convert_workers or None,
+                                 'done': converted,
+                                 'errors': errors})
+        if not Proc.exec():
+            self.parent.isErrorInProcess(Proc)
+        if errors:
+            self.parent.mw_view.error_msg(';\n'.join(errors))
+        # files converted before cancelling are added too
+        self._addConvertedFilesToPlaylist([(pl_model.rowOf(songs[ind]), path)
+                                           for ind, path in sorted(converted.items())])
 
-    def _addConvertedFilesToPlaylist(self, proc_list):
-        if len(proc_list) == 0:
+    def _addConvertedFilesToPlaylist(self, converted: list[tuple[int, str]]):
+        # converted: (row of the source file, converted file path), sorted by row
+        if len(converted) == 0:
             return
         self.parent.mw_view.PlaylistView.clearSelection()
         pl_model = self.parent.PlaylistContr.playlistModel
         selection = QItemSelection()
         proxy_model = self.parent.PlaylistContr.proxyModel
-        pl_model.layoutAboutToBeChanged.emit()
-        for ind, P in enumerate(proc_list):
-            ins_ind = P.track_ind + ind + 1
-            pl_model.playlistdata[ins_ind:ins_ind] = [PlSong(P.return_obj)]
+        for ind, (row, path) in enumerate(converted):
+            ins_ind = row + ind + 1
+            pl_model.insertSongs(ins_ind, [PlSong(path)])
             selection.select(pl_model.index(ins_ind, 0),
                              pl_model.index(ins_ind, 0))
-        pl_model.updCanLoadData(changeLayout=False)
-        pl_model.layoutChanged.emit()
         self.parent.mw_view.PlaylistView.selectionModel().select(proxy_model.mapSelectionFromSource(selection),
                                                                  QItemSelectionModel.SelectionFlag.Select |
                                                                  QItemSelectionModel.SelectionFlag.Rows)
@@ -102,6 +108,8 @@ class AudioFileMaker(QObject):
             return
         cropped = self.parent.ADGen.audiochunk.cropped
         cropped_normalized = self.parent.ADGen.audiochunk.cropped_normalized
+        if SA.name == PN and self.parent.ADGen.audiochunk.pn_format != PN_DEFAULT_FORMAT:
+            cropped = cropped_normalized = None  # pink noise is exported in the default format
         kwargs = {'audiodata': self.parent.TransportContr.PlayerContr.sourceAudioData(),
                   'EQPattern': self.parent.PatternBoxContr.PatternBox.currentText(),
                   'cropped': cropped,
@@ -116,7 +124,8 @@ class AudioFileMaker(QObject):
                   'drill_length': SR.slice_length,
                   'gain_depth': self.parent.EQSetContr.EQSetView.GainRangeSpin.value(),
                   'Q': Qextr(self.parent.EQSetContr.EQSetView.BWBox.currentText()),
-                  'disableAdjacent': EQP['DisableAdjacentFiltersMode']}
+                  'disableAdjacent': EQP['DisableAdjacentFiltersMode'],
+                  'workers': gb.export_workers or None}
         if Dialog.LearnBut.isChecked():
             kwargs['order'] = self.parent.freqOrder(audioFileGeneratorMode=True)
             kwargs['enumerate_examples'] = Dialog.EnumLearningExBut.isChecked()
@@ -14,14 +14,13 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import contextlib
 from pathlib import Path
 
 from PyQt6.QtWidgets import QFileDialog
 
 from GUI.Playlist.plsong import PlSong
 from Model.export_playlist import export_m3u_playlist
-from definitions import PLAYLIST_DIR, CURRENT_PLAYLIST_PATH
+from definitions import PLAYLIST_DIR
 
 
 def exportPlaylistWithRelPaths(mw, playlistdata: list[PlSong]):
@@ -45,9 +44,3 @@ def exportPlaylist(mw, playlistdata: list[PlSong], pathmode='absolute'):
         except Exception as e:
             mw.error_msg(f'Error exporting playlist! {str(e)}')
     return result
-
-
-def saveCurrentPlaylist(playlistdata: list[PlSong]):
-    Path(Path(CURRENT_PLAYLIST_PATH).parent).mkdir(parents=True, exist_ok=True)
-    with contextlib.suppress(Exception):
-        export_m3u_playlist(playlistdata, CURRENT_PLAYLIST_PATH, pathmode='absolute', ext='.m3u8', encoding='utf-8')
@@ -20,7 +20,9 @@ from PyQt6.QtCore import QObject
 from PyQt6.QtGui import QTextDocument
 from GUI.Help.QuickHelpWin import QuickHelpWin
 from GUI.Misc.TextBrowserDocParameters import setParameters
-from definitions import ROOT_DIR, Settings
+from GUI.qt_runtime import Settings
+from GUI.resources import registerHelpImages
+from definitions import ROOT_DIR
 from pathlib import Path
 from Utilities.str2bool import str2bool
 from Model.get_version import version
@@ -45,6 +47,7 @@ class HelpActions(QObject):
     def onGettingStarted_called(self):
         if self.GS_Win.isVisible():
             return
+        registerHelpImages()
         content_path = Path(ROOT_DIR, 'GUI', 'Help', 'Data', 'get_started.md').absolute()
         with open(content_path, 'r', encoding='utf-8') as f:
             content = f.read()
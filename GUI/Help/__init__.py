@@ -1 +0,0 @@
-from GUI.Help import help_img_rc
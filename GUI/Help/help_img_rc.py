@@ -1,9343 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.5.0
-# WARNING! All changes made in this file will be lost!
-
-from PyQt6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x03\xb1\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x00\xb1\x00\x00\x00\xb1\
-\x01\xc6-I\x8d\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x03.ID\
-ATH\x89\xa5\x93]hSg\x18\xc7\xff\xcf{\xbe\
-\x92\xe6\xf4\xc3T\x92\xd5\xda\xe6\x9c\x1c\xca\x10;\xbc\xa9\
-C\xf7q;\x10\xc4\x9b\xe1\x98\xb2\x0d\xe6\xc5\xa6\xf4\xa2\
-\xeb@\xd1\xe2\x9d\xe8@\xd11\xc6\x14\x06\x8e\xc1\x18\xee\
-j8)(~\xacPqs\xae\x17\xddX\xa1\x90&\
-Yj\x9a\xc4tM\xb7&i\x9b\xe6\x9c\xf3\xeeB\x03\
-MzNO\xc4\x07\xde\x8b\xf7\xf9\xf8\xff\xde\xf7}\xde\
-\x878\xe7h\xd6\xa2\x81\xe8\x01\x00H\x94\x137\x9a\xad\
-aN\xce~\xea\x97\xf5-zG\xa3\x9f\x13\x0fr\xe2\
-\xc1F?\x11\xd1\x00\x0dHM\x03V\xd5\xd5\x0e\xaa\xe2\
-'\x22\x12\x1a\x19\xcfV\x9di\x01\xedbA-\xecm\
-\x1a0S\x9c\xc9\x13p]\x0f\xe8\xc3u\xc92\xbb\xae\
-\xf8\x95\x1f\xd7\xfb\xa2m\xd17\x19\xd0\x95(&\xc6\x9d\
-\xb4\xc09w\x5c\x00\x84hK\xe4\x88[\xbc\xb6\xf4\x16\
-\xfd#C5Bnq\xaa5\xd9h7\xfa\xe2\xff\xc5\
-cN\x87\xe8\xeb\x88\xbe\x15\xea\xb4\x0e\x11\xd1\xeeg\x87\
-\xfa=\xbf \x5c\x8b\xfd\x9b\xb8\xed\x94o\xb4\x18\xbd\xf1\
-\xe5\xf8,\x80u\x00U\xff\x9c\x03;\x89\xb3\x91x9\
->\x01\x00F\xd0h\x0f\xb5\xdb\xdf\x0d\xec\xb2^\xff\xf0\
-]3\xa8Gld\x9f\x10VV\x08W\xaf\x89\x85\xc9\
-\xbf\xe8~\xa1\xe8\x7f\x7fz~\xba\xf8T\xc3x\x85\xc3\
->K@<^J\x0eox\xa2\x88\x1a\xd9\xa1\x05\xb4\
-\xcfj\xfb=Z\xef\xa3\xdbW\xb6\x99|*\xcc\xf9T\
-\x98g\xc7^\xe2#\xefm\xe7o\xef\xe9\xe5_\x9f\xea\
-\xe6\xa3_l3_\xd3#\xbf\xd6\xf2\xb5\x80vNo\
-\xd5_v|\xa2F{5\xa2\x0f\x1d\xdc_=s|\
-\xd0lm\x8c\xd96\xf0\xed\x0f\x22\xa6g\x18ZU^\
-\x1a\xbd#\x8d\xfc\x96J|\xe9\xa4\xe3\xf8\x8b\x00\xc0'\
-\xdb\x83\x9f\x1e\xdd(\x0e\x00\x8c\x01G\x0e\x9bP\x14\x8e\
-\xbd\x03\xb6*I\xf6\x90\x9b\x8e#\xa0\x87z\xfc\xaa\x0a\
-Uh\x9c\x82\x06\xfb\xe0\x1d\x13c\x0f\x18Z\x03<\xf0\
-\x5c\x83&\xfa\xc4ph\xeb\xe6\xe2\x00`D8\xfc~\
- \x1c\x02_\x08,t6\x0dH\xae$\xffN=\x86\
-\xe9\x05`\x0c8\xfdI\x15\xe9\x0cU\x92\xa5d\xaei\
-\x00\x00T\xd6(\x93\x9b'/\x06r\xf3\x84J\x05s\
-\xae\x87p\x0bd\xf3t\xf4\xd8\x099o\xd9\xee\xe2\x96\
-\x0d\x0c\x9e\x94\xf3\xb9'\xfc\xe3\xe7\x06$K\xc9\xc9\xb9\
-,\x9d\xff\xea\xaa\xb4\xe4\x96s\xf9\x1b\xb1\x94\xce\xe1b\
-\xac\x98\x9ar\xcbq\x9d\x83\x9a\xbdah\xa9\xd1\xef+\
-\xbd\x1dm\xf5yKE\xc2\xbe\xc3\xca\xdc/\x89T\x0f\
-\xdfD\xc4\xf5\x065[3\xe9\xca\xad{lC\xc3o\
-\xfe\xccL\xb3\x8a\xcb\x9b\x89\x03\x80\xe8\x05(,\xf2\xf1\
-{\xf7\x85\xd5`\x10\xeaz\xff\xddq\xa1\x92_\xa4\x07\
-^\xf5\x9e\x00\x9fO\xfd\xf3\xd1d\xf9\xdc\xc4\x1f\xa4\xac\
-\xf7\xdb\x9cU\x98\xc4&_\x18P.\x95\xfb\xc3\xdd\xe1\
-\xa1\xae\xee\xae\xba\xff\x94Mg\xd8R&?\x06\xe0\xe1\
-\x0b\x01,\xb2f-\xcb\x9a\xc9\xa4\xe7\xeaf\xdb\xb6\xf9\
-?\x22\xc4\xb4W\xbdg\x93g\xcb\xb3\x99\xe2b\xf1\x82\
-\xc0\x04Q\x96dY\x96dY`\x82XZ*]\x8a\
--\xc7<\x01\x9e7\x00\x00\xc5\xaf\xe8\x82$\xa8\xb2\xfc\
-\xb4\x0dfu\x0d\x8aO\xd1\x9a\xa9\xfd\x1flN\x8dw\
-\x93v\x9ex\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x01\xa2\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x00v\x00\x00\x00v\
-\x01N{&\x08\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x01\x1fID\
-AT8\x8d\xa5\xd3=JCA\x14\x05\xe0OM\x1b\
-;\xdd\x8b\xa44)\x8c\xe0\x02\xb4Q\x82\xb5\xba\x07\xad\
-\xfc\xe9l\x8d\xc1\xce\x9f&\x95\xd9\x80;\x10\x8c\x82\xae\
-@!)\x22\x08\x12\x8bw\x9f\xbe<\xc74\x1e\x18\x18\
-\xe6\x9cs\xb9w\xe6\x0ci40\xc48\xd6\x10\xf5\x94\
-p\xf6\x8f\x02\xeb\xb8\x8bB\x8d\xd8o\xfc\xa1\x05\x8b\xb8\
-\xc6)\xb6\xf1\x86\xcd\x02\xbf\x85\xd7\xe0Nq\x15\x9eo\
-\x5c\xe0\x1e=<\xe3\x10s\x05\xbe\x82\xe3\xe0z\xa1\xbd\
-\xc8\xc9%|\xa2\x96\xe8\xac\x12\xab\x8cZx\x96\xe0\x06\
-\xdd\x92`\x1e\x1d\xbcc\x84sTK\x9a\xaell{\
-\xf8\xc0Z\x81\xec\xa0\x8f\x154\xf1\x18Er\xac\x85g\
-'?8\xc0C\xa1\xedQ\x98s4\xe3,\x1f\xa7\x8f\
-}&\x9fq\x9c\x985\xc7\xcc4>5\xc2y\xb4\xdd\
-\xc4*\x9ep\x96\x18a\x97\xf4%V\xa3\xc8(V\xdb\
-\x94K\xfc\xf732\x19\xa4\x17\x1c\x95\x8c\x15\x9c\x04\xf7\
-+Hd\xb1\xbc\x94\xc5\xb4%\x8b\xedf\x81\xcf\xa3\xdc\
-\x0a\xcd%\x16\x12\x9d}\xa3\x8d[\xd9\x0f\xac\xc7\xbe=\
-\xcdPF\x1d\x03?\xdfy\x80\xe5\x94\xf0\x0b\xf0\x97P\
-\x80\xb5$E\x13\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x02\xd0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x03\x00\x00\x00(-\x0fS\
-\x00\x00\x01ePLTEGpLUUUPP\
-P|||\x81\x81\x81www\x7f\x7f\x7f888\
-\x82\x82\x82TTTVVVQQQSSSR\
-RRwwwSSSsssjjjZZ\
-Z\x5c\x5c\x5cjjj```]]]<<<\
-===wwwttt]]]IIIX\
-XXYYYGGGSSSKKKOO\
-O```eeedddeee\xdf\xdf\xdf\
-\xfe\xfe\xfe\xff\xff\xff\xf8\xf8\xf8\xe4\xe4\xe4MMM\xed\
-\xed\xed\xf5\xf5\xf5\xc9\xc9\xc9\x81\x81\x81\xf9\xf9\xf9QQ\
-Qnnn}}}\x90\x90\x90\x99\x99\x99\x8c\x8c\x8c\
-\xcb\xcb\xcb555\xf6\xf6\xf6kkk\xf3\xf3\xf3\x7f\
-\x7f\x7fjjj+++~~~PPPhh\
-h:::\x89\x89\x89***\x84\x84\x84ooo\
-\x85\x85\x85ttt___\xbd\xbd\xbd\xec\xec\xec\xe1\
-\xe1\xe1|||\xe5\xe5\xe5\xe8\xe8\xe8\xea\xea\xea\xcf\xcf\
-\xcf\x8f\x8f\x8fOOO\xee\xee\xee\xc5\xc5\xc5\xfb\xfb\xfb\
-\xf0\xf0\xf0\x93\x93\x93\x19\x19\x19JJJ&&&U\
-UU\xa1\xa1\xa1FFF\x91\x91\x91]]]``\
-`\xf1\xf1\xf1111\x0f\x0f\x0f\xe7\xe7\xe7\xfc\xfc\xfc\
-666;;;(((\x1c\x1c\x1c\x88\x88\x88\xa2\
-\xa2\xa2\xca\xca\xca\xd5\xd5\xd5\xe9\xe9\xe9\x94\x94\x94yy\
-yKKKZZZ\x83\x83\x83\xd1\xd1\xd1A\xc8\x0a\
-\x18\x00\x00\x00'tRNS\x00\xbf\xfd\x98\xd7\xfd\xf8\
-\x08\x96\x98\x98\xf8\x96\xd7\xbf\xfd\x98\xfd\x96\xd7\x96\xf8\xf8\
-\x08\x08//\x08/\x08\x08/\x08////\xd7\xd7\
-\xa6r\x91\xc5\x00\x00\x00\xf3IDAT\x18\xd3-\x8f\
-\xd3z\x05a\x0cEsl\xa36\xd2\xf958\xb6Y\
-\xdb\xb6\xdd\xe7\xef\xcc\xd7\xae\xabd_\xecd\x01\xe8\x0c\
-;\xadv\xbb\xd59\x04\x7f\x8cYl\x09%\x95R\x12\
-6\xcb\x88\xb1O\xfa\x0b\x99\x8d\xd5\xf5\xb5\xe5l\xa6\xe0\
-\x1f\xd7\x83`\xfd\xf9\xa6HT5\xbf\x8d'\xf5 \xc0\
-L\xa8\xf9\x96\xbf]\xd0\xe1g\xf8\x14\x9a\x85h\xffG\
-\xbc7%I\xda9\xaf\xf1\x97~\x14\xe6{T\xfd\xfe\
-\x90\x8a\xfb\xa7w\x0d\x81\xbd9\x88u)\xf9\xfczU\
-\x8e\xaf\x1e[\x84vc\x10oS\xd2\xaad/r\x07\
-\xd7\x0f\x84\xb6\xe3\x10\xe9\xa0h\xdcK{+\x95\xa3\x9c\
-\xc0N\x04\xc2\x9a\xcck\x9a^\xba\xb8u\xc8e-\x0c\
-S\x81*^\xee\x1ag\x976\xb1\x1a\x98\x06p\xb34\
-rA\x88\xe0\x98fn\xfdS\x87\x89%e\xa4\x14\xe5\
-$3\x0d\x1a2\x0e\x97\x99\x95K\xa523\xbb\x06\xfe\
-}'\xbc>\x8f\xc7\xe7\x1d5\xe6_\x88\x5c,X\xea\
-\x06-\x02\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01o\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x09pHYs\x00\x00\x00v\x00\x00\x00v\
-\x01N{&\x08\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00\xfcID\
-AT8\x8d\xa5\xd3MN\x02A\x10\x05\xe0\x8f\xd9\x8f\
-G\x10w\xc0i \xc8\x1a\x96\xee\xdc\x8a\x871\x92\x09\
-\x17p\xe1\xcf)\xd4\x9dz\x00\x91K0\xba\xe8B;\
-\x13fb\xf4%\x9dIW\xf5{]\xf5\xba\x86\x7f\xa2\
-\xd7\x12\x1fa\x8cA\xec_q\x13\xdfN\x1ca\x8d\x1a\
-\x1b\xdc\xe2\x0e\x1f\x11\xabPv\x91\x9f\xf1\x8e\x09\x8a,\
-W`\x1a\xa2Om\x22\xeb \x1fwT\xd8\x0f\x91\xaa\
-\x99\x18E\x89\x93\xd8\x8f1\xcf\xf2\x8b\x88\xc1)v\x18\
-\xe6\x02\x97\xa1\x5cd\x84\x1a\xe7\xb1\xeaL\xb0\x90<Y\
-\xe6\x02\xd7\x92Y9\xce\x82\xb8\x17\xca\xf1\x80\xab\xbd\x1a\
-|j\x7fR\x07r\xbd\xe0|c\xf9\x8b\x16\x16Y\x0b\
-[\x5c\xe4\x02C\xc9\x98i\xec\x9b&\xce\xfd\x988\x8b\
-\xb3\x03\x0dTQE\xbf\xa3\x95\x93\xb8}u(YJ\
-C\xb2\x91\x9e\xaa9H\xb3 ?\xea\x98\xc62*\xd9\
-\xc5\xe1\xfbX\xdb\x88\xad\x9a\xe46\xe7\x87R\xcf\xfba\
-y\x91~\xa6\xb7\xb6\x9b\xff\x8c/\xac\xc8>\xe3\xb7\xa1\
-\x05E\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01Q\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x03\x00\x00\x00(-\x0fS\
-\x00\x00\x00\x03sBIT\x08\x08\x08\xdb\xe1O\xe0\x00\
-\x00\x00\x09pHYs\x00\x00\x00{\x00\x00\x00{\x01\
-GKK\x9b\x00\x00\x00\x19tEXtSoft\
-ware\x00www.inkscap\
-e.org\x9b\xee<\x1a\x00\x00\x00KPLT\
-E\xff\xff\xff\xff\x00\x00\xff\x00\x00\xff+\x00\xff$\x00\
-\xf6\x1b\x09\xf4\x1c\x0b\xf6\x1b\x0c\xf7\x1d\x0d\xf5\x1d\x0c\xf6\
-\x1c\x0e\xf7\x1c\x0c\xf6\x1c\x0c\xf6\x1b\x0e\xf6\x1c\x0d\xf6\x1c\
-\x0d\xf6\x1c\x0d\xf6\x1c\x0d\xf6\x1c\x0c\xf6\x1c\x0e\xf6\x1c\x0d\
-\xf6\x1c\x0d\xf6\x1c\x0d\xf6\x1c\x0c\xf6\x1c\x0d\xa0\x1c%<\
-\x00\x00\x00\x18tRNS\x00\x02\x04\x06\x07\x1c.U\
-`jn\x7f\xa5\xa8\xbd\xd0\xd8\xdb\xe1\xe2\xe4\xe9\xef\xf5\
-*c\xc2I\x00\x00\x00TIDAT\x18\x95\x85\x8e\
-G\x0e\x80 \x14D\xc7\x02\x16\x10\xac0\xf7?\xa9\x0b\
-?\x11\xc2\x82\xb7|\xc9\x14\xa0\x8d2v\x13\xacQ\x80\
-\x0e\xcc\x08\x1a\x8e\x05\x0e\x91$\xe3\x95D\x04I\xd2\x0f\
-\xcb-F\x040\xaeO)\xba\xe9\xc8E?\xef)\xf2\
-\x95\x9e\x7fi5[\x1d\xab\xae7y\x01\xba\x9d\x0e\x8a\
-7taB\x00\x00\x00\x00IEND\xaeB`\x82\
-\
-\x00\x00\x01\x0c\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
-\x00\x00\x00\x04sBIT\x08\x08\x08\x08|\x08d\x88\
-\x00\x00\x00\x09pHYs\x00\x00\x02C\x00\x00\x02C\
-\x01,\xe6\xb7\xe7\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00\x00\x89ID\
-AT8\x8d\xc5\x93\xc1\x09\x850\x10D\xdf~\x0fz\
-\xb7\x10;\x10-\xc3\x96\xb4\xa4_\x8cUx\x1e/\x1b\
-\xd0\x98xI\xc0\x85\x81%\x99}\x90Lb\x92(\xa9\
-_\xd1\xf4\x1b\xc0\xcc\xc6T\xff(I7\x01\x0d\xb0\x01\
-\x02:\x97|\xady\xf8\xa3\xe1\x1e\xf8\xfb@\x0c\x90\xef\
-\xf5I\x000\x00\xfb\xc5\x9c\x02\xc8=\xc3\x0d\x00,\xc0\
-\x11\x19s\x00\xb9w\x09\x09\xae\x09CP\x9b\x01\x04\xad\
-\xc51\x96\x1f\xa1\xca%V\x89\xb1\xcaC\x8a@\xd3\xa5\
-\x9fs>\xfb\xfc7\x9e\x8d\xdb\xec\xb5I\x10\xd1\x8e\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02\xcc\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x10\x00\x00\x00\x10\x08\x03\x00\x00\x00(-\x0fS\
-\x00\x00\x01bPLTEGpLwww||\
-|PPPTTT\x81\x81\x81\x7f\x7f\x7f888\
-\x82\x82\x82UUUVVVwwwQQQS\
-SSRRRSSSsssjjj\x5c\x5c\
-\x5cZZZjjj]]]```<<<\
-===wwwtttXXX]]]I\
-IISSSYYYGGGKKKOO\
-O```eeeeeeddd\xdf\xdf\xdf\
-\xfe\xfe\xfe\xff\xff\xff\xf8\xf8\xf8\xe4\xe4\xe4MMM\xf5\
-\xf5\xf5\xed\xed\xed\xc9\xc9\xc9QQQ\xf9\xf9\xf9oo\
-o\x81\x81\x81\x90\x90\x90nnn\xf3\xf3\xf3}}}\
-\x99\x99\x99\x8c\x8c\x8c555kkk\x7f\x7f\x7fj\
-jj~~~\xcb\xcb\xcbhhh\xd0\xd0\xd0\xfb\xfb\
-\xfb+++```\xf1\xf1\xf1___\x84\x84\x84\
-\x85\x85\x85ttt;;;***\xbd\xbd\xbd\x8f\
-\x8f\x8fOOO\xec\xec\xec\xe8\xe8\xe8\xe5\xe5\xe5\xea\xea\
-\xea\xcf\xcf\xcf\xe1\xe1\xe1JJJ&&&\xe7\xe7\xe7\
-\x19\x19\x19\x8b\x8b\x8b\xa2\xa2\xa2|||\x0f\x0f\x0f\xba\
-\xba\xbaggg\xf6\xf6\xf6\xe9\xe9\xe9\x91\x91\x91HH\
-H(((\xf0\xf0\xf0\x9b\x9b\x9b\xee\xee\xee\x89\x89\x89\
-\x83\x83\x83KKK\xd1\xd1\xd1\xf2\xf2\xf2\xa1\xa1\xa1P\
-PPZZZzzz\x88\x88\x88:::DD\
-D222VVV\xca\xca\xca\xe9\xf3\xc4-\x00\x00\
-\x00'tRNS\x00\xfd\x98\xfd\x98\xd7\xf8\x08\x96\xbf\
-\x98\xbf\xf8\x96\xd7\xfd\x98\xfd\xd7\x96\x96\xf8\xf8\x08\x08/\
-/\x08\x08/\x08\x08////\xd7/\xd7\x0d\xf1O\
-\xe0\x00\x00\x00\xf2IDAT\x18\xd3-\x8f\xd5zB\
-A\x10\x83\x07w\x97\xbaQ\xd9\xae\x1e\xc1\x1d\x8aSw\
-ww\x7f\xff\xee\xf9\xca\x7f\x95\xc9E2\x01\x90\x8c:\
-mv\xbb\xcd9\x02\xff\x8c\x99M\xe9d*\x95L\x9b\
-\xcc\xe3\xc6=\xe9)\xe6\xb77\xb76v\xaa\xf9\xa2g\
-J\x1a\xc1\xda\xd1~\x86h\xda\xf9\x1dz\xa9\x05\x01f\
-C\xf7\x17\xa7\x99E\xc9R\x0b}\x84\xe6!\xda~\xe2\
-\x97\x87u\x8c\xf1\xdb\x8f\xf8mGa\xaeG\xb5\x07\xfd\
-\xec\xf6\x19\x7f\xf59\xea-@\xbcK\xc9\xe3\x95\xda|\
-\xaf\x7f/\x13\xda\x8dC\xacC\xc9\xf5\xc9A\xa1Ym\
-H\xa3\x13\x83\xb0\x8exa\xafq|\x83\xfb\x9f\x1c\xe9\
-a\x88\xa8\x8a\xd8][\x91\xa1\xea\xabP\xd4\x08\xcc\x04\
-*hu}P[\x09$\x00\xdc,\x87\x04'\x84\x0b\
-\x94cn\xf9\xa9\xc3\xc5\xb2\x0a\xa2\x14)Y\xe6\x1a6\
-\xc68\xac\x16V.\x95\xca\xccb\x1d\x1a\xec\x9d\xf6\xf9\
-\xbd^\xbfo\xc2\xd0\x7f\x84\x0b,/L\x9fw\x81\x00\
-\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x01\xc0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x96\x00\x00\x00\x96\x01\x03\x00\x00\x00\x06\xcf\xe3\xa1\
-\x00\x00\x00\x06PLTE\xff\xff\xff\x00\x00\x00U\xc2\
-\xd3~\x00\x00\x00\x09pHYs\x00\x00\x0e\xc4\x00\x00\
-\x0e\xc4\x01\x95+\x0e\x1b\x00\x00\x01`IDATH\
-\x89\xbd\x96A\x8a\xc30\x10\x04;\xf8\xa0\xa3\x9f\xa0\x8f\
-\x04\xf9c\x81\x18\xfc1\x9b\xfd\x88\x9e\xe0\xa3\x0e\xc1\xbd\
-=\xa3,\x9b\x5c7\xe3\x15\xc6\xe0\xba\x0c\xd33\xdd2\
-\x10|F\x92\x0f\xe0\x0aL\xe4\xa6\x0f\xce\xf1l\x06n\
-\x99k&k\xdav\x18\x08g\x0b\xdb\x0d\x0dHG\xc6\
-e\xe7q\x16\xcb\xe9\x8b\xedROe\x90\x84*\xcd\xed\
-$\xe6\xfa\xb5\x81i\xc5\xbb\xa6\x7fd6s\xf5Q[\
-\xc9\xe9u\x0f\x02Y?m\xa8z\xab\xf4\xcb\x89c\xaa\
-\xdb\xee\xd4\xe2\xb6I\xa5\xc7\xde^0\xc3P\xd3R\xcd\
-\x1f%\xcb\x1f\xcd\x05\x8df2\x07m@<rZ\xc7\
-\xe6\xcdE3dM\x85\xeb\xcf\xe3\xbd}\xc0FYY\
-K:\x99\x17\xd4D:p\x02[hZi\x186\x92\
-\xaeU4\xc3\xbdv\xb3\xa9b\xe2\xeeu\xe3\x19\xb9T\
-\x85\x9f\xe6!\xfd\xdae?\x83U\xdb]X\xc6\xe2\xa9\
-_4\x1b\x1f\xbe\x07j\xaf\xc0v\xb7\x98\xa6\x9f\xb09\
-[nh\xa3\xe8\xae+V#\x9aI\xa89[\x98J\
-\xa8iw\xad\xc2Yol\xb0\xe4K\xb4\xd5\x9a\xc3Y\
-\xb7\xb0,b\xf7\xb4w\x18\xcfz\x8e\xfb\xc5S\xfd\xee\
-\x01\xe2\x99\xc5\x9d\xa5\xe0SB|\xca\xfa\x9dlRU\
-\xd3\xaa\x9c\xc6p\xcd\x96\xd9\xb2\xf5\xef\xbf@8\x83\x01\
-+\xce\x1d\xf1\xecy\xd5T\xff\x17 \xb73\x98\xcf\x1c\
-\xda\xdd\xcdc\xb6 \x9e\xfd\xc3\xf9\x06\xa2\x0c2)\x5c\
-\xafD\xa5\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x96\x19\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02:\x00\x00\x01w\x08\x06\x00\x00\x00\xacf\xe1\xef\
-\x00\x00\x00\x09pHYs\x00\x00\x0f\xae\x00\x00\x0f\xae\
-\x01\x04\xe3\xc0\x89\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
-ATx\xda\xec\xddw|TU\xfa\xf8\xf1\xcf\x9d\x96\
-\xdeI\x83\x84\x1e\x08\x10\xa4\x84\x8e\xf4*e\x01\x05T\
-XP\xec]D]W]\xbfb]\xd7\xb6\xac?]\
-\x17Q\xc1U\xb1PdQz\x0f\x01\x04\x02J\x0b]\
-\x10\xa9\xa9$!m\xda\xf9\xfdq\x9dI\x062!\x08\
-\x01\x02\xcf\xfb\xf5\xca\x0bf\xe6\xcc\x9dg\xce=\xf7\xce\
-s\xcf\xb9\xe7^M)\xa5\x10B\x08!\x84\xb8\x06\x19\
-\xa4\x0a\x84\x10B\x08!\x89\x8e\x10B\x08!\x84$:\
-B\x08!\x84\x10\x92\xe8\x08!\x84\x10BH\xa2#\x84\
-\x10B\x08!\x89\x8e\x10B\x08!\x84$:B\x08!\
-\x84\x90DG\x08!\x84\x10B\x12\x1d!\x84\x10B\x08\
-It\x84\x10B\x08!$\xd1\x11B\x08!\x84\x90D\
-G\x08!\x84\x10B\x12\x1d!\x84\x10BH\xa2#\x84\
-\x10B\x08!\x89\x8e\x10B\x08!\x84$:B\x08!\
-\x84\x10\x92\xe8\x08!\x84\x10BH\xa2#\x84\x10B\x08\
-!\x89\x8e\x10B\x08!$\xd1\x11B\x08!\x84\x90D\
-G\x08!\x84\x10B\x12\x1d!\x84\x10B\x08It\x84\
-\x10B\x08!$\xd1\x11B\x08!\x84\x90DG\x08!\
-\x84\x10B\x12\x1d!\x84\x10BH\xa2#\x84\x10B\x08\
-!\x89\x8e\x10B\x08!\x84$:B\x08!\x84\x10\x92\
-\xe8\x08!\x84\x10BH\xa2#\x84\x10B\x08!\x89\x8e\
-\x10B\x08!$\xd1\x11B\x08!\x84\x90DG\x08!\
-\x84\x10B\x12\x1d!\x84\x10B\x08It\x84\x10B\x08\
-!$\xd1\x11B\x08!\x84\x90DG\x08!\x84\x10\x92\
-\xe8\x08!\x84\x10B\x5c[LR\x05e\xce\x9c9\xc3\
-o\xbf\xfdF`` QQQ\xf8\xf8\xf8H\xa5\x08\
-!\x84\x105\x98\xf4\xe8\xfcN)\xc5\x8f?\xfe\xc8\x93\
-O>\xc9\x94)S\xf8\xed\xb7\xdfPJI\xc5\x88k\
-\x8e\xd3\xe9$''\x07\x87\xc3qA\xef\xfb\xf5\xd7_\
-\xc9\xce\xce>\xe7y\xab\xd5\xca\xa1C\x878|\xf8\xf0\
-\x05/S\xd4\x0c\xb9\xb9\xb9\xfc\xf2\xcb/R\x11B\x12\
-\x9d\x9a\xac\xa8\xa8\x88Y\xb3f\x91\x9a\x9a\xca7\xdf|\
-CZZ\x1a6\x9bM*F\x5cS>\xfc\xf0C\xc2\
-\xc3\xc3\x89\x88\x88\xc0\xc7\xc7\x87S\xa7NU\xe9}\x19\
-\x19\x19\xf4\xe8\xd1\x03\xab\xd5\xea~\xae\xa0\xa0\x80\xc7\x1f\
-\x7f\x9c\xa8\xa8(\x1a6lH\x83\x06\x0d\x08\x0f\x0f\xe7\
-\xc5\x17_\xc4n\xb7_\xf2\xd8\xe7\xcc\x99\xc3\xfe\xfd\xfb\
-/\xf9r\xc7\x8e\x1d\x8b\xa6i\x15\xfe5h\xd0@\x1a\
-\xcd\xef\x07\x82\xbd{\xf7\xe6\xe8\xd1\xa3R\x19\xa2\xc6\x91\
-\xa1\xab\xdf7\xe2\x0d\x1b6\xb0i\xd3&\x0a\x0a\x0a(\
-((`\xe5\xca\x95$''\xd3\xb8qc4M\x93\
-J\x125\xde\x89\x13'x\xf4\xd1G\x09\x0c\x0c\xe4\x89\
-'\x9e\xc0l6\x13\x1d\x1d]\xa5\xf7N\x9c8\x91q\
-\xe3\xc6\x11\x1b\x1b\x0b\xe8\xc3\xbc]\xbat!77\x97\
-)S\xa6\xd0\xbd{w\x94R\xcc\x9b7\x8fg\x9f}\
-\x96c\xc7\x8e\xf1\xf1\xc7\x1f_\xb2\xd8\xf7\xee\xdd\xcb\xc8\
-\x91#\xd9\xb4iS\xb5\xd4M||<\xef\xbc\xf3\xce\
-9\xcf\x07\x04\x04H\xc3\x01\xc2\xc3\xc3y\xe0\x81\x07x\
-\xf8\xe1\x87\xf9\xdf\xff\xfe'\x15\x22j\xdc\x8f\xfcu\xaf\
-\xb0\xb0P\xdd{\xef\xbd*88X\x01J\xd34\x15\
-\x17\x17\xa7f\xce\x9c\xa9\xacV\xabT\x90\xb8&\xacY\
-\xb3F\x01\xea\xb9\xe7\x9e\xbb\xa0\xf7\xa5\xa7\xa7+\xb3\xd9\
-\xac222\xdc\xcfM\x9a4I\xf9\xf9\xf9\xa9\x03\x07\
-\x0e\x9cS\xfe\xed\xb7\xdfV\x9a\xa6\xa9\x9f\x7f\xfe\xd9\xe3\
-y\x9b\xcd\xe6\xb1\x8c\x8a8\x9dN\x95\x99\x99\xa9\x1c\x0e\
-\x87\xc7\xf3\xbbw\xefV\x80\xda\xb4iS\x85\xdb\xef\xe9\
-\xd3\xa7+]n^^\x9er:\x9d\x15\xbe6f\xcc\
-\x18\x95\x94\x94T\xe5\xfa\xc8\xcb\xcb;'\xbe\xfc\xfc|\
-\x95\x9f\x9f\xef\xf5=\xae\xef~\xf6\xfb.T~~\xbe\
-*((\xa8\xb4LQQQ\xa5\xf5a\xb5ZUf\
-f\xe6\x1f\xfal___\x95\x96\x96&\x1b\x93\xa8Q\
-\x0c\x92\xe8\x95\xf5\xe6\xe4\xe7\xe7\xbb\x9f;z\xf4(\xab\
-V\xad\xe2\xf0\xe1\xc3r\xae\x8e\xb8&\xb8\xdawdd\
-\xe4\x05\xbd\xef\xbd\xf7\xde\xa3G\x8f\x1e\xee\xf7\xd9l6\
->\xfb\xec3\xc6\x8c\x19C\xa3F\x8d\xce)\xff\xc0\x03\
-\x0f\xb0x\xf1b\x1a7n\x0c\xe8\xe7\x04\xbd\xf4\xd2K\
-\xd4\xaaU\x8b\xa8\xa8(BCCy\xe4\x91G(-\
--\x05\xf4\xf3?\xc2\xc3\xc3\x99>}:\x09\x09\x09D\
-FF\x12\x12\x12\xc2\xa3\x8f>\x8aR\x8a}\xfb\xf6\xd1\
-\xb1cG\x00\xfa\xf4\xe9\xc3\xd3O?\xed\xee\xa1\x1a:\
-t(\xc1\xc1\xc1\x84\x86\x86\xd2\xb8qc\xbe\xfd\xf6[\
-w\x1c\x1f}\xf4\x11={\xf6\xe4\xee\xbb\xef&44\
-\x94\xee\xdd\xbb\xff\xe1\xba\xfb\xec\xb3\xcf\xe8\xdc\xb93\x0f\
-?\xfc0aaa\xeex\xf6\xee\xddK\x8f\x1e=\x08\
-\x09\x09!44\x94\x96-[\xb2b\xc5\x0a\x8f\xfd\xcb\
-\x1bo\xbcADD\x04QQQ4n\xdc\x98\x7f\xfe\
-\xf3\x9f\x1e\xeb\xa0y\xf3\xe6L\x992\xc5\xe3\xf3F\x8f\
-\x1e\xcd\xbd\xf7\xde\xeb~\xbcg\xcf\x1e\xbaw\xefNH\
-H\x08!!!\xb4l\xd9\x92\x95+W\xba_\x9f<\
-y2\xb7\xddv\x1b\x8f=\xf6\x18aaa\x84\x86\x86\
-\xd2\xbcys6l\xd8\xe0.SXX\xc8\x03\x0f<\
-@pp0\x91\x91\x91\xd4\xaaU\x8b\xa9S\xa7\x020\
-~\xfcx\xfa\xf7\xef\xef\x11CQQ\x11qqq|\
-\xf3\xcd7\x00\x04\x05\x051`\xc0\x80sb\x15Bz\
-t\xaer\xc5\xc5\xc5\xea\xee\xbb\xefV!!!\x0ap\
-\xffi\x9a\xa6\xe2\xe3\xe3\xa5WG\x5c\x13:u\xea\xa4\
-\x02\x03\x03\x15\xa0\xfc\xfd\xfdUXX\x98\xfa\xf7\xbf\xff\
-]\xa5\xf7\xc6\xc5\xc5\xa9w\xdf}\xd7\xfd\xf8\xc0\x81\x03\
-\x0aP\xd3\xa7O\xaf\xd2\xfb_~\xf9e\xe5\xef\xef\xaf\
-\xbe\xfd\xf6[u\xfa\xf4i\xb5b\xc5\x0aU\xbbvm\
-\xf5\xd0C\x0f)\xa5\x94\xca\xce\xceV\x80\x8a\x8a\x8aR\
-\xdf}\xf7\x9d:t\xe8\x90z\xf5\xd5W\x15\xa0\x96-\
-[\xa6\xacV\xabZ\xbat\xa9\x02\xd4w\xdf}\xa72\
-33\x95\xcdfS\xadZ\xb5R\xc9\xc9\xc9j\xdb\xb6\
-m*;;[\xbd\xf9\xe6\x9b\xcah4\xaa\xd5\xabW\
-+\xa5\x94\xfa\xd7\xbf\xfe\xa5|||T\xc7\x8e\x1d\xd5\
-'\x9f|\xa2\xe6\xcc\x99\xe3\xb5G\xa7~\xfd\xfaj\xd9\
-\xb2e\xe7\xfc\xd9l6\xa5\x94RS\xa7NU>>\
->*99Y}\xf2\xc9'\xea\x9bo\xbeQ\xa7O\
-\x9fVqqq\xaa\x7f\xff\xfej\xdf\xbe}\xea\xd4\xa9\
-Sj\xd2\xa4I\xca\xd7\xd7W\xed\xde\xbd[)\xa5\xd4\
-\xf4\xe9\xd3\x95\xc9dR3g\xceT%%%j\xce\
-\x9c9*  @\x19\x8dF\xf7\xe7\xd7\xae][\xbd\
-\xfe\xfa\xeb\x1e1\xddt\xd3M\xea\xf6\xdboWJ)\
-\x95\x9b\x9b\xab\xea\xd4\xa9\xa3\x06\x0c\x18\xa0\xf6\xef\xdf\xaf\
-N\x9d:\xa5\x9ex\xe2\x09\xe5\xe7\xe7\xa7\xf6\xec\xd9\xa3\
-\x94R\xea/\x7f\xf9\x8b2\x9b\xcdj\xe4\xc8\x91j\xcf\
-\x9e=j\xe3\xc6\x8d\xea\x86\x1bnP\xc9\xc9\xc9\xeee\
-\x8e\x1b7N\xc5\xc4\xc4\xa8e\xcb\x96\xa9\xfc\xfc|\xf5\
-\xef\x7f\xff[i\x9a\xa6V\xadZ\xa5\xe6\xce\x9d\xab4\
-MS\x07\x0f\x1et\x97\xff\xf2\xcb/U``\xa0G\
-\x0f\xd2\xd4\xa9SUxx\xf8E\xf7L\x09q9]\
-\xd7\x89\x8e\xd3\xe9T+W\xaeT-[\xb6\xf4Hr\
-\xca\xff\xddw\xdf}j\xdf\xbe}^\xbb\xbd\x85\xa8\x09\
-\xbe\xfd\xf6[\xf5\xc8#\x8f(@\x8d\x1e=ZM\x9d\
-:Um\xdf\xbe\xfd\xbc\xef;r\xe4\x88\x02\xd4\xd2\xa5\
-K\xdd\xcfm\xdc\xb8Q\x01\xea\x7f\xff\xfb_\x95>;\
-<<\x5c=\xff\xfc\xf3\x1e\xcf}\xf2\xc9'\xcab\xb1\
-\xa8\xa2\xa2\x22w\xa2\xf3\xd2K/yl\x9b~~~\
-\xea\xcd7\xdf\xacp\xe8j\xc9\x92%\x0aP;v\xec\
-\xf0Xn\xbf~\xfd\xd4\xa8Q\xa3\xdc\x89\x0e\xa0v\xee\
-\xdcYi|c\xc6\x8c\xf1\xba\xfd\xe7\xe6\xe6\xba\x7f\xe0\
-\x01\x8fa\x9bi\xd3\xa6)\x93\xc9\xa4\xb2\xb2\xb2<\xe2\
-NLLT\x93&MRJ)\xd5\xa1C\x07u\xeb\
-\xad\xb7z|\xde\xe3\x8f?~A\x89\xce\xd4\xa9S\x95\
-\xd9lV999\x1e\x9f\xd3\xa4I\x13\xf5\xd4SO\
-\xb9\x13\x1d\x1f\x1f\x1f\x8f\xe1\xb3\x7f\xfe\xf3\x9f\xcad2\
-)\xa7\xd3\xa9\xb2\xb2\xb2\x94\xc9dR\x1f}\xf4\x91\xc7\
-\xe7L\x9e<\xd9\x9dLFFF\xaa\x97_~\xd9\xfd\
-\xda\x80\x01\x03\xd4\x1dw\xdc\xe1Q~\xfd\xfa\xf5\x0ap\
-'rB\xd4\x04\xa6\xeb\xbc7\x8b\xaf\xbe\xfa\x8a_\x7f\
-\xfd\xb5\xc2\xd75Mc\xf1\xe2\xc5\xf4\xea\xd5\xcb\xdd\x0d\
-/DM4j\xd4(\xfc\xfc\xfcx\xff\xfd\xf7\xe9\xdc\
-\xb93\xf7\xddw\x9f\xc7\x90\xd6\x84\x09\x13\xd8\xbd{7\
-\xf5\xeb\xd7\xe7\xe3\x8f?\xa6v\xed\xda\x00\xeeYY\xe5\
-\x87Z\x22\x22\x22\x00\xc8\xcb\xcb;\xef\xe7\x9e<y\x92\
-\x9c\x9c\x1cV\xacX\xc1\xbe}\xfb\xdc\xcfgggc\
-\xb5Z9x\xf0\xa0\xfb\xb3\x9a5k\xe6\xb1\xedEE\
-EQ\x5c\x5c\x5c\xe1r\xd3\xd3\xd3\xd14\x8d\x97^z\
-\xc9c\xb2\xc0\xe1\xc3\x87=\xae\x7fe2\x99h\xd2\xa4\
-\xc9y\xe3l\xd6\xac\x19\xeb\xd6\xad;\xe7\xf9\x90\x90\x10\
-\x8f\x98\x9a7o\xee\x11\x83\x8f\x8f\x0f\x0f>\xf8\xa0\xc7\
-{\x0a\x0a\x0a\xd8\xb3g\x0f\x00;w\xee\xe4\x96[n\
-\xf1x\xbd[\xb7n\xbc\xff\xfe\xfbU^w\xe9\xe9\xe9\
-X,\x16\xee\xbf\xff~\x8f\xe7\xcf\x9c9\xe3\xfe\x1c\x80\
-\xb8\xb88\x82\x82\x82\xdc\x8fcbb\xb0\xdb\xedX\xad\
-V\xd2\xd3\xd3\xb1\xdb\xedt\xe8\xd0\xc1c\x19/\xbe\xf8\
-\xa2\xfb\xffc\xc7\x8e\xe5\xcb/\xbf\xe4\x85\x17^\xe0\xf8\
-\xf1\xe3,_\xbe\x9ce\xcb\x96y\x94w\xb5\x83\x93'\
-O\x92\x98\x98(\x1b\x96\xa8\x11\xae\xebD\xc7n\xb7S\
-XX\x88\xc5b!88\x18\xa5\x14\xc5\xc5\xc5\x98L\
-&,\x16\x8b\xfb\xfc\x82\x92\x92\x12\x9cN'F\xa3Q\
-Z\x8c\xb8\xe6\xfc\xf5\xaf\x7f%!!\x819s\xe60\
-c\xc6\x0c\xee\xbe\xfbn\x16-Z\x04\xe0\xbe.N\xf9\
-d\xa2^\xbdz\x84\x87\x87\x93\x96\x96\xc6\xb8q\xe3\xce\
-Y\x9e\xd5j\xe5\xae\xbb\xeeb\xc2\x84\x09\xd4\xabW\xcf\
-}\x1e\xca\xd9\x09G\xff\xfe\xfd\x09\x0e\x0ev?\xf6\xf5\
-\xf5=\xe7@\xc3\xdb\xf9q\x85\x85\x85\xf8\xfa\xfa\xd2\xae\
-];\x8f\xe7\x93\x93\x93=fJ\x05\x04\x04`6\x9b\
-\xcf[\x07F\xa3\x91\xb0\xb0\xb0J\xcbX,\x16\xfc\xfc\
-\xfc<b\x08\x0e\x0e&99\xf9\x9c\x18\x5c\xb3\xd3,\
-\x16\xcb9\xfb\x8d\x8afr\x9d\xfd=]\xe7/\xb9>\
-'$$\xa4\xc2\xcfq%\x89\x15\xd5\x9f\xb7\xef\xe0\xcd\
-\x84\x09\x13\x982e\x0a\x9b7of\xcd\x9a5\xc4\xc7\
-\xc7\xd3\xa3G\x8fs\xd6\x89k\xbf(\x84$:5\x80\
-\xc5ba\xca\x94)dffb\xb5Z)))\xe1\
-\xd9g\x9f\xa5g\xcf\x9e\x0c\x1e<\x18\x93\xc9DPP\
-\x10\xd1\xd1\xd1\x92\xe4\x88k\xd6w\xdf}\xe7>iu\
-\xdc\xb8qL\x9a4\x89\xbc\xbc<BBB\x88\x89\x89\
-q\xf7\xc0\x94\xef%\x199r$_|\xf1\x05/\xbc\
-\xf0\x02\xb5j\xd5\xf2X\xdeW_}\xc5\x97_~\xc9\
-]w\xddE\xfd\xfa\xf5\xb1X,4o\xde\x9c'\x9f\
-|\xd2]f\xff\xfe\xfdl\xd8\xb0\x81\x88\x88\x08\x8f\x1f\
-uo\xce\xbe\xc4CBB\x02\xc5\xc5\xc5\x8c\x1d;\x96\
-\xb8\xb88\xf7\xf3\x8b\x17/\xc6`\xb8<s,\x12\x12\
-\x12\xc8\xcf\xcf\xe7\xd1G\x1f\xc5\xdf\xdf\xdf\xfd\xfc\xec\xd9\
-\xb3\xdd\x89N\x93&M\xd8\xb9s\xa7\xc7\xfbv\xef\xde\
-\xed\xf1\xd8\xc7\xc7\x873g\xcex<\xf7\xcb/\xbf\xb8\
-\xa7\xfe'$$PPP\xc0c\x8f=\xe6\x91h\xcd\
-\x9a5\x8b:u\xeaT)V\xd7I\xe3{\xf6\xec\xf1\
-\xe89\x9b4i\x12qqqL\x9a4\x89\x1bn\xb8\
-\x81\xb6m\xdb2g\xce\x1cRRR\x18?~\xfc9\
-u\x99\x99\x99\xe9\xee-\x12\xa2\xa6\xb8\xeeg]EF\
-F\xd2\xbcysZ\xb7n\xcd\x0d7\xdc@HH\x08\
-u\xeb\xd6\xe5\x86\x1bn\xa0u\xeb\xd64j\xd4\x88\xc0\
-\xc0@i)\xe2\x9aTZZ\xca\xa9S\xa7\xdc\xc9\x82\
-\xd1h$::\x9a\xe3\xc7\x8f\x03P\xa7N\x1d\xc2\xc2\
-\xc2\xd8\xb5k\x97\xc7\xfb&O\x9e\x8c\xc1`\xa0w\xef\
-\xde\xac]\xbb\x16\xa7\xd3Iqq13f\xcc\xe0\x91\
-G\x1ea\xe8\xd0\xa1\xf4\xea\xd5\x0b\x93\xc9\xc4-\xb7\xdc\
-\xc2\x9bo\xbe\xe9\xfe\xc1?s\xe6\x0c\xf7\xdcs\x0f\xaf\
-\xbd\xf6\x9a\xc7\x0fwe\xc2\xc3\xc3\x01}\x96SQQ\
-\x11\xfd\xfa\xf5#<<\x9c\x87\x1ez\xc8\x9d$l\xdd\
-\xba\x95\xd1\xa3G\x93\x92\x92rY\xean\xf8\xf0\xe1\xd8\
-\xedv\x1e\x7f\xfcq\xf7\xc5E\x97,Y\xc2m\xb7\xdd\
-\xe6\xae\xaf\xf1\xe3\xc7\xf3\xd5W_\xb1v\xedZ@\xbf\
-\xba\xf4\xd9\xb3\x96\x1a7n\xcc\xe2\xc5\x8b\xdd\xdfc\xfa\
-\xf4\xe9\x1c>|\xd8\xfd\xfa\x88\x11#\xb0Z\xadL\x9c\
-8\xd1\xfd9\x8b\x17/\xe6\xf6\xdbo'==\xbdJ\
-\xb1\xd6\xae]\x9b\xae]\xbb\xf2\xdak\xaf\xb9\x93\xd6\x8d\
-\x1b7\xf2\xef\x7f\xff\xdb#Y\x9a0a\x02_~\xf9\
-%\x9b6mb\xfc\xf8\xf1\xe7,'==\x9d\x80\x80\
-\x00\x1a6l(\x1b\x8f\x90DG\x08q\xf5SJa\
-2\x990\x99\xca:w-\x16\x0b\x85\x85\x85\xee\xde\x9b\
-\x9bn\xba\x89\xd4\xd4T\x8f\xf7\xc5\xc6\xc6\x92\x92\x92B\
-@@\x00\xdd\xbbw\xc7\xdf\xdf\x9f\xc0\xc0@\xee\xb9\xe7\
-\x1eF\x8d\x1a\xc5\xcc\x993\xdd\xbd0\xef\xbf\xff>\xad\
-Z\xb5\xa2u\xeb\xd64m\xda\x94:u\xeap\xfc\xf8\
-q\xe6\xcc\x99S\xe5\xde\x97Z\xb5jq\xc3\x0d70\
-n\xdc8\xc6\x8d\x1bGXX\x18s\xe7\xcee\xcb\x96\
--\xc4\xc6\xc6\xd2\xbcys:t\xe8\xc0M7\xdd\xc4\
-\x0b/\xbcpY\xea\xaeq\xe3\xc6|\xf1\xc5\x17\xcc\x99\
-3\x87\xa8\xa8(\x12\x13\x13\x19<x0\x0f>\xf8\xa0\
-{j\xf8\x83\x0f>\xc8\xc4\x89\x13\xe9\xd5\xab\x17\x09\x09\
-\x09\xb4l\xd9\x92\x16-Zx,\xe7\xc5\x17_\xe4\xb7\
-\xdf~#66\x96\xe8\xe8h\xde{\xef=n\xbd\xf5\
-V\x8f\x9e\xa3\xcf?\xff\x9cY\xb3f\x11\x1d\x1dMb\
-b\x22C\x87\x0e\xe5\xe1\x87\x1f\xe6\xee\xbb\xef\xaer\xbc\
-_|\xf1\x05V\xab\x95\xf8\xf8x\x12\x13\x13\xe9\xd6\xad\
-\x1b\x8f<\xf2\x88\xc7g\xdd~\xfb\xeddff\xd2\xa5\
-K\x97\x0a/\x1d\x90\x9a\x9aJ\xbf~\xfd\xaa4L&\
-\xc4\xd5BSr\x91\x18\xb7\xa2\xa2\x22\xc6\x8c\x19\xc3\xb0\
-a\xc3\x18;vl\xa5\xe3\xd9B\xd44?\xfc\xf0\x03\
-C\x87\x0e\xe5\x9f\xff\xfc'\x13'Nt?\x1f\x11\x11\
-\xc1\xa1C\x87\xdc\xe7\xcb\xc4\xc5\xc5\x91\x9a\x9aJ\xfd\xfa\
-\xf5\x01X\xbe|9#F\x8c\xe0\xf8\xf1\xe3\x1e'\xbb\
-\xba\x1c<x\x90\x83\x07\x0fb2\x99h\xd1\xa2\x85\xd7\
-\xab-\xa7\xa7\xa7\xbb\x87d\xda\xb4i\xe3N\xae\x9cN\
-'\x87\x0f\x1f&&&\xc6c\x08\xe8\xc8\x91#\x04\x05\
-\x05\xb9\xcf\x9d\xb1\xd9l\xa4\xa7\xa7\x13\x1c\x1c\xec\xbe5\
-Cii)iii\xe4\xe6\xe6\xd2\xbcys\x8f\x9e\
-\x86\xbc\xbc<rss\xdd\xdf\xc3\x9b\x8c\x8c\x0c\xacV\
-\xab\xc7\x10\xd8\xd9\xf2\xf3\xf3\xc9\xce\xce\xae\xf0\x96\x10\x85\
-\x85\x85l\xde\xbc\x99\x92\x92\x12\x92\x92\x92*\x5c\xce\x81\
-\x03\x07\xd8\xbbw\xaf\xfb:;\xf7\xde{\xaf\xc7m2\
-\xce\x9c9CZZ\x1af\xb3\x99N\x9d:q\xfa\xf4\
-i\x1c\x0e\x07QQQ\x15~N\xcb\x96-=zb\
-rrr\xdc\xd7\xbd)\xbf\xcc\x8c\x8c\x0c\x1a4h\xe0\
-N:\x1d\x0e\x07[\xb7n%33\x93\xa4\xa4$\xea\
-\xd6\xad\xeb\x11\xa7\xcdf\xa3N\x9d:\xbc\xf5\xd6[\xdc\
-q\xc7\x1d\x1e\xaf\x95\x94\x94P\xbbvm>\xfb\xec3\
-\x86\x0e\x1d*\x1b\x94\xa81\xe4\x16\x10B\x5c\xe7Z\xb7\
-n\xcd\xca\x95+\x19>|8{\xf7\xee\x05p\x9fD\
-\x0c\xd0\xb7o_\x92\x92\x92\xf8\xf2\xcb/y\xe0\x81\x07\
-\xcey\x7f\xa3F\x8d*<\xfa?[\xf3\xe6\xcd=f\
--\xb9\x18\x0c\x86\x0a\x87B\xce\xfe\x116\x9b\xcd\xb4j\
-\xd5\xca\xe39\x1f\x1f\x1f\xbav\xedZ\xe1\xe7\xb9.\xae\
-w>\xe5\x93\x09o\x82\x83\x83=N\x9c./  \
-\x80\x9e={\x9e\xb7\xf7\xa7\xb2\x99\x9b\x81\x81\x81\x1e\xcb\
-p\xcdl\xab\xea\xe7\x84\x87\x87\xbb\x87\xf7\xca/\xf3\xec\
-aw\xa3\xd1H\xfb\xf6\xed\xbd\xc6\xf1\xd1G\x1f\xa1\x94\
-\xf2\xe8\xe5q\xf9\xf6\xdbo\xa9_\xbf>C\x86\x0c\x91\
-\x8dFH\xa2#\x84\xa89^}\xf5U\xc6\x8f\x1f\xcf\
-\x9a5kX\xb8p!o\xbf\xfd\xf69'\xff~\xf0\
-\xc1\x07\x8c\x1c9\x92;\xee\xb8\xa3\xca\xe7\xd5\x88\x9a#\
-55\x95\x01\x03\x06PTT\xc4\x07\x1f|p\xce\xd0\
-\x94\xd5j\xe5\xb5\xd7^c\xc6\x8c\x19r\xef?Q\xe3\
-\xc8\xd0U92t%\xaee'N\x9c 55\x95\
-\xd6\xad[\x93\x90\x90\xe0\xf1Zff&[\xb7n\xa5\
-I\x93&^\xef\xd8\xbdx\xf1b\x9a5k\xe6\xd1\xdb\
-#.\xdc\xf1\xe3\xc7\xd9\xbd{7}\xfa\xf4\xb9jb\
-*,,\xe4\xbb\xef\xbe\xa3^\xbdzt\xeb\xd6\xed\x9c\
-\xd7\x8f\x1d;\xc6O?\xfd$\xbd9B\x12\x9dk.\
-\xd1Q\x0a\xca\x8d\xa3c0\x80\xd9\x0c\xae\x137m6\
-\xb0Z\xbd\xd4\xac\xa6\x97s%K\x0e\x07\x94\x94x/\
-k0\x80\xeb(J)(.\xd6\xff\xf5V\xde\xd7W\
-\x7f\x0f\xe8\xcbu:+.\xafiz\x0c\xe5c\xb6\xd9\
-\xbc/\xdbl.\x8b\xd9n\xd7\xcbz\xbbf\x86\xd1X\
-\x16\xb3\xd3\xa9\xd7\xc5\xef\xd7]\xa90\x0e??\xfd_\
-\x80\xd2R\xbd\xac\xb78\x5c\xdfO\xd3\xce\x1f\xb3\xeb\xfb\
-iZ\xd5b\xb6X\xf4e;\x9dz\xd9\xf2\xeb\xb8<\
-\x83\x01||\xf4\x7f\x95*\x8b\xc3\x1b\x1f\x1f}\xf9\x17\
-\x1a\xb3\xc3\xa1\xd7\x9d\xb7\x98M&}\xbdT5f\x8b\
-E\x8f\xc3\xd5~+k\xa3f\xb3\xfe\xa7TY\x1c\x95\
-\xb5\x0d\xb3\xb9j1\x1b\x8dzY\xa3\xb1j1\xbb\xb6\
-\xab\x0b\x8d\xd9\xe9\xf4\xbe]\xb9\xea\xceb\xd1\xdfw\xbe\
-\xed\xaa|\xdbP\xaa\xac\x8d\x9e/\xe6\xea\xde\x17\x14\x15\
-\x9d[\xce\xdf\xbfl[\x12BTJ\x86\xae*\xf3\xcc\
-3\xf0\xd5We\x8f\x13\x12\xe0\xe9\xa7a\xd80\xfd\xf1\
-\xa7\x9f\xc2+\xafT\xfc\xe3\x17\x11\x01\x7f\xfe3<\xf7\
-\x9c\xfex\xcb\x16\x18;\x16~\xbf\xb1\xe29?z]\
-\xbb\xc2\xd7_\x97%\x01\xdd\xba\xc1\xd1\xa3\x15\xc7\xd5\xb0\
-!\xcc\x99\x03\xae\x8b\x85=\xfc0,_^\xf1\xce3\
-\x22\x02\xde}\x17\x06\x0e\xd4\x1f\x7f\xf8!L\x9d\x0aY\
-Y\xe7\x96\xf5\xf3\x83\xfb\xef\x87g\x9f\xd5\x1f\xafY\x03\
-/\xbe\x08\xfb\xf7W\xfc\xa3\xd0\xb9\xb3\x1e\x87~\xc8\x07\
-\x8f=\x06\xeb\xd7{\xff\xc1\xf9\xed\xb7\xb2\x9d\xf3\xd3O\
-\xc3w\xdfy\xffq\x98;\x17:u\xd2?g\xda4\
-\xfd\xef\xf7)\xcf\xe7x\xee9\xb8\xef>=\xfe\x95+\
-\xf5\xef\xfb\xd3O\x15\x97\xbd\xe9&x\xfbm\xa8UK\
-\xff^o\xbe\x09?\xfcPq\xd9\xf8x\xf8\xe6\x1bh\
-\xd4H\xff\xb1y\xf7]\xa8\xec\x8a\xb6_\x7f\x0d7\xde\
-\xa8\xff\x00~\xf3\x0d\xbc\xf1\x06\xfc~\xdd\x91s<\xff\
-\xbc\xde\x1e\x22\x22`\xedZ=\x8e-[*.;b\
-\x04<\xf9\xa4\xde\xfe\x0e\x1c\x80\xf7\xde\x83Y\xb3*.\
-\x9b\x94\xa4\xb7\xc9.]P\xb9\xb9\xf0\xc5\x17h\xaf\xbd\
-VaQ\xab\xc9\xc4\xfc\xee\xdd\x09\xbb\xe7\x1e\xbau\xeb\
-\x869%\x05\xed\xce;\xbd'sO<\x01\xf7\xde\xab\
-\xc7\xbck\x17<\xfe8x\x9b\xde<l\x98\xfez\x8b\
-\x16\xfaz\xfb\xfb\xdfa\xf6\xec\x8a\xcb\xb6j\x05\x93&\
-\xe9m\xb4\xa0\x00f\xce\xd4\xdb]E\x22#\xe1\x91G\
-\xe0\x81\x07\xf4\x84\xe8\xe7\x9f\xa1\xb2^\x86\xf1\xe3\xf5\xfa\
-\xf0\xf5\x85\xdc\x5c\xe8\xd5\x0bN\x9e\xac\xb8l\xaf^\xf0\
-\xd2K\xd0\xb4\xa9\xde.\x1fx\x00~\xbfp\xe29\x9a\
-7\x87\xa7\x9e\x82\xc1\x83\xf5\xc7\x1f}\x04/\xbf\x5cq\
-\xd9\xa8(\x980A\xff\x8e\x00\x9b7\xc3\xe8\xd1\xfav\
-^Q\xb2\xdc\xa7\x0fL\x9f^v\x10\xd3\xae\x1d\xe4\xe4\
-x\x96KO\xd7\xd7\x83\x10B\x12\x9d\x8b\x92\x9f\x0f\x19\
-\x19e\x8f\xc3\xc2<\x93\x89\xa2\x22\xfd\xf5\x8a~\x18\x9c\
-N(\x7f\x110\x9bM\xff\xd1\xab\xe8\xb2\xf9\x16\x0b\x9c\
->]\xf6X)=\x11)\xff\xd9\xe5\x85\x84x\x1ei\
-\xe6\xe5\xe9e+Jt\x9cN\xcf\x1dja\xa1\x1eG\
-E?\xc0~~\x9e1\x97\x96Bvv\xc5q\x18\x0c\
-\xfa\x0f\x87\x8b\xc3\xa1?\xf6\x16\xf3\xd9\x17\x5ct\xc5\xec\
--\xd1)\xff|aa\xe5\xf5QXXv\x94^Z\
-\xaa\xff(x+\x9b\x97W\xd6\x0ba\xb7\x97\xc5Q\x11\
-??\xcfz>s\xc6{YW\xcc\xae8\x8a\x8b\xf5\
-:\xae,fW\x1cV\xeb\xf9cv\xc5a\xb7\x9f\xdb\
-.\xcb\xcb\xceFY\xaddfd\xb0\xe4\xab\xaf(}\
-\xff}\xee\xf1R\xd6\x0e,\x9e7\x8f\xf9+VP7\
->\x9e\x17\x92\x93\x19r\xf2$Fo\xbd\x18g\xcex\
-\xd6\xdd\xf9bv\xf5\xe08\x9d\x95\xd7sNN\xd9\xfa\
-v:\xf5\xba\xa9\xac\x9e\x7f\x9f\xfa\xee\xae\xbb\xca\xca\xe6\
-\xe7\x97\xad\x13\xa7\xb3\xf2ur\xfatY\xccJU\x1e\
-st\xf4\xb9\xdb\x95\xb7\xb2\x06C\xc51{Kt\xca\
-\xef#\x94\xd2c.w\xc1F\xf7\xf3B\x88*\x91\xa1\
-+\xca\xe7-g\x0d]efz\xfe\x98\xfb\xf8\xe8G\
-g\xae\x99\x1cYYp\xeaT\xc5;\x1d\xa3QO\x8c\
-\x5cW\x10-,\x84_\x7f\xad\xb8\xab_\xd3  \x00\
-\x5c\xd3`\x9dN\xbd\xb7\xc1\xdb\x91\xb5\xc5\x02\x0d\x1a\xe8\
-=\x07\x00G\x8e\xe8G\xc2\xde\xe2\xa8S\x07\x5c3F\
-\x5c;\xcd\x8a\x86\x114M\xef\xe9pM\x0f.(\xd0\
-\x8f~\xbd]\xb96 @\x8f\xc3\xb5\xf3>v\xccs\
-\x87\x8e>uX\xd344\x83A?\x0av\xf5\xe8\x1c\
-=\xaa\xef\xd0\xbd5\xbf\xfa\xf5\xf5\xe5k\x9a^\xcf\xd9\
-\xd9\xde\xeb#:Z?\xba5\x18\xf4\x1f\xb6\xccL=\
-\xd1\xa8Hp\xb0\xde\x13f2\xe9\x89aFF\xc5\xbd\
-l\xa0\xd7o\xfd\xfa\xfazw:\xf5\xb2\x15\xf5\x84\xb9\
-\xd4\xab\x07\x81\x81z\xcc\xae$\xc0\xdbpMt\xb4\xde\
->L&\xbd\x9e32\xbc\xc7\x1c\x12\xa2\xf7d\xf8\xfa\
-\xea1gey&\xc6\xe5\x14\xd8l\xac\xdc\xbd\x9b)\
-\xd3\xa6\xb1s\xdb6L\x05\x054\x09\x09\xa1{\xf7\xee\
-$''S\xafn]\xfc\xfd\xfd)))\xe1\xd0\xaf\
-\xbf\xb2\xe0\xa7\x9f\x98\xb7z5\xb9\xb9\xb9D\xfa\xf9\xd1\
-\xc4\xd7\x97''Mb\xe0\xc0\x81X\xce\xbeuBd\
-\xa4^\xcf&\x93\x1e\xeb\xb1c\xde\x87`\x82\x83\xf5\xf2\
-~~z\xdb8u\xaa\xe2$\xdf\x95PFF\xea\xef\
-q%\xcc\xdez]L&\xbd\x8d\xd6\xaaU6\xacs\
-\xe8\x90\xf7u\x12\x16\x06\xb1\xb1z\xdb\xb0\xdb\xf5\x1e1\
-o\xeb$0P\xdf^}}\xf5\xf5}\xf4\xa8\xf7\xb6\
-\xe1\xeb\xab\xc7\xec\xda\x17df\xea\xdf\xd1[\xcc\xe1\xe1\
-\xfa\xbe\xc3\xb5/8|\xd8\xfbPs`\xa0\xde\x96\x5c\
-\xfb\x82\xbd{\xcf\x1dBKL,\x1b6\x13BH\xa2\
-\xf3\x87\x13\x9d\x8av$\x9aV\xf6c\xadT\xe5GV\
-\x17R\xd6u\xe4W\xd5\xb2\xe5\x97}\xbe\xfb\xce\x5c\xa1\
-\x98\x95R\xdc{\xdf}\xf8\xf8\xf8\xf0\xfe\xff\xfb\x7fz\
-\xb2s!1\xbb\xfe\xadJ\xccU-[\xfe;^h\
-\xd9\xf3\x1dI_\xc1\x98\x95R\x1c\xf9\xed7>\x9a:\
-\x95\x19\xff\xfd/999\xd4\xae]\x9b\xbb\xef\xbe\x9b\
-\xa1C\x86\x10\x15\x15\x85\x9f\xaf/\x06\xa3\x89B\xab~\
-n\x94\xafI\xbf6JvN\x0e\x0b\x16,\xe0\xff\xbd\
-\xf7\x1e'O\x9e$\x22<\x9c\xdbn\xbf\x9d\xe7\x9e{\
-\x8e\x88\x88\x08\x0c\xe5c\xbdZ\xea\xb9\xaae/&\x8e\
-\x0b\xd9\x06/\xf7\xbe\xa0\xfc\xf2\x84\x10\x95\x92C\x82\xaa\
-\xecl\xaa\xb2\xf3:oJYMe\xab\x12\xe7\x15\x8a\
-\xf9\xb1G\x1f\xe5\x93O?\x05\xa0\xb8\xa4\x84i\xd3\xa6\
-\x95\xdd3\xec*\x8d\xb9J\x89\xc9U\x16\xb3\xd3\xe9d\
-\xfb\x8e\x1d\xbc\xf5\xd6[,Z\xb4\x08M\xd3\x18;v\
-,\x0f<\xf0\x00\x8d\x1a5\x2288\x18\xa3\xd1\x88S\
-)~\xcb)\xe2\xae\x19?\x11\xe2gf\xe6\xbd\x1d\x09\
-\x0e\x09!2*\x8a\xda\xb5k3p\xe0@\xfe\xf3\x9f\
-\xff\xf0\xf1\xc7\x1f3}\xc6\x0c\x0e\x1c<\xc8;\xef\xbc\
-C\xa3F\x8d\xce\xbd\xd7\xdb\xd5P\xcfW\xcb:\xb9\x9a\
-\xf6\x05B\x08It\xc4\xe5\xf1\xec\xb3\xcf\xf2\xfe\xfb\xef\
-\xd3\xb4iS\x0c\x06\x03\x9f}\xf6\x19\x85\x85\x85|\xf1\
-\xc5\x17U\xba\x9b\xb4\xa8\x1a\xbb\xdd\xce\xc6\x8d\x1by\xfd\
-\xf5\xd7III!&&\x86\x89\x13'2b\xc4\x08\
-\xa2\xa2\xa2<n\xed\x00`\xb5;9\x98YHx\x80\
-\x05\xa7\xd2o\x96\xa9i\x1a!!!\x04\x07\x07\xf3\xc2\
-\x0b/\xd0\xbe}{\xfe\xf6\xb7\xbf\xb1b\xc5\x0a\xee\xb9\
-\xe7\x1e\xfe\xf5\xaf\x7f\x91\x94\x94$\xebM\x08Q3\xfb\
-,\xa4\x0a\xc4\xa56y\xf2d\xdex\xe3\x0d&O\x9e\
-L\xd3\xa6M\x89\x8a\x8a\xe2\xbf\xff\xfd/s\xe7\xce\xe5\
-\xe6\x9bo\xa6\xa4\xb2\xe9\xc0\xa2\xca\x1c\x0e\x07\x9b6m\
-\xe2\xd5W_%%%\x85\x84\x84\x04\xfe\xfe\xf7\xbf3\
-f\xcc\x18bcc\xcfIr4 >\xdc\x9fy\x0f\
-w\xe5\xbfwu\xc0\xd7d,\xd7q\xa0a0\x18\x88\
-\x89\x89\xe1\x96[na\xda\xb4i\xd4\xaf_\x9f\xcd\x9b\
-7\xf3\xf8\xe3\x8f\xb3s\xe7N\xf7\x0d%\x85\x10B\x12\
-\x1dq\xdd\xfa\xd7\xbf\xfe\xc5K/\xbd\xc4_\xfe\xf2\x17\
-^|\xf1E,\x16\x0bV\xab\x95\xb1c\xc7\xf2\xf9\xe7\
-\x9f\xb3d\xc9\x12\x1e|\xf0A\xa9\xa8\x8b\xe4t:I\
-KK\xe3\xed\xb7\xdf&55\x95\xa4\xa4$^}\xf5\
-U\x06\x0e\x1cHXXX\x85W\xaf\xd54\x0d_\xb3\
-\x91\xd6\xf1\xa1$\xd5\x09\xc1`\xa8xH$((\x88\
-^\xbdz\xf1\xe1\x87\x1f\xd2\xb4iS\xd2\xd2\xd2x\xfa\
-\xe9\xa7\xd9\xb3g\x8f\xc7\xfd\x99\x84\x10B\x12\x1dq\xdd\
-\xe9\xdd\xbb7\x7f\xfb\xdb\xdf\xf8\xc7?\xfe\x01\xe8\xf7'\
-r\xf5\x04\xdcv\xdbm\xcc\x993\x87g\x9eyF*\
-\xea\x22\xed\xda\xb5\x8b\x0f?\xfc\x90\x15+V\xd0\xacY\
-3\x9e}\xf6Yz\xf6\xecy\xce\xbd\x8d\xfe(__\
-_:w\xee\xcc\xbb\xef\xbeK\xa3F\x8d\xd8\xb0a\x03\
-/\xbf\xfc2G\x8e\x1c\xc1y\xbe\x13\xc9\x85\x10\xe2*\
-\x22\xe7\xe8\x88K\xaae\xcb\x96\xb4l\xd9\xd2\xfd\xb8|\
-\xa2\x03\xc8]\x8f/\x81_\x7f\xfd\x95\xaf\xbf\xfe\x9a\xef\
-\xbf\xff\x9e\xfa\xf5\xeb\xf3\xc4\x13O\xd0\xbbwo\x8f;\
-\x7fWD)\xc5\xe9b\x1b\xdfo;\x8e\xaf\xd9\xc0\x88\
-6u0\x9f}\x92q9\x16\x8b\x85\xae]\xbb\xf2\xfa\
-\xeb\xaf3q\xe2D\x96.]J||<O?\xfd\
-4111r\xcf#!D\x8d =:\xa2Z\x9d\
-\x9d\xe8\x88\x8b\x93\x9b\x9b\xcb\xfc\xf9\xf3\xf9\xfc\xf3\xcf\x09\
-\x0b\x0b\xe3\xce;\xefd\xd0\xa0AU\xea\xc9Q\xc0\xe9\
-\x22+S\xd7\xfc\xc2g\xeb\x7f\xc5\xee8\xff\x95%|\
-||\xe8\xd3\xa7\x0f\xcf<\xf3\x0c~~~|\xf9\xe5\
-\x97\xcc\x993\x87\xdc\xf2\xd7\x97\x12B\x08It\x84$\
-:\xe2b\xd9l6\xd6\xae]\xcb\x8c\x193\xb0Z\xad\
-\x8c\x181\x82[o\xbd\x95\x10\xd7E\xeb\xaa\xc0\xc7d\
-\xa4U|\x08-j\x07\x97]\x1f\xe7<\xfc\xfd\xfd\xb9\
-\xe5\x96[\x980a\x02v\xbb\x9d\x0f>\xf8\x80\xb4\xb4\
-49\xa9\x5c\x08Q#\xc8\xd0\x95\x90D\xa7\x86\xd8\xb1\
-c\x073g\xce\xe4\xe0\xc1\x83\x0c\x180\x80\x09\x13&\
-\x10\x1b\x1b[\xe5\xf7k@D\xa0\x85\x89}\x9b`4\
-h\x98\x8dU?\xce\x89\x88\x88\xe0\xfe\xfb\xefg\xcf\x9e\
-=,[\xb6\x8c\xf7\xde{\x8f:u\xea\xd0\xacY3\
-\x0c\x069^\x12B\x5c\xbdd\x0f%\xaa\x95k\xd6\x95\
-\xb88\xc7\x8f\x1fg\xde\xbcy,_\xbe\x9c\xe6\xcd\x9b\
-s\xc7\x1dw\xd0\xa4I\x93\x0b:OF\xd34|L\
-F\x9aD\x07\xd1(2\xd0\xeb\xac+o\xea\xd5\xab\xc7\
-\xc4\x89\x13IHH`\xed\xda\xb5|\xfd\xf5\xd7\x9c\xf4\
-v\xab\x06!\x84\x90DG\x5c\x0f\xa4G\xe7\xe2Y\xad\
-V\xd6\xacY\xc3\x9c9s\x08\x0a\x0ab\xe4\xc8\x91\xdc\
-x\xe3\x8d\xe7\x5c'\xe7|\x94R8\x9d\x8aR\xbb\x03\
-\xab\xdd\xc1\x85\xde\xfdE\xd34:u\xea\xc4=\xf7\xdc\
-CPP\x10_|\xf1\x05\x1b7n\xa4\xa8\xa8HV\
-\x92\x10B\x12\x1d!\x89\x8e\xf8cv\xee\xdc\xc9\xbcy\
-\xf38v\xec\x18}\xfa\xf4a\xc4\x88\x11\x04\xbbn\xd2\
-z\x812\x0aJxf\xf6v^\xfe>\x1d\xab\xe3\xc2\
-\xa7\x89\xfb\xf8\xf80r\xe4Hz\xf7\xeeMvv6\
-3f\xcc\xe0\xe0\xc1\x83\xc8-\xf3\x84\x10\x92\xe8\x08I\
-t\xc4\x05\xcb\xc9\xc9a\xd1\xa2E\xac^\xbd\x9a\xa4\xa4\
-$F\x8e\x1cI=\xd7\x9d\xad/\x90\x02\x0aJ\xec\xcc\
-\xfb\xf98\x0bw\x9e\xc4\xe1\xfcc\xc9Itt4\xf7\
-\xde{/M\x9a4!%%\x85\x05\x0b\x16\x90\x91\x91\
-!+K\x08!\x89\x8e\x90DGT\x9d\xd3\xe9d\xfd\
-\xfa\xf5|\xff\xfd\xf7\x98L&\x06\x0f\x1eL\xa7N\x9d\
-\xfe\xf0\xc9\xbf\x1aP+\xd0\xc2\x0bC\x9a\xf1d\xff&\
-\x98\x8d\x7f\xfc:8\xed\xdb\xb7g\xd4\xa8Q\xf8\xfb\xfb\
-3s\xe6L\xb6o\xdf.\xebY\x08qU\x92YW\
-\xe2\x8a%:\xa5\xa5\xb0t)dgC\xabV\xd0\xa6\
-M\xe5\xcb\xfa\xfe{8q\x02n\xb9\x05\x22\x22`\xe6\
-L8s\xa6\xecu\x7f\x7f\x08\x0e\x86\x8e\x1d!:\xba\
-\xe6\xd7\xdd\x91#GX\xb8p!\xbbw\xef\xe6\xa6\x9b\
-nb\xe8\xd0\xa1\x84\x86\x86^\xd42C\xfd-\x8c\xef\
-\x5c\x1f\x0d0\x1a\xfex\xa2\xe3\xeb\xeb\xcb\xad\xb7\xde\xca\
-\x86\x0d\x1bX\xb1b\x05\xf3\xe7\xcf\xa7q\xe3\xc64h\
-\xd0@\x1a\xbd\x10B\x12\x1dq}%:J)\xecv\
-\xbb\xc7\xc9\xb3\x19\x19\xd0\xa3\x07\xec\xd9SV\xf6\xb1\xc7\
-\xe0_\xff\xf2\xbe\xac\xb7\xdf\x86\x94\x14\xe8\xd0AOt\
-\x9e{\x0e~\xfd\xb5\xa2\xcf\x84O?\x85?\xff\xb9\xe6\
-\xd6\x9b\xcdfc\xf5\xea\xd5\xacZ\xb5\x8a\xf8\xf8x\x06\
-\x0d\x1aD\xd3\xa6M/j\x99\xae\x19Z\x17\xd3\x93S\
-^\xbdz\xf5\xb8\xf5\xd6[IOOg\xfe\xfc\xf9t\
-\xed\xda\x95\xe8\xe8\xe8\xf3^\xa1Y\x08!.'\x19\xba\
-\x12\xd5\xcab\xb1\xb8\x7f\xb8\xcfNZ\xf6\xec\xd1\x93\x9b\
-\x94\x14HH\x80\xf7\xde\x83M\x9b.\xfc3\xdey\x07\
-\xbe\xfdV\xff\xfb\xbf\xff\x03\x9b\x0d\x1ex\x00j\xf2\xf5\
-\xec\xf6\xed\xdb\xc7\x92%K8q\xe2\x04\xbd{\xf7\xa6\
-W\xaf^\x98\xcd\xe6\x8bZ\xa6R\x8a\xc2R;k\xf6\
-e\xb0\xfe`\xd6\x1f>G\xa7|\xe2\xd4\xbf\x7f\x7f\xba\
-w\xefN^^\x1es\xe6\xcc\x91\x13\x93\x85\x10W\x1d\
-\xe9\xd1\x11\xd5\xca\xf5\xe3l\xb3\xd9\xf0\xf3\xf3s?\x7f\
-\xcb-\x10\x1b\x0b\xf7\xde\x0b\x81\x81z/\xcd\xfe\xfd\xfa\
-\xd0\x94\xcb\xda\xb50m\x9a\x9e\xb0\x8c\x1f\xef\xfd3\x06\
-\x0c\x80\x16-\xf4\xff\x8f\x1a\x05\x1f~\x08YY\xfa\xfb\
-|}k^\x9d\x15\x17\x17\xb3t\xe9R\xd6\xad[G\
-bb\x22\xfd\xfb\xf7\xa7N\x9d:\x17\xbd\x5c\x05\xe4\x14\
-Zyo\xc5~\x82\xfd\xcc\xb4\xad\x1b\x86\xd1`\xbc\xa8\
-eFDDp\xfb\xed\xb7\xb3}\xfbvV\xaf^M\
-\x9f>}\xa8[\xb7\xee\x05]\xadY\x08!$\xd1\x11\
-\xd7D\xa2S^\xc7\x8e\xfa\xdf\xa9S\xf0\xea\xab0{\
-\xb6~\x9eN\xff\xfe\xfa\xeb\xdf\x7f\x0f#F\xe8\xffO\
-N\x86\xb1c\xc1\xe1\xa8\xf83\x96,\x81\xf4t\xc8\xcf\
-\x87\xb44\xc8\xcc\x84\xd1\xa3\xe1\x22Og\xb9bv\xee\
-\xdc\xc9\x8a\x15+(,,\xa4_\xbf~t\xec\xd8\xf1\
-\x92]}X\xa1\xb0;\x15\x0e\x87\xfa=\xf5\xb9x\x9d\
-;w\xa6W\xaf^\x1c:t\x88\xef\xbf\xff\x9e\xe4\xe4\
-d\xda\xb5k'7\xfd\x14BH\xa2#\xae\xdfD\xc7\
-e\xdd:\xf8\xc7?@\xd3\xf4^\x1e\x1f\x1f\xfd\xf9\xb7\
-\xdf\xd6\x13\x9bO>\x81\xbb\xee\x82\xdd\xbb\xe1\x86\x1b*\
-\xfe\x8c'\x9f\xf4|\x1c\x14\xa4\x0f]\xd5D\x85\x85\x85\
-,]\xba\x94\xb4\xb44\xda\xb4iC\xdf\xbe}\xa9U\
-\xab\xd6%Y\xb6\x06\x84\x07Xx\xacw\x02f\xa3\x01\
-\x93\xf1\xd2$O\xfe\xfe\xfe\x8c\x181\x82\x0d\x1b6\xf0\
-\xe3\x8f?\xb2n\xdd:\x1a7nLXX\x98l\x00\
-B\x88+N\xce\xd1\x11W4\xd1\xe9\xd3G\xef\xd5\xb9\
-\xeb.\xfd\xfc\x9a\xd7_\xd7\x9fw\x9d\xa4<j\x94\xfe\
-o\xb3fe\xc3Sgs\x9d\xa3\xf3\xc9'\xf0\xfc\xf3\
-\xe0t\xea=C\x1b6\xd4\xbc\xfa\xda\xb9s'))\
-)\xd8l6\xfa\xf4\xe9C\xabV\xad.Y\xcf\x88\xa6\
-i\x04\xfa\x98\xe9\xd3,\x9a\xeeM\x221]\xc2{T\
-\xb5i\xd3\x86\x1e=z`2\x99X\xb0`\x01{\xf6\
-\xec\x91su\x84\x10\x92\xe8\x88\xeb'\xd19\xfb~W\
-N'\x1c?\x0e!!\x10\x15U\xd6\x03\xb3pa\xd9\
-\xeb\xfa\x8fs\xf9eU\xfc\x19\x03\x06\xe8\x09\xd1]w\
-\xe9\xc3`w\xde\x09v\xbb\x9e\xfc\xd4$\xae\xde\x9cm\
-\xdb\xb6\xd1\xae];\xbaw\xef~\xd1\xd3\xc9/\x17\x1f\
-\x1f\x1f\x86\x0f\x1fNRR\x12iii\xa4\xa6\xa6\x92\
-\x93\x93#\x1b\x80\x10B\x12\x1dq}$:g\xf7\xe8\
-\xf4\xe8\x01u\xea\xc0\xe6\xcd\xfa\xe3-[\xf4\x7f\xe3\xe2\
-\xf4\x7f\x13\x13\xf5\x7f\x97,\xd1\xff=z\x14v\xee<\
-\xff\xe7ed\x94-\xab\xa6\x9d\xa3\xb3c\xc7\x0e\x8f\xde\
-\x9c\xa4\xa4\xa4K\xba|\xa5\x14\xa7\x8b\xac|\xb6\xfe0\
-\xdfl\xd5\xae\x1e\x8e\x00\x00 \x00IDAT>\x82\
-\xfd\x0f\xdc\x02\xa227\xdcp\x03={\xf6\xc4\xcf\xcf\
-\x8f\xc5\x8b\x17\xb3{\xf7n\xe9\xd5\x11BH\xa2#\xae\
-m\xde\xa6\x97?\xf2\x88\xfeo\xbf~\xfa\xf0\xd5\xa3\x8f\
-\xea=6O?\xad?\xff\x97\xbf\xe8\xff\x8e\x1f\x0f7\
-\xdf\xac\x9f\xb8\xec\xed\x1e\x96]\xba@x8X,\xfa\
-\x85\x02\x7f\xfc\x11\xc2\xc2\xf4\x1e\x9e\x9a\xa2\xb8\xb8\x98%\
-K\x96\xb0c\xc7\x0e:t\xe8\xc0\x8d7\xdex\xc9g\
-.) \xb3\xa0\x94\x17\xe7\xef\xe2\x1f\x8b\xf7\xfe\xa1{\
-]\x9d/\xa9\x1d<x0IIIl\xdd\xba\x95\x8d\
-\x1b7\x92\x9f\x9f/\x1b\x81\x10\xe2\x8a\x92\x93\x91E\xb5\
-\xf2\xd6\xa3s\xeb\xad\xfa\xb0\xd4\x94)p\xe0\x80\x9e\xec\
-\xbc\xf8\x22\xb4o\xaf\xbf>t\xa8~\xe5\xe3)S\xe0\
-\x97_\xe0\xf1\xc7\xc1`\xd0{x\x82\x82\xf427\xde\
-\xa8_\x7f\xa7<\x7f\x7f\xa8WOO\xa4\xe2\xe3kN\
-=\xa5\xa7\xa7\xb3n\xdd:\xacV+}\xfb\xf6\xbd\xe4\
-\xbd9\xa0\x9f\x8c\x1c\xe4k\xe2O\xadj\x13\xe8c\xbc\
-\xa8+#{\xd3\xb2eK\xbat\xe9\xc2\xb6m\xdbX\
-\xb1b\x05]\xbbv\xa5c\xc7\x8e2\x03K\x08!\x89\
-\x8e\xb8\xbe\x12\x1d\xd0\xa7\x80\x8f\x1e\xed\xfd\xbd\xb7\xdf\xae\
-\xff\x95\xf7\xd4Se\xff\xff\xe2\x8bk\xa3\x8e\xacV+\
-\xcb\x96-#==\x9d\xe4\xe4d:v\xec\xf8\x87\xef\
-N~>\x91A>\xbc6\x22\x09\x0d\xb0\x18\x0d\xd5\xb2\
-\xbe\x07\x0e\x1cHJJ\x0a\x9b6mb\xd3\xa6M$\
-%%\x11\x18\x18(\x1b\x83\x10\xe2\x8a\x90\xa1+q\xc5\
-\x12\x1d\xa1;t\xe8\x10\xa9\xa9\xa9\xe4\xe7\xe7\xd3\xabW\
-/\x9a7o^-\x9f\xa3i\x1aF\x83\x81 _3\
-\x81\xbe\xe6j\xebei\xdd\xba5\x9d:u\x02`\xf5\
-\xea\xd5\xec\xdd\xbbWV\xb2\x10B\x12\x1dqm':\
-g\xcf\xba\x12:\x87\xc3\xc1\x92%KHOO')\
-)\x89\x0e\x1d:T\xdb\xf5g\x94R\x94\xda\x1d\x1c\xc8\
-(\xe0P\xd6\x19\x9c\xce\xea9Q\xd8\xd7\xd7\x97\xfe\xfd\
-\xfb\xd3\xa2E\x0b\xd6\xaf_\xcf\xa6M\x9b(..\x96\
-\x95-\x84\x90DG\x5c\xbb\x89\x8e\xf4\xe8T\xec\xf8\xf1\
-\xe3\xacY\xb3\x86\x8c\x8c\x0c\xf7L\xab\xea\xeaiq\xdd\
-\x02\xe2\xfd\x95\x07\xf8d\xed!l\x97\xf8d\xe4\xf2\xda\
-\xb7oO\xbbv\xed(**b\xfd\xfa\xf5\x1c>|\
-XV\xb6\x10B\x12\x1dq\xed\xf16\xebJ\xe8=,\
-\xcb\x97/g\xe7\xce\x9d4h\xd0\x80.]\xba\x10\x1d\
-\x1d]\xad\x9fYbs\xb0\xf1P\x0e[\x8e\xe4\xe2\xac\
-\xc6\xa9\xdf\x01\x01\x01\xf4\xea\xd5\x8b\xc4\xc4D6l\xd8\
-\xc0\x96-[\xb0\xdb\xed\xb2\xd2\x85\x10\x92\xe8\x88k\x8b\
-\xf4\xe8xw\xfa\xf4iV\xae\x5c\xc9\xb1c\xc7\xe8\xd7\
-\xaf\x1f-Z\xb4\xa8\xd6\xd9I\x1a\x10\xeag\xe6\x9e\x1b\
-\x1b\xf0\xe7\x8e\xf50\x19\xabw&T\xc7\x8e\x1di\xdd\
-\xba5\xc7\x8f\x1fg\xe3\xc6\x8d\x9c<yRV\xba\x10\
-\xe2\xb2\x93YWB\x12\x9d+\xe4\xc7\x1f\x7fd\xd7\xae\
-]\x84\x85\x85\xd1\xa5K\x97Kr\x87\xf2J\x13\x1dM\
-#,\xc0\x87\xbb\xbb5\xbc,\xdf/22\x92\xae]\
-\xbb\xb2v\xedZ\xd6\xaf_\xcf\x96-[\xa8]\xbb\xf6\
-%\xbbA\xa9\x10BT\x85\xecq\x84$:W@i\
-i)\xcb\x96-\xe3\xf0\xe1\xc3\xee\x99VF\xa3\xf1\x9a\
-\xfb\x9e]\xbbv\xa5M\x9b6\xec\xd9\xb3\x87M\x9b6\
-\x91\x97\x97'+_\x08!\x89\x8e\xb8\xf6\x12\x1d\x99u\
-\xe5i\xef\xde\xbdl\xde\xbc\x19\x9b\xcdF\x8f\x1e=\xa8\
-_\xbf~\xb5\x7f\xa6R\x8a\x12\x9b\x83\xedGO\x93~\
-<\xbf\xdaf]\x95\xd7\xb0aC:t\xe8@hh\
-(?\xfe\xf8#\xdb\xb6m\x93\xdbB\x08!$\xd1\x11\
-\xd7^\xa2#=:e\x1c\x0e\x07\x8b\x16-\xe2\xf0\xe1\
-\xc3t\xec\xd8\x91\x96-[\xe2\xef\xef_\xfd\x89\x0ep\
-4\xb7\x88Q\xff\xd9\xc0\xdd36SbwT\xff\x0e\
-\xc6`\xe0\xc6\x1bo\xa4M\x9b6\xfc\xf4\xd3Ol\xde\
-\xbcY\x92^!\x84$:\xa2f\xdb\xb0a\x03\xc7\x8e\
-\x1d\x03\xce\x9due\xb3\xd9\xf8\xfb\xdf\xff~]_W\
-%33\x93\xd5\xabW\x93\x95\x95E\xdf\xbe}i\xd8\
-\xb0\xe1e\xfbl\x93\xd1@\x5c\x98\x1f\xb1\xa1\xbe\x5c\xae\
-\xbb2\xb4l\xd9\x92\xb6m\xdbb\xb3\xd9\xd8\xbau+\
-\x07\x0e\x1c\x90\x8dD\x08q\xf9\xf6{R\x05\xe2R\xb2\
-\xdb\xed\xdcq\xc7\x1d8\x1c\x0eV\xacXA\xbdz\xf5\
-\xdc\x09\x8e\xc3\xe1`\xfc\xf8\xf1\xcc\x9a5\x8bv\xed\xda\
-\xd1\xaf_\xbf\xeb\xae~\x5cS\xca\x0f\x1e<H\xfd\xfa\
-\xf5i\xdf\xbe=\x11\x11\x11\x97\xe5\xb35\xa0N\x88\x1f\
-_\xdc\xdd\x11\x83\xa6\xe1s\x99\xce\x09\xf2\xf1\xf1\xa1C\
-\x87\x0e\xb4h\xd1\x82\xad[\xb7\x92\x96\x96F\xb3f\xcd\
-\xe4\xa4d!\xc4e!{\x1aqi3g\x93\x89\xef\
-\xbf\xff\x1e\xab\xd5J\x97.]\xd8\xbd{7F\xa3\x11\
-\xab\xd5\xca\x83\x0f>\xc87\xdf|\xc3\x87\x1f~x]\
-&9\xa0\x9f\x84\xbcd\xc9\x12\x8e\x1d;\xc6\x80\x01\x03\
-h\xdc\xb8\xf1e\xbb\xe1\xa5\xa6i\x98M\x06bC\xfd\
-\x88\x0e\xf1\xc5`\xb8|7\xdal\xd7\xae\x1dm\xda\xb4\
-\xe1\xd0\xa1C\xa4\xa5\xa5\x91\x9b\x9b+\x1b\x8b\x10B\x12\
-\x1dQ35m\xda\x94\xd4\xd4T\xfc\xfd\xfd\xe9\xdd\xbb\
-7&\x93\x89\xb9s\xe7\xf2\xf1\xc7\x1f\xf3\xfe\xfb\xefs\
-\xef\xbd\xf7^\xb7u\xb3m\xdb6\xd2\xd3\xd31\x9b\xcd\
-t\xeb\xd6\xad\xda\xa7\x94\x97\xa7\x94\xc2\xe9T\x9c)\xb1\
-SXj\xbf\xac'\x05\xc7\xc4\xc4\x90\x9c\x9cL\xed\xda\
-\xb5\xf9\xf9\xe7\x9f\xd9\xb2e\x8b\x9c\x94,\x84\x90DG\
-\xd4\x5c\xf5\xea\xd5c\xd5\xaaU\x84\x84\x84`\xb3\xd9\xd8\
-\xb8q#o\xbf\xfd6\x0f=\xf4\xd0u['N\xa7\
-\x93E\x8b\x16q\xec\xd81\xbaw\xefN\xe3\xc6\x8d1\
-\x99.\xef\xe8qn\x91\x95\x8fS\x7f\xe1\x8b\x1f\x7f\xad\
-\xd6[@T\xa4]\xbbv\xb4m\xdb\x96\x1d;v\xb0\
-y\xf3f\xb9R\xb2\x10\xe2\xb2\x90st*?\x04\xae\
-\xf8y\xd7PCU\x8eH\xab\xab\xec\xd5\x12G%e\
-\xe3\xe3\xe2X\xb3z5\xfd\xfa\xf7\xe7\xd6\xd1\xa3\x99\xf4\
-\xc4\x13\xe7\xaf\xdb\x8a\x96_\x93\xcaVR\xfetn.\
-)k\xd6\x90\x93\x9dM\xdf>}\xa8[\xb7\xeee\xad\
-\x0b\xa5\x14\xb9\x85\xa5\xfc{\xd5\x01\xc2\x03,\x8c\xebT\
-\x17\x8b\xd1p\xc9\xbe\xdf\xf9\xca6o\xd6\x8c\xe4\xb6m\
-Y\xb6t)?m\xdd\xca\xbe\xbd{i\xd1\xa2\xc5\x15\
-]'\x97\xa4\xec\x95\xda\x065\x0d!\x84$:\x17\xe7\
-\xf4i(**W[&\x08\x0e\x06??\xfdqa\
-!\xe4\xe7W\xbc32\x18\xc0\xdf\x1fBB\xf4\xc7V\
-+dgW\x5cV\xd3\xc0b\x81Z\xb5\xca\x9e;u\
-\x0a\x1c^\xa6\xff\x1a\x8dzYWo@N\x0e\x94\x96\
-z\x8f#4\xb4,\xe63g\xf4?\xa7\xb3\xe28\x02\
-\x02\xcab.-\x85\xbc<\xf0v\xe4\xed\xe3S\x16\xb3\
-\xc3\xa1\xd7Wi\xa9G\x91\x18`\xe3w\xdf\x9d;}\
-:7\x17JJ\xbc\xef\xc8#\x22\xf4\xe5\xbbb.,\
-\xf4^\x1f\xc1\xc1z\xdc\x9a\xa6/\xf3\xcc\x19\xbd\xbe+\
-\xe2\xeb\xab\xd7\x87\xd1\xa8\x7f\xaf\x82\x02\xf06\x03\xac|\
-=+\xa5\x97=s\xc6{{)\x1fsa\xa1^\xbe\
-\x5c=\xff\xb8h\x11\xd6#Gh\x13\x13C\xfbf\xcd\
-\x08\x0d\x0e.\xab\xe7\x82\x02\xef1\xfb\xf9AP\x10\x98\
-\xcd\xe7\x8f\xd9l\xd6\xd7\x9f\x8f\x8f\x1e\xb3\xab\x8d\xfe.\
-\xb0\xa0\x94\x9b\xeb\xfa\x12\xe0c\xc4\x90q\x0a\xc2\xc3\xf4\
-\xba\x03\xbd\xeers\xbd\xaf\x93\xa0 \xbd\xac\xd1\x086\
-\x9b\xbe\xbe\xbd]6\xc0\xcf\x0f\x02\x03\xf5v\xedp@\
-~>\x96\xe2b:\xd6\xadK\x8f&M8\xf5\xf3\xcf\
-\xec\x5c\xb6\x8c\x16aaz\xccAA\xfa{\x94\xd2\xb7\
-9o\x17\x164\x1a\xf5\xe5\x06\x06\x96mWYY\xde\
-\xd7\x89\xbf\xbf\xbe\xbe\xf5.5\xc8\xcc\xf4\xde\x8e|}\
-\xf5\xb6d6\xebq\xb8\xda\xa8\xb7zv\xc5\xecj\xa3\
-\xe5\xea\xf9\x9c\x98\x03\x02\xf4\xf2U\xd9\x17\xf8\xf8\xe8m\
-\xc9\xe5\xc4\x89s\xcb\xc6\xc4\xe8\xcb\x15BT\xa5\xd3B\
-\xb8\x14\x16\x16\xaaa\xc3\x86\xa9O?\xfdT\x95\x96\x96\
-*5a\x82R\xfa.F\xffk\xdaT\xa9\xaf\xbf.\
-{\xc3\xbb\xef*e6{\x96q\xfd\xd5\xaa\xa5\xd4\xb3\
-\xcf\x96\x95MMU*$\xa4\xe2\xb2\x16\x8bR\x03\x06\
-\x94\x95-*R\xaan\xdd\x8a\xcb\x82R\x09\x09J\x1d\
-9RV\xfe\x96[\x94\xf2\xf5\xf5\x1e\xc7\xbcyee\
-_\x7f]\xa9\xc8\xc8\x8a\xcb\xfa\xf9)\xf5\xdcsee\
-\x17,P*1\xb1\xe2\xb2\x06\x83R\xbdz\x95\x95=\
-tH\xa9\x1e=\xbc\xc7l4*\xe5p\x94\x95\x1f?\
-^\xff\xde\xde\xca\xaf\x5c\xa9\x94\xdd\xae\x97}\xf3M\xa5\
-\xe2\xe2\xbc\x97}\xed5\xa5\x0a\x0b\xf5\xb2\xf3\xe7+\xd5\
-\xbe\xbd\xf7\xb2\xc3\x87+u\xea\x94^v\xe7N\xbd\xee\
-\xbc\x95\xadWO\xa9\xbd{\xf5\xb2g\xce(\xf5\x97\xbf\
-x/\x0bJ-^\xacTi\xa9^\xfe\xa3\x8f\x94\x8a\
-\x8ar\xbf\xe6\x04UhB\x15XP6\x0d\xe5|\xfd\
-u\xa522\xf4\xb2K\x96(\xd5\xb1\xa3\xf7\xe5\xdev\
-\x9bR\xbbw\xebew\xedRj\xdc8\xefe[\xb5\
-Rj\xd5*\xbdlV\x96R\x7f\xff\xbb\xf7\xb2~~\
-J}\xfe\xb9^\xd6\xe9T\xea\x87\x1f\xbc\xb7gP\xea\
-\xf9\xe7\xcbb\xde\xb2E\xa9\x1bn\xf0^v\xf4h\xa5\
-~\xfeY/\xfb\xeb\xafJ\x8d\x1d\xeb\xae\x87\x12\xa3^\
-\x0f%F\xfd\xb1JNV\xea\x7f\xff\xd3\xcb\xe6\xe6*\
-\xf5\xf6\xdb\xde\x97\x1b\x15\xa5\xbf\xae\x94RV\xab\xbe]\
-U\xb6N\xee\xbbO\xdf\x9e\x94R*3S\xa9\xd8X\
-\xefe\x07\x0c\xd0\xdb\x84RJ\x15\x17\xebm\xc5[\xd9\
-\x96-\x95\x9a3\xa7\xac=\xff\xe3\x1f\xde\xcb\xc6\xc4(\
-\xf5\xf2\xcbee\xd7\xacQ\xca\xc7\xa7\xe2\xb2>>J\
-\x8d\x18Q~\xa7\xa4TD\xc4\xb9\xe523e\x87-\
-D\x15I\x8fN\xa5\xfd]&\xfd\xc8\xad\xfcQ\x5c\xf9\
-)\xb1\x06\x83~\xc4\xea\xed\x88\xaf\xfc\x11\x97\xa6\xe9\xcf\
-\x95_^\xf9\xb2g\x9f\xab\xe1\xad\xac+\xae\xf2\xdd\xd6\
-&S\xd9\x91\xf3\xd9,\x16\xcf\x98\x8dF\xfd9oq\
-\x94\x8f\xd9`\xf0\x1e\x87\xd1\xe8\x19\xb3\xa6\x9d[_g\
-\xc7|\xf6c\x8b\xc5{\xef\xc1\xd91WV\x1fU\xad\
-\xe7\xb3\xeb\xee|1\x9b\xcd\x9e\xf5\xec\x8a\xc3\x9b\xb3\xdb\
-F\xb98\x0a5\x07\x03\xfe\xecd}]\xf8n\x96\x91\
-!&CYw\xaa\xc1p\xfe\xba+\x1fseq\x9c\
-\xddF++{v\xdb\xa8\xac=\xbb\x96U\xd5\xba\xab\
-\xa8\x8d\x9a\xcd\xd8\x8c\xf0ZW\x07\xafts\xf2\xd0F\
-x{\xb9\x11\xbf\xf2\xf5\x5c\x95\xefWQ\x1b\xadl\x1b\
-.\xbf\xec\x0b\xd9\xae*\x8b\xc3d\xaaz=W\x14\xb3\
-\xc5Rq\xaf\xea\x85\xec7\x84\x10U\xa2)\x99\xfa\xe0\
-VTT\xc4\x981c\x186l\x18c\xc7\x8e\xc5\xa2\
-\x94\xe7\xb0\x8dk\x88\xc9\xf5\xa3m\xb5z\xef\xbaw\xed\
-\x0c]C\x19\x0e\x87\xf7np\xd7\xce\xcf\xd5\x0d\xae\x94\
->4Q\xd9\xaa\xf1\xf3+\xdb\xd1\x96\x94x\xef\x8ew\
-\x0d1\xfd\x91\x98\xedv\xbd|e\xc9\x88+f\xa7S\
-\x1f\x82q:+\x1fFp\xfd\x90T%f\xd7\x0f\xab\
-\xd5\xaa\xc7\xe2-\x0e\xd7\x0f\x81\xa6\xe9\xe5l6\xefq\
-\xb8\x12=\x83A/c\xb5z\x8fC\xd3\xf4\xe1\x0c\x83\
-A\xfflW\x1cU\x8d\xf9\xf7zV\xc0[\xef\xbe\xc9\
-\x94\xe2\xffp\xc2'\x83\xef\x86}\xc5\x90\xc4a\x98|\
-|\xab\x1e\xb3\xeb\x07\xd0\xe1\xd0\xcbz\x8b\xd9\xf5#j\
-4\xea1\xdbl\x1eq\xa0\x14\xca\xfd\xf544W\xd2\
-\xab\x94\xbe\xcc\xb3\x86\x1e\xbd\xd6\xb3\xc3\xa1\x7f\xc7\xaa\xc4\
-\x5c\xae\x9e\xad\x0e+\xafnx\x93W~|\x83\xa8\xfd\
-\xe1<\x95\xf8\x18OMzZ\x8f\xc35D\xe8jw\
-\xde\xd6\x89+\x8e\xaa\xc4l4\xea\xeb\xc5u\xdeMe\
-\xdbU\xf9\xb6\xa1\x94\xbe\xdc\xca\xdaFU\xf7\x05\xae\xa4\
-\xd0\x95D^\xe8\xbe\xa0\xfc\xf0yE\xdb\x92\x10\xa2\xf2\
->\x0b\xa9\x82JX,\x95\x1f\xe1^\xc8\x91\x96\xeb\x9c\
-\x9d\xaar\xed\xe8\xaa\xc2\x95\x98T\xc5\x85\xc4l4V\
-=\x0eWRp5\xc4\x5c\xd5s\x17\x5c\xe7C\x5c\xaa\
-\xf6\xe0%\xe6\x92\x92\x12\x16\xadI!\xa3a6\xd4\x01\
-||\xc1b\xfec1\x1b\x0c\x7f\xb8\xee\x14p(\xeb\
-\x0c\xa3\xff\xf3#a\x01f\xe6?r#\xfe&\xa3g\
-\x1cUm\xa3\x06C\xd5\xd7w\xf9zv\x98\xdd\xdf=\
-#'\x87\x9f\xf6\xee\xe5hv6\xf1qq\x9e\xc9v\
-Ug\xa3]H\xccW\xcbvu\xa1\xfb\x82\xcbp{\
-\x10!$\xd1\xb9n\xfb\xbb\xb4\x8b{\xfdr\x94\xbdZ\
-\xe2\xb8\xd6c\xbe\x88\xef\xb7f\xcd\x1a\x8e\x1e;\x8a\xa3\
-\x9e\xa3\xe22\x97+f\xa5p:!\xbb\xd0\xea\xee\xd5\
-\xf9C1\x5c\xc2\x98w\xef\xde\xcd\x8f?\xfeH\xfc\xa8\
-Q5\xb7\xcd]M\xedN\x08q\xee\xb1\x85T\x81\x10\
-\xd5k\xf1\xe2\xc5d\x9d\xcab\xb0s0\xdf\x0d\xfa\x8e\
-\x1e\xf5{`\xd4.\xff\x8c\x19\x0d\x88\x0f\xf3\xe7\x7f\x0f\
-w\xe5\xf3\xbb:\xe0c\xbc\xfc\x9b\xbf\xc9h\xe2\xfe\xe4\
-\xfb\x99;p.\xc3\x22\x87\xb1w\xf7^6n\xdc(\
-\xd7\xd4\x11BH\xa2#DM\x94\x95\x95\xc5\xbau\xeb\
-\xc8;\x9d\xc7\xa8^\xa3\xe8\xdd\xac7\xa1\xbe\xa1W,\
-\x1e\x1f\xb3\x81\xa4:!$\xc6\x06_\xd6[@\x94%\
-[\x1a\xb1A\xb1\x0cj;\x88>\xed\xfa`2\x9aH\
-OOg\xd7\xae]\xd2X\x84\x10\x92\xe8\x08Q\xd3,\
-_\xbe\x9c\x8c\x8c\x0c\x9a6mJ\x8b\xe6-\x08\x0a\x08\
-\xd2O\x02\xbe\x02C\x12\xae\xcf5\x1a\xf4\xbf+\x15\x83\
-A3`1YHJJ\xa2m\xdb\xb6\xec\xdd\xbb\x97\
-\x0d\x1b6Hc\x11BH\xa2#DM\xb3`\xc1\x02\
-\xb2\xb3\xb3\xe9\xd3\xaf\x0f\xab\xb3V\xf3\xee\x86w\xd9\x9f\
-\xbd\x1f\xa7r^\xf6X\x94R\xe4\x17\xdb\x98\xf7\xd31\
-\x16\xee8q\xd9o\x01\x01\xe0p:Xwd\x1d\xef\
-nx\x97\x93~'i\xdb\xae-G\x8e\x1ca\xd3\xa6\
-M\xe4{\xbb\xe0\x9e\x10BH\xa2#\xc4\xd5\xe7\xd0\xa1\
-C\xfc\xf4\xd3OX\xadV\xba\xf7\xea\xce\x82c\x0bx\
-%\xe5\x15\xf6e\xef\xa3a\x83\x86\xee\x1e\x16M\xd3\xf0\
-\xf3\xf3#11\x91o\xbf\xfd\xb6Zb\x99<y2\
-\x06\x83\x81\x85\xcbV2\xf9\xfb]\xbc\xb5d/\xf6\xf3\
-$:G\x8e\x1cA\xd34\xee\xbc\xf3\xce\x0a__\xbe\
-|9\x9a\xa6\xf1\xea\xab\xaf\x02PXX\xc8\x0b/\xbc\
-@\xf1\xefWm~\xf2\xc9'\xd14\x8d\xad[\xb7\x96\
-%:\xca\xc1\x9a_\xd7\xf0J\xca+l\xc9\xdbB\x8b\
-\xa4\x16\xc4\xc4\xc4p\xe0\xc0\x01~\xfa\xe9'i4B\
-\x08It\x84\xa8)\x16/^LVV\x16\xc9\xc9\xc9\
-4j\xd8\x08+V\xf2J\xf3\xb09\xf4\xeb\xad\x98L\
-&\x9ey\xe6\x19\x9ey\xe6\x19\xee\xbd\xf7^N\x9d:\
-\xc5\xd8\xb1c\xd9\xbf\x7f\x7f\xb5\xc5d6j\xb4\xa8\x1d\
-L\xd3\x98\xa0\xf3\x0e]\x05\x06\x06r\xdf}\xf7\xd1\xb3\
-g\xcf*-{\xfc\xf8\xf1\xbc\xfa\xea\xab8+\xbb\x96\
-\x92\x82\x12{\x09y\xa5y\x94:Ji\xda\xb4)m\
-\xdb\xb6\xe5\xe0\xc1\x83l\xdc\xb8Q\x1a\x8d\x10\xe2\x92\x93\
-\xe9\xe5BT\x03\x87\xc3\xc1\x82\x05\x0b8}\xfa4\x03\
-\x06\x0c 22\xf2\x9c\xc4\xc2l6\xf3\xc6\x1bo\xb8\
-\x1f[,\x16\xdey\xe7\x1d\x0e\x1f>LBB\x02\xa5\
-\xa5\xa5|\xfa\xe9\xa7l\xd9\xb2\x05\x83\xc1@\xa7N\x9d\
-\xb8\xe3\x8e;0\x1a\x8d,Z\xb4\x88\xed\xdb\xb7s\xe7\
-\x9dw\xf2\xd1G\x1f\x91\x91\x91\xc1\xa8Q\xa3\xe8\xde\xbd\
-\xbb\x9eO(\xc5\x8c\x193\xd8\xb8q#m\xda\xb4\xc1\
-\xf1\xfb\x85\xef\xc2\x02,\xb4\xb7m\xa7\xb4\xa0\x04\x8b\xa9\
--\x00\x1f~\xf8!\xa5\xa5\xa5L\x9c8\x11\x80\x8f?\
-\xfe\x18\xbb\xdd\xce\x981ch\xd8\xb0!\x91\x91\x91\xee\
-\x18W\xae\x5c\xc9\xdc\xb9s\x89\x8a\x8a\x22))\xc9\xfd\
-\xfc\xda\xb5k\xdd'\x14\xbf\xfb\xee\xbbL\x980\xc1\xfd\
-Z~~>\xaf\xbd\xf6\x1a'N\x9c`\xd8\xf0aP\
-n\xc2YBB\x02\xc9\xc9\xc9,\x5c\xb8\x90\x9f~\xfa\
-\x89\xac\xac,j\x95\xbf\xe7\x9b\x10BH\xa2#\xc4\xd5\
-g\xdb\xb6m\xec\xdd\xbb\x17\xb3\xd9L\xf7\xee\xdd\x09\x0d\
-=w\xa6\x95\xddn\xe7\xa3\x8f>\x02 //\x8f\x99\
-3g\xd2\xa4I\x13n\xbc\xf1F\x00\x1ez\xe8!>\
-\xfd\xf4S\xbat\xe9BNN\x0e\xd3\xa6M#77\
-\x97'\x9f|\x92\xd9\xb3g\xf3\xe9\xa7\x9f2}\xfat\
-j\xd5\xaa\xc5\xd6\xad[\xf9\xf0\xc3\x0f\xd9\xb9s'\x89\
-\x89\x89<\xfd\xf4\xd3\xbc\xf3\xce;4i\xd2\x84\xf5\xeb\
-\xd7s\xe8\xd0!}\x837\x188\x98\xbe\x83\x0f>\xf8\
-\x80\xf1\xb7\x8d\xc2d2\xf1\xf0\xc3\x0f\xa3\x94b\xf8\xf0\
-\xe1\x04\x07\x07\xf3\xe0\x83\x0fr\xeb\xad\xb72h\xd0 \
-\xfe\xfa\xd7\xbfr\xc7\x1dw0x\xf0`\xe6\xcd\x9b\xc7\
-\xcd7\xdfLdd$M\x9b6\xe5\xed\xb7\xdfv\x7f\
-\x97\xb4\xb44~\xfb\xed7\x00\xa6O\x9f\xce\xc0\x81\x03\
-\xdd\xaf\xdd~\xfb\xed4n\xdc\x98\xed\xdb\xb7\xf3\xe1\x87\
-\x1fr\xf7\x7f\xeev\xbf\x16\x1c\x1cL\xf3\xe6\xcd\xa9[\
-\xb7.\x07\x0f\x1ed\xcb\x96-\x0c\x180@\x1a\x90\x10\
-\xe2\x92\xa9\xf1CWJ)N\x9f>\xcd\xbcy\xf3\x98\
-<y2\x0f<\xf0\x00w\xdey'\x8f?\xfe8\x1f\
-|\xf0\x01\x9b7o\xc6\xea\xedr\xf2BT\x93\x85\x0b\
-\x17\x92\x93\x93C\xd7\xae]\xa9[\xb7.\xe6\x0a\xae\x9a\
-k\xb3\xd9\xb8\xff\xfe\xfb\xb9\xff\xfe\xfb\xf9\xcb_\xfe\xc2\
-\x89\x13'\xe8\xd7\xaf\x1f\xa6\xdf\xaf\x0a<|\xf8pf\
-\xcc\x98\xc1\xbau\xeb\x98={6\x80\xc7\xf9.\x00O\
-?\xfd4\xa9\xa9\xa9<\xff\xfc\xf38\x1c\x0e6o\xde\
-Laa!\xef\xbd\xf7\x1e-Z\xb4`\xe7\xce\x9d\xfc\
-\xfc\xf3\xcf\xb4l\xd9\xd2\xfd\x9e\x11#F\xa0\x94b\xf1\
-\xe2\xc5\xac\x5c\xb9\x12\xa5\x14\x9a\xa6\xb1j\xd5*\x96.\
-]\x8a\xddn\xe7\xe6\x9bo>'\xde7\xdex\x03\xb3\
-\xd9\xcc\xe6\xcd\x9bIII\xe1\xfe\xfb\xefw\xbf\xf6\xc4\
-\x13O\xb8\x87\xb8v\xec\xd8A\xfb\xf6\xed\xdd\xaf=\xf9\
-\xe4\x93\xac]\xbb\x96\xb7\xdez\x0b\xa7\xd3\xc9\xb1\xf4c\
-e; \x83\x81\x84\x84\x04\xda\xb5k\xc7\xe1\xc3\x87Y\
-\xbf~=rW\x1a!\x84\xf4\xe8\xa0\x0f\x0d\x1c?~\
-\x9cO?\xfd\x94\xa5K\x97b4\x1a\x89\x8b\x8b#8\
-8\x98\xa0\xa0 \x0a\x0b\x0bY\xbcx1\x9f}\xf6\x19\
-u\xeb\xd6e\xcc\x981\x0c\x180\x80\x80\x80\x00Y\xeb\
-\xa2Z\x95\x96\x96\xb2d\xc9\x12\xf2\xf3\xf3\xb9\xe9\xa6\x9b\
-\xbc\x0e\xc5\xf8\xfa\xfa\xb2k\xd7.\x9cN'YYY\
-|\xf4\xd1G|\xf0\xc1\x07\x84\x85\x85\xf1\xca+\xaf\x90\
-\x94\x94\xc4\x07\x1f|@\x8b\x16-\xd8\xb3g\x8f;9\
-*\xaf]\xbbv\x00\xd4\xabW\x0f\xd0O\x08>|\xf8\
-06\x9b\x8d.]\xba\xb8\x13\xacn\xdd\xba\xb1a\xc3\
-\x06\xb2\xce\x94\xb2\xf0T0\xbeA!,X\xb0\x90\xf0\
-\xf00\x9a4iB@@\x00\xabV\xad\x02\xc0\xdf\xdf\
-\x9f\x81\x03\x07\x92\x95\x95\xe5\xf1Y\x07\x0e\x1c\xa0A\x83\
-\x06\xd4\xad[\x17\x80\x1e=zx\xf4\xeax\xd3\xa9S\
-'\x00j\xd7\xae\xad\xd7OQ)\x94\xeb\xe0j\xd8\xb0\
-!\xed\xda\xb5c\xde\xbcy\xec\xdc\xb9\x93\x13'N\xb8\
-\xcb\x0a!\xc4u\x9b\xe8\x9c>}\x9a\xfb\xef\xbf\x9f\x16\
--Z\xf0\xc8#\x8f\x90\x90\x90@`` \x16\x8b\x05\
-\x83\xc1\x80\xc3\xe1\xa0\xa8\xa8\x88\x9c\x9c\x1c\xb6n\xdd\xca\
-\xec\xd9\xb3\xc9\xca\xcab\xf4\xe8\xd1\x15\x0e#\x08q\xa9\
-l\xd9\xb2\x85_\x7f\xfd\x95\xd0\xd0P:w\xeeLP\
-P\x10V\xe7\xb9\xbd\x8a\x9a\xa6\xd1\xb0aC\x00\x1a7\
-n\x8c\xc5ba\xfa\xf4\xe9l\xd9\xb2\x05\xa7\xd3I\xf7\
-\xee\xdd1\x9b\xcd\xbc\xf9\xe6\x9b$''\xd3\xb0aC\
-\x8cg\xdd\x13+((\x08\xc0\xa3\xc7(88\xd8\xbd\
-\x8d\xb8\xb8\xa6n\x97\xda\x1c\xa4\x1c\xc8!0\xa1#\xcb\
-W,',4\x94\x9bn\xba\x89\xc0\xc0@\xbe\xfa\xea\
-+JJJ\x188p \xfe\x15\xdc_)88\x98\
-\xbc\xbc<w\x0fPAAA\x85\xdf\xff\xec\x1e\x19\xd7\
-\xb2\xdc\xb1\x9f\xd5a\x13\x10\x10@\xb3f\xcdh\xd4\xa8\
-\x11\xbf\xfc\xf2\x0biii\xfc\xe9O\x7f\x92\x86$\x84\
-\xb8\xbe\x13\x9d\x80\x80\x00&N\x9cHBB\x02QQ\
-Q^{j\x1c\x0e\x07\xcd\x9b7\xa7w\xef\xde\x18\x0c\
-\x06|/\xe4\xc6\x93B\xfc\x01\x8b\x17/&??\x9f\
-\x9e={\x12\x1b\x1b\x8b\xc1`\xc0\x8c\x99\xa7:?\xc5\
-\x9fo\xf83\xadbZ\x01e\xe7\xe8\xd8\xedv\xf2\xf3\
-\xf3\x995k\x96\xbb\x07$##\x83\xa3G\x8f\xd2\xb9\
-sg\x86\x0e\x1d\xca\xd4\xa9S\x01\xdcS\xb7+S\xa7\
-N\x1d\x9a6m\xca\x82\x05\x0b\x987o\x1e\xfe\xfe\xfe\
-|\xfd\xf5\xd7\x00\x84\xf8\x99\xf9\xbf\xa1\x8d\xd9\x11>\x9a\
-7\x9fZJ\xde\xe9\xd3\xf4\xed\xdb\x97\xc0\xc0@\xdez\
-\xeb-\x80\x0a\x87\xad\x00z\xf7\xee\xcd'\x9f|\xc2\x1b\
-o\xbcA\xff\xfe\xfd\xdd\xe5\xcb\xf7P\x81>\xed\xbcK\
-\x97.^\xe3k\x16\xd9\x8c\x91\x83G\x92\x14\x99\x84\xc9\
-`\xc2`0\xd0\xa8Q#:t\xe8\xc0\xfc\xf9\xf3Y\
-\xb7n\x1dC\x86\x0c\xc1`\x90I\xa1B\x88\xeb8\xd1\
-\xf1\xf1\xf1\xa1W\xaf^\x15\x9e\xfbP\x9e\xd1h$2\
-2\x92\xc8\xc8Hl6\x9b\xfb\xfc\x07!\xaaCII\
-\x09\xcb\x96-\xa3\xb0\xb0\x90\x01\x03\x06\x10\x12\x12\xf2\xfb\
-\xd5\x88\x8d\xf4m\xd4\x17\x87\xd3\x81\xbfY\xef\xe1p\x9d\
-\xa3S\xbe\xad\x8e\x181\x82I\x93&\x11\x18\x18\xc8\xe8\
-\xd1\xa3\xf9\xf6\xdbo\xf1\xf5\xf5\xa5s\xe7\xce\xc4\xc7\xc7\
-\xb3o\xdf\xbe\xf3\xc6`0\x18\xf8\xe4\x93O\x18>|\
-8#F\x8c   \x80\x9bn\xba\x89\xd9\xb3g\xe3\
-o1\xd1\xadum\x064\x1d\xc5\x07/>NII\
-\x09={\xf6\xc4\xcf\xcf\x0f___\x9cN'C\x86\
-\x0c\xa9p\xb9\xaf\xbc\xf2\x0aiii<\xf7\xdcs<\
-\xff\xfc\xf3\x8c\x1b7\xce\xe3\xda7=z\xf4`\xee\xdc\
-\xb9\x8c\x181\xc2\x9d\xb4U$&0\x86\xdb\x93n\xc7\
-b\xb4`\xd0\xf4d\xa6n\xdd\xba\xb4k\xd7\x8eo\xbf\
-\xfd\x96]\xbbvq\xe4\xc8\x11\xea\xd7\xaf/\x0dJ\x08\
-q\xd14u\x0d\x9c\xf9\xa7\x94\xa2\xa0\xa0\xc0\xdde\x9f\
-\x95\x95\xc5\xb2e\xcb(**\xa2m\xdb\xb6$%%\
-\x9d7!\x02(**b\xcc\x981\x0c\x1b6\x8c\xb1\
-c\xc7b\xb1X\xa4\x85\x88\x0b\x92\x9a\x9a\xca\xe8\xd1\xa3\
-\xb1\xdb\xed,Z\xb4\x88\xd6\xad[\x9f3\xdc\x04\xfa\xc5\
-\xf8\x5c7\xb2\xf4\xf5\xf5u'\x1a~~~\x1e\xe5v\
-\xee\xdc\x89\xc1` 11\x91\x8c\x8c\x0c\x8a\x8a\x8ah\
-\xd0\xa0\x01YYY\x14\x14\x14\x10\x1f\x1f\x8f\xd9l\xe6\
-\xcc\x993dddP\xabV-\xf7vPXX\xc8\
-\x9e={HLL\xc4\xe9t\x92\x99\x99I\xed\xda\xb5\
-\xdd=/G\x8f\x1e\xc5\xe1p\xb8\xcf\xefq\xcd\x9a\x8a\
-\x8f\x8fw\xf78\x1d9r\x84\xa0\xa0 \xf7\x14s\xbb\
-\xdd\xce\xae]\xbb\x88\x8d\x8d%,,\x8c\xdf~\xfb\x8d\
-\xf0\xf0p\xf7p\xf0\xee\xdd\xbbQJ\xd1\xb4iSN\
-\x9f>M^^\x1eu\xea\xd4\xc1\xc7\xc7\x87\xa2\xa2\x22\
-N\x9e<\xe9Q\xbe\xfc6\xbcb\xc5\x0a\x9ez\xea)\
-\xecv;\x7f\xfb\xdb\xdf\xb8\xed\xb6\xdb\xa4A\x09!\xae\
-\xdf\x1e\x1d\xd0\x87\xa5\x0e\x1c8\xc0[o\xbd\xc5\xc9\x93\
-'\xa9W\xaf\x1e\x93&M\xe2\xc5\x17_$==\x1d\
-\xbb\xddNhh(\xcf?\xff<=z\xf4\x90a+\
-Q\xed\x16-Z\xc4\x993g\xe8\xdb\xb7/111\
-\xee\xe1\x17\xbb\xd3\xce\xfa#\xeb\xc9.\xce\xa6c\x5cG\
-\xe2\xe2\xe3\xdc\xbd\x19\x95)\x7f\xad\x9a\x98\x98\x18\xf7\xff\
-]\xbd\x94.\x81\x81\x81\x04\x06\x06z\xbc7  \x80\
-\xe4\xe4d\x8f2\xc5V\x07\x1b\x7f\xc9\xc6d\xd4h\x1d\
-_\x1bc\xb9\xe1!W\x82\xe3\xde9\x98L\xees\x88\
-\xca?\xd7\xaaU+\xf7\xe3\xb3_o\xd6\xac\x99\xfb\xff\
-\x11\x11\x11DDD\xb8\x1f\xfb\xfb\xfbS\xaf~=\xf6\
-f\xefe\xd5\xeeU4\x0ckHRT\x12F\x83\x11\
-M\xd3h\xd0\xa0\x01\x9d:u\xe2\xab\xaf\xbeb\xfd\xfa\
-\xf5\x8c\x1a5\xaa\xc2$Q\x08!.D\x8d\x1e\x04/\
-))a\xea\xd4\xa9\x1c<x\x90N\x9d:q\xf2\xe4\
-I\x9e}\xf6Yrrrx\xe6\x99gx\xe9\xa5\x97\
-\xa8U\xab\x16\x9f\x7f\xfe\xb9\xdcGGT\xbb\xa2\xa2\x22\
-\x96.]JQQ\x11\x83\x06\x0d\x2288\xd8}\x91\
-@\xbb\xd3\xce\xc7?}\xcc\x8b\xab_dO\xe6\x9e+\
-2\x85Z\x01Y\x85\xa5\xbc\xbep7S\x96\xef\xbf\x22\
-\xf7\xbar*'\xab\x0e\xad\xe2\xc5\xd5/\xb2p\xffB\
-\x1c\xca\xe1~-66\x96\xe4\xe4d\x1c\x0e\x07\xbbw\
-\xef\xe6\xf0\xe1\xc3\xd2\xa8\x84\x10\x17\xadF\xf7\xe8\x94\x96\
-\x96\xb2|\xf9r\x9e}\xf6Y\xfa\xf4\xe9\xc3\xde\xbd{\
-\x194h\x10\x1f|\xf0\x01#F\x8c\xc0l6\xe3\xef\
-\xef\xcf\xd3O?]\xa5\x938\x85\xb8\x18iii\x1c\
->|\x98Z\xb5j\xd1\xa1C\x07\x8f\x99KJ)~\
-\xc9\xfd\x85\x1d\x19;\xc8/\xcdGqeF\x8c\x95\x82\
-\x12\x9b\x13\x1f\x93\x93+1h\xad\x94\xe2T\xe1)v\
-d\xec\xa0GA\x0f\x8f\x84\xcf\xcf\xcf\x8f\xc6\x8d\x1b\xd3\
-\xa4I\x13\x8e\x1e=\xca\xa6M\x9bh\xd4\xa8\x914,\
-!\xc4E\xa9\xd1=:N\xa7\x93\x93'O\xd2\xb5k\
-W\x22##\xe9\xd4\xa9\x13J)Z\xb6l\x89\xd1\xa8\
-w\x87'%%\x91\x97\x97W\xf9\xfdw\x84\xb8\x04\x16\
-,X@QQ\x11\xdd\xbau#::\xfa\x82g\x0d\
--]\xba\x94\x87\x1ez\xa8\xda\xda\xaa\x06\xd4\x0a\xf4\xe1\
-oC\x9a1\xa9\x7f\x13,\xa6\xea\xdb\xfc\x7f\xfe\xf9g\
-&L\x98pA\x17\xeb\xd44\x8d\xbau\xeb\xd2\xb1c\
-GN\x9c8\xc1\x86\x0d\x1b\xdc\xb7\xae\x10B\x88\xeb2\
-\xd1\x01\xb0Z\xad\xf8\xf9\xf9\xa1i\x1af\xb3\x19\x93\xc9\
-\x84\x8f\x8f\x8f{\xc8\xc0b\xb1\xe0p8\xe4j\xab\xa2\
-Z\x15\x16\x16\xb2l\xd92JKK\x194h\x10\x81\
-\x81\x81\xe7\xbdi\xe6\xd9I\xce\xb0a\xc3\xd8\xb5k\x17\
-%%%\xd5\x93\xe8h\x1a\x01>&\xba%D\xd2\xa9\
-a\x84\xc7\xf99\x97\xda\xbe}\xfb\xf8\xfc\xf3\xcf\x19=\
-z\xf4\x05%;\xb1\xb1\xb1\xb4m\xdb\x16\x9b\xcdFz\
-z:G\x8e\x1c\x91\xc6%\x84\xb8(5~\xae\xb5\xd5\
-j\xe5\xb3\xcf>s\x9f\x88i\xb5Z\xf9\xe6\x9bo\x88\
-\x89\x89A\xd34\xce\x9c9Caa\xa1\xaciQ\xad\
-\xb6l\xd9\xc2\xe1\xc3\x87\x89\x8c\x8c\xa4C\x87\x0e\x17t\
-\xe2\xfb\xd2\xa5K\x19>|8\xc9\xc9\xc9\xfc\xf0\xc3\x0f\
-\x15^\xac\xaf\xa6\x19=z4\x9a\xa61f\xcc\x18F\
-\x8c\x18\xc1\xdc\xb9s\xf1\xf1\xf19\xef\xfb\xfc\xfc\xfcH\
-HH !!\x81c\xc7\x8e\xb1i\xd3&\x1a4h\
- \x0dL\x08q}&:&\x93\x89\xd6\xad[\xb3y\
-\xf3f\xf7\xec\x8c\xd6\xad[\xb3k\xd7.\xf6\xef\xdf\x0f\
-\xe83\xb3Z\xb4hQ\xa5\x9d\xac\x10\x7f\xd4\xfc\xf9\xf3\
-)))\xa1\x7f\xff\xfeDGGWy\xb6\x90\xab'\
-\xa7]\xbbv,\x5c\xb8\xd0}\xa5\xe3\xea\xa0\x94\x22\xa7\
-\xd0\xca\xccMG\xf03\x1b\xb9\xa3s}\xcc\xd58|\
-5j\xd4(\x00\xc6\x8c\x19\xc3\xcd7\xdf\xcc\xdc\xb9s\
-\xd1\x8c\x95\xf7ri\x9aF\x5c\x5c\x1c\x9d:u\xe2\x9b\
-o\xbe!55\x95Q\xa3F\xc9\xc5\x03\x85\x10\xd7g\
-\xa2\xe3\xef\xef\xcf\xe4\xc9\x93\xabT6,,L\xd6\xb6\
-\xa8\x16\xae\xd9V\xa5\xa5\xa5\x0c\x192\xa4\xca=2K\
-\x97.e\xe8\xd0\xa1X,\x16\x0a\x0b\x0b\xe9\xd5\xabW\
-\xb5\xc7Zjwr0\xf3\x0c&\x83\xc6\xbf\xa3\x021\
-\x5c\xc0\xf0\xda\x1f\x15\x1f\x1f\xcf\xa2E\x8b\xb8\xf5\xd6[\
-\xf9\xf2\xab/\xcf[>66\x96\xf6\xed\xdb\xf3\xf9\xe7\
-\x9f\xb3k\xd7.\x8e\x1e=\xea\xbe\xbf\x96\x10B\x5cW\
-\x89\x8e\xc5b\xa1\x7f\xff\xfe\xb2\x16\xc5\x15\xb5m\xdb6\
-\xf7l\xab\xf6\xed\xdbW\xd8{h\xd4\x8c\x0ck:\x8c\
-\x16Q-\xa8\x1fZ\x1f\x03\x06\xa2\xa2\xa2\xf0\xf3\xf3C\
-)E\x5c\x5c\xdce\xb9\xceS\x89\xcd\x81=@Ot\
-\x1a\xc6\x04]\x96D\xc7u\x8e\x5cdd$f\xb3\x99\
-v\xb5\xdbq_\xf2}t\xad\xdb\x15\xa3f\xac\xf0\x00\
-&!!\x81\x86\x0d\x1br\xec\xd816n\xdc(\x89\
-\x8e\x10\xe2\xfaKt\x8a\x8a\x8a\x98;wn\x95\xcb\x0f\
-\x1b6\xacZ\x87\x05\xc4\xf5k\xc1\x82\x05X\xadV\xfa\
-\xf6\xedKTTT\x85\xc3V&\xa3\x89q\xad\xc6Q\
-j/%2 \x12M\xd3h\xdd\xba5k\xd6\xac\xa1\
-o\xdf\xbe\xec\xdb\xb7\x8f\x95+WV\xeb]\xbb\x95R\
-\xd8\x9d\x8aS\xf9%\x185\x8d\xe8\x10\xdfjOt\xa6\
-L\x99\xc2\xec\xd9\xb3\xb9\xeb\xae\xbb\x98:u*\x9a\xa6\
-\xd1\xbd^wZE\xb7\x22\xc8'\x08\xa3\xe1\xdc\xba\xd2\
-4\x8d:u\xea\xd0\xb9sgf\xcd\x9a\xc5\xda\xb5k\
-\xb9\xe5\x96[d\xf8J\x08q}%:\xa5\xa5\xa5,\
-X\xb0\xc0c'\xbe{\xf7n|}}\xdd7R<\
-q\xe2\x04\xc5\xc5\xc5$$$\xd0\xaf_?ItD\
-\xb5\xb4\xc3\xc5\x8b\x17c\xb3\xd9\x184h\x90\xd7^\x19\
-\x83f &0\xe6\x9c\xe7[\xb5j\xc5\xf2\xe5\xcb\xe9\
-\xdb\xb7/\xbd{\xf7\xae\xd6dG\xd34\xccF\x8d\xb8\
-\xb0\xcbs\xb2\xf3\x94)S\x984i\x12\x13&L`\
-\xda\xb4i\xeeD%\xd47\x94P\xdf\xd0J\xdf\x1b\x1d\
-\x1dM\xc7\x8e\x1d\xf9\xe2\x8b/\xd8\xbe};\xc7\x8f\x1f\
-'..N\x1a\x9c\x10\xe2\xfaIt|}}\xdd'\
-;:\x1c\x0eV\xae\x5c\x89\x9f\x9f\x1f\xc3\x87\x0f'>\
->\x1eM\xd38~\xfc8\x0b\x16, 44T.\
-%/\xaa\xc5\xee\xdd\xbb\xd9\xb7o\x1f!!!t\xe9\
-\xd2\xc5\xeb\xfd\xd1\x9cN'\xfb\xb2\xf7q\xc6z\x86F\
-\xe1\x8d\x08\xf5\x0duO?o\xd5\xaa\x15\xcb\x96-\xa3\
-o\xdf\xbe\xf4\xed\xdb\x97\xcd\x9b7\x13\x10\x10p\xc9c\
-UJas8\xf9-\xb7\x18\xa3\xa6Q7\xdc\x1f\x83\
-\xa1zzt\xa6M\x9b\xc6\xa4I\x93\xb8\xe7\x9e{\xf8\
-\xcf\x7f\xfe\xe3Nr\x9c\xca\xc9\x89\x82\x13\x9c(8A\
-T@\x14q!\x15\xdf\x0a#  \x80&M\x9aP\
-\xbf~}\x8e\x1f?\xce\xc6\x8d\x1b%\xd1\x11B\x5c_\
-\x89\x8e\x9f\x9f\x1f7\xdf|3\xa0\xdf\x0ab\xfa\xf4\xe9\
-\xdc}\xf7\xddL\x980\xc1}\xb1@\xa7\xd3Ill\
-,\xb3f\xcd\xc2f\xb3\xc9\xda\x16\x97\xdc\xc2\x85\x0b)\
---\xa5s\xe7\xce\xd4\xae]\xdb\xeb\xf0\x8a\xcdic\
-\xc6\xb6\x19\xec\xce\xdc\xcd\xb3\xdd\x9e\xa5}\xed\xf6\x1e\xe7\
-\xa7\xb4n\xdd\x9a\xe5\xcb\x97\xb3|\xf9\xf2jIr\x5c\
-r\x0a\xad\xbc\xbf\xf2\x00\x01>F^\x18\xdc\x1c\x1fC\
-\xf5\x1c\x00\xf4\xee\xdd\x9b\xbf\xfe\xf5\xaf\xbc\xfa\xea\xab\x1e\
-u\xe2t:Ysx\x0d\xdf\xec\xfa\x86\xc1M\x063\
-\xa1\xf5\x04\x0c\xc6s\xebL\xd34j\xd7\xaeM\xd7\xae\
-]\x99={6\xabW\xaff\xc4\x88\x112|%\x84\
-\xb8`\xd7\xc4^\xc3\xe9t\xb2e\xcb\x16\x92\x92\x92\xdc\
-I\x0e\x80\xc1`\xa0i\xd3\xa6\xec\xda\xb5\x8b\xd2\xd2R\
-Y\xdb\xe2\x92\xf6\x8e\xd8\xedv~\xf8\xe1\x07\xecv;\
-C\x86\x0c\xf1\xb8P\xe59mT9I=\x92\xca\xfc\
-}\xf39Yp\xb2\xc2[@\xb4n\xdd\x9a\xa7\x9ez\
-\xaa\xfab\x06\x8a\xac\x0e\xd6\x1d\xc8b\xf3\xa1\x5c\x9c\xd5\
-x\x11\xcdF\x8d\x1a\xf1\xfa\xeb\xaf\x9f\x93\x988\x95\x93\
-=\xd9{\x98\xbfo>;N\xed\xc0\xa9\xbc_\x05:\
-**\x8aN\x9d:QRR\xc2\xf6\xed\xdb\xc9\xcc\xcc\
-\x94\x86'\x84\xb8`\xa6k\xe1K\x18\x0c\x06\x1a7n\
-\xcc\xcc\x993\xb1X,\xee\x8b\x05fdd0k\xd6\
-,\xea\xd4\xa9\x83\xd9l\x96\xb5-.\xa9_~\xf9\x85\
-\xed\xdb\xb7\xe3\xef\xefO\xaf^\xbd\xbc\x0e[]-4\
- ,\xc0\xc2\xfd=\x1a\xe2k6b2^\xdd\xc79\
-\x81\x81\x81$&&\x12\x17\x17\xc7\x89\x13'HKK\
-c\xf0\xe0\xc1\xd2\xf0\x84\x10\xd7_\xa2c2\x99x\xec\
-\xb1\xc7\x986m\x1aS\xa6L!2R\x9f\xd5\x92\x95\
-\x95\xc5\xc9\x93'\xb9\xf3\xce;\x09\x09\x09\x91\xb5-.\
-\xa9E\x8b\x16QRRB\xe7\xce\x9d\xa9W\xaf\xdeU\
-?\xac\xa2i\x1aa\xfe\x16\xee\xbe\xb1a\x8d\xa8_M\
-\xd3\x88\x8e\x8e\xa6S\xa7N,\x5c\xb8\x90\x94\x94\x14\x06\
-\x0d\x1atA\xb7\xd6\x10B\x88k\x22\xd11\x1a\x8d\x8c\
-\x1c9\x92\x90\x90\x10V\xacXAff&J)\x22\
-\x22\x22\xb8\xf9\xe6\x9b\xe9\xd7\xaf\x1f~~~\xb2\xb6\xc5\
-%\xa1\x94\xc2\xe1p0\x7f\xfe|\x9cN'C\x86\x0c\
-\xc1b\xb1\xc8\x0fp5\xa8U\xab\x96{\x9a\xf9\x96-\
-[\xc8\xcf\xcf\x97\x83\x16!\xc4\xf5\x97\xe8h\x9a\x86\xd1\
-hd\xe0\xc0\x81\x0c\x1c8\x90\xe2\xe2b@\x9f\x99%\
-?>\xa2:\xb8\xee\xc3\xe4\xe3\xe3C\xbf~\xfd0\x99\
-\xae\xfeMI)E\x91\xd5\xc1\x8f\xbfdc6\x1a\xe8\
-\xda\xb8zo\xecy)\x04\x07\x07\xd3\xa2E\x0b\x22\x22\
-\x228z\xf4(\xdb\xb6m\xa3{\xf7\xee\xd2\x00\x85\x10\
-UVcOF.--%%%\x85\xec\xec\xecs\
-^\xf3\xf3\xf3s\xdf\xd1\x1c\xc0f\xb3\xb1\x7f\xff~\xf6\
-\xee\xdd+'%\x8b\x8b\xe6p8X\xbe|9\x85\x85\
-\x85$&&\xd2\xa4I\x93\x1a1\x1bH\x01\x99\xceX\
-\xa8\xdb\x00\x00 \x00IDAT\x05%L\xfe~\x17\
-o-\xd9\x8b\xd5\xee\xbc\xfawP\x06\x03111t\
-\xec\xd8\x91\x9c\x9c\x1c\xd6\xacY#\x0dP\x08qAj\
-l\x8fNqq1_~\xf9%\xcd\x9a5\xa3Y\xb3\
-f\xc4\xc6\xc6\x12\x16\x16\x86\x9f\x9f\x1f\x06\x83\x01\x9b\xcd\
-FAA\x01YYY\xfc\xfa\xeb\xaf\xec\xda\xb5\x8b\xc4\
-\xc4Dbcc\xe5\x06\x9f\xe2\x8f'\x0b\xbf\x0f[\xcd\
-\x9b7\x0f\xa5\x14\x7f\xfa\xd3\x9f\xaa4le\xd0\x0c\xdc\
-\x10}\x03\x1a\x1a\x11\xfe\x11h\x5c\x99\x9eF\xa3A#\
-&\xd8\x97`_3W\xa2\xb3S\xd34\xea\x85\xd4\xe3\
-\xc6\xf8\x1bi\x14\xde\xa8\xc2k\xe8\x9c\xadV\xadZt\
-\xed\xda\x95\x85\x0b\x17\xb2a\xc3\x06\x8a\x8a\x8a\xae\x89;\
-\xbc\x0b!$\xd1\xa9\x94\x9f\x9f\x1f\x7f\xfa\xd3\x9f\x98=\
-{6)))DGG\x13\x1a\x1aJPP\x10f\
-\xb3\x99\xa2\xa2\x22\xf2\xf2\xf2\xc8\xcd\xcd%''\x87\xf6\
-\xed\xdb\xd3\xb1cG\xd9A\x8a\x8b\x96\x99\x99\xc9\xda\xb5\
-k1\x9b\xcd\x0c\x1a4\xa8J\x17\xa34\x19L<\xd6\
-\xf11\x0a\xad\x854\x0ckX\xa5\x1f\xf8K\x9ed\x00\
-\x91\x81>\xfc\xdf\x90\xe6\x18\x0d\x1a\xe6+0\xeb\xcah\
-02\xb0\xf1@Z\xc7\xb4&2 \xb2\xc2[@\x9c\
--$$\x846m\xda\xe0\xef\xef\xcf\xc1\x83\x07\xd9\xb7\
-o\x1f\xad[\xb7\x96\x86(\x84\xb8\xb6\x13\x1d\x1f\x1f\x1f\
-\x06\x0d\x1aD\xef\xde\xbdY\xb7n\x1d\xeb\xd6\xad#=\
-=\x9d\xfc\xfc|\x1c\x0e\x07\x16\x8b\x85\xf8\xf8x:v\
-\xecH\x9f>}h\xd0\xa0A\x8d8\x8fB\x5c\xdd\x1c\
-\x0e\x07\xa9\xa9\xa9\xe4\xe5\xe5\x91\x90\x90@\xcb\x96-\xab\
-4le4\x18I\xac\x95xEc\xd74\x0d_\x8b\
-\x89\x96q\xa1W,\x06\x83f\xa0Np\x1d\xea\x04\xd7\
-\xa9\xfaN\xcad\xa2v\xed\xda$''\xb3c\xc7\x0e\
-V\xaf^-\x89\x8e\x10\xe2\xdaOt\x5c;n??\
-?\xf7\xa5\xf3\x01\x0a\x0b\x0b\xb1Z\xad\x04\x06\x06b2\
-\x99\xe4ddqI\xd9\xedv\xf7=\xd6\x06\x0f\x1e\x5c\
-\xe5\xd9VN\xe5$\xbb(\x1b\xab\xc3J\xb8_8\xbe\
-\xa6\xcb\x7f\xa2\xbcR\x0a\xa7\x82\xbcb\x1b\x06\x0dB\xfc\
-\xccW$\x86\x02k\x01\x05\xa5\x05\x04X\x02\x08\xf1\x09\
-\xa9R\x0c\x11\x11\x11t\xef\xde\x9d\xd4\xd4TRRR\
-x\xf8\xe1\x87\xe5\xdaXB\x88\xaa\x1d`]k_(\
-  \x80\xb0\xb00\xccf\xb3$9\xe2\xd2\xffH\x17\
-\x14\xb0z\xf5j\x0c\x06\x03\x83\x06\x0d\xaa\xf2I\xc8v\
-\xa7\x9dY\xe9\xb3xo\xe3{\x1c\xcc=\x88\xaa\xc6\xab\
-\x12W&\xaf\xd8\xc6\xb7i\xbf\xf1\xbf\x9f\x8faw^\
-\xfe\x18\x1c\xca\xc1\x8f\xbf\xfd\xc8{\x1b\xdfc\xcd\xe15\
-8\x9c\x8e*\xbd/$$\x84\x0e\x1d:`0\x18H\
-OO\xe7\xc8\x91#\xd2 \x85\x10\xd7g\xa2#Du\
-\xb1\xdb\xedl\xdb\xb6\x8d\xa3G\x8fR\xabV-:u\
-\xeaT\xe5d\xda\xe1t0s\xc7L\xde\x5c\xff&\x07\
-\xb2\x0f\xe0\xe4\xf2\xcfxR@Na)\xffZ\xb1\x9f\
-\x8fR\x0eaw\x5c\xfe\x18\x9cN'\xa9\xbf\xa5\xf2\xe6\
-\xfa7Y\xfe\xcbr\x1c\xaaj\x89\x8e\xc5b\xa1n\xdd\
-\xba\xb4l\xd9\x92\xbc\xbc<V\xadZ%\x0dR\x08!\
-\x89\x8e\x10\x97\x92\xcdfc\xd1\xa2E\x18\x0c\x06\xfa\xf4\
-\xe9C@@@\x8d\xea5\xd4\x80@\x1f37%\xc5\
-\xd0\xa7Y\x14FC\xcd\xea\xf1\x0c\x0b\x0b\xa3g\xcf\x9e\
-\xe4\xe7\xe7\xb3j\xd5*\x1c\x0e\x874J!\x84$:\
-B\x5c\x0aJ)\x8a\x8b\x8bY\xb6l\x19F\xa3\x91!\
-C\x86\xd4\xb8\xa1QM\xd3\x88\x09\xf1\xe5\xdd\xd1\xady\
-yX\x12\x16\x93\xb1F\xc5\x1f\x1a\x1aJ\xd7\xae]q\
-8\x1cl\xdd\xba\x95\xac\xac,i\x98B\x08It\x84\
-\xb8\x14\x1c\x0e\x07\x87\x0f\x1ff\xe7\xce\x9d\x04\x04\x04\xd0\
-\xbbwo\xa9\x94\xcb\xcc\xc7\xc7\x87\xc6\x8d\x1b\xd3\xb0a\
-CN\x9f>MJJ\x8aT\x8a\x10\xe2\xbcj\xec\xac\
-+\xd7\xd5\x8e\xabzT\xdd\xa8Q\xa3\xab\xfe\xee\xd2\xe2\
-\xeae\xb5ZY\xb6l\x19\x9a\xa6\xd1\xbe}{bb\
-bj\xdcwPJaw*N\xe4\x95`\xd44b\
-C}1\xd4\xa4\xa17M#44\x94\x9e={\xf2\
-\xf9\xe7\x9f\xb3j\xd5*F\x8e\x1c)\x93\x0e\x84\x10\xd7\
-f\xa2\x93\x93\x93\xc3\xf0\xe1\xc3\xab\xbc\x93[\xbe|9\
-\xf1\xf1\xf1\xb2\xc6\xc5\x1fJ\x10JJJX\xb2d\x09\
-&\x93\x89A\x83\x06\xd5\xcc\xef\x01\x9c\xc8+\xe6\x91\x99\
-?\x11\xe2kf\xda\x1d\xed\xf05\xd7\xac\xe1\xab\xe0\xe0\
-`n\xbc\xf1\xff\xb3w\xe7\xf1Y\x95\xf7\xbe\xf7?k\
-\xad{H\xee\xcc#\x09\x99\xe7\x84!@\x18B\x8a\x10\
-\x06AT,\x8e\xbb\x15\xeb\xd0s\xda\xaa}\xd4\xee\xd3\
-\xees\xecn\xfbXO\xed\xf4r\xd8\xb6v\xb7\xa7U\
-ww\x9f]\xb7Xe\x8bVE@\x19\x04\x01!a\
-\x08CF2\x07\xc8L\xe6\xdc\xd3Z\xeb\xf9\xc3\x92\xe3\
-\xd0ZE\xc8J\xee\xfc\xde\xbe\xf8C\xc8\x0b\xd6}]\
-k\xf8\xde\xeb\x1a~W\xf0\xcc3\xcf\x8c\xed\x92\x1c\x12\
-\x12\x22'\xa9\x10\x22\xf0\x82Nxx8?\xfb\xd9\xcf\
->\xf5\xcfGGGKo\x8b\x8b\x0e:\xdd\xdd\xdd\xbc\
-\xf7\xde{8\x9dN\xd6\xacY\xf3\xd9\xdfF\xa0\x10\x15\
-\x14E|H<N\x9b\xd3\xb2\x12\x10~\xdd\xe4\xcc\xf9\
-QFBtk\x96\xb8+\x10\xea\x08%>$\x9e0\
-g\xd8gn\x07\x97\xcbEaa!\xd1\xd1\xd1tt\
-tp\xf8\xf0a)\xf2)\x84\x08\xcc\xa0\x13\x1c\x1c\xcc\
-M7\xdd\xf4\xa1\x87\x91\xae\xeb\x0c\x0f\x0f\xe3\xf7\xfb\x89\
-\x88\x88@\xd34<\x1e\x0f\xaa\xaa\xca\xe6b\xe2\xa2\xb9\
-\xddn\xf6\xee\xdd\x8b\xd7\xeb%//\x8f\x82\x82\x82\xcf\
-\xfcw\xd85;\xdf\xbd\xe2\xbb\x9c\x1f=\xcf\xbc\x84y\
-\x96\x0c\xb7(@|\x98\x93Go.\xc4\xae\xa9\x96\x94\
-\x80\xb0\xa96\xd6\xe7\xadgF\xec\x0c\xd2#\xd3?U\
-\x09\x88\x0f}\x86\xbf\x0c_-]\xba\x94\xb7\xdf~\x9b\
-\x1d;vH\xd0\x11B\x04f\xd0\xf9\xe87n\x8f\xc7\
-CEE\x05\x9b7o\xa6\xb6\xb6\x96\x7f\xf9\x97\x7f!\
-55\x95w\xdey\x87\xb0\xb00\x8a\x8a\x8a\x08\x0a\x0a\
-\x92\x1e\x17\x9f\xf9\xdc\xba0l\xe5p8\xb8\xfa\xea\xab\
-/*\xa4h\xaa\xc6\x92\xd4%\x96~\x16EQ\x08\x0d\
-\xb2\xb3\xaa`\x9ae\xc7\xa0**y\xb1y\xe4\xc5\xe6\
-]\xf4\xdf\x11\x16\x16\xc6\xf2\xe5\xcb\xf9\xf3\x9f\xff\xcc\xee\
-\xdd\xbb\xf1\xfb\xfdR\xdeE\x08\xf1\xb7\xef;\x81\xf0!\
-\x0c\xc3`\xfb\xf6\xed\x5c{\xed\xb5\xd4\xd6\xd6\xb2u\xeb\
-V\x06\x06\x060M\x93\x86\x86\x06~\xf1\x8b_\xd0\xd7\
-\xd7'\xbd-.\xca\xe0\xe0 \xbbv\xed\x1a\x0b:\x17\
-\x1b\x98\xbc\xba\x17\x8f\xdf\x83nX3ld\x9a&\xa6\
-i\xe2\xd3\x0d\xfc\xbaa\xd91\xf8\x0d?\x1e\xbf\x07\xbf\
-\xe1\xbf\xa8c\x08\x0d\x0d\xa5\xa4\xa4\x04UU\xa9\xad\xad\
-\xa5\xa1\xa1ANR!D`\x07\x1d\x9f\xcf\xc7O\x7f\
-\xfaS\x1ez\xe8!6m\xdaDhh\xe8\xd8\x9f\x95\
-\x94\x94P]]\x8d\xc7\xe3\x91\xde\x16\x9f\x99\xc7\xe3\xe1\
-\xe8\xd1\xa3\xf4\xf4\xf4\x10\x13\x13\xc3\xe2\xc5\x8b/\xea\xef\
-\xd1M\x9d\x1d\x0d;x\xe1\xe4\x0b\x9c\x19<\x83\x895\
-% F\xbc:\x07\xea\xbb)k\xeaE\xb7\xa0\x04\x84\
-a\x1a\x9c\xec8\xc9\x0b'_\xe0\xf0\xd9\xc3\x18\xe6g\
-\xdf\x9dY\xd34\xe2\xe3\xe3Y\xb8p!n\xb7\x9b\xb7\
-\xdf~[NT!D`\x07\x1d\xc30\xa8\xa9\xa9\xf9\
-\xab\x9b\xb8EEE100\x80a\x18\xd2\xdb\xe2\xb3\
-\x07\x83\x91\x11\xb6o\xdf\x8e\xc3\xe1`\xd5\xaaU\x17\xbd\
-E\x81O\xf7\xf1\x93\xbd?\xe1\xaeW\xef\xe2\xc8\xd9#\
-\x17\xf5\x80\xff\xbcL\xe0l\xdf(w\xfe\xbe\x8c\xfb\x9e\
-?\x8a\xd7\x82\x12\x10\xba\xa1\xf3r\xf5\xcb\xdc\xf5\xea]\
-<w\xfc9\xfc\x86\xff\xa2\xfe\x9e\xd0\xd0PV\xae\x5c\
-\xc9\xe8\xe8(;v\xec\xb0\xacv\x98\x10B\x82\xce\xb8\
-\xb80A\xf1\xcc\x993\x1f\xba\xe1\x99\xa6\xc9\x89\x13'\
-\x88\x89\x89A\xd34\xe9m\xf1\xd9\x82\xc1_vC\xde\
-\xb1c\x07N\xa7\x93\xab\xae\xbaj\xd2\x7f&\xbb\xa6\x92\
-\x19\x1bBZ\x8c\xcb\xb2\x95_\x97BHH\x08\xcb\x97\
-/\xc7\xeb\xf5r\xf0\xe0A\xfa\xfb\xfb\xe5\x84\x15B\x04\
-n\xd0\xd14\x8d\x1bn\xb8\x81\xef}\xef{\x9c;w\
-\x0ex\xff-\xcf\xa1C\x87x\xe8\xa1\x87X\xb5j\x15\
-aaa\xd2\xdb\xe23\xf1\xf9|\xd4\xd7\xd7S[[\
-Kpp0W^y\xe5\xe4\xbe\xd8\x15\x85\xf4\xd8\x10\
-v\xfc\xd3r^\xfe\xe6\x12\x82\x1d\x937\xfc;\x1c\x0e\
-\xb2\xb2\xb2\xc8\xce\xcefxx\x98\x9d;w\xca\x09+\
-\x84\x08\xdc\xa0c\xb7\xdb\xf9\xd1\x8f~D^^\x1e\xd9\
-\xd9\xd9tww\xb3x\xf1b\x96/_Nff&\
-\xdf\xf9\xcew\x88\x8c\x8c\x94\xde\x16\x9f\xc9\xf0\xf0\xf0\xd8\
-\xdb\x9c\x92\x92\x12\x22\x22\x22\xa4Q&\x10\x97\xcb\xc5\xca\
-\x95+\xf1x<l\xdf\xbe]\x1aD\x08\xf1W\x05\xcc\
-\x9a\xcc\x90\x90\x10~\xfd\xeb_\xf3?\xff\xe7\xff\xa4\xaa\
-\xaa\x8a\xa1\xa1!f\xce\x9cInn..\x97Kz\
-Z\x5ct\xd0\x09\x0a\x0ab\xf5\xea\xd5Rj`\x02^\
-\xf3\xabV\xad\xe2\xe9\xa7\x9ff\xc7\x8e\x1d\xf8|>\xd9\
-/K\x08\x11\x98A\xc70\x0c\xca\xca\xcaX\xbcx1\
-999deea\x9a&\xaa\xaa\xa2\xaa\xaa<\xa0\
-\xc4g\xa6\xeb:]]]\x94\x95\x95\x11\x15\x15uQ\
-\xbb!O\xb8\xeb\xc44i\xefw\xf3\xc8\xeb\xa7\x08u\
-\xday\xe4\xfaY\x93\xae\x04\xc4\x07\x05\x05\x051\x7f\xfe\
-|\x22##\xe9\xea\xea\xa2\xbc\xbc\x9c\x92\x92\x129y\
-\x85\x10\x1f\x12\x10CW\x1e\x8f\x87u\xeb\xd61w\xee\
-\x5c~\xfc\xe3\x1fSSS\x83\xaa\xaah\x9a&!G\
-\x5c\x94\x91\x91\x11\x0e\x1c8\x80a\x18dgg\x93\x91\
-\x91\x11\x10\x9fk\xd8\xeb\xe7\xad\xcaN\xde\xa9\xed\xc2\x08\
-\x80\x95J\xe1\xe1\xe1\x94\x96\x96\xe2\xf5z\xd9\xb6m\x9b\
-\x9c\xb8B\x88\xc0\x0c:AAA\xec\xde\xbd\x9b[o\
-\xbd\x95\xdd\xbbw\xb3r\xe5J\xae\xbc\xf2J~\xf1\x8b\
-_\xd0\xd8\xd8\x88\xae\xeb\xd2\xd3\xe23\x19\x1a\x1ab\xcf\
-\x9e=\x04\x07\x07\xb3|\xf9\xf2\xcf\xbdj\xcf\xa6\xdax\
-\xa0\xf8\x01~q\xd5/\x985m\x16\xaa2\xfe\x97\x9e\
-\x02\xc4\x848\xf8\xe7k\xf2\xf9\xd6\xaa\x1cl\xea\xf8\x7f\
-\x09\xd0T\x8d\xab\xb3\xaf\xe6\x17W\xfd\x82\x9b\x0an\xfa\
-\xcc% >\xf4y\x14el\x92\xb8\xd7\xeb\x95y:\
-B\x88\xbf~\xaf0\x03`\x03\x0a\xd341\x0c\x83\xd1\
-\xd1QFFFhhh\xe0\xcd7\xdf\xe4\xed\xb7\xdf\
-\xa6\xb5\xb5\x95\xa2\xa2\x22~\xf7\xbb\xdf1m\xda\xb4\xbf\
-\xfb-~\xc3\x86\x0d\xac_\xbf\x9e\xdbn\xbb\xed\xa2\xf7\
-L\x11\x93\xff|\xaa\xad\xade\xe5\xca\x95\xf8\xfd~\x9e\
-\x7f\xfeyV\xadZ\xf5\xb9\xffN\xb7\xdf\x8da\x1a8\
-mN4e\xfc\xdf6\x9a\xe6\xfb\xdb\x14\xba}:\x0a\
-\x0aAv\xd5\x92c\xf0\x19>|\xba\x0f\x9bj\xc3\xa1\
-9>\xd71\xe8\xbaNUU\x15EEE\x84\x86\x86\
-R^^Nff\xa6\x9c\xc4B\x881\x01\xb3\x8f\x8e\
-\xa6i\x84\x86\x86\x12\x1f\x1f\xcf\xfc\xf9\xf3y\xe0\x81\x07\
-\xb8\xef\xbe\xfbHHH`\xe7\xce\x9d\x8c\x8c\x8cHo\
-\x8bO\xc5\xedvSUUEgg'QQQ,\
-Z\xb4\xe8\x92\x9c\xa3\xc1\xf6`B\x1c!\xd8T\x9b5\
-E=\x15\x05UQp9l\x04;4\xcb\x8e\xc1\xa1\
-9\x08q\x84\xbc_\xc5\xfds\x1e\x83\xaa\xaac\xd7\xbc\
-\xec\x92,\x84\xf8k\x02\xae\x12\xde\x91#Gx\xe3\x8d\
-7\xd8\xb6m\x1b]]]\xcc\x981\x83;\xef\xbc\x93\
-\x98\x98\x18\xe9m\xf1\xa9\x0c\x0e\x0e\xb2o\xdf>\x1c\x0e\
-\x07\xc5\xc5\xc5\x1f*)r\xd1o\x1e\x0c\x9d\x8a\x8e\x0a\
-\x06\xdc\x03\xcc\x8c\x9fI\x8c+f\xdc\x87\xafL\xd3\xc4\
-\xeb7h\xe9\x1dAS\x15\xd2bB\xd0\xc6y\xf8\xca\
-0\x0d\x9a\xfb\x9ai\xeek&)<\x89\xac\xe8\xac\xcf\
-\xd5\x0e\x1f\x1c\xbe*//g\xcb\x96-|\xe3\x1b\xdf\
-\x90\x93X\x08\xf1\x7f\xbf\x10\x05\xc2\x87\xf0\xf9|<\xf1\
-\xc4\x13\xac^\xbd\x9a/\x7f\xf9\xcb\x94\x97\x97\xb3~\xfd\
-z\x9e{\xee9\x9ez\xea)n\xbf\xfd\xf6K\xf2\xb0\
-\x12S\xc3\xc0\xc0\x00{\xf7\xee%$$\x84\xd2\xd2\xd2\
-K\xf2\xe6\xc3\xa7\xfb\xf8\xf1\x9e\x1fs\xc7+wp\xe4\
-\xdc\x11k\x0aj\x02g\xfbG\xf9o\xff_\x19\xdfz\
-\xe1\x18^\xff\xf8\xcf]\xf3\x1b~^\xaez\x99;^\
-\xb9\x83?\x1e\xff#~\xdd\xff\xb9\xff\xce\xa0\xa0 \xd6\
-\xacY\x83\xdf\xefg\xdf\xbe}\x0c\x0c\x0c\xc8I,\x84\
-\x18\x13\x10ott]g\xfb\xf6\xed,Y\xb2\x84\xef\
-\x7f\xff\xfb\xa4\xa4\xa4\x10\x15\x15EDD\x84,/\x17\
-\x9f\xedA\xec\xf7s\xee\xdc9\x8e\x1f?\xce\xb4i\xd3\
-(--\xbdD!\xc3\xa4s\xb8\x93\xd6\x81VF}\
-\xa3\x96\x15\xf54M\x18\xf6\xf8qh*XQ\x02\xc2\
-\x84~O?\xad\x03\xad\x9c\x1f=\x7fI\xda\xc1f\xb3\
-\x91\x9b\x9bKzz:\xe7\xce\x9dc\xdf\xbe}\x17]\
-e^\x08!AgBr8\x1c\xfc\xf2\x97\xbf$:\
-:\x9a\xa8\xa8(l6\x9b\x84\x1bqQ\x06\x07\x07)\
-//G\xd7u\xf2\xf2\xf2HMM\x0d\x98\xcf\xa6\x00\
-I\x91\xc1\xfc\xe7\xd7\x16\xa3\xa9\x0aN\x9b\x1a\x18\x9fK\
-Q\xc6j_=\xf7\xdcsl\xdd\xbaU\x82\x8e\x10b\
-L@\xdc\xe9TU%77\x97#G\x8ep\xff\xfd\
-\xf7s\xfd\xf5\xd7\xd3\xd8\xd8\x88a\x18\xbc\xfa\xea\xab\xec\
-\xde\xbd\x9b\xd1\xd1Q\xe9m\xf1w\x0d\x0c\x0c\xb0o\xdf\
->BBB\xf8\xc2\x17\xbe\x10P;\xed*\x8a\x82\xd3\
-\xaeQ\x90\x18N\xee\xb40T5p\xbe\x0c\xd8\xedv\
-V\xaf^=\xf6vW\xd7u\xa9h.\x84\x08\x9c\xa0\
-\xe3\xf7\xfb\xd9\xbcy3?\xfc\xe1\x0fq\xb9\x5c\xec\xd9\
-\xb3\x87\xa1\xa1!L\xd3dhh\x88?\xfe\xf1\x8f\x0c\
-\x0e\x0eJo\x8bOd\x9a&\xbd\xbd\xbd\x1c8p\x80\
-\xd0\xd0P\x96-[&\x8d2\x89\x82NII\x09.\
-\x97\x8b\xe6\xe6f\xaa\xaa\xaa\xa4Q\x84\x10\x81\x15t\x9e\
-~\xfain\xb8\xe1\x06\xee\xbb\xef>4M\x1b\xfb6\
-w\xe1M\x8f\xdb\xed\x96\xde\x16\x9fhdd\x84\xaa\xaa\
-*\xba\xba\xba\x88\x8f\x8fg\xde\xbcy\x01\x17\xe4\xba\x87\
-<\xfc\xe2\xedZ~\xf7N\xbd%\x93\x91/\x17EQ\
-\x88\x8d\x8de\xd1\xa2Ex\xbd^\xde~\xfbmy\xa3\
-#\x84\x08\x9c\xa0c\x18\x06G\x8f\x1e\xe5\xdak\xaf%\
-##\x03U\xfd\xbf\x1f+**\x8a\xfe\xfe~\xd9\x1d\
-Y\xfc]}}}\x1c<x\x90\xa0\xa0 \x8a\x8a\x8a\
-\x08\x0f\x0f\x0f\xac\xa0\x03\x0c\x8c\xfax\xee\xbdf6\x1d\
-nC7\x02'\x08(\x8a26|e\x18\x06o\xbe\
-\xf9\xa6\x04\x1d!D\xe0\x04\x1dEQ\x08\x0b\x0b\xa3\xbb\
-\xbb\xfbc7\xb7\x93'O\x12\x1d\x1d\x8d\xcdf\x93\xde\
-\x16\x7f7\xe8\xec\xdf\xbf\x9f\xf0\xf0p\x96.]zI\
-'\xb4k\x8a\xc6\xfa\xbc\xf5\xdc3\xff\x1e\xd2#\xd3Q\
-,X\xf1\xa4\x00!N\x1bW\xcdL`E~\x9c%\
-stTUe\xe1\xf4\x85\xdc3\xff\x1e\xaeH\xbd\x02\
-M\xb9tEE/\x04\x1d\x80\xf7\xde{\x8f\x9e\x9e\x1e\
-\x09;B\x88\xc0Xu\xa5i\x1a7\xddt\x13\x8f?\
-\xfe8\x9a\xa6\xa1\xeb:\xf5\xf5\xf5\xd4\xd5\xd5\xf1\xeb_\
-\xff\x9a5k\xd6\xc8>:\xe2\x13y\xbd^\xda\xda\xda\
-\xa8\xaa\xaa\x2255\x95%K\x96\x5c\xda\x0bM\xb3\xb1\
-a\xf6\x06\xdc~7\x09\xa1\x09\x96\xd4\xba\x02\x88r9\
-\xf8\xc6\xb2L4U\xc1\xae\x8d\xff1h\x8a\xc6\x92\xd4\
-%\xcc\x88\x9bA\x843\xe2s\xd5\xba\xfak!*;\
-;\x9b\xac\xac,N\x9f>\xcd\x81\x03\x07X\xb7n\xdd\
-\xe7\xaeS&\x84\x90\xa0c\xfd\x87\xb0\xd9\xf8\xfa\xd7\xbf\
-\xce3\xcf<\xc3\x93O>\xc9\xf0\xf00?\xfb\xd9\xcf\
-\x08\x0a\x0ab\xc6\x8c\x19\xdcv\xdbm\x84\x85\x85Io\
-\x8b\xbfi``\x80\xa3G\x8f\xa2\xeb:\xb9\xb9\xb9\xa4\
-\xa4\xa4\x5c\xda7\x19\x8aJRx\x92\xa5\x9fQQ\x14\
-\x1c\xb6\xf7wD\xb6\xf2\x18\xa2\x83\xa3\x89\x0e\x8e\xbe,\
-\x7f\xb7\xcb\xe5b\xc5\x8a\x15\x9c>}\x9a\xad[\xb7r\
-\xcd5\xd7H\xd0\x11B\x82\xce\xe4w\xe1\x9b\xdc7\xbf\
-\xf9MN\x9c8\xc1\xfa\xf5\xebq\xbb\xdd\xc4\xc7\xc7\x93\
-\x93\x93\x83\xcdf\x93W\xd8\xe2\x13]Xm\x15\x1e\x1e\
-NII\xc9%_Vn\x18\x06-\xfd-\x8c\xf8G\
-H\x0eO&\xcc\x11fIAM\xdd0\xe9\x1d\xf1\xa2\
-*\x0a\xd1.\xc7\xb8\x0f_\x99\xa6I\xd7H\x17\xdd#\
-\xddD\x07E\x13\x1f\x1a\x7fI\xdfn\xa9\xaa\xca\xda\xb5\
-ky\xe6\x99gx\xeb\xad\xb7\xf0x<\xb2\xaf\x96\x10\
-S\x9c\x1a(\x1fDQ\x14\xd2\xd3\xd3\xb9\xee\xba\xeb\xf8\
-\xcaW\xbe\xc2\x9dw\xde\xc9\x0d7\xdc@xx8\x8f\
-<\xf2\x08===\xd2\xdb\xe2o\x86\x90\xee\xeen\xca\
-\xcb\xcb\x09\x0f\x0f\xbf\xe4\xc3V\x00>\xc3\xc7\xaf\x0e\xfd\
-\x8aoo\xfb6';Ob\x98\x86%\x9f\xb5s\xd0\
-\xc3\xff\xfb\xca)~\xfef5>}\xfc\x8f\xc1o\xf8\
-\xd9vz\x1b\xdf\xde\xf6m^\xae~\x19\xdd\xb8\xb4\x8b\
-\x044Mc\xf1\xe2\xc5\x84\x87\x87\xd3\xdc\xdcLMM\
-\x0d\x86a\xc8I.\x84\x04\x9d\xc0b\xb3\xd9\x08\x0e\x0e\
-FQ\x14\x86\x86\x86\xd8\xb1c\x87T/\x17\x7f\xd3\xf0\
-\xf00\xd5\xd5\xd5tww\x93\x98\x98\xc8\xec\xd9\xb3/\
-}\x982\x0d\x0e\x9e9\xc8\xb6\xfamt\x0euZR\
-\x02\xc2\x04F\xbc~v\xd7t\xb2\xeft7\xba\x15\xf5\
-\xb6L\x93\xba\xde:\xb6\xd5o\xa3\xaa\xab\xea\xb2\x04\xbe\
-\x0b\xcb\xccu]g\xc7\x8e\x1d\xf8\xfd~9\xc9\x85\x90\
-\xa0#\xc4\xd4\xd5\xd3\xd3CYY\x19.\x97\x8b\xb9s\
-\xe7\x06\xdc\xb2\xf2\x0b\x14 .\xcc\xc9#\xd7\xcf\xe2\xbb\
-W\xe7\xff\xa5\xdeU\x80}FEA\xd34\xae\xbe\xfa\
-j\x14Ea\xdb\xb6m\x12t\x84\x98\xe2d\xcd\xb5\x98\
-\xd2L\xd3\xa4\xbb\xbb\x9b\xf7\xde{\x8f\xa8\xa8(\xbe\xf0\
-\x85/\x04\xec|\x0eEQ\x88\x08v\xf0\x0f\x0bR\x02\
-\xbaO\x15Ea\xf5\xea\xd5h\x9a\xc6\xe1\xc3\x87\xe9\xec\
-\xec$--\xedC\xfbk\x09!$\xe8L\x0a~\xbf\
-\x9f\xea\xea\xeaO\xfc\x99\xfa\xfaz\xf9F'\xfe&\xaf\
-\xd7Kkk+uuu\xe4\xe7\xe7S\x5c\x5c,\x8d\
-\x12\x00A'77\x97\xec\xecl\xaa\xab\xab9t\xe8\
-\x10III8\x1c\x0ei\x1c!$\xe8L.##\
-#<\xfc\xf0\xc3\x9f\xf83\x03\x03\x03\x0c\x0f\x0fKO\
-\x8b\xbf\xaa\xaf\xaf\x8f\x8a\x8a\x0a\x0c\xc3 ''\x87\xe4\
-\xe4\xe4\x80\xfd\xac\xa6i2\xe4\xf1\xb3\xa7\xb6\x1b\x87M\
-eE~\x1c650\x87\xaf\x9cN'+W\xae\xa4\
-\xb6\xb6\x96\xb7\xdez\x8bu\xeb\xd6I\xd0\x11B\x82\xce\
-$<x\x9b\x8d\xb9s\xe7\xfe\xdd\x9f+--%*\
-*Jz[|LWW\x17\x87\x0e\x1d\x22**\x8a\
-E\x8b\x16\x05T\xb5\xf2\x8f\x05\x1d\xa0w\xd8\xcb\xafv\
-\xd6\x11\x11l\xe7\x8a\x9c\x98\x80\x0c:\x17\xac]\xbb\x96\
-\xa7\x9f~\x9a]\xbbv1<<\x8c\xcb\xe5\x92e\xe6\
-BH\xd0\x99\x5c\x5c.\x17?\xf8\xc1\x0f\xa4\x17\xc5E\
-\xd1u\x9d\xf6\xf6v\x8e\x1e=Jll,%%%\
-\x97\xed\xdfR\x15\x95\x05\xd3\x17\xe0\xb2\xbb\x88\x0b\x89\xb3\
-\xa4\x04\x04\x80\xa6*\xc4\x86:\x09\x0b\xb2YS\x86B\
-Q\xc8\x8a\xcabu\xe6j\xf2c\xf3/\xeb\x0e\xd1\xc5\
-\xc5\xc5DGG\xd3\xdc\xdcLmm-QQQ\x01\
-\x1dd\x85\x10\x01\x18t\x84\xf8<\x86\x86\x86\xa8\xad\xad\
-\xa5\xb7\xb7\x979s\xe6PPPp\xf9.4\xd5\xc6\
-]s\xefb\xc03@^l\x9e%% \x14 :\
-\xc4\xc1\x03\xab\xb2\xb1\xa9\xaa5% T\x8d\xd2\xf4R\
-2\xa22\x98\x1e6\xfd\x92\x96\x80\xf8\xa8\xd8\xd8X\xe6\
-\xcf\x9f\xcf\xb6m\xdb\xd8\xbd{7\xf3\xe6\xcd\x93\xa0#\
-\xc4\x14$\xcb\x10\xc4\x94\xd5\xd9\xd9\xc9\xe1\xc3\x87\x09\x0b\
-\x0b\xa3\xb0\xb0\x90\x88\x88\x88\xcb\xfa\x80\x9f\x9b0\x97e\
-i\xcb\x88u\xc5Z2\x84\xa2(\x0a.\x87\x8dE\x19\
-1\x14\xa5E\xa1YQ\xd4SQI\x8fLgY\xda\
-2\xb2\xa3\xb3/k\xe0S\x14\x85\xab\xae\xba\x0a\x9b\xcd\
-\xc6\xdbo\xbf\x8d\xc7\xe3\x91\x1d\xd2\x85\x90\xa0#\xc4\xd4\
-`\x9a&\x9d\x9d\x9d\x94\x97\x97\x13\x13\x13s\xd9W[\
-\x19\xa6A\xefH/\xedC\xed\xb8\xfdnK\x1e\xb8\x17\
-J@\x0c{\xfc\x8cx\xfc\x96\x1d\xc3\x90g\x88\xf6\xa1\
-v\x06<\x03\x97\xfd\x18V\xae\x5cIPP\x10G\x8f\
-\x1e\xa5\xbd\xbd]vI\x16B\x82\x8e\x10S\x83\xc7\xe3\
-\xa1\xb9\xb9\x99\xfa\xfaz\xe2\xe3\xe3\x99?\x7f\xfee\xfd\
-\xf7tCg\xe3\xc9\x8d<\xb1\xff\x09N\xf7\x9c\xb6\xec\
-\xcdB\xdf\x88\x97\xdf\xbf\xdb\xc8\xf3\x87Z,)\x01\xa1\
-\x9b:\xfbZ\xf7\xf1\xc4\xfe'\xd8\xd9\xb0\xf3\x92\x97\x80\
-\xf8\xa8\xdc\xdc\x5c222\x18\x1a\x1a\xa2\xac\xac\x0c\xaf\
-\xd7+'\xbf\x10\x12t&\xef7t\x8f\xc7CUU\
-\x15\x07\x0f\x1eddd\x04\xd34\xe9\xe9\xe9ahh\
-H\xbe\xc9\x89\x0f\xe9\xe9\xe9\xe1\xf8\xf1\xe3\x00dgg\
-_\xf2j\xe5\x1f\xe57\xfcl<\xb9\x91\xc7\x0f<\xce\
-\xe9\xde\xd3\x18\x8c\xff\xf9xa\xd5\xd5\xbf\xbcU\xcb\xff\
-\xd9]\x8f\xdf\x18\xff\xb0e\x18\x06\xfbZ\xf7\xf1\xf8\x81\
-\xc7\xd9\xd1\xb8\x03\xdd\xbc\xbcA\xc7\xe1p\xb0r\xe5J\
-\xecv;;v\xec\xc0\xedv\xcb\xc9/\x84\x04\x9d\xc9\
-\x19rzzz\xf8\xe3\x1f\xff\xc8o\x7f\xfb[~\xfc\
-\xe3\x1f\xd3\xd1\xd1\x81i\x9a\x1c<x\x90\x1d;v0\
-::*\xbd-\xc6tttp\xe4\xc8\x11bcc\
-Y\xb0`\x01\x9a\xa6\x05\xfcgV\x80\xf0`;_Z\
-\x98\xc2\xf5\xf3\x92\xb0\xa9Sc\xa9\xf5\x95W^\x89\xdd\
-n\xe7\xddw\xdfe``@\xe6\xe9\x08!Ag\xf2\
-\xd1u\x9d\xcd\x9b7\xf3o\xff\xf6o\xd8\xedvv\xed\
-\xda\xc5\xe0\xe0\xe0\xd8<\x8c\xdf\xff\xfe\xf7\x0c\x0c\x0cH\
-o\x8b\xb1\xf3\xe5\xcc\x993\x9c8qb\xac\x00\xe4T\
-\xa0(\x0a\xd3\xc2\x83\xf8\xf9M\x85\xfc\xbf\xebf\xe0\xb0\
-iS\xe2s\x17\x17\x17\x13\x13\x13Css3uu\
-u\xf8|>\xb9\x08\x84\x90\xa03\xb9\xf8|>~\xf7\
-\xbb\xdfq\xd7]w\xf1\xe8\xa3\x8f\xe2r\xb9\xc6\xfel\
-\xfe\xfc\xf9\x9c>}Z\xc6\xe6\xc5\x98\xc1\xc1A\xea\xea\
-\xea\xe8\xe9\xe9!99\x99\xfc\xfc|i\x94\x00\x16\x1d\
-\x1d\xcd\xfc\xf9\xf3\xb1\xd9l\xbc\xf3\xce;\x8c\x8c\x8cH\
-\xa3\x08!Agr1M\x93\xe6\xe6fJKK?\
-\xb6l\xd7n\xb7\xe3\xf1xd\x8e\x8e\x18s\xee\xdc9\
-\x8e\x1e=JTT\x14\x85\x85\x85\x84\x85\x85M\x89\xcf\
-m\x9a&n\x9f\xce\xa93\xfdT\x9f\x1b@7\xa6\xce\
-\x10\xce\xea\xd5\xabq:\x9d\xec\xde\xbd{l\xfe\x9e\x10\
-B\x82\xce\xa4\xa1(\x0a\xc9\xc9\xc9\x1c=z\xf4C\x81\
-ftt\x94w\xdey\x87\xe4\xe4d\xa9s#\xc6\x1e\
-\xf6\x17\x82N||<\x0b\x16,\x98:\x9f\x1d\xe8\x19\
-\xf2\xf0\xe8\xb6\x1a~\xbd\xeb4>]\x9f2\x9f\xbd\xb4\
-\xb4\x94\x90\x90\x10\x8e\x1d;&\xcb\xcc\x85\x90\xa03\xf9\
-\xd8l66l\xd8\xc0\xf3\xcf?\xcf\xd6\xad[\xf1\xf9\
-|\x94\x97\x97\xf3\xf2\xcb/\xf3\xfc\xf3\xcfs\xed\xb5\xd7\
-\x12\x1a\x1a*\xbd-\xc6\x96\x95744\x90\x98\x98\xf8\
-\xa9j\xa5]\x920\x8eBrx2\xd9\xd1\xd9\x848\
-B,+\x01\xe1\xd3\x0d\x9a{\x86i\xe9\x1d\xc1\x8a\x97\
-\x1a\x8a\xa2\x10\x13\x1cCvt\xf6\xfb\xa50\xc6i\xe3\
-\xc4\xdc\xdc\x5c\xd2\xd3\xd3\x19\x1d\x1d\xa5\xac\xacL\x16'\
-\x081\x85\x04D\x09\x08\x9b\xcd\xc6\xddw\xdfMOO\
-\x0fO<\xf1\x04III<\xfb\xec\xb3\x18\x86\xc1\xa2\
-E\x8b\xb8\xe3\x8e;\xa6\xcc\xf0\x84\xf8d\x9d\x9d\x9d\x9c\
-<y\x12M\xd3\xc8\xca\xca\x1a\xb7j\xe56\xed\xfd\x12\
-\x10\xd7\xe6\x5cK^l\x9e5;#\x03Q!N\xee\
-_\x99\x83\xd3\xa6b\xb3\xa0\x04\x84\xaa\xa8\x94\xa6\x97\x12\
-\x1d\x1cM^l\x1e\x9a2>\x13\xa25Mc\xc5\x8a\
-\x15\x9c8q\x82\xdd\xbbws\xfd\xf5\xd7\xcb\x97\x1f!\
-$\xe8L\x1e\x8a\xa2\x10\x1e\x1e\xce\xcf\x7f\xfesN\x9c\
-8ACC\x03###deeI}\x1b\xf1!\
-g\xcf\x9e\xe5\xe8\xd1\xa3L\x9b6\x8d\xa2\xa2\x22\xd4q\
-\xaa\xdemSm\xac\xcd^k\xf9u\x12\x11l\xe7\xa6\
-\xf9\xc9\x96\x1d\xc3\x85R\x18s\x13\xe6\x8e\xfb\xbf\xbdb\
-\xc5\x0a\x9e~\xfai\x0e\x1c8@__\x1fqqq\
-\xe3\xd6\xffB\x08\x09:\x9f\x99\xae\xebttt|\xec\
-\xf7cbb\x88\x89\x89\x19\xfb\xff\xae\xae.\x00\xe2\xe3\
-\xe3\xb1\xd9\xa4\x86\xe9T\xa6\xeb:\xad\xad\xad\x9c:u\
-\x8a\x9c\x9c\x9c\xcb\xbe\x1b\xf2\x07\x99\xa6\x89G\xf7\xa0\x1b\
-:N\x9b\x13M\xd1\xc6\xfd\xad\xce\x85\x09\xb8\xbaa\x82\
-\x02\x9a\xa2Xr\x0c>\xc3\x87O\xf7a\xd7\xec\xd8U\
-\xfb\xb8\x1d\xc3\xa2E\x8b\x88\x89\x89\xa1\xae\xae\x8e\xba\xba\
-:\xd2\xd2\xd2\x08\x0a\x0a\x92\x0bC\x08\x09:\x13\xd3\xf0\
-\xf00\xbf\xfa\xd5\xaf>\xf4{>\x9f\x0f\xc30\xd0\xb4\
-\xf7\x1f\x22~\xbf\x1fUU\xb1\xd9l\xfc\xaf\xff\xf5\xbf\
-\x88\x8e\x8e\x96\x1e\x9f\xc2\xfa\xfb\xfb\xa9\xab\xab\xa3\xb7\xb7\
-w\xdc\x97\x95\xeb\xa6\xce\xde\xe6\xbdt\x8dt\xb1,u\
-\x19\xd3\xc3\xa7[2Og\xc4\xabs\xa4\xe5<vM\
-eaz\x14\xda8\x07\x1d\xc34\xa8\xee\xae\xe6d\xe7\
-Ircr\x99\x970o\xdc\x86\xaf\x22\x22\x22X\xb8\
-p!\xad\xad\xad\xec\xdd\xbb\x97\xe2\xe2b\x09:BH\
-\xd0\x99\xb8|>\x1f'N\x9c\x18\xfb\x96x\xfe\xfcy\
-\xea\xea\xea\x88\x8f\x8f'6\xf6\xfd\xea\xd0===t\
-vv\x92\x9e\x9e\xce\xfd\xf7\xdf/\xbd=\xc5\x9d9s\
-\x86\x8a\x8a\x0a\xe2\xe2\xe2\x98={\xf6\x87\xf6[\xba\xec\
-\xe7\xab\xee\xe3\x7f\xbf\xf3\xbf\xd9\xd7\xba\x8f\xcd\xff\xb0\x99\
-ua\xeb.k\xe5\xee\xbf\xc6\x04\xce\xf6\x8dr\xfb\xbf\
-\x1d\x22:\xc4\xc1\xbb\x0f\xae\xc0\xe5\x18\xdfc\xd0\x0d\x9d\
-M\x95\x9bxd\xcf#\xdc\xb7\xf0>f\xaf\x99\x8d\xa6\
-\x8e\xdf\xc6\x85\xcb\x97/g\xeb\xd6\xad\xec\xd9\xb3\x87\xbb\
-\xef\xbe{\xec^!\x84\x90\xa03\xe1\xc4\xc4\xc4\xf0\xfa\
-\xeb\xaf\x8f\x85\x9e\xa7\x9ez\x8a\x83\x07\x0f\xf2\xb3\x9f\xfd\
-\x8c\x8c\x8c\x0cTU\xa5\xa5\xa5\x85\x1f\xfd\xe8Gde\
-e\x11\x12\x12\x22\xbd=\x85\x99\xa6I[[\x1b\xc7\x8f\
-\x1f'!!\x81\xa2\xa2\xa2)\xd9\x0e\x0e\x9bJ\xde\xb4\
-0\x22\x5cv\xd4)\xf8|_\xb6l\x19aaaT\
-TT\xd0\xde\xdeNjj\xaa\x0ci\x0b\x11\xe0\x02b\
-&\x9e\xdf\xef\xe77\xbf\xf9\x0d\xdf\xfd\xeew\xc9\xcc\xcc\
-\x1c\x9b`\x98\x9a\x9a\xca\xfd\xf7\xdf\xcf\x9f\xfe\xf4'\xfa\
-\xfb\xfb\xa5\xb7\xa70\x8f\xc7CSS\x13\x0d\x0d\x0d$\
-%%1g\xce\x9c)\xd7\x06\x0a\x90\x12\xe5\xe2\xf5\x07\
-\xae\xe0\xf9\xaf\x15\xe3\x9c\x22% >(;;\x9b\xf4\
-\xf4t\xfc~?eee\x0c\x0d\x0d\xc9\xc5!\x84\x04\
-\x9d\xc9\xf1m}hh\x88s\xe7\xce\xe1v\xbb\xc7&\
-]z<\x1e:;;\x19\x1e\x1e\x96\x9dP\xa7\xb8\xb3\
-g\xcfr\xea\xd4)\x9cN'\x99\x99\x99$&&N\
-\xbd\xa0\xa3(\xa8\xaa\x82]{\x7fi\xf9T\x1c\xb2Q\
-U\x95\xd2\xd2R\x5c.\x17\xef\xbe\xfb.\x83\x83\x83r\
-q\x08\x11\xe0\x02\xe2\x9d\xad\xa6i\xac]\xbb\x96\x87\x1f\
-~\x18]\xd7\x99={6\x8a\xa2PYY\xc9c\x8f\
-=Fqq\xf1\xb8\xce\xc7\x10\x13/\x08\xb7\xb6\xb6r\
-\xfc\xf8q\x92\x92\x92(**\x9a\x92\x0fy\xd341\
-L\x18t\xfb\xde\xdf\x92!\xc86%\xdb\xa1\xb4\xb4\x94\
-g\x9f}\x96\x03\x07\x0ep\xfe\xfcy\x92\x93\x93e\x9e\
-\x8e\x10\x12t&6\x87\xc3\xc1\xa3\x8f>\xcaw\xbe\xf3\
-\x1d\xee\xbe\xfb\xee\x0f\xbd\xbdY\xb6l\x19\x0f?\xfc\xf0\
-\x87\x96\x9c\x8b\xa9\xc50\x0c\x9a\x9b\x9b9u\xea\x14s\
-\xe7\xce\x1d\xb7\xdd\x90'\xa2\xee!\x0fO\xed\xa8#\xc4\
-i\xe3;kr\xa7\xe4\xf0\xd5\xa2E\x8b\x88\x8a\x8a\xe2\
-\xd4\xa9S\xd4\xd6\xd6\x92\x9d\x9d-_\x84\x84\x90\xa03\
-\xb1)\x8a\xc2\xb4i\xd3x\xee\xb9\xe7\xa8\xaf\xaf\xa7\xbe\
-\xbe\x1e\xc30\xc8\xcc\xcc$33S&\x1bNq\x17\
-V\xe4\x0d\x0c\x0c\x90\x9a\x9ajY\xb5r\xa7\xcdI\xb0\
--x\x5cW\x19}\x90\xc9\xfbos\xfe\xebH\x1b\xd1\
-!\x0e\xfe\xf1\xca\x1c\x0b.V\xb0\xabv\x82m\xc18\
-4k\xea\xcf\x85\x84\x84\xb0h\xd1\x22\x9a\x9a\x9ax\xf7\
-\xddwY\xb2d\x89\x04\x1d!$\xe8Ll\xa6i2\
-<<\x0c\xc0\xb4i\xd3\x986m\xda\xd8\x9f\xb9\xddn\
-\x00\x5c.\x97\xec\x82:E577s\xf2\xe4I\x12\
-\x12\x12\x985k\x16N\xa7s\xfc/4\xd5\xc6\xad\xb3\
-neI\xf2\x12\xb2\xa3\xb3\xc7}i\xf9_2\x06\x91\
-.\x07\xdfX\x96I\xb0]\xc3f\xc1\xf5\xa0)\x1aK\
-R\x97\xf0O%\xffDqr\xb1e\xa1\xaf\xb4\xb4\x94\
--[\xb6\xb0\x7f\xff~\xfa\xfa\xfaHHH\x90\xe1+\
-!$\xe8L\x5c^\xaf\xf7c\xfb\xe4\x98\xa69\xf6K\
-UU\x1e}\xf4Q\xe2\xe3\xe3\xa5\xc7\xa7\x18\xd34i\
-ii\xe1\xe4\xc9\x93$''[\xb6\xda\xca\xae\xd9\xf9\
-Z\xd1\xd7,m\x0bEQ\x88\x0du\xf2\xed\xd5y\x96\
-\x1d\x83\xa6j\xac\xccX\xc9\xca\x8c\x95\x96\xb6\xc5\xd2\xa5\
-K\x09\x0f\x0f\xe7\xe8\xd1\xa3\xb4\xb7\xb7\x93\x93\x93#o\
-~\x85\x08P\x01\xf3\x8acxx\xf8C\xbf\xfa\xfb\xfb\
-9t\xe8\x10[\xb6l\xa1\xbb\xbb[V]MQ\x1e\
-\x8f\x87\x86\x86\x86\xb1e\xe5\x85\x85\x85\x96\x05\xae\x8f\xfe\
-\x92c0-\xbb.\xd3\xd3\xd3\xc7\xb6\xa2(++\x93\
-\xed'\x84\x08`\x01\xf1\x15\xc6\xe9t\xf2\xe2\x8b/~\
-\xec\xf7\x0d\xc3\xe0\xc1\x07\x1f$22\xd2\x92\xe1\x0aa\
-\xbd\x96\x96\x16\xaa\xaa\xaa\x08\x0b\x0b#''\xc7\xb2\xb7\
-z&&\xe7\x06\xcf\xe1\xd1=L\x0b\x99\x86\xcbn\xcd\
-\x9c\x10\xd34\xf1\xe9\xef\xd7\xba\xb2k\xea\xb8\x17\xa10\
-1\xe9s\xf7\xd1\xe7\xee#\xdc\x19Ntp\xb4%\xa5\
-0\x14Ea\xe9\xd2\xa5\x94\x97\x97s\xe0\xc0\x01n\xba\
-\xe9&\xa2\xa3\xa3e\xf8J\x88\x00\x14\xd0\x93V\x14E\
-\xe1\x1b\xdf\xf8\x86l\x188\x85555q\xea\xd4)\
-RSS-{\x9b\x03\xe0\xf1{\xf8\xf2\xa6/\x93\xfd\
-T6o5\xbc\x85n\xea\x16\x84-\xa8\xef\x1a&\xff\
-\xa1\xad|\xe1\xe7;q\xfb\xc6\xff\x18\xfc\xba\x9f_\xbe\
-\xf7K\xb2\x9f\xca\xe6G\xef\xfc\x08\x9f\xee\xb3\xacO.\
-\x0c_\xed\xdf\xbf\x9f\xde\xde^\xb9X\x84\x90\xa039\
-\x83NKK\xcb\x876\x11\x14S\x87i\x9a466\
-r\xea\xd4)RRR,\x0d:\x17\xdef\x98\x98\xef\
-'\x0eK\xdb\xe5\xfd_V\xb7\x83\xd5\xd7\xe4\x82\x05\x0b\
-\x88\x8e\x8e\xa6\xbb\xbb\x9b\xaa\xaa\xaa\xb1\x05\x0dB\x88\xc0\
-\x120\x93\x91\x1fz\xe8\xa1\x8f=\xe4:;;\xd9\xbe\
-};\xabV\xad\x92ZWSPgg'uuu\
-\xb8\xddn\xd2\xd2\xd2\xc8\xc9\xc9\x99\xd2\xed\xa1\x00\xe9\xb1\
-.\x0e\xfc\xf3JTE!\xc86\xb5W!\x06\x05\x05\
-\xb1h\xd1\x22\xea\xea\xea8x\xf0 \xcb\x97/'4\
-4T.\x1c!$\xe8L<\x86aP^^\xfe\xe1\
-\x9b\xba\xa2\x10\x15\x15\xc5?\xfe\xe3?r\xfb\xed\xb7\xcb\
-\x86\x81SPcc#UUU$%%1s\xe6\
-L\xecv\xbb\x5c\xf0\xaaJBx\x90\x9c\x1c\x7f\xb9G\
-\x5cq\xc5\x15\xbc\xfe\xfa\xeb\x1c8p\x80\xde\xde^R\
-SS\xa5a\x84\x90\xa03\xf18\x9dN^z\xe9\xa5\
-\x8f\xfd\xbe\xaa\xaa\xd8\xedv\x82\x82\x82d\x92\xe1\x14\xd4\
-\xd0\xd0@ee%\xa9\xa9\xa9\xcc\x9a5k\xca\x9f\x03\
-r\x0d|\xdc\x92%K\x88\x8c\x8c\xe4\xe4\xc9\x93\xb4\xb5\
-\xb5I \x16\x22\x00\x05\xc4\xbbk\xaf\xd7\xcb\xbd\xf7\xde\
-\x8b\xaa\xaaDFF\x12\x15\x15ETT\x14\x11\x11\x11\
-\x18\x86\xc1=\xf7\xdcCgg\xa7\xf4\xf6\x142<<\
-L}}=---cAg\xaa3M\x93\xdea\
-/O\xef\xa9\xe7?\x0e4\xe1\xf5\x1bS\xbeM\x92\x92\
-\x92\xc8\xcd\xcd\xc5f\xb3q\xe4\xc8\x11\xce\x9f?/\x17\
-\x8f\x10\x12t&\x1e]\xd7\xd9\xb2e\x0b\x1e\x8f\xe7c\
-\x7f\xe6v\xbb\xd9\xb9s'###\xd2\xdbSHs\
-s3555DEE\x91\x9b\x9bKTT\x94\x04\
-\x1d\xe0\xfc\xb0\x87_\xed8\xcd\xb3{\x1b\xd1\x0d\x09:\
-\x9a\xa6\xb1x\xf1b\x22\x22\x228x\xf0 \xdd\xdd\xdd\
-r\xf1\x08\x11`&\xf5\xd0\x95\xdf\xef\xe7\xf4\xe9\xd3\xb8\
-\xddn\xdcn7uuu\x1fZ&j\x18\x06\xfb\xf6\
-\xed\xc3n\xb7K\xf9\x87)\xa6\xbe\xbe\x9e\xea\xeaj\xd2\
-\xd2\xd2\x989s\xa6\xe5\xfd\xaf)\x1a\xab3W\x93\x1e\
-\x91Nrx\xb2%{\xc7\x00\xb8\x9c6V\x16\xc4\x13\
-\xea\xb4\xa1Z0\x94\xa5**\x85\xf1\x85\xdc6\xeb6\
-\x16L_`I)\x8c\x8f*))!**\x8a\xb2\
-\xb2\xb2\xb1\xcdEe\x98O\x08\x09:\x13\xc2\xc0\xc0\x00\
-\xd7\x5cs\x0d\xf0\xfe[\x9d\x0d\x1b6\xa0i\xda\xc7\xc2\
-\xd0]w\xddEDD\x84\xf4\xf6\x14\xa1\xeb:\xf5\xf5\
-\xf5\xd4\xd6\xd6\xb2z\xf5jf\xce\x9ci\xf91\xd95\
-;\xf7/\xba\x1f\xaf\xe1%2(\xd2\xb2ZWq\xa1\
-N~p\xed\x0cT\x05\xec\x16\xac\xba\xd2T\x8d\xb59\
-k\xb9\x22\xed\x0a\x5cv\x176\xd5\xd2?\xa9\x01\x00\x00\
- \x00IDAT\xfa[\xd0\x9c9sHHH\xe0\
-\xf4\xe9\xd3TUU1g\xce\x1c\xb9_\x08!Ag\
-b\x08\x0d\x0d\xe5\xb7\xbf\xfd-n\xb7\x9b\x9bo\xbe\x99\
-G\x1f}\xf4CC\x14v\xbb\x9d\xe8\xe8h\x92\x92\x92\
-\x08\x0b\x0b\x93\xde\x9e\x22\xda\xdb\xdb\xa9\xad\xad\xc5\xef\xf7\
-\x93\x95\x95Ezz\xba\xe5\xc7\xa4(\x0a\xd1\xaeh\xcb\
-\x8f\xc1\xa6)\xc4\x859-=\x86PG(\xa1\x8e\x89\
-\xb3\x8c\xdb\xe5rQTTDEE\x05eee\x5c\
-y\xe5\x95\x12t\x84\x90\xa031\xd8\xedvJKK\
-1M\x93\x83\x07\x0f\x8eM*\xbc@U\xd5\xb1\xff\x97\
-W\xd1S\xc7\x85\xb79III\xe4\xe5\xe5\xe1p8\
-,?&\xd34\x19\xf4\x0e\xa2\x1b:!\xf6\x10\xec\x9a\
-}J\x9e\x93\xa6i\xe2\xf6\xbbq\xfb\xdd85'\xc1\
-\xf6`\xcb\xdbAQ\x14\x16/^\xcc\xab\xaf\xbeJY\
-Y\x19]]]dee\xc9\x85$\x84\x04\x1dky\
-<\x1e\x0e\x1f>\xcc\xa2E\x8bP\x14\x85\xc1\xc1A\x0e\
-\x1f>\xfc7\x7f~\xe1\xc2\x85\x04\x07\x07K\x8fO\x01\
-uuu\xd4\xd6\xd6\x92\x9f\x9fOAA\xc1\x84\x08\x14\
-^\xdd\xcb?n\xfdG\x8e\xb5\x1f\xe3\x895O\xb0,\
-m\x19\x9a\xa2\x8d\xeb1\x18\xa6\xc9\x99\xf3#|\xeb\x85\
-c\x84\x07\xd9\xf9\xed\xed\xf3\x09\xb2\x8f\xef1\xf8\x0d?\
-\x7f8\xf6\x07\x9e9\xf2\x0c_\x9a\xf9%\xfeG\xc9\xff\
-\xc0\xa1Y\x1fD\x8b\x8b\x8b\x89\x89\x89\xe1\xd8\xb1c\xb4\
-\xb4\xb40o\xde<\xa9\x8f'\x84\x04\x1dk\xf5\xf7\xf7\
-\xf3O\xff\xf4O\xbc\xf1\xc6\x1b\x04\x05\x05q\xef\xbd\xf7\
-~\xe2\xcfo\xdd\xba\x95\x94\x94\x14\xe9\xf1\x00700\
-\xc0\xe9\xd3\xa7\xe9\xe8\xe8\xe0\xea\xab\xaf&//oB\
-\x1c\x97a\x1a\xd4\xf6\xd4r\xb4\xfd(\xfd\xee\xfe\xf7K\
-AX\xc0\xed38\xd2\xd2GL\x88\x03\xc3\xa2\xea\xe5\
-\xe7\x86\xceq\xb4\xfd(KR\x96L\x98\xd2,\x89\x89\
-\x89\xe4\xe5\xe5q\xf2\xe4I***\xb8\xe2\x8a+\x98\
->}\xba\x5cPBH\xd0\xb1NDD\x04\x8f=\xf6\
-\x18!!!h\x9a\xc6\xaf\x7f\xfd\xebO\xfc\xf9\xd8\xd8\
-X\xe9\xed)\xa0\xb1\xb1\x91\xba\xba:\x22##\xc9\xc9\
-\xc9!22R\x1a\xe5/\x14 !<\x88\xdfl(\
-\xc2aSqh\xb2\x12q\xecFh\xb3\xb1`\xc1\x02\
-v\xed\xdaEyy9\x9d\x9d\x9d\x12t\x84\x90\xa0c\
--\xa7\xd3\xc9\x92%K\xc6\xfe\x7f\xf9\xf2\xe5\xd2\x9b\x82\
-\xda\xdaZ\xea\xea\xea\xc8\xcc\xcc\xa4\xa0\xa0\xe0c\xab\xf0\
-\xa6\xba\x90 \x1b\xabf\xc4\xa3\xa0\xa0\xa92o\xed\x83\
-.\x0c_\x1d=z\x94s\xe7\xceQXX(\xdbR\
-\x08!A\xc7:n\xb7\x9bm\xdb\xb6}\xea\x9f\xbf\xf2\
-\xca+\xa5\xb0g\x80\xf3\xf9|\xd4\xd5\xd5\xd1\xd8\xd8\xc8\
-\x17\xbf\xf8E\xf2\xf3\xf3\xa5Q>@Q\xde\xdf\xbd\xc7\
-i\x93\xf0\xf7\xd7\x14\x14\x14\x90\x94\x94DUU\x155\
-55,^\xbcX6\x9a\x14B\x82\x8eu\x86\x86\x86\
-x\xea\xa9\xa7>\xf5\x0d~\xd1\xa2E\x12t\x02\xdc\xd9\
-\xb3g9}\xfa4\xa6i\x92\x95\x95ERR\x924\
-\xca\x07\x98\xa6\xc9\x90\xc7\xcf\xbe\xd3\xdd84\x95e\xb9\
-q\xd8d\xf8jLhh(s\xe6\xcc\xe1\xd0\xa1C\
-\x1c9r\x84\xb5k\xd7J\xd0\x11B\x82\x8e\xb57\xa5\
-\xef|\xe7;\x9f:\xe8\xc8\xbe\x18\x81\xaf\xae\xae\x8e\xd3\
-\xa7O\x93\x9c\x9cLnn\xae\xac\x9a\xf9h\xd0\x01z\
-\x87\xbd<\xf9V\x1d\x11.;%Y1\x12t>r\
-\x9fX\xb8p!\xaf\xbc\xf2\x0aG\x8e\x1c\xa1\xbd\xbd]\
-\xde\x0a\x0a!A\xc7:AAAc\xbb\x22\xff\xb5o\
-\xae\x1f\xbcy\x89)\xf0\x107M\xaa\xab\xab\xa9\xaf\xaf\
-\xa7\xa8\xa8\x88\xbc\xbc\xbc\x09\xd5\xf7\xaa\xa22g\xda\x1c\
-4E#\xc6\x15cY\x09\x08U\x85\x88`;\xe1A\
-6\xach\x1eEQH\x8fLgY\xea2\xb2\xa3\xb3\
-'D\x09\x88\x0fZ\xb0`\x01\xf1\xf1\xf1\x1c<x\x90\
-\xa6\xa6&FGGe[\x0a!$\xe8L\x0c\x86a\
-\xb0g\xcf\x1e\xb6m\xdbF{{;\xa6i\x12\x1f\x1f\
-\xcf\xaaU\xab(--%((Hz;\x80\xf5\xf5\
-\xf5QWWGOO\x0f\xd9\xd9\xd9\x13n\xc37\xbb\
-j\xe7\x9e\x05\xf70\xe8\x1d$?&\xdf\xb2\x12\x10\xb1\
-!N\x1e\xbc:\x1f\x9b\xaa`\xd7\xac)\x01qe\xe6\
-\x95\xe4\xc7\xe6\x93\x10\x9a\x80\xa6N\xac\xf9B\x09\x09\x09\
-\xe4\xe6\xe6r\xf8\xf0aN\x9c8\xc1\xaaU\xabd[\
-\x0a!$\xe8X\xcf\xef\xf7\xf3\xea\xab\xaf\xf2\x9b\xdf\xfc\
-\x86\x84\x84\x04bccQ\x14\x85s\xe7\xce\xf1\xf8\xe3\
-\x8f\xd3\xd9\xd9\xc9\x8d7\xde(st\x02X}}=\
-\x0d\x0d\x0dDGG\x93\x93\x933\xe1\x86*UUe\
-\xf6\xb4\xd9\x96\x1e\x83\xa2(\x04;l\xccO\xb3n\xde\
-\x89\xaa\xa8\xa4F\xa4\x92\x1a\x91:1o\x886\x1bE\
-EE\xbc\xf5\xd6[\x1c;v\x8cs\xe7\xceI\xd0\x11\
-B\x82\xce\xc4\x08:O=\xf5\x143f\xcc\xe0\xce;\
-\xef$!!\x01\x80\xae\xae.6n\xdc\xc8\xbf\xff\xfb\
-\xbf\xb3j\xd5*\x09:\x01\xac\xaa\xaa\x8a\xfa\xfaz\xb2\
-\xb3\xb3\xc9\xc9\xc9\x99p\xcb\x82M\xd3\xc4g\xf80M\
-\x13\x9bjCU\xd4)[\x02B7ttSGS\
-44U\x9bp\xed\xb0p\xe1B\xa6M\x9b\xc6\x89\x13\
-'hkkc\xfe\xfc\xf9\xb2M\x81\x10\x93X@\xcc\
-D4\x0c\x83\xaa\xaa*\xbe\xf2\x95\xafP\x5c\x5cLz\
-z:\xe9\xe9\xe9,\x5c\xb8\x90/\x7f\xf9\xcb\xb4\xb6\xb6\
-\xe2\xf5z\xa5\xb7\x03\x94\xc7\xe3\xa1\xa6\xa6\x86\xd6\xd6V\
-rss\xc9\xc9\xc9\x99p\xc7\xe8\xd3}\xfc\xf2\xbd_\
-\xf2\xc0\xd6\x078\xd1q\x02\xc34,\x09\x19]\x83n\
-~\xba\xa5\x92_\xbc]\x8b\xd7\xaf\x8f\xfb1\xe8\xa6\xce\
-\x96\xd3[x`\xeb\x03l\xaa\xda\x84n\xe8\x13\xae\xaf\
-rrrHIIa``\x80\x9a\x9a\x1a\xfa\xfa\xfa\
-\xe4\x22\x13B\x82\x8e\xc5\x1fBU\x99;w.\xb5\xb5\
-\xb5\x1f\xdbR\xbe\xb1\xb1\x91\xfc\xfc\xfc\x09Q\xd8Q\x5c\
-\x1eg\xce\x9c\xa1\xbe\xbe\x1eEQ\xc8\xc9\xc9!11\
-q\xc2\x1d\xa3n\xea\xbcZ\xf3*O\x1f~\x9a\xa6\xbe\
-&KJ@\x98@\xdf\xa8\x8f\x7f\xdf\xd7\xc4\xc6C-\
-\xf8\x8d\xf1?\x06\xc30(?[\xce\xd3\x87\x9ff_\
-\xcb>ts\xe2\x05\x9d\xd0\xd0Pf\xcd\x9aETT\
-\x14\xc7\x8f\x1f\xe7\xdc\xb9sr\x91\x091\x89\x05\xc4\xd0\
-\x95\xaa\xaa\xe4\xe4\xe4\xf0\xec\xb3\xcf\xd2\xd5\xd5EZZ\
-\x1a\x8a\xa2\xd0\xd6\xd6\xc6\x96-[\xc8\xcc\xccd\xef\xde\
-\xbdc\xab'JKKe\xb9y\x00\xa9\xaa\xaa\xa2\xb1\
-\xb1\x91\xf4\xf4t\xb2\xb3\xb3eY\xf9\xdf\xa0\x00Q\xc1\
-v\xfe\xfb\x15\x99\xb8\x1c\x1a6\xd9\x19\xf9\xaf\xb7\x93\xa2\
-\xb0`\xc1\x02\x12\x12\x128v\xec\x18g\xcf\x9ee\xe6\
-\xcc\x99\xb2\x82S\x08\x09:\xd61M\x93\x8e\x8e\x0ez\
-{{\xd9\xb4i\x13\xd3\xa7OGQ\x14\xda\xdb\xdb\xe9\
-\xef\xef',,\x8c\xcd\x9b7\x8f\xfd|aa\xa1\x04\
-\x9d\x00qa\xd8\xb2\xa9\xa9\x89\xa5K\x97\x92\x9d\x9d-\
-\x8d\xf2\x09\xa2\x5c\x0e\xee)\xcdDQ\xacYu5Y\
-\x14\x16\x162}\xfatv\xef\xdeMcc#\xa3\xa3\
-\xa3\xb8\x5c.i\x18!$\xe8XC\xd34\xae\xbb\xee\
-:\xae\xbb\xee\xbaO\xf5m-<<\x5cz>@\xf4\
-\xf6\xf6RSSC\x7f\x7f?\xb9\xb9\xb9\xa4\xa5\xa5I\
-\xa3|\xc2\xb9\xafi\x0a\x91.\x19\xc6\xfd{\x12\x12\x12\
-\xc8\xc9\xc9\xe1\xddw\xdf\xe5\xd4\xa9Sttt\x90\x91\
-\x91!\x0d#\x84\x04\x1d\x8b>\x84\xcd\xc6\x9dw\xde)\
-\xbd9\x05\xd5\xd4\xd4\xd0\xd8\xd8H\x5c\x5c\xdc\x84\x5cV\
->\x91\x98\xa6\x89\xc7oP\xd3>\x88MS\xc8O\x08\
-\x97\xc2\x9e\x9fpO\x99;w.\x09\x09\x09TTT\
-\xd0\xd6\xd6&AG\x08\x09:\xd6\xde\xc0\xfd~?G\
-\x8e\x1c\xa1\xa5\xa5\x85\xe1\xe1\xe1\x8fMJ\xbe\xf9\xe6\x9b\
-\x09\x0b\x0b\x93\x1e\x0f0'N\x9c\xa0\xb1\xb1\x91\x82\x82\
-\x02\xb2\xb3\xb3e\x1e\xc5']'@\xef\xb0\x87\x7f\xdd\
-YGh\x90\x9d\x9f\xdf8{\xc2m\xd87\x91\xcc\x9b\
-7\x8f\xc4\xc4DN\x9d:EKK\x0b~\xbf\x1f\x9b\
-\xcd&\x0d#\x84\x04\x9d\xf1\xa7\xeb:\xaf\xbd\xf6\x1a\x1b\
-7nD\xd34\x0c\xc3\xf8X\xd0\xb9\xe6\x9ak$\xe8\
-\x04\x98\xe1\xe1a*++ioo\xe7\x8b_\xfc\x22\
-\x99\x99\x99\x13\xf6X\x15E!%<\x85\xdc\x98\x5cB\
-\x1d\xa1\x96\x95\x80\xf0\xfa\x0dNw\x0d\x11\x19\xec\xc00\
-MK\xda!\xc6\x15CnL.\xf1!\xf1\x13:\x98\
-fee\x91\x9e\x9e\xce\xc1\x83\x07\xa9\xa9\xa9\xe1\xfc\xf9\
-\xf3\xc4\xc5\xc5\xc9\x85'\x84\x04\x9d\xf1\xe7\xf7\xfby\xe2\
-\x89'\xc8\xc9\xc9a\xed\xda\xb5\x84\x87\x87\x7f\xec\x06*\
-!'\xf0455\xd1\xd0\xd0\x80\xd3\xe9$77w\
-B?\x84l\xaa\x8d\xdb\x0aocu\xd6jrbr\
-,y\xc0+@T\x88\x83{\x97g\xe1\xb4i\x96\x14\
-\xf4T\x15\x95\xa5\xa9K\x09s\x84Q\x10W\x80\xa6L\
-\xdc7J\x17\x96\x99\xef\xd8\xb1\x83\x13'N\xd0\xda\xda\
-*AG\x08\x09:\xd60M\x93\xd6\xd6V\x9e|\xf2\
-I\x16.\x5c(\xc3\x17S\xc4\xf1\xe3\xc7inn&\
-//\x8f\xac\xac,\xecv\xfb\x84\x0e:\xebr\xd7Y\
-z\x0c\x8a\xa2\x10\x11\xec\xe0\x1f\x16XW~AS5\
-\x8a\x12\x8b(J,\x9a\x14\xe7XQQ\x11III\
-c\xe7\xda\xdc\xb9s'\xdc\xae\xdbB\x88\xbf\xf3\x05+\
- >\x84\xaa\xb2z\xf5j***\x18\x1c\x1c\xfc\xd8\
-\xb0\x95\x08<>\x9fol\x8b\xfe\x993gN\xe8a\
-+1y\xcd\x9a5\x8b\xd4\xd4T\xce\x9e=K]]\
-\x1dCCC\xd2(BL2\x01\xb3\xea\xeak_\xfb\
-\x1a?\xfc\xe1\x0f\xe9\xef\xefg\xda\xb4i\x1f\xabM\xf3\
-\xc5/~\x91\xd0\xd0P\xe9\xf1\x00\xd1\xde\xdeNmm\
--^\xaf\x97\x82\x82\x02\xa6O\x9f>\xa1\x8f\xd7o\xf8\
-\xd9^\xbf\x9d\xce\xe1NV\xa6\xaf$9\x22y\xdc+\
-\x98\x9b\xa6\xc9\x90\xc7\xcf;\xb5]84\x95\x95\xf9\xf1\
-\xe3>|\xa5\x1b:\xc7;\x8eS\xd1QAAl\x01\
-\x0b\xa6/\x98\xd0\x13\xa2\xe3\xe2\xe2\xc8\xcb\xcbc\xd7\xae\
-]\x9c:u\x8a\xb6\xb66f\xcc\x98!\x17\xa0\x10\x12\
-t\xc6\x97i\x9a\x9c9s\x86\xfe\xfe~6n\xdcH\
-xx\xf8\xc7VG\xacX\xb1B\x82N\x009~\xfc\
-8---\xa4\xa5\xa5\x91\x95\x955\xe17s\xf3\xe9\
->~\xba\xf7\xa7\xeck\xdd\xc7\xe6\x7f\xd8\xcc\xf4\xf0\xe9\
-\xe3\x1ft\x80\xce\x01\x0f\xdf{\xf9\x04Q!\x0e\x96\xe6\
-\xc4Z\x12t6Wo\xe6\x91=\x8fp\xdf\xc2\xfb\x98\
-\x9b0wB\x07\x1dEQ\x987o\x1e)))\x1c\
-?~\x9c\xa6\xa6&\x0a\x0a\x0adx\x5c\x08\x09:\xe3\
-\xfc\x10\xf1\xf9\xf8\xc9O~Baa!\xd7_\x7f=\
-\x91\x91\x91\x1f\xbb\x11EFFJo\x07\x08\xc30\xa8\
-\xa8\xa8\xa0\xb5\xb5\x95e\xcb\x96\xc9\xfe&\x9f\x81\xd3\xae\
-R\x98\x1cIx\xb0M\x1e\xd6\x9f\xd2\x9c9sHI\
-Ia\xd7\xae]\xd4\xd7\xd7\xe3\xf1x\x08\x0a\x0a\x92\x86\
-\x11B\x82\xce8~S5M:;;\xf9\xd6\xb7\xbe\
-\xc5\xbcy\xf3\xe4\x06\x1e\xe0\x06\x06\x06\xa8\xac\xac\xa4\xaf\
-\xaf\x8fY\xb3f\x91\x92\x92\x22\x8d\xf2i\xdeN\x00\xf1\
-aA\xfc\xf4\xc6Yh\x8a\x82CJ@|*\xa9\xa9\
-\xa9dgg\xb3s\xe7N\xaa\xab\xabioo'=\
-=]\x1aF\x88I\x22 \xeet\x9a\xa6\xb1b\xc5\x0a\
-\x8e\x1e=Jww7\x1e\x8f\x07\x9f\xcf\xf7\xa1_2\
-A9pTVV\xd2\xd2\xd2Btt4999\
-DEEI\xa3|\x9a\xa0\xa3(8l*\xa9\xd1!\
-$E\xb9PeW\xe4O\xc5n\xb7SXXHr\
-r\xf2\xd8\x06\x95B\x88\xc9#`\xaa\x97\xe7\xe7\xe7\xf3\
-\xc4\x13O\xd0\xdd\xddMzz\xfa\xc7\x96\x1a_u\xd5\
-U\x84\x84\x84H\x8fOr\xa6ir\xf4\xe8Q\xda\xda\
-\xda\x98={6\xe9\xe9\xe9\xf2\x06\xef3\xb4\x9d\xdf0\
-\xe9\x19\xf2\xa0*\x0a\xb1aNTi\xbbO\xa5\xb0\xb0\
-\x90\xd4\xd4T\x8e\x1d;F}}=K\x97.\x95]\
-\x92\x85\x90\xa03~t]\xe7\x95W^\xc1\xe5r\xb1\
-i\xd3\xa6\x8f\xdd\xdc\x15E\xa1\xb8\xb8X\x82N\x00\xf0\
-x<\x1c?~\x9c\x8e\x8e\x0en\xbe\xf9fRSS\
-\xa5Q>\x83\xbe\x11/\xbf\x7f\xb7\x11\x97\xc3\xc67W\
-d\xe1\xb0I\x09\x88O#77\x97\x8c\x8c\x0cv\xef\
-\xdeMmm-\xbd\xbd\xbd\xc4\xc7\xc7K\xc3\x08!A\
-g|8\x1c\x0e\x9e}\xf6\xd9\xbf\xf9\xe7###\xc4\
-\xc4\xc4Ho\x07\x80\xc6\xc6F\x1a\x1a\x1a\xb0\xd9l\x14\
-\x14\x14L\xaa\x87M\xb83\x9c\xe8\xe0h\x1c\x9a5\xd5\
-\xc3M`\xc0\xed\xe7\xc5\xf26\xa2B\xec\xdc]j\xc1\
-\xdeC\x0a\xb8\xec.\xa2\x83\xa3\x09q\x84XV\x0a\xe3\
-\xb3\x0a\x09\x09a\xe6\xcc\x99$&&RYYIC\
-C\x83\x04\x1d!$\xe8\x8c\x1fUU\x99;w\xee\x87\
-~O\xd7uzzz\xe8\xec\xec\xa4\xb5\xb5\x95\xd9\xb3\
-g\xcbJ\x89\x00p\xe4\xc8\x11\xce\x9c9\xc3\x8c\x193\
-HOO\x9f4\xc3\x076\xd5\xc659\xd70#n\
-\x06\xa9\x91\xa9\xe3\xbe\xb4\xfc/\x19\x83\xf0 \x1b\xb7\xcc\
-O\xc6\xe5\xd4,\xa9\x5c\xae**\xf3\x12\xe6\xf1\xd5\xb9\
-_\xa58\xb9xR\xed2\x5cXXHzz:U\
-UU\xd4\xd7\xd7\xb3h\xd1\x22\xd9%Y\x08\x09:\xe3\
-opp\x90\xae\xae.\xce\x9c9\xc3\xde\xbd{\xd9\xbb\
-w/g\xcf\x9ee\xc9\x92%R\xefj\x92\xd3u\x9d\
-\xa3G\x8fr\xee\xdc9JKK'\xd5j+\xbbf\
-\xe7\xbeE\xf7Yz\x0c\x8a\xa2\x10\x17\x16\xc4\xf7\xd7Y\
-\xb7\xe1\x9dM\xb5qU\xf6U\x5c\x95}\xd5\xa4;\xff\
-\x0a\x0a\x0a\xc8\xc8\xc8\xe0\xc0\x81\x03\xd4\xd6\xd62<<\
-,\xf7\x14!$\xe8\x5c~\xa6i\xe2\xf3\xf98\x7f\xfe\
-<===\x94\x97\x97\xb3g\xcf\x1e^z\xe9%\xe6\
-\xcf\x9f\xcf\xda\xb5kY\xb5j\x95\xbcf\x0e\x00]]\
-]TWW322\xc2\xec\xd9\xb3'\xfcn\xc8\x22\
-\xb0\xc4\xc5\xc5\x91\x9b\x9bKxx8\xd5\xd5\xd545\
-51{\xf6li\x18!$\xe8\x5c\xdeo\xf8--\
--477\xb3s\xe7Nv\xed\xda\x85\xa2(\xac^\
-\xbd\x1a]\xd7\xf9\xc9O~\xc2\xc2\x85\x0beuD\x80\
-8r\xe4\x08g\xcf\x9e%##\x83\xcc\xcc\xcc\x09\xbf\
-\x1b\xf2\x07\x19\xa6As_3#\xfe\x11R\xc2S\x08\
-s\x84\x8d\xfbj1\xd34\xf1\xe9&g\xce\x8f\xa0\xaa\
-\x0a)\xd1\xaeq_ue\x9a&]#]t\x8dt\
-\x11\x1d\x14\xcd\xb4\xd0i\x96\x0c\xe3]\x0cEQ\x985\
-k\x16\x19\x19\x19TUUQWW\xc7\xacY\xb3d\
-\xd5\x9f\x10\x13\xdc\xa4\x1e`\x1e\x1a\x1a\xe2\xae\xbb\xee\xe2\
-\xab_\xfd*\x03\x03\x03<\xf2\xc8#\xec\xdc\xb9\x93\x1f\
-\xfc\xe0\x078\x1c\x0e\xe9\xdd\x00b\x9a&eee\x9c\
-;w\x8ey\xf3\xe6\x91\x9c\x9c<\xa9\x8e\xdf\xe3\xf7\xf0\
-\xdf\xff\xfc\xdfY\xf0\xf4\x02v7\xedF7\xf5\xf1o\
-C\xe0\xcc\xf9\x11\xbe\xf2o\x07\xf9\xe6s\x87\xf1\xf8\x8c\
-q?\x06\x9f\xee\xe3\xb7\xe5\xbfe\xc1\xd3\x0bxl\xff\
-c\xf8t\xdf\xa4\xea\xc7\x0b\x05d\x1b\x1a\x1a\xa8\xab\xab\
-\xc3\xe7\xf3\xc9\xc5)\x84\x04\x9d\xcbG\xd7u\xda\xda\xda\
-\xb8\xf1\xc6\x1b\xb9\xfe\xfa\xeb\xc9\xc9\xc9axx\x18]\
-\xd7\xa5g\x03\xcc\xf0\xf00\x15\x15\x15\xf4\xf4\xf40w\
-\xee\xdcI9l\xe5\xd5\xbd\xb8\xfdn\x0c\xc3\xb0\xec\x18\
-L\xc0\xa7\x9b\xf8\x8d\x0b\xff7\xfe\xfc\x86\x1f\xb7\xdf=\
-\xe9B\x0e@ZZ\x1a\xd9\xd9\xd9\x00\xd4\xd6\xd6\xd2\xd6\
-\xd6&\x17\xa7\x10\x13\xdc\xa4\x1e\xd3\x09\x0f\x0f\xe7\xf9\xe7\
-\x9f\xe7\xa5\x97^\xe2\xde{\xefe\xfa\xf4\xe9\xac^\xbd\
-\x9a5k\xd6\xa0\xeb:n\xb7\x1b]\xd7\xd14M^\
-/Or\xc7\x8e\x1d\xa3\xad\xad\x8d\x98\x98\x18\xf2\xf3\xf3\
-e7\xe4\x8b\xa0\x00\x89\x11\xc1<{\xc7\x024M\x91\
-=t.\x82\xa6i\xcc\x9c9\x93\x8c\x8c\x0c\xaa\xab\xab\
-\xa9\xad\xad%33S\x1aF\x88\x09lR\xbf\xd1\xb1\
-\xd9l\x14\x17\x17\xf3\xd8c\x8fQVV\xc6\xd7\xbe\xf6\
-5\x0e\x1c8\xc0u\xd7]\x87i\x9a\xec\xdc\xb9\x93\xba\
-\xba:z{{\xe5-\xcf$f\x9a&\x07\x0f\x1e\xe4\
-\xdc\xb9s\xcc\x9f?\x9f\x94\x94\x14\x09\xae\x17\x13t\x14\
-\x85`\x87FaJ$3\xa7GX\xb2\xbc<\x10\xcc\
-\x981\x83\xac\xac,jkk\xa9\xad\xad\xb5\xf4\x0d\x9d\
-\x10\x22\xc0\x83\xce\x07o\xe0\xa1\xa1\xa1\xdcz\xeb\xad\xbc\
-\xfa\xea\xab\xec\xd9\xb3\x87\x07\x1f|\x90\xd7^{\x8dU\
-\xabV\xb1a\xc3\x06\xba\xba\xba\xa4\xb7')\x9f\xcfG\
-YY\x19]]],X\xb0\x80\xa4\xa4$i\x94\x8b\
-\x0c\x8c\x86i\xe2\xf5\x1bx\xfd\x86\xd4\x7f\xbbH\xb9\xb9\
-\xb9dgg\xd3\xd7\xd7GMM\x0d\xdd\xdd\xdd\xd2(\
-BH\xd0\x19_YYY|\xff\xfb\xdf\xe7\xf0\xe1\xc3\
-<\xf7\xdcs$''\xcb\x1b\x80I\xac\xb2\xb2\x92\xe6\
-\xe6f\x9cN'\x85\x85\x85\xc4\xc5\xc5I\xa3\x5c\xa4\xc1\
-Q\x1f\xaf\x1e;\xc3\xd6\x93\xed\xf8\x0d\x09:\x17#8\
-8\x98\xfc\xfc|RRR\xa8\xa9\xa9\xa1\xba\xbaZ\x1a\
-E\x88\x09,\xa0\xd7]k\x9a\xc6\xea\xd5\xabY\xbdz\
-\xb5\xf4\xf4$~\x0bq\xe0\xc0\x01:::\x98?\x7f\
->\xc9\xc9\xc9\x93v7ZEQP\x15\xd5\xb2\xd0m\
-\x02\x9d\x83\x1e\x1e\xfc\xaf\xe3D\x878\xb8rF<v\
-m\xfc\xdbREEU\xd4I\xb3\xac\xfc\xaf\x999s\
-&\xb9\xb9\xb9\x9c:u\x8a\xaa\xaa*\x96.]*_\
-\xa6\x84\x98\xa0d\xffr1)\x82N{{;\x8b\x16\
--\x9a\xb4\x9b\x04\xaa\x8aJQB\x11+\xd2W\x10\xe3\
-\x8a\xb1\xac\xc6S\xb0Ccqf\x0c\x0b\xd2\xa2,\xa9\
-\x5c\xae(\x0a\xe9Q\xe9\xacH_ANt\xce\xa4\x0d\
-\x073f\xcc 77\x973g\xcePUU\xc5\xe0\
-\xe0\xa0\x5c\xacBLP\xb2\x93\x9e\x98\xd0\x9a\x9a\x9a8\
-}\xfa4~\xbf\x9f\xf9\xf3\xe7\x93\x90\x900)?\x87\
-\xd3\xe6\xe4\x97W\xff\xd2\xe2\xb0\xa5\x90\x1c\xe5\xe2\xf9\xaf\
-/\xb6\xec\x18\xec\x9a\x9d\xbb\xe6\xde\xc5]s\xef\x9a\xd4\
-\xe7eDD\x04\xf9\xf9\xf9L\x9f>\x9d\xba\xba:\xaa\
-\xaa\xaa(..\x96\x0bV\x88\x89\xf8ES\x9a@L\
-d\xfb\xf6\xed\xa3\xb3\xb3\x93\xb9s\xe7\x92\x9c\x9c\x8c\xa6\
-\xc9\x92h11\xcc\x981\x83\xbc\xbc<jjj8\
-y\xf2\xa44\x88\x10\x12t\x84\xb8\xb8\xa0\xd3\xd5\xd5\xc5\
-\xe2\xc5\x8bILL\x94y\x10bB\x05\x9d\xfc\xfc|\
-\x9a\x9a\x9a\xa8\xac\xacdttT\x1aE\x08\x09:B\
-|z\xed\xed\xed\x9c<y\x92\xa1\xa1!\x16.\x5c8\
-i\x87\xad\x00F}\xa3\xdc\xf2\xe2-d\xfc2\x83\xed\
-\xa7\xb7\xe37\xfc\xe3~\x0c\x86i\xd2\xda;\xc2M\xff\
-g?_\xfd\xf72\xdc\xbe\xf1\xdf[\xca\xab{y\xf2\
-\xc0\x93d\xfc2\x83\x87w?\x8c\xd7\xef\x9d\xb4}\x1a\
-\x1b\x1b;\xb6ye]]\x9d\xac\xbe\x12B\x82\x8e\x10\
-\x9f\xcd\x81\x03\x07\xe8\xea\xea\x22??\x9f\x8c\x8c\x0c\x9c\
-N\xe7\xe4\x0enC\xedc\x85=\xad\xe2\xf6\xeb\x1cm\
-9\xcf\xc93\xfd\x18V\xec\xa3cB\x9f\xbb\x8f\xe6\xbe\
-fzG{1\x99\xbcK\xdcUU%??\x9f\xfc\
-\xfc|\xea\xea\xead\xf8J\x08\x09:B|6\xef\xbe\
-\xfb.\xdd\xdd\xdd,^\xbc\x98\x84\x84\x84I?le\
-\xfe\xe5?\xab\x9e\xed\x0a\x90\x10\x1e\xc4/\xbf<\x97\x1f\
-\xdf0\x0b\x87\xa6Z\xda\x0e\x81\xb0aa^^\x1e\x05\
-\x05\x05466r\xea\xd4))\xf2)\x84\x04\x1d!\
->\x9d\x81\x81\x01\xca\xcb\xcb\xe9\xeb\xeb\xa3\xa4\xa4\x84i\
-\xd3\xa6I\xa3\x5c\x02!N\x1bkf$\xb0</N\
-J@\x5c\x02\xd3\xa7O'??\x1f\xa7\xd3I]]\
-\x1duuu\xd2(BH\xd0\x11\xe2\xef;t\xe8\x10\
-\x1d\x1d\x1d\xa4\xa4\xa4\x90\x9b\x9bKHH\x884\xca\xe7\
-\xf4\xfe\x86\x85\x0aN\xbb\x86\xd3&\x85n/\x05M\xd3\
-\xc8\xcb\xcb#??\x9f\xd3\xa7Os\xe2\xc4\x09i\x14\
-!$\xe8\x08\xf1\xf7\xed\xdd\xbb\x97\xde\xde^\x8a\x8b\x8b\
-IHH\x98\xb4\xbb!O$\xa6i2\xec\xf1s\xa0\
-\xbe\x9b\xf2\xa6\x1e\xfc\xba\x14\xa3\xbc\x14\xe1177\x97\
-\x993g\xd2\xd8\xd8\xc8\xf1\xe3\xc7\xa5\x80\xb0\x10\x12t\
-\x84\xf8d\xa3\xa3\xa3\xec\xdf\xbf\x9f\xf3\xe7\xcf\xb3d\xc9\
-\x12\xa9mu\xa9\x82\x0e\xd09\xe8\xe6\xdb/V\xf0\xd0\
-\xab\xa7\xf0I\xd0\xb9$RSS)((\xc00\x0c\
-\xea\xea\xeahnn\x96F\x11B\x82\x8e\x10\x7f\xdb\xe1\
-\xc3\x87ikk#::\x9a\xd9\xb3g\x13\x1e\x1e>\
-\xf9\xbf\xf9\xa3\x90\x1e\x99\xce\x8c\xb8\x19\x849\xc3,+\
-\x01\xa1*\x0a\xa1N\x1b!N\x9b%CW\x8a\xa2\x10\
-\x1f\x12\xcf\x8c\xb8\x19$\x86\x05\xc6\xbeH\x0e\x87c\xac\
-\xa2yCC\x03\xc7\x8f\x1f\x97\x8bX\x88\x09DJ@\
-\x88\x09g\xf7\xee\xdd\xf4\xf6\xf6RRRBbbb\
-@\x0c[9l\x0e~\xbc\xf2\xc7\x8c\xf8FH\x09O\
-\xb1\xa4\xa0\xa5\x02$F\x04\xf1\x9b\xaf\x14\xa1)\x0a\x0e\
-\xdb\xf8\x1f\x83M\xb5\xf1\xa5\x99_be\xc6J\xa2\x83\
-\xa3\xb1\xa9\x93\xff\x16\xa4(\x0a\xd9\xd9\xd9\xcc\x9c9\x93\
-\xad[\xb7RQQ\xc1\xfa\xf5\xebe\x0e\x94\x10\x12t\
-\x84\xf88\xb7\xdb\xcd\x9e={8\x7f\xfe<\xa5\xa5\xa5\
-\xc4\xc7\xc7\x07\xc4\x03CUT\xd2#\xd3-\x7f ;\
-l\x1a9\xf1a\x96\x1eC\x5cH\x1cq!\x815\x1c\
-\x99\x9e\x9e\xce\xcc\x993y\xf9\xe5\x97\xa9\xa9\xa9\xe1\xec\
-\xd9\xb3$%%\xc9\x05-\xc4D\xb8\xffJ\x13\x88\x89\
-\xe4\xf8\xf1\xe3477\x13\x11\x11\xc1\xbcy\xf3\x02b\
-\xd8J\x04>\x97\xcbEnn.iii2|%\
-\x84\x04\x1d!\xfe\xb6\x9d;wr\xfe\xfcy\x16-Z\
-\xc4\xf4\xe9\xd3\x03\xa6\x88\xa7W\xf7\xf2\xf0\xee\x87\xb9u\
-\xd3\xad\x94\x9d)C7\xc6\x7fe\x8ei\x9at\x0e\xba\
-\xf9\xe1\x9fO\xf2\xe8\xd6j\xbc\xfe\xf1?\x06\xbf\xe1\xe7\
-\xa5S/q\xeb\xa6[\xf9\xc3\xb1?\xe0\xd3\x03c\x83\
-\xbd\x0b\xc3Ws\xe6\xcc\xa1\xa1\xa1\x81\xf2\xf2\xf2\x80\xd8\
-\x10Q\x08\x09:B\x5c\xca0\xe0\xf5\xb2k\xd7.\xfa\
-\xfb\xfbY\xb1b\x05\xb1\xb1\xb1\x013\xcfA7t\xf6\
-4\xef\xe1\x95\x9aW87t\xce\x92\xd2\x07&0\xe8\
-\xf6\xf1\xf2\x913\xbcq\xfc\x1c\xba1\xfe\xc7`\x98\x06\
-\xd5\xdd\xd5\xbcR\xf3\x0a\xc7;\x8ec\x98\x81\xb3\xf2+\
-33\x939s\xe6000@ee%\xed\xed\xed\
-rQ\x0b1\x01\xc8\x1c\x1d1a\x9c<y\x92\xc6\xc6\
-FBBB\x98?\x7f~\xc0\x0d[yu/n\xbf\
-\x1b\xc3\xb0\xe6\xe1\xae\x00\x11Av\xee(I\xc3\xe5\xb0\
-Y\xb33\xb2\x09>\xc3\x87\xdb\xef\x0e\x98\xb79\x17\x84\
-\x86\x86\x92\x97\x97Gjj*\x0d\x0d\x0dTTT\x90\
-\x98\x98(\x17\xb6\x10\x16\x937:b\xc2\xd8\xb1c\x07\
-}}},\x5c\xb8\x90\xe4\xe4\xe4\x80\x19\xb6\x9aH\x22\
-]\x0e\xee(I\xe7\x1f\x16\xa4`\xd3\xe4\xf2\xbf\xa47\
-SU%;;\x9b\xb9s\xe7\xd2\xd4\xd4DYY\x99\
-\x0c_\x09!AG\x88\xf7\xf9|>v\xee\xdc\xc9\xc0\
-\xc0\x00+W\xae$::Z\x96\xe7^b\x8a\xa2`\
-\xd3T\xa6\x85\x07\x11\x17\xe6D\x95\xf6\xbd\xe4\xd2\xd3\xd3\
-\x99;w.\x03\x03\x03\x9c:u\x8a\x8e\x8e\x0ei\x14\
-!$\xe8\x08\x01UUU\xd4\xd5\xd5\x11\x14\x14Dq\
-q\xb1\xac\xb6\xba\x0cL\xd3\xc4\xe3\xd7\xa9\xeb\x18\xa4\xa1\
-k\x08\xc3\x90\xb7\x0d\x97ZXX\x18\xf9\xf9\xf9$'\
-'\x8f\x0d_\x09!$\xe8\x08\xc1\xce\x9d;\xe9\xeb\xeb\
-c\xfe\xfc\xf9\xa4\xa4\xa4`\xb3\xc9\xf4\xb1K\x1et\x80\
-\xeeA\x0f?z\xbd\x92\xc7\xb7\xd7H\x09\x88\xcbqC\
-UU\xb2\xb2\xb2(**\xa2\xb9\xb9\x99\xf7\xde{O\
-\x86\xaf\x84\x90\xa0#\xa6:\xbf\xdf\xcf[o\xbd\xc5\xd0\
-\xd0\x10\xabV\xad\x22222 \x87\xadb\x5c1$\
-\x86&\x12d\x0f\xb2\xec\x18<~\x83\x9a\xf6A\xea;\
-\x870\xacx\x00+\x10\xe6\x08#14\x91\x88\xa0\x08\
-\xcbJa\x5cNiii\xcc\x9b7\x8f\x81\x81\x01N\
-\x9e<IWW\x97\x5c\xe4BXH\xbe6\x0b\xcb\xd5\
-\xd6\xd6R]]\x8d\xc3\xe1\xa0\xa4\xa4$ \x87\xad\xec\
-\x9a\x9d\x07\x16=@\xf7H7\xb3\xe2gYV\x02\x22\
-.\xcc\xc9C\xebf\xe0\xb0\xa9\xd8-\x98\x8c\xac)\x1a\
-ks\xd6\x92\x1a\x91JNL\x0e\x9a\x1ax\x13\xce\xc3\
-\xc3\xc3)(( ))\x89\xc6\xc6F\x8e\x1d;\xc6\
-\x9a5k\xe4B\x17B\x82\x8e\x98\xaa.\xac\xb6\x9a3\
-g\x0eiii\x019leSm\xac\xca\x5ce\xe9\
-1(\x8aBX\x90\x9dus\xa6[v\x0c\x9a\xaa1\
-;~6\xb3\xe3g\x07\xec\xf9\xac\xaa*\x19\x19\x19\x14\
-\x15\x15\xb1g\xcf\x1e\x0e\x1c8\xc0\xea\xd5\xaber\xbd\
-\x10V]\x93\xd2\x04\xc2J~\xbf\x9f7\xdf|\x93\xe1\
-\xe1a\xd6\xacY\x13\xb0\xc3VbjIIIa\xfe\
-\xfc\xf9\xf4\xf7\xf7s\xfc\xf8q\xba\xbb\xbb\xa5Q\x84\x90\
-\xa0#\xa6\xa2\x9a\x9a\x1aN\x9d:\x85\xc3\xe1`\xd9\xb2\
-e\x84\x86\x86\x06\xe4\xe7\xf4\xe9>6\x9e\xdc\xc8\x13\xfb\
-\x9f\xa0\xae\xa7\xce\x92\x1d\x81M\xd3\xa4\x7f\xc4\xcb\xc6C\
--\xbc|\xa4\xcd\x92\xc9\xc8\xba\xa1\xb3\xafe\x1fO\xec\
-\x7f\x82\x1d\x8d;\xf0\x1b\xfe\x80\xec\xef\x88\x88\x08\x0a\x0a\
-\x0a\x98>}:MMM\x1c;vL.v!$\
-\xe8\x88\xa9h\xdb\xb6m\xf4\xf7\xf73o\xde<22\
-2\xb0\xdb\xed\x01\xf99\xfd\x86\x9f\xe7\x8e?\xc7\xcf\xf7\
-\xfd\x9c\xba^\x8b\x82\x0e\xd0;\xe2\xe57\xbbN\xf3\xef\
-\xfb\x1a\xf1[\x11tL\x9d\xbd-{\xf9\xf9\xbe\x9f\xf3\
-v\xfd\xdb\x96\xed\x12}\xd9o\xac\xaaJzz:\x0b\
-\x16,\xe0\xcc\x993\xec\xdf\xbf_V_\x09!AG\
-L5^\xaf\x97-[\xb6022\xc2\xb5\xd7^K\
-DDD@\x0f[\xf5\xbb\xfb\xe9\x1e\xe9\xc6\xeb\xf7Z\
-\xf2\xef+\x80\xd3\xa61sz\x04y\x09\xe1\xd6l\x18\
-h\xc2\x88o\x84\xee\x91n\x86\xbcC\x96\xd4\xfc\x1a/\
-))),\x5c\xb8\x90\xfe\xfe~***d\xf8J\
-\x08\x09:b\xaa\xa9\xae\xae\xa6\xb2\xb2\x92\x90\x90\x10\x96\
-.]\x8a\xcb\xe5\x92F\xb9\xccbB\x1c<\xb0*\x87\
-o,\xcd\xb4d\xd5\xd5T\x12\x11\x11\xc1\x8c\x193H\
-HH\xa0\xb1\xb1\x91#G\x8eH\xa3\x08!AGL\
-%o\xbc\xf1\x06\x83\x83\x83,X\xb0 `W[M\
-$\x8a\xa2\xe0\xb4k\xcc\x98\x1eNnB\x18\xaa*\x93\
-\xbe/\xeb\xcdUUIKK\xa3\xb8\xb8\x98\xb3g\xcf\
-\xb2w\xef\xde\x80\x1d\xaa\x13B\x82\x8e\x10\x1f\xe1v\xbb\
-\xd9\xb2e\x0bn\xb7\x9bu\xeb\xd6\x11\x16\x16&\xab\xad\
-.3\xd34\xf1\xeb\x06]\x83n\xba\x87<\xd6l\x18\
-8\xc5$%%\xb1x\xf1b\x06\x07\x079r\xe4\x08\
-\x9d\x9d\x9d\xd2(BH\xd0\x11SAee%\x95\x95\
-\x95\x84\x85\x85\xb1t\xe9R\x82\x83\x83\xa5Q\xc6\xc1\xf9\
-\x11/\xcf\xeci\xe4\xb9\x03\xcd\x96LF\x9ej\xc2\xc3\
-\xc3\x999s&\xc9\xc9\xc9477s\xe8\xd0!i\
-\x14!$\xe8\x88\xa9\xe0\xcf\x7f\xfe3\xa3\xa3\xa3,^\
-\xbcx\xca\xd4\xb6\x0a\xb6\x07\x13\xea\x08\xc5\xa6Z\xf3Y\
-M\xa0\x7f\xd4\xc7s\x07\x9b\xd9t\xa4\x0d\xdd\xb0\xa6\x04\
-\x84Ss\x12\xea\x08\xc5is\x06\xfe\x0d\xf6/\xc3W\
-K\x96,\xa1\xbd\xbd\x9d\xdd\xbbw\xa3\xeb\xba\xdc\x00\x84\
-\x90\xa0#\x02\xd9\xc8\xc8\x08[\xb6l\xc1\xeb\xf5\xb2~\
-\xfd\xfa)1\x09\xd9\xa6\xda\xb81\xffF\xbe\xb9\xe0\x9b\
-dDeXV\x02\x222\xd8\xc1\xed\x8b\xd3\xb8e~\
-\x0a\x9a:\xfe\xc7\xa0**\x0b\x93\x16\xf2\xcd\x05\xdfd\
-i\xea\xd2\x80,\x01\xf1Q\x89\x89\x89,^\xbc\x18\xb7\
-\xdb\xcd\xb1c\xc78{\xf6\xac\xdc\x04\x84\x18\xcf\xfb\xaf\
-4\x81\x18o'N\x9c\xa0\xba\xba\x9a\xc8\xc8H\xae\xb8\
-\xe2\x0a\x82\x82\x82\x02\xfe3\xdb5;\xf7.\xbc\xd7\xd2\
-cP\x14\x85\xd80'\xff|M\x81\xa5\x81oM\xd6\
-\x1a\xd6dM\x9d\xdaO\xa1\xa1\xa1\x14\x14\x14\x90\x91\x91\
-A[[\x1b\xfb\xf6\xed\xe3\xcb_\xfe\xb2\xdc\x08\x84\x18\
-\xaf/X\xd2\x04b\xbcm\xde\xbc\x19\xaf\xd7\xcb\xd2\xa5\
-KILLD\xd34i\x14\x11\xb0\x14E!%%\
-\x85\xd2\xd2R:::\xd8\xbd{7>\x9fO\x1aF\
-\x08\x09:\x22\x10\x0d\x0d\x0d\xf1\xe6\x9bo\xe2\xf7\xfbY\
-\xbf~\xfd\x94\x99\x84\xac\x1b:\xe5g\xcb\xd9\xd1\xb0\x83\
-\xae\xe1.Kv\xc95M\x93Q\xaf\xce\xe1\xe6^*\
-Z\xfb,\x99\xa3c\x98\x06\x0d\xe7\x1b\xd8\xd1\xb0\x83\x9a\
-\xee\x1aKv\x88\xb6\xc2\xb4i\xd3())A\xd7u\
-***hkk\x93\x9b\x81\x10\x12tD :|\
-\xf80555\xc4\xc4\xc4\xb0l\xd92\x9cN\xe7\x94\
-\xf8\xdc>\xdd\xc7c\xfb\x1f\xe3\xee\xd7\xef\xe6X\xfb1\
-\xcbJ@t\x0d\xba\xf9\xd1k\x95<\xbe\xbd\x06\xaf\x05\
-\x93buC\xe7\xcf5\x7f\xe6\xee\xd7\xef\xe6O\xa7\xfe\
-\x84_\xf7O\x89\xfe\x0f\x0e\x0e&77\x97\xfc\xfc\xfc\
-\xb1I\xc9B\x08\x09:\x22\x80\x98\xa6\x89i\x9al\xdc\
-\xb8\x11\xbf\xdf\xcf\x9a5k\x88\x8b\x8bCU\xa7\xc6)\
-hbrf\xe0\x0c\xf5\xe7\xeb\x19\xf6\x0e[V\xfa\xc0\
-\x04<~\x03\xaf\xdf@\xb1\xe8<\xe8\x1d\xed\xa5\xfe|\
-\xfd\xfbo\xb6\x98\x1a{\xf9(\x8a\xc2\xf4\xe9\xd3Y\xbe\
-|9]]]\xec\xda\xb5\x0b\x8f\xc7#7\x06!$\
-\xe8\x88@\xd2\xd7\xd7\xc7\x96-[P\x14\x85\x9bn\xba\
-i\xca\xbc\xcd\x990\x0f[ &\xd4\xc9\x83k\xf3\xb9\
-\x7fe66U.\xff\xf1\x14\x17\x17GII\x09\x8a\
-\xa2p\xe2\xc4\x09\x1a\x1b\x1b\xa5Q\x84\x90\xa0#\x02\x85\
-i\x9a\xec\xdc\xb9\x93s\xe7\xce\x91\x9c\x9c\xcc\x92%K\
-\x02\xb6R\xf9D~\xab\x10\xea\xb4\xb1\x22?\x9e+r\
-\xe2\xb0I\xad\xabq\xe5t:\xc9\xca\xcab\xee\xdc\xb9\
-tuu\xf1\xd6[oI\xa3\x08!AG\x04J\xc8\
-\xd1u\x9d\x8d\x1b7\xa2\xeb:7\xdcp\x03\xa1\xa1\xa1\
-R\xf2\xc1\x82~0\x0c\x93Q\xaf\x9fQ\x9fn\xc9\x84\
-\xe8\xa9.!!\x81\x95+W\xd2\xdb\xdb\xcb\xae]\xbb\
-\x18\x1d\x1d\x95F\x11B\x82\x8e\x08\x04\xed\xed\xed\xbc\xf5\
-\xd6[\xd8\xedvn\xbc\xf1Fy\x9bc\x91!\x8f\x9f\
-\xed\x95\x1d\xec\xae\xe9\xb4fg\xe4).&&\x86%\
-K\x96\xe0t:\xa9\xac\xac\xe4\xc4\x89\x13\xd2(BH\
-\xd0\x11\x93\x9d\xae\xeb\xbc\xf6\xdak\x0c\x0e\x0e\x92\x9f\x9f\
-OQQ\xd1\x94\xdc;GS4l\xaa\xcd\xb27Y\
-&\xd01\xe8\xe6\xdb/V\xf0\xd0\xab\xa7\xf0ZT\xeb\
-JUTl\xaam\xcaLD\xff \xbb\xddNZZ\
-\x1aK\x97.\xa5\xa7\xa7\x877\xdexC\xde\xac\x09!\
-AGLf\xa6i\xe2\xf5zy\xf1\xc5\x171M\x93\
-/}\xe9K\xd8\xed\xf6)7l\xa5(\x0a\xb3\xa6\xcd\
-\xe2\x0b)_ :8\x1a\x05k>\x7f\x90McA\
-Z\x14s\x92#P\x15k\xda!%<\x85/\xa4|\
-\x81\xcc\xc8\xcc)9|\x19\x1f\x1f\xcf\x9a5k\x18\x18\
-\x18`\xe7\xce\x9d\x0c\x0c\x0c\xc8\x8dB\x88\xcby\xdf1\
-\xe5\xeb\xc4\x98\x91\x91\x116l\xd8\xc0\xfa\xf5\xeb\xb9\xed\
-\xb6\xdbp8\x1c\xd2(\x9f\x93a\x18TUU1g\
-\xce\x1c\xecv;G\x8e\x1c!//oJ~\x9b\x17\
-\xe2\xc25QVV\xc6\xcd7\xdf\x8c\xa6i\xfc\xeb\xbf\
-\xfe+\xeb\xd6\xad\x93\x86\x11\xe22\x91\xa7\x8d\xb8\xac|\
->\x1f\x9b6m\xc20\x0cJJJ\xc8\xce\xce\x96\x90\
-#\xa6\xf6MWUILLd\xed\xda\xb5\xf4\xf6\xf6\
-\xf2\xdak\xafIEs!$\xe8\x88\xc9\xc84MF\
-FF\xd8\xb4i\x13\x8a\xa2p\xeb\xad\xb7N\xd9\x90c\
-\x9a&=#=\xb4\x0f\xb5\xe3\xf6\xbb-+\x01\xe17\
-\x0cz\x86=\x9c\x1f\xf6Zv\x0c\x83\x9eA\xda\x87\xda\
-\x19\xf0\x0cL\xd9\xf9)\xb1\xb1\xb1\xacY\xb3\x06\xb7\xdb\
-\xcd\xbb\xef\xbeKGG\x87\xdc0\x84\x90\xa0#&\x1b\
-]\xd79v\xec\x18'O\x9e$,,\x8c\xf5\xeb\xd7\
-O\xd9\xa0\xe3\xd1=|o\xc7\xf7\xb8\xe1\x85\x1b8\xd8\
-v\xd0\xb2\x12\x10\x1d\xfdn\xfe\xf9\xbfN\xf0\xc8\x1b\x95\
-x\xfc\xe3\x7f\x0c~\xc3\xcf\xc6\x93\x1b\xb9\xe1\x85\x1bx\
-\xe6\xf03\xf8\x8c\xa9Y\xdc\xd2\xe5r1s\xe6Lf\
-\xcc\x98AOO\x0f[\xb6l\x91\x1b\x86\x10\x12t\xc4\
-d{\x83\xe1v\xbb\xf9\xcf\xff\xfcOTUe\xdd\xba\
-u\xc4\xc6\xc6N\xd9\xbdsL\xd3\xe4T\xd7)\xde;\
-\xf3\x1e\xe7G\xcf[V\xfa`\xd4\xa7\xf3\xee\xe9n\x0e\
-5\xf6Z\xf6F\xa7m\xa0\x8d\xf7\xce\xbcGS_\xd3\
-\x94^q\x14\x1b\x1b\xcb\xb5\xd7^K\x7f\x7f?\xaf\xbf\
-\xfe:~\xbf_n\x1cBH\xd0\x11\x93\xe9\xc1\xde\xd7\
-\xd7\xc7\xcb/\xbf\x8c\xddn\xe7\x8e;\xee\x90\x0d\x02-\
-\xa6\x00\xb1\xa1N\xfe\xf9\x9a\x02\xbe\xb5*GvF\xb6\
-XTT\x14\xabW\xaf\xc64M***\xa8\xae\xae\
-\x96F\x11B\x82\x8e\x98,<\x1e\x0f[\xb6l\xa1\xaf\
-\xaf\x8f\xd4\xd4TV\xae\x5c)\x8dbu\xd0Q\x14\x22\
-]\x0en_\x9c\xc6-\x0bR\xb0K\xd0\xb1\x94\xddn\
-'55\x95e\xcb\x96\xd1\xdf\xdf\xcf\xe6\xcd\x9beO\
-\x1d!$\xe8\x88\xc9EX|\x01\x00\x00\x15vID\
-AT\xe0\xc2$\xe4\x8d\x1b7b\xb7\xdb\xb9\xed\xb6\xdb\
-\xb0\xd9l\xf2Fg\x02\xf4\xcbG\x7f\x09kEGG\
-s\xddu\xd7188\xc8k\xaf\xbd\x86\xd7\xeb\x95F\
-\x11B\x82\x8e\x98\xe8t]\xa7\xb1\xb1\x91\xdd\xbbw\xe3\
-p8\xf8\xcaW\xbe\x22\x8d2A\xf8\xfc\x06M=\xc3\
-\xb4\xf6\x8e 9\xc7z\xe1\xe1\xe1,_\xbe\x9c\x88\x88\
-\x08ZZZ\xd8\xb9s\xa74\x8a\x10\x12t\xc4D7\
-22\xc2\x8b/\xbe\x88\xcdfc\xe9\xd2\xa5dff\
-J\xa3L\x00&\xd0\xdc;\xc2\xca\xc7\xdf\xe1\x86\xff\xb3\
-\x1f\xb7_\xf6n\xb1\x9a\xa2(\xc4\xc5\xc5q\xfd\xf5\xd7\
-300\xc0\x9f\xfe\xf4'i\x14!$\xe8\x88\x09\xfd\
-05M\x86\x86\x86x\xf1\xc5\x17q:\x9d\xdcv\xdb\
-m2d\xf5\x17N\x9b\x93`[0\x9aj]\x9d/\
-E\x01\xa7M\xc5i\xe1\xfc\x1c\xbbj'\xd8\x16\x8cC\
-\x93\x9d\xc7\x15E!**\x8a\x9bn\xba\x89\xd1\xd1Q\
-v\xec\xd8A[[\x9b\x5c,B\x5cB6i\x02q\
-)\xb9\xddn\xf6\xee\xddKkk+\xc9\xc9\xc9|\xf1\
-\x8b_\x94F\x01\x82lA\xbc\xb1\xe1\x0d\x0c\xd3\xc0\xa1\
-9\xd0\x94\xf1\x0f;\x0a\x90\x19\x17\xca\xd1\x87\xd6\x8c\x05\
-\x9eq\x0f9\x9a\x9d\xef^\xf1]\xbe\xf3\x85\xef`S\
-m\xd8U\xa9b\xefp8(((\xa0\xb8\xb8\x98\xea\
-\xeaj^|\xf1E\xbe\xfd\xedo\xcbE#\xc4%\x22\
-ot\xc4%588\xc8K/\xbd\x84\xd3\xe9\xe4\xfa\
-\xeb\xaf'44T\x1a\xe5/\xdf\xdc\x83lA\xb8\xec\
-.\xcb*\x98+\x8a\x82\xaa(\x04;4\x82\xec\x9ae\
-\xc7`\xd7\xec\xb8\xec.\x1c\x9aC\xde\xf6\xf1\x7f\xdf\xea\
-\xdcr\xcb-\x0c\x0d\x0d\xf1\xc2\x0b/\xc8\x9e:BH\
-\xd0\x11\x13\x91\xae\xeb\x9c9s\x86\xad[\xb7\x12\x1c\x1c\
-\xcc\x86\x0d\x1b\xe4A&\xc4\xa7\x10\x1a\x1a\xcaUW]\
-Ehh(\x0d\x0d\x0d\xec\xd9\xb3G\x1aE\x08\x09:\
-b\xa2\x19\x18\x18\xe0\xd5W_\xc5\xeb\xf5RXX\xc8\
-\xbcy\xf3\xa4Q\xfe\xc2\xab{y\xe4\x9dG\xb8}\xf3\
-\xed\x1c>{\x18\xdd\x18\xff\x89\xc0\xa6i\xd25\xe8\xe6\
-'oT\xf2\xe4[5x-\x98\x8c\xec7\xfc\xfcW\
-\xe5\x7fq\xfb\xe6\xdb\xf9\x8f\x8a\xff\xc0\xa7\xfb\xe4\xe4\xe0\
-\xfdB\x9f\xd3\xa6M\xe3\xba\xeb\xaecxx\x98\x8d\x1b\
-7J\xa3\x08!AGL$\x17vB~\xe1\x85\x17\
-p\xb9\x5cl\xd8\xb0\x01\xbb]\xe6_\x5c\xa0\x1b:\xbb\
-\x9av\xb1\xa9r\x13g\x07\xcfZR\x02\xc2\x04\xfaG\
-}\xfc\xe7\xc1\x166\x1d>\x83\xdf\x18\xffc0L\x83\
-\xca\xaeJ6Un\xe2X\xfb1Kj~MD\x8a\
-\xa2\x10\x1e\x1e\xce\x97\xbe\xf4%<\x1e\x0fo\xbe\xf9&\
-\xed\xed\xed\xd20BH\xd0\x11\x13\xc5\xc8\xc8\x08\xfb\xf7\
-\xef\xa7\xa1\xa1al\xb9\xac\x0c[}\x98W\xf7\xe2\xf6\
-\xbb-y\x9b\x03\xefOF\x0e\x0f\xb2\xb3aQ\x0a7\
-\x15%\xa1\xa9\x16\xf4\x8f\x09>\xc3\x87\xdb\xef\x96\xb79\
-\x1f\xe1p8\x983g\x0es\xe6\xcc\x19+\x9f\x22\x84\
-\x90\xa0#&\x88\xf3\xe7\xcf\xb3i\xd3&\x9cN'\xd7\
-]w\x1d111\xd2(\x13PL\xa8\x93\xffgE\
-\x0e\xff\xed\x8a\x0c\x1cR\x02bBQ\x14\x85\xc8\xc8H\
-n\xb9\xe5\x16\xdcn7\xff\xf1\x1f\xff!\x93\x92\xc5%\
-e\x18\x06^\xafw\xca\xed\x8a.w:\xf1\xb9\xf9|\
->\x1a\x1a\x1ax\xfb\xed\xb7\x09\x0f\x0fg\xc3\x86\x0d\xa8\
-\xaa\x9cZ\x13\xf1A\xaa\xa9\x0aQ!\x0e\x22]\xb2\xe2\
-i\x22r\xb9\x5c\xac_\xbf\x9e\xd0\xd0P\xaa\xaa\xaad\
-R\xb2\xb8\xa4\xf7\xe9\xb2\xb22\xd6\xae]\xcb=\xf7\xdc\
-Cyy\xf9\x94\x09<\xf24\x12\x9f\xdb\xf9\xf3\xe7y\
-\xfd\xf5\xd7\xf1\xfb\xfd,\x5c\xb8\x90\xd9\xb3gK\xa3L\
-@\xa6i\xa2\x1b\x06}#^\xfaG\xbdR\xebj\x22\
-\xde\x90U\x95\xa4\xa4$\xd6\xaf_\xcf\xc8\xc8\x08\xbf\xff\
-\xfd\xef\xa5Q\xc4%\x0b:mmm\xbc\xfb\xee\xbb\xbc\
-\xf0\xc2\x0b\xdcq\xc7\x1d\xdc}\xf7\xdd\x94\x95\x95\x05\xfc\
-\xbd@\x82\x8e\xf8\xdc\x0f\xcf\xce\xceN6o\xdeLx\
-x87\xddt\x13N\xa7S\x1af\x22\xf6\x15p\xe6\
-\xfc(\xb7={\x90{\x9f;\x82GJ@L8\x8a\
-\xa2\x10\x12\x12\xc2\x1dw\xdc\x81a\x18l\xdf\xbe\x9d\x86\
-\x86\x06i\x18qI\xee\xd5~\xbf\x1f\x9f\xcf\xc7\xc0\xc0\
-\x00\xd5\xd5\xd5\xbc\xf4\xd2K|\xf5\xab_\xe5\xee\xbb\xef\
-\xe6\xd0\xa1C\x01\x1bxdg\xe4O\xe0\xf1xd\x8c\
-\xfc\xef\x18\x18\x18`\xd7\xae]\xb4\xb6\xb6\x92\x9f\x9f\xcf\
-\xb2e\xcb\x18\x1e\x1e\x96\x86\xf9\x88Q\xdf(\xba[\x07\
-\x0f\xb8G\xdd\x0c\x0f\x0fcS\xc7\xf7\xf23L\x93\xf3\
-\x03C\x9ch\xea$:\xc4\xc1\xe0\xd00\xbac|\x8f\
-\xc1\xab{\xf1\x8d\xfa\xc0\x03>\xb7\x8f\xe1\xe1a\xfc6\
-\xb9\xc6>\xfa@\xca\xca\xcab\xd1\xa2E\x94\x97\x97\xf3\
-\x87?\xfc\x81\x07\x1f|P\x1aF|.###\xb8\
-\xdd\xee\x0f\x9dg}}}\xf4\xf7\xf7\xd3\xd6\xd6\xc6\x81\
-\x03\x07())\xe1\xeb_\xff:\x0b\x16,\x08\xa8\xa1\
-m\xc5\x94\xf7\xd7\x1f:\x116l\xd8\xc0\xfa\xf5\xeb\xb9\
-\xe5\x96[x\xf2\xc9'\xd9\xbe}\xbb4\xcc'\xf0\xf9\
-|ttt\xd0\xd4\xd4DXX\x18\x85\x85\x852\xf7\
-\xe3\xaf\x86\x0c\x83\x13\x1d'\x18\xf4\x0eR\x10[@t\
-p\xf4\xb8\xb7\x93\x09\xb8\xbd:'\xcf\xf6cS\x15\x0a\
-\x93#\xc7}\xe5\x95a\x1a\xb4\xf6\xb7\xd2:\xd0Jb\
-h\x22\x19Q\x19\xa8\x8a\xbcX\xfe(]\xd7\xa9\xa9\xa9\
-\xa1\xb7\xb7\x97\xc4\xc4D\xb2\xb2\xb2\xa4Q\xc4\xe7>\xa7\
-z{{\xa9\xa9\xa9\xf9\x9b?\x13\x11\x11Aii)\
-\x9b7o\x0e\xa8y\x96\xf2F\xe7\x03\x1c\x0e\x07\xdf\xfb\
-\xde\xf7HHH\xc0\xe9tr\xed\xb5\xd7RXX(\
-\x0d#\x84\x10bR\xf3x<\x94\xfd\xff\xed\xddyL\
-T\xe7\xfe\xc7\xf1\xf7\xcc\xb0\x0c\xfb8\xc38\x22\x8b\x15\
-\x15\x04\xdc\x1d\xb1*\x88V\x8cK\x14\x1b\xb1\xadFS\
-\x97\xbaDS\x97\xf6\xaf\xb6\xd1\xe8\x1fm\xd4\x1a\xb5\xc9\
-m\xa3\xd1\x1a\xe3R\xabAjc)\x82\xa8T\x05\x5c\
-\x8a\xa2R\xc4\x05\x81J\x0b\x0a\x08\x082\xac\xc3\xdc?\
-\x0c'\xce\x0f\xec\xd5\xde:\xde\x9f~_\x09I;\x83\
-g\x9e9s\x98\xf39\xcf\xf9>\xcf\xf3\xeb\xaf\x9d\x06\
-\x9d\xf6\x8b.\x7f\x7f\x7f&L\x98\xf0\xca]\xacJ\xd0\
-y\x82F\xa3a\xe8\xd0\xa1\xa8T*T*\x15\x03\x07\
-\x0e\x94\xa0#\x84\x10\xe2\xff=\x8b\xc5\xd2\xa1\x14C\xa5\
-R\xa1V\xab\x09\x0b\x0bc\xf6\xec\xd9\xc4\xc4\xc4\x10\x12\
-\x12\xf2\xca\xbdw\x09:\xff\xe7C\xd7h4v\xc1G\
-\x08!\x84x\x15.\xe4\xdb\xcfi\xed\xe7\xba\xf0\xf0p\
-\xde{\xef=F\x8f\x1eMhh(\xbe\xbe\xbe\xafd\
-\xe9\x81\x04\x1d!\x1c$//\x8f\x84\x84\x04jkk\
-\x190`\x00\xf3\xe6\xcdsx\x1b\xee\xdd\xbb\xc7\xf6\xed\
-\xdb)..\xa6K\x97.\xac]\xbb\x16\x9dN\xe7\xd0\
-6\x9c>}\x9a\x8c\x8c\x0c\xb4Z-\xb1\xb1\xb1\x0c\x1c\
-8P\x0e\x0e!\x1c\x10t|||0\x18\x0c\x04\x05\
-\x051c\xc6\x0c\xa2\xa2\xa2\x08\x0b\x0b{e\x03N;\
-)F\x16\xc2\x01rrr\x189r\xa42\xeaa\xca\
-\x94)\xfc\xf4\xd3O\x0emCSS\x13\x11\x11\x11\xdc\
-\xb9s\x07\x17\x17\x17\xd4j5\x0f\x1f>\xc4\xc5\xc5\xc5\
-am\xd8\xbau+\x1f\x7f\xfc\xb1\xf2\xff\xbbw\xef~\
-)\x81O\x88'\xb5\xb5\xb5q\xfd\xfau\x8e\x1d;\xc6\
-\xcc\x993\x09\x0c\x0c\xfc\xc7\xb6\x9d\x9f\x9f\xcf\x91#G\
-\x987o\x1e~~~/-P\xb4\xb5\xb5QQQ\
-Aff&z\xbd\x9e\xf0\xf0p\x8cF\xe3k1x\
-Dzt\x84p\x80\xa3G\x8f\xd2\xd8\xd8\xc8\xe6\xcd\x9b\
-Y\xbat)mm\x8e_\xcc2??\x9f;w\xee\
-\x10\x17\x17Gbb\x22NN\x8e\xff\xf3\xdf\xbd{7\
-Z\xad\x96\x94\x94\x14z\xf7\xee\xed\xf0\xde\xa4W]b\
-b\x22'N\x9c\xa0\xae\xae\xce\xee\xf1\xf9\xf3\xe73j\
-\xd4(\xb4Z\xad\xec\xa4NTTT\x90\x9e\x9e\xce\x9d\
-;w\xf0\xf2\xf2\x02\xa0\xb0\xb0\x90\x7f\xfd\xeb_,\x5c\
-\xb8\x90\x88\x88\x08\xe5w\x1b\x1a\x1a\xd8\xb3g\x0f\xad\xad\
-\xad|\xf8\xe1\x87\xffq\xdbz\xbd\x9e\x8b\x17/\xd2\xab\
-W/&O\x9e\xacl\xdf\xd1\xd4j5]\xbbve\
-\xda\xb4i\xa8\xd5\xea\xd7jt\xac\x8c\xeb\x14\xc2\x01J\
-KK\x01\x986m\x1annnxxx8\xbc\x0d\
-eee\x00DGG\xbf\x94\x90\x03\xf0\xc7\x1f\x7f\x10\
-\x16\x16FLL\x0c\xfe\xfe\xfe/e?\xbc\xca\xae]\
-\xbbFNN\x0eAAA\x0c\x1b6L\xf91\x1a\x8d\
-\x1d\x86\x0b[\xad\xd6\x97\x12\xb8\xff\xd7\xd8l6\x8a\x8b\
-\x8b\xb9x\xf1\x22QQQJ\xf8\xae\xaa\xaa\xe2\xc7\x1f\
-\x7f\xec\xb0\x8a|KK\x0bYYYddd<\xd3\
-\xf6M&\x13o\xbe\xf9&)))TVV\xbe\xd4\
-\xf7\xda^\x9b\xf3\xbaM\x01\x22=:B\xbc@UU\
-U\xec\xdc\xb9\x93\x9c\x9c\x1c\x00\xbe\xfd\xf6[t:\x1d\
-K\x97.\xc5\xdb\xdb\xdba\xed\xd8\xb2e\x0b\xe7\xce\x9d\
-\x03P\xbep\xa7L\x99BTT\x94C^\xff\xf2\xe5\
-\xcbdgg\xd3\xd0\xd0@MM\x0d;v\xec\xa0k\
-\xd7\xae\xbc\xfd\xf6\xdbr\x90\xfc\xc3\xfc\xfc\xfc\x981c\
-\x06}\xfb\xf6U\x1esqq!99\x99\x8a\x8a\x0a\
-<<<(**\xa2\xa9\xa9\x89\xb8\xb88z\xf5\xea\
-\xc5\xb9s\xe7\xc8\xca\xca\xa2\xb6\xb6\x16\x93\xc9\xc4\xe8\xd1\
-\xa31\x9b\xcd\xb8\xba\xba*s\xfa$''SRR\
-B@@\x00={\xf6\xe4\xde\xbd{\xf4\xeb\xd7\x8f1\
-c\xc6p\xe7\xce\x1dv\xef\xde\xcd\x9c9s\x94\xd7\xad\
-\xac\xacd\xf3\xe6\xcdL\x9f>\x9da\xc3\x86a\xb3\xd9\
-\xa8\xac\xac\xe4\x87\x1f~\xe0\xfa\xf5\xeb\xa8T*z\xf7\
-\xeeM||<&\x93\x09\xb5ZMBB\x02\x95\x95\
-\x95\x04\x06\x06r\xe9\xd2%\x1e>|H\xdf\xbe}\x89\
-\x8b\x8b\xc3d2\xa1R\xa9\xb0Z\xad\x5c\xb8p\x81\xb3\
-g\xcf\xf2\xe7\x9f\x7f\xe2\xea\xea\xca\xd0\xa1C\x89\x89\x89\
-\xe1\xd2\xa5K\x94\x97\x973v\xecXz\xf6\xec\x09<\
-\x9e\xd44%%\x05\x8b\xc5B|||\x87\x1e\x15\x8b\
-\xc5\xc2\x8d\x1b7\xa8\xa8\xa8x\xee\xbf\x07\x9b\xcdFE\
-E\x05k\xd6\xac\xe90\xabppp0K\x97.\xc5\
-\xc7\xc7\x87\xf1\xe3\xc7s\xf8\xf0a\x8a\x8b\x8b\x09\x08\x08\
-\xc0\xd9\xd9Y\x0eT\xe9\xd1\x11\xe2\xd5\x09:\x1b7n\
-\xe4\xda\xb5k\x00l\xdb\xb6\x8d\x8d\x1b7\xf2\xf0\xe1C\
-\x87\xb6#55U\xb9\x02\xbdr\xe5\x0a\x09\x09\x09\xdc\
-\xbau\xcba\xaf\xff\xf3\xcf?\xb3d\xc9\x12\x1a\x1b\x1b\
-)**b\xc9\x92%\xac_\xbf^\x0e\x90\x17\xf1\xa5\
-\xaeV\xa3\xd5jqwwW~\x9c\x9c\x9c\xb8t\xe9\
-\x12;w\xee$))\x89\xc6\xc6F\xf4\xfa\xc7\x93V\
-&%%\x91\x98\x98HCC\x03\x06\x83\x81\x92\x92\x12\
-\xf6\xef\xdf\xcf\xd9\xb3g\x81\xc7\xb7p\xf6\xef\xdf\xcf\x99\
-3gpww\xa7\xa6\xa6\x86\x03\x07\x0e\xf0\xddw\xdf\
-q\xfd\xfau\x00\xee\xdf\xbf\xcf\xa1C\x87\x94^C\x80\
-G\x8f\x1eq\xe0\xc0\x01\x0a\x0b\x0b\xb1\xd9lX,\x16\
-\xbe\xfc\xf2K2331\x18\x0c\x18\x8dF\xce\x9e=\
-\xcb\xa6M\x9b\xa8\xab\xab\xc3f\xb3q\xee\xdc9v\xec\
-\xd8\xc1\xb1c\xc7prrB\xa3\xd1p\xe0\xc0\x01R\
-SS\x95\xbf\x99\xb4\xb44\xb6o\xdf\xce\xcd\x9b7\xd1\
-\xe9txxx\xf0\xe0\xc1\x03\xea\xea\xea\xa8\xae\xae&\
-55U\xb9\xb0\x00((( 55\x95\xc2\xc2\xc2\
-N{2\xab\xaa\xaa\xb8}\xfb6:\x9d\x8e\x80\x80\x80\
-\xe7\xde\xdf\xce\xce\xce\x04\x07\x07+?F\xa3\x91#G\
-\x8e\x90\x9b\x9bKKK\x0b\x00}\xfb\xf6E\xa3\xd1\x90\
-\x9f\x9f/3\xc7K\x8f\x8e\x10\xaf\x96\xde\xbd{SU\
-U\xc5\xc2\x85\x0b\xd9\xb5k\x17\xd7\xae]#((\xa8\
-\xc3\xefegg\xa3\xd5j\xe9\xd7\xaf\xdf\x0b\x0b:I\
-IIL\x9d:\x95\xd5\xabW\xb3j\xd5*\xbb\xe73\
-33\xc9\xcc\xccd\xf0\xe0\xc1\x8c\x1f?\xfe\x1f\x7f\xfd\
-5k\xd6\xb0f\xcd\x1a\xbc\xbd\xbd\x09\x0f\x0f\xe7\xfc\xf9\
-\xf3v\xcf\xd7\xd6\xd6r\xfa\xf4i4\x1a\x0d111\
-rK\xeb\xbfPXX\xc8\xe6\xcd\x9b1\x18\x0c\x00\x04\
-\x06\x06\x12\x17\x17\xa7\x84\x8f~\xfd\xfa\xf1\xee\xbb\xef\xa2\
-\xd3\xe9(,,$++\x8b\x80\x80\x00f\xcd\x9a\x85\
-^\xaf\xe7\xd6\xad[\xec\xda\xb5\x8b\xb4\xb44\xccf3\
-\x97/_&''\x87\xb8\xb88\xe2\xe2\xe2\xa8\xa9\xa9\
-a\xdf\xbe}J\xc8y\x16V\xab\x95\xec\xeclRR\
-R\xd8\xb2e\x0b\x83\x07\x0fF\xadVs\xfe\xfcy\x96\
--[\xc6;\xef\xbc\x83\xd9l\x06\xe0\xe1\xc3\x87\x0c\x1f\
->\x9cq\xe3\xc6\xd1\xda\xda\xca\xa7\x9f~Jff&\
-\xa3F\x8d\x02\xe0\xe0\xc1\x83\xd8l6f\xcd\x9a\xc5\x80\
-\x01\x03hkk\xc3b\xb1`0\x18\x88\x8c\x8c\xe4\xc4\
-\x89\x13\xe4\xe6\xe62n\xdc8\xbc\xbc\xbc\xc8\xcd\xcd\xa5\
-\xae\xae\x0e\xb3\xd9\x8c\x9b\x9b[\x87\xb6\xd5\xd5\xd5QY\
-Y\x89\xc9d\xea\x10\x84\xaa\xab\xab\xd9\xb9s'\xa9\xa9\
-\xa9\xcac\xcd\xcd\xcd\x5c\xbdz\x95\xb0\xb00\xe0\xf1l\
-\xc2\xed\xb5:\xad\xad\xad|\xf5\xd5W\xf4\xe9\xd3\x879\
-s\xe6\xe0\xe9\xe9\x09\x80\x87\x87\x07]\xbbv\xa5\xa4\xa4\
-\x84\x86\x86\x06\xa9M\x93\xa0#\xc4\xeb%//\x8f\xc9\
-\x93'\xb3i\xd3\xa6\x17\x16t\xfeJbb\x22\x9f\x7f\
-\xfe9+W\xaed\xfd\xfa\xf5\xe4\xe6\xe6\xda\x8d\x8cz\
-\xd1\x8a\x8b\x8by\xeb\xad\xb7\x98>}:\x0d\x0d\x0d|\
-\xf4\xd1Gddd`4\x1a\xe5\xe0\xf8\x9b=:.\
-..\xca\xe2\xba\xed#\xec\xdaCOdd$\xc1\xc1\
-\xc1J\xef\xc8\x8d\x1b7(++\xa3\xa9\xa9I9\x91\
-\xdf\xb8q\x83\x80\x80\x00~\xff\xfdw\x8a\x8a\x8apq\
-qa\xfc\xf8\xf1\xf8\xfb\xfb\xd3\xad[7\xa2\xa3\xa39\
-u\xea\xd43\xb7\xa9\xa5\xa5\x853g\xceP^^N\
-zz:\xe9\xe9\xe9J\x00\xaa\xac\xac$77W\x99\
-f\xc0\xdf\xdf\x9f\xe8\xe8h\xbaw\xef\x8eJ\xa5\x22\x22\
-\x22\x82\xec\xecl\xea\xeb\xeb\xa9\xaf\xaf\xe7\xd6\xad[\xcc\
-\x9d;\x97\x11#F(A\xa2\x9d\x9b\x9b\x1b!!!\
-\x14\x16\x16r\xeb\xd6-\x02\x03\x03\xf9\xed\xb7\xdf\xe8\xd2\
-\xa5\x0bC\x86\x0c\xe9\xb4m\xcd\xcd\xcd466*\xc1\
-\xf0I*\x95\x0aggg\xbb\x85\x8a\xdb'\xd9k\xff\
-\xef\xf6\x85X\x01\x0e\x1c8@rr2\x8b\x17/&\
-&&\xc6\xee\xdfy{{\xf3\xe8\xd1#Y?Q\x82\
-\x8e\x10\xaf\x97={\xf6\xb0v\xedZ\xfc\xfd\xfd_Z\
-\x1b6l\xd8\xc0\x96-[\x18;v,\x93&Mb\
-\xd0\xa0A,_\xbe\xdcau\x04\xdb\xb6m\xe3\xfd\xf7\
-\xdfg\xdd\xbau\x00|\xf0\xc1\x07|\xff\xfd\xf7\xacX\
-\xb1B\x0e\x90\xbf!  \x80\xb9s\xe7\x12\x1a\x1a\x0a\
-<\x9e?\xc5\xdd\xdd\x1d\x00\x83\xc1`\xd7[VSS\
-Css\xb3\xddg\xed\xe2\xe2Btt4}\xfb\xf6\
-\xc5\xc9\xc9\x09\x8b\xc5\x82V\xabUz!4\x1a\x0d\x1e\
-\x1e\x1e\x1dj]T*\x95]\x9d\x8a\xcdfS\x8a\x9d\
-\xdb\xda\xda(++S\xda\xd1N\xa3\xd1\xb0l\xd92\
-BBB\x94\xde\x14\x83\xc1\x80\xb3\xb3\xb3R0\xeb\xee\
-\xeeNss3V\xabU\x99\xdd\xd7\xd7\xd7\xb7\xc3\xb6\
-\x00\x5c]]\x89\x8c\x8c$??\x9fk\xd7\xaeQS\
-SCYY\x19\x91\x91\x91\xf8\xf9\xf9=5\x18j4\
-\x9aN\x03\x88\xb7\xb77\xf1\xf1\xf1\xc4\xc4\xc4\xd8\xf5\x00\
-\xdd\xbd{\xb7CMNzz:_\x7f\xfd5S\xa7\
-N%>>\x1e777\xbb\xa2\xdf\x96\x96\x16\x9c\x9c\
-\x9cd-@\x09:B\xbc^z\xf4\xe8ANN\x8e\
-C{P\x9e\xd4\xd6\xd6\xc6\x95+W\x186l\x18\xf0\
-x\x84\x88\xab\xab+eee\x9d\xdeb{QA\xab\
-\xbd\x96\x01\xa0\xbc\xbc\x1c\x1f\x1f\x1f98\xfe\xee\x97\xba\
-\x93\x13\xde\xde\xdet\xe9\xd2\xa5\xc3s\x1a\x8d\xc6n\xf4\
-\x95\x87\x87\x07:\x9d\x8e\xd8\xd8X\xa6O\x9fnw\x12\
-vvv\xc6j\xb5\xe2\xe1\xe1ACC\x03UUU\
-\xf8\xfa\xfab\xb5Z\xa9\xaf\xaf\xa7\xb6\xb6\xb6C/R\
-{\xfd\x89\xd5j\xa5\xba\xbaZ\xe9%R\xab\xd5\x18\x0c\
-\x06\xdc\xdc\xdcX\xbe|\xb9]OG{OL{\xd8\
-\xfa\xab\xc5$}}}\xd1j\xb5\x94\x97\x97S__\
-\xdf\xe9P\xed\x81\x03\x07\xe2\xeb\xeb\xcb\xd5\xabW\xb9y\
-\xf3&*\x95\x0a\xb3\xd9\xfc\xd4\x99\xee=<<\xf0\xf1\
-\xf1\xa1\xa2\xa2\x02\x9b\xcdf\xb7\x0f\xd4j5^^^\
-v\xfbR\xa3\xd1\xe0\xec\xecLss\xb3\x12\xe8\xf2\xf3\
-\xf3\xd9\xb0a\x03\xfd\xfb\xf7g\xc1\x82\x05x{{\xdb\
-m\xa7\xb5\xb5\x95\xf2\xf2r\x86\x0c\x19\x22C\xfc_\x02\
-)F\x16\xe2%\x1a3fL\xa7'$Gihh\
-@\xa5R\xd9\xdd\x02\xd0\xe9t\x94\x97\x97;\xac\x0d*\
-\x95J\x99\xb4p\xeb\xd6\xad\x14\x17\x173s\xe6L9\
-8\x1c\xa0\x7f\xff\xfe\xe8\xf5z._\xbe\xcc\xed\xdb\xb7\
-imm\xa5\xb1\xb1\x91\xdb\xb7oS\x5c\x5c\x8c\xa7\xa7\
-'\xbdz\xf5\xa2\xa5\xa5\x85\x94\x94\x14JJJ\xc8\xcb\
-\xcb\xe3\xd4\xa9Svs\xf5\xb8\xbb\xbb\xe3\xeb\xeb\xcb\xb9\
-s\xe7(++\xa3\xa0\xa0\x80#G\x8e(=:\xce\
-\xce\xce\x8c\x1d;\x96\xfa\xfaz\x92\x92\x92\xa8\xab\xabC\
-\xa5RQWWGvv6\x16\x8b\x85g\x99\xbb6\
-  \x80\x88\x88\x082228s\xe6\x0ceee\
-\x94\x96\x96*+\xbd\x03\x18\x8dF\x06\x0c\x18@AA\
-\x01iii\xf8\xfb\xfb\x13\x1e\x1e\xfe\xd4m\xea\xf5z\
-z\xf4\xe8\xc1\xbd{\xf7\xa8\xa9\xa9y\xae\xfdg\xb3\xd9\
-\xb8\x7f\xff>\x1b6l\xa0\xb9\xb9\x99\x85\x0b\x17\xe2\xe9\
-\xe9\x89\xc5b\xc1b\xb1(\xef\xbf\xb4\xb4\x94\xea\xeaj\
-BBB\xa4\xfeLzt\x84\x10\x8e\xe4\xee\xee\x8eF\
-\xa3\xa1\xa5\xa5E\xb9\xa2\xae\xaf\xaf\x7f)W\x9d_|\
-\xf1\x05\x87\x0e\x1d\xe2\xf8\xf1\xe3\x1d\xae\xf8\xc5\x8b\x11\x1a\
-\x1a\xca\xd4\xa9SINNf\xe7\xce\x9d\xcaH\xac\xc6\
-\xc6FF\x8d\x1aEDD\x04C\x86\x0c!//\x8f\
-\xe3\xc7\x8fSPP\x80\xab\xab+%%%\xe8\xf5z\
-e;&\x93\x89\x09\x13&\x90\x96\x96FSS\x13n\
-nnTWW+\x9f\xa3F\xa3!22\x92\xf9\xf3\
-\xe7\x93\x94\x94D^^\x1eZ\xadV\xe9\x1d\x0a\x09\x09\
-y\xa6\x02]OOOf\xcd\x9a\xc5\xde\xbd{9x\
-\xf0 'O\x9e\xc4\xc9\xc9\x89\x80\x80\x00&N\x9c\xa8\
-\xb4\xdfl6\x93\x9c\x9cLkk+\x83\x06\x0d\xfa\xcb\
-m{yy\x11\x1a\x1a\xca\xa9S\xa7\xb8r\xe5\x0ac\
-\xc7\x8e}\xe6\xfd\xd7\xde#z\xe8\xd0!F\x8c\x18\xc1\
-\xe1\xc3\x87\x95\x1e\xa9\xa0\xa0 \xe6\xcc\x99\x83\x97\x97\x17\
-\x99\x99\x99t\xef\xde\x9d>}\xfa\xc8\xb1-AG\x08\
-\xe1H*\x95\x8a\xc0\xc0@\x0a\x0a\x0a\x08\x0b\x0b\xc3b\
-\xb1P^^\xae\x14\xab:\x82\xcdf\xe3\x93O>!\
-++\x8b_~\xf9\xc5\xee\x04*\x9e\xcf\xc8\x91#\x09\
-\x0e\x0e\xee\xb4\xb0v\xe4\xc8\x91\x84\x85\x85\xd1\xad[7\
-\xe51\xadV\xcb\xc4\x89\x131\x99L\xfc\xfa\xeb\xaf<\
-x\xf0\x00\x17\x17\x17BBB\x08\x0f\x0fG\xa5R\xd1\
-\xa3G\x0ff\xce\x9c\x89\xd1h\xa4\xb4\xb4\x14???\
-z\xf7\xeeMRR\x92\xb2\x1d\x83\xc1\xc0\xcc\x993\xf1\
-\xf2\xf2\xe2\xfe\xfd\xfb\x98L&\xa6M\x9bF\xf7\xee\xdd\
-\x09\x0d\x0dU\x0avW\xadZ\xc5\xb1c\xc7\xb8q\xe3\
-\x06MMMt\xe9\xd2\x05\xb3\xd9\x8c^\xafG\xadV\
-3f\xcc\x18\xaa\xaa\xaa\xecz\x18\x87\x0e\x1d\x8a\xb7\xb7\
-7]\xbbvU\xde\x87\xab\xab+\x17.\x5c\xe0\xfe\xfd\
-\xfb\xb8\xba\xba\x12\x14\x14d\x17f\x8cF#\x06\x83\x81\
-\x01\x03\x060x\xf0\xe0\xbf>\x09:9\xd1\xa7O\x1f\
-\xfa\xf7\xefOZZ\x1aQQQ8;;c2\x99\
-X\xb4hQ\x87[\xb8...L\x9a4\x09\xab\xd5\
-\x8aJ\xa5B\xaf\xd7\xb3b\xc5\x0al6\x1bV\xab\x15\
-\xab\xd5\x0a<\xbe]e\xb3\xd9hll\xe4\xd8\xb1c\
-\xc4\xc6\xc6\xe2\xe7\xe7\xf7\x97\xb7\xe6\x84\x04\x1d!\xc4\x0b\
-0{\xf6l\xd6\xad[\xc7\xa6M\x9b\xf8\xe6\x9bo\x98\
-2eJ\xa7\x85\x9e/\xca\xde\xbd{IHH`\xdf\
-\xbe}\x14\x15\x15QTT\x84\x9f\x9f\x1f\xdd\xbbw\x97\
-\x0f\xe79M\x980\xe1\xb9\x9f\xf3\xf4\xf4$::\x9a\
-\xe8\xe8\xe8N\x9f\xd7h4\x84\x86\x86*\xc5\xcd\xf0x\
-:\x82'\x83\x8e\x93\x93\x13={\xf6\xec\xb0$B{\
-\xedW{\xa8\xd6\xe9t\xcc\x9a5\xeb\xa9ml\x1f\x06\
-\xff\xa4\xd1\xa3G3z\xf4h\xbb\xd7\x1a>|8\xc3\
-\x87\x0f\xef\xb4\x87\xa5\xa9\xa9\x89\xbc\xbc<jkk1\
-\x9b\xcd\xbc\xf1\xc6\x1b\xffq\xbf\xf9\xfb\xfb3f\xcc\x18\
-N\x9e<IMM\x0dF\xa3\x91\xc0\xc0@>\xfb\xec\
-\xb3\x0e\xbf\xab\xd5j\xed\xdeCdd$\x91\x91\x91O\
-\xdd\xf6\xdd\xbbw\xf1\xf2\xf2\x2266V\x86\x95K\xd0\
-\x11\xe2\xd5\xe5\xeb\xebKpp\xf0S\x97^\x186l\
-\xd83}!\xff7|||\x18:t(&\x93\xc9\
-\xee\xf1\xd5\xabW\xb3i\xd3&\x16/^Lxx8\
-\xdb\xb6m{am\xd0\xe9t\x1d\x0aHO\x9f>\x8d\
-^\xafg\xe5\xca\x95\xcac\x0b\x16,`\xd9\xb2er\
-\xe0\x88\xe7r\xef\xde=\xce\x9e=Krr2:\x9d\
-\x8e\xa8\xa8\xa8g\xbaU\xa4\xd5j1\x9b\xcd\x18\x0c\x86\
-\x7f|T\x94F\xa3a\xd1\xa2E\xf4\xe9\xd3\xe7\xa5-\
-\xbd\xf2\xba\x93\xd5\xcb\x85\x10B<\x97\x82\x82\x02RR\
-R\x94% \xfeW\x14\x15\x15q\xf4\xe8QJKK\
-\x89\x8d\x8d%**\xaa\xd3I\x02\x85\x04\x1d!\x84\x10\
-B\x88W\x82TE\x09!\x84\x10B\x82\x8e\x10B\x08\
-!\x84\x04\x1d!\x84\x10B\x08\x09:B\x08!\x84\x10\
-\x12t\x84\x10B\x08!$\xe8\x08!\x84\x10BH\xd0\
-\x11B\x08!\x84\x04\x1d!\x84\x10B\x08\x09:B\x08\
-!\x84\x10\x12t\x84\x10B\x08!$\xe8\x08!\x84\x10\
-BH\xd0\x11B\x08!\x84\x90\xa0#\x84\x10B\x08\x09\
-:B\x08!\x84\x10\x12t\x84\x10B\x08!$\xe8\x08\
-!\x84\x10BH\xd0\x11B\x08!\x84\x90\xa0#\x84\x10\
-B\x08!AG\x08!\x84\x10\x12t\x84\x10B\x08!\
-^E\xff\x06\xba\xd5\xba\xfb\x8f+\xf3^\x00\x00\x00\x00\
-IEND\xaeB`\x82\
-\x00\x00M\xd5\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x02\x17\x00\x00\x00H\x08\x06\x00\x00\x00E\x9e\xd7C\
-\x00\x00\x00\x09pHYs\x00\x00\x11 \x00\x00\x11 \
-\x01\xa4\x00i\x0d\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
-ATx\xda\xec\x9dwx\x1d\xe5\x95\xff?\xef\xdc\xa2\
-nUKn\x92\xdc{\xc7\xd8\xe0PC\x09%@`\
-7N6\x85$\x80}\x0dK\xf8-\x90e\x93l\x12\
-`\x93\xecf7\x9bM'\x96\xbd\x94\x90lH\x0c\x09\
-\xa17Sl\xdcq\xb7,[\xb6U\xac\xde\xbbt\x9b\
-\xee\xbc\xbf?\xce\x8c\xee\x95\xad+\x170-s\x9eG\
-\x8fn\x99y\xe7\x9d\xf7=s\xce\xf7|\xcfy\xdf\xab\
-\xb4\xd6\x0c'+V\xac\xf8\xadR*i\xb8c\x94R\
-\x1d\xabV\xadZ\x11\xfb\xd9\x83\x0f>h\xd4\xd6\xd6\xde\
-\x08\xfc\x9dRj&\x90\x0a\xb4(\xa5\xb6j\xad\x1f.\
-**\xda\xcfi\x88\xcf\xe7\x1b\xad\x94\xba\xd54\xcd\xcb\
-\x94R\xa3\x80\x88\xd6\xfa\x98R\xea\xf9\x94\x94\x94\xc7\xfe\
-\xe7\x7f\xfe\xc7?\xc49\x0b\xb5\xd6\xdfSJ\xcd\x00\xfc\
-Z\xeb\xe7V\xaf^\xfd\xdd\xe5\xcb\x97\x8f3\x0c\xe3\x07\
-\xc0b\xc0\x04\xf6\x17\x15\x15\xfd\x03\x8e|(E\x95\xa8\
-;\x81\xaf\x9e\xc2\xa1\xf7\xe9\x99\xfa\x8dA\xe7\xeeW\x17\
-\xe3\xe2v\xe0\x024#\x81\x00p\x18x\x86\x00\xbf\xd4\
-\xe7\xe8\xceS\xee\xc7>\x95\x82\xc1\xed\x18\xdc\x84f\x1a\
-0\x02h\x06\xb6\xa0)\xd2\xb3\xf5\xab\xcel9\xf2a\
-\x14\x9f\xcf\xe7\xd3ZO8\xd9q\x91H\xe4\x87\x0f?\
-\xfcpw\xecgw\xdcq\xc7\xc4\xfe\xfe\xfe\xcf\x01\x0b\
-\x95R\x19J\xa9n\xad\xf5n\x97\xcb\xb5\xf6\xa1\x87\x1e\
-*=\x9d~<\xf8\xe0\x83F}}\xfd\xb5Z\xeb\xab\
-\x95R\xf9Zk7P\xaf\x94z\xc3\xeb\xf5>\xf9\x8b\
-_\xfc\x22x\xfc9\xb7\xdezk\x9a\xdb\xed\xbeWk\
-}.\x80a\x18%EEE\xf7=\xf0\xc0\x03\xae\xba\
-\xba:\x1f\xf0)\xa5\x94\xd74\xcd\x0a\xa5\xd4w\x8b\x8a\
-\x8aZ\x9c\x19\xff\xe0\xc5}R\x83\xaa\xd4g,#\x1a\
-W\xb4\xd6\x0d\xb1\xefo\xbf\xfd\xf6\x5c\xd34\xff\xac\x94\
-\xba\xe0\xb8C'i\xad\x97\x00_\xf7\xf9|\xff\xb1z\
-\xf5\xea\xef\xea\x93\xa1\x1b`\xe5\xca\x957\x00\xbf\xd7Z\
-\xa7*\xa5b\xfb6\x0b\xb8\xa6\xb7\xb7\xf7_V\xae\x5c\
-y\xc3\xaaU\xab\xf6\xda\xdf\xdds\xcf=I\xc0\xabJ\
-\xa9\xec\x98\xe3\xf7\x01\xb8\x5c\xae'\xb5\xd6\xe7\xc5\x5c\xa2\
-\xdfQ\x85\x0f\xb1\x98\x8cAq\xce)\x1c\x9990\xd7\
-(\x83\x12~\x8a\xc1]\x0c\xd60/\xb0\x08XD\x22\
->u@}Z\xcf\xd2{O\x01XL\xc0\xc5+\xc0\
-\x94\xe3\xda\x1b\x0d\xdc\x84\xe2&U\xa2\x1e\xa1\x09\x9f\xbe\
-D;\xfa\xe4\xc8\x87M\xbe\xa0\x94\xba\xe8d\x07%&\
-&\xfe\x0c\xe8\xb6\xec\xa5Z\xb1b\xc5\x83\xc07\x95R\
-\x9e\x18{\x0fpc$\x12\xb9\xdf\xe7\xf3\xfdO{{\
-\xfb\xb7\xd6\xae]\x1b9\x05\x80S\x00<\x0d,\x8ci\
-\xc7n\xf3k\xc1`\xf0\x07>\x9f\xefsEEE\xdb\
-\x069)\xb7\xfbO\xc0\xd5\xb6\xed\xd7ZO\xd2Z\xff\
-\xf3\x8a\x15+~\xa0\x94\xfa\x17\xbb-\xa5T\x04\xb8\xd7\
-\x99\xea\x8f\x08\xb8\x88\x91Z\xe0\x858\x00\xa4\xcb~\xbd\
-l\xd92off\xe6\xb3\xc0\x12\xeb\xa3\x0a\xe0\x09+\
-\xc2\x9b\x05|\x09H\x04\xfe\xd5\xe7\xf3u\x03\xffy\x12\
-\xe6d\xa9Rj\xad\xe5\x14\xb4R\xea\x05\xd34\xd7+\
-\xa5\xdcJ\xa9k\xb4\xd6\x17\x02\x85Z\xeb\xd7\x96/_\
-\xbep\xcd\x9a55\x00===\xb3c\x80\xc5\x8f\xdd\
-n\xf7/\x03\x81@\xe4\xae\xbb\xeeJ\xb0\x00\x0e\xc0\xb3\
-n\xb7\xfbN\xd34]\x8e*|DD\xf3\x13\x14\xcd\
-C\x87]\x14\x0f\xbc.\xe6\x9b(\xee\xb2\xde\xb5\x03\xbf\
-B\xb3\x07\x83t4_\x04.\x03\xc6\xa1xA\x1dV\
-\xf3\xf5T\x1d7\xdaQ[T\x12#x\x01\x98b}\
-\xb4\x19\xc5o1i\xc1`\x1a\x9a\xaf\x03\xa3\xd1\xdcB\
-.\xad\xc0}\xceD9\xf2!\x950\xb0>\xde\x97\xc1\
-`0\x14c{\x7f\x00|\xdbz\x1b\xd2Z\xbf\xa4\x94\
-\xaa\x00\x0a\x80k\x81\x04\xe0\x9f333=\xc0\xdd\xc3\
-]\xf4k_\xfbZ\x86\xd7\xeb}\x1d\x98l}T\x05\
-\xbc\xaa\xb5\xf6[A\xe8\x02\xa0\x10x}\xc5\x8a\x15K\
-V\xaf^}\xc0b:\xdc\xc0\x15\x96\x9fy[k\xfd\
-m\xd34\xfb\xad\xf7W[m\x1d3\x0c\xe3\xab\x91H\
-\xc4\xbdz\xf5\xea>g\x8a?z\xe0\xe2PQQ\x91\
-\xef\xa4\xa1cf\xe6\xd7b\x80\xc5\xba\x94\x94\x94\xebc\
-S\x16>\x9f\xef\x17\xc0\x06 Ck\xfd\xc0\xf2\xe5\xcb\
-\x1f[\xb3fM\xe30\xcc\xc9/-`\x81\xd6\xfa+\
-EEE\xbf\x8b\xf9\xfaG>\x9f\xef~\xe0\x01`\xa4\
-R\xea\x87\xc0W,v\x22\xc54M\x1b\xe9n\xf8\xf5\
-\xaf\x7f]\x0dp\xdbm\xb7e\xb9\x5c.\x9b\xfe\xd8f\
-\x7f\xee\xc8G\x06\x5c\xfc\xaf\x9e\xad\x0f\x0d\xcb2\x1cV\
-9(\xfe\xd5z\xdb\x86\xc1yz\x86>\x12\xc3j<\
-\xc6\x01~\x05\xdc\x81f,a\xbe\x01|3n\x83#\
-X\x09\xcc\xb0N\xfe\x13\x07\xf8\xa2\xfe\xac\x1e\x88\xd4T\
-\x89z\x14\xcdV\xa0\x10\xcd\xdd\xea\x90zHO\xd7\x95\
-j\xa7\xf2\xe0%\x1f\x80$j\x99L\x88\x03,B1\
-\x1a\x83Cz\xba>\xecL\xa8#\xef\xb3t\x15\x15\x15\
-]q\xb2\x83\x96/_>\xc30\x0c\xfb\x99h4\x0c\
-\xe3\xf2\xdf\xfc\xe67\xc51v|:\xb0\x0e\x18\x0b\xfc\
-\xbf\x15+V\xfcv\xf5\xea\xd5{\xe2\xb5\xe7\xf5z\xbf\
-g\x03\x0b\xad\xf5\x13\x89\x89\x89_\x8bM\x81\xf8|\xbe\
-\xbb\x80\x9f\x03)J\xa9U\xc0\x85\x00\x95\x95\x95\xa9^\
-\xaf\xd7m\x9d\xf7ZQQ\xd1\xc6\x98f3\xac\xcf\xdf\
-\xf9\xcdo~\xf3\x963\xb5\x1f.1\xceB\x9b7\x0f\
-\xc4\x91p\xeb\xf1\xb5\x10EEE\xfb\xb5\xd6?\xb4Y\
-8\xc30>7\x0c\x8d6\xdd\xa6\xd0\x80gW\xaf^\
-\xfd\xbb\xe3\x8f\x193f\xcc\xf7\x81\x83\x16\x10\xf9\xbc\xcf\
-\xe7K\xf6\xf9|kM\xd3|3\x06\xa0<\xe7\xf3\xf9\
-\xf4\xca\x95+\xff\xe2r\xb9ZcN\xff\xa1\xcf\xe7\xd3\
-+V\xac\xf8\xaa\xa3\x0a\x1f#\x09q=\x90l\x81\x81\
-\x1f\xc7\x02\x0b\xc1'Z\x13\xe1>\x14v\xbd\xc5\xe7\x87\
-mO\xf1\xd9\x81\x96\x83|=\x16X\x00\xe8\x99\xba\x01\
-\xc5\x03\x03\x80=\x82\xe8\xb4\x87\x89\x18\x94aPF\x90\
-\x9b8\xc0.`;\x9ag\x88P\xaa\x0e\xa8'\x14\xca\
-p&\xcc\x91\x0f\x9dc0\x8c[c\xfc\xc3=\xb1\xc0\
-\xc2\xb2\xe3\x87\x94R63\xa8\x0c\xc3X\x1e\xaf\xade\
-\xcb\x96\xb9\x80/\xdb@%55\xf5\xd6\xe3k+\x8a\
-\x8a\x8a~\x01\xbcd\xbd\xbd`\xc5\x8a\x15\xb3V\xacX\
-q\x87\xd7\xeb\xdd\x1ds\xd8?\xf9|\xbe\xb2\x15+V\
-\xfc\xc6\xe7\xf3\x95\x01c,\xfb~\x95\xcf\xe7+\xf3\xf9\
-|\xdfuf\xee\xa3\xc9\x5c\x14\xae\x5c\xb9\xf2_\x86\xfa\
-\xc24\xcdWV\xaf^\xbdg\xd9\xb2e\xae\xcc\xcc\xcc\
-E\xd6\xc7\x87\x8b\x8a\x8a\xaa\xe2\xb4\xb5.\xc6\xf1/\x8e\
-\x1b\xa4j\xbd4\xa6\xc6\xe2\xf5\xa1\x8e\xb9\xff\xfe\xfb\xcd\
-\x95+W\xbe\xa9\xb5\x9e\x01xM\xd3<\xc70\x1c{\
-\xfd\xb1\x15\xc5\x83\xea\x80\xea\x18\xe2\xf3Z=S\xff\x9b\
-\x05\x99\x17\xc5\xd4El\x1aR\xb7\xe6\xea^U\xa2\xf6\
-\x00\x17\x03\x85\xea\xb0\xca\x19*5\xa2P\x0a\x8d\xad\xd3\
-G\xf5\x02=tJ\xa6\x9f-D\x93kC\xe9\xf4\xff\
-\xa2hD\xf3g\xe0R \x0b\xf8<\xc5\xace6O\
-;\x13\xeb\xc8\xfb$^\x9f\xcf\xf7\xd98\xdf\x95\x15\x15\
-\x15\xed\xb2\x1d\xfc\x80\x93p\xbb\x9f\x1d\xea\xe0\xb6\xb6\xb6\
-\xe7333#\x80Kk\xbd4\xde\x05\xd3\xd3\xd3g\
-\x019\xd6\xdb\xd7\x86*\xbe\xb7\xec\xfd\xf3v\xaa\xc30\
-\x8c\x0b\xb5\xd6\x99\xc0\xf8\x98C\xb2\x80,\xc30\xf2\xb4\
-\xd6\x13c>O\x05Rc\xeb\xeb\x1c\xf9h\x81\x8b\xc9\
-Z\xeb\x1f\xc5A\xb9\x9d\xc0\x9e\xdc\xdc\xdc\x8cp8\xec\
-\xb5>\xae\x8c\xeb\x1f$og+T\xde0\xc7\xe5\xc6\
-\x1cW9\x0c\x08\xa9\x8c\xe9\xcb\xa8\xa2\xa2\xa2e>\x9f\
-\xefR\xc0^9\xf0\xe9\xa2\xa2\xa2\x17\x00\xee\xbc\xf3\xce\
-\xecp8\xdcb\x9d\xf7\xed\xd5\xabW\xff\x87\xa3\x06\x1f\
-)p\xb1,\xce7\xfb\x81\x7f\xb3\xa8\x89\x9c\x98\xcf\x8f\
-\xc5mKSi\x81\x0b\x081\x128\xb1\xeeb\x0f\xe9\
-x\xf0\xc4\x1c?\xb4\x8c\xe0\x18\xbdh@\x01#\x878\
-\xe2\x08~\x96\xeast\x9f*Q\x8b\xd1l\xb3\xeeg\
-18\xe0\xc2\x91\xf7M\xd2\x80\xb5q\xec\xe8*\xe0v\
-\xeb\xed(\xeb\x7f\xcb\xaf\x7f\xfd\xeb\x9e\xa1\x8e_\xbbv\
-m\xc8\xe7\xf3\xd5\x01\xf9Ha\xf3\x90\xe2r\xb9\xf2\xec\
-\xe2\xcd\xe1\xec8R\x9fg\x07\xacc\xc3\xe1\xf0O\x12\
-\x13\x13_4M\xd3\x06<?q\xb9\x5c\x0f\x85\xc3\xe1\
-^\x8f\xc7\xf3\x8dH$\xb2\xd1\xba\xee\x0b.\x97\xeb.\
-\xcb\x0f9\xf2\x11\x04\x17\xddJ\xa9\xc3q\x98\x8b\xe6\xd3\
-\xb9h(\x14R^\xaf\xd7V6=\x0c\xb8p\xdb_\
-+\x15\x9f>\xd6Z\x87bW\x918\xf2\xb1\x96\x97\xb1\
-\xaa\xd9\x07+!\xb1,Y8\x8a|I\x1c\x06\x5c$\
-\x11U\x9b\xd0\x90\xc7D\xd0x\x06\x80Mr\xdc\xb6\xfa\
-\x07\x80\x85\xbc\x1b\xa2\xdf\xfa\x1c-\xc5f~v\x938\
-p\xbc\x13m9\xf2~\x8a\x06:\xe2|\xd77\x84o\
-\x08\x9e\xcc\x9c\x9f\x82/I\x8c\xb1\xe9\xa1x\x07\x19\x86\
-\xd1\x1fc\xef\xdd\x8f>\xfah\xc7\x1dw\xdc\x11\x0bF\
-\xda\x1fz\xe8\xa1r\xfb\x8d\xcf\xe7\xb3\x9f\xb3\x9e\xd8\xcf\
-\x1d\xf9\xe8\x81\x8b\xed\xabV\xad\xba|\xb8\x03\x9a\x9a\x9a\
-:233CH\x01\xe6\xf8x\xc7y\xbd\xde\x891\
-\xca\xd68\x5c\x931\xaf'\x0c\x03B&\xc6\x00\x9d\x06\
-gZ?\xc6br\xb7\x9e3|A'\x9a\xfa\x187\
-_\x88\xeck\x81B)M\x0c\x98UL\x1ch\xd5`\
-h=<\x87.\x0e\xd0\x0b\xa4\x00\x13\xe3^\xd3\xcf\xd4\
-\x81\x0c\xb5\xa2v\x08\xc6e@\x97\xf59:\xac\x0e\xa8\
-n`\x04\x0ag\xa5\x92#\xef\xa7\xb4\x15\x15\x15\xe5\x9c\
-\xc2q-H\xb1\xe6\xe8e\xcb\x96y\xd7\xae]{\x02\
-(\xb0\xd2\xe0\x05\xd6\xdb\xb8\x01\xa6i\x9a\xad1\xc1\xdf\
-\x84a\x8e\x1bo\x1f\xa7\x94jv\xa6\xea\xa3-\xefi\
-q\xc2\xda\xb5k#Z\xebw\xac\xb7S\x96/_>\
-.\x06e>\xb1b\xc5\x8ao\xdcu\xd7]\x09\xc0\xd5\
-1\xa7m\x8d\xd7^$\x12\x89\xfd\xee\x9a\xa1\x8e\xb1\x96\
-*]o\xa3\xe8`0\xb8\xcb\x99\xd6\xbfy\xd9\x14\xa3\
-\xe1\x9f\x1ex]\x8cO\x1dP\x1bU\x89\xfa\xa4\xda\xaf\
-&\xa2X`}\xb3W\xcf\xd4=C\xe3\x14\xadQl\
-\xb6\xde\x16\xa8\x9285B\x06_\x88y\xb7q\x88\x86\
-\xbaN\xe0:\x1cq\xe4\xc3+;m\xcd\xce\xcc\xcc\x5c\
-\x1cc\xc7\xef\xf4\xf9|\xffx\xd7]w%\xa4\xa7\xa7\
-/\x85\x01^oG\xbc\x86\x02\x81\xc0^\xa2l\xe2E\
-\x0f>\xf8\xa0\x11\x87\xb9\xb88\xc6\xf6\xbf\xe3L\x81\x03\
-.\x8eW\x90\xc7mVD)U\xb4l\xd92\xefm\
-\xb7\xddV\x08\x5c\xa3\x94\xfaq0\x18\xdc\x0d\xd8\x85\xa1\
-~\xd34\x9f\x8a\xd7\xd6\x9a5k\xf6)\xa5l%\xbf\
-\xdc\xe7\xf3\xddy\x1cc\xa1\xea\xea\xea~\x1c\xc3\x92\xac\
-}\xfc\xf1\xc7{\x9di\xfd\x1b\x97D^\x04\xea,\xa7\
-~\xbb:\xa8\xae\xb1\xd8\x83Y\xc0R4\xebp\xb1\x01\
-m\xb1\x06\x9a5'aB\x8ab\xde=\xae\x0e\xaa\xc2\
-Azx@]\x07\xdcc]\xa3\x13?\x7ft&\xc1\
-\x91\x8f\xb2h\xad\x9f\x88\xb1\xb3?\xb6V\xe1y\x80o\
-\x01\xbf\x0a\x06\x83\xbb\x0d\xc3\xf8e\xcc1k\xe3\xb5\xf5\
-\xf8\xe3\x8f\xf7j\xad\x9f\xb1\xdeN\xaa\xab\xab\xfb\xde\xf1\
-\xc7\xf8|\xbe+\xb5\xd6\xf6\xaa\xad\xf2q\xe3\xc6mq\
-f\xe1\xa3-\xa7\x93\x16\x99\xee\xf3\xf9\x8a\x86\xf9\xfe\x81\
-\xa2\xa2\xa2\xfa\xb6\xb6\xb6\xc7233o\x01\x96(\xa5\
-\xae\xc9\xcc\xcc\xdc\x0d\xfcNk\xfd\x13k7\xb5\x191\
-\x0a\xfc\xbd\xe1\xf6\xb8\xb0\x10\xec\x9d\x86a\xacGR-\
-\xbf\xf4\xf9|7!\xabM<>\x9f\xef:\xad\xb5\xbd\
-sc\x8b\xdb\xed\xfe\xb63\xa5\x1fsq\xf1\x88*V\
-\xbdq\xa0\xf23z\xa6\xfe\x95\x9e\xac\x83\xea\x80Z\x09\
-<\x03x0y^\x95\xa8\x17Q\xec\xc5d7\x8a\x85\
-h\xc6Z\xc0a\x17-'\x01\x17\xb3\xf8\x0b%<\x8d\
-\xe6F4\xd3\xd0\x94\xa8\x03\xea%\xa0\xd1\x02,\x03\x11\
-\x17&_?\x9d-\xc5\x1dq\xe4}\x96\xa4x\xab\xfe\
-,{\xfb\xec\x9a5k\x0e\xae^\xbdz\x9d\xcf\xe7{\
-\x01\xb8\xd6\xda\xcdx\x1b\xf0s\xa5\xd4\xb7\xb4\xd6\xff\x11\
-k\xc7\x95R\xaf\x14\x15\x15=\xbfj\xd5\xaa\xf8\x8e\xc6\
-\xed\xfeN$\x12\xf9\x14RPz\xff\x8a\x15+\xce\x05\
-\xfe\xac\x94\x0a\x00\x17\x01\xb7\x00.q\x0b\xfa\x1b\xf7\xdf\
-\x7f\xbf\xc3\xec\xfd\x0d\x81\x8b\xb1\xc0\x8ax_\x9a\xa6\xf9\
-3\xa0~\xed\xda\xb5\xa1[n\xb9\xe5:\x8f\xc7\xf3\xa4\
-etg\x02\xff1T\xc1\xa5R\xea\x0b+W\xae\xdc\
-[TT\xb4.^a\xe7\x9a5k\xb6\xae\x5c\xb9\xf2\
-F\xad\xf5\xff!\x9b\xa6\x5cj\xfd\xc5n\x1f{\xcc0\
-\x8c\x1b\x9d\x0d\xb1\xfe\x16B*\xceG\xc5\xfdn\xa0\x16\
-C\xcf\xd2\xcf\xa9\x03\xea\xb3@\x11\x90\x8d\xe6Z\xe0\xda\
-\x13\xceU\xccg$\xbfV\xc5\xea\xbf\xf4l]6t\
-\xb3Z\xabd\xf5\x05\xfa\xf85\x9a\xaf!{h\xfc\x9d\
-\xf5\xa5-]\xc0]z\xb6\xfe\x9d3I\x8e|\x88%\
-9\xde\xaa?\x00\x97\xcbU\x85\xb5oP(\x14\xfa\x92\
-\xd7\xeb}\x0a\xd9\xcdv6\xb0f(3\xad\xb5\xce\xbd\
-\xed\xb6\xdb.\x00\xde\x8e\xd7\xeeC\x0f=T\xba|\xf9\
-\xf2\xcf\x18\x86\xf1$\x90\xa5\x94\xba\x86\x13S\xdd\xfd\xc0\
-\xdd\xabW\xafvVO\xfd-\x80\x0b\xad\xf5_O\xf6\
-\xc3e\x162\x1d\xc8)?\xf2\xc8#\xcdJ\xa9K}\
->\xdf\xa7\x81\x9b\xac=(\xd2\x95R\xcdZ\xeb\xadH\
-\xb1\xd0w\x80\x05Z\xeb\xa7W\xae\x5c9\x91\xc1\xc5\x9b\
-\x83d\xd5\xaaU/\xdeq\xc7\x1d\x13#\x91\xc8m\xc0\
-'\x81q\x80\xa9\xb5\xaePJ\xbd\x14\x0a\x85~\xfb\xe8\
-\xa3\x8f\x06\x8e\xebw\x93R\xeaI\xebm\xbd\xfd\xb9\xdf\
-\xef\x0f\xb9\xdd\xee'-ps\xd0Q\x81\x8f\x80\x18l\
-@\x9fB\x0aO1\x88J\xd5\xb3\xf4\x9fU\xa9z\x95\
-0\xcb\x80O\x00y(\x02\xc0\x11\xe0M`\xb9\x05\x12\
-V\x00\xbb\x81\xb2\xb8\xcf\xc1x\x1d\x00nU\xfb\xd5\xcf\
-pq\x13\x9aYHAf\x13\x9am\xb8\xf8\xa3\x9e\xae\
-[\x07\x87\x81\xb4\xe1\x1a\xd8\xde~\xefq}\xfd9\x9a\
-d\x86\xc9U;\xe2\xc8{(;\x89\xb7\x22j\xb0\xdd\
-\x1c(\x88\x7f\xf4\xd1G;\x1e|\xf0\xc1+kkk\
-\xff^)\xf5E\xe0\x1c\xe4\xf7{:\x80b\xad\xf5n\
-\xa5\xd4\x1d\xc0\x02\xc306\xdc~\xfb\xed\x97\x0e\xb7S\
-\xe6\x9a5k\xde\xb8\xe5\x96[\xa6\xbb\xdd\xee\xbb\x94R\
-W!\x05\xd2\x09@5\xb0\xde4\xcd\x9f\xafY\xb3\xe6\
-\xe0q\x01h\x98\xe8\xbeH\x15\xc7\xf5u\xa3Rj$\
-\xb2\x0c\xdd\x91\x0f\x99\xa8S\xf8\xdd\xb0\xb3\x22\xb7\xddv\
-[\xa1\xcb\xe5\xfa\xbeR\xaab\xd5\xaaU\xf7;S\xe1\
-\xc8\x07\xf2\x00\x94\xa8\xeb\x81/\xe0\xe7\xcb\xfa\x1c\x1dv\
-F\xc4\x11GN\xcf\x8e\x1b\x86\xf1\xdf\xc0\xe8\xd5\xabW\
-_\xe0\x8c\x88#\x1f8\xb8p\xc4\x11G\x1cq\xe4\xe3\
-!\xcb\x96-s\x9d\xca/\xa3:\xe2\x80\x0bG\x1cq\
-\xc4\x11G\x1cq\xc4\x913\x127\xf0\xc339\xb1\xad\
-\xad\xcd\xf3\xe8\xa3\x8f\x16\xde{\xef\xbdG\x9dat\xe4\
-L\xa4\xbf\xbf\x9b\xfa\xfa\xcd\xa4\xa6.>\xa3\xf3\xeb\xeb\
-\xeb\x13\x9ey\xe6\x99q+W\xae,sF\xd3\x11G\
-D\x02\x81Z\x92\x93\xfbIO\x9f\x7f\xd2cC\xa1\x90\
-\x0a\x06\x83FZZ\x9a\xc3:8\xf2\x9e\x83\x8b3Z\
-\xbe\xe9\xf7\xfby\xf6\xd9g\xb9\xf7\xde{\x9dQt\xe4\
-\x0cE\xa3\xd4\xa0U?\xa7\xad\x83\xeb\xd6\xad\xc3\xe7\xf3\
-9C\xe9\x88#\x96\x1c\xb7\x0f\xed\xb0\xb2e\xcb\x16\x1e\
-\x7f\xfcq\x1e~\xf8ag\xe0\x1cyO\xc5\xf9\xf9P\
-G\x1cq\xc4\x11G\x1cq\xc4\x01\x17\x8e8\xe2\x88#\
-\x8e8\xe2\x88\x03.\x1cq\xc4\x11G\x1cq\xc4\x11\x07\
-\x5c8\xe2\x88#\x8e8\xe2\x88#\x8e8\xe0\xc2\x11G\
-\x1cq\xc4\x11G\x1cq\xc0\x85#\x8e8\xe2\x88#\x8e\
-8\xe2\x80\x0bG\x1cq\xc4\x11G\x1cq\xc4\x11\x07\x5c\
-\x9c\x1d\xa9\xadu\xc6\xc0\x11G\x1cq\xc4\x11G\x1cp\
-\xf1\x1e\xca\xab\xeb\x9c1p\xc4\x11G\x1cq\xc4\x11\x07\
-\x5c\xbc\x87\x12\xe9w\xc6\xc0\x11G\x1cq\xc4\x11G\x1c\
-p\xe1\x88#\x8e8\xe2\x88#\x8e8\xe0\xc2\x11G\x1c\
-q\xc4\x11G\x1c\xf9\x18\x83\x8b\x8d\x1b7\xf2\xf6\xdbo\
-\xd3\xde\xde\xce\xbau\xeb8z\xd4\xf9aTG\xde?\
-\xd1Z\xb3y\xf3f\xb6m\xdbF[[\x1b\xeb\xd7\xaf\
-\xe7\xd8\xb1c\xce\xc08\xe2\x88#\x8e|HD\xe9\xd3\
-\xfcI\xcaC\x87\x0e1c\xc6\x8cA\x9f-\x5c\xb8\x90\
-\x9d;w\xfeM\x0e\xe0\xff>\x0c\xb7\xdd\xea(\xd2\xa9\
-\x03\x03PJ^\xf7\xf7w\xd1\xd0\xb0\x85\xe4\xe4sO\
-\xab\x8d}\xfb\xf6q\xe9\xa5\x97\x0e\xfal\xc9\x92%\xbc\
-\xf8\xe2\x8b\xce\x00;\xf27/\xa1P-\x89\x89\x112\
-2\xe2\xff\xe4\xfa\x96-[\xb8\xe1\x86\x1b\x08\x04\x02\x84\
-B!\x92\x93\x93\xb9\xe5\x96[\xf8\xef\xff\xfeog\x00\
-\x1dyO\xe4\xb4\x99\x8b\xe9\xd3\xa7\xb3x\xf1\xe2A\x9f\
-}\xe9K_rF\xd2\x91S\x92\x8d\x9b\xa0\xa5\xe5\xdd\
-\xb51g\xce\x1cf\xcd\x9a5\xe8\xb3\xcf~\xf6\xb3\xce\
-\xe0:\xe2\xc8)\xca\xe8\xd1\xa3\xe9\xe8\xe8\xa0\xbb\xbb\x9b\
-`0H{{;\xd9\xd9\xd9\xce\xc08\xf2\xc1\x81\x0b\
-\x80\xef}\xef{\x03\xafG\x8d\x1a\x85\xcf\xe7sF\xf2\
-c$\xdb\xb7Cs\xf3\xd9i\xbb\xb3\x0b\xc2\xe1w\xd7\
-\x86R\x8a{\xef\xbdw\xe0\xfd\xd8\xb1c\xf9\xc2\x17\xbe\
-\xe0L\xdcY\x90\xae.5\xe4\xe7\xa6\x09G\x8e8%\
-[\x1fU\x19?~<_\xf9\xcaW\x06\xdeggg\
-s\xe7\x9dw:\x03\xe3\xc8\x07\x0b.\xae\xbd\xf6\xda\x01\
-\xf6\xe2\xbe\xfb\xee#99\xd9\x19\xc9\x8f\x91\xb4\xb5C\
-0\xf8\xe1\xee\xe3\xf5\xd7_?\xc0^\xdc}\xf7\xdd$\
-$$PS\xa3\x08\x04\xce\xeeu{z\xd4\xc7j\xae\
-Ov?eej\x98s\x87o\xbb\xafO\xd2`g\
-\x22\xe5\xe5\x06\xa6\xf9\xc1\x8cIo\xaf\xfa\x9bx\xce\xbf\
-\xf3\x9d\xef\xe0\xf5z\x01\xb8\xe7\x9e{HKK{\xdf\
-\xfb\x10\x0eC{\xbbcs\x1dp\x11#?\xf8\xc1\x0f\
-\x98:u\xaa\xc3Z8\xf2\xbe\x8a\xdf\x1fe/\xbe\xfd\
-\xedo3}\xfat\xbe\xf8\xc5/\x0e8\xcaH\xe4\xec\
-^\xff\xe8\xd1\x8f\x97\xe39\xd9\xfd\xc4s\xf0\xa7\x02\x1a\
-*+\x0d\xfa\xcfp\x1f\x98\xce\xce3\x07&\xefV\xca\
-\xca\xd4\x07\x06l\xdeO),,\xe4\xe6\x9bo&;\
-;\x9b\xaf\x7f\xfd\xeb\x1fH\x1f::a\xeb\xb6\xbf=\
-;\xd6\xdf\x0f]\xddg\xa7\xed\x0do\x7f\xc4\xc1\xc5\x15\
-W\x5cAii\xe9\x00k\xd1\xfd.\x06*\x10x\xf7\
-T\xf9\x87\xd2p\x97Ak\xab\x03\x08NW\xaa\xab\xe3\
-;\xbc\xc3\x87\xa3*{\xd5UW\xb1i\xd3\xa6\x81\xe8\
-\xeb\xfd\x90\xb3\x0d^\xdeoy\xb7\xf73\x1c\xc3\x15\x89\
-|p\x00\xe1LE\xeb(\x80\xfd[\x90\x1f\xff\xf8\xc7\
-\xbc\xf9\xe6\x9b\xef)kq:\xf6\x5c\x9b\x10\x0a\x7fp\
-\xba\xdf\xd7\xf7\xc1\x5c\xbb\xa3\x03\xb6n=;m\x1f>\
-|\xf6\xfa}:~\xfe=K\x9a\xbe0L\xa1\xfe\x9e\
-\xbd\xc3\x9f\xbbo?T\xd7|\x1c\x9d$\xb4w\x9c\xfd\
-(\xfe\xe3&MMjX\xc4\x0f\xd0\xdb\x1b\xbf\x1e\xe0\
-lD\x19\x1fu\xf0{&\xfdoh\x88\x1f\xc1+\x05\
-~\xbfb\xe3F\xd7\xc7*0\x88D\xe0\xe8\xd1\xb3S\
-K\xa25g\xcc\xe4\x9c\xady\xce\xc8\xc8`\xce\x9c9\
-\xefi\x1f\xf6\xec\x85\xda\xba\xd3;g\xdf~\xdew\xb6\
-\xa8\xa3\x036o\xf9`\xf4\xcc4yW)\xdc\x93\xf9\
-\xd4x\xd2\xde\x0e\xc7\xaa\xce\x8e\x9f?cpq2\xa5\
-\x1d.\xff\xbac\x87\x0cf<\xe5\x09\x06\xcf\xdcx\xd7\
-\xd4\x08C\xd0\xd6\xf6\x01\x19#\xf3\xec<\x14\xa7\x12\xf5\
-=\xf7\xbc\x5c\xbb\xbf\xff\xfd\x8f\xa8\x0f\x1e\x8c\xef\x88\xdf\
-\x8fH\xa4\xb7W\xd1\xd99\x140\x19^\xa5\xbb\xba\xa4\
-.\xe3t\xe6\xec\xf0a\x83\x92\x12c\x90\x938\xdd\x88\
-\xfc\x83\xa6\xd9KKO\xdfa\xd6\xd7+\xb4\x8e\x0f\xf6\
-\xc2a\xa8\xa9Q\x84Bg\xa7\xcfJ\xbd\xf7\xe3\x19\x89\
-@k\xab\x1a\x16\x00\xbc[\xb0\xd4\xdc\xac\xe2>\x1be\
-eg\xaf\x086\x12\x19\xcc\xec}P\x12\x08@\xff)\
-\x8caWW\x14\x84\xec\xdc\xf5\xfe?#\xc5\x07\xce\x9c\
-\xb9\xd0\xfa\xdd\x81\x83\xfe\x08t\xf7\x9e\x99\x8d\xb5}\xea\
-p\xdf\xc7\x93\xd66(/?\xb3sO\xe6\xe7\x87\x05\
-\x17\xe5\xe5\xf1\x0f\xfc\xfd\x13'\x19\xec\x939\xa3Cg\
-\x87\xae9T\x0aO>y\xfaH\xf9\xbd\x92\x03\x07\xa0\
-\xac\xec\xbdow\xeb6hl\x1a\xfe\x98\xce.\xa8\xa8\
-\x80u\xaf\xc3\xdb\x1b\x05h\xbdgQ\xd6I\xbe\xdf\xb4\
-yh}\xd9\xbf\x1f^y\xe5d\xc6\xf7\xdd\xa5\xd1\x86\
-\x93\x92\x83\x8a\xb6\xb6\xf8\xce\xe3\xe8QEo\xaf\xe2\xe0\
-\xc1S7\xc2\xc1\xa08\xd8\x8e\x0eq\xa4mmj\x10\
-\xd8850\xf6\xee\x8c\xfep\xf74|t&\xecC\
-\xbc\xf4EG\x87\xa2\xbc\xdc\x18\xd6\xa1\xc6KS\xc52\
-gg\xda\xbf\x93\x19\xf0x\xc0\xe2L\xc0\x92\xed\x80\xeb\
-\xea\xde]_\xdb\xdbU\xdc\xbei\x1d\x7f\xbc\xb4\xe6\xac\
-\x01\xb1PH\x80\x8b=\xcf\xa5\xa5\xea\xb4\x1cA\xac4\
-4\xbc?\xe9\x82\xe6\x16(9\x08\xbd\xc7]\xab\xb5U\
-\x80\xc7\xd9\x96\x8d\x9b\x86\x8f\xf0\x8f\x0c\xb37dc\x13\
-|\xfb;\xf1\xbf\xf7\x07\xa0\xbe~\x18p\x11\x86\xce\xb6\
-\x93\xdb\xd8\xe1\xec\xf3p\xdf\x9fL\xce\xf4\xdc\xd3\x89\xa9\
-\x06=\xa1o\xbc9L\xe4S\x02O\xff\x15\xfa\xfc'\
-\xeeS\xb0};\xd4\xc7q\xeeU\xd5QCt\xf8H\
-\x9cc\xaa\xde\x9d\x92\xbc\xfe\xe6\xf0\x08\xef\xdd8]\xbb\
-\xff\xf1\xa4\xcf\x0fO\xfcI\xee\xef\xbd\x5c\xbe\xd9\xdds\
-r\xf4_\x5c\x0c\xc5%R\x14\xd5\xd0\x08\xdb\xb6\xbfw\
-\xd7\xff\xeb_\xe3\x7f\xd7\xd2\x02M-\xc3\xeb\xcbp\x0f\
-\xdd\xfe\x03P\xdf\x10\xff\x18\xdb\xd1uu)jj\xd4\
-\x09\xce0\x1c\x06\x97K^\xb7\xb5\xa9\x81h\xd0fp\
-**\x86v\xfe==\x8a#G\x0c\x02\x019\xf7t\
-\xa4\xb6Vq\xe4\x88\xa2\xabKY\x11\xe2\xe9\x9d\xffn\
-\xa2\x9c\xf2r\x83\x83\x07\x87\xbf^_\xdf\xd0\x11wy\
-\x85\xe2\xe8Q#\xee\x0a\x88\xcaJ\xc5\xcb\xaf\xb8\xd8\xb1\
-\xc3\x15\xf7\xdav\xdf\x8f\x1fS\x1b\xb8\x80\x8c\xf9\xd0\xed\
-\x1bC:\xaa\x83\x07\x0d\xda\xdb\xd50\xcf\x95\x80\x9e\xb3\
-\x115\x9el\xee\xfb\xfb\xe5\x98x\x00\xb2\xaa\xea\xec\x14\
-\x0e\xf7\xf7\x9f9\xf3p<\x80|\xf1%\x83\x86!\x9e\
-\xb1\xa7\xffj\x83\xc1\xf8Q\xe8\xde}\xe2X\xbb{8\
-\xab\xf2\xe4\x9f\xa5\x0f\x8f><8\xf0\xd8\xbb\xef\xbdI\
-\x93\xef\xda=<\x80\x18\xfey\x87W^\x867\xdf\x8a\
-\x0f\x0e\xaa\xaa\xa3\xe3y\x82\x8e\xb5\xcb\xf5OE\xd6\xbd\
-\x1e?\xd8\xaa\xa9\x1d\x9a\xd1\xa9\xaa\xb6\x80l\x0d46\
-\x9e\xd9\xea\xbe\xea\x9a\x13\x01|g'T\x0e\xb3\xd9q\
-c#l9\xc5T\xd2iirk+45\xc9\xe4\
-\x0f\xa2\xb7\xba!\x18\xb2\x95\xfa\xc4\x81\xdb\xbcU\x22\xfc\
-\x0d\x1b\xe3\x0f\xeeK/\x9d\xb9\x12\x99\x1a\x12\xbc\xf1\x9d\
-\xf4\xbe\xfdQv\xe1x4\xb9o\xff\xf0\xac\xca\xba\xd7\
-\x87G\xb7\x81\x80\x8cKk\xeb\xe9\xe7\xc1::\xa1,\
-\x0e[4z\x14\xec>\x89r\x1e:,\xa0f\xa8\xb1\
-\xeb\xe88yMFOO|\xa5n\x19\xa6\x10u\xef\
->(\xde+J\xb8kw4%\xf5\xfa\x1b\xa2\x07\x1d\
-\xedr\xed\xbe>NH]\xb4\xb7@x\x98\xe8\xad\xbb\
-[\xe1\xf7\xab\x81(\xf3\xf8H\xaf\xad]\x00B\x7f?\
-46*\xea\xea\xa2\xcbO\x83\xc1\xa8\x91\xed\xe8\x88\xb6\
-gK]\x9d\xc2\xef\x97\xc8\xb3\xbd]\x9c\xa5\xed\xf8*\
-*NN\xefw\xc5\xb4\xd5\xdb\xa7\xd8\xbf\xdf`\xff~\
-\x83\xb22cX&c8f\xa0\xbb[Q_\xaf8\
-p\xc0\xa07\x0eM\xbaw\xaf\xc24U\x9c9\x94(\
-\xfa\xe8Qc\xc8e\xa5\x81\x80\xb0.uu\x02\xd4\xc2\
-a9\xc7\xbe\xefp?\xb8]:n\xa4\xd8\xde\x0e\x91\
-\x88\xa2\xa9IQY\xa9\xd8\xb7\xcf8\xc1!\xdac\x1c\
-\x0e\x9f\xe8\xf4\xf7\xef7\x88D\xd4\xa0y\xb0\xc1Py\
-\xf9\xc9\x01\x9a\xdf\x1f\xadS\xe8\xe9\x91\xfbP\xa7\x80\xeb\
-\xecq\x19z>\xe27PY)sU^.\xbar\
-\xbc\xb3?\xfe>\xdek\xa6\xc6\xef\x17\xc0W\x5cl\xb0\
-}\xfb\x99\x01\x8d\xae.E\xb8\x7f\xe8\xc8\xd9.0?\
-x\x08\xea\xe2\x04\x84\xf5\xf5PZ*5c\x8d\x8d\xb0\
-k\xd7\xe0\x887\xf6\x99>\xde\xde\xb7\xb6F\x9f\xd9\xa7\
-\xfer\x12\x07^\x0d\x87J\xa2\xc1\xea\x8b/\xc1\xbf\xff\
-\x08j\xeb\xe1\xd9\xe7E\x97\xde\xcd2\xd5\x97^\x16\x16\
-\xe6\x0fO\x0c\xee\xeb\xf1\xe3\xd2\xd0 ~\xad\xbf_\xd8\
-`\xfb9\x14\x90\x19\xbf\xfd^\xff\xf0\x05\xfb\x91\x88\xb4\
-\x1bO\xec~\x1c:|\xe2sc\xf7u\xfd\xfa\x13\xeb\
-t\xda\xdb\xe1\xf0QI\xc9\xbf\xf1\x06<\xfb\x1cC\xa6\
-\x88O&o\xbc! j\xe0~z\xa1\xa4\x046\xc7\
-\x01d\xc7\x8e\xc1s/@k\xbb\xe8\xc5\xcb\xaf\x9c\x22\
-\xb88x\x08\xea\xea\xa3\xd1w\xdc(\xdc\xca7\xbf\xfe\
-\xc6\x89\xc757\x8b\xc2\xf6\xf6E\x97\x17\x99\x11(9\
-\x00G\x8fBRb\xf4\xd8m1\x1b5ELIk\
-\xd8m\x1e\x8f\xa4^z\x19\xca+\xa4\x8fC\xa2H\x13\
-\x86\xdbj\xa3\xab[\xe8\xb7\xeenx\xf5\xb5\xc1\xfd\xee\
-\xe8\x10fc\xcb\xd6\xa1\xef\xd9\x1c&B\xf9\xc9OE\
-y\xfc~i\xdb4elJKO-\x7f\xb8g\x0f\
-\xacy8\xce\xc4(\xc9\xcb\x0d'A\xcbA\x0c\x95\x12\
-z\xfd\x0d\xd8_<X\xd1\x8f\xafK)+\x97z\x95\
-!\x8d\xba\x85\x84kj\x04=\xbf\xf3N\xf4\xbb\xa6&\
-\x19\xd3\xeaZ(Z-\xe8\xfd\xf9\xe7\xe5!-\xaf\x90\
-\xbf\xd7_\x97\xfb;P2\x04\x85\x1b\x16}\xf8\xcd\xaa\
-\xc1\xfb,TV\x8a\xc3\xd6Vt\xd9\xda*N\xf5x\
-\x90\xb4e\x8b\xc1\x81\x03\xc6\x80A\xee\xe9\x11p\xd0c\
-E\xe7\xd5\xd5\x06--\xe2@7o\x1e\x5c+aS\
-\xc8\xa1\x10\xd4\xd5+jk\x0d\xeb\xc1\x1a\xbaxQk\
-\xe8\xeb\x93H\xb5\xbcL\x81\x12\x87\xec\xf7CK\x8bb\
-\xfb;\x06\x86!y\xf6x\xec@o/\x03\xb5\x0b{\
-\xf6\x0cv\x18ee\x8a\xd7_w\xb1k\x978a\xdb\
-166\xaa!#\xed\xe3s\xf6\x15\x15\xc2\xa6\x1c9\
-2\xf8\x98\x81\xe34\x1c8\xa0h\xef\x80\xe2\x03\x06{\
-\xf6\x18\x1c;\xa6\xd8\xb0!\xcaTx<\xe24{z\
-\xe4o\xf3\xe6\xe8w\x113\xea\xf4\x9a\x9a\xd4\x09\x0cE\
-\x9f_\xb1i\x93\x8bc\xc7\x0c*+\x0d\xea\xead\x0e\
-\xfb\xfa\xacs\x9a\xe5Y\x18j\xc9\xeb\xa9\xd4\xad\xd4\xd7\
-G\xc7\xb5\xbf?\x0a\x98\xfb\xfa\x04<\x94\x94\x18tv\
-\xaa\x13\xda}\xe3\x0d\x01\xa0MM\x8a\x9d;\xa3s|\
-\xb2\xeb\xda:`\x1fSU\xa5hhPtv\x0a\x88\
-=\x95\xa5\xc8v\xdf\xe2\xe9\xc2\xc9\xa4\xb7W\xd1\xdb'\
-\xe0\xf9t\xea?z{\xa1\xb8\xd8\xa0\xb8\xd8@\x9b\x8a\
-\xa7\x9f\x19\x9c\xdex\xe1%\xb9\xaf\xe6f\xa1\xf5+*\
-%\xe8\xb2\xed^K\x8b|\xff\xeak\xf2\x8c\xd6\xd7\x0b\
-\xd3x\xac*\xca\x8a67\x0f\xae\xa9:\x1e\xa0\xbc\xf8\
-r\xd4\xa1\xee\xdcqr\x8a\xfd\x95W\xa1\xba\x1e^{\
-]\xecXM\x0dtu\x88\xfd\xf8\xb7\xef\x8b\x8d]\xf7\
-z4\xd8\xd9\xbf\x1f\xd6o\xb0l\xcc\x1b\xe2k\xb6l\
-\x8d\xda\xf2\xd8\xf1\x0a\x87%\xb8\xfc\xc1\x8f\xac\xe7\xa2B\
-\xfe\xbf\xfa\x9a\x04 \xdd\xdd\xd2\xc6\xf3/\xc2\x1f\xfe$\
-i\xde_\xffZ@U\xac/hm\x8d\x8e\xdb P\
-R{|\xa0\x00\x81`t\x9c\xfc\x81\xf8\x01\xb5\xdd\x0f\
-\x80\xda\xaa\x13\xfd\xc5\xd6\xedR\x1fa\x8f\xe5\xc3\x8fD\
-\xdb\xd5Z\x9eK\xfb\xf9|\xf9\x15\xf9\xac\xac\x5c\xe64\
-\x9e\xbd\x1f\xe4;B2\x8e\xcf<\x17\xf5\xb1\x95\x95P\
-zX\xfar\xbc\x7fon\x86\x9e^h\xac\x17=\xdb\
-\xb8I\xf0\xc2\xf1\xf2|L\xc1\xa7\xd1\xd1\x11\xdd\x92\xb9\
-\xbb\x1b~\xfb;\x99\xe8\x97^\x1e\x8c\x86\xca\xca\x84\xca\
-\xfe\xc3\x1f\xc5\x98?\xb1V\x00\x84\xdd\xd8\xee=\xf0O\
-\xf7B\xc9!AD\x8f\xfd6F\x89\xcc\xc1\xd1\xfa\xfe\
-b\x08\xf8\x05%\x81(zu5\xbc\xb5^\xfa\xf1\xda\
-:\xa9\xe2\xfd\xdd\xef\xe1\xb1\xdf\xc9@\x1f92\x98\x8e\
-\xd9\xba5\x8a\xe8\xc2a\xc9\xdf\xc5C\x99\x9b6\xc9o\
-\x80\x14\x1f\x10\x87\x08\xb0\xf6\xa9\xe8\x84\x86\xc3\x82\xe0~\
-\xf1\xab\xa1\xd3\x1e\xe5\xe52\xf0\xc7\x03\x83\x9d\xbb\xa4(\
-\xe7X\x95\x8c\xe11KIn\xbeU\x8c\xe0\xc6MP\
-u\x0c\xd6\xad\x83\xa25\xb1\x91\x85\x1c\xd7\xda*Q\xfe\
-pT\xf7\xf1Q\xa2\x0d\xda\xf6\x17\xcb\x84\xb7\xb6\x0a\x08\
-\xe9\xe8\x88\xaeL\xd9\xbb\x0f~\xf6+A\xbf\xa1\x90(\
-\xb1\xdf/\xeb\x9f\x8fU\xc9_\x7f\xbf\x9c\xbbaC\xd4\
-\xa8\xc6V\x11\xd7[\xe3\xf4\x9f?\x91\xb4\xd731\xe8\
-\xf8\xb9\x17\xa0\xf4\x08l\xd9$\x0a\xfd\xf4_\xe1\x7f\x1f\
-\x15\xa3\xd3\xda\x01%\xa5\x82\xae\x9f}~hf\xa4\xb3\
-]\x8c\xd2\x1bo)JJ\x5c\x03\xce\xa1\xb1I\x9c`\
-[\xabb\xc7\x0e\x03\xbf\x1f\x0e\x1eT\x83\xaa\xf7#\x11\
-\xf9\x0b\x04\xe4\x9e\x02\x01\xd9)\xb2\xa1AQZ\xaap\
-\xb9\xa4\x1f\xbd}\xe2\x10\xba\xbb\xc5)\xd4\xd4\xa8\x81\x0d\
-\xa1\xec\xe2\xe2\xce\xce\xc1\xec\xce\x91#\xc6\x09\xf9rY\
-=\xa0\x08\x04\x14\xfd\x11\x01\x14\x87\x0e\x1a\xa0\xc5@\x85\
-B`\x18z\xc0\xa1\xed\xdci\x0cD\xb7\xb1m\x07\x83\
-\x92\x03ol\x14\x07n\xaft\x09\x87\xa3\xe9\x1c\xfbu\
-8\x1cuB\xf5\xf5\x8a\x80u\x1d)F<\xd1\x19\xbe\
-\xfc\xb2\x8b\x9e\x1eac**\x14\xfb\xf7\x8bC\xb4\xa9\
-\xd2\x9e^q\xd0\xfd\xfdR\x1bQS\xa3\xf0\x07\x14\xc7\
-\x8e\xc9\xf8\xf4\xf5)z{%O_Z\xaa\xa8\xad\x1d\
-<\x06M\xcd2\x96\xa1\x90\x18\xb1c\xc7\xd4 \x0f\xd1\
-\xd9\x19\x8d\xfe\xda\xda\x15\xbbv\x19\xd4\xd6\x1at\xf7(\
-BAEu\xb5\x00E{\x5c\xb45v\xb5\xb5j\xd8\
-\xd5\x13\x0d\x8d\x92\xf2\xaa\xacT\x03\xce\xc8fp\xca\xcb\
-e\x1c\x0f\x1c0\xd8\xb5\xeb\xc4\x08\xbf\xb9E\x18\xb0\x92\
-\x12\x83\x8aJ\x01\x9a[\xb7\x9e\x9c\x09\xb0\x9dS\x9f_\
-\x0d\xe8ZE\x85\xc1;\xef\x18\x1c;f\x9c\xd2\xae\xa4\
-\x07JT\x5c\xb0z\xf4\xa8\x11\xf7\xbe\x05\xa0Y)\x17\
-\x0d\x95\xc7\x0c\xb6ow\x0d0rv:/\x1ep9\
-r\xc4\xa0\xa6V\x0d\x14\xacn\xdf\x01om\x18l\x07\
-5\xf0\xcc\xf3\xf0\xcb\x87\xc49\xb4\xb5Kzb\xcf\x1e\
-\xb1\xb7\x7f\xf8\xa3\xd8\xbc\xceN\xf8\xe3Z\xeb9}S\
-\x98g\x10\x1bc\x03\x8a`P\xd2\xa3]]\xf2\xd7\xd1\
-\x01=]\xd2\xcfW^\x93\xf7'\xab\xdd\x08\x87E\xb7\
-\xb7m\x95kFL9\xaf\xabK\xfa\xbf\xed\x1dX\xfb\
-$\xfc\xf0\xdf\xa5\xcd\xc6&\xe9Ky\xb9\x04.\xe1\x10\
-\xfc\xf1O\xb0\xfd\x1d\xa9;\xeb\xe8\xb0\xd2*\xd5\xd2n\
-K3\x94\x1e\x10{\xf4\xda+\xb0c\xa7\xa4|v\xee\
-\x82W\xd7I\xcdZu\x15<\xf2\x88\xa4\xb7K\x0e\xc9\
-\xfd?\xfd\x8c\xd8o\xad\xe1\xcfOKz\xe4\xe5Wc\
-\xd8\x83\x8e\xc1~m\xdf~9~\xebV\xb9\xf6\xcb\xaf\
-\xca5\xfb\xc3b\x87\x87\xd2\x85`\x08^~\x19\xfe\xf8\
-WaL\x8e\x07.\x1b\xde\x86uo\x88o\xdd\xbdK\
-\x80\xc3\xc3\x8fF\x9f\xfb\xae.\x01\xef\xe1\xb0\xdc\xf7C\
-\xbf\x91\xff\x1d\x9d\x12\x0c\xae\x8f\xb3\xdf\xc5\xd3\xcf\x08X\
-\xac\xaa\x86\xe2\xfd2\x0e\xaf\xbc&~w\xfd\x06\xb9\xd7\
-\xb7-\xf6\xe2/\x7f\x81W_\x1d\x1c\x04\xb7\xb7\x8b\xaf\
-\x06\xd8\xb7O\xca\x1a\x02\x01\xb1\x01om\x14_\xbdq\
-\x13\xb8_|I\x0c\xd6\x84\x09\xa2l\xe5\x15\xb0\xf6i\
-\xf8\xf2\xe7E\xe9n\xfd\x9aTm74\x82\xab\x04\xea\
-j /\x176m\x84\x8b.\x88*O]-\xec\xd9\
-\x0fS'BN\xb6\xa0\xcd\x1d;e\xa2\xed\xdc^K\
-\x8b8\xaap\x18RSdB\xdcnqd\xbd\xbd\x90\
-\x91!\xffw\xed\x04o\x22\xfc\xf6\xb7\xe0M\x82\x96&\
-hm\x81\x0d\x9b\xe1\x9c\x850o\x9e\xd4o,\x5ch\
-]\xbb\x11~\xfb{(\xc8\x87\x9b\xbf\x08YY2!\
-\xd3\xa6J\x84\xbdg\xaf<T-\xad\xd0\xda\x1cu\x90\
-\x7f\x7f\x93\x00\xa6\xa7\xff\x0a\xc9I\x12\x91\xfe\xee\xf7p\
-\xe3\x8d\xd0\xd7\x0b99\xa2\xc8\xe9# ?\x1f\xc6\x8f\
-\x8f\x89\x18+\xa5_\xda-\x88\xee\x91\xc7\xa0\xa9\x11n\
-\xb8\x0ev\xed\x10\xda\xe8\xc0\x01\x982\x05\x1e\xfd-t\
-\xf6\xc2\x82y\x82f\xd7\xad\x83[o\x11`a\x1b\x8a\
-\xceN\xf0z!))z\x8d\xe7^\x82E\xe7\xc8\xb5\
-\x0dC\xe6\xe1\xf0\x11\xa97\xd8\xb5K\xc0\xc5\xb6w\x04\
-\xbd?\xf3\xacD\xa0\xff\xf09x\xea)\xa8,\x83\xce\
-\x05\xf0\xbb\xff\x13p\x91\x95)F\xe1\xad\xf5\xe0qC\
-\xde(\x19\xff\xe4dxg\x07\xcc\x9e\x05\xf7}\x13\xee\
-\xf9'\xe8\xea\x81`\xbf\xccmu%l\xf6\xc8\xeb\xff\
-{\x02n\xf7As+D\x14\xf4uAz\x06\x1c)\
-\x831y\xd0P\x0f\xc9ip\xb8\x14\x9e\xb7\xaa\xee\xd3\
-\xd3ad.x\x5c0g\x8e\xe8\xc2\xf6\xedp\xe5\xa7\
-\xe4\x01ik\x93Hw\xf1\xe2\x08\xc1\x80\xa2\xb9Y\xc0\
-@[\xbb8\xbc\xdaZ\xc5\xe812H;v\x18\xb4\
-\xb6*\xc9M\xe4?\x00\x00 \x00IDAT\xb4)\
-zR]\xa3\xe8\xeb\xd3\xf4\xf4X\xc5l\x81\xc1\xd1\xeb\
-\xe1\xc3\x06u\xf5\xb2\x5cr\xcc\x18MU\x95\xc2\xed\x8e\
-\xd2\xb6\x11\x13\xca\xca\x15\xa1\x90Ab\xa2\x1c?}\xba\
-Il\xd9\x92\xd6\x92F\x09\x85\xc1\xe3Q\x04\x03\x10\x0a\
-\x02\x8aA\xd1p8,\xab\x10\x9a\x9b\x15\xd5\xd5\x9a\x8b\
-.2\xa9\xa8P\x8c\xb1\xfa^Y\xa9\xc8\xce\x96cK\
-\x0e*j\xaa\xe5\x9e;:\x15IIb(\x1a\x1b\xc5\
-\xb1(\x05\x81\x80\x22\x14\xd2\xe2\x90\xb5\xa2\xaeN\xc6\xaa\
-\xbb[@\x81\xcb\x05\xe3\xc6i\x01N\xb5\x8a\x8ct\xcd\
-\xe1\xc3\x06\xe9\xe9\x9a\xfaz\x012\xd9\xd9\xc6@\xdf\x0c\
-C\xfa\x1d\x0a\x09m\x9e\x96\x06\xb5u\x02@<n\x89\
-\xb8d\xe5\x87\x80\x88\xba:\x01\x19\x81\x80\xa2\xb3CS\
-V&\xce\xba\xaf\x0f\x0e\x1d2\xc8\xcf\x8f\x0c8\xfc\x9e\
-\x1e\x01^\xa5\xa5\x06s\xe6\x98\xf4\xf4H\xc4}\xe4\x88\
-D\xe0\xbd\xbd\xd0\xd9\xa5x\xfbm\x83\x85\x0b\xe5\xfb\x92\
-\x83\x06n\x17\xec\xdci0o\x9eIb\xe2\xd0\xe9\x0b\
-\x7f\x9f\x18\xfb\x193\xa4\xff\x9d\x9d\xe2\xec#\x11(.\
-\x96\xf6S\x03\xc2`\xf4\xf6B~\xbe&\x18\x14\xf6\xe0\
-\x85\x17\x5c\xf8\xfd\x90\x90(cWW\xa7\xa8\xa80,\
-*\x5c1b\x84\xc6\xeb\x95\xf1v\xb9l\x1b%st\
-\xe4\xb0\x1ax\xde\x8f\x1cU\x98\x11HI\xd545\xc3\
-\xb4i2\x8e\x0d\x0d\x8aq\xe34\xa1\x90<\xbb\xb1)\
-\x99\xf2rE~>\x8c\x18!\xf3o\xb7\xdf\xdf/\xa9\
-\xa2\x9c\x9c\x08n\xf7q\xa9\xc8\x16\x01\x18}}\x1a\x97\
-[tb\xf7n\xc5\xe8\xd1\x8aQ\xa34o\xbd\xe5\x22\
-%\x05.\xbc0\x82R\x02|jj\x14\x85\x85z\x00\
-\x08\xdb\xf6$b\x8a\xa3\xff\xe5\xaf\xe0\x92\x8bD\x07\xf6\
-\xec\x86\xb1\xe3\xa0\xb6\x12j*d,\x8fU\x8b\x13\xda\
-\xb3\x0f6m\x80\x1b?+\xd1kJ\xaa\xd8\xb3\xd5k\
-$\xe8\xa8\xaa\x86\x05\xf3\xc5\xce\xed\xda\x09\xbf\xfc\x858\
-\xbag\x9f\x01\x7f\x1f\xcc\x98.:&\x00\x0a6m\x11\
-\xfb\xb8\xe6\x7fa\xc5\xf2\xc1v\xcd\x16\x97\x1b:\xfd\xc2\
-\x0e\xeb\x88\x80\x83\xba\x06\x88X\x1bLE\xb4\x80\x83#\
-\x15\x90\x9a$\x0e,o\x14$%H\xb0\xb7y3\xcc\
-\x99%E\xfd\xdb\xde\x110\x1f\x89\xc0_\x9e\x81\xbb\xef\
-\x92\xb1\xe8\xea\x94\xf6\xff\xf3\xc7\xc2(\xff\xf1O\x02J\
-\xde\xde\x04m-\xd2g\xef!\xa8\xa9\x13\x87h\x18\x02\
-T6m\x86\xa0_@\xc4\xf3\xcf\xc3\x85\x17\x822\xa4\
-\xce\xad\xb9E|\xa3Fl\xef\xc3\x8fBZ\xaa\xe8i\
-I\x09\xfc\xc3\xe7\x851ys=|\xe5K\xf0\x9b\x22\
-\xb8\xe8B\xb1\xcf\x86!\xf7\xb6o\x9f\x80\xb3_\xaf\x12\
-`Q\xf4\xbf0a<|\xea\x0a\x18;&\x1a8\xb5\
-\xb6\x8b\xaf\xe9\xe8\x90\x1a\x89\x8a\x0a9\xaf\xa5Qj\x0d\
-\xcf]\x00\x1d]\xf0\xd4\xd32/S\xa6\xc8\xf3f\xa7\
-\xa4n\xbc\xe1D\xb6\xf0\x99\x17 %\x01\xc6\x8c\x81\xbf\
-\xfcU\xda\xaeo\x80C\x87,\x92\xa1\x13Z\x9f\x85\x07\
-\xbe\x0b\x07\x0e\xca}n\xdd\x06\xe7-\x89\xa6l\x8eU\
-A[\x07\xa4\xa4H`\xbed1<\xfa\x184\xb5\x89\
-\xef\xdb\xba\x1d\xdc\xed\xed\xf0\xec\x0b\xe2\xec\xbb\xbaD\xe1\
-\x1a\x9be\xa9\xca\xf3/\x89\x83\x9d;[\x06$T\x0d\
-a\xab\xe3\x9dV\x11aU\x15\xe4\x8e\xb4\xf2\xbbA\xb9\
-\xf9\xd7\xd7\x8b\x03z\xe1E\xa9\xb7\xe8\xec\x12e\xaf\xa9\
-\x83\x1f\xfd7\x5c\xb0T\x10\xe7\xd1r8X*J\x9c\
-\x96&\x8a\xd1\xdd\x0dO\xfdY:\xe9uAc;\xf4\
-v\xc8\x0dT\x95\xc3\x8f\x7f\x02\xdf\xb8\x176n\x86\x1b\
-\xae\x17\x10\x11\x89\x08\xbd\xbfo7\xec\xdb+\xe0#\x10\
-\x14\xf4\xe6\xb1\x9cI[\x07\x1c:\x08\x9b\xdf\x11\x00Q\
-V\x06\xdfy\x00\xfc=\x82\x82\xa7N\x11\x1a\xe9\xe1\xdf\
-\x8a\xb1y\xe1%\xb8\xe5\xab2\xb9\xeb\xdf\x96\xfe]x\
-\x81(H0(\xf7\xd3\xdc\x0cx!-\x09\x02}\xf2\
- |\xe3[\x82h\xff\xe5[PUk\x15\xc8TC\
-J\x1a<\xf9\xb4Pxi\xc9\xf0\xce.\x99\xc4\xdc\x5c\
-\x19\xa7\xad;`\xc1\x1cyH{{e\xbc\x0f\x94\xc0\
-\xbf\xfc+L\x9f&\x0f\xe7\xc4\x09\xf2\xdds/BM\
-e\xd4\x90\x84\xc32\x99\x98\xe0\xbb\x13\x1a\xea\xe4^v\
-\xef\x86\x97\xdf\x80$/<\xfe\x07y\xe0'M\x90y\
-\xdb\xb9\x03\xe6\xcc\x86\x82Bxg\xa78\xfd#e\x92\
-\x9f\x9c8\x19\xb6\xed\x9418P\x02\x1d\xdd0e2\
-<\xf8C\xf8\xe2?\xc8X\xda\xc6\x0c\x05\x8d\xad\x02.\
-\xfaz\x05\x5c46BC+d\xa5[9\xc5R\x18\
-7V\xf4\xe0\xb1\xdf\x81\xbfW\xc0\x85]/\xd3\xdf\x0f\
-\x87J\x0dJK%\xa2w{\xe4\x9e\x82A\xd9K\xa1\
-\xb1A\x0c\xfe\xc6M.LS\xe6\xb4\xab[\x8e\xa9\xab\
-W\x18\x0a\x12\x135\xa1\xb0\xa2\xbdM\xce\xd3\x88\xd3\x0d\
-\x06%\xf50u\xaaI[\xbb\x221Q\xae\x95\x9a\x0a\
-(Mm\xad\xb4\xbfx\xb1Ig\xa7\xe8J\x7f\xbf0\
-\x0660\xb0S\x03\xc1\xa08\x91\xaenq\xee\xed\x1d\
-\x02\x90\xca\xca\x0c\x8e\x96\x19\xa05.\x17T\xd7\x18\x94\
-\x95i\xca\xca\x0d\xfc\x01Mo\xcf\xe0\xfa\x04\xc3\x80\xaa\
-jE$\xe2\xa2\xb1\x0923 \x14RT\xd7\x88C\
-\xcf\xce\xd6\x1c*5hj\x92\xf4\x88i\x150\xee\xda\
--\xe0\xaa\xa5\xc5Er\xb2\xc64M\xf6\x17\x1b\x03\xc5\
-\x85\x0d\x0d\xc2Xt\xf7(\x0cCSZ\xaa\xc8\x1b\xa5\
-\x07\x96\xceVT\x1ax=\x90\x94\xa4\x89\xf4\x0b\x9b\xa2\
-\x940=\x9e~\xa8\xaa205$'i**\x14\
-U\xd5R\xcc\xe9OP\xd4\xd6\x8a!M\xe8\x06\x10\xf0\
-\x101-&\x09yfzz\x15\xe1\xb0\xa2\xcf/z\
-\xda\xd3#\xd1{C\x83\x05\xcaB\x02\x167nt\xa1\
-\x948\xde\x83\x07\x0df\xcc\xd0$&\xea!R\xa22\
-\x7f\xfer\xc5\xbe}\x9a\x8a\x0a\x83\xceNHL\x94\xe7\
-{\xe7.\xd9c#9\x096n\x12\x00\xd0\xde\xaei\
-n\x96\xd7\xf5\x0d\x0a\xac_\xe1}\xf3-\x17\xadm\x8a\
-wv\x08\xb3\xb4\x7f\xbfAF\x86f\xcc\x18MB\x02\
-ddhI\xa34+\xb4V\xb4\xb61\x00\x1c\xfaz\
-\xc5)\x14\xef7\x08\x06eN\x1a\x1b]$'Co\
-\xaf\xa6\xbd\x1d\x0a\x0a5\xa3G\xe9\x81`KV\xb3\x98\
-\xe4\xe6\xca\xb9\xb9\xb9z \xe2ljR\x03@\xcc\xae\
-\x1f\xe9\xe9\x91\xb9\x8fD\xc4\xb1\xb4\xb6\xc9\xd8uv\x09\
-\xa8\x0b\x85\xe0\xe0!\x83\xa9SL\xc2aHH\x80\xbd\
-{\x85i\xf3zM23\x07\x8f_[\x9b\xd8\xdb\xaa\
-c\xf0??\x93\x14Gq1$&\xc1\xf8\x02\x8bA\
-\xed\x805\xaf\xc0\x8e}0*G\xae{\xe8\x10\xd4W\
-\xc3n\x05.\x05\xed\xad\xd0\xdd'u\x01\xbfY\x03\x15\
-e0>_\xa2\xf3\xdf\xfdQ\x98\xcb\x84\x8d\xe2\xdcg\
-\xcf\x84\xf66\xb1O\x85\xf9\xe2l\x9fyN\x80\xe1\x95\
-W\x9c\x08.\xda:E\xf7\x02=@644\x89\xd3\
-lm\x85\xbaj\xf0&\x88\xbdu%CS=\x04{\
-\xc1D\xc0\xe2\xf9\x8b\xe1\xd0\x11\xb8\xf7[\x90\x93\x09\xcd\
-\x0d\xf0\xd7ga\xd6,aa\xca+$\xc5r\xe0\x80\
-\x04\xa8;v\x0aS\xb0a\x830\xbdM\xad\xa0\x22b\
-+\xeb\x9a\xa0\xbbC\x82\xcf\xcenx\xe4Q\xb9\x0f\x7f\
-P\xecU_\xaf\xdc\xab\xdb-Asq1\x8c\x1e\x0d\
-ad\xbc\xb6\xed\x80\xbc\x91\x12\xd4vu\x89O\xdc\xb2\
-E\x18\x9277\x88\xdd\xfb\xcb\xd3\xc2\xba\x5c\xffiy\
-\x96\xef\x7f\x10\xdc\x09VJ\xbd\x056\xbc\x01\xeb\x0da\
-\x0ff\xcf\x14\xbf\x99\x91%5j\x91~X\xbfQ\xe6\
-\xa1\xb1I\x18\xf8@\xaf\xf8\xcei\x93d\x1e_y\x19\
-\x9a\xdb\xe0\x89?\xc0\xe2\xf3`\xf36\x01<\xfb\xf6\xc1\
-\xdc\xb9\xe2\x9733%Hlk\x85\xa4<\xb1\xe3\xcd\
-\x0d\xb0~\x0b\x14\x8e\x03\xb7G\xc6,-E\xc6\xea\xe7\
-\xbf\x84\xcd\xdba\xd2\x14\xd8\xb6K\xfc\x83\x9d\xfe9V\
-)\xfek\xc64aAv\xee\x12\x1f|\xf4\x08\xacJ\
-\x96\x80\xde\xe5I|\xe0\x81M\x9b\xc4\x99'%BM\
-\xb5(WU\x9d\xd0\x1f\x07\x8f@0\x00\x1b\xb6\x891\
-mo\x85\xda\x06\x89\xc0K\x0fJ\xa7\xb7\xef\x92cZ\
--f\xa0\xb9M\x1e\xa2\x96F\xa8o\x82\xde\x1eA}\
-\x8dMr\xb3\xfb\x0f\xc0\xeb\xafA\xf51)\x8a9V\
-)\x88\xab\xa2J\xd2!55\x12y\x1b\x1e\xa1\xd0\x83\
-~1 uu\xd0\x1b\x96\xc9[\xff&4\xb6HT\
-\xde\xd1\x06\xcd\xedPY\x03G\x0e\x0a\x18\xa8:&\x13\
-\xe2q\xcbu\xbb:D\x19\xcb*\xe1\xc9?Ab\x1a\
-l\xdf\x06\x15\xe5\xa2\x14\xd9\xd9\xb0i\xab\xa0\xb8\xaa\x1a\
-\x19\xa4W^\x15%\xcc\xc8\x10\xd4\xdb\xd6n\x0d\xde*\
-\x19\xcc\x03%\x10\xea\x07\x8f!\x81lC=TT\xcb\
-\xc3\xd2\x15\x80\xb2\xc3p\xb8\x5c\x94\xa9\xb3C\x0a\x98\xf6\
-\xee\x86\x82\xf1\xb0\xafX\x0ad\x12\x12`o1\xec\xdf\
-\x0b[\xb6\x09\xb0\xfb\xfd\x13Bm\xed\xda%\xa0\xef\xf0\
-a\x89\xf6_{KR\x11o\xac\x83\xec\x1c\x99\xa3\x82\
-\x02\xb9\xaf\xe6ZI5UT\x8b\x13\x0c\x04A\xb9d\
-\x9e\x9a\xdbd\x1c\x03A(?&s\xd6\xdb\x01\xa3\xc7\
-\xc8\x9c\x96\x96\xc2S\xcf@w;\x94WJ\xbe\xcd\xb0\
-rxG\x8f@?\xd0\xd3\x0d-\x9d\xa0\xfb\xe1\xad7\
-\xc1\xed\x85P@X\x95\x8aJHL\x90v\x92R\x04\
-\xc4\xb9\xbc\x02J\x9a\x9a\x85\xd2\xeb\xea\x82\x87\x1e\x92U\
-E\xeed\x89Z<\xae\x10\xe3\x0b\xea\xe8\xef\x1fC\xf1\
-\x01\x17\xc1\x80\xd0\xd1.C\x0c\x80\xd6\xe2\xc4ZZ\x14\
-S\xa7hv\xed6\xf0x\xecB?1\xc4\xc1\xa08\
-\xb8\x04\xaf\xf5\x99\xa9\xe8\xed\x13\xaa\xbf\xa7[\x1cs\x9f\
-_1k\xa6\xa6\xb8X\xf2\xf0\xfd\xfdB[\xfb\xfd\xa2\
-\xa7\xed\x1d\x8a\xf6\x0e\x83PH\xce\xeb\xe8Pl\xd9j\
-\xd0\xd5\xa5hh\x10\x03n\x039\x97\xcbb\x01B\x10\
-\x0e\x8b\xd1\x97\xad\xaa\x85\x15\xe9\xeb\x13\xe6\xa5\xb9\xc5\xa0\
-\xb9Y\x18\x84\xfa:\x83\x84\x04\xa1\xb4kj\x05\x98\xb4\
-\xb6\xcaJ\x17\xbf_\x91\x90\x00\xdd=\xf2\xbe\xbd]Q\
-['\x0e\xd0\xdf'\xecL$\x22\x86-\x18\x14 \xd4\
-\xd2*\xd4wu\xb5\x1a\x00\x09\xc9\xc9\xe2D{\xad\xeb\
-\xa3\xa4-\xd3\x94v\x07\xfa\xdc/\xf7\xd0\xd9\xa5\xac\x82\
-dqb^\xaf\xf4\xc14\x05$tw\x19\x02\xa8,\
-\x96\xc7\xed\x86@P\x01\x8a\xaen\x85\xbfO\xc0\x87M\
-\xf7\x9a\xa6\x5c\xbf\xb5U\x00\x81\xa1\x14\xcd-2\x7f\xa1\
-\xa08\x0a\xad\x15U\xd5\xd2\x1f\xa5\xa4M\xb7K\xc0B\
-S\x93D\xfb\xa9\xa9\xd2\xbf\xfd\xfb\xa4\xed\x9e\x1ei\xaf\
-\xba\xda\xa0\xa9Y\x98\x14\xad\xe5\xde\x82Ak\xcf\x11k\
-\x0e\xb1\xaf\x19\x92{\xd0Z\xfa\x15\x0a\x0b\xc3\xa45D\
-\xfa\xd5\xc0\xb6\xcb\xe9\xe9\xf2\xfc\x1d=jP_/\xa9\
-\x9c\x8a\x0ac\xe07Q\x92\x92\xa0\xbdM\xee7`\x01\
-1\xbf_\x11\x0aB}\xbd\xf4\xe7\xe8Q\x03\xbf_\xe6\
-\xcc\xdf\x07\xaf\xbf\xee\x22\x10\x14f\xa8\xbd]\xe6\xa5\xb3\
-S\x00c(\xa4\xd8\xf0\xb6\x8bqc5\x87\x0e\x19\xe4\
-\xe4hJ\x0e\x1a\xf4\xf5\xc9\xca\x98\x83\x87\x0c\xfc\x01\xb9\
-\xff\xde>\x99\x0bS\x8b\xfe\xb7\xb5*j\xebD?]\
-.a\x9f\xb6l5\xe8\xf3+\x9a\x9aDW\x1b\x1b\xe5\
-\xfb\x9c\x9c.\xaa\xab4\x9b7\xe6\x12\x0aJ\xaar\xcf\
-n\x01\x18\xf5\x0d\xd0\xde\x09-\xed\xf2~\xdb6\xd1\xe7\
-\x96za+j\xab\x85QMI\x11{\xe6\x0fAK\
-\x9b\xd8\x96\xa3G\xac\xc8\xb6K\x9c\xf0_\x9e\x94\xcf=\
-^\x88\x84$U\xfb\xcen\xd1\xb3\xa6z\x08\x84\xc4'\
-\xb4w\xda\xf5 V\xfd\xc66\x01\x08\x0f\xaf\x81\x9a*\
-a-\xd23\x84\x11HI\x95\xe3\xfd\xdd\xd0\x1f\x92\x00\
-\x221U^77\x88\x1din\x14\x07w\xb8T\xfe\
-\x8f\x19#\xc1fU\x0d\xec\xdf',\xf7\xd1\x0a\xf1\x13\
-\x0d\x8d\xa2\xf3\xca-~\xa2/\x00\x91\xb0\xd43tu\
-\xca\xfd\x05\x03\x10\xea\x83\xd4T\xa88\x226\xab\xb3S\
-j\xda\x22\xfd\xd2\xaf\xda*\xb1\x83GK\xa1\xb5\x09\x9a\
-\x1a\xc4g\x14\xe4C\xf1>8P\x0c\xc7j\x05\xd4m\
-\xd8 6\xbb\xb3S\x80@S\x8b\x8c\xe5S\x7f\x16\xb0\
-\xf4\xd8cb[SF\x08\xc0ji\x80\xe4\x14\xf1o\
-\x07\x0fZ\xfe\xaf\x02\x92\x13\x85\xadHM\x81\x1d{\xa0\
-\xf4\x10t\xf5\x0aH\xd8\xb8I\xc6x\xd7n\xa99l\
-k\x91{)/\x83\x1e\xbf\x04W.\x13L\x03\xc6\x8c\
-\x86\xef\xff\x87\x041\x1b7\x8a_\xcc\xce\x86\xaev\x99\
-\xeb\xbc1b\xef\xdd^h\xac\x83\xa4d\xe8\xea\x83\xb7\
-\xde\x96\xffG\x8e@}\x8d\xccK}\xbd\xd8\xee\xaar\
-H\xc9\x86]\xfb$\xa8\xef\xf3G\xdb\x1b\x91!>^\
-\x8d)\xd4\xba\xadM\xa8\xeb\xa4d\xe8k\x8f.\xdd\xf4\
-$B\xd2\x08pG \xd0/N3i\x84|\xde\x1f\
-\x80\xdc,\x01\x0f(0\x5c\xf2\x90\xfb\xbb!5[\x94\
-M[\xecq\xb0O\x9cyJ\x224\xd5Ar:\xf4\
-uJ;a\x8b\xca\x9e\xb7PV\x1f\xf4\x9b2\xd1a\
-+_\x9c\x90\x22Fk\xdcha\x1b\x12\x12\xe1\xb2+\
-\xa0\xa4X\xd0sr\x06$X\x14aW\x97\xf0\xb4\xfd\
-a\xe9\xa7mx\xe6\xcd\x15\xa7\x1d\xb6\x0a\xd3\xda\x8f+\
-B\x9a:\x03\xc6\x8e\x85\xc3\x15\xd0\xda(H77S\
-\x066\x14\x92\xd4A8,\xecEuE\xb4o\x00\xe9\
-y\x10\xf2\xc3\xd8<y\xf8\xec{\xb3\xff\xa7\xe7\xc1\xe8\
-\x5c\xa8o\x94\x07\xa7\xae\x1c\xd2r\xa2mx\x12`\xf2\
-D(;\x22\x11\xa0\xcb-\xfd6#26Y\xa3\xc0\
-\x0dx=\xd2\xff\x86*py #S\x94)#C\
-\x00]\xa0[\xee\xdb\x93\x00c\x0a\xe5\x01s\xbb\xa4\x1d\
-W\xa2\xd0\x8a\x18\x02\xe6\xb2S\xe0H)\xe4\x8e\x81\xc4\
-\x14\xa8;\x06iY0j\x94\x80\xb3\xb4\x1c\xc8M\x97\
-\xfa\x94H\x08\x0a'\x81\x0eAk\x1f\xf4\xb4\xca\xf8\xa4\
-e\x08\xb8\x18;\x06\xcaJ%\x15\xd6\x17\x14\xa0\xd6P\
-\x0f\xc9\xa9V\xee\xbaG\x90\xbf\xcb+\x06\xc2\xed\x919\
-K\xf5\xc0\xec9\xdd\x5cy\xd9\x0e\xea\xea\x16\x89\xf3\x0a\
-\x88\xa3\xb1k\x05\x22\x11q\x0e.\x17\xe4\xe5i\xda\xda\
-\x14\x09^1\x86\xfd\x16\xcb\xe5v3\xe0\x1c\xc3a\x99\
-\xab\xfe~iC\x89\xbf!\x12\x81\xd1\xa35\x8d\x8db\
-\x98\xbd^aj\x0c!\x1b\x06\x1c]^\xae\xa4!R\
-R4\x0d\x8dj\xe0\x5c\x9b\xce\xd4Z\xceu\xb9\xe4Z\
-\xe2\xf0!)Qc\x18\x0ae\x88~\xd9i\x08[\xec\
-\xbe\xe5\xe5IT\x9d\x98 N\xdb\xae\xc9HJ\x92>\
-{<r/~\xbf\x9c\x9f\x94$F\xd9\xeb\x85\xcc\x0c\
-a \x9a[\xc4\xe9x<b43F\x08\x80LL\
-d\x00\x84\xf4\xf40\x08\x0c\xd9\xa9\x16\x1b\x00\xd8}\xb3\
-?\x07a\x11\xec\xda\x17\xad-\xc7\xef\x96~\x8f\x18!\
-}\x0a\x85\xe4x\x8f\xc7\xd2-=\xb8\x1eH\xa9\xe8u\
-\xfb\xfb\xe5:\xc1 \x8cH\x8b\xb2?\xe1\xb08{\x97\
-!\x0el\xec\x18Mo\x9f]\x80\xa6\x18\x91&\xe3T\
-zX1z\x94\x16\xf6\xc1\x1aC\xbb\xf6\xc0\x9es\xbb\
-\xaf\xc2 \xc8\xf5\x5c.\xf9\x0b\x85\xe48\xc3\x90g\xc0\
-\xd4Q}0\xack{<\x9a\xf4tIY)%\x8c\
-N\x7f\x7f\xb4V%%%\xba\xec\xb5\xbf_\xe6#\x10\
-\x90\xff6p\xf1\xfbe\xec\xed\xcd\xec\xec\xfbOL\x94\
-\xeb''iz\xfb\x14^\xaf\xc6\x8c(\xba{`\xfa\
-4m\x01@Ik\x04\x83r\xad\xae.9'1Q\
-^\xdb\xe3\x99\x92\x22v4\xdc\x1f\x9d\x17\xd3b\x8d\x5c\
-\xae\xe8X\xa4\xa6\xca3RPP\xc3\xc6\x8d\x11\x9e\x7f\
-i\xb6\x04\x00\x85\x12\x8c\xec\x8a\xf9\x0d\x0fo\x92\xd8\xdf\
-@\xb7\xd8X\x94\xd8\xb1\x11#\xc4IxS\xc4\xde\xdb\
-c\x963\x0a\x1ab\x96\xe5\xdb\xf6\xcd\xb6a \x01`\
-r\xaa0\xb8(\xb1Sn\x97\x00\xff\xc4d\xb1\x83\x0d\
-\xed\x90\x97-N\xfe\xe8!\xb1q\x86\x01Y#\xe5\xb3\
-\x09\x13\xe0P\xb18u\x10\xbf\x92>J\xfa\x19\xe8\x06\
-O\x92\x80\x83\x09\xe3\xc5\x19\x8f\x1a'm\xa7z\x85\xc5\
-\x0e\x07\xe5\xbe\x0cC\xec\xa1\x19\x91\xfb3\x0ci3\x1c\
-\xb4\x9e\xdf \xa4f\x09\x83\x1e\x09C\x7f\x10\xa6\xcd\x91\
-\xa0\xab\xbb[\x82\xc1\xe4d\x980\x11\xca\xab\xe4\x98\xd0\
-q\x85\xe5\xa3\xf3\x05\x90\xd4\xd4\x08\x93`\xb8\xc4\xbee\
-d\x0a\x00\xf2$\x88=\x07)!xc\x9d\x80\x1c\xc3\
-m]o\xa6\xa4\x9b\xba\x9a%\xd0\xeb\xec\x14[\xe9I\
-\x90\xfeM\x9e\x22>e\xeaT\xa88\x16\xf5\x199\xb9\
-\x92vIM\x15\xa0\x93\x9c\x0en\x032\xb3\xa1\xbdI\
-\xd8\xe3q\x852&\x8d\xed\xc2Voz\x1b\xe6\xce\x13\
-\xc6<1\x15\xf2GCg+T\x96\xc3\xa4\x99\xd0\xd3\
-\x01\xa3F\xcb*\xc0)\xd3\xa0'(m\xdb:\x12\xf2\
-CB\xb2\x8cc\x82W\x80\x9a;A\xca\x17\xfa:e\
-\x8c\xc3A\xf9n\xf1yR/\xe3R<\xf0\x80\xbf\x07\
-\xc6\xe6K\xa4\xd9\xd9\x0e\x999\x96\xd1\x1c\x01\xff\xb8\x5c\
-\xbe+9\x04\x85\x05\x82\x8a\x12\x5cBE\xd55\xc1y\
-\xe7BX\x09\x82\xcd\xce\x92\x08\xd6\xce?\xa5&\x81\xa9\
-\x04\x5c\xb8=\xa2\xb4\x86K\xd0^\xd8\x10*=#[\
-\x1e\xfc\xf4\x11\x96\x81\x1f\x05\xcdM\xa2\x14\x19\x99\x92w\
-\xcb\x1f+\xa0\xa1\xab\x07\xc6\x8c\x95<[G;\x8c\xc8\
-\x81\xfb\xee\x16\xa48m:\xf4vCV\xae\x18\xbf\xeb\
-\xae\x86Y3\xe5\x9e\xda\xbb\xadh\xbe\x07&O\x964\
-Lv.,\x9c/4Qc\xb30\x1fcG\x0b\xdd\
-\xd5\xd2&\xe7/>WV\xa8\x8c\xcc\x86\x09\x85\xb2<\
-\xf4\xd2\xcb`\xd6\x1c\x983_\x90rB\xb2\xa4V\xba\
-\xfb\xc0\xec\x87\xbc|\xe8j\x130\xa5MHI\x16\xc6\
-#\xd2\x0fW\x5c&\xd1=\xc0\xd4\xc9\xa2\x04n$\x0d\
-1~\x82\xa4\x11>s\x1d\x5c\xf0\x09\x89\xaa\x82}\x82\
-n3\xd2\x05\x80`9\xb7\x0b\x96\x0a\x83\xd0\xd6\x05S\
-&\xc9\x7f\xfbA*\x1c/ \xa6\xb3SV\x9c\xe4\x8c\
-\x84qcdl\xfdApY\xb5'\xe1\x00\x8c+\x90\
-\xf9\xb8\xe1\x06\xa9O9P\x02\x05c\xe5\xde_\x7fC\
-\xd2&\x11 \xc1rzm\xad0n\x1c\xb8\x95\xa46\
-\xf0\xc8\xbd\xf7t\x83J\x02e\x82\xd7-\x85}^\x8f\
-\xa4\x5cR,c3}6\xb8\x12 -]\x9cK$\
-\x04\x9e\xc4\x10\xf3f\xd7\x11\x0c\x8c!%U\xae\x91\x98\
-\xa0\x09\x04\xa2\x05\x83\x86!\x7fK\x16k\xaak\x84\xd5\
-PJ\xf4\xc9\x1f\x80\xacLM\x9f_\x22\xde`P\x8c\
-YZ\x9a\xb6\xc0\x8aD\xec\x89\x89p\xe5\x15&\x87\x0e\
-\x19(%\x14x \xa0\xf0z\xa5\x1d3\x22F\xd5\xeb\
-\x11\xdd\xc9\xcd\xd5$$\xc2\x92\xc5&))BQ\x0f\
-\xe4\x89]\x83\xf3\x97\xd2?I\xbb\xf4\xf4Hz\xc3\xe3\
-\x11\xc3\xef\xf5F\xd3h\xe1\xb0D\x0b\x12y\x83\xd7\xab\
-I\xf0Jd?\x22Mr\xff\x13&h\xba\xba\x14\x19\
-\x19\x02\xcb\xc7\x8d\xd5\xb4\xb7\xab\x01\x87\x93\x93-,\x85\
-\x0d\xa22Fh\xdc\x1e\xa1\xfe\xfb#2\x16\xc2\xe6\x08\
-\x88JJ\x94t\x91\x9d\xfe\xb0\xff\x92\x92\xa4o#G\
-\x0a\x98\x92z\x01\xa9\xfd\xb0\xd3\x0c^\x8f8+\xbf_\
-\x91\x96\xaa-\x87-}OO\xd7\x9cw\xbeIE\x85\
-1hY\xa8\xb6\x9ec\x1b\x90\xa0\xa3+\x0b\xec\xd4\x8d\
-\xed0\x93\x92\xe4/9Y\x80\xc6\xb9\x8bL\xc6\x8e\xd5\
-\xe4\xe6\xc2\xacY&%\x07\x0d\x92\x93\x85\xb9HL\x14\
-\xe0\xd7\xd5%\xf7\x95\x90\x10-\xe6\xb6\x9d\xb9\xa1$\xfa\
-\x1b\x91\xa6\x07jV\x12\x13D\x17Pr\x9eR2\x8e\
-Z\x8b\xb3\xce\x1d)\xd7\xf2z\xe1\x9c\x85&\xf3\xe7\x99\
-T\x1dS\x04C\xc2&\x19\x86\xf4-\x12\x91\xeb\xd9N\
-=\x10\x80\x919\x9a\xbc\xdc\xe8=dg\xc1\xf4\xe9\x9a\
-\x8c\x0c\x01\xb1\xc9\xc9\x9a\xc2\x02\xcd\xe2\xc5\x9a\x82|\xcd\
-\xd5WE\x98;\xd7d\xd7.\x17i\xa92\xfe\xe7\x9f\
-\x17\xc1\xe3\x11\xe0;q\xa2Ic\xa31\xa0\xef68\
-F\xc1\xe4\x89\x9a\xf4\x0ca@\xb4\x86\xcb>\x19\xe1\xdc\
-sMR\x92%\xf5\xe3\xf1\xc0\x9c\xd9\x92\xf6\xf3\xfb\x15\
-^O7\xcdm&\x86+\x97~%Q\xe9\xf4i\xc2\
-4\xbb\xbdV \x08\x84\xfdb\x07\xfbzD\xaf\x83\xbd\
-\x02`P\x96\xed\xed\x87\xf4\x91r\x5c\xc6\x08\xc8\xc9\x13\
-\xe0\xbah\x11\xcc\x9e+,\xb76\xc4Q\x9a\x11H\x1d\
-!\xf3\x9f\x99%iK3\x0c\xa3\xc7\xc1\xe7\x96\x89\x0d\
-\x9a1\x1d\xbe\xf4yI/\xdfw7l\xdc \x00A\
-[\xc0\xc9\xe5\x8e\x16\xb8\x1bn\xb1\xa7(i/\xe0\x8f\
-\x02I\xc3-,B\xda\x08\x18_(\x8c\xf5\xd4\xc9\xc2\
-\x98\x8e\xc8\x90gz\xc1B\xa1\xfa\xfd\xe1\xa8/\xeb\x0f\
-\xc9=E\xc2\xd1\xe09#St\xdd\xdf\x0bc\x0b\xc4\
-\xae\xa6\xa4\x0b\x13\x909R\xee1\xd4'\xce3)Y\
-\x1cjF\x96\x8cYO\x970\xf99y\xe2\xa7\x12\xbd\
-0i\xb2\xa4\xba\x9b\x9ae<=\x89R#\xb2`\x81\
-\xd8\xc1\xc9\x93\xa4\xd4@[\xcf\xc6\xf8\x02a\x05R\xd3\
-,\xfb\x95,\xfe\xae7\x00=}2\xb6\x8b\x97\x08k\
-\x91\x95%i\xad\x7f\xffw8zX\xda\xe8\xf5\x0bP\
-\x0c\x05\xa5\xdd\x9e.\x99\xb3\x86F\x01'7^\x07\xb7\
-\xdd*\xb55\x9f\xfc$\xe4\x17\x88/\xef\xf5\x83\xd7\xb0\
-\xc6\xdb#~a|!\x94\x1d\x15\x1f\xec\xf6\xc0\xe8\x91\
-\x12@N\x99$\xf3t\xe3M\x92\x06\xd2\x86\xdcW\xa4\
-\x1f\x96.\x911Z\xb0P\xea.G\xe6\xc0e\x97Y\
-\x0c\xf5\x9d_\x87\x8d[e\x002\xfb\xa0/K\x1cl\
-\x8f_\xe8\x9c\xcb?\x09\x9f\xb8@\xf2X)\xa9\xd2\xa9\
-\xd4dAJ_\xb9Ynp\xf1\xf9\xf0P\x11\x9c3\
-_\x0a?\xd2F\x08\xf88\xff\x02)\xfe\x08\xf7\xc0\xe8\
-<Xp\x95\x14\xff\x04\xfbal\x04\xc6\x8e\x82\x15\xb7\
-\xc2\xdd\xdf\x84\x89\x05\xb0x\x91\xe4\xaa\x5cZ\xf2Iy\
-\xa3eB\xc3aq\x9e3f\xc1\xa5\x17\xc1\x7f\xfc\x10\
-~\xf1\x0b\xc8\x1e)\x8eO\x9b\xf2\x90g\xe7J~o\
-\xfe\x5cQ\xb2+>\x09\x7f~\x06~\xb1J\x9c\xce%\
-\x97\x0a\x18JN\x12e\xba\xfb\x1e\xa9U\xa8\xaa\x86\x9d\
-{\x04\x5c\x8c\xca\x85\x8b/\x84\x9b>#E\x90\xaf\xbf\
-&\x88n\xea\x14\xb8\xe6j\xb8\xf4\x1210\x8f\xff\x01\
-\xdex\x0dp\x0b\x98r\xbb!\x92\x0aW_\x09\x8fT\
-\xc2\x97>\x07;wJ\xd1\xe9_^\x90{\xbd\xff\xdb\
-\xa2\x80\xe7-\x91\xc8\xeah\xb9\xac\xac\x99P\x08\xd3\xa7\
-\x0a\x1aOM\x81\xa5K%%\xf3\xf3V\xe9\xb3\xd6\xa2\
-X\xf9\xe3$/\x99\x9c(u\x22?\xfd\x15\x8c\x19%\
-\x85\xb8!+\xda\xcd\xca\x81s\x16\x09@+\x18'\x8c\
-\xcc\xb4)R\x8c\xbam\x07d\xa6\x8b\x12}\xe7\x011\
-(\xd9\x99p\xebW\x05\x1d\xa7\xa6\xc0\xb5W\x8b\xb2x\
-\xdc\xf0\xe9k\xe1\xb9\x97\xe1\xd2\x0be\xb9\xd3\xcd_\x86\
-\xaf~Y\xce=rHrq\xda\x84\xe4\x05p\xc5\x95\
-\xf0\xd8#Val\x18&M\x12E\xee\xee\x81\x7f\xbe\
-G\x8a^\xbb:\x85\xc6[\xf7\xb6D\x04\x97]\x22\x8e\
-j\xf4(\x93\xb44\xcd\xbe}\xc6\x00#\x90\x9a\x22\xe0\
-A)HI\xd1L\x9el\xd2\xd0\x005\xb5\x06\xda\x04\
-\xafG\x93\x96*\x8e\xc7\xe3\x89\xfe\x8d\xcc\xd5\x8c\x1c\xa9\
-\xe9\xb46x\xd2Z\xees\xf2d\x13\xb7\xdb%\xc6[\
-E\x8b\xf8RS4\xe1D\xc5\x92%\x11\xfa\xfa\x14\xfe\
-\x80\x18\xc8\xa5K#\xe4\xe4Hq`Eet\xe7C\
-\xbb~!1\x01\x92\x925\xfe>\x98=[\x13\x0cA\
-A\xbe\xa6\xa1Q\x80aS#\xcc\x9c\xa9\xf1x4\xd5\
-\xd5\x06UU\x8a\xb44i\xcf\xeb\x91\xe8(9Y\x13\
-\x0c\xc9=h\xc48\xa4\xa6\x9a\x8cH\xd7\x1c,\x91\x9c\
-|o\x9f\xd0\xe6\xfdaE8\xacq\xbb4\x0b\xe6\x8b\
-\xa3\x9d;\xd7d\xff~\x83\x80_\xa1\xac%\xa5\xae\xa0\
-D4\xe3\xc6j\xd2\xd35\xdd\xdd\xb2z!1A\x1c\
-k(\x04\xd9\xd9\xd2\x8f)S4\x0d\x0d\x0a\x8f[\xee\
-%\xc1+)#\x8fG3q\xa2&9\x09\xb6\xb4*\
-\xbc\x09\xc2<x\xbd\xe2l\xd3Ra\xde\x5c\x93w\xb6\
-\xbb\xf0\x07d\xbe\x94\x12\xe38gn\x84-[\x5c\xcc\
-\x9d\x1b\xa1\xa2\xc2 \x10\x94\xf6\xb3\xb24\x86\x01\xe3\xc7\
-k*\x8f)\xb2\xb3\xa4\xf0T)X\xb2\xc4d\xc2\x04\
-s\x00xh\x0d99\x1ae\x81\x91\x84\x04\xcd\xbcy\
-&`\x90\x99)\xe0a\xf7\x1e)\xc2\xcd\xca\xd4\x02,\
-C\xa2\x8b^/L\x9ad\xb2y\x8b\x0b\x97\xa1-P\
-\xa0\xc9\xcf\xd7\xd4T+\xe6\xcc\xd5l\xdfn\xe0\xf1j\
-\x16-\x8aPX\xa8\x99:5\xca\xf0df\x89\xfe*\
-Cc(\x012^\xaf\x04@\xa3Gi\x0e\x1f1p\
-\x19\xf2YN\x8e&/\x0f\x12\x12e\xecf\xcf61\
-M(\xaf0HK\x85\x99\xb3Do#\x91(Hv\
-\xbb\x19\x00\x14\xb9\xb9\x9a\xf4t\x13\xad%\x9dd35\
-^\x8f\xc6\xe3\x91tXR\xa2\x80\xbc\xeclMm\xad\
-\x8b\xbc<\xa9\x13\xc9\xcb\xd3\xb8\xdd&\xc9\xc9Z\xc0M\
-\xb6\xa6\xb9\xd9EK\x0bd\xe7\xc8X'&\xc0\x94\x09\
-0r$\xcc\x9b#6eB\xa1\xd8\x99\xbd{\x85\x09\
--\x18k=#\x16p\xba\xe8\x13\xb0\xa7\x18\xae\xf9\x14\
-\xbc\xf0<,^(\xab,\x94\x82\xef?\x00\xf7\xfe3\
-\xcc]\x00\xbe\xdb\xc4\xe1T\xd7\xc2\x85K\xc4\xe6\xcc\x98\
-\x0e\xaf\xbe\x226\xe7\x8fOA\xf9QHO\x81\xeb\xae\
-\x81%K\xa4p|\xe9\xf9\x0c\xa46\xb3\xb3\xad\x94\x9b\
-G\x82\x9d\xf1S\xa0\xaf\x1b\x12=R\xa4\x9f\x9e!\xe9\
-\xec\x8b/\x84??\x05\x97\x5c\x22~\xca\xb0\xc0\xb66\
-!\x18\x86\xac\x0c\x89\xf6'N\x81\xe9S$\x0d\xfe_\
-?\x82\x9f\xfeD\xecN{\xa20#U&tE\x80\
-\x049W\x9b\x90\xe2\x05\xd3J\xbf_z1\xbc\xb3\x15\
-\xfe\xfe\xef\xe1\xa7?\x95s\xa6L\x81\x86f\xf1\x0b\x09\
-\x09\xe2G\x1a\x1a\x04<\xdb\xaba\xbev\xb3\xf8\x91\xac\
-l\x01%\xb7\xdd\x02\xff\xf6#h\xb3\x96o~\xf5+\
-R\x08\x7f\xc3\xf5\xd6\x96\x05\x11\xd9\xc5\xf8\xe5\xd7a\xea\
-\xa4(\xd09w&\xe4d\xc1\xa7\xaf\x81\xffw\xaf\xd4\
-\xe6\xf5%H\x807i&\xdc\xf3u\xd8\xf9\x8e|\xbf\
-e\xb3\xd4\xf0\xe5\x8e\x13\xdd\x1f5\x12\xeeX!\xcbw\
-\x93\x92\xc4\xf7-=\x1f\x96,\x92\x02\xe4\x9f\xfeX\xfa\
-\xdf\xd0\x04O\xfeU\xf4\xe2X\xa5\x04\xf79Y\x12\xec\
-}\xee\xf3r\xaf\xe1 \xb4\xf6\xc0\xb9sa\xd1\xb92\
-_\x07K\x05\x14\xbe\xf9\x96\xf5\xbbB\x01\x09\x88o\xfe\
-\x0aT\xd7\xc1/\x7f&E\xb3\xc7\xaa%M\xf5\x89\xa5\
-\xe0\x9e;\x07|\xcbe\xc0\x9eyN\x9cxC#|\
-\xf9*xh5,^,J\x9a\x9e.\x0fFN&\
-,\xbfM\x8a@/\xbfT\x22\xd9@P\x96\xb0\xda\xc6\
-w\xcaDa\x05f\xcf\x91\x1c\xdd\xfa^\x19\xf8\xbb\xbe\
-.\x13:b\x84\xb0\x17\xf5\x0dR(h\xb8d\x05\xca\
-\xbdw\xc3\xe1OK1K\xe9!Q\xf6iSEY\
-::\x84\x018o\x89\xa0\xd7\xc9S\xe1\xf2\xcb\xe0\x85\
-\x17\xe4fsG\xca\xca\x8a\xeb\xaf\x13GYS\x03\xb3\
-gK!R\xc1\x18\xe9\xd7\xed\xcb\xa5\xce\xe1\xab_\x82\
-\xe9\xd3a\xe1\x021\xe8u\xf5\xc2*\x14\xe4K\x1b\xc7\
-\xaa$\x95\xa2\x94\x18\xea\xf9\xf3\xe0\x9b\xf7\xc9\x18\xc4R\
-\xdd\x86!\x05F\xe3\x0a\xe1\xfcs\x85\xd2\xba\xear\x01\
-Hv\x1f\xae\xfb\xb4\xf4\xdb\xe3\x11\xe0\xf3\xa9+\xa4\x9a\
-\xf8\x89?\x0a\xba\xff\xd67%\xf2\xff\xe2?X\x14\x9a\
-\xc5Nx\xbc\x90\x97'\xab7JKE\xc9\xdd\xee\xa8\
-\xf1\xdd\xbc\x05\x1e\xfb\x83\xd0P\xa3s\xe5\x9c\x88)\x8e\
-\xf1\xc2\xa5\x92\x8fL\xf0\xca\x18\xce\x9e\x0d\x9f\xb9A\x22\
-\x88\xc4Dx\xe3-16\x13'H\x15\xf39\x0b\xe5\
-^W\xdc*\xc7>\xf2\x08L\x9d.c9c\x86\x00\
-L\xaf\x17>\xfbw\xb2\xaad\xf19\x92'\xbc\xe9\x06\
-A\xaf#\xd2e\x9c>s\x83\x18\xe8\xaaj\x010\x1e\
-\xaf \xd9\xcf}VRZ\x13&\xc8\x0a\xa0]\xbbd\
-|\x17\x9f\x0b\xda\xd4,\x5chRS\xa3\x986]s\
-\xb8T\x91\x99!\x0e#\xc7\x05\xde\x04\xcd\xc4\x09\x02\x18\
-f\xcf\xd6ttj\xba\xbb\x14\xa3Gkjk\xa3i\
-\x8a\xa4D\x89z\xddn-4u\x9a\xa6\xa0@S\x5c\
-\xac8\xf7\x5cs\xa0V\x22w\xa4f\xfcx)\xbcK\
-I\x85\xe9\xd3M\xc6\x8e\xd1\xd6\xa6K\xc2 \xcc\x9e\xad\
-%\xe2\xb5\x98\x0a\x9b\x92\xd7\x1aR\x92-fE1\xe0\
-|\x96.\x8d\xf0\xf6\xdb.\xc6O2\x09\xf7\x1bdf\
-\x88\x9e\x8f\x1a\xa5\xf1\xfbm&D\x22\xd9\xb9sL\xdc\
-\x1eX\xbf\xdeE\x82W\x9cz\xa4_\xd2\x12\x8b\x16E\
-\x06jI\xd0&\x93&\x99\xa4\xa6j\xd6\xads\x91\x9a\
-&\x91\xee\xfeb\x83\xf3\x96\x9847+&L0\x07\
-\xf6\xb3\x987\xcf\xa4\xa3SX\x8d\xc4$\xcd\xa8Q&\
-\xd9\xd9\x92\xf3.9(\x11`Z\x9a\xc64%Z?\
-x\xd0 )Q\x93\x94$\x80\xc1\xde\x84.5E\x9c\
-\xd7\x9c\xd9&\xa1\x10l\xdd&\xed\xe7\x8e\x94y\xcd\xc8\
-\xd0\x8c\x18\xa1-@!\xec\x8b\xc7#LO  \xc6\
-w\xa06\xc5\x02p\xe9\xe9\x9a\x9c\x1c\x19\xdb\xf1\xe3M\
-&O\x96\x951^/\xcc\x9dk\x92\x95\xa5\x071B\
-\x00\xb3f\x9a\x94\x94H\xe1\xad=\xff\x17_\x1c\xa1\xad\
-MY{\x0eh\xfa#\x92B\xb9\xe0\x02\x93\xcd\x9b\x0d\
-F\x8d\x12G;e\x8a\xc9\xbe\xfd\x06\xfdV*Sk\
-\x98:U\x13\x0e\xc3\x82\xf9&;w\x1a,Yl2\
-n\x9c\x1eH\x89\xd9u%#s4MM\xc2\x90%\
-$Ba\x81\x00\xb4\xe934y\xb9By$&@\
-f\xa6\x160;R\xfaf\xb3lJT\x83\x1bn\x88\
-\x90\x9e\xaeO`\xbbF\xe6h\xae\xbc\xb2\x1f\xb7[\xf4\
-\xca\xeb\x95c\xd2\xd2\x04@<\xf2\xa8{ U\xa6\x94\
-\xdc\xdf\xdc\xb9&\xd9\xd9\x9a\x96V\xc5\xc2\x05&yy\
-rNn\xae\x80\x0c\xc3\x90\xb1OI\x11Pr\xd1\x85\
-\x11\xf6\xee\x87*k^\xa7M\x16@{\xf9'-\x06\
-v\x9c\xd4Ldd\x88-z\xe6Ya66m\x85\
-\xab\xae\x92b\xec\xa5\x9f\x90\xb4\xf3\xf7\xbe+\x85\xe9Y\
-\x99\xf2|\xef\xdb'\xc0y\xde\x5c\xb8\xe4BYz\xb8\
-\xec\xf3\xf0\xb9\xbf\x8f\xee\x87\xd0\xd1\x0e\x0b\xe6Bn\x9e\
-\x14\x07.]*\xcf\xc9\xb9\x8b\xa2\xc0\xc2^-\x02\xe2\
-C*\xcb\xe1\xda+\xa5\x1e\xac\xbc\x5cR\x1d\xe3\xf2\xa1\
-\x1ai\xfb\x95W\xe1\x8a+d\x05\xca\xc5\x97J\xdf\xb6\
-o\x87\xcf\x5c.\xdb\x0adg\xc3O\xfeKRp{\
-\x8b\xe1\xdcs\x84U\xfe\x87/@\xd1*I\xab\xe7d\
-\xcb\xe7\x15\x95b{\x8fT@\x92\x0bpY\xbe K\
-\xd8\xf9I\x93`\xa5\x0f^~M\x00Ag\x07\x5cq\
-\xb9\xd8\xff\x83\x07\xc5?&$\xc8\x1e?\x97_!+\
-\xf4>s\x83\xf8\xa5\x17^\x10v\xfc\x92\x8b\xa4H\xb4\
-\xa6Z\xda\x9b4I\xea\xd3\x9a\x9b\xa5\xfe\xf0\x9d]\x90\
-\x9b-\xcc6\x88\x8f\xf9\xe5\xcf\x84\xf5ML\x12vd\
-\xf1\x02\x09P\xbfv\xb3\xac\xba\xbc\xe6*\x01\xb9c\xc7\
-BZ&L\x98$v\xc6\xed\x96\xf4\xf4\x98\xb1\xf0\xe5\
-/K*\xe4\xfc\xf3\xc4^\xdb{K\x15\x16Z\xf3c\
--e\x1f\x95'5\x8e#\xd2\xe0\x9e;\xe1\xa5W\x84\
-\xa1\xf8\xfe\xfd\xf0_?\x86\x99\xb3d\xce\xd3\xd3a\xd9\
-g\xc57N\x99\x22\xed\xfc\xddM\xf0\xc0\xfdp\xf5U\
-2\x9e\xbf\xfa9\xcc_\x00\xbfy\x08~\xff\x7f\xd2\xfe\
-e\x97\x83{\xeaTqb\xfe\x808re\xd5O\x5c\
-~\xb9(\xac\xfdK\xbcc\xc7\x89#)\x18\x0b_\xfc\
-\x828\xe5+\xaf\x10\xa7r\xf0\xa0P\x9299p\xf1\
-%\xf0\x9do\xca\xceb\x97}R\xe8\xa1\x80\xb5|/\
-5E\x963\xd9\x92\x95\x15}\x9d\x94$\x0f\xe1\xd4)\
-r#\x11S\xda\xb8\xf8\x22)\x8a\xa9\xaa\x96J\xddk\
-\xaf\x91\xe3?e];;[j\x07.\xbdD\x96:\
-\xda\xcber\xb2\xa3\x06\xe3[\xdf\x10\x85JO\x87\xcf\
-|FV\x9e\xc4\xf6C\x8c\x99<0IIR0c\
-KZ\xa6(X,\xb0\x008g\x9e8\xe5\xb2\x1a\xb8\
-\xe5f\x89\x06\x0a\xac\xe5\xaa\x7f\xf8c\x94\x05\x18c\xb1\
-\x1eM\xd6\x12X\xbb\xff\xd7^#\xeb\x87\xc7\x8f\x97\xca\
-\xda\xd4\xd4\x13\xab\xa9Gd\x8a\xc2.X0\xf4z\xe5\
-\xc9\xe3%\x8a\x04\xd9o\xe3\xdb\xf7\x0a\xb2LI\x81\xaf\
-\xde,@\xf1\xa5W\xe0\x13\x9f\x88\xce#\xc0\xc4\xf1\xa2\
-x\xf3\xe7\xcbx\xd9\xcb\xe8f\xcf\x8e\x1e\xf3\xcd\x7f\x96\
-4\xd0\xfcy\xf2\xfe\xbe{-\xaa\xdb\x1a\xab\xcd\x9b\x04\
-\x1c\xa4\xa4J\xc1\xcf\x84\x09p\xd5\xa7D\x7f\x1e\xfd\xad\
-\x00\x0a\xc3%\xe3\x90\x90\x003gF\x0dJN\x0e,\
-=O\x1e\xe8\xd2RMj\xaaD\xca]\xdd\x06J)\
-\xf2\xf2\xc4\x11\x8d\x19\xa3\x07Vh\xc8\x03\x22\x8e\xc10\
-4S\xa7J\xd4=u\x9aI_\x9f\xc1\xacY\x125\
-\xb6Y[J\xa7\xa4J$YQ\xe1b\xe1BIJ\
-''k\x0a\x0b5II\x9a\x9c\x91\x8a\xa4$MJ\
-\x8aD\xd3\xc5\xc5\x8ai\xd3d\xd5BB\xc2\xe0qv\
-\xbb%Ma\x9a\xb2\x82\xa0\xab\x1b\xba\xac\xfa\x84\xa9S\
-\xc5\xc9\xd8KSSS$w?g\x8e8\xe2\xfc|\
-Y\x11\xe1\xf5\x8a\x03IM\x15\xc7t\xdd\xa7e9\xe1\
-\xbe\xfd\x8a\xe4$\xd9\xd3A\xd8\x17m\xcd\x85\x8cA~\
-\xbe\x80\xa1\xfc|\xcd\xb8q\x1a\xadM\xd2\xd3e\xcc<\
-\x1eX\xb0 B}\xbd\x8b\xf3\xce\x8b\xd0\xd4\xa4\x04\xe4\
-\x8c\x97cG\x8d\xd2tuI\x14\x1d\xee\x97\xe8\x0c\x0a\
-\xa9\x88\x00\x00\x0dJIDATV\x9e\x19=\xc0\xf4\
-\x18J\x9c\xbf\x9d\xb7\xcf\xcc\x14&\xc1v\x98JI\xbd\
-G\xde(Mc\xa3\x8b\xac,\xcd\xa5\x97\x9a\x03\xe9\x08\
-\xb7G\x1ctN\x8e\xc6\xdf\xa7\x181\x022\xd25I\
-\x89\xe2\x9c].\x01Y))0\x7f\xbei=\xf7R\
-\x1b\x90\x9c\x22\x11\xfcPb;\xa1\xb4T\xb9\x17\xc3\x90\
-g\xc4\x1f\x80\xc2\x02s \xb5\xe2\xf7\x0b0+,\x14\
-'o;\xf4\xdc\x91\x02\x80\x92\x92\x84\xca\xcf\xcc\xd0d\
-e)\x12\x135YY\x9a\x05\x0b\xcc!w\xfaLI\
-\x91\xd4\xd2\x85\x17\x98TW\x0b\xb32v\xacf\xc2x\
-\x13\xb7[\xd8\x8b9s\xa2\x9b\x16\x1c\xaf+ \x801\
-5U\x0f\xaa\xbb\x91\xc1\xb4j\x8e\x86\xd8\xf0\xcff\xe8\
-F\x8e\xd4\xf4t\xcb\xde)\x89\x89\x90\x9d%s\x0fp\
-\xc5\xe5\x91A\xd7;\x1e\x90%&J\x7f\x92\x935\xd9\
-\x99\x02,23\xe0s\x9f\x83I\x13\xc5a\x05\x02\xf2\
-\xec\x99\xa6\xb0\x9e\xb3f\x8a]\xbf\xe9F\xa9\xf3x\xe1\
-%\xb8\xfejI\xbd\xd6\xd4\x08\xeb\xf1\xf5;l\xbd\x86\
-/|AVex<b\x17\xbd^I\x1b\xdb\x923\
-R\xa2\xf9\xdbn\x95\xc2\xfa\xa6\xa6\xe8\x18\x1d\x7f\xdf\x85\
-\x13!o\x9cU\x1b\xe3\x92\xb4\xea\x884\xd1\xc9Q\xb9\
-\xc2HdfH\x00\xb4\xe8\x1c\xb1\xe9\xfd\x11\x09X\xf2\
-\xc7\x09\x0bw\xe5\x15\xb2\x12\xcd\x93 \x01\xad\xd7+i\
-\x1b;\x98\x1b\x95'\xfd\xbe\xfb\x9f\xa4\x90\xf4\x9e\xbbe\
-\x15GW\x97\xec=T\x98/\xcbR\x97\x9c'vZ\
-\x19\xe2\xb7\x0a\x0a`\xc7nq\xd2\xb3gE\xed\xe7\x9c\
-9r\xdd#G\xe1\xc9\xbf\xc0w\xbe\x15\xb5\x8bR\xbb\
-$\xfd\xf7\xdd\x0a\xabW\xc3\xed\xb7G\x1d\xbb\xd7+\xc0\
-\x00\x04\xc8\xa4\xa6J\x80\xfc\xdc3\xb22\xb1\xa0@\xfe\
-\xaa\xabaL\x0e\xdcu\xa7\xf4\xf1SWF}\xe5\xcd\
-_\x8c^\xe7\xfa\xab\xe0\xcd\xb7\xe1\xe2\x0b$\x1d\xb2h\
-\x91\x90\x01\xf7\xdf/\xabW\x92\x12\xe3l\x14\x17\x91%\
-\xac\x93'\xc3\x9f\xfe\x0f>\xff9)\x1c\x9d1]\xc8\
-\x80\x9bn\x14@>r\xa4\x80\xaa\xd1\xa3\x05\x1864\
-\xc2\xac\x19R\xc3\x91\x9f/\xbea\xd6,\xf9\xb3\x03\x90\
-\x11ib\xeb\xe7\xce\x01w\xac\x93M\xf0\x0aH\xb8\xea\
-JA-7\x5c\x1f\x13\xa9{ o,\xfc\xe3\xed\x92\
-\xf6\xb8\xfa\xaa\xc1\x0e+=]\xfe\x16\x9f+4Lv\
-\x8e|?m\xaaD\xde\xb6\x93\x1aJ\xdc\x1a>s}\
-\xf4\x81II\xb1\x8a`.\x94\xd7.\x97DWS'\
-G'\xd2\xbe\xb6\xdb-Kw\xae\xbeJ\x10\xf0\xf1b\
-\xefQq\xc3\xf5\x927MI\x89.\x9d\x1d\xb8\xbeU\
-\xb1>\xd4Z\xec\xd93\x044\x1c/s\xe6\xc8Z\xef\
-\xfb\xbe#N2/OX\x18\xad\xe1G\xff.\xd7}\
-\xcd\xda\x81\xed\xf3\xcb\xa2?\xc4c\xf7?V!\xa7L\
-9\xb1\xfd\xb1c`BA\xfc1\x1b=J\xd6\x16G\
-\x22\x12IM\x9b(\xe7\xfc\xe8\xdf%\xff+\x9b\x10\x09\
-+3q\xc2\xe0sg\xce\x94\xe2\xcdXpw\xbc\xcc\
-\x9b+\xf7\x14\xfb\xd0\xd8r\xf5U\xb2\xa3]R\xb2\x80\
-\x9b\xa4$9>v\xccss\x87n7g\xa4,\x15\
-^\xbaT\x22\xaf\xfe~\xd3\xa2\xbe\xc5\x80\xa5\xa7\x0b\x1d\
-:f\xb4\xb0\x07\xf5\xf5j\xc0H\xdb{\x12\x5crq\
-d \xd7\x9d\x97\xab\x99?\xdf$\xc1Z\xd6\x95d\xa5\
-\x18R,\x03\xbfhQ\xd4\x11\xe4\xe5j\xa6L1\xad\
-\xad\xc3\xa5\x98o\xca\xe4XGq\x22\xb0p\xb9`\xd2\
-D\xcd\x8e\x9d\xd1\x15\x0e\xe9#\x842wY\xe9\x84X\
-\x992\xc5\xa4\xb1Q1e\x8a9\x88\xe5\xb2\x81z\xa2\
-\xe5p\xed\xfd\x0f\x92\x12\x15\xd3\xa7\x9b\xb4\xb7\x0f\xf6\x14\
-\xb1\xfdp\xbb\xa1\xa0@\xda\xb3\x1d\x8d=&\xf9\xf9\xc2\
-\xe8\xb8\xdd\x02|F\x8e\xd4\x14\x16\x9a\x14\x14\xe8\x01\x87\
-\x93\x9fo\xd2\xd2*\x8e\x7f\xe1\xc2\x08\xa6\xa9\x986\xcd\
-d\xf2d\x93\xb7\xd6\xbb\x986M\x98\x90\xc4D\x981\
-#\x0a,\xa2\xban\xd2\xdb\xa7X\xb0 BNN\x94\
-\x01\xd1H=\x80\xdf\x0f\xb3g\x99\x1c>b0i\x92\
-I}\xbd\xdcS_\x1fh\xd3`\xe2Dq\xfaYY\
-\xd1v'O6O\xfacn6\x13\x90\x9a\xaa\xad\x02\
-IM\xfa\x08\x06\xea!&O6\x07\xf6,\x991\xc3\
-\x1cT\xfb1f\x8c\x00\x9aPH\x8e\xcf\xca\xd2\xe4\x8f\
-\xd3\x03\xcf{<\x996Ms\xf0\xa0\xd4@\xe4\xe4\xc8\
-\xca\x96\x09\x13\xccA\xec\xc6P\x80b\xd0\xf35C\x9f\
-\xb0\x87\x85mC\xc7\x8e\xd1\xc3n\xff=q\x82I{\
-\xbb\x5cw\xeaT\x93\xe9\xd3\xf5\xb0@&V\xc6\x8c\xd1\
-\x03;\xe2fZc=rd4\x90\x9a5C\x1ce\
-v\xb6\xd8w\xb7G\x9co\x81U\x98\x98\x9a\x1a\x0d\xee\
-\x92\x93$M\x00\xe2\xbc\xcf?\xcf\xd2\x85\xd9bgl\
-\xfb\x5c|@\x1c\xcf\x00(t\x8bs\x1d1\x02\x96\xdf\
-:\xfc/\xccN(\x84\xdb\xbe&L\xea\xe81\x92\x86\
-8\x7f\xa9\x04\xa2\xf3\xe7K\x1bY\xd9\xd2\xaf\x1b\xae\x13\
-&\xf5@I\xb4hw\xde\x5c\xb9\x97\x0b/<.(\
-\xb3l\xd5\x0d\xd7I:\xff\xaaOI\x90j\xcf\xdf\x8c\
-\xe9\xf2\xfa\xb5u\xe2\xf8[\xdb\xc4\x96.X \xf6'\
-99Z\x03h\xdf\xf7\xa0y\xf4\x0a\xeb3v\xf4`\
-\xbb\x08\x02zl\xdd\x9d6]\x00\xce\xdc9C\xb71\
-._\xees\xc9'\xe0\xe2\x8b\xa3\xdf\xe5\xe5\xc1\x85\x97\
-\xc8}\xcd\x9e-\xd7\xb2u\xde\xbe^^\xb6\xb0!9\
-#\x05\x98\xb4\xb5\x0b[\x8c\x95^]z~\xfc\x9d\x9f\
-3\xd2\xa5\xe4 7O\xeaK@@Z^\x9e\xa4q\
-\xc6O\x90\x8d\xc5\xbe\xf6\xd5\xc1\xe7\x8e\xca\x93`85\
-\x0d>\xbbL\x98\x8e\xa1\xc4\xbe\xb6;V)L-\xe8\
-\xa7\xc5\xda\x5c$6\x82/,\x90\x09\xca\xcf\x8f\x82\x89\
-\xe3\x1d\xb4\xdb%\x83\xe4\xf1\x88\xf3\x039\xe7\xc8\x11A\
-7F\x1c[R\x90/\x91\xff\x09\xc0 \xdd~X\x05\
-\x11\xc5:\xb0X\x994qh`1P\x10h9\xaf\
-x\x0f\xe7\xc4\x89\x82\xe2\x86\x92\xa9S$\x874\x94\xe4\
-\xe7\x8b\xf1\x1e_\x18\xbd\xbeR\xd2\x1f\xfb5D\x91]\
-<\xb1\x15\x7f\x90A\x9f-k\xb3\xe3\xc9\xacY2'\
-\xf3\xe7\xc9\xf2\xa0\xf9\xf3\xa4\x104;&\x8a\xc8\xc8\x90\
-\x07|(\x19\x0eX\xd8\x85\x7f\xf1$+Kjh@\
-\x90\xfe\xf1\x11\xd4\xa7\xae\x8c\x7f\xae\xc7#\x9b\x97\xa5\xa6\
-`Q\xc3Q\xe39a\x828$\xc3\x80\xa9S\xc5\xc8\
-\xa6\xa5\xc1\xd8\xb1\xe6\x90z\x91\x9d-\x14\xbeap\xc2\
-\x8f`\xd9\x06H6\xc5\xb2\xe7Yh\xf3\xe4dM]\
-\x9d8e\x1b\xc8\xda\x8el\xa8\xb1\xf0\x1e\xa7;\x99\x99\
-\x92\xd7\x87\x13#\xef\xe4\xe4\x13\x9f\x8d\xf1\xe35%%\
-\xea\x04\xa7m\x1b\xc2\xc4D\x06\xf6\xd48\x13\xf9\xc4'\
-\xa2\xfb\xc4\xcf\x9dk\x0e\xa2\x9e\x01&M\x921\x9a?\
-\xdf$9\x19\x22\x11a~\x92\x92\xa2l\xca\xc4\x89&\
-\x19\x19\xfa\x84s\xed\x95:}}@^\x14\x14\xd9\xb2\
-h\x91\x89\xdf/\x06'\xb9F\x8cfJ\x8a\x1eX-\
-1i\x92\xc9\xf8\xf1\x9a\x84\x84\x13\xc7\xe9d2~\xbc\
-\xf4;??\xea\xac\x93\x93\xf5@p\xa1\xd4\xf0\xed(\
-%:UZ*K\x98'O6\x87\xdd\x11\xd4NO\
-\x14\x14J\xffSR\xf4\x09\xf3;y\xf2\xc9\xe7))\
-I\xc7\xd5\xa5\xa1\xf6\xf3\x88\x05\x17\xc9\xc90o^\x84\
-\xaa*\x83\xfc|s@?OU\xb2-P1\xbe\xd0\
-\xb4j\x5c\x86\xb63S\xa7\x0e=\x17\x17_$)\x08\
-\xfbuU\x95\xcci\xacN\x1f\xcf8\xc7\x06\x99.\x97\
-8\xad\xd4T\x89x\x87\x93/\x7fQ\xc6\xa4\xb0@\xc0\
-\xc5\xc2\xf9\xd6\xf3\x93!>(\x7f\x9c\x15\x01\xbb\x85i\
-\xcd\xc9\x91>\xd9+\xbdf\xcd<\xd9X\xc8q\x05\xe3\
-\x87\xb6\xb3JIp\xf4\xdd\xef\x08\x1b\x12{LRr\
-\xf4\xb3\xa1dd\x0e|\xfb\x9b\xc3_\x7fD\xda\xd0\xc0\
-\xc2\xbe\xf6u\xd7J\x1d\xc3_\x9f\x12\x87\x1f\x0b<\xec\
-Z\x0c\xdb\x07\xcf\x9f\xc7\xa0\x8d\xe6\x92\x93\x05456\
-\x89\x9d\xcf\xc8\x88\xf1K\x85'\x82\x9e\xd8\xb9\xfb\xc1\xf7\
-\xe4\xbe\x93\x93\xe1\x82\xf3\xa5/\xf6}\xdb5U\xb1s\
-z\xc2\xe6g.\xd9\xa4,6\xf8\x1c\x924\x88u\xb0\
-o\xbc)\xa0\xc0\x06\x06\xb1\xf2w7E)\xf8\xa1$\
-3\x9d\x81<\xf4\x90\x14\xfe\xa4\xf8\x0e\xeb\xca\xcb\xa3t\
-\xd1\xd0\x0f\xbc \xc0\xb8Fd\x98\x00h\xcel\x86\xdc\
-\xfdo0\x15*\xcen(9\xd9\x00\x16\x8c\x1d<\xb1\
-\xb1\x92\x91%J\x1aw\xf0=B\x07\xc6\x93+/?\
-\xb91Y\xb4H\xeaGfL\x1f\x0c,N\xb5\xffC\
-\xf6;[\x1c\xea\xb0b\xe5\x96G\xe6H\x94\xf3\xff\xdb\
-;\xb7\xe5\xb6m \x0c\x83:P\x96dy\xa2X\xb2\
-\x92\x91+\xc7\xb1ME\xb13\x13\xabn\xebN:\x9d\
-6\x07\xe7|\x9c\xbc@^8\xb9\xca\xf4\x0d\xfc\x16&\
-{\xb1\x86D\x93\x5c\x10\x04H\x1d\xff\xef\xd6\x06\x05\x82\
-\xe0\xee\xbf\x8b\x05\x98\xe57O\x8e\xc9\xf0D\x0d}\xa3\
-1\xdd&(\xa3\x0cY\xb06M\xfd\xd2\xfa|\xabE\
-Q\xba\xeb\x0a1\x18\xd0\x8e\x88\xf0\xc7\x7f\x92\x8cr\xe9\
-z\xc7\x80\xeb\x0a1\x1aQfc\xf2\x1c\x07q\xc7:\
-1\xfa>\xd5\x22T\xaa\xd4\xfe\xec\xec\x8av\xb6l\xc4\
-\x0d\x86\x8c\xca\xa3\xa9\xf6\x12\xf3b\xc8\xff\x0d\x8b \x1b\
-\xfa\xfd \xd1\x90\x95\xcbbr\xbf\xe5\xf24K\xb7\xb7\
-GcX\xab\x89\xc4\xfb\xaf\xd7\xc9\xc1'\x09\xa3\xce6\
-\x89\x0di\x00\xe5rA\xd8\x11\xd5\x1bt\xff&<z\
-\xe4O\x8a \xe3\x01\x81\x9f\xfaN\xf7\xfbR$\x88\xdc\
-\x08\xcf\x99\xa2h4\xcc\xe6C\xa9$\xc4\x97/W\x13\
-\xb1\xff\xe4O*$\xb4\xa1\xbbCK\x8c\xba6\xea\xb7\
-3z\xfe\xae\x9b~\xed^\x8f\x96MvzT\xa48\
-\xb1\xf7\x9b\xe4l\x87\xdet.u\xbb\xe1g\xa0\xdf\xff\
-VK\x88\xa7\xff&\xff\xcd\xad\x92`I\x12\x11\xbd\x1d\
-u\x90\xe4\xba\x94\xa1W\xc1eo\xe5\xb3\xea\xed\xe8\xdb\
-\xe8h\xc0\x12\xeegl\xfel\xa83\xde\xaf_\xd1I\
-\xa2\x7f=!\xff\x18}?*\x15\xda\xbc\x90\xf6\xec8\
-\xd1\x14\x13\x17\xa9/\xfa\x89\xfa\xef_?\x93q:`\
-R%\x9c\x92\xb2\x7f\xd9\xa9\xd0E\x15e\xa7\x19\xa1\x0d\
-\x85#}\xffN\xdd\xfe\x97>?\xd9\xcf\xc6\xc9K-\
-\xe1\xbe\xa9\x0c\x9fJpE\x15\xfa\xc5E~cZ\xaf\
-\xa9S\xc72\xa33\x18\x90\x83M\x13oY\x91\x86\xb5\
-\xd5\x0ab\x0azwwZl\x19]\x8e\xf8\xfe\xa3$\
-\x0e\xee\xfa\xe2\xf2\xd2I4\xce\xf7\xf7\xa9\xde\x82^\xd6\
-@\xdbi\xc8\xf3\x13F#_\xdcn'\x1bN:\x85\
-qZ3\x11w\x86\xe6N\xa9Z\x8dg\x87t\xa9\xd5\
-H\x18p\x1f\xcc*\x95\xd2\xa2p>\xca>:\xf2o\
-\xf4K\x8e\xa9\x1c\xfb\xcdM>\xd8\xd0ak+0\xba\
-o\xc7\x11b8\xf4c\xf3)<\x9eE\x92\xf7\xfb\x90\
-\x85V\x8bN\x15\xddl\x0a\xf1\xed\x9b:\x02\xd5\xb2\x05\
-\x1b\xfc\xda}\x92\x8d\xeav\xed\xefa\xe8\xd13\xb2\xed\
-{\xbbM\xcb\xf4\x9c#l\xb7\xc9\xc1\x9a\xda~e\xd4\
-^U\xfb\xbcgOi\x13\x85\xa9\xdf\x92A\xc2\xdb7\
-\xd9\xfbv;t\xdf\xdc\xd8\xe8\xfa\x9e(\xcf\x9f1\xe2\
-\x82\x8b\xc0\xd3\x18\x8dH\xc5q\x99\x09\xd3\xeb\xea\xf0\xc7\
-\xefv\xed\xc7\xa7\xc5\xf5\xad\xd3I\x89P\xea\xfc\xa7\xe2\
-\xb3\x90\xb4\xacR4\x9f?\x16#\x18\xe5w\x12t\x1d\
-gt<iK\x9e\xc3\x1a^\x13\x9a\xcd@\x1c\x1c\xd0\
-\xefE\x8fY\x9efc|e\x84\xce\xb5\xd3\xe1\xf0\xd0\
-7\x16\x17GG\xfeu\xad\x88\xc3\xf6\x9b\xbei\x13\xb0\
-\xd1\x1d'Jd]\x07\x1b%\xdd\x0db\xcb(YE\
-B\x11t\xbb\x81\xf2\xda6\x82\xc8qn\xd6\x7f\xcc\x8b\
-\xf1\xf8\xe6\xb2v\xa6\x8c\xd1\x09\x1f)\xcf\x02\x1d\xc7\xaa\
-+\xf2\xe6%\xf4:\xdb\xb4\x1d\x93\xe3\xde\x9eZ\x5c|\
-\xfa(\x16\x92\x7f\xfe\xa6S\xa9y\xfb\xcd\x88\x8b\x0f\xef\
-\xcd_(\x95\xf13\xbd\xee,\x0c\x90m{\x1bu\xfd\
-\xf8qz\xe4\xa8\xe7@\xf2\xce\x1c\xa4\x0bB\xd3\xdf<\
-\x1e\xa9EI\xa7\xa3\xef\x8c\xa2F\xbcz\xbdl\xb1\xbb\
-\x9bo\xea\xdau\x858?\xbf\x12\x97\x97\x0e\x9b\xee\xcd\
-\xd2\xef\xec\x22\xd5\xdeA\x9b\xf6\x9bk\xe78$\xe4\xd4\
-\x91\xa3\xfa\xefi\xcf)(`H\x83 \xbd0\xb2\xd9\
-\x0c\xac\xec\x82\xaa\xad\xea\xb7\xe5\x92]\x1ep5D:\
-p5f \xdb\x1c\xb0\x99C6~\xe1\xfc\xdcN\xd8\
-ye\xb5\xdd\xff\xf9\x9ff\xf6F\xc7\x90\xe4a\x9cW\
-\x95wo\xcd\xdbV*\x8byO\xf7\xf6\x8a\xbb\xf6\xfe\
-~~\xd7\x8a\x0a\xda\xc1\xc0\x9f\xd4i\xe4\x89\xe7Q\x91\
-\xa4\xdc\x12\xb9\x8c\x84\x97\x09f\xd1N\x07y^\xc3\xac\
-3\x17t\x02\xea|\xec\x95\xe7\xf9\xca\xf9\x1c\xad\xd7\x01\
-\xc5qz:\xbf\xdfn6o\x16\xd5\xe6\xc9\xc9\xb1y\
-\xdb\xad\xad\xfc2\xd2\x0b\xe1\xde\x1e>\x5c\xde\x09\x9ag\
-\xb1\x18\xb0\xa3\xa8\xb5ty\xddE\x15\x83E\x0a|:\
-\x09r>}.\x22sQ\xa9\xa4\x17\x83\x1e\x1e\xfa\x85\
-\x89H\xd5s\x90\xdfm1\x15\xda6Ko\xeb\xc8\xaf\
-\xe3\xf9\xfa\x8d\x07\xc3\xd5\x1e\xdf\x850\x97\xdc\x9e\x5c\x90\
-\xe2\xf4\x5c\x8c\x01(\x16\xee\x90\xabYPD\xe6B\x9e\
-\xa9\xa2b\x9e\x05\x996\x02\xd8f;3\x00:4\x1a\
-t\xf8\xda\xd2\x88\x0b`\xc6\xcb\x17\x18\x03\x00\xc0\xf2\xe2\
-\xbat\x9a$\xc8\x86i\x81\xb7-\xdb\xdb\xc9G\x1e$\
-Q\xc2cZ^\xee\xdc\xc1\x18\x80\xd5%@ \xbe\xf2\
-\xdc\xbaeW\x80\xb8\xae\xbcx\xbe\xf8}\x84\xb8\x00K\
-\x85\xcdy\x11\x00\x00\xb0\x0ap'RC\x5c\x00`\x08\
-\x8a\xd6\xd6\x83Z\xad\xb8\xdd\x22\x00\x00\x88\x0b\x00\xc0\x1a\
-\xe2y\xfe\xd2n\xfb\x05\x00@\x5c\x00\x00\x16\x90\x0aJ\
-\xcd\x01\x80\xb8\x00\x00\x00\x00\x00\x80\xb8\x00\x00\x00\x00\x00\
-\xc4\x05\x00\x00\x00\x00 .\x00\x00\x00\x00\xb0f\xfc\x0f\
-*\x1e_V\xb0\x82\x04\xae\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x18x\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x1d\x00\x00\x007\x08\x06\x00\x00\x001*\x9e\x9f\
-\x00\x00\x01XiCCPICC Prof\
-ile\x00\x00(\x91m\x901K\xc3P\x14\x85O\
-j\xa4`E\xac88(dQT\xaa\x964\x0e\x8e\
-\xb5\xa0\x08\x0e\xa1*V\xb74M[1\xad\x8f$\xa2\
-\xce\x0e.\xce\xce\xd2\xc1\xfe\x01\xa1\x22\x22\xe2\xe4.\xa8\
-\xd5\x1f\xe0\xd6E\xc8\xa2%\xdeg\xaai\xd5\x0b\x97\xfb\
-\xbd\xc3\xe1\xbe\xc3\x05B\xa2\xc6\x98)\x02(\x95\x1d+\
-\xbd8/e66\xa5\xf0+DD0\x80\x11\x8ci\
-\xba\xcd\x92\xaa\xbaL\x16|\xcf\xcer\x1f \xf0y?\
-\xc5wU\x872\xd5P<\x1a\xad\x1c\xcd\xd6\x1d\xe5\xf2\
-\xfa\xaf\xbf\xa3zr\x86\xad\xd3\xfc\xa0\x9e\xd4\x99\xe5\x00\
-\xc28\xb1\xba\xe70\xce\xfb\xc4\x83\x16\x85\x22>\xe6\x5c\
-\xf0\xf9\x94s\xd6\xe7\xf3/\xcfj:E|G\xdc\xaf\
-\x17\xb5\x1c\xf1\x13q,\xdb\xa6\x17\xda\xb8d\xee\xea\xad\
-\x0c<}\xafQ^[\xa1\xd9G=\x8c\x14d(X\
-@\x02s\x88\xd3m\xfe\xf7*-\xef\x0e\x18\x0e`a\
-\x0b\x05\x14\xe1@B\x92\x14\x06\x13\x06\xf1\x12\xca\xd01\
-\x8d\x18\xb1L\xdbd$\xf8\x8d\x7f\xdf.\xd0\x8c\x0bZ\
-}H_\xd5\x03m\xbb\x01\x5cU(^#\xd0Fg\
-\xe8\xfd\x02\xdc\xe6\x99fi?\x17\x15\x5c\xd1\xce'd\
-\x9f#5\xa0\xfb\xc4\xf3\xde\xd6\x81\xf0\x04\xd0|\xf4\xbc\
-\xf7\x9a\xe75\xcf\x80\xaeg\xe0\xc6\xfd\x04\xddKb*\
-l\xe1Q\x9b\x00\x00\x00VeXIfMM\x00*\
-\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\x00\x01\x00\x00\
-\x00\x1a\x00\x00\x00\x00\x00\x03\x92\x86\x00\x07\x00\x00\x00\x12\
-\x00\x00\x00D\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x01\x1d\
-\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x007\x00\x00\x00\x00\
-ASCII\x00\x00\x00Screensh\
-ot[d\xf5-\x00\x00\x01\xd5iTXtXM\
-L:com.adobe.xmp\x00\
-\x00\x00\x00\x00<x:xmpmeta x\
-mlns:x=\x22adobe:ns\
-:meta/\x22 x:xmptk=\
-\x22XMP Core 6.0.0\x22\
->\x0a   <rdf:RDF xm\
-lns:rdf=\x22http://\
-www.w3.org/1999/\
-02/22-rdf-syntax\
--ns#\x22>\x0a      <rd\
-f:Description rd\
-f:about=\x22\x22\x0a     \
-       xmlns:exi\
-f=\x22http://ns.ado\
-be.com/exif/1.0/\
-\x22>\x0a         <exi\
-f:PixelYDimensio\
-n>55</exif:Pixel\
-YDimension>\x0a    \
-     <exif:Pixel\
-XDimension>285</\
-exif:PixelXDimen\
-sion>\x0a         <\
-exif:UserComment\
->Screenshot</exi\
-f:UserComment>\x0a \
-     </rdf:Descr\
-iption>\x0a   </rdf\
-:RDF>\x0a</x:xmpmet\
-a>\x0aP\x19\xf3\xe2\x00\x00\x14\x98IDATx\
-\x01\xed]\x09\x5cU\xd5\xf6\xfe\x98\x05D\x11D@q\
-\x00q\x16MS\x14\x11\xa7\x04\xd1\x9c\xd2&\xb5^\x83\
-\xafY}jei\xf6\xd2\xa24\xcd\xd2\xb2zf\xe5\
-\xffU6\x99\xcf!-\xe71\x14\x99\x0cAPD\x10\
-D\x04dF\x19/\xfa\xdfk_\xcf\xe1\x5c\xc6\x0b\xdc\
-\x0b\x17\xdc\x9b\xdf\xbd\xfb\xeci\xed\xbd\xbfs\xcf\xc7Z\
-k\xefs\x8eQFF\xc6\x1d\x88 \x10\x10\x08\x08\x04\
-\x1a\x09\x01\xd3\x8a\xfd\x94\x94\x94\xa0\xb8\xb8\x18eee\
-\xbc\xe8\xce\x9d\xbasR}\xdaT\x1c\x87H\x0b\x04\x04\
-\x02M\x8f\x80\x91\x91Q\x9d\x07!\xb5111\x81\x85\
-\x85\x05\xcc\xcd\xcd5dh\x90Naa!T*\x15\
-LMMaff\xc6+J\x024Z\x89\x84@@\
-  \x10\xa8\x06\x01I\xe9\xa0XR`,--\xe5\
-\xda\xc6\xd2\x11i8D8\xc4J\xc6\xc6\xc6 \xb2\x11\
-\x84#\xa1#b\x81\x80@@[\x04$\xee \x1e!\
->!^!~\x91\x82L:\xc4H\xa4\xe1\x88 \x10\
-\x10\x08\x08\x04t\x89\x00\xf1\x0a\xf1\x8b\x14d\xd2!\x1f\
-\x8e\xd0l$XD,\x10\x10\x08\xe8\x0a\x01\xe2\x15\xc9\
-GL2e\xd2\xd1U\x07B\x8e@@  \x10\xa8\
-\x09\x01A:5\xa1#\xca\x04\x02\x02\x01\x9d# \x93\
-\x0ey\x9a\x85y\xa5s|\x85@\x81\xc0=\x8f\x00\xf1\
-\x8a\xb4\xa2E`\xc8\xa4s\xcf##\x00\x10\x08\x08\x04\
-\x1a\x05\x01A:\x8d\x02\xb3\xe8D  \x10\x90\x10\x10\
-\xa4#!!b\x81\x80@\xa0Q\x10\xd0\xe9\xc6\x1c\x07\
-\x87}\x8d2h\xd1\x89\x1a\x81%K~\xc5\xeb\xaf\x7f\
-\xab\x15\x1cg\xca\xec\xb5\xaaw\xafV\xfa\xf9\xa3\x95\xf8\
-\xe4\x8dyZM\x7f\xe3\xab\x8b\xb5\xaa\xd7\xdc+\xbd3\
-g\x162\x07\x0f\xd5\xf94tJ:\xea\xd1%\xea|\
-\x90B`e\x04\x0e\x1eL\xae\x9cYK\xce\xd5\xc2Z\
-*\xdc\xa3\xc5WC\x8e\xd5y\xe6\xa3\xbbu\xa9s\x9b\
-\xe6\xd4`L\xd7\xaez\x1b\xae\x1eHGoc\x15\x82\
-\x05\x02\x06\x85\x80\xc7\xfc\x85\xb0\x0f\x0f\xe1\xda@K\x8b\
-\xb1{\x87\xde\xb0\x16>\x1d\xbdA+\x04\xb7t\x04Z\
-\x1a\xd1(\xe7\xa3\xcfs'HG\x9f\xe8\x0a\xd9-\x1a\
-\x01\xf2w(/\xd4\x96\x94\xd6\xe7\x89\x13\xa4\xa3Ot\
-\x85\xec\x16\x8d@K%\x1c\x9a\x97>\x83 \x9dZ\xd0\
-\xcd\xcd-\xbf;\xb6\x96\xaa\xa2\xf8\x1eC\xa0%i6\
-\x15\x09T\x9f\xa7\xb2\xc9\x1c\xc9\xc7\x8f_\xc1+\xaf\xec\
-\xe5s\x1b2\xa4\xa3<G33\x13\xf4\xef\xdf\x01\x94\
-\xe7\xe9\xe9\xc2\x1e&\xd6t\xbc\xb8j\xd5Il\xddz\
-\x0e\xcf<3\x08\xaf\xbe:B\x1ecK?\x88\x0b>\
-\x81\xd3\xdb\xb6\xc0\xa1kw\xf8\xcf[\xde\xd2\xa7[\xef\
-\xf9U\xbcP+\xa6/m\xfd\x1e\x0b\xce\x84\xc0\xfc\xe3\
-OPb\xd7\xbe\xd6x\xd8\xae\xdd\x98\xb3\xf2=\x830\
-\xd9\xea\x0d\x8a\x16\x0d\x9b\x8ctn\xdc(\x90\x87\x17\x1a\
-\x9a\x22\x1f\xd3\xc1\xe9\xd3W\xb1ys\x18||\xbab\
-\xc3\x86\x89\xecA@&\x1a\xe5\x8d\x95\x88\x8cL\xe3]\
-Iqc\xf5\xdb\xd4\xfd\xe4g\xa6#)2\x0c*\xc5\
-\x83\x97\x9azL\x86\xd8\x7fm\x9a\xce>{\x07D\x06\
-\x05\xa1\xacU+\x98\xc4\xc6\xd5\x1a[\x8d\x1b\xa7s\xc2\
-\xf9\xfb\xdb\xcd\xf8#\xf5\x06<O\x9c\xc4\xf8\x85\x8b\xb5\
-\x97\x9f\x5c\xf7-\x19\xda\x9e\xa3&#\x1d\xe5\x00\x7f\xfc\
-\xf1a9\x99\x9e~\x8b\x93\xceo\xbfE\xe3\xe4\xc9D\
-,^\xbc\x0f\x1b7>(\x977\xe6\xc1\xca\x95c\xf1\
-\xe7\x9fqx\xf0\xc1\x1e\x8d\xd9\xad\xe8\xab\x99 PQ\
-\xb3\xa9\x98\x9et\xe2(\x9c7oF\xdb\x0b\xd1\xc8\xed\
-\xdd\x97\xc7\xbbR\xd3\xb1s\xebVt\xe9\xd3\x07+'\
-\xf9\xcb\xf9T\xeez\xed\xaa\xce\x97\xdfC\xd8\xa3\xce\x0f\
-\xee\xdc\x89\x22\x7f\x7f<V\x87\xe5}}\x9e\x82\xa6\xb3\
-]\xee\xce\xca\xc3\xc3\x11\x03\x06\x94\x7f\xc6\x8fw\xc3\xdb\
-o\x8fF@\xc08^\xe3\xd8\xb1+\xc8\xccl\x9a]\
-m=z\xd8c\xc1\x82a\xe8\xde\xddN\x9f\xe7@\xc8\
-n\xa6\x08\xd4\xa6\xe9\xdc\x1e5\x16\xe3\xcaJ\xd0\xed\xb1\
-Yr\xdcGU\xca5\x1e\x07\x16+\xf3\xa9^\x9bI\
-\x93\xb5\xd7D\xb4$\x10\xab\xe4$\xde_\xab\xf4\xb4:\
-\x11\x9a>O\x89Ah:UMp\xca\x94^X\xbf\
->\x08ii7\x11\x16\x96\x82\xc1\x83\x9d\x99\xa9\x15\xc4\
-M\xad\xf9\xf3\x87\xe1\x97_\xa2\xf0\xd7_I\xe8\xd9\xd3\
-\x9e\x93\x14\xc9\x88\x8f\xcf\xe6\xdaQ``\x12\xbb\x95\x1e\
-\xf0\xf2\xea\x8c\x91#\xbb\xf0:T\xfe\xfb\xef\x17\x11\x1c\
-|\x0d}\xfb:`\xd6,\x0f\xca\xd2\x08d\xd6\xfd\xf1\
-\xc7%8:\xb6\xc6\xbcy\x9e\xd8\xbb7\x16AA\xc9\
-\xdc\xcc\xf3\xf3\xeb.\xd7\xad\xad\x9f\xa2\x22\x15\xde\x7f\xff\
-\x04\xaf\xbfl\xd9(XZ\x96\xc3,\xf5\xe1\xe2\xd2\x06\
-/\xbc0D\x96I\x07\xdf}\x17\x81K\x972As\
-\xf7\xf4\xec\xa4Qf\xe8\x89\x8c\xa4x\x5c\x0e\xf9\x0b\xf1\
-a\x81\xb8\xc3\xfe\x5c\x07y\xa1\xfb\x10otp\xedY\
-i\xe8\xd9)W\x11qp'\xd2\xe3/\xe2fv&\
-\xf3\x1d\xb9\xa3c\xaf\xfe\x184\xf1a\x18\xb37\x08P\
-\xb8\xc5\xf2\x8fn\xd9\x00S\xf6\x8c\xdd\xd1\xff\x98\x87\xb0\
-\xbd\xbf\x22>4\x90\xc9\xeb\x01\x9f9/\xc9e~/\
-\xbd\x89\xb3\x7fn\xe7\xe6`\xd6\xb5D\xd8u\xea\x8a~\
-c&\xa2\xa7\xd7\xd8J\xfd\xea:\xa3\xa2f\xa3M:\
-\xbf\x9b+L\x8a\x8aPlg_%\xc1\x84\xdbw@\
-\xd4\x9a\xd58\x92v\x03\xe6\x1b>\x83\xc7\x04\x7fL\xb8\
-v\x0d\x982]\xa3\xfe\xd5\xde\xfdph\xf5\x07\x08-\
-(B\xc6\x07\xab\xe1\xe81\x00\xc3\x8e\x1c\xe5&\x94#\
-#\xa4s\x8e\x1d\xf1\xdb\xc2\x7f!<;\x87\xf7\x17\x9e\
-\x91\x89\x0d,]\xdc\xb1\x13>d@\xd4F\x98\xba\xc6\
-J)O\xbe\x1a\x94\xcf\xbbPVh\xcac{{+\
-N:\xc9\xc9yL\xdbh\x87\x1d;b\xd0\xaa\x95)\
-RSo\x82\x1c\xd1\x14,,\xd4?\xd2C\x87\xe2\xb1\
-h\xd1>\x8d\xe7v\xd0\x05\xfe\xc9'\xa7\xb1n\xdd\x04\
-\x10i\x90o\x88d\x1c9\x92\x80G\x1e\xe9\xc7\x9e\x09\
-\xad\xa9\xe8\xfd\xf0\xc39.w\xf6\xec\x01\x5c\xf6\xd9\xb3\
-\xa9\xbc\xbe\xadm+\xde\x9e2\xb5\xe9\x87\xc6Hdu\
-\xfdz>&M\xea\xc1\xc9\x8f\x0bd_\xff\xfb_\x0c\
-3\xd9.\xf1\xb1<\xf5\xd4}|>R\xd97\xdf\x84\
-3\xad\xae\x003g\xf6\x95\xb2\x9aE|1\xf00\xb6\
-\x07,\xd6\xc0>!<\x08G\xbf]\x8f\x19o}\x84\
-\xde#}\xe5y\xc4\x9e>\x8a\xddk\xdfBq\xc1M\
-9\xefz\xecy\x9c;\xb8\x0b\xb1\xa7\x8e`\xe6\xdb\x1f\
-\xc3\xdc\xd2\x1a\x85y9\x888\xb0\x13f\x16\xad\x90w\
-#\x15\x97\xce\xa8I\x9cHH*353GAn\
-\x0ebN\x1e\x90e\xa5\xc6\xc5 \xfa\xf8>\x8cyj\
->\xbcg='\xe7\xeb\xe3\xa0\xb6\x0b\xb7\xaar\x9b\xa3\
-\xc7\xb9\xe6a\x91\x95Y\xe9\xc2\xdfq\xb3\x10+^z\
-\x14*\xf6\xda\x16\x22&\xf2\x05\x05\xad_\x8fM\xecM\
-\x0a\x9f\xa4\xa5c\xf0?\x9f\xe7\xc4\x13\xe5\xec\x82\xe5\xb3\
-\x1e\xc7\xa5\xbb\x84B\xf5b\xf6\xee\xc5a\x16\xff\x11\x12\
-\x8a\xf7\xbe\xda\x8c\x92}{\xb1=\xfc\xac,'3)\
-\x09\xdb\xd3\xd3a\xc6|LK\x96,\xd1 \xb0\xaa\xc6\
-i\xafc\x9f\x8e\x92_d\xd2\xd1\xc7Ii\x88L\xd2\
-\x16\x92\x92r\xb8\x082\xbf\xa4@\xf9\xa4\xc9\x90\x96@\
-+\x5cD\x08QQ\xe9x\xf3\xcd\x83\xfcG?mZ\
-o\xd0\x87\xc2\xae]\x17\xf8g\xd9\xb2Cpvn\x8d\
-\xb1c]\xd1\xa6\x8d\x05rs\x8b8)\x90\x16$\x85\
-\xfc\xfc\x12\x9c:u\x95'\xa7OW\xb7\x97\xca\xa4X\
-\xdb~\xc8d$\xd9\xdb\xb6\x9dGHH\x8aL:\xb7\
-o\xdf\x91\xfb())\xe3Z\xd7\xa8Q\xea{\x5c\x12\
-\x12\xb29\xe1\xd0\xf8\xa8}s\x09)\xb1Q\xd8\xb5f\
-)\xc7~\xc0\xf8\xa9\x18\xe0;\x8d\x0f\x9dH\xe4\xdc\xa1\
-\xdd\x9c`\xda881M\xc6\x03\xb7\xcbT\xd8\xb71\
-\x80\x13\x8e\xeb\xe0\xe1\xf0\x9c\xfe\x04\xac\xda\xb6\xe3\x1a\xd2\
-\xa9_\xbeA|\xf8iD\x1e\xfa\x1d\xf7Oy\x5c\x9e\
-~iq\x11.\x87\x9d\xc2\xc8\xd9\xcf\xa3\x8b\xc7\x10X\
-\xda\xb4\x95\xcbT\xa5%\xb8\x10x\x88iB\xaf\xc0\x8d\
-iU\xa49\x85\xef\xdd\x86\xeb\x97\xa2\xf1\xd7\x8f\x9b0\
-p\xc2Ch\xcdV\x8d\xf4\x15\xb4\xd1l*^\xd0\xd5\
-i:\x81V6X\xb5`!'\x9c\x87\x06\x0d\xc4\x98\
-\xa7\x9f\xe5>\xa0\x9f\x13\x12\xb9O\xe6\x8d_\xb6\xe1\xbf\
-v\xed\x80\x19\x8f`\xf7\x92\xd79\xe1\xf4d\xe9\xd7V\
-\x7f\x88~\x8c\x94\x8f\xc1\x04\xebW\xae\xc0\xdf\xd7Sq\
-x\xe3\xa7x\xf0\xb5%\xd8ae\x85\xaf\xa3/b\xdf\
-\xf6\xed\xb8\xcf\xdb\x1b\xcb\xc7\x8dF^\xff\x81\xb5\x13\xce\
-\xbd\xb8OG\xa5\xba\x8d\xd5\xabO\xe2\xe6\xcd\x12\xae\x11\
-T\xbc\x08\x97/\x1f\x0d2\xb1\xc8|\xea\xd3\xc7\x01_\
-~\x19\x02\x22#\xd2*\xde\x7f\xff\x01n\x9a\x90y\x12\
-\x10\xf0\x00\xc8GDe?\xfd\x14\xc9e\xf9\xfb\xbb\xf3\
-\xdf\xe0\x81\x03q\x1a\xbf\xc5\xa3G\xe3QZZ\x06w\
-w;n~i\x14\xdeMh\xdb\x0fU\xf7\xf6V\x13\
-Zh(S\x8d\xef\x06\x22-\x22<\x22\x16\x0aD\x9e\
-R\x90V\xf0\x86\x0fw\x81\x89I\xdd_p&\xc9i\
-\xec\xf8\xaf\xad\xff\x01\x11\x03\x994S^\x0b@\xd7\x81\
-C\xf9g\xf2\xab\xef\xa1\x97\xf7\x03\xbc,t\xf7\xcf|\
-XdV9\xb9\xf7A\x1f\x1f_\xcc|k\x1d\xdc=\
-Gq2\xf2y\xe2%\xf4\x1a9\x9e\xd7\xb9\x12\x11\x5c\
-i\x0a\xfe\xaf,\xe3&\x96\xeb\xa0\xe1\xbc\xbd\xb2\xc2\xd8\
-\xa7\x170Bz\x01\x1d{\xf6\xc7}\xfe31\xfdM\
-2\x1e\x00\x22\xa4\xd4\xb8heU\x9d\x1fW$\x14m\
-\xd26W\x12\xaa\xd4t~Z\xbb\x06\xb7\x8cM0\xd9\
-\xa3?\x161\xb3j\xfc\x1d\x15\xdcf\xcd\xc1G\x13\xc6\
-\xc3\xdb\xcf\x0f\xaa\xdc\x5cl\x89\x89\xe5\x84q2\xe5:\
-\xd7`\xa6\xcd\xfd'\xbc\x0b\xf2Q\xe63\x06\xd3\xad[\
-a\xe1;+0\xb6\x87;\xd2\xd9\xaaY\xc7\xf3\xe7`\
-\xcfL2\x17\xa6Q\x92&\xe4PX\xc0\xd3C\xb23\
-*iXU\x8d[\xe7`)\x04j\xda\x17\x8a\x82\xc6\
-:\xa4\xe5\xe8\xcf?\x0f\xe6\x9f\x8d\x1b\x83\xf1\xce;G\
-1u\xea\x8f\xa0\xd5+\x0a\x8b\x17\x8f\x90M(J\xd3\
-\xa3\x0f}}\xcb\xfd+\x94w\xfe|:Ex\xe2\x89\
-\x81<\x96\xbeXU\xcc\x98\xa16U\xa2\xa3o\xf0l\
-I\x0b\x223\x89\xc8M\x0a\xfb\xf7_\xe6\x87\xe4O\xa9\
-.\xd4\xa5\x9fa\xc3\x88<\x8c\x11\x19\x99\xce^\xbf\xa1\
-~[\xaaD2D\x98d\xdaIi\xea/$DM\
-NJ\xed\xab\xbaq\x18R>\x99F\x14\x86N\x9f\xa3\
-1,:O\xf7M\x98\xc1\xf3\xa4\x8b\xdf\xbe\xb3+\x1e\
-]\xb9\x91\x99\x5c\xeb`am\xa3Q\xdf}\xa8\x0fO\
-\xe7\xddPoS\x90\x0aI\x8e\xd2<\x93\xf2\xa5\xb8\xcf\
-\xa8\x09\xd2!\x8f\xc9\xa7c\xd7IM\xf8\xb9\xe9\xd75\
-\xcat\x9d\xd0\xa5\xa6\x13\x91\x99\xc5\x89d\xf2+\xf34\
-4\x91\xac\xfb=1\xbb\xa7;'\x8e\x84\x90`N\x18\
-\xae\xe6f<\xbdw\xcb\x16\x9c\xb2n#\xd7'\xe2Y\
-\xf9\xcd\xb7x\xcb\xf3~\x99X\x0a\x5c\xbap\xb9E\x1d\
-\x1c\xe5z\xda\x8c[\xd7X)\xe5\x19\x84yE\x1aD\
-\xc5@~\x91\x85\x0b\xbd\x18\x91\xa8\xfd+R9\xf9p\
-\xda\xb6Uk\x0a\x94\x97\x96v\x0b\x19\x19\xea=?/\
-\xbe\xf8;s\xda\x9aIUyL\x8eh\x0aqqY\
-(,Ta\xe0@'t\xedj\x8b\xc4\xc4\x1c\xd9\xc4\
-\xca\xcb+\xe6f\x8f\xb1\xb1\x11&O\xae\x9at\xea\xda\
-\x8f\x8d\x8d9\xeb\xcb\x11\xe1\xe1\xd7\x11\x11\x91\xca\xb5/\
-r|\xd3E\xe4\xe7\xe7\xce}Cg\xce$#%%\
-\x1f\x1d;\xda@\xd2tF\x8c(7\xf9\xf8\xc0\x0d\xf8\
-+?#\x9d;\x82i\x88?/\x7f\x19f\xec?\xaa\
-2P9\x85\x1b\x89\x97QZT\xc8\xca-\xb9\x89E\
-&T\xc2\xd9 \x90\xe3\xb7\xe8V>\x8a\xd9\x87|3\
-\x14\x08\x1fe05\xb7\xd00\xa9*\x96\xd9:Uv\
-\xb8\xdb\xbbtc\xb2i1\xa1\xfc\x9f\x8a\xb2\x9d\xae\x8e\
-\xab\xd2\x10j\xbb\xa0\xab\xf2\xe9\x5c\xe8\xdc\x0d\xb9))\
-\x9cH\x96\xbe\xfc2L\xed\xedaz3\x1f\xaa\xd66\
-<\xbe^X\xc4\x89#6+\x1bVA\x81\x981\x7f\
-\x01B\xe7\xcfCtF\x06^|\xf2I\xd8w\xe9\x02\
-/g'\x0c}\xe4QL\x09\x09B\xe6\xd0\xe12\xc1\
-X\xb1\x0d\x87\xa4\xe9\xd4u\xf5J\xd7>\x1d%\xe6\x06\
-A:\x8b\x16y\xc9c\x22g/\x99S\xb4+\xb9\xa2\
-\xa3W\xae\xa48\xc8\xc9)_No\xdf\xde\xaa\xd2\x8f\
-\xd6\xd2\xd2\x16W\xae\xe4\xf0e\xef\xc2\xc2R\xbe\x924\
-uj/|\xf6\xd9\x19\xec\xdf\x1f\xc7}/\xc7\x8e%\
-p\xd3\x8a\xcc5GGk\x85\xf4\xf2\xc3\xfa\xf43r\
-dWN:D(\xbd{\xb7\xe7\xbe\xa7~\xfd:\xc0\
-\xde\xde\x12\xe4\xcb!\xd2!\x22\xf2\xf2r\x01\xedO\x22\
-\xd3\xce\xc9\xa9uy\xa7\x06~T\x90\x97-\x8f\xb0u\
-;\xf6\x90\xb0\x0a\x84a\xd6\xc9\x92\x13K\xfb.n\xcc\
-\xcc*DiI\x11\xb6\xad\xf8\x17\x92\xa3\xff\xe6\xedh\
-\xa5\xca\x9a\xb5\xb3\xb6\xb5\x97IG\x16\xa8\xc5AE\x82\
-\xd2\xa2\x89N\xab\xd4F0U\x95W\xe5\xd31b\x8f\
-\x91 b \xe7q\x9b^\xbd`\x9e\x97\x8b\x12\xa6\x99\
-\xb4\xbe\x1b\xbb\xe5d#\x9e\x8d\xbcG;[\xa4\xb0U\
-\xab\xf1\xf1\x97`\xfb\xfd\x0f\xd8\xf7\xc5F\xec\x8d\xb9\x08\
-r\x12\xefbN\xe2=g\x82\xb1\xa1sg|\xf3\xec\
-S\xc0\x83S9\xf1\x18\xb4\xa6\xd3T'\x90\x08f\xee\
-\xdc\xc1\xf5\xfe1\xb8\xb9\xd9\xb1[%L8i|\xf1\
-\xc5d\xd0Rtm\x81H\x87L\xb9\xc3\x87\xe3\x999\
-7\x86\x91\xcfe\xded\xda\xb4\xaa\xb5\x1c*\xacO?\
-d*}\xfai\x10\xd3b\xaeqB)+\xbb\xcd\xc9\
-\x86\xe4\xd1n\xeb\xb5k\x03\xb9\x89ej\xaa\xfe\xef.\
-\xf9\x81\xa8\xbc9\x04\x22\x13\x13S\xa6\xea\xb3='\x8f\
-\xbd\xfb9l\xd9\xaaJM!d\xe7VN8\xb4\x22\
-5y\xf1\xbb|I]2\xb3h\xa5j\xcf\xc7\xff\xae\
-\xa9\xb9\xc1\x95\xe9J\xd3QM\x9a\x82V\xab\xd7\xa0\x88\
-\x11\xcfWO\xce\x86\xa5\xdfDYS\xa9\x8a\xb8\xa8\xdf\
-!\xcc\xd9\xeb\xbav\x1d\xde\x0a\x0bF\x98\x9d\x03\x82\xfe\
-\xbb\x05[C\xc3\x91u\xf5*\x96\xec\xda\x83\xed\xce\xce\
-\xdc\xc42\x14MG\xc9/M\xee\xd3i\xe8/\x89\xee\
-\xcd\xa2\xbd:\x14\x94>\x12InVV!\xf6\xec\xb9\
-\xc8\xb5\x1a)\xcf\xd9\xd9\x86\xaf|\x91Yu\xe0\xc0e\
-nZY[\x9b3\xa7\xb3\xa6\xafH\xaaOq}\xfa\
-!'\xb7\x9d\x9d%3\xaf\xd2@\xda\x14\x05\x1f\x1f\xb5\
-\xf9\xe4\xe6\xd6\x8e\x13$i;\xb4\xbcN\xa1\xb9\xf9s\
-\x88p:\xb8\xa9\xf7\xe1\x5c\x0e\x0b\xe4sP~\x15\xe4\
-f!\xea\xc8\x1eyI;12\x94\x17\xf7\xf1\xf1C\
-\xdf\xd1\xfe\x1a~\x9d\xc4*\x1c\xc8JY\x86x\x5c\x1d\
-!\xd4\x94_\x95\xa6\xe3x\xee,\xba\xf5\xf7\xe0\x9a\xce\
-\xfe\x82\xe2J\x84ct\xfc(~\xca\xc8F\xd8\xe6M\
-H\xea\xd5\x17\xc1\x9b\xbe\xc4\xaf\xd9y\xb0\x0d=\x03\xf2\
-\xf9\x90sx\xd6\x8aw\xf1\xdeC\xd3\xb8\xc6\x14\x7f\xee\
-\x1c\xd2\x07\x0e\xd6\xd0t\xf2\xdb\xd9U\x92[\xd38\xf5\
-\x89w\xb3'\x1d\x02\x87\x96\xc2)\xacY\x13\xc8o\xa1\
-\xe0\x09\xf6\x95\x9d]\x847\xde8\xc8\x96\xd3\x0f\xc9\x8e\
-i\xa9L\xd2j\x02\x02\x8es-\xc9\xd7\xd7Mc\xcf\
-\x8cTO\x19\xd7\xb5\x1f\xb26F\x8c\xe8\xcc\x1c\xc9*\
-\xec\xde}\x91\x13\x10\x99WR m\x87V\xe8hC\
-\x22\xf9\xb0\x06\x0f.\xbf\xf1U\xaac\xe8q\xcf\xe1c\
-\xf8\x10\x0f}\xf5\x11\xf7\xd3H\xe3%\xd3k\xe7\x87o\
-\xb2\xe5\xf4el\xf3\xdeo<\xbb\x9dsg\x1e\xd3\x0a\
-UI\xe1-\xa9*\xce\xfe\xb1\x0d\xe7\x8f\xfd)\xa7\x9b\
-\xcbA\xbd4\x9djV\xaf\xfc\xba\xb8p\xc2\xf8\xcf\xda\
-\xb5\xd8\x7f\xdbH&\x08cv+\xc5\xa2]\xbfc\xd5\
-\xf2\xe5\xd8\xcaL\xa9\x0e\x91\x7fc\x05K\x07,]\x8a\
-u\x11Qr=\x22\x90p\xf6F)2\xd1\xba\xf6\xeb\
-\x87\x0e\x11l\xcf\x17\xd3\x88\x9c\xb22\xb8\xdc\x983A\
-2\x11i3n}\x9e\x03\x83\xf0\xe94t\x82\xcf?\
-\x7f?bc3\xb8\xd6\xf2\xdcs\xbbA\xbe\x1d''\
-\x1b\x5c\xbeL\xce\xe3R\xd8\xd8XT\xbaK\xdc\xd7\xd7\
-\x9d-\xa9\x9f\x00i;\x14\xa6N\xadzo\x8erl\
-\xf5\xe9\x87\xb4\x97={b\xb9\x18:&g\xb5\x14\x88\
-th)\x9f\xc2\xd0\xa1\x9d4V\xe9\xa4:M\x19\xa7\
-\x5c\x8c\xc4\x07\x135W\x04\x95\xe3\x99\xb3\xfakx?\
-\xfe\x1c\xd2\x13b\x996s\x10?.}\x1e\xe4\xdbi\
-\xe3\xe0\x8c\x1bIj\xe7q+\xb6J\xf5\xc0\x5c\xf5\x83\
-\xcc{\xb3e\xf1\xe0\x1d\xdf\xf3\xcd~\x1f?2\x0aN\
-=\xfa\x2275\x99;\xa3i/\x0fm\x02lN\xa1\
-&M\xa1\xba\x0b\xbb*M\x87\xe4\xccX\xb6\x1c\xb1\xc9\
-\xd7\xb0/:\x06\xaf3gr@\xc7\x8e\xe8\xccV\xa9\
-.\xe6\xe4\xa24'\x07\x96\xed\xdbc\xe9h\x1f\xdc\x1a\
-\xee\x8d\xd9C\x06\xe3\xabc'\xf0\xc3\xa6M\xf8\x939\
-\x91\xef\xb3\xb7C|\xa9\x0a\x09QQ\xb8\xcd6\x12>\
-9\xd0C^\xbdr\xf1\xf3\x87\xc9\xf6\x1d\xc8b\xa6\xdb\
-L\xdf\xf1\xe85\xd4\x13_3\x90\xab\x1b\x9f\x94\xaf\xcf\
-\xf3\xd0d\x9a\x8e\xe4s\x94\xe2\xda&)]\xacR\xac\
-\xacOy\xabV\xf9\x82v\xf8\xd2\xfdRt\xafVT\
-T\x1a\xdf\x9fC\x0e\xdb\xef\xbe{\x88;r\x95m\xac\
-\xad\xcd\xf8\x1e\x1e\xca\xa3\xd5#\xba\xe8+\x06ilR\
-\x9f\xf5\xe9\xc7\xcb\xab\x8b\xec\xdc&\xc7\xb22\xd0^\x22\
-\xd2p(\x18\x92?Gi\x7f\xd3N\xd2\xea>4n\
-#ccL}\xfd\x03\x0c\x9b\xf9\x0f8ts\xc7\xad\
-\x9c,\xd0\x86A\x15\xdb\xbb\xe3\xee\xe9\x83'\xd7\xfd\x1f\
-\x1c\xbb\xab\x09\xbdS\xef\x01j\xdf\x0f\xdb\xa2O~\xa0\
-k1\x11(\xcc\xcf\xc3\xf0\x87\x9f\xc6\xb8\xb9\x8bH\x9c\
-\xec\x8c&\xb9<y7\xe6\x89\xbb_5\x95\xf16F\
-w\xdb\xa2\x9c\xe0\x95\xeduu,]\xa0u\x89m\x12\
-\xef\xee\xd3a\xb7y(\xdb9\xfc\x1d\x86\xd7>\xfd\x0c\
-\xcf\x8c\xf4\xe67\x83\xe6]g\xab\x9e\xa9i|\x7f\x8e\
-\xe7\xd8\xb1\xf8\xe1\xa5\x17\xe00\xed!\xae\xd9<\xf1n\
-\x00\xfe=\x83\xdd\x16\xc1\x08\x87\x9c\xc8\x07b. 1\
-\xfa<\x5c\x98\x13\xfa\x8bg\x9f\xc6\x18\xb6\xc9P\x22D\
-\xda\xef3w\xc1\x02t\xb2bN}U\x19B\x8f\x1f\
-\xd3\xe8W\xaaW1\xd6\x15FU\xc91\xca\xc8\xc8\xb8\
-C\x05\xd9\xd9l9\x8e\xed`lHP\xbf\x82&\xb1\
-!\x22t\xd2\x96H'?\xbf\x98\xedB\xb6\xd1\xab\xf6\
-\xd0X\xfdT\x05\x0a\xbd\x0d\xe2\xe0\xc1kuz\x05M\
-c\xbc\x0d\x82H\xa7\xe8f\x1e\xdavpf\xf7M\x95\
-om\xa88\x07\xa9\x9e-# \x13v;CS\x06\
-z\x1bDR\xf0\xf1:\xbd\x82\x86\xde\x061\x86\xed\xf2\
-U\x12G\xc5\x0b\xb7!\xe98Ww\x98\xb2\xe5q\x8b\
-\x07\xfc\xe0\x1c\x15Qm?Wz\xf4F\x193\xc1,\
-\xc7O\xe0\x1b\x02\xab\x1bO\xc6\xa0!(=|\x009\
-\x03\x06\xa1Orb\xb5\xf2\xa4\xf6\xa0\xdb \x5c\x5cx\
-=]\x9c\x9b\x82\x82\x02\xb4k\xc7vT\xb3\xd0d\x9a\
-\x8e.&R\x9d\x0cZ\x92\xee\xd6\xcdV\xaf\x84C}\
-7V?\xd5\xcd\xd3\x10\xf3\xadm\x99\xc3\x92\xed\x93\xa9\
-\x89ph\xdcR\xbd\xa6&\x9c\x86`(]\xa0\xfa\x88\
-\xdd\x13\xe2`3qr\x8d\x84C\xfdv\xbbt\x01\xb6\
-ly\x9cv \xd74\x8e\xf6gCa\xce\x88I\x1b\
-\xc2!9\xfa\x0c-\x92t\xf4\x09\x98\x90-\x10\x90\x10\
-h\x88&S\x13A\x18\x82\x5ci\x8e\xfa\x88\x05\xe9\xe8\
-\x03U!\xf3\x9e@\xc0\xd0\x89\xa3!\xe3\xd3\xe7\x09\x14\
-\xa4\xa3Ot\x85\xec\x16\x8d\x80!h$\x0d!\x96\x9a\
-\xc6\xaf\xcf\x13\xa7\xf3%\xf3\xfa\xbc\xeeV\x9f\x13\x14\xb2\
-\xcb\x11\xa8\xcf\xebs\xcb[\x8b#%\x02\xfc\xb5\xbb\xcc\
-\xd9*\xdd\xa3\xd4\xd2b\xe5\x5cu}\xacS\xd2Y\xb2\
-\xe4W]\x8fO\xc8\xd3\x11\x02?\x7f\xb4RG\x92\x84\
-\x98w\xe6\xcc\x12 4\x00\x01\x9d.\x997`\x1c\xa2\
-\xa9@@ \xd0\x82\x11h\xf1K\xe6-\xf8\xdc\x89\xa9\
-\x09\x04\x9a=\x02\xc2\x91\xdc\xecO\xa1\x98\x80@\xa0y\
-! H\xa7y\x9d/1Z\x81@\xb3G@&\x1d\
-\xba\xdfF\xf9\xc4\xf6f?31\x01\x81\x80@\xc0 \
-\x10 ^Q\xde\xcf'\x93\x8eA\x8cN\x0cB  \
-\x10h\xf1\x08\x08\xd2i\xf1\xa7XLP `X\x08\
-\xc8\xa4c\xc2\x9eW+\xcc+\xc3:9b4\x02\x81\
-\x96\x80\x00\xf1\x0a\xf1\x8b\x14d\xd2\xb1`o\x15T\xa9\
-TR\xbe\x88\x05\x02\x02\x01\x81\x80N\x10 ^!~\
-\x91\x82\xbc#\xd9\x9c\xbd\xae\xb5\xac\xac\x0c%%%\xec\
--\x0c\xa6\xb2\xe3G\xe9\x00\x92\x1a\x89X  \x10\x10\
-\x08T\x87\x80d1QL\x84C|B\xfc\x22\x05\x99\
-t(\xc3\x92=\xea\x90H\xa7\xb8\xb8\x98\x13\x10\xe5I\
-\x02\xe8X\xdbP\x9f6\xda\xca\x16\xf5\x04\x02\x02\x81\xc6\
-C\xa0>J\x87\xd4\x86L*\xd2p\x94\x84C#\xd7\
- \x1d\xca\xa0\x0a\x15+Q\xbe\x08\x02\x01\x81\x80@@\
-\x17\x08\xc8>\x1d]\x08\x132\x04\x02\x02\x01\x81@m\
-\x08\xfc?'(\x02\x86\xbc+\x0c\x96\x00\x00\x00\x00I\
-END\xaeB`\x82\
-\x00\x00^\x12\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x03\xeb\x00\x00\x00s\x08\x06\x00\x00\x00\xe0\xdd\x93\xfa\
-\x00\x00\x01XiCCPICC Prof\
-ile\x00\x00(\x91m\x901K\xc3P\x14\x85O\
-j\xa4`E\xac88(dQT\xaa\x964\x0e\x8e\
-\xb5\xa0\x08\x0e\xa1*V\xb74M[1\xad\x8f$\xa2\
-\xce\x0e.\xce\xce\xd2\xc1\xfe\x01\xa1\x22\x22\xe2\xe4.\xa8\
-\xd5\x1f\xe0\xd6E\xc8\xa2%\xdeg\xaai\xd5\x0b\x97\xfb\
-\xbd\xc3\xe1\xbe\xc3\x05B\xa2\xc6\x98)\x02(\x95\x1d+\
-\xbd8/e66\xa5\xf0+DD0\x80\x11\x8ci\
-\xba\xcd\x92\xaa\xbaL\x16|\xcf\xcer\x1f \xf0y?\
-\xc5wU\x872\xd5P<\x1a\xad\x1c\xcd\xd6\x1d\xe5\xf2\
-\xfa\xaf\xbf\xa3zr\x86\xad\xd3\xfc\xa0\x9e\xd4\x99\xe5\x00\
-\xc28\xb1\xba\xe70\xce\xfb\xc4\x83\x16\x85\x22>\xe6\x5c\
-\xf0\xf9\x94s\xd6\xe7\xf3/\xcfj:E|G\xdc\xaf\
-\x17\xb5\x1c\xf1\x13q,\xdb\xa6\x17\xda\xb8d\xee\xea\xad\
-\x0c<}\xafQ^[\xa1\xd9G=\x8c\x14d(X\
-@\x02s\x88\xd3m\xfe\xf7*-\xef\x0e\x18\x0e`a\
-\x0b\x05\x14\xe1@B\x92\x14\x06\x13\x06\xf1\x12\xca\xd01\
-\x8d\x18\xb1L\xdbd$\xf8\x8d\x7f\xdf.\xd0\x8c\x0bZ\
-}H_\xd5\x03m\xbb\x01\x5cU(^#\xd0Fg\
-\xe8\xfd\x02\xdc\xe6\x99fi?\x17\x15\x5c\xd1\xce'd\
-\x9f#5\xa0\xfb\xc4\xf3\xde\xd6\x81\xf0\x04\xd0|\xf4\xbc\
-\xf7\x9a\xe75\xcf\x80\xaeg\xe0\xc6\xfd\x04\xddKb*\
-l\xe1Q\x9b\x00\x00\x00VeXIfMM\x00*\
-\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\x00\x01\x00\x00\
-\x00\x1a\x00\x00\x00\x00\x00\x03\x92\x86\x00\x07\x00\x00\x00\x12\
-\x00\x00\x00D\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x03\xeb\
-\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x00s\x00\x00\x00\x00\
-ASCII\x00\x00\x00Screensh\
-otEbk\xbd\x00\x00\x01\xd7iTXtXM\
-L:com.adobe.xmp\x00\
-\x00\x00\x00\x00<x:xmpmeta x\
-mlns:x=\x22adobe:ns\
-:meta/\x22 x:xmptk=\
-\x22XMP Core 6.0.0\x22\
->\x0a   <rdf:RDF xm\
-lns:rdf=\x22http://\
-www.w3.org/1999/\
-02/22-rdf-syntax\
--ns#\x22>\x0a      <rd\
-f:Description rd\
-f:about=\x22\x22\x0a     \
-       xmlns:exi\
-f=\x22http://ns.ado\
-be.com/exif/1.0/\
-\x22>\x0a         <exi\
-f:PixelYDimensio\
-n>115</exif:Pixe\
-lYDimension>\x0a   \
-      <exif:Pixe\
-lXDimension>1003\
-</exif:PixelXDim\
-ension>\x0a        \
- <exif:UserComme\
-nt>Screenshot</e\
-xif:UserComment>\
-\x0a      </rdf:Des\
-cription>\x0a   </r\
-df:RDF>\x0a</x:xmpm\
-eta>\x0a\xb1k\x0b\x8b\x00\x00@\x00IDA\
-Tx\x01\xed\xdd\x09\xbcm\xe5\xfc?\xf0u\xef=\xdd\
-\xea6\x97\x0aE\xd7\x9cH\x86\x08\xa1\xab2\xcf\x94d\
-j@H\xc8\x10IR\x91\xa1\x9f!S\xf8KB4\
-\x10E\xca\x14J\x83\xa4(\xa42\x15B\x86h\x1e\xef\
-\xbd\xff\xf5~\xae\xe7\xb4\xee\xbak\xaf\xbd\xf79\xfb\x9c\
-\xb3\xcf9\xdf\xef\xeb\xb5\xf7\xda{\xadgZ\x9f\xb5\xd6\
-\xf3<\x9f\xef\xf7\xfb|\xd7\x9c\x7f\xfc\xe3\x1fK\x8b\x90\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \
-\x10\x08\x04\x02\x81@ \x10\x18\x1a\x04F\xe6\xcc\x99S\
-,Y\xb2dh\x1a\x14\x0d\x09\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04f\
-3\x02\xf3\xe6\xcd+\x12Y_\xbaty\xe3\xfa\xa5\x97\
-^Z\x9c{\xee\xb9\xc5\x85\x17^X\x5cq\xc5\x15\x09\
-\xa3M6\xd9\xa4\xd8b\x8b-\x8a\xad\xb6\xda\xaa\xb8\xdf\
-\xfd\xee\xd7\x13n\x83*\xa7\xa7\xca\x22Q \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ 0\x03\x10\xc0\xd1\xe7p\x83_\xbcx\xf1\xe8\xe9\
-|\xeb[\xdf*N>\xf9\xe4\xe2o\x7f\xfb[\xb1\xd2\
-J+\x15s\xe7\xceM\xc7X\xdfo\xbb\xed\xb6\xe2.\
-w\xb9K\xf1\xf4\xa7?\xbdx\xda\xd3\x9e6\x9a\xa7\xe9\
-\xc7\xa0\xcai*;\xf6\x05\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x023\x15\
-\x01<|\xceUW]5J\xd6\x11\xec/}\xe9K\
-\xe9|W]u\xd5D\xd6GFF\xd2\xff\xdbo\xbf\
-=\x91\xf5\x9bn\xba)\xfd\x7f\xd1\x8b^\xd4\x91\xb0\x0f\
-\xaa\x9c\x99\x0a|\x9cW \x10\x08\x04\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \xd0\x09\x01\
-n\xf0\xf3\xf6\xd9g\x9f\x03Y\xcd/\xbb\xec\xb2\xe2\x98\
-c\x8e)n\xbd\xf5\xd6b\x8d5\xd6(\x9e\xfd\xecg\
-\x177\xdexc\x81\xac\xaf\xb2\xca*\xc5z\xeb\xadW\
-l\xbb\xed\xb6\xc9-\x9e%\xfe\xca+\xaf,\xeey\xcf\
-{\xa6\xfd\xd5\x0a\xea\xe5\xac\xbb\xee\xba)\xff\xfc\xf9\xf3\
-\x0b\x1fe\xad\xb6\xdaj)K[9\xd52\xe3w \
-\x10\x08\x04\x02\x81@ 0l\x08\xdc|\xf3\xcd\xc5y\
-\xe7\x9dWl\xbc\xf1\xc6cn\x1aE\xf85\xd7\x5c\x93\
-\xc6\xc61\x172\xc0\x8c\xa5\x02\xbf\xf8\xd3\x9f\xfeT\xdc\
-\xe9Nw\x1a`\xa9\x83)\xca\xfc\xe2\xd7\xbf\xfeu\xf1\
-\xcf\x7f\xfe\xb3\xb8\xeb]\xef:\x98B\xbb\x942\x88k\
-\xdc\xa5\x8a\xd6\xc3\xea\xff\xd7\xbf\xfe5:ojM<\
-\x01\x07o\xb9\xe5\x96\xe2\xac\xb3\xceJs?s\xb7\x05\
-\x0b\x16L@-Qd \x10\x08\x04\x02\x81@'\x04\
-F\x10f\xfe\xf0\xe7\x9f\x7f~\xf1\xef\x7f\xff\xbbXs\
-\xcd5\x93\x9b\xfb\xcb^\xf6\xb2\xe2\xaf\x7f\xfdk\xf1\xa1\
-\x0f}(\xe5}\xe3\x1b\xdf\x98\x06Gi\xb9\xc9K+\
-\xcf}\xees\x9f\xe5\xca\xae\x96\xb3\xd6Zk\xa5c\x8f\
-{\xdc\xe3\x12\xd1\xaf&\xfc\xc1\x0f~P|\xf3\x9b\xdf\
-\xecXN5m\xfc\x0e\x04\x02\x81@ \x10\x18<\x02\
-\x87\x1f~xq\xfc\xf1\xc7\xa71 \x97.\xe8\xe8\x0b\
-_\xf8\xc2b\x8f=\xf6\xc8\xbb\x86r\x8bD|\xees\
-\x9f+^\xf9\xcaW\x16\xda\x5c\x97m\xb6\xd9&\xed\xa2\
-\x95F2\xfc\xdf{\xef\xbd\x93\x02\xba\x9ev\xac\xff\x91\
-\xa8C\x0e9$\x8deme\x9cx\xe2\x89i\xbc|\
-\xe8C\x1fZ\xfc\xe2\x17\xbf(\x0e:\xe8\xa0\x94\x9c\x17\
-\xda'?\xf9\xc9\xf4[,\x98\xf7\xbf\xff\xfd\xa3\xed\xfb\
-\xc9O~R\xbc\xe7=\xef)\x9e\xfa\xd4\xa7\x16\xafz\
-\xd5\xab\x96+\xfe\xec\xb3\xcf.\xf6\xdbo\xbf\xb4/\xc7\
-\x9c\x81\xc1\x03\x1e\xf0\x80\xe2\x13\x9f\xf8\xc4ri\xfb\xfd\
-C\xf9\xa0\xeew\xbd\xeb]\xfdf\x1dW\xfa\x03\x0f<\
-\xb0x\xd0\x83\x1eT\xfc\xfc\xe7?/\x1e\xf6\xb0\x87%\
-\x83A\xbd\xc0\xaf~\xf5\xab\xc5\xd5W_]<\xf2\x91\
-\x8fLi\xf2\xf1\xdf\xfc\xe67\xc5k^\xf3\x9at\x8d\
-\xdf\xf9\xcew\xe6\xddi{\xfd\xf5\xd7\x17\xbb\xee\xbak\
-A)\xe2:\xd4\x05~_\xfe\xf2\x97\x8b\xcf~\xf6\xb3\
-\xc5{\xdf\xfb\xde\x14\x97\xa7\x9a\xa6\xed\x1a\xef\xb6\xdbn\
-\xa9\xde-\xb7\xdcr4\xcb\x07>\xf0\x81b\x83\x0d6\
-(^\xfa\xd2\x97\x8e\xeek\xfbq\xc6\x19g\x14\xdf\xff\
-\xfe\xf7\x8b\x83\x0f>x\xb9d\x0c'\x87\x1ezh\xe1\
-8\x03\x8ae\x88\xae\xb9s'\x9e\xdb\xad\xb7\xde\xba\xd8\
-h\xa3\x8d\x96\xcb7\xe8?\x9e\xb3K.\xb9\xa4\xf8\xe1\
-\x0f\x7f\x98\x9e\xb5\xfc\x5c\x0d\xba\x9e(/\x10\x08\x04\x02\
-\x81@`E\x04\x18\xd4\x93\x8f\xbb\xc1Jg\xcc\xf5\x9d\
-\xf5\xdb\xe0\xf0\x84'<\xa1\x10T\xee\xcdo~s\xca\
-y\xe7;\xdf9iV\x1d\x93FZy\xf2D!\x17\
-_-'\xefc\x917\x10W\xc5\xff\xef|\xe7;\x1d\
-\xcb\xa9\xa6\x8d\xdf\x81@ \x10\x08\x04\x02\x83G\xe0\xd5\
-\xaf~u\xe1\x83\xd0\x88E\xf2\xdd\xef~7\xf5\xefj\
-\xaa\xf7\xed\x83\xaf}|%Z\x92\xc5\x1b\xec\xe5/\x7f\
-y\x81\x90\xd7\xe5\x1e\xf7\xb8\xc7(\x91\xfa\xe5/\x7f\x99\
-H\xf5\x09'\x9cP<\xff\xf9\xcf\xaf'\x1d\xf3\xff\x8c\
-Q\xdev*\xc8\x98)\x06\x8cv\xfa-=\x12\xf8\xf1\
-\x8f\x7f\xbc@\xee(\xbd\xdf\xf4\xa67\xa5\xf3y\xf1\x8b\
-_\x9cH\xe5\xd1G\x1f]8\x07i\xeb\xe5?\xeaQ\
-\x8fJ\xe4I}\xce\x9fb\xe5\x11\x8fxD\xaa\xbe\x9e\
-\xb6S\x9b:\xed\xcf\xf9\xf3\xb6S\xbaA\xef\x87\x0bO\
->8\xf9t\xaa\xff\xb1\x8f}l\xf1\x8cg<c\xf4\
-\xb8\x89\xcc\x07?\xf8\xc1\x84\xa1<\xf5|G\x1eyd\
-\xf2\x00\xe41P?\xe6\x1c(N\x1cC\xb0\x95UO\
-\x93\xff\xe7m\xf5\xbc\xed\xcb\x9f\xbc?\xffoJ\x9f\xd3\
-T\xb7\x9d\xd2\x9fs\xce9\xc9\x8b\xe0+_\xf9J2\
-\xa20n8\xcf\xe3\x8e;.)\xa7(z\xdc\x1f\x13\
-\xeda\xb0\xfa\xea\xab\xa7{\xec\xf7\xbf\xff}jv\xaf\
-\xe7U=\xc7\xf8\x1d\x08\x04\x02\x81@ 06\x04(\
-\xe2G\xf2@\x91\x03\xca\x19$o\xb8\xe1\x864\xc9\xa1\
-\xf1\xbf\xdb\xdd\xee\x96J\xff\xf3\x9f\xff\x9c\xf6\xad\xbc\xf2\
-\xca\xc9]O:y\xea\x1dw\xb5\x1c\x84\xdc`B>\
-\xff\xf9\xcf\xa7\xed\x1f\xff\xf8\xc7\xc2~\x92\x07\xe5\xa6r\
-R\x82\xf8\x0a\x04\x02\x81@ \x10\x98p\x04r?\x9e\
-\xc7\x03\xfd4+\xa3\xe5O,\xc1\xa7\x9ezj\xf1\xbd\
-\xef}/Y\x1f\xff\xfb\xdf\xff\x16\x0f~\xf0\x83\x8b\xb7\
-\xbf\xfd\xed\xc9\xe2\xc7\x82\xc8\x12\xca:h\xbc@\xfe7\
-\xdf|\xf3\x82\xd7\x162\xfa\xa3\x1f\xfd(\x91\x8b\x9dv\
-\xda\xa9\xf0\xe1\x99\xc5z\xfa\xf7\xbf\xff\xbd@\x00\xe4e\
-1d\xfd\xb6\xf4\x8au\x99\x87\x167leS\xf6\x12\
-\xbf\x1f\xf8\xc0\x07&\x92\x8a\xb4\xbc\xe3\x1d\xefH\xfbw\
-\xdcq\xc7\xf4[\x9b\xaaR='\xf9\x1e\xff\xf8\xc7\x17\
-\x17_|qr9\x7f\xdf\xfb\xde\x97\xda\xc0\x93\x8c\x17\
-\xd9\x13\x9f\xf8\xc4\x22\x9f3K%\xcb\xb2v\xbd\xe1\x0d\
-oH\x18P\x0c\xc8\x93]\xde_\xfb\xda\xd7\xa6s\xac\
-\xd6\xc15\xfb\xa4\x93N*X[\xeb\xca\x03D\xd4\xd8\
-\xe9\x93\xc9\xbas\xbc\xef}\xef[\xdc\xff\xfe\xf7O\xcd\
-\xdea\x87\x1dR\xcc\x18\xf1`,\x17\xfb\xf4\xa7?\x9d\
-\x88Y\xbe&\xd5s\xab\xff\xcei\xf29\xf4r\xdd2\
-\xd6?\xfb\xd9\xcf\x8a\xb5\xd7^;\xb5{\xfb\xed\xb7\x1f\
--Z\x99p`q\xe6=\x80\xcc\x92\xff\xfc\xe7?\xc5\
-^{\xedU|\xe1\x0b_H\xe7\xb9\xe7\x9e{\x16\xcf\
-{\xde\xf3\x8a\xed\xb6\xdb.y\x18\x98+\xd8\xc7k\x83\
-B^9O~\xf2\x93\xd3}\xf1\xd3\x9f\xfe\xb4@>\
-)(\xc8\x8f\x7f\xfc\xe3\xe2\x94SNI\xf7Z\x15#\
-8\xc9W\x97|\x9e\xd5cH\xab\xb9\x84k\xe8^\xad\
-\x1e\x83\xc7i\xa7\x9dV\xb0\xb6#\xe5\xd5c\xb9\xecM\
-7\xdd4\xdd\x7f\xda\x9c\xcb\xcf\xc7ls\x1e[s\x95\
-\x03\x0e8 )G\x1e\xfe\xf0\x87/w\xac\x9eGz\
-\x0a\x98\xfcF\x1d\xffy\x0e\xd4-\xff\xd5\xf2\xabeP\
- \xb8\x8e\xc8\xb24Oy\xcaS\xd2|\x8aB\x81\xd7\
-\x83\xa5\x0a\xce\xe9\x05/xA\xf2\x84\xf1\x9c\x1du\xd4\
-Q\xc9\xf3\xc0\xbd\xfe\xfa\xd7\xbf>\x05\x08\xae?7\xe6\
-dM\xf7\xb2\xba?\xf3\x99\xcf\xa4k\xe6\xf7\x93\x9e\xf4\
-\xa4\xe2\x15\xafx\x85\x9fI\xb4!\x7f\xf2\xbe\xd8\x06\x02\
-\x81@ \x10\x08L,\x02\xfa\xdd\xb9Y\x93,\xda\x9c\
-\x09\x86\x8f\xc1\xc1\xe0]\x17\xfb\x1c\xcb\xe9\xe4\xc9\x9dw\
-\xdeV\xcb1(\xec\xb2\xcb.\xcb}2yWv[\
-9\xb9\xbc\xd8\xde1@\x06\x16\x81E\xdc\x03q\x0fL\
-\xc4=\xa0?\xae\x96\xcb\xe5\xd6\xfa`\xe4\x8d5\x1a\xf1\
-FT\x11d\xae\xc8\x88\xde\xb7\xbf\xfd\xed\x94\xc7\x92(\
-D\x8b\xc5\x0fa\xe6R\xac,\xd6lk]\xfd\xff\xd8\
-\xc7>\x96\xca\xb3\xfeV^$\x0dIF\xdc\xa4\xa5\x18\
-\xb6\xfd\xc8G>\x92\xc6\x85c\x8f=6\xb9\xac#\xe5\
-\xc8\x9fc\xea\xe1\xd1\xc5\xfd\x97\xcb8\x12i\xbfz\xbd\
-V\xd4\xef\xea\xa7zN\xce\xc7Zgo3\xd1\xae\x85\
-\x0b\x17\x16_\xff\xfa\xd7\x13\xe9\xd46\xe3`>g\xa4\
-S\xfd\xdaI\x01\xa1Li\x10H\xed\xddy\xe7\x9d\x8b\
-\xfd\xf7\xdf?\xa5W\x07\x91\x06Yg\x0dE\xec\xab\xed\
-\xf0\x1bI\x13\x07\x06>\xcfz\xd6\xb3\xd2q\xe7u\xf7\
-\xbb\xdf}4-E\xc7_\xfe\xf2\x97\xf4\x1f\xf1\x5cg\
-\x9du\xd2\xef\x5c~\xbd\xcc\xfc\xbfz<\x9fC/\xd7\
-\x0d\xd6\x04~\x96\xb9\xc1\x9a\x8by.\xd7\xeb[\x0f;\
-\xec\xb0Dd\xd7_\x7f\xfd\xd1\xfd\xe6\x01\xc6n\xf7\x87\
-\xd85\x7f\xf8\xc3\x1f\x8a3\xcf<3\x1d\x97\xe7\xde\xf7\
-\xbew\xdaO\xa9\xc3\xaaM\xe9\x80P\xff\xeew\xbfK\
-\xd7\x89\xf7\x9d|\xea\xa1\x00\xb24\xc0\xefg>\xf3\x99\
-\x09\x1f8\xc1+\xb7\xa3\xba\xad\x9e\xab\xfd\xda\xeb>\xe0\
-\x01\x98\x97B\xe4\xf4\xae\xa9s\xda}\xf7\xdd\x0b\xb1s\
-\xeays:\xca\x1e\xe7\x93\xff\xd7\xb7)c\xf9\x85\xa8\
-\xab\xc7\xf5\xe7\xf6.\x1d\xa1l\xd0\x86\xfc\xc9\x1e\x87\x8e\
-SJ\xb8g\x90h\xca(\xd7\xb5^~\xa7\xff<\x08\
-(\xb4<'G\x1cqD\xba\x7f7\xdbl\xb3t\x9e\
-\x14\x06\xee\x17[\xed\x81\xa7%\x8be\x0c\xa2\x82G\x86\
-k\xe29Uv\xfd\xb9\xe9t/S\xc8y.-\xa3\
-\xf0\xf1\xdb\xbe\xdc>\xe7\x9a\x7f\xc7v\xf9\xbe&\xf0\x08\
-<\xe2\x1e\x88{`\xa2\xee\x01}\xefH\xee\x80Y\x13\
-\x0c\x0c&e\x06\xe3\xb7\xbd\xedm)hN\xd6\x0as\
-\x89\xa7\x8dem1\x08\x1b\x08\xe5\xd1\xb8\xaaT\xcb\xa9\
-\xee\xaf\xfefY\xb7f]]\x9d\xca\xa9\xa6\x8f\xdf\x81\
-@ \x10\x08\x04\x02\x13\x87@\xee\xc7\xab\x83\x0d\xcb6\
-\x0b]\x16\xee\xd6,\xadH\xfbE\x17]\x94\x08o\xce\
-g]5k0+8\xc2`?K,/-\x84e\
-\xab\xad\xb6JVj\xa4\x9e h\xd9\x12\x8e,!\x1a\
-\xf2\xb0\xb8\xb3\x16\x0ab\x85\xb0\xb1\xd0\xab\xcb\xb8B\x9e\
-\xf3\x9c\xe7\x8c\x06\xda\xcau\xdb\xe6\xdf)\xd1\xff\xbeX\
-U\x91+\xf5\xb0\xe0\xb3R>\xf7\xb9\xcfM\xc4\x8d\xbb\
-\xf5\xd7\xbe\xf6\xb5de\xbf\xee\xba\xeb\x0aJ\x04e \
-u\x8f~\xf4\xa3S\x09\xb6\xbf\xfa\xd5\xaf\xd2~\x84\x0c\
-yB\x80\x88\x80p\xca\xd7\xce\x5c?\x0b-\xcb$\xa9\
-\xb7G\xb9\x990j\x87\xe3\xd6Pg\x85\xb7<\x08\xa3\
-}\xd5\xbc\xb9\xec\xea>i\xabRM\xe3w\xaf\xd7\xed\
-\x82\x0b.\x18\xc5\xfa!\x0fyH\x22\xd4\xcaU\x86\xeb\
-l\xc9\x9b\xf31\xf6\xd7\xeb\xe7r\x7f\xe1\x85\x17&%\
-\x0dL)5\xb4\x9d\x22\x04\xf17\x87\xe0)`\x9c\xbf\
-\xf6\xdak\xd3}@\x99q\xaf{\xdd\xabX\xb4hQ\
-\xc1\x0a\xecZ\xf2.`\x01V\xbe\x80\xb5\x04>\xa4^\
-gu_>\xc6z\xef\xde\xd3Fu\xdb\x9f\x8fQ\x10\
-\x10\xc7)AH>\x96\xfet\xf8\xaa\xa7\xf1\xdf\xf5F\
-\x8a-7\xd0\xfej\x1a\xf7R\xbe\xaf\x15YU\x1a\xf8\
-/-\xcf\x04\xcf\x92\xe7\xa0\x9a\xd7\xf1,\xf5\xfd\x14$\
-b2P\x84x\xe6\xdc\xcb\xbc=\x94\x95E\x1e\x1f\xd7\
-\x02\xce\xbc$|`\x0dc\xd7\x80T\x9f\x9bN\xf7\xb2\
-g\x0fV\xea%~\xdb\xc7\xc2Nr\xfb\xf26\xed\x8c\
-\xaf@ \x10\x08\x04\x02\x81\x09E\x00O\x1e1\xb0\xe8\
-|\xb9\xe3\xd1\xce\x0aj\xc2J!\xba\xad\xc9\x08\x17*\
-\xc2\xe5\x8dU\xdc1\xdapD[\x9ez\xc7]-\xa7\
-S\xeb\xb3\x1b\xbc\xba:\x95\xd3)o\xec\x0f\x04\x02\x81\
-@ \x10\x18,\x02\xb9\x1f\xb7\xcd\x1f\xae\xc5y?\x05\
--\x0b%2\xae\x8fG\x9e\xb35RK\x90\x15i\xf3\
-\xd6\xef\x0d7\xdc0Y\x14\x91>\x16:\x16V\x96V\
-\xc7\xaay\x8dA\xc6\x01\xfb\xbb\x11\xd8j>\xe9\x89m\
-\xfe\x9dv\xfc\xef\x0b9~\xda\xd3\x9e\x96\x08\x0eww\
-Vlu\xb1\x80\xb2\xf8#!y\x99W.\xa3\xea~\
-]=\x17E\xb2\xca\xe7\x08\xe9\x02\xbe\xb1|#\xf9\xa4\
-\xa9\xfet\xa0\xe5\xcb\x18{\xfa\xe9\xa7\x8f\xe6E(\xb5\
-\xa7\xa9\xac\xa6}\xf5\xa2\xf39\xf4z\xdd`^U\x16\
-T\xcb36\xbb\xc6b\x02X\xeeP\x17.\xe0<\x13\
-\xe0\xf9\x92\x97\xbc$\xcd\x15\x5cc\xd7\x5c`Y\xe4R\
-p<\xd6\xf2\xbc\xa6:\xb7O<\x1c\x96[qp(\
-d\x10\xfb^\xce/\xb7!\x97#\x00.%\x01k5\
-\x0f\x80\xcb/\xbf<\x91T\x9e\x17\x14@\xe6,\xae9\
-\x0f\x021\x19(\x8e>\xfc\xe1\x0f\x17\xaf{\xdd\xeb\xd2\
-y\xe7\xf2\xaa\xdb\x5cv}\x9f\xff\xda\xea\x1c\xad\x97\xcf\
-\x11\xd1\xa5\xe7\x89\x81Dga\xf4\xa8\x96\xf3\xc5/~\
-1\xfd\x87\x93\xfdu\xc9i\xeb\xc7X\xc4\xdd\x8f\xbc$\
-|x)\x9a\x8f\x99\xa7\xd51u\xbdH\xbe?y'\
-d\xaf\x0d\xfb\xab\xcf\x8d\xffM\xf7r\xfd\xd9sot\
-R\x1e)#$\x10\x08\x04\x02\x81@`r\x10\x98\x9b\
-;c$\x9cF[\xa7\xcf-\x8e\x15\xddz\xa5e\xeb\
-\xcaG\xd2o\xfb\x1c\x93F\xda&\xd7\xc3j9\xc8\xbe\
-\xb5\xea\xd5\x8f}\xc4\xc4\xa4\xad\x9c\xea\x00\x16\xbf\xef\x98\
-@\x07\x16\x81E\xdc\x03q\x0fL\xc4=\xa0_\xeeT\
-nv[\x16y\xdd\xdb=X\xd1Y\x14\x9b\xd2\xe7r\
-X\xc4\x05\xc5B\xd8D\xbaF\x98\x04U\x93\x87\xc5\x8e\
-\xd7\x96\xf1\x87\x05\xd4\xbam\xfb\xad-\xb7\xa6\x1d\x91t\
-\xdc\x1ad\xae\xbfM\xf5\x18\x9b\x90\x90*9\xaa\xa6C\
-\xd0Y\xe6\x95\x89\xb8\xe4vqS\xa6t@\xe8\x10\x92\
-\xbc\xbf\x9a7\xff\xce\xc7\x1e\xf3\x98\xc7\xa4\xb6\x22\x9a\x88\
-\xaa\xf5\xc2UR,=\x0b}^\x1a\x90\xf3\xb7m\x8d\
-\x95\xac\xc1\xdc\xc9\xb9\xafs\x97\xce\xeb\xa0\xdb\xf2\xd5\x8f\
-\xe56\xd6\xf7\xfb\xdfv\xdd\x90O\xd1\xd1]\x03X[\
-kO)#\x1f/\x02\xf1\x06\xac\xf17\xe6\xdbW=\
-?\xb8^z\xe9\xa5\x89 \x0b\x8e\xc7\xd2n\x9c\xcf\xee\
-\xe1\xce\x89;<\x82i\xc9BV\x82(G\xc4z\xf7\
-\x82r\xfbq\x0b\x97\xb7\xfa\xb1$OL\x01\xe5\xb1\xd8\
-#\xaa\xf6Q2H\xe7|\xdc\xab\x8eQ\x82\xb8W\xb4\
-\x89T\xcf%\x97\xd9\x86\xa3{\x89K\xbd\xfb\x88e\x9b\
-\xa5C\xbe,\xb9\x8c\xfa>\xcb\x02(\x14\xf6\xddw\xdf\
-\x94\xb4\x9a\xae\xfa\xbb\xa9\xeeo|\xe3\x1b\xc9\xf3\xc1r\
-\x0ci\xada\xf7\xcc\xe5\xe5\x11\x9e\xc1\x1c4\xcf3\xa2\
-\x8d\xeeuJ(\xcbE\xc4\x16\xa8\xd6\x91\x7fw\xba\x97\
-\xe1\xc8\x10\xa3>\x1f\xbf\xed\xcb\xf9\x9a\xda\x98\x8f\xc5v\
-\xf9{3\xf0\x08<\xe2\x1e\x88{`\x90\xf7\xc0\xa8e\
-}a\xb9\x86\xcf\xc0fre\x12\x220\x8c\xadW\x86\
-\x10Zi\xfb\x0c\xba\x06=i\xe5\xd1\x98\xaaT\xcb\x11\
-h\xc8k?\x94c\xbd\x16Q\x8e\x89I\xb7r\xaae\
-\xc6\xef@ \x10\x08\x04\x02\x81\x89C \xf7\xe3yp\
-QS\xf6\xba\xf2\x9b5\x1d!\xe0V\x8b\x10U-{\
-\x8eW\xf3\xe5\xff,\xc7\xd6\xda\x22\x1d\xca\x12d\x0c\xd9\
-au\xe5\xf2\xccb\x8bPd\x02\xa4\x0c\x81\xdbx^\
-q\xdbELv-_\xb9U\x1dg\xaa\xf5 +\x5c\
-\x8bY\xfcYq\xb9rW%\xb7_\x9e\xaa([z\
-k\xf1\x11V\x92\xd3\xe4<\xd5}\x8eq\xd5\xb6>\x98\
-\xcb7\xa2\x06\x07c\x1a\xf7\xe8\x9c\x07y\xb5\x1e\x98\xfb\
-<\x8c\xba\x09+4\xe5\xc7[\xde\xf2\x96\x94\x14\xe9\x15\
-\x5c.\xb7\xa5\x9a\xbfi_>\x9e\x8f\xe5mn\x8f\xe3\
-m\xd7M\x908K\x0e\x9c\x13\xe5\x08b\x8d\xf0\xe5r\
-\x9c\x83k\x81\x10#\xb9\xf6W\xcf\xcf>Vq\x82\xac\
-\xb3`ge\x03WqVhXs\xab\xce\xae\xd5\xb9\
-lJ\x0f\xcb\x10\xbc\x86,\xefK\x05\xf5\xf8%\x8f\xf6\
-q\xd5\xce\xe2\xba8\x8f\x5c\xa6:\xb2\x88\x0f \xf8_\
-N\xdft\xad\x94\x99?9\x9f\xad}0%\xae\x95{\
-\x94\xd5\x9e\x95;c-M\x96\xfc\xdb\x96\x17\x07\x05\x95\
-{\x94x\x86\x9a\x02\xccI\x9b\xf3\xe5r\x04\xed\xfb\xed\
-o\x7f;\xfa\xcc\x89\x85\xe0Zd\xc5\x07R\xeez(\
-\xdf\x1b\x04|x\x0d\xc0\x81\xe2\xc2\xb5\xcbeV\xcb\xef\
-t/\xf3B\x81\x0bw\x7f\xe2>\xb6\xaf^F\xfe\x9f\
-\xdb\x19\xdb@ \x10\x08\x04\x02\x81\x89E`Ni\xe9\
-^j\x80\xcb\xc2-\x8f\xdb\xa25OH\xb9\x0f\x91\xc6\
-\xc7\xa0\x8b\xa8w{\xd7\xe6\xa0\xca\xc9\xed\x8am \x10\
-\x08\x04\x02\x81\xc0\xd4\x22\x800p\x0f\xcf\xe3B/\xad\
-\xa9\xe7A\x92yX\x89\x94\xedXv)\xae\x96\xc5\xbd\
-\x1c)\xc9$\xa9z\xac\xfe\x9be\x18\xb1\xefG\x8ce\
-\x14\xc9Mu\xb7\x95S?\x97zZD)[\xeb\xeb\
-\xc7:\xfd\xd7~\x96\xe6L|;\xa5\x1b\xcf\xfe\xb6v\
-\xc3\xda5\xed\xa5\xdd\xfd\x9e\x9f\xf3\xeaEq\xd1\xeb\xb9\
-\x89\x7f\xc0\x0b\x03\x89\x1c\xaf\xf4{.\xe3\xad\xafS~\
-k\xd2\xad\xed\xa7\x0cj\x12\xd7\x8e\xc7\x03\xe5N\xfd\x1a\
-\xe5\xb9[~\x1e\x11iV\xf1l\x1ci*/\xef\xeb\
-tO\xb8\x1fI\xfd\x99\x12\x5c\x92\x82\x80e>$\x10\
-\x08\x04\x02\x81@`r\x10\xd0\xbf\x8f\xbe\xba-W\x89\
-\x88\xb3t\x88\x9c+z\xeb_\xcb\x08\xa8t\xca\x1bo\
-\xb4qq\xaf\xfb\xdc\xabx\xe0\x03\x1e\xb8\x9c\xa5#\xe7\
-\xabo\x07UN\xbd\xdc\xf8\x1f\x08\x04\x02\x81@ 0\
-5\x08\xb0f\x93~\xack\xf5<\x88a\xde\xc7]\xb7\
-\xa9,D\xbd\xd7z\x0cdMe\xa4\x02:|!=\
-\x9d\xea\xee\x90%\xed\xce\xed\xeeT_\xb6\xb4\xb6\x95Q\
-?\xa6\xfd\xd6yw*\xb3\x9e~,\xff\xdb\xda\xdd\x0f\
-\xd6\xfd\x9e\x1f\xd28\xc8\xf3r\x1e\xa2\x9d\x9f}\xf6\xd9\
-\xc5\xbb\xdf\xfd\xee\xb1@1\x9a\xa7\xdfs\x19\xcd8\xe0\
-\x1f\xae\xbf\xf3\xea\x84\x93c\xd6\xf7\x93z\x9aL\xde\xab\
-\xfbs\xd0\xc3n\xcd\xectOhO\xb5.\x86\x1bA\
-#\x91{\x9e\x09\xd5\xba\xba\xd5\x11\xc7\x03\x81@ \x10\
-\x08\x04\xc6\x87\x80>wN\x19%w9\xcb\xfa\xf8\x8a\
-\x8c\xdc\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ 0\x1e\x04\x188V\
-\xb0\xac\x8f\xa7\xc0\xc8\x1b\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\xe3\
-C -\xf5SD\xb85\x8d\x0f\xc8\xc8\x1d\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x0c\x12\x81\xb0\xac\x0f\x12\xcd(+\x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x18'\x02\x82\xa1\x8e\x08\x1e\x22*nH \
-\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08L=\x02\xd6\xac\xcf\xb9\xfa\xea\
-\xab\x97b\xed!\x81@ \x10\x08\x04\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ 0\xf5\x08\
-x\xeb\xc7\xdc \xeaS\x7f!\xa2\x05\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@\x15\x81\x92\xb0\xcf\xad\xfe\x8f\xdf\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ 0\x85\x08\x08\x02\x1fL}\x0a/@T\x1d\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x084!\x10d\xbd\x09\x95\xd8\x17\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08L\x11\x02i\xcd\xfa\x9c9s\xa6\xa8\
-\xfa\xa86\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81@ \x10\x08\x04\xea\x08$7\xf8\
-\x080W\x87%\xfe\x07\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02S\x8b\xc0\
-\x5c\x8c=$\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x86\x03\x01\x1e\
-\xf0s\xe7\xcd\x9b7\x1c\xad\x89V\x04\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@\xb1x\xf1\xe2\x88\x06\x1f\xf7A \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ 0L\x08D\x80\xb9a\xba\x1a\xd1\x96@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@\xe0\x7f\x08\xcc\xbd\xfd\xf6\xdb\x03\x8c@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x18\x12\x04\x04\x82\x1f\xb1p=\x82\xcc\
-\x0d\xc9\x15\x89f\x04\x02\x81\xc0\x94\x22\xf0\xcb_\xfe2\
-\xd5\xbf\xf9\xe6\x9bOi;\xa2\xf2\xc9G \xae\xfd\xe4\
-c\x1e5\x06\x02\xfd\x22\x10\xcfi\xbf\x88M\xbf\xf4\xc8\
-\xc9-\xb7\xdc\x92\x1a\xbe\xe6\x9ak\x16\x0b\x16,(F\
-FFFO\x84\x91\xf1\xc6\x1bo,\xae\xbd\xf6\xda\xb4\
-o\xe5\x95W.\xb8\x0a\x87\x04\x023\x11\x01\xb1\xe5F\
-\xdc\xe0\x16\xaf\x87\x04\x02\x81@ \x10\x08\x14\xc5\xa2E\
-\x8b\x8a\x7f\xff\xfb\xdf\x01\xc5\xff\x10\xa8*s\xfd\xa6\xe0\
-\xadJ\xfd\x7f\xf5\xd8t\xfb\x1d\xd7~\xba]\xb1\xe1k\
-o\x10\x8d\x89\xbf&\xf1\x9cN<\xc6\x9dj\xb8\xe1\x86\
-\x1b\x8a\x9bo\xbe\xb9\xd3\xe1q\xed_e\x95U\x8aU\
-W]5\x11\xf5\x95VZ\xa9\xd8p\xc3\x0d\x1b\xcbC\
-\xdc\x91x\x9f\xab\xae\xba*\xa5\x0f\xc2\xde\x08U\xec\x9c\
-!\x08\x8cT'b3\xe4\x9c\xe24\x02\x81@ \x10\
-\x08\x04\xc6\x89\x80\xb1\x01\xf1\xa0\xcc\xf5a\xcd\xc8\xe3\x05\
-%/mo\xfe\xf8?\x93H\xfb8\xa1\x1b\xca\xec\x13\
-9\xc9\x1e\xca\x13\x9e\xe4F\x05\xd1\x98d\xc0\xa3\xba)\
-A\x00Q\xbf\xef}\xef;!u_v\xd9e\x05\x92\
-n\xdc\xa9\x13uV\xf4\xef\x7f\xff\xfb\xc5\xf6\xdbo\x9f\
-Hzn\x80t\x7f\xfe\xf3\x9f\xd3\xf84\x7f\xfe\xfc\xbc\
-;\xb6\x81\xc0\x8cA\xc0\xbc+\xb9\xc1\xcf\x983\x8a\x13\
-\x09\x04\x02\x81@ \x10\x187\x02&K\xc8\xf9\xad\xb7\
-\xdeZ\xac4o\xa4X\xb0\xea\x82b\xb5\xd5V+\xe6\
-\xaf<\xbfX\xb2x\x99\x8b\xe2-\xb7\xdc\x5c\xdct\xe3\
-M\xc5Me\x1a\x93$\xd6\x8epE\x1c7\xf4\x13V\
-\xc0DN\xb2'\xac\xd1\xd3\xa8\xe0 \x1a\xd3\xe8bE\
-S\x87\x16\x01\xe3\x0e\x8byU\x10\xf5\x97\xbe\xf4\xa5\xc5\
-o~\xf3\x9b\xe2\x0b_\xf8B\xfaT\xd3\xac\xb1\xc6\x1a\
-\xc5u\xd7]\x97\xc6\xa1j\xbe\xf8\x1d\x08\xcc\x04\x04\x18\
-B\xfa&\xeb?\xf8\xc1\x0ff\xc2\xb9\xcf\xfas\xd8q\
-\xc7\x1d\xc3\xd5w\xd6\xdf\x05\x01@ \xb0\x22\x02\xac\xe8\
-i\xbd`\xa9\xcd\xdd`\xfd\x0d\x8aU\x17\xac\xba\x5c\xa2\
-y#\xf3\x8a\x05#\x0b\x8a\x05\xab-(\xd6Y\xb7H\
-\x84\xfd\xdf\xff\xfaW\x22\xf7\x5c\x11Y\xdbC\x02\x81\xd9\
-\x88@\x10\x8d\xd9x\xd5\xe3\x9c\x07\x89\x00\x05\xb15\xea\
-U\xc9D\xfd\xb9\xcf}n\xf1\xb5\xaf}\xadx\xef{\
-\xdf\x9b>9\x8d\xf4\x96\xae\xd5\xf3\xe5\xe3\xc3\xb4\xfd\xdc\
-\xe7>\x97<\xd4v\xdf}\xf7\xbe\x9b\x15\xfc\xabo\xc8\
-\x862C\xbf\xfc\x8b\xf1d\xc4W\xbf\xa2\xa2\x90@ \
-\x10\x08\x04\x02\x81\x99\x85\x00\xa2\xce\x02\xbb\xf2\xfc\x95\x8b\
-\x0d\xef\xdc\xbc^\xb0~\xc6\xc8\xfc\xc6w\xbf[q\xd5\
-\xdf\xafJy\xb9\x03\xcff\xc2~\xdbmE\xf1\xd7\xbf\
-\xce-\xeer\x97%\xa5\xa5\xa7\x8eV\xfc\x9f\xc9\x08L\
-&\xd18\xf3\xcc\x95Jk\xe2\x9cb\xf5\xd5\x97\x16\x8f\
-}ly\xd3\x85\xf4\x8c\xc0\xdf\xfe\xf6\xb7D\xec\xd6Z\
-k\xad\x94\x87\x92\xe5{\xdf\xfb^\xb1\xddv\xdb%\xeb\
-\xec\xe5\x97_^\xfc\xe9O\x7f*\x1e\xf7\xb8\xc7\xf5\x5c\
-\xe60'\xfc\xcb_\xfeR\xf8<\xf2\x91\x8f\x9c\x94f\
-r\xdb\xe5\x9a\xceE\x9d\x02\xb7W\x91\xcf\xb5\xa8\xba\xb3\
-\xbf\xedmoK\x16u\x04\x1dY\x7f\xf8\xc3\x1f^\xd8\
-G\xec#\xd2\xcb7\x1d\xe4\xab_\xfdjj\xe6X\xc8\
-\xba\x8c\xc1\xbf\xa6\xc3U\x1el\x1b=\x17\x11>q\xb0\
-\x98Fi\x81@ \x10\x08LK\x04(n\xfb%\xea\
-\xd5\x13E\xee\x91|e\x8cE\x09\x5c-k:\xfe.\
-\xf5\x1c\xc5\xfe\xfb\xafVl\xb2\xc9z\xc5\xa3\x1f\xbdv\
-\xda\xee\xbb\xefj\xe5$r\xd9\xd9|\xf5\xab+\x17\xe7\
-\x9e{GD\xe3~\xcfq\xbc\xf9\x9b\xea\xfb\xc7?\xfe\
-Q\xdcF\xbb\xd0 m\xc7\x1a\x92\x97\x0a\x8a\xbf6\xed\
-N\xfb\xfa)\xab[\xda\xb6z\xea\x0dhK;\xc8z\
-\xd4\xdb\x8dhdk \xcb`&\x1b\xf2\x8d\x95h\xbc\
-\xf5\xad\xab\x15G\x1f\xbdrq\xdey+\xdeS\xbf\xfe\
-\xf5\xbcr\x09\x8b\xd2C\xaa\x08|\xf7\xbb\xdf-\xeew\
-\xbf\xfb\x15\x0f{\xd8\xc3\x8a\xfb\xdc\xe7>\xc5\x93\x9e\xf4\
-\xa4D*E\x16\x7f\xc9K^R\xfc\xf7\xbf\xffM\xc9\
-\x8f?\xfe\xf8\xe2\x80\x03\x0e\xa8f\x1d\xd7\xef;\xdf\xf9\
-\xce\xc5E\x17]4\xae2\xfa\xc9\x8c\x10\x9e{\xee\xb9\
-\xa3Y~\xf8\xc3\x1f\x16\xef~\xf7\xbbG\xff\x0f\xea\xc7\
-\xd5W_]\xec\xb0\xc3\x0eI9\xfb\x87?\xfc!\x15\
-\x0b\xe3\xf5\xd7_\xbfx\xd0\x83\x1eTpO?\xf0\xc0\
-\x03\xfb\xaa\xcesT\x15J\x86L\xd4\xedG\xd8\xfd\xe7\
-\x12_\x95z\xbe\xea\xb1a\xf9M\x81q\xdey\xe7\xa5\
-\x8f\xdf!\x81@/\x08p\x83\x0f\xb2\xde\x0bR\x91f\
-\x05\x04t\x8c\xb4\xd3\xe7\x9csNq\xd2I'\xa55\
-D\xff\xef\xff\xfd\xbf\xc2\xc7\x9a\x22\xfb\x1c\x93f\xb2:\
-\xd1h\xd3\x0a\x97\xa9q\xc70\xe2\x94\x1bz\xd0A\x07\
-%\x0bG\xfe\x1f\xdb\xc9A\xc0=\xc12Q\x86\x89\xeb\
-\xd9\xa2\xde\xd42\x84]\x19\xca\x9a\xac\xe7\xbe\xa9\x1dS\
-\xb1\xef{\xdf\x9b_|\xf9\xcb+\x17\xdf\xfe\xf65\xc5\
-\x95W^]\xde\xc7\xd7\x94.\x9b+\x17\xdf\xf8\xc62\
-\xcb\xd2\xf1\xc7\xaf\x5c\xfc\xe4'+\x8d\xb9i\xe3\xcd_\
-\xad\x18Q}\xd4\xa3\x1eU\xdc\xfd\xeew/6\xd8`\
-\x83Q\x0b\x954m\xc7\xaae\xe4\xdf\xfaz\xe5\xdc\xe3\
-\x1e\xf7H\x81\xa7\xce>\xfb\xec|\xa8\xaf\xb2\xba\xd5\xdb\
-V\xcfh\x85\xff\xfb\xd1\x96v\x90\xf5\xd4\xeb\xad\xdf\xf3\
-\x13M4v\xdb\xed\x96\xe2\x8do\xbci\xb9f|\xfd\
-\xeb+\x17Oy\xcaZ\xe5\xd8\x1b\xd3\xbb*0\xbc\x1e\
-\xf6\xd8c\x8f\xe2u\xaf{]\x22\xe8\xbf\xfd\xedo\x0b\
-\x96\xf5\xfd\xf7\xdf\xbf\x9a,\xfd~\xcb[\xdeR\x0c\xd2\
-\xe5\x98\xf2\xb2~o\xacP\xe9\x00wP6\xfc\xe4'\
-?\x19`\x89+\x16%F\x03BN\xd1\x91\x95\xb3<\
-\xb3^\xf0\x82\x17\x14\xef{\xdf\xfb\x92\xe2C@8c\
-\xfa%\x97\x5c\xb2b\x01\x1d\xf6\xc0Iy>\xca;\xea\
-\xa8\xa3\x8ag=\xebY\xa3\x81N\xed\xf3\xff\x84\x13N\
-H\xfbr\xda\xc9\xc4\xb7C\xd3\xbb\xee\xfe\xfa\xd7\xbf>\
-zn~\x87\x04\x02\xbd\x22\x10\xd1\xe0{E*\xd2%\
-\x04t\x8c\x97^ziq\xfe\xf9\xe7\xa7\xceX\xc7\x99\
-?\xb9\xb3\xa4\x05\xfaW\xb9\x86\x95+\x99tk\xaf\xbd\
-v\xd2d\xd3hOD\x00\xaahSo7\xe70\xe2\
-\x94[n\x02M\xb9\xe3\xdeb\x110\xe17\xa9Zg\
-\x9du\xd2d\xe0\x88#\x8eH\xeb\xa8YC\x90\x8cz\
-\xa4\xd8\x5cNl\xc7\x86\x80{C\xb4\xf0\xbb\xdd\xedn\
-c+\xa0\x92k\xfd\x0d7H\x93a\x01\x80f\x93;\
-\xfco\x7f;\xaf\xc4oI9\x81]fJ\x7f\xe0\x03\
-o/N<\xf1\x9a\xf2UDE\xb1\xe7\x9e\xab\x17g\
-\x9e9\x92\xac\xa0\xdf\xff\xfeJ\xc57\xbfymq\xd3\
-MsJ\x0b\xebj\xc5)\xa7\x08\xce\xb7\xb4to\xbc\
-\xa5\xb4B\xddX\xbe\x8ahni\xf1[\xab\x9c\xf4\xde\
-R\x1cq\xc4*\xc5G>r}JS\xcf\xff\xc5/\
-\xaeR\xba\x84\xdeVl\xbai\xff\xaf^}\xf5\xab_\
-\x9d\x88\xca?\xff\xf9\xcf\xe2\xc2\x0b/L\xee\xbf\x8fy\
-\xcccJw\xea\xc7\x16m\xc7\xf4\xf1\xcf\x7f\xfe\xf3\xd3\
-\x87;\xa6\xe7\xf6e/{Y\xb2B\xbe\xeaU\xaf*\
-\xde\xf1\x8ew\xa4@P\xde\x85\xed\x15Lme\xfd\xea\
-W\xbf*\x89\xe6\x1b\x0bk87\xdah\xa3\xd6\xb4\xdd\
-\xea\xa9\xdc~\xe3jS?\xf5T\xeb\xcc\xbf3\xd1\xf0\
-\xdfoD\x83\x18#\xb3 \x1a\x99|\xe47(\xe4\xb1\
-3\xa7\x19\xeb\xd6\xbd\xb4\xf7\xde\xab\x15G\x1ey]\xe9\
-\xd9\xd1\xff\x12\xc7\xb1\xd6;\x1d\xf21\x1c\x5c\x7f\xfd\xf5\
-\xc9\x9a\xae_B\xd4?\xf1\x89O\x14\x7f\xfc\xe3\x1fW\
-h\xfe1\xc7\x1cS\xfc\xe8G?*>\xfd\xe9O\x17\
-\xbf\xfe\xf5\xaf\xd3\xfd\xfd\xb3\x9f\xfd\xac\xb8\xd7\xbd\xeeU\
-\xbc\xe7=\xef\x19u'\xcf\xc7.\xb8\xe0\x82\xe4\x9e}\
-\xe8\xa1\x87\x16\x0b\x17.\x5c\xa1\xbc\xb6\x1d\x9d\xca\xf8\xfb\
-\xdf\xff\x9e\xda\xca]\xfaS\x9f\xfaT\xb1\xf1\xc6\x1b\x17\
-oz\xd3\x9b\x8a'?\xf9\xc9\xa98c$\x22\xcc\xc2\
-\xfc\xb4\xa7=-)H\x1f\xff\xf8\xc7\x97\xfd\xcc\x99\xe9\
-\xc3\x82\x8b,\x7f\xf3\x9b\xdfL\xe9)P_\xf9\xcaW\
-\x16\xdf\xf9\xcew\x8a{\xde\xf3\x9e\xc9\xb0r\xef{\xdf\
-\xbb\xf8\xcf\x7f\xfeS|\xe9K_*^\xfe\xf2\x97\x17\
-\x960\xf5*\x14Qo\x7f\xfb\xdb\x8b\x17\xbe\xf0\x85i\
-\x8e'\x9f\xb2(Dv\xd9e\x97T\x8ce\x04p\xa6\
-\x18\xd9t\xd3M\xbb\x16\x9d\x9f\x9f\xac\xec\xed\xe5\xb9\xf0\
-\x0c\xf9\x18\xc3\xda\xe4\xc8#\x8f,>\xfe\xf1\x8f\xa76\
-\x8a(\xff\xa1\x0f}(Y\xfe;\xe1\xaf\xac|\xac\xe9\
-\xda\xb7\xd5\x95\xf3\xbe\xff\xfd\xefO\x9eK\xce\x87\x07S\
-\xd5\x1b\xc0\xbdw\xdai\xa7\xa5\xe8\xf7\x82\xb3\xf2\xb0y\
-\xeb[\xdfZ<\xe0\x01\x0f\xe8Vt\x1c\x9fe\x08\xb8\
-\xbf\xe7\xe6\xc1b\x96\x9d{\x9c\xee\x18\x10\xd0\x11\x7f\xe5\
-+_I\x9d\xbd\x81\xcf\x7f\xef\xb8\xe4\x0a\xa5S\xd5\xd1\
-\xfb\xf8m\x9fc\xd2Hk\x80\x90\xd7\xffAJ\xb4\xa9\
-74\x87\x11'-7\xe0s\xcf\xdbm\xb7\xdd\xd2\x84\
-D;\xdd?\xac\x02o~\xf3\x9b\xd3\xc9\xfd\xf8\xc7?\
-.N=\xf5\xd4d\xe90y2yy\xd7\xbb\xdeU\
-Z/\xaf\xec\xed\xe4#U+\x02\xf0F&\xe6\x8f\xac\
-\xd4\xd7\xfa\xc2N\x85Z\xa3\xa8,e*{\xb6\xc8\xa2\
-E\xb7\x95\x93\xd2y\xc5\xce;\xafQ\x9c|\xf2\xfcR\
-\x999\xa7\xd8l\xb3\xc5\xa5\xc5yqI\xcao,\xb6\
-\xd8bqy\xec\x96\x92|\xdf\x90 9\xe6\x98\x95\x8b\
-\xb3\xce\x1a)>\xff\xf9\xeb\x8aC\x0f\xbd\xa1\xf8\xccg\
-V-\xce8c\xa5\xe46\x7f\xe5\x95s\x8b\x0b.\x18\
-)\xc9\xdeu\xa5K\xfdm+\xe4\xc7\xfd\xf6\xdboA\
-q\xdcq\xbd\xaf\x07\xcd\xd7\x81\x85\xf1\xc4\x13OL\xcf\
-\x1d7U$\xfdy\xcf{^\xea\x9f\xdb\x8e\xe5\xfc\x5c\
-\x85-u \xac\x8f&\xe3\xaf}\xedk\xd3d\x93\xcb\
-+\x05\x00%m\xb7\xb2L`\x05\x85r\x9ftK\xdb\
-VOnW\xde\xb6\xa5\x1dd=\xb9\xbe\xbcu\xaf#\
-\x0cybnr\xde\xcbG\xfanD#\xd7\xd1\xb6\xa5\
-\x04\xdae\x975J\x02wcI\xc6\x96\x14\x7f\xf8\xc3\
-\xbc\xe5>\xee\xc7\xd9,\x9bl\xb2Ir\x81\xdfy\xe7\
-\x9dK%\xd8\x11\x89\xa4s\xd7~\xc4#\x1e\xb1\x02,\
-\x22\x8b\xbb7Y\x8d_\xfc\xe2\x17'\xe50\xd7\xf2\xad\
-\xb6\xda*\x91\xd3\x9bn*\xdf\x82Q~\x04>S\xae\
-\xb9\x8d\xe7 \x93\xd4\x15\x0a\xec\xb0\xa3\xad\x0c\xf7\x851\
-\x0e\xe9\xe6\xad\xb8\xf9\xe6\x9b'r\xac(\xcf\xa01\x13\
-\xb1c\xa1\xf5\x1c\xdbRFXb\xb1\xc5\x16[\x94}\
-\xcd\xcee_\xf3\x91\xd1\x9a\x11N\xe4\xfc\xcb_\xfer\
-\xea\xe7\xb3G\x01\xe5\xb8\xe7\x96\xa2\xbc\x1f\xd9v\xdbm\
-\x93\x82\xad\xca!\xeet\xa7;%\xab\xba\xd7\xaf\x11\xf3\
->\xcf\x5c\x13\xc6Mu\xe5g\xc8\xfc\x11\xfe\xbd~\xa4\
-o{\x86\xcc3\x10a\xee\xf3'\x9f|rR\x1e\xc0\
-\xb4\x0d\xff\xb6k\xdf\xd4\xf6\xfa\xbe\xcd6\xdb,\xdd/\
-\x94>\x96!P\xa28\x9f,~\x9fu\xd6YI)\
-t\xfa\xe9\xa7\xa7\xb4\xf2\x84\x04\x02u\x04\xdc\xdb#,\
-\x9dm7y=S\xfc\x9f\x9d\x08\xd0>\x9fr\xca)\
-\xc9\xfa\xa6\x83\xd3\x91q{|\xe0\x03\x1f\x984\xbe\xd5\
-\xa0R\x06\x19\x939\x03\x0d\xeb\x89\xbc\xa2t\xea\xb4\x0d\
-\x14O}\xeaSS\xde\xf1\x22\x19m\xea\x0d\xc1a\xc4\
-I\xcbi\xfcM\x9a\xdc\x17u1\x01\xc8\xc1}\xb8\xda\
-Y\xf3\xc7\xd2@\xf4W\xac\x0a&1\xafx\xc5+\x8a\
-g<\xe3\x19\xf5\xec\xf1\xbfO\x04<\xb3\xab\xd6\x22\xf0\
-\xf6Y\xc4r\xc9\x17\x94\xafy\xbb\xe9\xe6\x9b\x92\xd5`\
-\xb9\x033\xf8\xcf\xe6\x9b\xdf^\x1c{\xec\xb5\xe5\x04y\
-\xd5\xd2\xda\xbcF\xe9UP\x94$\xf8\x96\xe2\x83\x1f\xe4\
-\xb1\xb0\xa4\x9cP/-'\xfdKJ\x22\xb5\xcc\xca\xba\
-\xfb\xee7\x97\x8a\xa7\x9bK\x85F\x91\x02\x85m\xbc\xf1\
-\xe2\xd2]t^i\xbd[v\xfc\x03\x1f\xb8~\xd4:\
-\xba\xee\xbaKW\xc8\x7f\xe6\x99\xd7\xa4\xf2\xfa\x85T\x7f\
-\xe0\x19\xaaZp\xf4\xe3&\x93m\xc7\xd4\xe3\xb9\x14\x88\
-+\x0b\x8b\x99\x09f\x9e\xb0\xb3\xa6\x1b\x17\xecG\x84:\
-\xd5#\xff\x83\x1f\xfc\xe0D\xea\xfdF\x14\xda\xd2\xb6\xd5\
-C\xd9P\x95\xb6\xb4\xdd\xda\xd4\x96\xb7^O\xb5N\xbf\
-\xabD\xc3\xb9\xf4\xa2\xa8\x82\xdb\xa0\xe6`\xef~\xf7\x82\
-t/\xbd\xf9\xcd\xab\xd5\x9b\x96\xfe?\xe5)\xb7\x16_\
-\xfc\xe2u\x8d\xc7f\xcbN\x84\xfb\xff\xfe\xef\xff\x8aC\
-\x0e9\xa4\xd8w\xdf}\x93\xc7\x1fB{\xd7\xbb\xde\xb5\
-\x11\x82_\xfc\xe2\x17\xc55\xd7\x5cS\x1cv\xd8aI\
-\x19\xf5\xd0\x87>4\x11Os n\xe0\x14S\x14\xc7\
-,\xf5\x88 \xeb\xb1\xb5\xc8\xbdz(\xf1j\xe9TF\
-~\xa6\x0e>\xf8\xe0d\x09\xa7\x14@0y,\xfe\xee\
-w\xbfK\xedu.\xea\xd6\xae\xfc\x5c\xaa\x1by\xe7}\
-\xc6\x82\x9e\xc5R\x95}\xf6\xd9'\xfd\xddu\xd7]G\
-\x97\xbeX\xb7o<\x1d\xf4\xbb\xd3\x11d\xca\x8bw\xbe\
-\xf3\x9d\xa9-\xb9\x1d\xbdl\xfbQ\xf4z\xce\xba=k\
-\xae!\xf1\x96\x13\xe7\x89@\x13F\x81N\xf8\xbb\x8e\x9d\
-\xae\xbd~\xae\x9b\xb8~\xafy\xcdk\x92\xc7\x85yJ\
-'\xe3\x02\xaf\xa2\xcf|\xe63=+4\xba\xd5\x1b\xc7\
-g\x1e\x02\xc6\x88\x11\x93\xb4\x90@\xa0\x0d\x01\x138Z\
-[\x03\x14\x8d\xf3z\xeb\xadW<\xf3\x99\xcfL\xeb\x14\
-W_}\xf54!\xd71\xf9\xe4\x09\x8b\xce\x96\x96\x95\
-\xdb\xb2 ?\xdc\xb1h\x12Y\x1a\x94\xf5\x9c\xe7<g\
-\x5c\x84=\xda\xd4v\xc5\xee86\x8c8i\x9d\xc1I\
-\xa0\xa5,&\x15\x5cCY\xfc\xdcg\xdccY\x12\xc8\
-]\xeer\x97\xe4*\xcb\xea\xce:\xf0\x8do|#M\
-V\xdcK\x87\x1f~x\xf2\xdc\xe0z7,\xf2\xc3\xcb\
-\xe7\x16o\xf9\xfe\xfc\xe2\xaa\x1bG\x8a\xe9aW.'\
-;7\xdf^\xfc\xf3\x80\xd5\x07\x06\xa1\xd7\xba]~\xc5\
-\xe5\xe9}\xb9y\xd29\xb0\xc2\x1b\x0a\xca\x935\x93\xd4\
-j$\xe1\x86\xa4\x13\xba\xebq\x8f\xbb\xadT2\xddV\
-Z\xb8\xe6\xa4\xf5\xeb\x87\x1c\xb2\xa0\x9c\xb8/.\xde\xf2\
-\x96\xe5\xd7\x15k\x04+\xfc\x1b\xde\xb0zyO\x8f\xa4\
-6\x19\x8aK\x8e7*\x1bn\xd8~\xf7l\xb2\xc9\x1d\
-\xae\xd5\xa3\x99z\xf8\xc1\xd3\x89\xf2\xb4:\xe1\xd4W\xdb\
-\xdfv\xac\xa9h\xe9\x8d\x07UA\x88\xfb-\xab[\xbd\
-m\xf5T\xeb\xf6\xbb-\xed \xeb\xa9\xd7\x9b\xff\x0f\x9a\
-h\xe4r\xbbm)\x85v\xdcq\xcd\x92<\xda\xae\xa8\
-\x00\xb5\xd4b\xb6\x8b\xb1\x84\xfb3\x92{\xc6\x19g$\
-\x8b\xb2e\x1c<\xb7\x9a\x84\xf2fa\xe9\xd6\x9e\xfb\x14\
-\xc4\xd8\xdc\x85 \xeb\x8c\x16\x8eW\xe5\xf7\xbf\xff}\xcf\
-d\xbd\xad\x0cVp\x92\x15\x09bK\xb0X[\xaed\
-Ne\xbf\xf6\x10},7\xf96\xc9\xe5H#mV\
-\x92\xcb;h\xa2\xce\xc2O\x89\xce-\x9fE\xbbW\xd1\
-\x16\xc4$+\xd5r\xbf\xde\x96?\xe7\xc9\xc1\x01\x9b\xd2\
-RL\x9aSXZ\xa7L\xcb\x06x\xf4\xb5\xe1\x7f\xc5\
-\x15W\x14\x0b;\x5c\xfb\xa6::\xed\xe3U\xc0\xdbg\
-\xeb\xad\xb7N\xcbC\xab\xe9\xf4\xbb\x8e\xd5\xfb\xd0j\x9a\
-\xf8\x1d\x08\xb8gG<\xec\x06\x97\x90@\xa0\x09\x01\xee\
-E\x08\x94\x01\x82\x96\x91\x05\xe6\x09OxB\x0aJ\xc4\
-\xdd\xd5\xfd\xe3\xa3\xc3\xf4qS\xf9\xb8\xa7\x1cgq7\
-)\xd4\x19\xe9\x94X\xdaY\x1d\x94I\xeb\xba\xee\xba\xe5\
-\x8b\x9a\xfb\x94hSo\x80\x0d#NZn}\x5c&\
-\xea&\x1f\x88\xb6\xc1\xd3\xfd\xe3~\xf1j\x96*\x91\xc8\
-gk\xfd\xba{\xcfz3\x93+.\xf1&\x1c\x94?\
-\xab\x95\x96\xdc\x17\xbd\xe8E9\xe9\x94n\xdf\xf2\xfd\x95\
-\x8b\xabn)\xd7\xfe\x8d\x08\xb56\x0ddi\xc9\x10\xe7\
-\x8e\x14\x0bV\xed\xdf\xa5\xba\xd3\xd9eO\x1b\xd7\xd7\xe4\
-k2D\xbf\x92\x95\x89\x93Q_\xbd\x0e\xeb\x85\xd7Y\
-gi\x19S\xe1\xb6\xf4:\xad=\xf6\xb8\xb9\xf8\xc5/\
-FJ\xab\xf122.}\xd95\x8e\xcaA\x07-(\
-]g\x97\x94d\xfd?\xe5\xe4yI\xf1\xf4\xa7/{\
-\x8d\xd4h\x82\x86\x1f\xd5\xfc\x0d\x87{\xdae\xa2\x8ed\
-\x98PS\xb6\x12^+,rm\xc7\x9a\x0a\x97\x07\xe9\
-\xa9\xcaX\xca\xeaVo[=\xd5\xba\xfdnK;\xc8\
-z\xea\xf5f\xd20h\xa2Q\xaf\xa7\xd3\xff\x87=\xec\
-\xf6R\xa9y]\xd9\x0f\xaeQ\xc6@(\x8a\x9dv\xba\
-\xa5S\xd2Y\xb9\x1f1\xe3\xf2-\xea\xbb9\x0b\x22i\
-\xfc0\x0f\xe94\x07f\x8dF\x8c\xab\xc2B\x8a8#\
-\xbf\xee'\xd6\xf7\xb1J[\x19,\xd3\x9d\x04\xb9\xa6\x14\
-0\xc6\x9bC]{\xed\xb5i=t\xd5\xcb\xcc<\xac\
-M\xba\x1do\xcb\xdbv\x0c\x96;\xed\xb4SZ\xc7~\
-\xd4\xffb6\xb4\xa5\xaf\x1e\xcb\xcf\x905\xdc\xfd\xb4/\
-\xe7\xab\x96U\xffmy\x805\xff\x96\xd5\xed\xb7\xdf~\
-\x89\xac\xf3\xf2\xect\x0d\xb9\xaew\xba\xf6\xd9\xcd\xbf^\
-G\xa7\xff0q\xad\xeab_\xa7{\xaf\x9e6\xfe\xcf\
-^\x04\xcc\xa1\xe6\xf6\xf3@\xcc^\xa8f\xe7\x99\x9b\xfc\
-rU6\x01F\xd4i'un\xdcvXf\x90q\
-\x1fZ\xe7\xfc\xc9\xfb2IG\xa2L\x08\x91uDK\
-\x19\xcaR\xa6\xb2\xd5\xd1\x8fD\x9bzCk\x18q\xd2\
-\xf2\x9f\xff\xfc\xe7\x89\xac\xfb\xed\x1e\x11\xac\xe7\xe9O\x7f\
-z\x22\xea\xf6q}\xaf\x12u\x83\xa5u]>y\xbd\
-\x97\x81\xd9}\xc8\x951\xa7\xa5\x00P\xf6P\xc8\x9c\xc9\
-!\xa7\x03=W\x0a\xb6\xdb\xa7\xbf\xd2\xd6\xbd1Ub\
-\x8d\xf0^{\xad^N\x9a\x97Y\xbb.\xbbl^\x19\
-4q\xa5\xd2Eu\x99\xf7\xda:\xeb,)\x83\xb9\x8d\
-\x94\x04aY\x1bo\xb8aN\xe9}\xb4\xb4\x5c\xe2\xb1\
-\xa48\xfd\xf4\x95\xd2\x1a\xf5\xb6\xb6\xd7\xf3\x1fz\xe8\xaa\
-)`][\x9e\xa6c\x0bKk\x91\xc9p\x95d\xf8\
-\xcd\x92\xd7vLY&\x96\x88\x02\xb7`\x22\x0f\x05l\
-\xf6\xd0C\x1a\xbc\xc2\xa9\x97\xb2\xb8\xdd#\xb6HT\xb7\
-z\xdb\xeaI\x0d\xa9|\xb5\xa5\x1dd=\x95*\xd3\xcf\
-L\x18`k2\x9f\xc7\xc4\xb6\xadt\xd2\x0fJ\xa1\xb5\
-\xcd6\xb7\x95\xb1?\xae/\xad\x88\xab\x95K\x1a\x96\xdd\
-\x87\xf5v\xce\xd6\xff\xe6&\xac\xab\x22\xa5\xbb\x8f\x19 \
-\xb8\xc5[f\x85\xbc7\x89\xa5\x1a\x08\xbd\xfb\x9d\x0b\xf5\
-q\xc7\x1d\x97\x94\xc9\xee\xf3\x87<\xe4!)\x06\x8f\xc0\
-e\xbc\xbc\x90\xc0m\xb6\xd9ft\x9c\xaa\x97\x87\x98\x09\
-\xbc\x9b?\xf2\xf4[F.\x93\xdb\xbb\xe7P\xac\x09^\
-\x02^gV%}\x14\xdb\x5c\xec\xb3\xf5<\xe7k\xda\
-R\xaeY\xbfnN6\x08y\xfd\xeb_\x9f\x94\xe9\xde\
-\x0cd\xae'h#\xe5`\xaf\x92\x9f\xa3l\x08\xf2n\
-x\xed\xcb\xffm\xfd\xb7?\xef\xf3\xfc\xb4\xf5\xfd\x14\x8a\
-\x14\x19\xbc\xf3(i,W\xc0}\xda\xf0o\xbb\xf6\xbd\
-\x9eKNg\xed~\x9e\xeb\x0a\xb4\xecC\xecs,$\
-\x10hC\xc0}\x12d\xbd\x0d\xa1Y~\xcc{A\xb9\
-\x02\x19\xd4\x90mk\x9b\xac\x83\xaa\x12\xf4<\xd9\xd0i\
-&\xedO\xd9i\xfam\x02b\x92\x22\xadA\x84%]\
-T\xf8\xed\xb6\xdb.\x95\xa5Le\xf7\xfb\xee\xd1^\xda\
-$\xe2\xa6\x09c[\x9b\x90<\x8a\x84\xc9jS/8\
-MF\x9bL\xca\x0dR\xae\xcdd\xb7\xc9\xe4\xe4\xa3\x1f\
-\xfdh\xaa\xdf\xc0j\xcd O\x8d&1\x91\xdfk\xaf\
-\xbdR\xa4i\xeej>, \xdc\xe7\xf3\xa4D^.\
-v\xcarN\xd6\x1e\xaac\xaa\xe5\xd0\xedo)6X\
-\xa5tC]|[\xb1t:|\x96x\xcd\xda\xe2\xe2\
-\xba\x1bVt\xd5\x1e+\x96&g\xae\x93\x0f\x227\xd1\
-\x1f\xd7]]\xd9R<\xd6v\x8f'\x9f\xf5\xe7[m\
-u[\xb1h\xd1\xda\xa5Bs\xdd2\xb2\xfa\xda\xc5\x96\
-[\xdeV\x06\x82Z\x16\x8c\xed\x85/\xbc%\x91\xf5\xc7\
-<f\x99\x05}\xef\xbdo*'\xb5\xf3K\xcb\xcez\
-\xe5\xba\xce\x05\xc5\xfd\xef\xdf\xbe$\xad\x9a\xbf<\xd52\
-0\xdd*\xe5:\xf3e\x81\x9c\xfai\xb7\xbe\x99\xe5\xeb\
-\xc0\x03\x0fL\x169\xeb7\x05]\x12\x90\xaa\xed\x98:\
-\xf4\xa9\xde\xc6 *6\xe1\xe5\x02{d\x061P\xa6\
-\xb5\xb5\xdec\xdd\xad,\xd6I\x13n}p\xb7\xb4m\
-\xf5h\x87\xa8\xd8\xde&A\xda\xd2\x8e\xb7\x9eTA\xcb\
-\xd7D\x10\x8d\x96\xea\x1a\x0f=\xfd\xe9\xb7\xa6\xd7\x06\x8a\
-\x810\x19\xe2\xb5\x5c\x1f\xfc\xe0\x07S\xb01\xd1\xff\xfd\
-\xee\xe7U]\x93\xd1Fu\xb8/?\xfc\xe1\x0f\xa71\
-\x83\xf7\x85\xd8\x0a\xa2}W\x83\xb0\xe5\xb6\xb8\x8e>H\
-\xaf\xb7\x15P\x06\xb3\xc0\x8a~\xae\x0c\xf3!\x9f\xcf~\
-\xf6\xb3)\xa2\xbcc\x82\xcd\xf9\xd8\xdf$\xde\x9e\x80$\
-\xe6\x0fr\xdfo\x19\xb9]\xc6o\xf1\x7f,\x1d\xb3\xd4\
-\xcd\xdah\x04>\x8b\x08\xed\xc8z\xb78\x0b\xd2s\xf5\
-g\x01\xef\xb4\xa6:\x97\xd9\xcb\xd6:oQ\xce\x8d\xc7\
-\x94\x09\xe6\x8b>0\x1b\xabx\x9ey\xe2\xb1\x8c\x13[\
-\xff\xed\xefU\xb8\xa2s9G\xc0-\xb9c\x04\xa0T\
-h\xc3\xbf\xed\xda\xf7ZoN\x87\x90\x9b\x1f\x8b\xc6\xcf\
-\xc3\xd4\xc7o\xfb\x82\xacg\x94b\xdb\x86\xc0\x9c\xd2Z\
-U>W\xed\xee2\xd5\x02\xdcd:\x9d6\x11,\x86\
-\xfbP\xb6z5\xa5\xa5m3\x81\xab\xae\xa3iJW\
-\xdf7\xd5e\xd7\xdb3\xc8\xff\xd6\xdc\x98\xf0\x98\xc4t\
-\x12\xc7a \xe0\x16\xab\xc4x$[*\x9b\xca\xa0\xc9\
-\xd1\xe9\x8a\xe8N;*\x02\xb7\x08\xa3\xae)\xf7I\xc7\
-\xdd7\xd6\x88zES\x938.\x80\xc7\xd1G\x1f\x9d\
-\xd6!{\x8d\x05\xed-\xf7-\x03\xa0\xe8\xa9:r\x03\
-\x8dN\xab\x9b\xb4\xb5\x09\xf1\xcc\xe4\x9c\xab\x1bM\xaa\xc1\
-\x98\x05\xb6:\x81\xd7&\x1f\x13{\x9a\xf2\xbc\x0e\x7f\xa2\
-\xda\xa4\x9e\x1c\xe1<\xd7]=\xcf<\xb9\xb3\xcf\xa4U\
-\x9a\x89l\x13\xab\x02y\xf4\xa3\x1f\x9d\xb4\xbb\xeao\x12\
-V\x00\x81W\xb2p\xb5\x1b\xcf\xb5S\x0eO\x0ak\xcc\
-\x89\xd7\xcf\x18,\x9bDdT\xefi5\xb1&\xd9j\
-\x97\xd3\x1ap\xe55\x98R\x06Q\x00\xe45\x87{\xee\
-\xb9\xe7\xb8\x02\xcey\xe5\xd4\xa2E\x8b:ZGr\x1b\
-f\xd2\xd6=\xe7\xda\xce_i~\xb1\xd1\xc6\x1b\x0d\xe4\
-\xd4\xae\xfc\xcb\x95\xc5\xad\xb7\xdd\x9a\xfa\x87N\xf7\xd8@\
-*\x1a`!\x83\xba\xf67\xdf<\xa7\x0c25\xb7t\
-\xc7^Rz\x8f\xac8\xb6\xd2'\x95\xddU\x92\x12\xfa\
-\x145\x9e\xfb|\xaf\x92\xf3#\xec%w\xeeY\xf4\xf7\
-&\xd0\x84u\xcf\xd2\x13\xde(<\x5c\xb8\x85R\x9eu\
-;\x96\x12\xd4\xbe<\xd7^\xdb\xa6\xbf@\x82\x10\x1b$\
-\xbc\xdf\xb2\xda\xda\xa4\xacN\xf5\xe8c\xd5K\xb9\xe7<\
-\xda\xd2:6\xd6zR\xc1-_\xc6e\xcf\x122\x96\
-%\x13\x0b\x96O\x01\xc8\xea\xffs:\xe4\xb6\xdf\xf1|\
-\xeb\xad\xd7N\x91\xdf\xb7\xdf~\xc5\xf5\xe9\xb9\xdc\x89\xdc\
-\x9a\x17xc\x07E\xbcy\x5cV\xbc\xf2\xb4@\x86\x9e\
-\xfd\xecg\x17\x1f\xf8\xc0\x07\xd28?\xc8v\x8c\xf79\
-5\x8f\xf8\xd3\x9f\xfe\x94\xe6\x05\x08\x5c\xaf\xe2|\xcdY\
-\x9a\xc4\xdc\xcd<\xa8\x97yLS~\xfb\xfa)C\x7f\
-\xed]\xf0\x94#<\x03\xcc_\xbcv\xd1+\xe7X\xf7\
-\xb3P\xa4\x99\x1bu\x13\xcf\x90\xf9S/R\xedGz\
-I\xdfO\x1a^6da\xe9\xfdC!\x91%?7\
-H\xf7O\x7f\xfa\xd3\xe4I\xe0y\xca\xe2<)-:\
-)Jr:\xf3gi\x19j\xea\xd2\x86\x7f\xdb\xb5\xaf\
-\x97S\xff\xef~\xb3^\xdd\x9c\xa6zm\xa43Oe\
-p\xe09\xd8\xcb\xbd3\x1d\xf8W\xfd\xfc\xe3\x7f3\x02\
-m\xfc\xab\x9e\xc3\x5c\xb8;C\xaa\xe7j\xf9\x8f\x8c\xd1\
-Z\x19\xact\x82\x06\xa8\x1c\xc19gss\xd2\xf6\x09\
-\xf4A\x1b\xe9U\x18y\xa2\x9d\xd34m\xa7\xb2l\x1d\
-\x08\xb0\x9a>\xdc\xa2z\x11\xca\x09\xc4T\x19yR\x94\
-\xf3\xb1j\xc0\x0d\xf9\x90\x06Y\xafk\x22Y\xaa\xb8<\
-\x19,t\xce\xd2p\x19\xd6AM\x84\xd0\x90\x9a|!\
-\x8e\x82\xc4!\xbe\x88\x91\xf6\x9ft\xd2IeT\xd9/\
-\xa6\xc8\xa4\x17_|qc\xf5:\xb7\x1c\xc8\x85\xc6\xd6\
-\xe0\x22?\xb2o`W\xa6\xb2\xd5\xa1\xae^\xa4\xadM\
-\x99\xa8#\x06\xc8\x1d\xbct\xea\x5c\xa5\x05%3\x89\x22\
-\x8e\xfbH\x9f-\xff\x13\xd9&D\x9d\x16\x98\xc2\x82[\
-\x18-\xbe{Y\x04\xd9\x03K+\x94H\xa9>\x22\xbe\
-:\xbf\x89n\x13\x05\x05\x22\xce\xfd\x0fq\xa7xi\x12\
-V*\xefL~\xc3\x1b\xde\x90\xda9\xdek\xa7\x0e\x81\
-\xe1\x88\xb2X\xc9;\x89\x01\x95\xb0Z\xc0\x0eV[n\
-\xb9\xe5hr\xde\x01\x82\x02\xb1,\x10\xd6\x0ce\x12\x13\
-\xfa\x90\xfe\x11p\xdfyF\x07%\xdcD\xab\x93\xadA\
-\x95;\x1d\xcaA\xd0\xefs\x9f\xc5\x8dD]\xfb\xabs\
-\xe7\xb2+J\xeb\xdc\xfb9\xaf\x9c\xbf\xc7\xb9uc\xd1\
-\xc6gJM\x1eH\xc6\xa6\xea\x98\xd4v\xac\xa90\xee\
-\xa5\xfa.d\x15i\xc8D]\xda~\xca\xea\x96\xb6S\
-=\xfar\xf5g\xa2\xae\xdeNi{iS[^\xf9\
-;\x89q\xc5\x84;\xf7_\xd2!\x14\xe6A\xfa1k\
-\xa5m3q\xcf\xe5 \x0f\xbdL\xd4s\xfa\xeav\x9f\
-}\xc4\xeaX\xa3\xbakR~\x1b\xdf\xe1\xe4\x1e2\xb6\
-\xe9\x93)i|\xfc\xb6\xcf1i\xa4\x1d&\x81\xf5\xc2\
-\x92\x0c\xba\xdf\xfa\x91ND]\x19\x14\xedc\xbd\x86\xb9\
-\x0d\xfd\x94\xc1H\xc2`ci!%\x89gn\x87\x1d\
-vH\xa40\x97g\xdb\x0bQ\x97\xaeW\xa2.\xedD\
-\x8b9&\xe2\x5c\x95\xfc\x1c5\x11u\xe9\xcc\xb3\xe4\xeb\
-&\xc6\xa4&\xa2._\x1b\xfem\xd7\xbe[\x9d\xee\x0b\
-\xd1\xf6\xebD]>sx\xc7\xc6{\xef(k\xaa8\
-\xd2\x09'\x9c\xd0\xc8\x8d\x5c\x0f\x9f^\xe6d\xee]i\
--aj\x93^\xd3U\xcbh\xe3^\xd5t\xbd\x96\xdd\
-k\xbaj\xd9\xe3\xfdM\x996b\x80\xc9Df<\x05\
-\x9a8\x1b\xf0i\xf7hS=T\xb6\xb4\x07,e\x84\
-F[\x14q\xe4\x08i1\xc1\xe6\xde\x8a\x84\x22}:\
-P\xc2\xd5\x19\x91C\xe4\xc9T\x97\xedb\x03\x8b\x06\x0c\
-\x99\xae\x8a5/\xbd\x88\xf7\xd0\x1a\xb4\x94C\xd3\x96\x05\
-)\xe2\xca\xa4\xc3=\xf6\xd8c\xd3\x04\x97K\xa1\xb5U\
-H-wEb\xd0\xa3U\xa3I\x85\x17\x8c\xe0\xcd:\
-\xc2\x95\xcbu\x1c\xa4p%7\x89\xe0\xae\xce\xa2Nk\
-\x9c\x091\xc2\x87\x0c\xbbo\xeaVO\xfb\x0c\xd2\x82\x7f\
-Q\xd4\x98\xb8\xd8\xa7\x934p\xd8\xba\xfe\xcat\xcd\xfd\
-W\x17\x17\xb5n\xd2\xd6&\x9d\x1d\x0c|2Y\xd7v\
-\xaf\x90\x83'\x8d,\x82\xa8\xd3\xcdX9\x9f\xc9h\x13\
-\xbc\xb4\x03f\xda\xe4\xde\x86\x8b{\x81hG\x1eh&\
-\xbaM\xda\xa1~\x1f\xcf(+\x88\xc9#ku\xc6E\
-\x9b`\x88\xbc\xf9h\xdbxq\xa2T\xca\x01s\xf4\x11\
-\x06\xc6n\xa2N\x1fD\xdd\xc7\xebj\xbcU\x00\xc10\
-Q\xd1i\x12e)\xd31u\xa8\x8br)\xa47\x04\
-\x5cw\xd7\xf8\xb6\xdb\x97=\xef\x9d&3\xbd\x95V\xa4\
-{|\xf1\x92rp)\xcb\xac\xdeS\xbd\xe6\x8ft\x93\
-\x87\x00\x85y'i;V\xcf\xa3\xffm{\xe6\xfa)\
-\xab-m\xa7z\xf4\x9bu\xe9\x946\xa7\x1bK=9\
-o\xa7\xad{\x1e\xd1\xa8z\xc7e\x0b`\x13QWN\
-\xafD\xa3^\xe7I'][\x8e\xd1E\xf9\x9c\xd5\x8f\
-L\xfc\x7f\x16u\xe7\xf9\xedo\x7f{\x05\xefH\xcf\xbc\
-%s\xde\xe6\xc1\x83JZ\xcb\x97B\x06\x8b\x00%?\
-\x0f3c\x1eO\xd6N\x1e\x8e\x83\xadu\xe2K\xc3\x0b\
-\xcc\xb9\xab\xcf\x90Z=G\x22\xf1\x9b\xcb\xd5E\xfa^\
-\xe6\x14\xf5|\x93\xf5\xbfm\x1cl;\xd6k\xfb\xa6\x92\
-#\x99\xcb\x8b\x9bP\x97\xef~\xf7\xbb\xa9\x7fp_\xea\
-\xe3\xf0@\xf1\x89\xf4\x91UA\xf63\xe1\xcfs\xe2\xea\
-\xf1\xfc\xbb\xd7t9}\xdev\xe2^\xf9\xb8m\xafe\
-\xf7\x9a\xaeZ\xf6 ~\xbbG\x96Gm\x1c\xa5\xb2\x04\
-{\xc8\xbe\xf2\x95\xaf$B\x8b\x00\x5c~\xf9\xe5) \
-\xc7\xf9\xe7\x9f\x9f\xd6\xb0q}FX]X\xef\x1d$\
-\xdcV\x90\xcfO}\xeaS\xc9M\x04I\x10\x00\x82\xc5\
-\x8f\xd5\xd5\x85\x9e\xea\xb2u\x04\x84\x95\xb1N\xd6\xd3\x81\
-._H\x11+\xa6H\x94\xd6sU\x85\x85\xd3\xa4\xc2\
-;2s\xe7\xb4\xa8t\xc3\x85\x8b}\xc8\xba\xce\x18Q\
-\x87Sv#\xb6\xf6\xdb\x04Egm\x12\xe0\xd8 \x85\
-\x9b\x18\xb2\xae\x0e\x03\x01\x05\x83v\xfa \x9a\xc8\x1e\xa9\
-*\x1e\x10;\x9d\xc6i\xa7\x9d\x96\x06r\xc44[\x19\
-rth\x0f*\x82\xcemQ\xd9\xeaPW/\xd2\xd6\
-&7s\xee\xf4\xdcC\xda\xa7~\x04\xd9\x7f\x91=)\
-8^\xfe\xf2\x97'%PN\xaf\x0d\x13\xd9&\x8a\x0a\
-\x18d\x92\x9c\xdb\x84\xc0\xc3.=\x84\xff\xc3$\xff\x9f\
-\xc86U\x15\x07~\xbbf,\xfe\xc8\xf0\xf3\x9f\xff\xfc\
-\xe4\xb6\xecZ\xc0\xcc3\xe8y\x1d\xc4\xb5\x83}\x96\xaa\
-\xe5-\xef\xebeK\xeb\xdaI\xf3\xaaLd\x1d\xde\xdc\
-$\xdb\x88C/u\xcd\xb64\x9ek\xd6\x9a\xdf\xfd\xf6\
-w\xc5\x16\x0f\xdeb\x5c\xa7\xaf\x8c\xb5\xd6^k \xd6\
-\x82q5$2\x07\x02\x93\x8c\xc0d\x12\x8d;\xdd\xe9\
-\x0e\xa5\xffd\x9e&\x97}\xae\xef\xac\xe7\x0c\x0a\xde\xc6\
-a\x5c{\xf1\x8b_\x9c\x9aa?\x85\x1fbe\xaeg\
-\xbf\xb9Ouy\xc0d\xb6w&\xd7\x85\xa0N6I\
-5\x1f\xf8\xd6\xb7\xbe5!\xb0R\xf0d%=c\xce\
-f\x9bm\xb6\x5c=MD]\xbalLX.\xf1,\
-\xfa3\xd5\x1c\x097\xaa\x8a\xb9,\x83\x9d\xeb\xc9{\x00\
-\xdf\xe3)\xc9#7\xf7\x13\xd2\x9b\xff3:Z\x9e%\
-\xe8\x9e\xb9[\x93\xf4\x9a\xae\x9e\xb7\x8d{\xe5\xb4\xbd\x96\
-\xddk\xba\x5c\xee \xb7\xe6\xb5\x03!\xebN\xc2\xda7\
-n^U2\xcb:\xccM\x9c\xa5U\xc0\x19[k_\
-\xb9\xadf\xb1\xaeiaiQ\xb7\xb6\x99 /\xdc\xc1\
-3a\x19\x86\xb2\x91u\xed\xe9wM\x99\xf3\x01\xb2\x81\
-\x8a\xdb\xbf\xe0$u\xb2n\xed0\xcdT&\xea\xf2P\
-P\x88\xb6\x8eH\x91\x8cM\xfd\xd5T\xfe#\xeb\x06\xcb\
-A\x93u\xe7\x8c\xb0\x19\x08\x90k\x0f\x9f\xff:E\x04\
-\x0e\x196\xc1\xb7\xdf9\xb2z\xbb\xd6\x08u\xb6\x22s\
-\x85ETa'\x8dk+\x8f\xff&5\xca6\xc8g\
-eH:\xd9\x96\xaf\xb66U\xb3\xd1\xce\xe56 \x9c\
-\xfe\xabS~\x9d\x9a\xce\xc3\xbd\x8a\x9cLF\x9b\xe0\xe6\
->F\x8e\xe1\xa6M~\xc3D\xbb\xe0K2F\x13\xd9\
-&\xd6\x10m\xa1\xc4\x80\x91:)+tj,\xd6\x08\
-\xbbe\x16\xae\xab4\xee\xc1\xec\x8d0\x9ekWU\xc8\
-\xe4u\xb3\xd5k6\xde\xdf\xd52\x05.\x0c\xe9\x0f\x01\
-\xd7\xd6$\xec\xc6\xf97\x16\x97\xfc\xe6\x92b\xd3\xfb\xdf\
-\xb1\xee\xb6\x9f\x92\xe4]i\xfeJ\xa9,e\x86\x0c\x0f\
-\x02\xbdL\xb2\xf5\x07!\xcd\x08\xe8\x97\xdbd\xb6\x10\x0d\
-D\x0dI\x7f\xe2\x13\x9f\x98\xe00\x86\x9b\xeb\xd9\x12\xcb\
-\xa7,\x81#\xd2H+O\x90\xf5\x04\xc9\xb4\xff\xa2\x88\
-\x19\xab\xc2\xbd\xd7\x937\xe7`\xac\xe3y\xca\x03\x86'\
-\x9d\xb9g\x16s\x18\x9e\x9b\x0cYb\x12\xe1\x15\xe6R\
-\xb3Q\x86\x81#\xd5qg\x84\xb4,\xca\xb2\x18\xfd&\
-\xe3\xa3\xf9@]\xb1\xf4\xc9O~2yL\xea\x1f\x90\
-\xf9N\xd2k\xbaj~cY\x1b\xf7\xcai{-\xbb\
-\xd7t\xb9\xdcAo\x07B\xd6M\xf2\x11\xa2\xbaK8\
-\x12\xeaB\x896Ili\xca\x10\xb5,.\xa0t\xe7\
-\x9dw^\xda\xe5\x81\xe3\xd6\x0dh\x93\x0b\x17|\xaa\xcb\
-F\xf2\xacob\x9d\xa5-Bb\x16\x95\xd6o\x1a\x22\
-\x9dH\x9b|\xe1\x0b_(#\xf6\x9e\x99\x02\x7f4\xb9\
-)5\x91l\xcb\x07\x0c|4\xd3\x04q\x22\xf5\xc9o\
-\xee\x9c&b\xdd\xba\xfa\xe1Ni\xa0\x1e\xd71OV\
-X\xfca\xc2z)20\xcb>wj$\x1e1\xcd\
-\x16[K t$\xca@\x08s\x19\xb6\xca\xb4\x1f\xa1\
-\xcf\x83|:\xc9\x96\xaf\xb66U\xb3\xb9>\xda\x22=\
-b\xec^\xd2\xd1\xc3Q\xdd\x82yX[)bjv\
-\xff\x9e\xa86!\xe7\xea\x82%\x5c\xb4-\x93u\xd7\x13\
-\x0e\x8eic\xbe\xce\x13\x89\x93\xf8\x10\xea\xa2 \xb0\x1c\
-\xc1\xa0Hi\xa1-\x88<\xcd'\xb2\x8e\xc8k\xa7\xeb\
-\xe3\x9a\x8e\xb7M\xca&\xca1\xb0\x0eZ(\xf8\x94\xed\
-\xdc\x5c\xfb\x90\xfe\x11\xf0\x8c\xc0QP\xc9\xb1\x10\xf6K\
-/\xb9\xb4\xb8\xf9\x96\x9b\x93\xc2\xb6:\xb1\xea\xbf%\x91\
-c\x22\x10\x98\x8cI\xf6D\xb4{\xba\x959\xd3\x89\x86\
-\xe5H\x96\xed\xe9o\x89y\x90q\xcd\xeb\xb4\x88\x18#\
-\xd9z&\x8d\xb4\xf2\x84\x04\x02\xbd\x22`\xfc\xa0\xe4\xc9\
-b\x1eR\x17\xf3\xc7\xaa\x92\xbe~|\xb6\xfc\x1f\x06\xfe\
-U\xc5\xda\x1cL\xac(o\x0c\xc9\xcbx\xad\xa7\x17$\
-\xb0J\xd6)[(\xf6xa\x0b\x04\xdd\x89\xac\xf7\x9a\
-\xae\xda\x06\xbf\xbbq/iz-\xbb\xd7t\xca\x9c\x08\
-\xd1\x8f\x8ed\x820\x9e\x0a2\x19\xe7.]\x15\xa4\x9c\
-\xa5]\x806\x17P\x87\xcd\x92^\x17\xeb\x95\x05-C\
-\xaeL(\xaad~\xaa\xcb\xd6V\xc4\xd4\x9a\x8b\xa7<\
-\xe5)I!\xa1\xe3\xa0\x09:\xe2\x88#\xd2\xbb5;\
-Y\xdc\x91\x06\x11;\xbdb\xe2\x05/xA\x22e\xf5\
-s\xcf\xff-\x11\xb0\xae\x0bF\xc8\x91H\xec\xf2\x10\xeb\
-q\x09wek>2I\xa7\xe9!\x1e\xd6A\x8b\xeb\
-\x95?Me\xc3\x83\x08V\xa6=\x08\xa9}\xfe\xdb\xfa\
-8\x7f\xc7\x5cOe\xd5%\x97\xdft\xac\x9e\xd6\xff^\
-\xd3\xd3\xc8\x0ar\xa3\x0d\x08'R\xaa\x93@\x12\x91\x11\
-D\xb5S\x9d\xbd\xd6\x91\xdb\xd7-=\x22N\xfb\x0b\x0b\
-\x1f\x96jm\x224\xc2\x88\xb2\xc9\x1deF'\xe9V\
-G=_[z\xcf{\xbe6\xda\xa6n\x98\xf8d|\
-(\x18\x1c\xa3hQV\x93\xb4\xd5\xd1\x94>O\xec\x9a\
-\x8e\x0db\xdfD\x97?\x886N\x872\xdc\x87\xbc|\
-\xf4y\xe7\x9c}Nq\xbfM\xef\xd7U\xb9\xe2\x99G\
-\xee\x17\xac\xb6 \xe5m\xbb\x97\xa7\x03\x06\xd1\xc6@`\
-<\x08\xccF\xa2\xd1i\x9c\x18\x0f\x8e\x917\x10\x08\x04\
-\xba#0\x0c\x1c\xa9\xdaJ\x01\xe5,{\xc4W2W\
-q\xbcJ\xd4\xfd\xdfg\x9f}\xd2<\xb3\xe9\xd5\x89\x8e\
-g\xe95]No\xdb+\xf7\xea\xb5\xec^\xd3U\xdb\
-0\xe8\xdf#,j\xe3%\xec,\x86\xa4J\xb2sC\
-\xedc\xa5S\x87\xc9\x7fS\x9a\xec\x06\xac\x1cd\xbd*\
-S]\xb6\xb6\x98\xb8\x1a\x80\x05S\xc9\xef\xad\xe4\xde\xc1\
-\x95\xfa\x80\x03\x0e(2i\xae\xb6\xdbo\x01@\x10\xa3\
-\x8f\x7f\xfc\xe3\xf5C+\xfcw#\xb3T#s<\x0b\
-(\x03\x16\x95\xd6{\x9e\x08\x5c\xe8\xad\xf9@\xe6\x11w\
-\x11@Y\xb2\xb9\xbf#{<\x10\x06-\xca\xd4\x96l\
-\xcd\xae\x923\x93\xf1\xacTA\xf6\xb2\x85\x9a\x82\xc1C\
-\xe2\xb8k\x8a\x8c\x22Q~\xdbW-\x03\x19T\xb6}\
-\xbd\xb6\xbf\xadM\xd5\xf3W\xa7\xeb%}\xfe\xad\x0d:\
-\x0e\x1f\xde\x00\xd6\xae\xc3\x8eb$\xb7k\x22\xda\x94\xad\
-\xe7\x19\x93\xea\xb9\xfa\x9d\xb1\xd1\xaeL8s{l\x07\
-\xdd\xa6\xdc\x0eZi\xe5W\xebG\xd8\xbdF\xcf\xba0\
-\xb1\x07<\xab\xae\xf3 \xae\x1d\xac\x89:Y\xd9\x9b^\
-\xb1\xe2\xd8\xe5e\x9c\x0bZ\xcc~E\x99\xf2\x93\x5cW\
-\xbfeD\xfae\xde;\xee\x09JV\xcf\xbf~f\xde\
-\xdcy\xc5\x06\x1bn\x90\x96\x01e\xef \x0aKJ\xb1\
-\x7f\x5cU\x06\xdf,\x83\xc9\xf10\x82\xbb\xe7.\xdf\xc7\
-\x81g 0\x1b\x110\xd7\xc9\xf3\x96\xbc\xa4M\x1f\x9a\
-\xc5\x98\xc3\x12\x9d\xad\x85\xfaY\xe3\xc4t\x11qCX\
-\xad\xf4\xb7\x9euk\xd4Y\xc8X\xd4\xfdga7n\
-\xb0\xaeK\xa3\x0f\xa9.}\x9c.\xe7\x19\xed\x0c\x04\xa6\
-\x03\x02\xb9\xafi\xe2V\xf6M4\xff\xaac$h\xf8\
-F\x1bm\xd4\xfa\xc6\x1f\xde\xc6\xfa\x0d\xaf\xb3k\x0b\xf4\
-\xd9k\xbaz\x1bz\xe1^\xbd\x96\xddk\xbaz\x1b\x06\
-\xf9_?z\xc7\x082\x8e\x92s\xd0'\xafO\xa9\x0a\
-\xa2\xe1\xb5]\x22\x82\x22#\xc8hu\xedjN+\x1f\
-\xab^\x93{\xecT\x97\xad\x8d,\xe8\x06\xe0\xaaf\xc8\
-z\xf1\x8f}\xecc\xc9\xb2\x9e\xcf\xa3\xbaE\xb8\x91\xd7\
-\xbd\xf7\xde;\x05N\xa8\x1ek\xfa\xcd\xe5=\xbb\xbd\x0b\
-\xb2\xf0\xd0\x87>4\x91\xdd\xfcj8\x01\xf8X\xbc\xac\
-\x051(z\xf5\x19\x85\x816L\x049A\xa6D\xef\
-\xf7\xd1\x19\xb8\x960p\xd3 \x99\xd5I\x88\x01Z\xe4\
-~\x01\x22\xbc\xf3\x9a\xa2A\xfa<q\x97\xdeG^e\
-8\xa6Le\xebL\x9a\x88[\x13FmmRv&\
-\x09&F\xac\xe9\xeaR~\xfe\x8fP\x88LK\xe1!\
-m>\x9f\x89l\x93I\x18\xf2\xe3\xfc\x9d\xb7zs\xa7\
-\x0a\x1f\xedtL\x1ai\x9d\xc7D\xe2\xa4.\x93E\xcf\
-\xa3z\xb4E\x1bx\x7f\xbc\xeeu\xaf\x1b\xbd\xc7af\
-\xc2\xa5\xbd\x83\xb8v\x02\x0af\xe1=R\xbf\xe6\xfa\x00\
-\xd1^\xc7\xba\xa4\xa3\xeafY\xad+\xd7\x19\xdb\xde\x11\
-p\xcd\xdd\x8f\x14q\xee\x01J5\xc4\x82\x87Hub\
-\xa0\x0fX\x7f\x83\xf5G\x15:UB\xd2{m\x91r\
-\xb2\x10p\x1dM\xdcB&\x06\x01\xfd\xa4\xbe\xd43\xa2\
-o\xaf\xc6\xef\xa9\xd6\xe89\xf1\xec\xf8Xr\x22\xbd~\
-x\xba\x10vo\xa01\xc9\x16\xedY\xd4w}\x845\
-\xea\xd9\xf5\x9d\x22\xd8>\x22\x8dw\xae\xcb\x13\x12\x08\x04\
-\x02\x83G`\x188R>+\xcf\xbb%\xcd\xfa\x03s\
-\x88&1\xdf6\xd7\xc4a\xea\x81\xe9\xaa\xe9{MW\
-\xcd\xe3w/\xdc\xab\xd7\xb2{MWo\xc3D\xfc\x1f\
-\x08Y\x07\xba\x09\x9e\xf5\xe5U\xe1\x9e\x8d\x18\xe4u%\
-\xd2!\xa2Ub%\xbd|9\x8d\xff,\xb5,\xd2H\
-\xdf0\x94\xed<\x0c>U\xb2\xae\x9d\xd6\xd4\xfc\xf8\xc7\
-?\xf6s\x05A\xb2\x9d\xbbm~\xbf\xb4\xf3&,\xe4\
-\xac\xe2\xa2W\xb3\x22\x22\xe1\x14\x19Y\x04\xaa1\xb8U\
-\x97\x06\x18\xc8i\xac|x(\x98\x0c\x98xy\x95\xdb\
-Dh\xad-i\xb0|\xc1D\x82\x82\x05\xb9r>\x08\
-\xa7\xc1\xd8D\xc3\xe4D;\xb2\xc0\x87\x86\x9d\xf7\x81(\
-\xb0<\x12\xf2\xc4_\x1ey\x95!\xe8\x9c2\x95\xad\x8c\
-\xfa\xf2\x89\x5c^}\xdb\xd6\xa6L>\xd5\xa7M\xae\x97\
-}\xea\x84\x9dI\x85`\x13\xac\xc7\xc4\xb5\xf0\x99\xe86\
-iCV\x1c\xe4\xb6\xc1\x80\x98\xb4e\xb2,\x8d\xe3\x13\
-\xdd&\xb8\xa8G\xbd\xear\xefq\xf1\xf1\x06\x06\xfb\xb3\
-\xc0\x90g\x846\x0e\xe2\xda\xb9\xa7\xb3\x08\x98\x98_\xcb\
-h\x1f+\x93\xe0\x8b,\xb5c\x95\x1c\x84Q\xfej]\
-c-/\xf2-\xbb?]\xffL\xdc\x0d\x5c\xee\x19\xe2\
-^\xf1\x5c\xe5O\xe05\xfc\x08\x18/\xaa\xe3\xec\xf0\xb7\
-xz\xb5\xd0x\xa9\xdf\xf4\x9c\xd4\x89:e\x97\xf1\x9e\
-R\xd4\xd8\x99E:\x8aJcB\xa7\xc9mN;,\
-[\x81\xe2,g4n\xe8k\xb3\x91!\xb7/\x93v\
-$]\x1ai#\xb8\x5cF'\xb6\x81\xc0`\x11\x18\x06\
-\x8e\x94\xcf\x08?\xc1\x15\xf6\xd8c\x8f\xbc+my\xe2\
-\x88\xc5ekN! 9c@u\xae\xc6\xb0k\x8c\
-r>\x8cj[o\xbduO\xe9^\xf9\xcaW.W\
-W/\xdc\x8b!u\x22\xdb\xb0\x5c\x83\x06\xf0'\xcd\xb3\
-\xaa\x13\xf4\xb1\x96i2\x0f\xf4#\x8f<2\x91\xec\x5c\
-\x8e\x8bCr\xe4H[$\xcd\xeb\xdd\xb2\x18\xc0\xac/\
-\xcei\x109k\x1e\xecG\xd8\x87\xa1l\x91N\xbd*\
--\x93,m7\xf8\x9e}\xf6\xd9\x85h\xeeY\x90\xd3\
-,\x82\xe6q\x93_T\xba\xb2#&>\xf9\xb5\x13,\
-\xbc\x5c\xb1\x11'\xee\xd8\x02,\xe4Ip\xce/8\x1b\
-\xf2\xeb\xfcY\x0d\xef\x7f\xff\xfb\x8f\xbe\xcb0\x13d\x91\
-\xe5\xb9\x9do\xb3\xcd69\xdb\xc0\xb6\x82\xc2\x10u\xd1\
-\x94Y\xc7\xec\xdaP\x14h\xb7\x07\xcd\xa4#\xb7%W\
-\xec~\xdav\xdbm\x93\x1b\xb5w\xc3\xe7t\x88\x9f\xbc\
-\xcaP\x962s\xde\x5cW.\xa3\xd36\xa7kj\x13\
-\xd2\x0dC\x1f\x93\x1e\xde\x06\xea\x16\x0f\xe1\xd0C\x0fM\
-\xde\x08MD}\xa2\xdb\x04\x0fxU\xd7\xa7\xbb\xae>\
-\xda\xa7\x9d\x8ee\x12\xed<&\xb2M\xear\xdd\xd4\xed\
-\xfapww\xbd\xea\xfd\x00\x8cs:m\x1bo\x9bh\
-\x7fs0\xc63\xce8ct\xdd\xbek\xed\xb5\x84u\
-\xa2\xae~m\xedE\xc4\x00P&QG\xd64\xf7\x92\
-7\xd2tG\xc0@\x91I;%\x8f\x8fg\xcc>\xc7\
-B\x02\x81@`\x19\x02\xe6\x08U2n\xaf\xb9\x02\x85\
-\xba\x00K\xb6\xfeW\xc5\x18P\x9d[T\x8f\x0d\xebo\
-s;c\x18\xafI\xcb\x03\xab\xf3\x17\xbf\xbf\xf3\x9d\xef\
-\xa4c\xd2\xe4y\xe0\xb0\x9eK\xb4+\x10\x98\xce\x08\x0c\
-\x03G\x82\x9f9\x18\xe3\xa57T\x993V\x85\xc5\x9d\
-\xa1\xf6g?\xfbY2\x98\xe1F\xcf|\xe63G\xb9\
-\x11~d~nn\x81\x1bq\xa3\xf7\xbf\x97t\xeaa\
-\xf0\xb1l\x8f\xf4\xc2\xbd,-\xee\xa5\xec~\xda\x90*\
-\x9f\xa0/}\xea@\x02\xcci\x9fu\xdb\xdc\x8b\x11O\
-.\x0e.\x0a\xf2\xbe\xeb\xae\xbb\x8e\x12Z\xda\x12\xd1\xa6\
-\xb9> \xa3&\xe4\xefy\xcf{\xd2\x859\xf0\xc0\x03\
-\xd3i\x9a\x04\xba\xe0\xac\xae\xd9Uv\xaa\xcb\xde}\xf7\
-\xdd\xd3\x85\x15`\x0eq\xa7\xfd1\x00!\x18\xbb\xec\xb2\
-Kj\xb7\xfd\x87\x1dvX\xb2\x98?\xebY\xcfJ\xaf\
-R\xabGzGx\xb8\xae#I\x08$\xa1\x81\x82\x97\
-AO=\xce\x1f\x81\xb2N\x02^H\x14\xf2!\x88\x9d\
-\xb5`\xc8.\xd2\xcf\xeb@\x00\x07x\xd7\xebI\x05\x8f\
-\xf3\x8b\xa5_\x9d\xb4\xe3\x1e2.\xb0\xac\xbf&\xe8o\
-}\xeb[S\xbbX\x8d\xdd\xf4M\xe2&\xb7n\xc4y\
-|\xfe\xf3\x9fO\xd7\xd35E\xd4\x95\xa5L\x9d\x8c:\
-\xaa^\x05Me\xe5}mmB\x1a`\xa5M04\
-a\xf2\xba@\xca\x10\x13\x86,nz\x1f\xa4\x18\x96\x13\
-\xdd&\xf70\xbcH\xae\xdb\x96hon\xb7\xdf\xb0\x9c\
-\xe86\x99\x18z\xb3\x81\xfb\x96\x07\x84z\x9b\x84\x12\x0a\
-\xdeY\x092^\x9c\xd4\xc3[D\xc4O\x1d\xeb1\xc7\
-\x1c\x93\xe20\xa8\xbbN\xd4\xed\x13\x97A\xff\xd0\x8b(\
-K\x99D\x1d\x9d\xce\xa9\x97\xb2\x22M 0l\x08\x9c\
-w\x9e\xa0\x7fKJ\xc5\xe3\xb2\xb7\x82\x0c[\xfb\xa2=\
-w \xa0\xff6\xaeU\x05A\xf7jSc\xb57\xa7\
-X\xee\xe3\x93Ez\xf3\xa1z\xbe||<\xdb_\xfd\
-j^i\xb9_\xf6J\xab\xed\xb6\xbb\xb5\x1c\x1b\xc7S\
-\xda\x1dy){\x19U\xccQLzy\x19fe\xba\
-5\xea\xe6\x0d,\xea\xe6I\xd2\xce&\xa1x\xf1\xc6\x1c\
-\x06\x1es\x91\xc9\x14\xaf:3\x9e\x22B\x9d\xe4o\x7f\
-\xfb[\xba\xd7\xaa\xd7\xc5\x9c\xcc\x87\xd1\xec\xf22n\x0c\
-\xa3\x9aW\xdc\x0e\x93X6\xa9\xcd\xbd\xce\x0b\x86\xa9\xed\
-\x13\xdd\x96\xa9\xe6H\xce\x8fU\xdd\xfc\xf2\xb5\xaf}\xed\
-\x0a\xa7+\x88\x9c\xd7\x02\xe39\x9e\x09\x16\xf6\xba\xf0\xd0\
-a\xb8\xad\x1e\xab\xfe\xce\xe9\xeb\xe9\xccQ\xc5\xf6B\xd6\
-\xdd\xb7\xf8P\x9d\x135q\xaf^\xcaVg\xaf\xe9r\
-\xfb&j;7\x13\x87\xf1V`ro\x9d\x02+\xb0\
-A\x89\xd5\xd7\xc4\xd9{\xad\xb3pyF\xd6\xad)\xdd\
-s\xcf=\xd3d\x1d\xa9\xb3\xaf\xdaqx\x9dV\xd5M\
-v\xaa\xcb\xe6\xd6em8W[\xaf\x18p~\xceS\
-\x04w\xbf\x09r\xa8\x13Ah;I&\x11Uk\x94\
-\x1b\x9bK\x86u\x16\xa2\xbf+\x8f\xb2\x82\xf2\x22\x13z\
-\xe5Y\xab\xce\x82\x8e\xb0{w\xa9u\xf4n|\x84}\
-\x22D\x1b\x11&[\x04\x98\xdb>+>\xb2\xed\xfay\
--\x03\x97JD8\xbb\xc7V\xc9\xa8}>\xae\xa3\x87\
-\xf8\xe1\x0f\x7fx\xca\xab\x0ce)\xb3ZG/\xe7P\
-M_o\x132\xe9c\xa0t/Q\x08q{\xf7;\
-\xb7+\xb7I\x9a\x9c\xde\xf9Ld\x9b\x9cW\xc6\x8a+\
-\xa0N\xe5\x01\x0fx@\xfa\xf8m\x9d?\xb7\x1f\xc4\xd8\
-\xf9eR<Qmr\x1d\x5c\x0f\xd7%\xe3\x91\xf1\xc9\
-[\xfb]W\xd7W\xdb]\xef\xf1\xe2\x04\x07o2\xc8\
-q),\xf10\xa9#&\x08\x94@Y(\xa3\xean\
-T\xf9X}\xab\x0ce\x11e\xab#$\x10\x98j\x04\
-\xbe\xf5\xad\xf9%\xc1^o\x85\xcf\x0d74+\xc7\xda\
-\xda{\xe8\xa1\x0bJK\xe5\xc4L\xfay\x83\x99\xc84\
-I\xdb\xb1\xa6\xf4\x08Z\x93\xe8W\xf2\xb2\xa7\xa6\xe3\xf5\
-}\x9d\xca\x91\xae\x9f6uK;\xa8zr\xfb\x9d\xa7\
-\xb1\xa5J\xd0X\xd3\x11\xf5L\xd0m\x11v\xfb\xb3H\
-/\xdfx\xe5\x0f\x7f\x98WZ\xed\x97\xbf\xbf~\xf7\xbb\
-y\xa5\xe7\xd2J%\xa1^\xa3\x9c\xcc.\x7fl\xbc\xf5\
-\x19[-\xe93_\xa1\x900\x07\xf2\xf1\xdb>\xc7\xaa\
-\xf3\xba\xf1\xd67\x88\xfc<\xaf\xaa\xf3*e\xf2\xec\xf2\
-\xba\xd2A\x09\xc51\x05F~]\xe9\xa0\xca\xedV\xce\
-\xe1\x87\x1f\x9e\x94\xf0\x08{\x93\xb0n\x9ao0b\x98\
-sX\x1a\x98\xe3Ly-\xb1y\x019\xfe\xf8\xe3S\
-\xe0\xe4\xa62&z\xdf\xf9\xe7\x9f\x9f\xe6\x8a\xe6\x9eY\
-\x90ts]\xd7\xc8\x1c\x8aQ,dy\x04\xa6\x9a#\
-]p\xc1\x05IAeYn\xd58\x96[\xc9hE\
-\x81T\xed\x1b\xf3\xb1\xbc\xc5\x8f2G\xca\xfb\x9a\xb6\xf5\
-t\xfe\xebwxb\x9aC7I.\xb7\xd3\xf1\x9c\xa7\
-^v\xde_\xdf\xf6\x9a\xae\x9eo\xac\xffS}\xa5\xab\
-\xf9R\x9a\x89^E\xc7\xb6\xe3\x8e;vLn\xc0\xba\
-\xf0\xc2\x0b\x8b{\xde\xf3\x9e\x09\xc0N\x09\x0d\xde\xeaE\
-Rz\x95\xa9.[{\x0d\xbcH\xb9N\xaf.&=\
-\xe3\xd1\xfa\xe5\xc9\x05\x17\x90N\xa2\xe3\xf2\xaa\x06\xef\xb4\
-\xa7\xfc\x18\x8f\xd0\xe6\xb7\x09\xd2F3\xee\xb5l\x82\x13\
-\xe9\xef5\xeb\x88\x00\x00\x1a$IDAT\x10x\x0d\
-x\x18)%\xb8\xac8_\xc4\xb9z\xf3\xbaN>\xf0\
-\x82I&\xa0\x06/\xc4\xca\xf2\x01n2\x88 \xcd|\
-\xb7\x07\xa8\xda\xc6hS\x15\x8d\xce\xbf\x87\x11'\xadu\
-\xed\x05H$:X\x93W}\xc5\x15W\x5c\x91\x9e-\
-\x8a\x01\xca\x8c^D,\x89\xfd\xf6\xdb/)[\xa4\xa7\
-\xc8\xb2\xcei<\xc2\xe3c\xd1\xa2E\xc9\xd25\x9er\
-\x22\xef\xf4C`\x90\xd7\xfe\x9b\xdf\x9c_\xde\x8f\xab\x15\
-\xa7\x9dv\xcdr@\xac\xb7\xde\x92\xb2\xaf\x5cnW\xd7\
-?;\xee\xb8f\xa98\xbd\xb5T`\x8d/8\x9c\xfe\
->\xafY7\xd6\xe8\xcb\xad\xdb\xd3\x97{\xc5h&\x90\
-m\xc7\x9a\x1a\xabO\xa7t\x16,\xcd\xb2\xa3\xa3\x8e:\
-j\xd4\x9b\x0eA\x10\x83\x06\x19Eb<\xaf\x14\xd1M\
-\xd2VN?m\xea\x96vP\xf5\xd4\xcfA\xec\x1d\xe3\
-^u}6\xd2\xc6\x12\x94\x95\xfa\xf2 \xeb\xac5'\
-\x9ex\xe2h\x11\x97\x5crI\xf22\x1b\xdd1\x86\x1f\
-\xee\xb7\xb3\xcf\x1e)\x95\xe1\xd7\x96$y\x99\xf7\x96b\
-n\xbaiN\xa9p]\xb7\x8c\x0dtu\xe9\xadx\xc7\
-\xfe1T1\x14Y\xc6\xf3\x9c\xf2*#?\xfa\xd1\x8f\
-F=\x01N;\xed\xb4\xe4\xba\x9b\x95\xc7\xe3=I\xcb\
-\x1c\x8ci\x17_|q\x8a\x093\xde\xf2z\xcd\xcf[\
-\xce\xbd\x97\x9f\xe3j>\x1e\x1f\x9e}1\x04^\xf5\xaa\
-W\xa5eh\xde0\xe4\xd9\xe7\xf9\xc8`f\xad\xef\xc9\
-'\x9f\x9c\xb2\x99?\xf43/\xab\xd65\xd6\xdf\xda \
-v\x0de\x02c\x05\xaeAv-\xbds\xf5\x1d<u\
-]#\xcf\x92g(/\x9d\x1dk}\xd31\xdft\xe0\
-_S\x81\xab\xfb\x95L\xf6=;\x9es\xed\xc6\xbf\xea\
-e7\xab!\xea\xa9\xfa\xf8\x8f\xb4\xb1\x8c\x9b\x88\xb7\x89\
-`a\xfd\x10ueMu\xd9H)W\xaf&\xa2\xae\
-}\xe3!\xea\xf2\x0b\xf6\xd5F\xd4\xa51\xd8X\xd31\
-^\xa2\xae\xacn\xe2\xc67\x00 \xd6:u.\xed&\
-:n\xb2\xfcZ7\x9d(\xab\xab\xa5\x01\xd5\x8f}\x8e\
-!\xf9\xd2\xca#\xaf2\x94\xa5Le\xf7\xfbpE\x9b\
-\xba]\xb5e\xc7\x87\x11'-\xcb\x0a\x1f\xbfMj\x90\
-\x04\xf7\x84I>\xedy'\xa2\xee]\xde\xe2\x1cd\x91\
-G^\x83:\xe1r9^\xa2\x9e\xcb\x8em 0\x08\
-\x048\x8b\xdc\xe9NK\x96\xfb \xea\x7f\xff\xfb\xdcr\
-]\xdd:\xc5G>\xb2j\x19\x8bd\x9d\x92\x88\xafU\
-\xae\xfb\xbd\xc3r~\xee\xb9#\xe5\xb3\xb0V\x19xs\
-\xddrb\xbdz\xb94\xe6\x8e\xd6|\xf1\x8b\xab\x14\x97\
-\x5c\xb2\xcc\xad\xf9\x8e\xbd\xfd\xffb\x01a\xf5\xe42\xcb\
-\x9d\x19\x81f\x0d%m\xc7\x90Q\xca\xfa\x1cw\x061\
-~\xd9\xcb^\x96\x94\xae\xfay\xc4\x94eU\xffOY\
-\xcb[L\xe4p\x8aZqh\x0e:\xe8\xa0\xb2\xfd\x97\
-$R\xdbk9\xdd\xda\x94\x1a]\xf9jk\x7f[{\
-\xfb\xad\xa7R\xe5\xe8O\xf8\x988\xfa8\x7f\x8a\x0bJ\
-\x11\xbf\xf3\xc7\xff\x13N8!\xfd\xcfi\xe5\x1b\xaf\xbc\
-\xf3\x9d7\x941;\x96\x94\xee\xa6k\x96d\xacO\x8d\
-\xd0x+\x9f&\xf9\x8d\x8b\xc6 \xca\xa5&o\x06\xd6\
-\xe9*\xd9E^s\xc0<\x0a\x16\x04\xd7=m\xfej\
-\x89\xdd\xe9\xa7\x9f^l\xb9\xe5\x96\xc9\xf0PWB\xf1\
-\x864\x9e\xb1\x08\xf34\xad\x0abj\xbc\xe2]\xb7\xef\
-\xbe\xfb\xa6\xfbE\xb0a\xebm)\xb0\x1922q\xae\
-\xe6\xcbdu\xe1\xc2\x85\xc9\x8b,\x07V\xd5.\xcf\x17\
-o\x86\xaaU:\xe7\xe5\xfa.\xb6\x0bk\xbay\xacg\
-\x9fG\xa7W\xb5\xd6\xc5\xb22\xcfP\x16m\xb5\xc4\x95\
-\x02\x02q\x16K\x8a\xf0\x06\xe5nl\x1e\xcf\xc5\x99\xfb\
-|\x16\xc4\xda\x1b\x8d\x1c\xd36}\x03\x91\xd7\xab\x8c\xcd\
-\x15\xeb\xa2/\xb2\xbc\xb3\xaa\xd8\xa2d8\xe5\x94S\x92\
-\x92\x8f\xe5\x14A\xe7=g.\x19\xb2\x22\x02S\xcd\x91\
-Vl\xd1\xe4\xec\xf1\x5c\xfb\xccTI\xe7\xe7\xe2\x86\x04\
-\x02\x9d\x10\x10\xad\xd6d\x8cr\x00\xc1>\xeb\xac\xb3\x0a\
-\xaf\x91c\xddG\xa0\x90%\x1d\xb1\x81\xa0\xfa\xb1\xcf1\
-i\xa4\x95G^e(K\x99\xf5\x88\xb9\x9d\xdaP\xdf\
-\x1fm\xaa#\xd2\xfc\x7f\x18q\xd2R.\xee\xd6\xf3\x11\
-\xca\x9cC\x0e9$Y\xc5\x91q\x83s]L\x88,\
-\x9b\xa1U\x96\x86\xf6]\x1ey\x89\xb2L\x08\xa6\xa3p\
-\xc5m\x9a\xb88\x17\x13\xac&A\x84\xc6\x22p\x1ck\
-\xde^\xebs\xfdx\xff\xb4\x09/\x0ak\xd3\xba\x89t\
-\x88\xddt\x15\xf3\xd1\x9f\xfcd\xa5\xd1\xcfE\x17\x95\xec\
-\xbd\x14\x1e\xcfW^9\xb7\xbc\x97GJ\x0b\xebue\
-p\xd6\xdb\xcb{zY@\x1e\xae\xca\xbb\xef\xbeF\x19\
-\xa7dqi=\xba\xb6Tl.-\xfb\xcd\x95R\xbe\
-\x92\xef\x95\x93\xd6\x05\xa5\x05l\xe5\xf4\x7f\xac_\xae\x11\
-\xabn^c(v\x85I7\x02\xdev,\xd7\x87x\
-\xe7{\xd63i\xe2\x8f\xfcpqDXL\xba\xb9\xb3\
-\x9a\x98{\xd6)e\x895\xb0\xd2\x1a\x0fH\xaf\xe5\xf4\
-\xd2\xa6T`\xf9\xd5-m[{\xbb\xe5\xcdut\xda\
-f\xa2\x8e\x04\xf2(\xeb\xf5#}\xb6\x0cu*\xbbi\
-\xff\x15W\xcc+\xb8\xbe\xe7\x8f\xb5\xe9\x07\x1c\xb0,v\
-\xc7\x0e;\xac\x99,\xeaM\xf9f\xfb>\x1eX\xe6*\
-M\xee\xd4y\xce\x9212\xc6\xf0\x18!\xe64H\xa2\
-\xd8E\x88;\xd7\xf1\xbd\xf6\xda+-\xff\x14{\x09\x09\
-\xe5\xed\x95\x05\xc95\xef1^!\xeb\x94b\xc4<\x88\
-B@\xac\xa2O\x7f\xfa\xd3\xe9\xf5v\x96\x8b\xba\x0fD\
-\xc4\xe6RL\xc9C\xa9P\x15m\xa18`\xd0\xa1\xec\
-\xe1]I1F\x01\xe5\x9c\x90c\xaf\x14\xb6~\xb9.\
-\x94\xe1\x8cL;\xef\xbcsZB\xe9\x15\xa9\xe2\x05\xe5\
-\xa0\xc7\xd5\xf4\xce3[\xfd\x04\x0d\xa3\x147\xbe:g\
-\xed\xa3\x5c0\x8e\xa8[\xb9\xfa\x0d\xcfu~\xce\xad}\
-\x17\xa7\x87\xd2\x81\xc2\xc1\xf3./9\xf7\xdcsS\x1f\
-Q\x7fs\x94c\xe2>U\xa3\x83\xdb\xc7\x03\xd7\xb3Q\
-\xf5V\x11ly\xac\xafxUfH 0\x1d\x11\x18\
-i\xd2.N\xc7\x13\x896O\x1c\x02\xb4\xc3\x5c\xa7\xac\
-\x93\xa7\xdc\xd1a\x1b\x5ch\x8cu\xf6:l.\xf14\
-\xb6\x84\x05\x81\xeb\xbb\xc9\xf6O\x7f\xfa\xd3\xe2\xa2\x8b.\
-Jk\x92\x11u\x1f\x1a\xe9N\x16\xd4^\xcf\x22\xda\xd4\
-\x1bR\xc3\x88\x13-\xa1x\x02\xd6\x0f\xd2\xe2\x1b\x8cM\
-\xee}\xac]\xa7\xc1\xf7\x0a@k\xd0\xdf\xff\xfe\xf7\x8f\
-Fz\xe7\xba\xe8\x93E9&\x1f&(\xd3M\xe9h\
-\x02crcRd\xe2c9\x88\xc9\x1b\xb1\x8ch\xb7\
-\xddvK\x13J1=\x8e=\xf6\xd8d\xa1@\x90\xac\
-\xfbB\x82\xb8\xd7\xe6\xf4&.\xac\x94\xdc9M\x9a\x9a\
-\xc4sh\xad&\xcbE'\xb1\xdcE\x90K\xcf2\xf7\
-\xe5\xaa\x98@\x9a\xa4\xaa\x9f\xf5\xa6I\x8e>\xfa\xe8d\
-9u\x8c\x85H\xa0\xcc\xa65j\xdai\xd2f\xa2j\
-2\xc7Z\xc3+\x09\xd9\xb1\x0c\xc2\xc4\x93\xf5Q^\x16\
-\x1b\xd7\x9c7\xcet\x93\x7f\xfccn9\xa1]c\xb4\
-\xd9\x08\xf8)\xa7\xdc\xe1\x16\x7f\xf0\xc17\x96\xf7\xfa\xe2\
-\xb2\xff\x5cRNfW)-S\xf3\xca OsK\
-\x22<\xa7\xec_\xaf/1)J/\xb5\xdbG\xd7\xab\
-\xeb^\xcf<\xf3\x9aR\xc9\xb9\xcc\xe5o\xb4\xe0>\x7f\
-\xb8_<s\xd5>\x98\xc7\x18o\x95\xb6c\xaa\xf1\x9c\
-\x09\x9e\x95\xc5}\xcc:\x98\x9f?\xd7\x895\xcd~J\
-\x00V\xf5,\x22\x84#\xc4\xc6\x8c~\xcaA*:\xb5\
-7\x97\x9d\xb7\xdd\xda\xdf\xd6\xde~\xea\xc9\xf5U\xb7\x99\
-\xacSPko/\xd6r8\xe8\xc7\xa4\xefG.\xbb\
-l^i\x99]\xbb\xac\xa3s\xaeSO\x9d_Z)\
-o\xe9\x9c`\x96\x1e\x11\xc8\xef\xa3\x1f\xfdhRP\x89\
-A\xd4\x8f\xf0\x1a\xcd\xa4\x94\x87#\x0bx\x0e\xc4\xc6k\
-\xc4\xfd\x97]\xed-\xf7b\x91&\x02.\xbb\xff\x05\x17\
-\xf6*_[}\x1cA\xf8\xf5\x9d;\xed\xb4S\xfao\
-\xe9\xa19U]\xcc\xa3\x10i\xb1\xa1\xf4\x97\xc8\xf9\xa9\
-\xa7\x9eZX\xa3\xae,\xde\xac\x14\xf4\x9d\xde\x86\xc2\xd2\
-\xef\x95\xba\x14\xdd\x087ws\x81\xbf\xaaD\xb8^g\
-\xb6t#\xe6$\xbb\xa2\x1b\xa3(\xe5\x9c\xa3y\x1fb\
-\xae\x1ck\xe0\xf3\xdb\x0e\xcc\x01\xb9\xde\xeb\xbf\xb3\xb0\xec\
-[\x0a\x97\x97\xe3\xe4\xfd\x9d\xb6\x14%\xfa\x94\xaa'\xa9\
-\xf5\xcf\xbc\x10B\x02\x81\xd9\x82\x80\xf1a\xc4`\xd1\xcb\
-\xa02[@\x89\xf3lF\xc0\xc4N\x07\x7fT\xa9\xf1\
-\xa5=F\xc8\xb9AY\xf3hro\x80B\xc4\x09\x0d\
-0\xeb\x9a\xce\xda\x84[g\xabC\xcfnTc\xb5\xa8\
-\xd7[\x16m\xaa#\xd2\xfc\x7f\x18q\xd2\xef\xb0\x12\x08\
-x\x87\xfc\xb9\x97\x08\xe5\xa1\xf7\x15\xb3\xa0\x9b\x04!\x99\
-M\x82\x5cP\xfatZ\x92\xd2\x94gX\xf6\xe9o\x11\
-m\xee~\xac\x09\x08\x04\xef\x00.\xc4\x1bo\xbcq\x0a\
-\x8e\x884\x9b\xc4\x1d|\xf0\xc1i\x9d\xa1\x89\x96g-\
-[U\x1e\xff\xf8\xc7\xa72t\xe2\xac\x9a&M\x9d\x88\
-\xba\xf3fE\xe2\xbe\xd9I\x90q\xc7\x11\xac\x1ct(\
-\xa7U\x07\xe5\x0a\xe5\x5c\xa7\xb1\xc2\xe4\x09\xc9f\xf1a\
-\x1dqn\xdc,\x05zl\x13\xe5\x09vhRHi\
-!\x90'K\x0e\xa5\x80\xb7#\x98\xd4\xb1\xdc\xe4\xc9b\
-[Y\xc3v\xec\xeew\xa7\x84Z\xe62\xda\xd4\xb6\xbb\
-\xdeu\x19A\x13\xe9\x1d1\xe7(\xf2\xfb\xdf\xcf+\x16\
-.\x5c\x9c\xfe\xcbS\xea\xae\x12\xa1\xcf\xf97\xd9\xa4\xf7\
-\xf829O}\x9b\xa3AW\x15 \xfao\xfb\xdb\x8e\
-\xd5\xcb\xf1_\xfa\xfc\xd6\x96|\x1c\xe9\xb5\xbf*\xacm\
-H\x8e7\x844\xf5\xffm\xe5\xf4\xd3\xa6ni\x07U\
-O\xf5\xdc\xea\xbf\x8d\x8d\x9d\x9e\x93zZ\xe9zM[\
-\xcd{\xdf\xfb..\x95\xe6b\xce,\xef\x19\xc93\x83\
-\x82h\xddu\x97\x94\xcfP\x10\xf5*f\xd5\xdf\x88\xb6\
->E\xdf\xa9\xbf\xe9U\xaa\xf7\xba\xb9\x8d\xe8\xd7Y\x10\
-\xca\xea\xb5\xac\x12R\xbf\xad\xb3&,\xee\x94V\xfat\
-R\xcd\xe3\x7f\xd3\xf3a\xbfqqa\xe9\xfe\x9e\x97[\
-\x1aC\x11s\xfb{\x11\xfd)\xa2\x8f\xb0\xb3\x98\x1fX\
-z\xc1\xf0pd\xe9\xef$\xc6\xa6Ee\x0c\x97,\x94\
-\xa9>,\xe5\x969jOU(|\xa57\xae\x19\xe3\
-\x9c\x9b@\xd3\xbcx(\xdf\xb5\xb9\x8aK5o\xd3o\
-o\x190.\x98S\xe6\xf9%\x02\xdfm\xb9hSY\
-\xb1/\x10\x98\xae\x08\xe0O#\xb4\xba\x06\x97\x90@\xa0\
-\x1b\x02\x06\x11\x01Jhri\x89u\x9a\x88\xba\xc9<\
-k_v\x9drO\xb1\x90\x1a\xcc\xfc\x96\x8fF\xd5\x00\
-\xe9\xff %\xda\xd4\x1b\x9a\xc3\x88\x93\x96#\xdb9\x88\
-!\x8d;\xf78\xf7\x8d\xf5|\x06g\xe4\x8d\x0b!w\
-h\xe7\x80\xd4r\x0fd\xd1\x98\xae\x82\xb8x\x9b\x84\xc9\
-\x1b\xc5\x17\x82\xee\xfc\x90'n\xf1&_\xd9\xad\xdfd\
-\xd2\xe4&\xc7\x7f094)\xa4\x08#\xac\xd3&O\
-\xac\xde\x9d\xc4\xc4\x90\xd5\x94\x97B'1!\xe2\xe5@\
-\xc9\xe6zT\x85\xd5G\x9d\xac\xdc\x9d&v&\x7f\xac\
-N\xac5\xc4\x9aG\x0a\x02d\xdd\x84\x8d\xdb'\xd2\x8d\
-\x14\xb2\x085\x89\xf3\xb7\xde\x92\xb5\x87\xd2\xc6\xa4\xd4\x1b\
-0X\xe2\xa7#Yo:\xc7n\xfb6\xdahII\
-t\x97\xef#\xeb\xff\xbb\x95\xd1\xed\xb8\xfb\xcd\xfd\xc4\x15\
-\xd8:PB\xd9\xe2>j;\xd6T\xae<\xae}U\
-rYy\x9fzX\x12)\x98\xf2k,\xf3\xb1\xbcm\
-+\xa7\x9f6uK;\xa8zr\xbb\xab[D\xc4\xf8\
-\x96-\xf4u\x12VM\x9b\x7f\xe7<\x96\x04\xf4+e\
-7Y\xca\x1d\xa6\xf5\x1bo\x9cSz\x19\xe9\x1f\x96\x96\
-\xaf\xc8\xbc>)z\xfa-s6\xa5?\xe0\x80\x03\x92\
-\xe5\x9bU8\x8bIq\x8e\x83b\x9f{w\xac\xa2/\
-\xb7\xb6\x9dP\x12e\x82\xb9\xc3\x0e;\xa4 \xbd\x14\xb1\
-U1.\xb4\x89{\xbbnQV\xae{\xba\x9b\x18S\
-x3\xf1\xc8r\x8e\x9eE\xe3\x02\x05Z\xdb\xfc_\xfb\
-\xab\xed2\xee\x98\xeb!\xd1\xda\xd3i9\x93\xfe\x9e\x82\
-W\x1c\x0cA%\x91u\x8a\x82~\xc5\xb9\x99K\x0a*\
-\x98\x03\xcaY\xb7\xcf\xf0\x13\x12\x08\xcc&\x04Fz\x19\
-Pf\x13 q\xae\xed\x08\x98\x8c R\x887-*\
-\xd7,\x84\xc3\xba)\x13@\xc2\xcdL\xb0<\x1d*k\
-\x1cb5h\x92^me\xb4\xa9\x8aF\xe7\xdf\xc3\x88\
-Sn\xad{\xa4\x89\x80\x9b\x10 \x8f\xac\x10\xdcKM\
-6\xa6\xbb \xeaH\xabW0Z\xd7jR\xc7\x8a\xce\
-\xc2\xe3\x992A\xa2\x04#\xdc\xe0Ys\xec\xb7F\xd1\
-$\xc8\x92\x14$\xd6>\xef\xad\x17X\x88\xe2\x0c\xf1\xca\
-\xd6\x87*F,\xe5\x14 m\x93\xba\x1c\x9c\x8f\x12\xae\
-*\x5c\x1d\xad\xc7\xb4\xc6\xd9d\xaf\x93h\x8b\xd7\x01e\
-\xf1\xdb>\xc2\x92d}'R\xe7|\xb9l\xe6\x89\x97\
-\xe3\xca\xe5\x9aI\xd9'\x0d\xd7\xe9l=\xe2A1Q\
-\xaf\xa7T\xf7D\x0a\x1d\xf8\xbf\xfe\xb5<\xf1\x16p\xae\
-M\xb6\xd8\xe2\xf6\xd2\xd5uNq\xf8\xe1\xe2z\xdcR\
-\xba\xc7\xae\x5c.'Z\xb6\xbcH\xbeC\x0f]\xb5\x9c\
-h\xdfVz\xa4\x8c\xfdU_\xaca&\xc0&\xda<\
-)\x88\xdf\xactm\xc7\xa43\xb1\xb7fT\x0c\x89\xbd\
-\xf7\xde;\xe5\x11\x94\x8brE\x99\x5c`\x8d\x07\xd9\x15\
-Wz\xee\xbd\xde \xc2++K?\xe5tkS.\
-\xd3\xb6[Z\xed\xea\xd4\xdeny\xab\xf54\xfd\xce\xc4\
-\x1b\x0e\xfd\xcc\xabr\xbe\xa62\xfb\xd9\xf7\xcew.(\
-\xafOQ\xde3\xd7\x95\xcf\xfb\x1d$\xbe\x9f2fS\
-Z\xf3\x14\x0aE\x1eM\x96d\x11\xf7\x00\x05(\x8b2\
-\xa5\x8b%Hc\x15\xcb\x8e\xf4\xcf\xfaf\x0a\xcf\xac\xa8\
-\xf2\xccY\xe6E\xf9\xc9u\x9c\xa5[\x1f\x8d\xd4\xb6\x09\
-e(\x0b\xb3\xfb\x97E\xdc\xfay\xed\xac\xbe\xe6\xb8S\
-~\xe3\x09k\xb7\xad\xf8\x14\x96T\x19S\xcd\xcf\x90\xf7\
-N\xc2\xbb\x8d\xc2\x95\xd7\x15\xa5\xb1\xdf\x94\x19\xd6\xc5#\
-\xed\xdc\xe2\x8d\xc9\x02\xdd\xf1\xac\xa2\x80\xe6%\xe7\x9c,\
-\x9b\xa4\x14p\x8e\xf9y\xa0l\xb0\xb6\x1f\x16U\xaf\x84\
-N\xf5{\x96\x04\x8f\x85\xa5\xa8\xf5\xe6\x9b\x96h\x09:\
-\x17\x12\x08\xcc\x16\x04<?\xc9\x0d~\xb6\x9cp\x9c\xe7\
-\xe0\x10@\xfcL\xc8\xab\x13\xf4\xc1\x95>\xb6\x92\xa2M\
-\xbd\xe16\x8c8\xb5\xb5\xdcd\x22\xaf\xe7kK7]\
-\x8e\x99\xec\x98d!\xb1,\xe2\xc8\xbbI\x8dI#2\
-k\x82R\x15\xff\x91!\xa4\xddzGy-\x1f0\xe9\
-B\xa4\x11l\x1e\x08\x94e&`u\xab\x03\xc2M9\
-\x90\xc5d\xaaj=7i\xecd\x997\xa94\x193\
-\xe1j#\xeb\xf5v\xe76\xab\x93\xc7\x04\xcbx\xb6,\
-\x891\x90\x89|n\x93\x891BgM\xa6\xc9\x9c\xf6\
-h3\xa5_\xf6\xd8\xc9i\xa7\xc3v\xce\x9c\x22\xad?\
-\xdft\xd3u\x96k\xee\xe5\x97_\xbd\xdc\xff\xfcGz\
-\x9f\xf5\xd7_R\x9e\xff\xf5\xe5\xc4}\xb52X\xd8j\
-\xe5\xfa\xee\xdbKo\x85e\xc4\x1c\x11\xfb\xfc\xe7WI\
-.\xf2\xe3!\xeb\xae\x8d\xe7\xe9\xc0\xd2\x0d\xd6\xe4\xda\x12\
-\x08\xb1\x03xM\xb4\x1d\xd3V\xcfb^\xab\xeb\xff\xf6\
-\xdbo\x9f\xeeY\xa4\x87\xdb\xab2\xad\xb7\xcd\x1e\x16\xaf\
-\x7f\xfd\xeb\xd3\xbaZ\x1e3\xd9bI\xa9\x84(\xf5Z\
-N\xb76Qv!\x07\xd6\x0c[\xb7\xdb\xe9\xdc\xba\xb5\
-\xb7[=\xf2w\x93:\xf1\xf6\x9c\xc2\xa8j\xbd\xa5p\
-\xa3`\xab\xbe\xddB\xbe\xf1\xca\x9e{\xde\x5c>3K\
-J\xa5]\x10\xf5^\xb1\xb4\xa6\x9cu9+)\xada\
-\xd7/\xf3\xde\xa2\xf8D\xac\x91m\xe2\x1a\xb5]\xa7\xfa\
-q^c9\x9e\x83eA\xe2\x90\x10\xfd\xad>\xd8R\
-\x1f\x96{J\xea^\x14\x92\xfa\x7f\xe4\x98R\x97W\x80\
-\xfe\xd4R#1\x22\xba\x89gR\x9c!$\x99\x92\xcd\
-xBqE\x99P\x97\xeayh\xb7\xd7\x15\x8b\x89\xa2\
-o\xa6\xa8\x93G[l\x95\xe7~\xf6<#\xeb\xf6\x8b\
-I\xa1\xef\xa6\x5c\xa0\x1c0G\xf4l\x12c\x17\xa5\x9d\
-%p\xc6\x94&\xa9cL\x91+6\x0de\x81\xf2,\
-\xc7\xa4\xb8\x0e\x09\x04f\x0b\x02\xe9\x99,\xdd\xaf\x96z\
-p{\x95n\xef\xf9\xeb\xb5\x9cH7\xf5\x08L\xc7I\
-\xf0\xd4\xa3\x16-\x98\xc9\x08\x8c\xe7\x1d\xbe\xbd\xe2b\xed\
-9wo\xde(\x14'\x84{?\xb2c\x82\x93\xad\xe6\
-\x88\x11\x02\xbep\xe1\xc2D\xe8\xab\xaf\xc34I3\x89\
-Bl\x91\x13\x11\x87\x7fT\x06\xf2A8X=\xab\x82\
-\x8cq\xab\x17\xc0\x8fpu\xcf\xaf\xfc\xf1\xdf\x842\x13\
-|\x93VD^\x101\xc1\x92\x90\x0dV\x15.\xea\x5c\
-\xf5\x11#V\x9dz\x1d\x82\xc9Q$dK\x142b\
-\x92\xc5\xa2\xaen\xe4\x8dG\x00\xb1\xac\x81[&\x0b\x96\
-\x08\xc9\x22&W\x03\xdfy\x85\x1fBOI\x80\xe4\x99\
-\xd46E\x0fN\x85\x0d\xf0k2\xae}\xaf\xcd-\x15\
-\xe9\xa5\x95zN\x19\x87`y\xe2\x85\xb0\xb7\x18\xc2Z\
-\x8b\xd7\xdf\xe7\xf5\xa2\xee\x01kI\xdd\x8b\x968\xb0\xea\
-\x99\x04\x93\xb6cM\x15\xb8\x86\xae-\xa5\x10\xef\x8d/\
-}\xe9K\xc9s\x82\xb50\xbb\x01W\xf3q\x89u\xbf\
-\xd6\xa5S9\xd2\xb5\xb5\xc9\x9c\xc4\xeb\x9c\x90_\xf19\
-\xda\xd2*k\xac\xf5\xc8\xdb&\xeeQ\x16\x90*\x09A\
-d(D\x90\x1e\x84\xbd\xfe?\x97\xe7\xd9\xa2\xb0\x9a\x08\
-\x89\xf7\xac\xf7\x8f*b\xea\xb9\xc8\x1e>\xfd\x97\xb0,\
-\x07\x0b\xb6\x896\x92Y\x17\xde%\xc8z[\xac\x91z\
-\x9e\xfc\x9f\x07Ku<\xc8\xfb\xbbm-Y\x14a\x9d\
-\xc2\xac\xaa\xc0\xed%\x1f\xab~\x935\xdc\x12\x0em\xc9\
-cY.\x8b\x9b=%n\xdd\xdb\xcby\xb7Y\xf3s\
-\xfe\xfa\xd6\xd8C\x19\xd0\x84e=\xedL\xfd\x1f\xfck\
-\xe6\x5c\xd9~\xf8\x97>d\xc4\xc3\x1b\x12\x08\x04\x02\x81\
-@ 09\x08 \x14H\x0d+8+\x8b\xc8\xba&\
-\xeb\xac\x05\xdc\xfe\xad\x07d\xb5\xf0\xda+\x16s\xef\xf1\
-\xadN\xccX'>\xf7\xb9\xcf\xa5\xb5\xdcZl\xe2c\
-R\xe4\xd34\x91A\x02X\x87\xf2$\xc9$\x0d\xb9\xe9\
-&,\xdd\xac1YL\x10)\x0f\xf2r\x05\x13\x07m\
-EN\xb8\xd1#\x22\x08/\x8b\x127I\x16E\x82\xa8\
-\x1fw\xdcq\x89|S\x0c\xe7 t\xb9\xdc\xbcu\x0c\
-\xe1\xb2&1\xbb\xec\x9b\xa0\x89U0\xdb\xa4\x1c\x9bW\
- \xea0\x18+Q\xaf\xe3\xe7\x1e\xe0)a=\xaa\xdf\
-\x88I\x96\xb6c9Muk=:\xe2\xef\xed\x1fU\
-+\x9fk\x98\xdd_\xab\xe9;\xfd\xeeT\x8e\xf4mm\
-\xdav\xdbm\x93\xd5/\x13\x80\xb6\xb4\xca\x1ak=\xf2\
-\xb6I\xb2~\x94\x17\x0eI\xb1\xec\x84d\x8b:\xc2\x0e\
-k\x0133q\xcfeyn\xebD'\x1f\x1b\xef\xf6\
-\xff\xfeo\xd5\xe2\xeb__\x91(\x8e\xb7\xdc\x99\x9e\xbf\
-\x89\x94\x8e\xe5\x9c\xab\xcfU=\xbf\xfbu,D]9\
-\xd5\xf1\xa0^n\xdb\x7f\xf7\xd9\xc2R\xf9\xdb\xaf\xc8\xd7\
-\x09\x13\xe3D\x93x\x06\xf2sP=\x9e\x9f\xd3\xea\xbe\
-^~\x1bkB\x02\x81\xd9\x88@r\x83\xef\xf7\xc4\xb9\
-\xc3\x84\x04\x02\x81@ \x10\x08\x8c\x0d\x01\x13\x98\xbc\xee\
-\x90\x95\x11\x09f\x85\xceVHVs\xd1\xe0Y\xb8M\
-\x84X\xad\xab\x22\xe8\x9cu\xddy\xa2\xc7\xc5\x1c\xb17\
-\xa1\xb2\x8e\xb1.H\x13\x8b\x04K\xbc5\xe0\xbd\x8a\xf5\
-\xf2\xd5\x18\x01\xc8\xbe\x8f`\x91D\xc0 k\xcf\xb9?\
-r\xb3\x14\x91\x1e\x11!\xd6Bz\x1d\x1da\x89G\x0c\
-\xb9Pr\x97\xa4|\xc8\x82\xe08f\xcd\xa8\x01\xc9\x84\
-\xcc\xfa\xfd\xfc:$\x96\xdf\xa6w\x01\xe7\xfc\xb1\x1d\x1f\
-\x02\x94C\x9d\xa4\xedX=\x8f{\xafJ\xd4\xeb\xc7{\
-\xfd\xdf\xad\x9cNmj\x22\x00\x9d\xd2j\xcbX\xeb\xe9\
-v\x1e<[X\x1a-\xdf\xc8R%\xecu\xa2.\x8d\
-\xb5\xbf\xf2M\x84\xec\xb1\xc7\xcd\xa5\xcb\xf1\xb2`\x94\xeb\
-\xae\xbb\xbc\x97\xc6D\xd4\x17e\x06\x02\x81\xc0\xc4!\x10\
-\xfck\xe2\xb0\x1d\xe6\x92\x93\x22\xb8\x0c\xda\xb44\xac\xeb\
-\xc3|\x99\xa2m\x81@ 0Y\x08L\xa6+4K\
-2k\x9b\xb5\x87uwK\xc4\x95U9\xaf\xf3\xeev\
-\xfe\xa2\xf4*\x03\x09i\x12\xaf\xccB\x94s\x90\xa3\xa6\
-4\xfd\xee3n\xd4\xebcU\xb46\xb9\xc9\xa5W\xc4\
-ym\xec\x87\x98X\xcbO\x91a\x0d\xe9D\xcbd^\
-\xfb\x89>\x97\xa6\xf2\xabn\xf0M\xc7c\xdf\xf8\x10\xb0\
-\xb4\x83\xcb/\xf2\xdd\xa4\x14cUoR<\xf1$\xa1\
-\x94\xab\xbeJo|-\x99\xd9\xb9g\xfas:\xb3\xaf\
-^\x9c] \x10\x08\xf4\x8b\x00\xb2\x1e\xd1\xe0\xfbE-\
-\xd2\x07\x02\x81@ 0\x00\x04\x90\xd6N.\x89:\xe7\
-^\x89\xba\xa64\xb9\xbfW\x9b(\x8a\xaf\x80t\xac\xf2\
-H\xfb \xa4N\xd4\x95\xc9k\xa0\x89\xa8;\xd6/\x19\
-\x11\x98\xceZ\xfa\xc9 \xea\xda7\xd3\x85Kn56\
-@\xd3\xf9\xf6\xe3\xb6\xde\x94\x7f&\xef\xf3L\xb6\xc9\xe6\
-\x9bo\x9e\x94Q\x14R\x17_|q\x8a\x05QM\xdf\
-D\xd4\xa5\x93\xbe\xc9]\xb8\x9a7~\x07\x02\x81@ \
-\x10\x08\xccN\x04\x12Y\xf7\x15\x03\xf4\xec\xbc\x01\xe2\xac\
-\x03\x81@`v \xc0r\xe7}\xe5\xd3I\x90\xf4 \
-\xea\x83\xbbb\xac\xbe\xd5W\xe6\x0d\xae\xe4(\xa9\x8a\x80\
-\xe5)\x82\xed\x9ds\xce9)\x06\x85%\x1e\x08y\x16\
-k\xd4\xbd\xc2\x8aW\x8d@_\xeb\xae\xbb\xee\x98\x02n\
-\xe5\xf2b\x1b\x08\x04\x02\x81@ 0s\x11\xe0\xc58\
-\xc2:\x12n\xf03\xf7\x22\xc7\x99\x05\x02\x81@\x7f\x08\
-\xf4\x13\xa5\xb3\xbf\x92#\xf5\xb0#\x10\xd7~\xd8\xaf\xd0\
-\xf0\xb7\x0f1\xaf\x06\xc3\x12\x93\xa2.\xbc[rd\xfe\
-\xfa\xb1\xf8\xdf\x1d\x81xN\xbbc\x14)\x02\x81@`\
-f \x80\xa7\xcf)_s\x12QGf\xc6\xf5\x8c\xb3\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x98\x01\x08\xf0\x80\x9f\xdb\x14Eu\x06\
-\x9c[\x9cB \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ 0-\x11`Y\x9f\
-\x1b\xeb\xd5\xa7\xe5\xb5\x8bF\x07\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\xccP\x04\
-\xd2\x9bw\x82\xac\xcf\xd0\xab\x1b\xa7\x15\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ 0\
-m\x11h~)\xef\xb4=\x9dhx \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- 0\xbd\x11\xb0\x5c=\xc8\xfa\xf4\xbe\x86\xd1\xfa@ \
-\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81\x19\x86\xc0\xe2\xc5\x8b\x8b\xb9\xa2\xcc\x85\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81\xc0p \x90\xa2\xc1\x0fGS\xa2\
-\x15\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x00\x01\xb1\xe5\xc2\x0d>\
-\xee\x85@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@`\xc8\x10\x08\xb2>d\x17\
-$\x9a\x13\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \
-\x10\x08\x04\x02\x81@ 0\xbb\x11Hn\xf0\xde\xdf\x16\
-\x12\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\xc3\x83\xc0\xdcR\x86\xa7\
-5\xd1\x92@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@`\x96#\x10k\xd6g\
-\xf9\x0d\x10\xa7\x1f\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ 0\x9c\x08\x84Y}8\
-\xafK\xb4*\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@`\x96\x22\xc0\x03~\xa4\xdf\
-\xf7\xac\x9fv\xdai\xb3\x14\xae8\xed@ \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@`l\x08l\xb7\xddv=g\xe4\x06?2\x96\x00\
-s\x97]vY\xb1\xff\xfe\xfb7W\xb4\xf7\xdeE\xf1\
-\x91\x8f4\x1f\xb3\xf7\xc3\x1f.\x0aiB\x02\x81@`\
-\xe8\x11\xf8\xf7\xbf\xff]\xdc\xe3\x1e\xf7(\x8e8\xe2\x88\
-\xa1ok40\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x98I\x08\xcc\xc5\xd8C\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@`8\x10H\xafn\x9b7o\xdep\xb4&\
-Z\x11\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\xc5\xe2\xc5\x8b\x8b\x08\
-0\x177B \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ 0D\x08\x0807\
-\xb7\xdf\x00sC\xd4\xfehJ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ 0\
-#\x11\x98{\xfb\xed\xb7\xcf\xc8\x13\x8b\x93\x0a\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \
-\x10\x08\x04\xa6#\x02\x02\xc1\x87e}:^\xb9hs\
- \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\
-\x08\x04\x02\x81\xc0\x8cE@l\xb9\xd2\x15>\x96\xad\xcf\
-\xd8+\x1c'\x16\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ 0-\x11\x88W\xb7M\
-\xcb\xcb\x16\x8d\x0e\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81@ \x10\x98\xa9\x08x\xc5z\xb8\
-\xc1\xcf\xd4\xab\x1b\xe7\x15\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@ \x10\x08\x04\x02\x81@ 0-\x11\x10\x08\
-~\xce\x7f\xff\xfb\xdf\xa5\xfd\x04\x99;\xed\xb4\xd3\xa6\xe5\
-\xc9F\xa3\x03\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81\xa9B`\xbb\xed\xb6\
-\xeb\xb9\xeaD\xd6\xaf\xbe\xfa\xea\xa5\x22\xcd\x85\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \
-\x10\x08\x04\x02\x81\xc0p \x10\xd1\xe5\x86\xe3:D+\
-\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81\x84\x00\xcbz\x90\xf5\xb8\x19\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81!C \xa2\xc1\x0f\xd9\x05\x89\xe6\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\xccn\x04\x92e\xddWH \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x0c\x07\x02\xe2\xca\xcd-e8Z\x13\
-\xad\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@ \x10\x08\x04\x02\x01D\xbd\x98\xdb\xcfk\
-\xdb\x02\xb3@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x98X\x04\x96.\
-]Z\xcc\x9d7o\xde\xc4\xd6\x12\xa5\x07\x02\x81@ \
-\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\
-\x04\x02\x81@\xcf\x08$\xcb:\xc6\x1e\x12\x08\x04\x02\x81\
-@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \
-\x10\x08\x04\x02\xc3\x81@Z\xb3\x1ed}8.F\xb4\
-\x22\x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\
-\x08\x04\x02\x81@ \x10\xc8\x08Dt\xb9\x8cDl\x03\
-\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@\
- \x10\x08\x04\x02\x81!@\xc0r\xf5 \xebCp!\
-\xa2\x09\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\x02\
-\x81@ \x10\x08\x04\x02\x81@F`\xf1\xe2\xc5\xc5\xc8\
-a\x87\x1dV\x5c{\xed\xb5y_l\x03\x81@ \x10\
-\x08\x04\x02\x81@ \x10\x08\x04\x02\x81@ \x10\x08\x04\
-\x02\x81@`\x0a\x11Xs\xcd5\x8b\xff\x0f@H\xfb\
-\xb7\xa5\xe9$V\x00\x00\x00\x00IEND\xaeB`\
-\x82\
-\x00\x00\x18\xdd\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x1d\x00\x00\x007\x08\x06\x00\x00\x001*\x9e\x9f\
-\x00\x00\x01XiCCPICC Prof\
-ile\x00\x00(\x91m\x901K\xc3P\x14\x85O\
-j\xa4`E\xac88(dQT\xaa\x964\x0e\x8e\
-\xb5\xa0\x08\x0e\xa1*V\xb74M[1\xad\x8f$\xa2\
-\xce\x0e.\xce\xce\xd2\xc1\xfe\x01\xa1\x22\x22\xe2\xe4.\xa8\
-\xd5\x1f\xe0\xd6E\xc8\xa2%\xdeg\xaai\xd5\x0b\x97\xfb\
-\xbd\xc3\xe1\xbe\xc3\x05B\xa2\xc6\x98)\x02(\x95\x1d+\
-\xbd8/e66\xa5\xf0+DD0\x80\x11\x8ci\
-\xba\xcd\x92\xaa\xbaL\x16|\xcf\xcer\x1f \xf0y?\
-\xc5wU\x872\xd5P<\x1a\xad\x1c\xcd\xd6\x1d\xe5\xf2\
-\xfa\xaf\xbf\xa3zr\x86\xad\xd3\xfc\xa0\x9e\xd4\x99\xe5\x00\
-\xc28\xb1\xba\xe70\xce\xfb\xc4\x83\x16\x85\x22>\xe6\x5c\
-\xf0\xf9\x94s\xd6\xe7\xf3/\xcfj:E|G\xdc\xaf\
-\x17\xb5\x1c\xf1\x13q,\xdb\xa6\x17\xda\xb8d\xee\xea\xad\
-\x0c<}\xafQ^[\xa1\xd9G=\x8c\x14d(X\
-@\x02s\x88\xd3m\xfe\xf7*-\xef\x0e\x18\x0e`a\
-\x0b\x05\x14\xe1@B\x92\x14\x06\x13\x06\xf1\x12\xca\xd01\
-\x8d\x18\xb1L\xdbd$\xf8\x8d\x7f\xdf.\xd0\x8c\x0bZ\
-}H_\xd5\x03m\xbb\x01\x5cU(^#\xd0Fg\
-\xe8\xfd\x02\xdc\xe6\x99fi?\x17\x15\x5c\xd1\xce'd\
-\x9f#5\xa0\xfb\xc4\xf3\xde\xd6\x81\xf0\x04\xd0|\xf4\xbc\
-\xf7\x9a\xe75\xcf\x80\xaeg\xe0\xc6\xfd\x04\xddKb*\
-l\xe1Q\x9b\x00\x00\x00VeXIfMM\x00*\
-\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\x00\x01\x00\x00\
-\x00\x1a\x00\x00\x00\x00\x00\x03\x92\x86\x00\x07\x00\x00\x00\x12\
-\x00\x00\x00D\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x01\x1d\
-\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x007\x00\x00\x00\x00\
-ASCII\x00\x00\x00Screensh\
-ot[d\xf5-\x00\x00\x01\xd5iTXtXM\
-L:com.adobe.xmp\x00\
-\x00\x00\x00\x00<x:xmpmeta x\
-mlns:x=\x22adobe:ns\
-:meta/\x22 x:xmptk=\
-\x22XMP Core 6.0.0\x22\
->\x0a   <rdf:RDF xm\
-lns:rdf=\x22http://\
-www.w3.org/1999/\
-02/22-rdf-syntax\
--ns#\x22>\x0a      <rd\
-f:Description rd\
-f:about=\x22\x22\x0a     \
-       xmlns:exi\
-f=\x22http://ns.ado\
-be.com/exif/1.0/\
-\x22>\x0a         <exi\
-f:PixelYDimensio\
-n>55</exif:Pixel\
-YDimension>\x0a    \
-     <exif:Pixel\
-XDimension>285</\
-exif:PixelXDimen\
-sion>\x0a         <\
-exif:UserComment\
->Screenshot</exi\
-f:UserComment>\x0a \
-     </rdf:Descr\
-iption>\x0a   </rdf\
-:RDF>\x0a</x:xmpmet\
-a>\x0aP\x19\xf3\xe2\x00\x00\x14\xfdIDATx\
-\x01\xed]\x09\x5cT\xe5\xfa~\xd87\x11\x01\x05\x14\x10\
-\x05\x11\xcdLT\x5cp\xdf\xf0\x9a\x1a\x9aZY\xd6\xed\
-\x96\xe9m7\xbd\x99f\x96y\xffje\xe9\xb5\xd2v\
-o]KM3w\xc3-74E\xc0\x8dE\x14A\
-\x94E6A\xf6u\xe4\xff\xbd\xdfx\x8e3\x800\x0c\
-3\x0c\xcb\xf7\xfe~3\xdfY\xbe\xf3-\xcf\x99\xf3\xcc\
-\xf3\xbe\xdfw\xce1\xca\xcc\xcc\xac\x800\x81\x80@@\
- \xd0@\x08\x98V\xae\xa7\xb4\xb4\x14%%%P(\
-\x14|WEE\xdd9I\x9bc*\xb7C\xac\x0b\x04\
-\x04\x02\x86G\xc0\xc8\xc8\xa8\xce\x8d\x90\x8e111\x81\
-\x85\x85\x05\xcc\xcd\xcd\xd5\xcaP#\x9d\xa2\xa2\x22\x94\x97\
-\x97\xc3\xd4\xd4\x14fff<\xa3T\x80\xdaQbE\
-  \x10\x10\x08<\x00\x01ItP*\x09\x18++\
-+9\xb7\xb1\xb4D\x0a\x87\x08\x87X\xc9\xd8\xd8\x18D\
-6\x82p$tD*\x10\x10\x08h\x8a\x80\xc4\x1d\xc4\
-#\xc4'\xc4+\xc4/\x92\xc9\xa4C\x8cD\x0aG\x98\
-@@  \x10\xd0%\x02\xc4+\xc4/\x92\xc9\xa4C\
-1\x1c\xa1l$XD*\x10\x10\x08\xe8\x0a\x01\xe2\x15\
-)FLe\xca\xa4\xa3\xab\x0aD9\x02\x01\x81\x80@\
-\xa0&\x04\x04\xe9\xd4\x84\x8e\xd8'\x10\x10\x08\xe8\x1c\x01\
-\x99t(\xd2,\xdc+\x9d\xe3+\x0a\x14\x08\xb4x\x04\
-\x88W\xa4\x11-\x02C&\x9d\x16\x8f\x8c\x00@  \
-\x10h\x10\x04\x04\xe94\x08\xcc\xa2\x12\x81\x80@@B\
-@\x90\x8e\x84\x84H\x05\x02\x02\x81\x06A@\xa7\x13s\
-\xda\xb5\xdb\xdf \x8d\x16\x95(\x11x\xe7\x9d\xad\x98?\
-\xff\xbf\x1a\xc11\xf7\x93\xb5\x1a\xe5k\xa9\x99\xa6\xbf\xbd\
-\x04\x03Lnk\xd4}\xc7s\xa1\x1a\xe5k\xea\x99\x96\
-n\xdc\x8c\xd7W\xad\xd6y7tJ:\xca\xd6\xdd\xd0\
-y#E\x81U\x118t(\xa9\xea\xc6Z\xb6t\xec\
-?\xbc\x96\x1c-s\xb7{\xbf\x11u\xefxR\xdd\xf1\
-\xaf{%\x86;\xe2\xd8\x0d\xfd]\xc7z \x1d\xc3\x01\
-%j\xae\x1d\x81\xb9#{\x22D\xe1\xc8\xff\xd5E\xaa\
-\xc4a[~\xed\xb8\x89\x1c\xbaC@\xc4tt\x87e\
-\x93(I\x10MU\xc2m\x12'\xae\x195R\x90N\
-3:\x99\x9at\x85\xe2\x16\x82x\xd4\x89G\x13\xdcD\
-\x1e\xdd! HGwX6\x89\x92\x04\xe1\xa8\x13\x0e\
-\xe1!\xaca\x11\x10\xa4S\x0b\xde99\xf7\xef\x8e\xad\
-%k\x93\xd8-\x94NU\xa5\xd7$N\x5c3j\xa4\
-\xc1\x02\xc9\xc7\x8f'\xe0\xb5\xd7\xf6q(\xfd\xfc:\xc8\
-\x90\x9a\x99\x99\xe0\xe1\x87\x9d@\xdb\xfa\xf7wc\x0f\x13\
-3\x1c/~\xf4Q06n\xbc\x84\x17^\xe8\x8d\x7f\
-\xfdk\x90\xdc\xc6\xa6\xbc\xa0\x89\xd2\xb9{v/\x9e\xd9\
-\xf4;\xfc:\xb3\xf32gy\xb3\x0f:\xeb\xeb|\x9e\
-\x89\x8f\xc7\xb7\xc7\x835.\xbewGw\xbc9z\x94\
-\xc6\xf9\x9bjF\x83\x91NFF\xa1\x8cYXX\x8a\
-\xbcL\x0b\xa7O'\xe2\xfb\xef\xc31t\xa8\x07>\xff\
-\xfcQ\xf6  \x13\xb5\xfd\x0d\xb5\x12\x11\x91\xc6\xab\x92\
-\xd2\x86\xaaW\x9f\xf5h\xa2tV\xa7\x17#\xe9\xe2Y\
-\x94\x95\xf8b^\x0b\x88\x01%B?.Vz^>\
-\xc2o\xdc\xd4\xf8t\xb6\xb2\xb4\xd08\xaf\xa6\x19\xff\xbc\
-\x1c\x83\xa31W\xd0\xd3\xcd\x15O\xf5\xf3\xd3\xf40\xbd\
-\xe63\x18\xe9\xa8\xf6j\xd3\xa6i\xf2jzz\x01'\
-\x9dm\xdb\xa2\x11\x1c|\x03\xf3\xe6\xed\xc7\xda\xb5\x13\xe4\
-\xfd\x0d\xb9\xb0t\xe9H\x04\x05]\xc3\x84\x09\xde\x0dY\
-\xad^\xeb\xd2D\xe9x\x1b\xe7\xa3\x18&p0*i\
-\x11Ag}\x01>\xd4\xbb\x0b~|\xe1y\xb5\xe2\x0f\
-FGcsH(\xba8\xb5\xc3{\x13\xc6\xab\xeds\
-\xb0\xb1V[\xd7\xc5JTJ\x0av_\xbc\x84\xa2\xb2\
-2A:\x12\xa0={:\xe3\x91G\x9c\xa5U\x9e\x8e\
-\x19\xe3\x09__\x17\xbc\xfb\xeea\x1c;\x96\x80\xdb\xb7\
-\x8b\xe0\xe8x\xff\x19\xabj\x99\xf5\xb8\xe2\xed\xed\x08\xfa\
-4'\xd3H\xe9\xdcm\x05K(\x90Ua\xd1\xec]\
-+\xc2C_J\xc7\xde\xda\x1a}=:\xaa\xfd|\xae\
-\xa6)\xd5\xb3\x1d{fp\xe5}j\x19\x9b\xf1J\xa3\
-P:\xd5\xe1\xfb\xd8c>X\xb3\xe6\x0c\xd2\xd2\x98D\
-\x0dOA\x9f>\xed\x99\xabu\x86\xbbZo\xbc1\x00\
-[\xb6D\xe2\xe4\xc9\x9b\xe8\xda\xd5\x11\xef\xbf\xaf\x9ci\
-\x1b\x1f\x9f\xcd\xd5\xd1\xa9S7\xd9\xad\xf4\x80\xbf\xbf;\
-\x86\x0c\xe9\xc8\xf3P\x1d{\xf6\x5c\xc1\xd9\xb3\xc9x\xe8\
-\xa1vx\xfa\xe9\x9eU\xaa%\xb7\xee\x8f?b\xe1\xec\
-\xdc\x0a\xaf\xbf\xde\x1f\xfb\xf6]\xc5\x993I\xdc\xcd\x1b\
-;\xd6K\xce_[=\xc5\xc5\xe5X\xbe\xfc\x04\xcf\xbf\
-h\xd10XY\xdd\x87Y\xaa\xc3\xcd\xad5\xfe\xf9O\
-u\xb9\xbba\xc3E\xc4\xc6\xde\x06\xf5\xbd\x7f\x7fW\xb9\
->].\xe8K\xe9\xec\x8a\xcfAq\xe8\x16\xac\x0b\xb9\
-\x88\xb6L'\x1d\xee3\x02\xd3\xfd{ \xa4S\xff*\
-\xc4\xe5\x96z\x09\xef\xef;\x8e\xd2\xb8\x8b\xf84\xab\x00\
-}=]\x11\xec\xd3\x0fs'\x8dd\xca\xca\x89\xe7?\
-\x94\x01\x84\xaf\x9f\x8f-\xa6v\xf8p\xf6\x0c,\xdd~\
-\x08\xe9\xa1G\xb0\xa5\xf3\xc3X\xfc\xe2Sx\xf3\x9b\x9f\
-\xd1\xc9R\x01\xc5kK\x91\x1e\xb4\x1e/\x9f\xbf\x82\xf2\
-\xe4X\xfc\xe8\xea\x8dg\x03\x06#\xc4\x7fR\x95z\x1f\
-D\xb8\xba\xc4\xb7\xbee\xc5gd\xe2\xe4\xb5k8u\
--\x8e?\x0e\xc2\xdf\xcb\x13\x83\xbbx\xa1\xab\xb3\xfa\x1f\
-sAI)\xb6\x86\x85!29\x05I\xd9\xd9\xe8\xd4\
-\xd6\x11\x8f\xb8\xba\xe2I\xe6B\x99\xb1\xb70$fe\
-\xe3\xfb\xe0`\xbe\x9f\xda\x14\x91\x9c\x8c\x0fv\xed\x86\x89\
-\x911\x96\x04N\xaco3\xebu\xbc|5\xa8>\xef\
-\xa2^%\xea\xf0`GGkN:II\xb9\xf0\xf2\
-\xb2\xc7\x8e\x1d\x97aii\x8a\xd4\xd4|P \x9a\xcc\
-\xc2B\x19\xef9|8\x1es\xe7\xeeW{n\x07]\
-\xe0\xff\xf9\xcfi\xacZ\xf57\x10iPl\x88\xca8\
-r\xe4:\x9ex\xa2\x07{&\xb4z\x90\xfa\x97_.\
-\xf1r\x9fy\xe6\x11^\xf6\xf9\xf3\xa9<\x7f\x9b6\x96\
-\xfcx\xda\xa8I=\xd4F\x22\xab[\xb7\xf20~\xbc\
-7'?^ \xfb\xda\xbe\xfd2s\xd9by[\x9e\
-\x7f\xde\x97\xf7G\xda\xb7~\xfd9\xa6\xea\x0a1u\xea\
-C\xd2&\x9d\xa7\x0f\xba\xf0T\xb7\xaf\xae\xa3\xd2\xf9\xee\
-\xd8\x05l\x5c2\x07E\x15\xc6\x5c!\xc50\xd7\xcc\x92\
-]\x10\xbb\xbe3\xc5\xca\x7f\x7f\x80\x90\xa1Se\x02(\
-;\xbd\x0bO/\xfb\x04(d$E\xf9\x98\xa2\xdaq\
-%\x0a\x96AA\xb8t\xf2\x08\xbeY\xb6\x18!\x16\xee\
-\xf0.\x08\xc7{\x7f\x1c\x80\x9d\x85)\xe6\xa4\xa7\x22\xee\
-\xccQ\x9e\x7f0{\xd0\xf7\x89lc\x5c\xd8\xff;\xc2\
-\xcc\xac\x90\x93\x93\x83\xa0\xa3'x9\xbc\xbc\xabW1\
-\xef\xe8~\xbc1\xeb:\xf0\xcc[r\xbd\xaa\xfd\xabL\
-\xbc\xfaR:u=y\x14\x7f\x99\xb7\xf57\xfe\x87)\
-\x1d{&\xfe:\xd6\x1c\xfe\x13\x9f=1\x0d\x01\x0fu\
-\xe7\x9b\x93\xb3\xef\xe0\xb5M\x9bA\x04%\xd9\xe5[\xa9\
-\x08\x8a\x88\xc2\x1f\x11\x91X;\xe3i\xa4\xe5\xe5b\xe7\
-\xf9\x8b\xd2n\xa4\xe6(\xd7\x8d\xd9\xb3m\x0cA:\xaa\
-\xfc\x22\x93\x8e\xdc\xbaF\xb2@j\xe1\xe6\xcd;\xbc5\
-\xaa\xee\x17m'%C*\x81F\xb8\x88\x10\x22#\xd3\
-\xb1p\xe1!N8\x93&u\x03}\xc8v\xed\x8a\xe1\
-\x9fE\x8b\x0e\xa3}\xfbV\x189\xb23Z\xb7\xb6`\
-?\xd4bN\x0a\xa4\x82$\xcb\xcb+\xc5_\x7f%\xf2\
-\xd5\xc9\x93\x95\xc7K\xfb\xa4T\xd3z\xc8e\xa4\xb2\x7f\
-\xfb-\x0a\xa1\xa1)2\xe9\xdc\xbd[!\xd7QZ\xaa\
-\xe0\xaak\xd80\x0f^\xfc\xf5\xeb\xd9\x9cp\xa8}t\
-\xbc\xbe\xac\xf2\x05W\xddz]b:[\xa3n\xe1\xb7\
-\xe5\xf39\xe1L\x1e\x17\x00\xf7\xb1\xd3\xf1\xb0I\x0e\xd6\
-\xef;\x86K\x07w\xe0\xbd\xe5\x9f\xe0\x87/\x9c\x11\xd2\
-u\x08\xfaV\xa4\xe1\xd1U_p\xc2\xf1\xe8;\x18\xaf\
->\x19\x88D[\x0f\x14\x84\x1e\xc0\xf7\xbf\xfc\x8a\x84\xb0\
-\x93\xf8*\xe8\x14\xde\x9e\x1a\x80\x9d\x8a6\x9cHh\xc6\
-\x82\x22,\x18\xc3\x9f{\x05\x93z{#\xa1UG\xf8\
-\x9a\xdcQ\x12VY\x11\xf6\x1f;\x89\xd7f\xfe\x03V\
-~ca}=\x1c?\xee\x0cB\xc6\xd5\x08|\xfd\xd3\
-/\xd83~<B\xdat\xad\x95x\xf4\x85u]\xca\
-%\xc5\xf2\xee\xf6\x1d\x9cp\x02{=\x82I\xbe\xbd\xf8\
-\xe1\xbb.\x5c\xe41\x99\xf7v\xec\x84\x8b]k\xf4d\
-j\xe6\x7f\xa7Os\xc2\xf1j\xd7\x0e\xff79\x10n\
-\x0e\xf68\xc7\x02\xd6\xff\xde\xb3\x8f)\x9a\x14l\x0b;\
-\x87\xe7\xfc\x07`\xdb+\xb3\xb1\xf1\xccY\xec8\x7f\x01\
-\x03<;c\xfe\xdf\x02`\xcc\x94\x8e\xa1\xadQ\x92N\
-y\xf9]|\xfcq0\xf2\xf3K\xb9\x22\xa0\x8b0)\
-)G\xc6j\xf1\xe2\xe1\x986\xed\xbe\x1a\xa0\xa1w\x22\
-#R\x15\xcb\x97\x8f\x96\xf3\xf5\xeb\xe7\x8a\x82\x82R\xae\
-N6o\x8e\xc0\x8a\x15c0n\x5c\x17l\xdd\x1a\x85\
-\x83\x07\xafqb\x902\x1f=\x1a\x8f\xb22\x05\xbat\
-q\xe0\xee\x97\xb4]5\xfd\xfa\xebP\x8d\xea\xa1\xf6\x0e\
-\x1e\xac$\x9d\xb0\xb0d\xb9\x08\x22-\x22<\x22\x96\xdc\
-\xdc\x12N\x9e\x12\xe9H#x\x03\x07\xba\xc1\xc4\xa4\xee\
-/8\x93+\xa9e\xa1\xa6\x7f|\x89\x80\xea\xa2t\xc2\
-7,@NI9&\x8c\x1e\x81\xd1\x0bV\xc9\x17\xf8\
-\x97\xbe\xbe\x98]T\x80+\xc1\x07\xb1\xee\xf7 \xac]\
-\xdc\x1d\xbb\xaf\x17\xa2O\xd7\xce\xc86\xf3\xc5\xea\x85o\
-\x22\xca\xca\x03O\xd2\xe8X\xf7\xb71.1\x11{\x0f\
-\x1fE\xce\x85\x13\x08\x99<\x9d\x11K\x82\xac\x84&\xce\
-Y\x8ay\xdc\xf5r\xc44\x96\x7fg\xdc\x1dY\xd9\xcc\
-\x99\xfd\x22\xbaL\x7fSYo\xb7\xe7\xb1\xa6W/L\
-\x9d\xf1wX2B\xday9\x153\x878\xd6\x1a\x0c\
-o\x0cJ\xe7\x9b\xe3'P\x5cV\x8eG{\xf6\xc0\xb2\
-\xc7'\xc9g\xd1\xaf\x13#e\xf6\xfa\x16RA\xbf\x9e\
-\x0dE\xcf\xc7]A\xea\x87l\xc6\xc0\xfex\xd8U9\
-\xdddT7\x1f\xbem\xfb\xb9\xf3\xc8go^\xb0d\
-\xef\xad#\x97\xcc\xb1\x95\x0d\xdf\xde\xda\xd2\xb2\x8a\x8b\xc6\
-w\x18\xe0\xcb\xe0\xb4G\xc3\xd1\xeb\xd6\x9d\xe5\x9f\xb5k\
-\xcfb\xc9\x92\xa3\x08\x0c\xdc\x04\x1a\xbd\x22\x9b7o\x90\
-\xecB\xd1:=\xfa0 \xe0~|\x85\xb6EE\xa5\
-S\x82g\x9fU\xfe;\xf0\x15\xf6\xc5\xb2b\xca\x14%\
-9EG\xb3 \x013I\x05\x91\x9bD\xe4&\xd9\x81\
-\x03q|\x91\xe2)\x0f\xb2\xba\xd43`\x00\x91\x871\
-\x22\x22\xd2\xd9\xeb7\x94oK%\x85FF1)r\
-\xed\xa4u\xda\x16\x1a\xaa$'U\xf5E\xdbum\x12\
-\xb1\xd4\x94\xd6E\xe9\x84\xc5\xc4q\x02\xe86\xe5%\x99\
-p\x88\xd8\xce\xdem\x8b\x17'\x8e\xe6\xc4\x91{\xf5\x02\
-\xbf\xf0\x03;\xb7\xc6\x94\x15?\xe0\xbbe\x8b8\xe1\xa8\
-\x12\xa0\xc3\x80\xb1\xbc\x9c\x98\xb4\x1c^\xce\x85{J\xa7\
-\x18\xa6\x985\xcaO\x8d8d\xa5\xc3\x5c3\xfb\xe1\xf7\
-]7*/\xa5\x83/\xba\xb8\xb5\xe7\xf5:f\xc6\xaa\
-\x1d\xa7Z\x9fj\xffu\x8d\xb16\xe5\xd1(\x13\xd9\x8c\
-\x01\x03\xd4\x0e\xa7\xdf\xfb\x94>\xbe|[tJ*O\
-\xdd\xec\xedy\xba%4\x0c\xd1\xb7n\xc9\xf9\x89x\xd6\
->3\x1ds\x03\xee\xff\xf1\xca;\x1b\xd1B\xa3P:\
-\xa4 *\x1b\xc5E\xdez\xcb\x9f\x11\x892\xbe\x22\xed\
-\xa7\x18\x8e\x9d\x9d\x85\xb4\xcab>\x05\xc8\xccT\xce\xf9\
-y\xf9\xe5=,h\xab|3\xa9\x94\x81\x02\xd1d\xd7\
-\xaee\xa1\xa8\xa8\x1c\xbdz\xb9\xc0\xc3\xa3\x0dn\xdc\xb8\
-#\xbbX\xa4:\xc8\xb5266\xc2\xc4\x89\xd5\x93N\
-]\xeb\xb1\xb55gu9\xe3\xdc\xb9[\xb8x1\x95\
-\x07\x86)\xf0M?\xa2\xb1c\xbbp\xf5\x15\x12\x92\x84\
-\x94\x94<t\xe8`\x0bI\xe9\x0c\x1at\xdf\xe5\x93\xfa\
-\xa0\xcb\xf4A\x17\x9e\xeavM\x95\xce\x814\x05\xca\xb2\
-\xd3\xf9\x05\xbea\xe1l\xfc`\xd1\x0a\xad\x8d\xca\x91[\
-a\xca\xd3\xc4\x8c,%\x91$$\xa2WY2B\xe0\
-\xca]\xac5{\xfeB\xce\xb9\xa3X\x99\x98\x0e\xf3\x82\
-,\xa4\xe6\x17C\x91s[I\x14\xc6\xa5\x9c($\xa5\
-c\xc7\xcew\xb4u'5B\x93\x5c\xafrsk\x8c\
-w\xb3\xacB,\x16n\xde\xb0d\x8f\x9e\x88-\xb7\xc6\
-dRR\xb5\xdcUoh\xa5\x93\x9e\x9b\x87\xdb\xf9\x05\
-\xfc4\xbf\xfa\xcb&X\x9a\xab\xff\x86i?Y\x5cF\
-\x06\x1f\xfa~a\x90?\xc2\x12\x12p%5\x0d\xd3\xbf\
-\xfd\x81\xbb]~\x1e\x1e\x18\xdd\xbd\x1b\x86\xfbt\x85\xa9\
-\xb1\xc1\xb5\x04o\xef\x83\xbe\x1a\x05\xe9\xcc\x9d\xeb/\xb7\
-\x8f\x82\xbd\xe4\x9e\xd0\xac\xe4\xca\x81^9\x93\xca\xc2\x9d\
-;E\xf2Z\xdb\xb6\xd6U\x1e.oe\xd5\x06\x09\x09\
-wX \xda\x81\x91N\x19\x1fI\x0a\x0c\xf4\xc1\x97_\
-\x86\xe0\xc0\x01\xa5\x8bu\xec\xd8u\xeeZ\xd1h\x97\xb3\
-\xb3R\x8e\xca\x85\xde[\xd0\xa6\x9e!C<8\xe9\x10\
-\xa1t\xeb\xd6\x96\xc7\x9ez\xf4p\xe2\xc3\xff\xe4V\x11\
-\xe9\x10\x11\xf9\xfb\xbb\x81\xe6'\x91k\xe7\xe2\xd2\xaar\
-\xd5:]\xaf\xed\x02\xa4\xfd\x9a*\x1d\xaf\xbc\x10N\x14\
-\x14\x0c6\xb6w\x86\x8bQ\x19\xee\xa0\x15\x5cP\xcaS\
-owK\xc4&\xa6\xc0\xc7\xc3\x0d\xa7\x0a\xac\xe0g\x1a\
-\x8f\x19\x0b?\xc4\xad\xa8p~\x9c\x8d\x09`j\xef\x04\
-w{[\xc4\xe4(]&i\x98^\x22\x96BF[\
-\xaa\x84H\xed\x93\x09\xc9HQ-\xa18\x19\x15#\x8a\
-\x05\xa9\xbd\xd8|#M\xfa\xabS\x80\xb5(,\xbb\xf0\
-\xfeDYr\x87\xe8\x8fI\xd5\xac\x1c\xcdp\xe3v\x16\
-<\xdb\xb5EQi\x19\xfau\xee\x84M\xb3^\xc2\xaf\
-\xa1\xa18\x10\x15\xcd\x83\xc4{/E\x80>N\xadm\
-\xf1\xeds3@\xf1\x9e\xc6j2\xe9T\xeehC5\
-\x98\x08f\xe6\xcc>ZW\xe7\xe9\xe9\xc0n\x950\xe1\
-\xa4\xf1\xd5W\x13AC\xd1\xb5\x19\x91\x0e\xb9r\x7f\xfe\
-\x19\xcf\xdc\xb9\x11\x8c|\x94\xae\xd5\xa4I\xd5\xab\x1c*\
-O\x9bz\xc8U\xfa\xe2\x8b3L\xc5$sBQ(\
-\xeeB\x8a\xe1\xd0l\xebO?=\xc5],SS\xe5\
-\x8f\x8c\xe2@\xfa\xb6\xca\x17pu\xeb\x9a*\x9d\xbf\xdc\
-\xfb\xc0\x96\xdd\xa6\x92W\x06\xfc\xbar\x19\x12\x9d{V\
-!\x08\xd5\xf2?\xd9z\x9a\x13\x8e\xc2\xc2\x06\x1f\xbf;\
-\x1f\xc6}\xc7a\x84\x9dR\xd9\xdc>\xf03>\xfc\xf8\
-SyB\xa2L,(\xafB\x1c5\x11\x12\xd5\xf7M\
-\x85%WXql\x14nJ\x13P:D&4\xcc\
-]\xc6^x\xb9\x8e\x8d<I\xeeSM\xbf\x05\x9a\x5c\
-\xb8\x98M.|o\xfc\xa3L\x01eb\x7fd\x14\xb6\
-\xb0\x11CRE\x8bw\xec\xc2\xe6\xd9/\xd5tx\x83\
-\xefS\xe5\x97\xc6\xad\xc34\x80\x86\xee\xcd\xa2\xb9:d\
-\xaa1\x12\xe9\xd0\xac\xac\x22\xec\xdd{\x85\xab\x1ai[\
-\xfb\xf6\xb6|\xe4\x8b\xdc\xaa\x83\x07\xe3\xb8kecc\
-\x8e1c\xd4cER~J\xb5\xa9\xa7{\xf7vp\
-p\xb0b\xeeU\x1a\x9b\xe4\xa8\x0c\xfe\x0d\x1d\xaa$\x16\
-OO{N\x90\xa4vhx\x9dL\xdf\xf1\x1c\xaaC\
-\x93\x7f~M\x95\xce \x8b\x5c\xd8{v\xe7\x17\xf8\xa6\
-3\xd1U\x08\xc7'/\x0ek\xf7\x9fF\xe1\x89m\xbc\
-\xde\xbcK'\xb9\xc2\x990r(l\x86?!\x13\x0e\
-\x11\xc5\xbep6\x1d\x82)&I\xe9H1\x9dB\x16\
-\xd3Q%.\xa5\xd2Q\x8e^YWCH\xb4\x9f\x94\
-\x0e\x0d\x9f7\x15\xa5C\x84\xd3\xd5\xd9\x89N\x0f\x9f\x9f\
-\xc3\x17T\xbe\xb2\x0a\x0a\xb9\x8a9\xc8T\x0d\x05\x89\x83\
-\x22#\xf9Gq\xf7.WED@\xaf\x8f\x1a\x81%\
-\x8fM\xe0G\xc5\xa4\xa6\x82\xf6\xa9\x1a\x11Zc\xb1&\
-O:\x04$\x0d\x85\x93\xad\x5cy\x8a\xdfB\xc1W\xd8\
-Wvv1\x16,8\xc4\x86\xd3\x0f\xcb\x81ii\x9f\
-\xa4j\x96-;\xceUR@\x80\xa7\xda\x9c\x19)\x9f\
-jZ\xd7zH%\x0f\x1a\xe4\xce\x02\xc9\xe5\xd8\xbd\xfb\
-\x0a' r\xaf$#\xb5C#t4!\x91bX\
-}\xfa\xdc\xbf\xf1U\xca\xa3\xeb\xb4\xf2\x05\x5c\xddzl\
-\x1d\xe6\xe9<6\xa4\x1f\xbf\xc0\xf7\x7f\xf51\xfew6\
-V&\x88n\xf9\xf1xc\xe9'\xd8\xbab\x01\xfe\xbb\
-\xfb \xdf\xaeh\xcfb-\x8cX\x8e\x9f\x8b@\xcf\x92\
-D\x99\x00W\xef<\x82\xe8#{y9\xd2\xad\x17R\
-\xb0\xb8:b\xa9\x89\x90\xa8?\xe9*J\xa7\xba\xfeU\
-&^]c\xacMy#X,\x86\xec\xb3\x03\x87\xd8\
-\xe8T\xbc\x5c\x04\xb9^\x0b\x7f\xdf\x8eE\xdbwb[\
-\xf89\x1e\xafY\xb6\xf7\x0f,\xd8\xb6\x034\xe2\xa5j\
-\x14\xe3!\xf3vr\x82\xc9\xbd\xb8NkK+\xbe\xed\
-<\x1b\x1d\xacLD|\x87\x01\xbed\xf7\xca\x00u\xeb\
-\xac\xca\xd9\xb3\xfb\xe2\xea\xd5L\xaeZf\xcd\xda\x0d\x8a\
-\xed\xb8\xb8\xd8\x22.\x8e\x82\xc7e\xb0\xb5\xb5\xa8r\x97\
-x@@\x17,[v\x82\x0f]SC\x02\x03\xab\x9f\
-\x9b\xa3\xdaHm\xea!\xf5\xb2w\xefU^\x0c-S\
-\xb0Z2\x22\x1d\x1a\xca'\xa3\xe1}i\xa2\xa3\xb4_\
-\x1fi\xe5\x0b\xae\xbauI\xe9\xa4\xc5\x5c@\xffa\xa3\
-`\xc5b'E\x15&U\xd2o?_\x05\x1f6\x01\
-o\x5c\x5c\x1c\x9b/\x13\x8c\xf5o\xcf\xc4\x06\x16\xa3\xf1\
-rv@tB\x12\x8c\x8bY\x10\xdf\xa6\x0d>x\xf5\
-EN0\xcf\x8d\xec\x87\xa3\xbf\xfd\x0c\xa4'c\xf4\xc4\
-\xc9\xf0\xf5\xf1\xc2\xa2\x94\x0c\x1e\x8c\xb6rr\x85\x82m\
-\x97\x94NM.TM\xae\x97\xa4t\x9aRL\x87\xce\
-\xf3\xacaCq5-\x1d\x87\xa2/c\xf6\x86\x8d|\
-\xa8\xbb\xbd\x9d\x1d\xe2\xd2\x95\xc1c[v3\xe8\xbc\xb1\
-c\xf8P\xf8\x93~~X\x7f\xf2\x14\xbf\x83\x9d\xe6\xf1\
-\xf4\xe8\xd0\x81\xcfJ&\xd2\xa1?\xba\xa7\xfa\xf7\x93\x7f\
-:=:\xb4\xe7\xcb9\x85E\x18\xf1\xd9j>k\x99\
-\x5c8C\x9a\xc1\x94\x8e\x14+\x93\xd2\xda@\x90.V\
-)U\xcdO\xdb>\xfa(\x004\xc3\x97\xee\x95\xa2{\
-\xb5\x22#\xd3\xf8\x9c\x1a\x8a\xa1l\xd8\xf08\x0f\xe4\xaa\
-\x1eccc\xc6\xdc)O\xbe\x89F\x8f\xe8\xa2\xafl\
-R\xdb\xa4:\xb5\xa9\xc7\xdf\xbf\xa3\x1c\x18\xa4\xc0\xb2\xaa\
-\xd1\xad\x0e\xa4p\xc8\x1a\x22\x9eC\xf5h\xf2\xcf\x7f\xad\
-\xc2\x96+\x12\xe5\x8c\xe1\xf2{3\x8d\xab\xa6\x91\x0a;\
-\x0c4\xcb\xc6\xd8wW\xe3\xf9\xa7\xa6\xc1\xbe\x93\x0f\xca\
-\xefd\xe0BL,LJ\x0a\xe05`\x04~Z\xb7\
-\x06Y\x9e\x03y\xbdy>C\xf1\xc5\xca\x15\xb0vv\
-\x87Yy1\xc2\xa3b\x80\xfcl\x0c~j&\xdey\
-\xe5%\xaet\x1c\xef\x8d^\xf56U\xceXne|\
-WVD\x12A^\xaap\xe0\xed+22\xaf\xb6?\
-\x99F\xd6|\x7f<\xeb\x87&\xfd%\x5c\x0cm4S\
-x\xc5\x94\xc9\xf8\xfb\xa0\x81\xfcf\xd0\xac\x82\x02~\x0b\
-Cqy\x19\xe8\xc6\xd1\x9f^\xf8\x07\xba\xb9\xb8\xf0f\
-\xce\x193\x8a\xdd,\xfa(\x1f\xb5\xa2\x99\xc64\x87'\
-\x96\x11\x16\xc5\x86\xbe|z:\xa6\xf6\xe9-w\x87\x82\
-\xce\x94\x9f&\x16\x12\xf1\xd0\xed\x15\x866\xa3\xcc\xcc\xcc\
-\x0ajD6\xbb\x7f\xc3\x9a\xdd\xa0V\x1fS\xbe\x82\xe6\
-F}\x8a\xd0\xc9\xb1D:yy%l\x16\xb2\xad^\
-\xd5CC\xd5S\x1d(\xf46\x88C\x87\x92\xeb\xf4\x0a\
-\x1az\x1b\xc4\xa0a#4\xba\x10\xa5\x0b\xbc\xae\xe9\xe1\
-L#t-\xbc\x81\x9b\xed\x1e\xc2\x10\xab\x07\x8f\x1eI\
-\xf9\x12\x9dz`\xb0e^\x15b\xa9k\xbd\xf5\xc9\x9f\
-\xc8\x06@\xdd\x99\x17B\x04\xa5\x89\xf1W\xd0\xe8\xf9m\
-\x10D:\xb9E\xc5h\xdf\xc6\x0e\x16\xa6\x0fvHr\
-\x8b\x8b\x91\x91\x97\x07\xd76l\x067\x9b\x10\xf8 \xa3\
-\xdb\x10RssA:\xdb\x85)\xa8\xda\x8c\xde\x06q\
-<\xe1\xa6\xce^AS\xc8\xdcD\xfb{\xf3\x8b\x1e\xdc\
-\x9b\xdaZ\xd5\x88\xf7\xd3\x1d\xe9\x0dqWzC\xd5\xa3\
-K\xa85\xf9\xe7\xaf\xcf\x05<\xa6-\xcd\x8b\xe9\x8d!\
-\xb5\x8c\x1aI\xf9\x06\xd7\x92O\xdf\xed\xa5\xf2\x0d=O\
-\xa7\xba\xf3\xeb`c\x03\xfa\xd4f4\xd3\x98>\xb5\x19\
-\x8d\x1e\x91\xbb\xd6\x18\xcc`\xeeUc\xe8|KlC\
-}\x08\xa5!\x08\xc0\x10\xedk\x89\xbf\x03C\xf6Y\x90\
-\x8e!\xd17@\xdd\xcd\x958\xea\xd3/\x03\x9c\x86\x16\
-]\xa5 \x9d\x16v\xfa\x0d\xa1$\xeaC\x08\x0d\xd1\xde\
-\x16\xf6\x130xwu\x1e\xd3\xd1\xe6u\xb7\x06G\xa1\
-\x854\x80^\x9fKAS)\x86!R\xe5\xa4Rm\
-N\xbf>_\xbb\xabM{\x9a\xd21:%\x9dw\xde\
-\xd9\xda\x94\xfa\xde\xa2\xda:\xfd\xed%-\xaa\xbf\xfa\xec\
-\xec\xd2\x8d\x9b\xf5Y|\xb3/[\xa7C\xe6\xcd\x1e-\
-\xd1A\x81\x80@@+\x04T\x87\xccELG+\x08\
-\xc5A\x02\x01\x81\x80\xb6\x08\x08\xd2\xd1\x169q\x9c@\
-@ \xa0\x15\x02\x82t\xb4\x82M\x1c$\x10\x10\x08h\
-\x8b\x80L:4cQ\xf5\x89\xed\xda\x16(\x8e\x13\x08\
-\x08\x04\x04\x02\xaa\x08\x10\xaf4\xab\xe7\xe9\xa8vN,\
-\x0b\x04\x04\x02\x8d\x1f\x01Y\xe94\xfe\xa6\x8a\x16\x0a\x04\
-\x04\x02\xcd\x01\x01\x99tL\xd8\xd3\xcb\x84{\xd5\x1cN\
-\xa9\xe8\x83@\xa0q!@\xbcB\xfc\x22\x99L:\x16\
-\x16\x16\xec\x95,\xe5\xd2v\x91\x0a\x04\x04\x02\x02\x01\x9d\
- @\xbcB\xfc\x22\x99<#\xd9\xdc\xdc\x1c\x0a\xf6\x1c\
-\xd5R\xf6b/S\xf6\xfc\x0e)\xf0#\xa5\xd2\x01\x22\
-\x15\x08\x08\x04\x04\x025! yL\x94\x12\xe1\x10\x9f\
-\x10\xbfH&\x93\x0em\xb0\xb2\xb2\xe2\xa4S\xc2\x1e\xfe\
-L\x04D&\x15\xc0W4\xfc\xd2\xe6\x18\x0d\x8b\x16\xd9\
-\x04\x02\x02\x81\x06D@\x1b\xd1!\x1dC.\x15)\x1c\
-U\xc2\xa1\xa6\xab\x91\x0em\xa0\x0c\x953\xd1va\x02\
-\x01\x81\x80@@\x17\x08\xc81\x1d]\x14&\xca\x10\x08\
-\x08\x04\x04\x02\xb5!\xf0\xff\xaf\xf0\xd9*\xe2\xc1\x8b\xb7\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x02\xb0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x10\x04\x00\x00\x00\x1a\xee)0\
-\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
-\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
-bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
-Ys\x00\x00\x00`\x00\x00\x00`\x00\xf0kB\xcf\x00\
-\x00\x00\x07tIME\x07\xe7\x05\x06\x09\x11\x08x\xcd\
-\xc1\x9b\x00\x00\x01\x7fIDATH\xc7c`\x18\x05\
-\xd4\x06&v\x86\x86\xc6\xc6\x97.\x19\x1d\xfb\xf4\xc9\xd8\
-x\xe2D\xadUllT\xb5\xc0\xb8\xf0\xe2Ec\xe3\
-\xff\xffa\xd8\xe8\xcd\xae]\xd6\xc2\xbc\xbc\xb8\xd43\x91\
-l\xc3!yyd.\xa3\xbb\xab\xeb\x0f\x85\x03\x07\xcc\
-\x97\x89\x8bS\xc7\x82\xed\xf3\xe7c\x0a\x1a\x19\xfd\xe99\
-z\xd4\xf0\x98\x8a\x0a\xc5\x16(e\x97\x94\xfc_9c\
-\x06\x86\x04\xa3\xb22\xa3\xe9\x89\x13\x86\xe9\x96\x96(\xc2\
-$\xfb\x00\x0a\x8c\x17\x96\x973L\xea\xe8\xc0\x900\xfd\
-\xfa\x95\xd1(4\xf4L\xda\xf6\xedp\x0b\xcc\x97\x89\x8b\
-\xff\xe9\xd5\xd2bldf&\xc5\x92\xffgRS\x19\
-6\x87\x85a\xca\xfc\xfe\xfd??1\xf1\x5c\xdc\xd2\xa5\
-\x8cFb11\x8c\x81s\xe72\x9c\xa1vr\xfb\xff\
-\x9f\xf1Y|<\xa3q\xce\xd3\xa7\x0c\xc7\xa5\xa4\xa8j\
-8\xcc\x87=O\x9e01X\xfe\xffO\x0b\xc3a\x80\
-Y\xf2\xc8\xabW\x8c\xce>>\x0c\xcfH\x0b\x7fb\x82\
-\x88iWn.\xed#\x99l\x07\x12\x99LI\x06\xa1\
-\xa1\xcc\xccFw\xa6OG.\x8f\xe0\xe5\xd2\xef7o\
-\xd03\x1a\x0b\xa9\x16\xdc\xb3\xec\xede\x0c\xcf\xc8\xc0\x0c\
-\xaf\xbbw\xff\x9f\xf6\xf08?\xf3\xce\x1dda\x92\x83\
-\xc8\xd8\xf8\xc3\x07\x06\x06~~\x14A\x87\xb3gY\x8c\
-\xbd\xbdOF\xbd|\x89\xae\x9e\xf4\xc2\xce\xee\xe1C\x14\
-\x87\xef\xdc\xbd\x9bc\x81\xa3#6\xc3\xc9\x02&v\x86\
-\x86F\x9f\xcf\x9d36\xfe\xf0\xc1\xb8o\xc2\x04\xaaW\
-8#\x0f\x00\x00L\x92\xa6\xf6\x05\xd8\x0ac\x00\x00\x00\
-%tEXtdate:create\
-\x002023-05-06T09:1\
-7:08+00:00\xcf\xd7\xaf\xda\x00\x00\
-\x00%tEXtdate:modif\
-y\x002023-05-06T09:\
-17:08+00:00\xbe\x8a\x17f\x00\
-\x00\x00(tEXtdate:time\
-stamp\x002023-05-06\
-T09:17:08+00:00\xe9\
-\x9f6\xb9\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x057\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x18\x00\x00\x00\x18\x10\x04\x00\x00\x00\x1a\xee)0\
-\x00\x00\x00 cHRM\x00\x00z&\x00\x00\x80\x84\
-\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\x00\xea`\
-\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\x00\x00\x02\
-bKGD\x00\x00\xaa\x8d#2\x00\x00\x00\x09pH\
-Ys\x00\x00\x00`\x00\x00\x00`\x00\xf0kB\xcf\x00\
-\x00\x00\x07tIME\x07\xe7\x05\x06\x0850\xa0\xe5\
-\xf2\x94\x00\x00\x04\x06IDATH\xc7\xa5UmL\
-SW\x18~N\xe9\xd7\xac\xd2e\xa6\x8d\x0d\xff\xb6@\
-\xa4-KzO\x15\x22\x1b\x04JVj\xcc\x0c\xc6\x1f\
-:IL\x10\x97\xccB4q\xb2Q\xf0G\xe3\xd8\x12\
-\x99\x09\xdb@\x13\x82`\x02q\x09\x04\xd0\x185\xa0\xbd\
-\x86\x15\x11Z\xda\x11(,\xd1\xed\xc7\xa2\xb1Z\x12b\
-\x05\xd4\xf2q\xcf~`/\x14\xa8\xad\xd9\x9b\xdc\xdc\x93\
-\xf7\xbc\xef\xf3\x9c\xf7<\xe7\xbc\x07H\xc2\xb8\xe2\x9c\x1c\
-j\x0f\x85\xcc\xcd6[2\xf1kM\x92T\xd47Y\
-Y\x18\xd6h\x98\xa4\xb7\xf7}IH\xbc\x09}\xa7\x5c\
-\xfe\x81\xa2\xac\x8cY\xecv\x92o4\xae\x92E\x22D\
-()\x19\xfd\xfa\xf6m\xdaUY\xc9~\x8aD\x08\xda\
-\xda|\xfe\xc5\xc5\xa4\x09(\xe58|\xde\xd1\x01wf\
-\xe6\xe6\x15E\x22\xcb\x19\x1c'\x1b'Dh\x0b\x04P\
-35%\xf9\xfd\xc8\x11o\xd7\xd8X\xc2-2\x0d\x15\
-\x17\x03nw\x5cp\x00P\x84\xc3\xecj8\xcc~Q\
-\xa9\x00\x00uz\xbd\xb0}p\x90sX\xad\xef$0\
-\xe7\x99L\x92\xca\xeen`\xcb\x96\xb8\xe0\xa7B!I\
-\xb8\xb0P\xea\x09\x85\x04g]\x9d\xe8\xf7\xaaTd\xa6\
-\xbb\xdb\x9cg2mJ@9\x99\x8c\x9d\xea\xe8\xd8\x0c\
-\x9c\xfd6;\x1b\x05'}\x16\x8b\xb7br\x12|]\
-\x1d\xb9PT\x14\x13\xe8U\xa9\x84\xea\xf6v}\xa7\x5c\
-\x1eu\xa5D\x07:]y9q\x97\x95\xc5\x8a\xc1\x18\
-s\xd4\xd4\xa4\xf8\xab\xaa\xd8Xf&\x09\x1f><\xda\
-\x11\x08\x00\xc0g\xff\xf0\xfc\x8b\xc1\x85\x05\xd8\x0a\x0a\x10\
-$\xa2\x96\x84\xd7j\xa5\x83O\x9e\x04\x83>_,V\
-We\xe5\xaeF\x83\xc1\x9c\xbe{7w\xf5\xce\x1dJ\
-\x19\xe3J\x1d\x0e$0\xdaR[K)c1\xdf\xf5\
-U\xb1\xc5\x0a\x82]\x1e\x8f\xf6{\x8dfy~z:\
-\xa5\xab\xb9\x19\xbcR\xf9I\xaf\xd395\xc5\xd8\xbb\x08\
-\xd2Rgf\xd8\xcd\xd2R\xd2\xa2P\x88\xce\x81\x1d;\
-\xd2\xd2\x1f?\xd6m\x97\xcb\xc5\xd2\xcc\xcd6\x1b\x93\xf4\
-\xf6B\x11\x0eK\xc2\x85\x85\xde\x8a\xc9\xc9D\xab\x07\x00\
-Jy\x1e((\x88{ \x00\x80sX\xad\xc2\xa7=\
-=\xb8\xa4P\xa0A\xab\x15\xfe\xbaw\x8frYY\xc9\
-\x10\x00'N\x00\xc1\xe0\x06\xb7yaA\xc8-/'\
-\x9c\xc3j\xc5\x97\xd7\xae\x11\xbbR\x19\x13\x903=\x8d\
-\x07\x16\x8b\xcf?1\x91\xb8\x8a\x9d;\x01\x9e\x07t:\
-\x11\xfc\xbb\x83\x07\xff\xfc\xf8\xc6\x0dB\xed\xa1\x10\x865\
-\x9aM3\xeb]._\xe1\xba\xa3\x18\xc7v5\x1a\x0c\
-\x82\x9a\xe7\x11Q\xab\xa3\xad\x04\x00$\xa4\x7f\xdf>\xa2\
-:vl}\x02\x1by\xf9R2u\xf2d\x22\xe0|\
-&\x95\xd2\x17\xe7\xcf\x0b\xad\x0f\x1f.\xdd\xe7\xb8\xe5\x0c\
-\x8e\x8b\x82\x03\x80d\xf4\x91\xc73\xfaGk+\x10\xbb\
-\x15$;5uyx\xff\xfeD\x04s\xe6\xeajX\
-\xce\x9ca\xdf\xde\xba%s\xa5\xa5\xc9\xc6\x091\xa7W\
-T\x88\x04\x22\xa0\xd0\xd4\xb4>\x99\xe4\x9d;G[j\
-k\xf3\x99T*jWj4R\xca\xf3+\xff\xb3g\
-A\x9dN\x00 \x17\x8a\x8aX\xea\xc8\x88\xd0\x16\x08\xb0\
-__\xbf\x161\xa2\x03}\xa7\x5c\xae\xdc\xe6\xf7\x93Z\
-\x83a\xc32]\xf5\xf5\xbe\x0f\xab\xaa\xcc\xa5F#\xb3\
-\xba\x5ch\xd0ja\x9f\x9bC\xd3\xd6\xad\x1b\xb6v \
-\x10\xd8\xa62\x99\x06\xc8\xd2R\x0c\x01\xb0\xd2\xec\x98\xde\
-\xed\x86\xf7m\x97\x04\xc0N\xdf\xbdK~\xde\xbbWR\
-\x96\x91!\xa8y\x1e\x0dZm|\xa5\xe7\xe7Y\xcf\x9e\
-=\xfe\xd0\xf8x\xd4\x95\xb2v\xfe\xe9\xbf\xcf\x9e\xe9\xbe\
-\xf0\xf9\xc8G%%x\xba\xd2\xb0Rn\x1e:\xb4\x98\
-/\x08$}h(\x118<\x07\x0e\xf8\xff\x1e\x1aZ\
-\xeb\xde\xf0\x1e\xf8\x7f\xec\xeb\x13.\xe7\xe6\xb2\x1f\xde\xde\
-\xe4\xd3\xaf^\x91\xaf\xd4jD\xd4\xea\xf8ROL\x08\
-\x97ss}\xfe\xfe\xfe\x0d:\xc6K\xa1\x9cL\x06\x1c\
-=Jf\x95\xca\xd1G\x8d\x8db+\xb9\xb4\xdas\x98\
-sl\x0c\xcb\x17/\x12\xe7\x95+\xf1\x9e\xcc\xf72s\
-\xb3\xcdF[\xde\xbc\xa1\x941\xee\xfa\xf1\xe3\xff\x1b0\
-.I\xfb\xf3\xe7\x94\xcb\xceN&\xfe?6S\xa6\x80\
-\xcbEjV\x00\x00\x00%tEXtdate\
-:create\x002023-05-\
-06T08:53:48+00:0\
-0/9\xab]\x00\x00\x00%tEXtdat\
-e:modify\x002023-05\
--06T08:53:48+00:\
-00^d\x13\xe1\x00\x00\x00(tEXtda\
-te:timestamp\x00202\
-3-05-06T08:53:48\
-+00:00\x09q2>\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00\x19\x84\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x1d\x00\x00\x007\x08\x06\x00\x00\x001*\x9e\x9f\
-\x00\x00\x01XiCCPICC Prof\
-ile\x00\x00(\x91m\x901K\xc3P\x14\x85O\
-j\xa4`E\xac88(dQT\xaa\x964\x0e\x8e\
-\xb5\xa0\x08\x0e\xa1*V\xb74M[1\xad\x8f$\xa2\
-\xce\x0e.\xce\xce\xd2\xc1\xfe\x01\xa1\x22\x22\xe2\xe4.\xa8\
-\xd5\x1f\xe0\xd6E\xc8\xa2%\xdeg\xaai\xd5\x0b\x97\xfb\
-\xbd\xc3\xe1\xbe\xc3\x05B\xa2\xc6\x98)\x02(\x95\x1d+\
-\xbd8/e66\xa5\xf0+DD0\x80\x11\x8ci\
-\xba\xcd\x92\xaa\xbaL\x16|\xcf\xcer\x1f \xf0y?\
-\xc5wU\x872\xd5P<\x1a\xad\x1c\xcd\xd6\x1d\xe5\xf2\
-\xfa\xaf\xbf\xa3zr\x86\xad\xd3\xfc\xa0\x9e\xd4\x99\xe5\x00\
-\xc28\xb1\xba\xe70\xce\xfb\xc4\x83\x16\x85\x22>\xe6\x5c\
-\xf0\xf9\x94s\xd6\xe7\xf3/\xcfj:E|G\xdc\xaf\
-\x17\xb5\x1c\xf1\x13q,\xdb\xa6\x17\xda\xb8d\xee\xea\xad\
-\x0c<}\xafQ^[\xa1\xd9G=\x8c\x14d(X\
-@\x02s\x88\xd3m\xfe\xf7*-\xef\x0e\x18\x0e`a\
-\x0b\x05\x14\xe1@B\x92\x14\x06\x13\x06\xf1\x12\xca\xd01\
-\x8d\x18\xb1L\xdbd$\xf8\x8d\x7f\xdf.\xd0\x8c\x0bZ\
-}H_\xd5\x03m\xbb\x01\x5cU(^#\xd0Fg\
-\xe8\xfd\x02\xdc\xe6\x99fi?\x17\x15\x5c\xd1\xce'd\
-\x9f#5\xa0\xfb\xc4\xf3\xde\xd6\x81\xf0\x04\xd0|\xf4\xbc\
-\xf7\x9a\xe75\xcf\x80\xaeg\xe0\xc6\xfd\x04\xddKb*\
-l\xe1Q\x9b\x00\x00\x00VeXIfMM\x00*\
-\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\x00\x01\x00\x00\
-\x00\x1a\x00\x00\x00\x00\x00\x03\x92\x86\x00\x07\x00\x00\x00\x12\
-\x00\x00\x00D\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x01\x1d\
-\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x007\x00\x00\x00\x00\
-ASCII\x00\x00\x00Screensh\
-ot[d\xf5-\x00\x00\x01\xd5iTXtXM\
-L:com.adobe.xmp\x00\
-\x00\x00\x00\x00<x:xmpmeta x\
-mlns:x=\x22adobe:ns\
-:meta/\x22 x:xmptk=\
-\x22XMP Core 6.0.0\x22\
->\x0a   <rdf:RDF xm\
-lns:rdf=\x22http://\
-www.w3.org/1999/\
-02/22-rdf-syntax\
--ns#\x22>\x0a      <rd\
-f:Description rd\
-f:about=\x22\x22\x0a     \
-       xmlns:exi\
-f=\x22http://ns.ado\
-be.com/exif/1.0/\
-\x22>\x0a         <exi\
-f:PixelYDimensio\
-n>55</exif:Pixel\
-YDimension>\x0a    \
-     <exif:Pixel\
-XDimension>285</\
-exif:PixelXDimen\
-sion>\x0a         <\
-exif:UserComment\
->Screenshot</exi\
-f:UserComment>\x0a \
-     </rdf:Descr\
-iption>\x0a   </rdf\
-:RDF>\x0a</x:xmpmet\
-a>\x0aP\x19\xf3\xe2\x00\x00\x15\xa4IDATx\
-\x01\xed]\x09|M\xd7\xd6\xff\xcb\x9c\x5c\x19\x84\x10\x09\
-R\xa4\xa6\x92\x0615\x11c\x10\xd3\xd3RC\xbdj\
-\x8d\xdf\xa7\xf5\xb5\xaf\x1eO\xe7V\xeb\xa7\xaa\xa8\xbe\xa7\
-\xdf\xc7k|\xed\xf3jNME\xd4\x1c\xc4\x18\x82H\
-\x08I\xcc\x11\x11B\xe6D\xc4[k_\xe7\xe4\xdeL\
-n\xb877ao?9w\xcf\xeb\xfc\xef\xd9\xff\xbb\
-\xd6\xda\xeb\x9cS#55\xf5!d\x92\x08H\x04$\
-\x02\x95\x84\x80U\xf1y\xf2\xf3\xf3\x91\x97\x97\x87\x07\x0f\
-\x1e\x88\xaa\x87\x0f+\xceIO\xd2\xa7\xb8\x1c2/\x11\
-\x90\x08\x98\x1f\x81\x1a5jTX\x08\xa5\x8f\xa5\xa5%\
-lmmacc\xa37\x86\x1e\xe9\xe4\xe4\xe4\xa0\xa0\
-\xa0\x00VVV\xb0\xb6\xb6\x16\x0d\x95\x01\xf4z\xc9\x8c\
-D@\x22 \x11(\x03\x01E\xe9\xe0\xa3\xa2\xc0\xd8\xdb\
-\xdb\xab\xad-\x94O\xac\xe10\xe10+YXX\x80\
-\xc9F\x12\x8e\x82\x8e<J\x04$\x02\x86\x22\xa0p\x07\
-\xf3\x08\xf3\x09\xf3\x0a\xf3\x8b\x92T\xd2aFb\x0dG\
-&\x89\x80D@\x22`L\x04\x98W\x98_\x94\xa4\x92\
-\x0e\xfbp\xa4f\xa3\xc0\x22\x8f\x12\x01\x89\x80\xb1\x10`\
-^Q|\xc4<\xa6J:\xc6\x9a@\x8e#\x11\x90\x08\
-H\x04\xcaC@\x92Ny\xe8\xc8:\x89\x80D\xc0\xe8\
-\x08\xa8\xa4\xc3\x9efi^\x19\x1d_9\xa0D\xe0\xb9\
-G\x80yE\xd9\xd1b0T\xd2y\xee\x91\x91\x00H\
-\x04$\x02\x95\x82\x80$\x9dJ\x81YN\x22\x11\x90\x08\
-(\x08H\xd2Q\x90\x90G\x89\x80D\xa0R\x100j\
-`\xcew\xdf\x8d\xab\x14\xa1\xe5$Z\x04\xe6\xce\x1d\x8e\
-[\xb7\xfa\x19\x04\xc7\x91\x07\xb5\x0dj\xf7\xbc6Z5\
-o&\xbe\x9f1\xc5\xa0\xd3\xaf}\xe2\x98A\xed\xaa{\
-\xa3\x99\xcbWb\xca\xfc\x05F?\x0d\xa3\x92\x0eK\x17\
-\x14\xe4it!\xe5\x80%\x11\x08\x0ajP\xb2\xf01\
-%Ws\x1e\xd3\xe09\xad\xbezlo\xc5\xcf\xfc\xda\
-\xb5\x8a\xf7\xa9F=\xf6^\xbel2i\x8dN:,\
-\xa9\xaf\xef\xd7ps\xdb&~\x85\xe5\xd148\x00K\
-LvQ\xc8\x81%\x02\xa6D\xc0$>\x1dI4\xa6\
-!\x1a]\x5cMyQ\xc8\xb1%\x02\xa6D\xc0$\xa4\
-\xc3~\x06\xdd\x05\x22\xf3\xc6\xc7\xc3\x94\x17\x85\x1c[\x22\
-`J\x04LB:\x92p\xa4\xa6c\xca\x8bV\x8e]\
-\xbd\x110\x09\xe9<K\x9a\x8d\x8d\xcd\xfa*\xe9\x9b\xaa\
-\xde\x97\x9d\x94\xfeyF\xc0$\x8edC4\x9dM\x9b\
-\x9c\xf1\xf1\xc7\xed\xe9\xeeS\x0d:u\x0a\xa1[\xdf=\
-\xe8)c!\x94o\x04?\xbf\xed\xf0\xf6\x1e\x89>}\
-\xb6\xd0\x82\x1f`6S-$d\x0a\x96-;\x8d\x09\
-\x13\xc21f\xccB\xb3\xc9Q\x1a\x9e\xa6\xbch\xe3\x8f\
-\xee\xc3\xa1\xb5?\xc3\xcd\xab)\xfaM\xf9\xd4\x94S=\
-\xd3c\x1fNL\xc4\x92\xf0\xfd\x06\x9fc\xdbF\x0d\xf1\
-^\xaf\x9e\x06\xb7\xaf\xae\x0dMB:\x86h:\xf9\xf9\
-_\x0b\xc2\xb1\xb4\xcc\xc2\x91#)\xb0\xb4\xbc\xf8(\x7f\
-\x11\x91\x91\x1a\xca\x87#4\xb4\x17\x96,yH\xc43\
-\xd0,\x0b>2\xb2\x80\xe4\xc8\x22y\x0a\xf1\xd7\xbf\x9a\
-\xded2\x04\xb7\x22\x022\xdd\xeeU\xc6\xed\x14\x5c\x89\
->\x8e\x02\x9d\x07/U\xd7\x0b\xdc\x9cr\xa7dd\xe2\
-\xf8\xe5+\x06\x8bP\xd3\xce\xd6\xe0\xb6\x866\xdcu\xf6\
-\x1c\xf6\x9c\x8bC\x9b\x06\x9e\x18\xd1\xc1\xcf\xd0n&m\
-g\x12\xd2)Z\x18e/\xd4\xf4t_Z\xd0\x1b\x04\
-\xd1\xac^\xfd&\xd2\xd2\xfcQ\xabV\x04.\x5ch\x8e\
-\xd8\xd8UX\xbd\xfa,\x8e\x1d\xdb\x85\xc9\x93-\xb0t\
-\xa9\x95YL\x9c9snb\xed\xda\xf6\x181\xc2\xd6\
-,\xf3\x97\x87\xa3I\xaf\x0a9\xb8Q\x10\xe8\xfa\xa27\
-~\x1e\xfb\x96\xdeX\xdbcc\xb1\xf2\xc81x\xd7u\
-\xc3'\x03\xfa\xeb\xd5\xb9j\x1c\xf4\xf2\xc6\xc8\xc4$%\
-a\xd3\xa9\xd3\xc8\xb9\x7f\xff\xd9&\x1dC~\xb1\x9d\x9c\
-\xb4\x9a\x8e\xafo-\xd4\xaf?\x11>>LP\xdac\
-`\xe0\xffR\xac\xcf7\xf8\xdb\xdf\xc2H\x0b\xda\x81\xf3\
-\xe7g\xa0Y\xb3\xb2\x09\xcc\x90\xf9\xca[\xc0e\xf5\x07\
-\xde\x22\x13\xb0\xf2\xe7-K\x1e\xfdr\xd3i:\xc6\xb8\
-\xd8\xe5\x18@-\x07\x07\xb4\xf7j\xa4\x07\xc5\xf9\x9b7\
-E\xde\x99\x9e\x19\x5c\xbcN\xaf\xe13\x9c1\xbb\xa6\x93\
-\x97\xd7\xb2T\xd3\xa9s\xe7\x8f\xe0\xe1\xb1\x1dII\x1a\
-\x5c\xba\xb4\x94n\x8d\x1f\x87_\x7f\x9dH\xcf[m\x89\
-\x193\xb21\x7f~&N\x9e|\x0d\x0d\x1a\x04\xe0\x9b\
-o 4\x91\x8c\x8ce\xa4!\xd9\xe2\xf4\xe9\x11\xc8\xc9\
-\xf1D\x8f\x1e\xfb\xd0\xaa\xd5xt\xee\xac%\x8e\xc3\x87\
-\xbf\xc1\xde\xbd5\xc8gt\x18\xbd{\x7fYb\xde\xf8\
-\xf8E\x983'\x13\x8d\x1b\xef$\xedf\x1e\x8e\x1e\xfd\
-\x16\xbbw?D\xdf\xbeg\xd0\xb6\xed4\xb5\xfd\xe3\xe6\
-qt\xfc\x9d\xcc\xb1\x1888\xfc\x86I\x93\xfe\x81\x86\
-\x0d\x8b\x88+,\xac\x0e\x0e\x1e\x9c\x08\x17\x97\xae%L\
-\xb6\xb0\xb0\xcfp\xea\x94\x86\xe6N\xa4K\xee\x1du\xbe\
-\xd2\x08\xb3\xaa]\x93\xa9W\x12\x91p\xec\x00\x12\x8fG\
-\xe0!\xfdk\xdc\xb6\x0b\x9a\xfa\xf9\xa3n\xe3f%D\
-MK\xba\x8aS;6 %1\x0e\x99i\xb7\xc9w\
-\xe4\x0d\x8f\xe6\xad\xd16x\x18,\xe8\x0d\x02\x9c\xb2\xa8\
-|\xcf\xcf?\xc0\x8a\x9e\xb1\xdbm\xcc\x14\x1c\xdf\xb2\x06\
-\x89\x91\x114\xde\x8b\xe8:z\xb2Z\xd7g\xf2\x87\x88\
-\x0a\xfbM\x98\x83w\xae_\x86\xab\xa7\x17^\xea\x1e\x8c\
-f]z\x94\x98\xb7:\x14$\xdeJ\xc5\x81\xf8xD\
-\xc4'\x88\xc7Ati\xda\x04\xfe\xdeM\xd1\xac^=\
-=\xf1\xb3\xf2\xf2\xb1&2\x12g\xae'\xe1ZZ\x1a\
-^\xa8S\x1b>\x9e\x9e\x18N&\x945ax\xf5N\
-\x1a~\xda\xbf_\xd4s\xc7\xe8\xeb\xd7\xf1\xf9\xc6M\xb0\
-\xaca\x81/\x06\x0f\xd4\x1b\xab\xb23*\xe9\xe8>\xef\
-\xe2i\x85\xd0\xffE.Zp\xba\xe5\x8a\xa6ck\x9b\
-\x5c\xa6\xe9\xe2\xe8\xe8M&\xd8\x09\x9c=\xeb\x81\xa6M\
-7\x93\x8f'\x0e\x1aM4n\xde\xecF\x84\xb0S\x98\
-f\xb6\xb6\x87\xa9\xffTZ\xac\x0b\xf0\xde{\x1b\xe9\xa1\
-\xf2\x99\x8f|C\xf1\xc27de\xb5\x1d\x9f\x7f>\x0f\
-\xaf\xbf\xbe\x8d\x88\xa83\xfe\xf8c\x1a\xf6\xefw\xa7\xfc\
-V\xea\xd7_oa\xcf\x98qU\x8c;d\xc8\x18Q\
-\x1e\x11aC\xed\x7f\x85\xb3\xf3\x04rjk\xcf\xc3\x90\
-yn\xdd\x1aD\xc4\xf7=\xae]+@\xff\xfe!\xb0\
-\xb3\x9b\xa2\xce\xb3{\xf7Xl\xde\x9c\x00{\xfb\xd3D\
-.\xfb\x884\x8b\xf0Y\xbc\xf84\xd2\xd3\xafa\xe0\xc0\
-\x7f\xa9\xedK#\x1c-\x8eUG\xd3\x89\x8b\xd8\x85\xdf\
-fM\xd5{f\xca\xc5\x13\x87\xb1\xe7\xff\x17\xe2\xb5O\
-\xe6\xa1E@\x90zI\x9d?\xb4\x07\x9b\xbe\xfb\x04y\
-\xd9\x99j\xd9\x8d\xf318\xbdc#\xce\x1f\xdc\x8d\xa1\
-\x9f-\x80\x8d\xbd\x069\xe9wqj\xfb\x06X\xdb\xda\
-!\xfdV2.\x1c\xd9'\xda3\x09)uV\xd66\
-\xc8\xbew\x17g\xf7oW\xc7J\x8e?\x8b\xd8\xf0m\
-\xe8\xfe\xd6\xff\xc0\x7f\xd4D\xb5\xbc:|`\xff\xcb\xd4\
-5k\x09\xc7\x22i\x0f'^\xc4\xc2\x9d\xbb0\xef\xf5\
-a\x08j\xd5RT\x5cO\xbb\x8bwW\xac\x04\x13\x94\
-\x92\xce\xdeHFXt\x0c\xb6F\x9f\xc1\xa2\xd1\xa3p\
-3#\x1d\x1b\xa2N)\xd5H\xbe\xa7\xcd[\xd0\xb3m\
-\xccA:\xba\xfc\xa2\x92\x8e*\x9d\x11>\x94\xbdP\x8a\
-\x16\x98\xe2\xd3)K\xd3\xb9v\xad\x07\x92\x93\xbf\x12\x04\
-\xe2\xef\x7f\x0fw\xee\x04\x13\x01\xfd\x80\xac,\x0dN\x9c\
-\xd8\x8d\xd1\xf4k\xd7\xbd{.\x0a\x0b\xfb\x10\x09\x85`\
-\xda\xb40A8AAC1j\x94\x0b\xee\xde\xed\x82\
-\xf0\xf0\x1f\xb1n\xddy|\xfb\xed\x87\xa8W\xefg\x0c\
-\x19\x92\x80y\xf3\xdc\x91\x9d\x9d\x8cm\xdbj\xd3\xe2.\
-\x92\xe7\xe2\xc5\x00DE}.\xe6{\xe3\x0dGA\x84\
-\x0e\x0e\x9bD^\xa3\x89\xa3\xfcd\x83\xe7\x09\x0c\xdcF\
-\x9aQ0n\xdcX\x85={l\xd1\xa5\x8bv\x9e\xda\
-\xb5\xc3H&v\x9ag\x11\x01j\x90\x98\xb8\x98v\xec\
-\xde\x17\x04\x13\x19\xd9R\x10\x8e\x83\x83;\x02\x03\xaf\x94\
- D]\xc2f|\xabJJ:\x7f\x06\x1b\xe7~$\
-\x08\xc7\xa7\xf7`\xf8\x04\xfdI\x88\xc6$rz\xe7&\
-A0Nn\xee\xa4\xc9\xb4A\xe1\x83\x02l[4K\
-\x10N\xe3v\x9d\xd1q\xc8\x9f\xe1\xe0\x5cKhH\x07\
-W/E\xe2\x89C\x88\xde\xf9;\xda\x0f\x1a\xa9\x9e\xde\
-\xfd\xbc\x5c$\x1c?\x88\x807&\xa1Q\x1b?\xd8;\
-:\xabu\x05\xf7\xf3q.b'iB\xef\xa2\x09i\
-U\xac9\x9d\xd8\xb2\x167.\xc4\xe2\xc0\x8a%x\xb9\
-\xef\xab\xa8\xe9ZGm_\x95?\xb0\xc6\xf2\xd1\xba\xf5\
-\x82p\x06\xbf\xec\x83?\xf9\xbe,\xc4\xddx\xf2\x94\xf0\
-\xc9|\xb2~\x03\xdc\x9d\x9d\xd0\x86\xb4\x99\x7f\x1d:$\
-\x08\xa7\xa9\x9b\x1b\xbe\x1e2\x18\x0d\x5ck\xe1\x049\xac\
-\xbf\xfa}\x0bi4I\x08\x8d<\x817\xbbtB\xe8\
-\xe4IX~\xf8(\xd6G\x9dD\xa7&\x8d1\xbdo\
-\x10,H\xd31w2\x09\xe9\x14_ \xa5\xe5\xcb\xd3\
-tn\xdc\xe8\x8d\x90\x90wq\xef\x9e\x15i\x04y\xe4\
-\xf3\x19\x8f\xdc\xdcU\x8f4\x98,\xd2h\xbe\xc4\xb8q\
-\xd6\x82\x18x\x01\x8e\x1bw\x81\xcc\xae;DB\x83\xf1\
-\xfd\xf7\xed\xd4r_\xdf\x9f\x88\xa4\xc6\x90\xb6r\x99H\
-f>Z\xb6\x0c!\xa2\xd9\x82\x95+3H\xa3YJ\
-[\xf5\xffT5\x8a\xe8\xe8oh\x0e;4o\xae\xa1\
-\xb2q\xa2<;\xfbE\x22\x88#4Fs\x91\x9f1\
-\xc3\xf0y\xfa\xf4\x89\xc5\xef\xbfkp\xee\x5c\x18\xc9\xb3\
-N\xf4\x0f\x0f\xf7\x12\x84\xc7\xc4\xc2\xc4\xb7cG\x0d\x22\
-\x18-!]\xbc\xa8%\xd8\x80\x80:D\xb0\xfa\x1aX\
-i\xf8\xb9\xb9U\x0dM\xe7\xc0\xf2\xc5`b`\x93f\
-\xd0\xb4Y\xea\xf5\xdc\xc8\xc7\x0fy9Y`-(r\
-\xd3*\x0c\x9e\xde\x06lV\xb9{\xb7D\x83V\xbe\x18\
-\xf0\x97/a\xabq\x14\xed\x99\x90n\x93i\x14\xb3g\
-+.\x9d:\xaaG:\xdc\xa0\xdf\xbb\x1f\x0b\xd3K\x19\
-<\xf5r\x82\xf2\x11=\xde~\x0f]\x86\x8f\x13y\x8f\
-f\xad\x051\xfd\xdf\xf8A`BJ\x8e\x8f\x85w\xc7\
-@\xb5mU\xfe\xb08|\x1fr\xef\x17 \xb8\xcdK\
-\x98\xf5\xaa\x96\xb8Y^\xbf\x17\xbc\x90E\xbb\x88\xac\x05\
-\xad:z\x0cm^\xf5\x04k?\x9cFw\xee\x88\xd6\
-\x9e\x1e\xe2s\xcf\x16\xcd\xc5q\xdd\x89(d\xd2\x9b\x17\
-\xec\xe8\xbdul\x92\xd5\xae\xa9\x11\xe5Nvv%L\
-4Qa\x86?&\xa1=\xc35\x9d,\xf2\xcb\xa4a\
-\xcd\x9a\xe9\xa4\x8d$\x91?f\x1ai,\xa70~|\
-\xb0\xd8\xbdb\x8d`\xe2\xc4\xe9\xf0\xf4\xdcM\x0b1P\
-h\x08\x85\x8551th\x81J,\xbc \x13\x13\x0f\
-\x0bB\x9a4\xc9C\xaf\xbcn\xdd?\xd0\xb3\xe7;\xa2\
-_TT\xbeX\xf8\x81\x81SD~\xdb\xb6\xeb\xb4[\
-\xc6&\x96\xf6\x16\x85\x0d\x1b\xee\x8a\xf2\xee\xdd\xff,\xda\
-q\xb9\x83\xc3\x05\x1dM\xa7b\xf34m:\x89\xde\xf9\
-\x93C\xe7w\x0fNN\x9b\xc5<\xb1\xb1\xbf\x88\xf1>\
-\xf8\xa0\x03=\x1a\xd6\x994+\x8eC\xd2\xce\x1f\x1e\xfe\
-P\xcc\xef\xe33\x5c\x9d\xbf<\x1c\xcdp\xad\x94:%\
-\x9bF\x9c:\x0c\x19\xadW\xcf\x8f\xa8\xf4\xed\xfb\x9a(\
-\xe3\xc5\xcf\xa9v\xc3\xc6\x18>s\x11\x99\x5c\xf3U\xc2\
-\x11\x15\xf4\xc7\xbbCW\xf11\xfd\x96\xd6\xd1\xaa\x94\xf3\
-8\xba\xe6\x99R\xae\x1c[\x06\xf6U>\x8a#\xfbt\
-\x5c=\xb5\xce\xdb{)7\xf4\xea\xaar\x86w\x998\
-\x8d\xee\xd4IOL>\xff\xd7\xda\xf9\x8a\xb2\xd8\xa4d\
-qlP\xab\x968\xae>\x16\x89\xd8\x1bE\xe7\xc8\xc4\
-\xb3\xe8\x8d\x91\xf8 \xa8\x97\xde\x18U-cvM\x87\
-\x89e\xd1\xa2#\xb4\xe0v\xab\x9a\x0c\x07\x0cj4\xf9\
-D>\x1f\xd1\x96yM\xb10]]\x97=\x22\x80<\
-zq\xd7\xab\xea\xc2,,\x5cCf\x8fv\xc1N\x98\
-\xb0\x01\x8e\x8e+p\xff\xbe+\xbd\xa1\xf4[q\xbcs\
-\xe7\x92\xe8w\xf5j\x0c\xae^\xedN\xda\xd0^\xd2\x9c\
-\x9a\x93\xe9\x13\xa7\x9aX\x89\x89\xfe\xc2\xb4z\xf8\xd0\x91\
-L\xb3\x22\x0dJW\xd3\xa9\xe8<\x8d\x1b\xefE\x8b\x16\
-\x9d\x10\x13s\x88L*O\xe1\x13\xda\xb5+\x83\xde-\
-\x96\x8d\xf6\xed\xdfG\xc7\x8e1\xe4P\xbeI2\xae\xa4\
-\xf3\x1bEa\x02\xdf\x0a9\xfb\xf5\xcb\xa4\xfc\x08\xf5\xfc\
-\xca&\x1e\xf3k:\x19\xa9)\xc2\x11\xcc\x17\xf5\xaaO\
-\xdf\x815\xfd\x9a\xea&\xae\xe7t\x8b4\x93\xfb\xb99\
-To/L,6\xa1.F\x1d\x06;~s\xb32\
-\x90G\xff\xd97\xc3\x89\x17\x99n\xb2\xb2\xb1\xd53\xa9\
-\x8a\xd7\xb9\xb8\x97|\x94J\xed\x06/\xd0\xd8W\xc8T\
-)\xd4m^e?\xa7\xa4g\xe0vf\x96\x90\xef\x9d\
-_W\xc0\xceF\xfbv]E`\xae\xe7\x94p\xeb\x96\
-\xd8\xfa\x1e\xfbJ\x17D^\xba\x84\xb8\xe4\x9b\x18\xb9$\
-D\x98]~^^\xe8\xd5\xb2\x05\xba5o\x06+\x0b\
-\x93\xe8\x12\x8a8O}4\x09\xe9\x94\xbdP\x8a|(\
-\x8aO\x87\x09f\xda\xb4\x00dd\xbcD\x84\x11C\x91\
-\xc9m\xf1\xca+i\xe4\x83\x19G\xe4\xb0S\xd5\x04.\
-]bM\xe7\x072\xa3\x5c\xf5\x16\xe4\xa1C\xed\x84\x86\
-\xc0\xe3\xb8\xbb? Bj\x80\x9a5Si\x1c\xed\xd1\
-\xce\xae\x05\xed\x80\x9d#\x87m+\x222\xd6,\x86b\
-\xd8\xb0=X\xb8\xf0\x1am\xc7\x87\x90\x89\xf5\x13\xce\x9c\
-\xd1\x9aV\x01\x01\xf5\xc8/T\xa4i\xe8\xfat\x12\x13\
-\xb5\x1aRE\xe6\xe9\xd5k/9\x945\x88\x8f_I\
-\x11\xd6\x9fQ\x0c\xd2gtlG\xdb\xffG\xc8\xe73\
-\x8c\xe6\x9f\x8b\xad[\x1dhwl\x05\x91\xe0\x03a\xda\
-YZ\x1aB8U\xc3\xa7\x93\x9d\x9e\xa6^\x805k\
-\xd1C\xc2\x8a\x11\x86\xb5\xa7\xbd \x96:\x8d\x9a\x90\x09\
-\x96\x83\xfb\xf9\xb9X\xfb\xe5\xfb\xb8\x16{R\xf4\xe3\x9d\
-*\x0d\xf5\xd3\xb8\xd4VIG\x1d\xd0\x80\x0f\xc5\x09\xca\
-\x80.U\xb2IZv\xb6*\x17\x9bC\xc5\xcf\xcb\xbe\
-\xb65.\xdf\xbe\x83&nu\x90\x93\x7f\x1f\x1d\x1a\xbf\
-\x80\x15\x13'`\xd5\xb1c\xf8#&V8\x897\x9f\
-\x8e\x06\xff\xaf\xeb\xe4\x88%o\x8e\x06\xfb{\xaajR\
-I\xa7\xf8\x89>\x8d\xc0\x8a\xc9P\xdeQ\xf1\xe9p\x9c\
-\xce\xe0\xc1\xb3\x1f\x11\x89r|]\x8fXx\x1cE\xd3\
-\xb1\xb3\xcbP\x89\x88\xcb\xfd\xfc\xb6\x10Q\xb8\x90\xb8w\
-\xf1\xf5\xd7\xab\xf0\xf2\xcb\xa7\xf5\xeaK#@\x7f\xff\xa9\
-\xa4]\x0d _O\x12\xbe\xf8b+\x8aL\xab\xf1z\
-\xf3\xeaj:~~q\x15\x9e\xa7U\xab\xb1D\x88;\
-p\xe0@\x1e\x91\xcd\x12\x22D{z\xc8\x99\x8b\x90\xaf\
-\x7f\xffe\xf8\xf1G\x0d\xa2\xa3CI\xfb\x19)\x88\xd3\
-\xd7\xd70\xc2\xd1\xe2j~M\x87\xc9\xc4\xd2\xca\x1a\x0f\
-\x0a(\xf0\xec\xab\x1f\xe1R\xbf\xfc\x07\x8b\x1d\xdb\xb0\x5c\
-\x10\x0e\xefH\x0d\x9c\xfa\x95\xd8RW\xfc:\xbcS\xb5\
-y\xc1\xe7Os\xd9U\xdb\xbeL&\xbc\xcd}\x9f^\
-x\xf9#\xed<)\xe6Sy'\xc4\xc1\x85\x9fRp\
-\xe1'\xfd\x83I\x03J\xc5\xb631XM[\xe8\xac\
-\x15}\xba~#VN\x9aP^\xf7J\xaf\xd3\xe5\x17\
-\x93\xe8a\xa5-\xf4\xe2\x04\xa4\xd5t\xb2H#q\xd7\
-[\xe8\xc5\xdb)y\xc5\xa7SP\xe0\xa8\xd7\xfe\xee\xdd\
-\x01\xe4 \xd6\x08\xd3\xe4\xdc\xb9\x9fJ\x10\xce\x85\x0b\x9d\
-I\xa3\x98C~#[\xb5_\xeb\xd6Qh\xd3\xc6_\
-8sCCm\xc9\xb4\xdaC\xbbHn\xe4+\xca\xd3\
-\xeb\xaf\xeb\xd3y\x92y\xfc\xfd\x13I{\xf3D\x5c\xdc\
-a\xd2h\xf2\x04\xb1\xb4n=V\xc8\xe1\xe88\x06^\
-^6\x88\x88H%\xd3*T\xc8\xdf\xb7/\xdf\xf2a\
-\xd8c0*\xfd\xaa)eB&\x9c\xbaM\xb4q8\
-\x09\x14\x9fS<e\xdf\xbb\x833\xbb7\xab[\xda\x97\
-\xa3#E\x93\x96]\xfb\xa0U\xb7~z~\x9d\xcb\xe4\
-@~^\x13\x13N\xb3zu\xc5\xe9s|N\xf1t\
-'+[h1\xdbI\xaba'q\xd8\x993\xe2\xff\
-\x83\xc2B\xa1\x151\x01M\xe9\xd9\x1d_\x0c\x1a \xba\
-\x9eKN\x06\xd7\xe9&&\xb4\xaa\x92LB:\x86,\
-\x1c'\xa7\x93b\xa1\x95\x17\xa7\xa3;\x8e\xab\xeb>\xd1\
-\xde\xcaJ_\xd3a\x82\xeb\xd0a\xa8X\xd0\xb3g\xef\
-'Sf\x91\xbap\xe3\xe3\xbb`\xee\xdc\xff\xc2\xf4\xe9\
-[i\xa7h\xb1Z\xce\xe3\x0e\x1f^O\x8c\xf7\xf7\xbf\
-\x7f!v\xad\x82\x83\x1b\x92\x897H%&\x1eW\xab\
-\xe9d\xa9\xbbW\x15\x9d'55\x18\xdd\xba\xd5\xa1q\
-l\xb1s\xe7:A@\x01\x01\x97T9\xda\xb7\x1fH\
-s\xa7\xd0.W\x82\xf0a5j4Io~\xdd\xf3\
-/N\xe4U\xe5\x02j\xd6\xb9\xbb\x10e\xe7?\xe7\x09\
-?\x8d\x22\x17\x9b^\x1b(Ta\xe3\xdc\x8f)x/\
-T\x14\xd7\xaa\xdfP\x1cy\x87*\x9fv\xb6\x94\x14\xb5\
-u-b\xf6\x86)\xd9\xe7\xf2\xd8\x9d|1\x9c\xe6\xfd\
-\xb1\x83v\xa7\x12U\x0c\xd8\xf4\xfa\xf0\xb7u\xf8x\xdd\
-\x06\x84\x1e?!\xfc5\xb36o\xc5\x8c\xd0\xf5\xe0\x1d\
-/\xdd\xc4>\x1eN/\xd6\xad\x0b\xcbG~\x1d'\xf2\
-\xa3q\x8a\xbaz\xb5\x04\x11\x89\x0a3\xfcQ\xcd+c\
-\xce]|\x81\x94\x96W|:e\xc5\xe9\x14_pe\
-\xf9t\xb8\xdd\xd4\xa9aHH\x18@A\x7f[h\xfb\
-|\x0d\xf9\x83\xd6\xd2\xceTs\x0a\xce\x9b\x89\xccLk\
-\x8a\xfe}\x80\xb1cg\xe9-\xe8\xb6m\xffB\x0b}\
-\x13\xdd\xf3e#\x08+0\xb0d\x04\xb0\xaeO\x87\xe3\
-t\x9ed\x9e6mFR0\xe0G\x82\xe0z\xf4\xa8\
-\x8b\xdb\xb7\x83U9\xfa\xf6\x8d\xa38\x22\xbe\xb95\x8b\
-4\xaf^b\x97\xae\xf8y\x97\x957\xe6\xf7U\xd6X\
-Iq\xd1\x98\x1d\xac\x8d\x17)\xad\xcd\xe89!\xf0\x1f\
-9\x11)\x17\xcf\x936\xb3\x03+>\x9a\x04\xf6\xed8\
-\xb9\xd5\xc7\xad+Z\xe7\xb1\x1dm\x8b\xf7\x1a?Ut\
-o\x11\xd0\x1bG\xd7\xff[\x04\xfb-x=\x10\xee/\
-\xb6\xc2\xbd\xe4k\xc2\x19\xcd\xb1<\x1c\x04\xf8\xbc\xa6\x89\
-\x81]q\xfef\x0av\xc4\x9e\xc5\xa4e\xcb\xc5Vw\
-}gg$\xa4h\x9d\xc7\x8et3\xe8\xd4>\xbd\xc5\
-V\xf8p??,=\x10!\xee`\xe78\x9e\x97<\
-<DT2\x93\x0e\xbb\xd5Ft\xec\xa0\xc2\xf8\x92G\
-}\xf1\xf9^v\x0e\xba\xcf[ \xa2\x96\xd9\x843g\
-2\x9b\xa6\xe3\xec|J,D;\xbb\x9b\xea/\x7fY\
-\x0b\x8c\xcb\xeb\xd4\xd9/\xda\xdb\xd8\xf0\xee\x8e\xbe\x09\xc2\
-\x0by\xe1\xc2\x8e\xe4 \x1eG;F5\x91B\x9b&\
-\x17.\x1c'\x0d\xc5\x86n\x85h@u\xff&\xe7t\
-\x82^?/\xaf}T6@,\xf8:u\x9a\x90\xaf\
-\xa5ddtNN3Q\x9f\x93\xa3\xbdU\xe3I\xe6\
-\xe9\xd7/\x9d\x02\x18k\x8aq||F\xa9\x84\xc3D\
-\xdc\xa4\xc9\x7f\x0b\x0d\x87\x9d\xd3\xbdz\xd9\xe9\xc9W\x1a\
-Q\xeb\x9e\xb7)/\x1a]\xfb\x9b#I\xcb\xfa\xcf2\
-\xd4\xa0_\xd4\xc1\xd3g\xa3\xd3P\x8a\xe2~\xc1\x1bY\
-w\xef\x80\x03\x06\x0b(v\xc7\xbbcW\xbc9\xff\x17\
-\xd4k\xdaB\x88\xeb\xd9\xc2G\xeb\xfb\xa9\xe7!\xfc@\
-\xd7\xcf\x9eB\x0eE\xcev\x1e\xf66z\x8e\xff@{\
-J\x8f\x9c\xd1<.'\xe5\xa8\xad\xd4\xfeU\xca\x94\xa3\
-n\x1d\x7f\xae\xf1(\x00\xae\x06\xf4w\xc2\x8a\xb7\xabJ\
-y\x8e\x14\x9e\xfd\xda\x10\x8cy\xa5\xb3\xb8\x19\xf4NV\
-\x96\xb8\x85!\x97\xfce|\xe3\xe8/c\xdfF\x0bw\
-w!\xf2\xfb\xbd{\xd2\xcd\xa2\xc1b\xd7\x8a#\x8d9\
-\x86\xe7\x02\x11\x16\xfb\x86\xfe1j$\x86\xb6k\xab\x9e\
-\x1a;\x9d\xb9=\x07\x162\xf1\x94f\xbe\xa9\x8d+\xe9\
-C\x8d\xd4\xd4T\x11t\x9dF\xf7o8\xd0\x0djO\
-\x93\xf8\x154\xfc6\x88\xa0 \xff\x0a-\xa0\xc7-\xb0\
-\x8a\xd6[X\x84\xd2\xfdZ\x148\xd5\x9ao+0\xdd\
-c1*k\x9e\xd2\xce\x1f\xb8L_\x95\x97\xc0\xd9\x90\
-\xef\x8c_AS\x19o\x83`\xd2\xc9\xcdL\x87s\xdd\
-\xfat\xdf\x94m\x99\xa2)\xed\x5c\x88\x80,\xe9v\x06\
-s&~\x1b\xc4\x95\xa3\xe1\x15{\x05\x8d\x89\xdf\x06\xc1\
-\xa4\x93\x9e\x93\x8b\xfa.\xce\xb0\xb5*\xdb I\xcf\xcd\
-\xc5\xad\x8c\x0cx\xba\xb8\x08-\xa8,\x1c\xf9\x87#9\
-=]\xd0\xb0;iP\x8fK\xfc6\x88\xf0KW\x8c\
-\xf6\x0a\x9al2\x13k=\x8a/2\x9b\xa6S\xdaB\
-\xd2\xfd%\x7f\x9a\xfa\xc2\xc2a\x14\x0b\x13kR\xc2a\
-\xf9*k\x9e\xd2py\xdcEc\xaez\x8d\x8b+8\
-N\xa6<\xc2a\xd9\x94v\xe6&\x1cs\xe1\xf4\xb8y\
-]5\x1aq\x13gy\x84\xc3cp\xa41o\x8fs\
-\x04ry\x89\xb5W6\xd7\x0c!\x9c\xf2\xc61F\x9d\
-IH\xe7i\x08\xa3\xb4\x05&\xc7+\x8aoR\xf01\
-\xc6\x97/\xc7\x90\x08\x98\x03\x01\x93\x90\x8e\xb20\xe4Q\
-\xdf\xf7dL<\xccq\xb1\xc89%\x02\xc6@\xc0$\
-\xa4#5\x93\x92\x9a\x891\x09\x87\xf1\x95I\x22P]\
-\x110\xba#y\xee\x5c\xfd\x1b\xd6\xaa+0\xd5C\xee\
-\x8a9\x92\x0f\xee\xdb[=N\xcb\x0cRV\xd4\x91\xbc\
-7\xa2d0\xa4\x19\xc46\xe9\x94\xa6r$\x97\xed\x16\
-\x7f\x82\xd3\x99;w\xf8\x13\xf4\x92]*\x03\x81U\xf3\
-fV\xc64\xcf\xc5\x1c3\x97\xaf|.\xce\xd3T'\
-iTM\xc7TB\xcaq%\x02\x12\x81\xea\x8d\x80\xc9\
-\xb7\xcc\xab7<Rz\x89\x80D\xc0\x94\x08\x98\xc4\x91\
-lJ\x81\xe5\xd8\x12\x01\x89@\xf5F@\x92N\xf5\xfe\
-\xfe\xa4\xf4\x12\x81j\x87\x80J:\x1c\xb1\xa8\xfb\xc4\xf6\
-jw&R`\x89\x80D\xa0J\x22\xc0\xbc\xa2{?\
-\x9fJ:URZ)\x94D@\x22\xf0\xcc! I\
-\xe7\x99\xfbJ\xe5\x09I\x04\xaa6\x02*\xe9X\xd2\xd3\
-\xcb\xa4yU\xb5\xbf,)\x9dD\xa0:\x22\xc0\xbc\xc2\
-\xfc\xa2$\x95tlmm\xe9\xa1\xe7\x05J\xb9<J\
-\x04$\x02\x12\x01\xa3 \xc0\xbc\xc2\xfc\xa2$5\x22\xd9\
-\x86^\xd7\xfa\x80\x9e\xa3\x9aO/\xf6\xb2\xa2\xe7w(\
-\x8e\x1f\xe5\xa8t\x90G\x89\x80D@\x22P\x1e\x02\x8a\
-\xc5\xc4G&\x1c\xe6\x13\xe6\x17%\xa9\xa4\xc3\x05\xf6\xf6\
-\xf6\x82t\xf2\xe8\xe1\xcfL@\x9c\x94\x01D\xc6\xc0?\
-O\xd2\xc7\xc0\xa1e3\x89\x80D\xa0\x12\x11x\x12\xa5\
-C\xe9\xc3&\x15k8\xba\x84\xc3\xa2\xeb\x91\x0e\x17p\
-\x83\xe2\x8d\xb8\x5c&\x89\x80D@\x22`\x0c\x04T\x9f\
-\x8e1\x06\x93cH\x04$\x02\x12\x81\xc7!\xf0\x1f\xb0\
--\xdd\xff\x0e/\x19D\x00\x00\x00\x00IEND\xae\
-B`\x82\
-\x00\x00\x17-\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x013\x00\x00\x00j\x08\x06\x00\x00\x00\xd0\xae\xb6\xd5\
-\x00\x00\x01XiCCPICC Prof\
-ile\x00\x00(\x91m\x901K\xc3P\x14\x85O\
-j\xa4`E\xac88(dQT\xaa\x964\x0e\x8e\
-\xb5\xa0\x08\x0e\xa1*V\xb74M[1\xad\x8f$\xa2\
-\xce\x0e.\xce\xce\xd2\xc1\xfe\x01\xa1\x22\x22\xe2\xe4.\xa8\
-\xd5\x1f\xe0\xd6E\xc8\xa2%\xdeg\xaai\xd5\x0b\x97\xfb\
-\xbd\xc3\xe1\xbe\xc3\x05B\xa2\xc6\x98)\x02(\x95\x1d+\
-\xbd8/e66\xa5\xf0+DD0\x80\x11\x8ci\
-\xba\xcd\x92\xaa\xbaL\x16|\xcf\xcer\x1f \xf0y?\
-\xc5wU\x872\xd5P<\x1a\xad\x1c\xcd\xd6\x1d\xe5\xf2\
-\xfa\xaf\xbf\xa3zr\x86\xad\xd3\xfc\xa0\x9e\xd4\x99\xe5\x00\
-\xc28\xb1\xba\xe70\xce\xfb\xc4\x83\x16\x85\x22>\xe6\x5c\
-\xf0\xf9\x94s\xd6\xe7\xf3/\xcfj:E|G\xdc\xaf\
-\x17\xb5\x1c\xf1\x13q,\xdb\xa6\x17\xda\xb8d\xee\xea\xad\
-\x0c<}\xafQ^[\xa1\xd9G=\x8c\x14d(X\
-@\x02s\x88\xd3m\xfe\xf7*-\xef\x0e\x18\x0e`a\
-\x0b\x05\x14\xe1@B\x92\x14\x06\x13\x06\xf1\x12\xca\xd01\
-\x8d\x18\xb1L\xdbd$\xf8\x8d\x7f\xdf.\xd0\x8c\x0bZ\
-}H_\xd5\x03m\xbb\x01\x5cU(^#\xd0Fg\
-\xe8\xfd\x02\xdc\xe6\x99fi?\x17\x15\x5c\xd1\xce'd\
-\x9f#5\xa0\xfb\xc4\xf3\xde\xd6\x81\xf0\x04\xd0|\xf4\xbc\
-\xf7\x9a\xe75\xcf\x80\xaeg\xe0\xc6\xfd\x04\xddKb*\
-l\xe1Q\x9b\x00\x00\x00VeXIfMM\x00*\
-\x00\x00\x00\x08\x00\x01\x87i\x00\x04\x00\x00\x00\x01\x00\x00\
-\x00\x1a\x00\x00\x00\x00\x00\x03\x92\x86\x00\x07\x00\x00\x00\x12\
-\x00\x00\x00D\xa0\x02\x00\x04\x00\x00\x00\x01\x00\x00\x013\
-\xa0\x03\x00\x04\x00\x00\x00\x01\x00\x00\x00j\x00\x00\x00\x00\
-ASCII\x00\x00\x00Screensh\
-ot],1\xd0\x00\x00\x01\xd6iTXtXM\
-L:com.adobe.xmp\x00\
-\x00\x00\x00\x00<x:xmpmeta x\
-mlns:x=\x22adobe:ns\
-:meta/\x22 x:xmptk=\
-\x22XMP Core 6.0.0\x22\
->\x0a   <rdf:RDF xm\
-lns:rdf=\x22http://\
-www.w3.org/1999/\
-02/22-rdf-syntax\
--ns#\x22>\x0a      <rd\
-f:Description rd\
-f:about=\x22\x22\x0a     \
-       xmlns:exi\
-f=\x22http://ns.ado\
-be.com/exif/1.0/\
-\x22>\x0a         <exi\
-f:PixelYDimensio\
-n>106</exif:Pixe\
-lYDimension>\x0a   \
-      <exif:Pixe\
-lXDimension>307<\
-/exif:PixelXDime\
-nsion>\x0a         \
-<exif:UserCommen\
-t>Screenshot</ex\
-if:UserComment>\x0a\
-      </rdf:Desc\
-ription>\x0a   </rd\
-f:RDF>\x0a</x:xmpme\
-ta>\x0a\xc9\x10\x00'\x00\x00\x13LIDAT\
-x\x01\xed\x9d\x0b\xb4\x0d\xd5\x1f\xc77*\xbd<\x92T\
-D%\xd1K\xd1\xc3\xb2\x94\xdbK/\xbdUt{\x11\
-=\x10\xa9\xb5\x92\x16K%+E\xad\xdeoK%B\
-\xd1C\x16!)\x95\x5cEO\xca\xa5\x92n%\x0aE\
-\xa8\xf4\xf8\xf7\xd9\xff\xf6\xac9\x8f\x8bs\xce\x9cs\xe6\
-\x9c\xf9\xfe\xd6\xbaff\xcf\x9c\x99=\x9f\x19\xbf\xd9\xfb\
-\xb7\x7f\xfb\xf7\xab\xf2\xfb\xef\xbf\xffc$\x22 \x02\x22\
-P\xe0\x04\xaa\x16x\xfdU}\x11\x10\x01\x11\xb0\x04\xa4\
-\xcc\xf4\x22\x88\x80\x08\x14\x05\x01)\xb3\xa2x\x8c\xba\x09\
-\x11\x10\x01)3\xbd\x03\x22 \x02EA@\xca\xac(\
-\x1e\xa3nB\x04D@\xcaL\xef\x80\x08\x88@Q\x10\
-\x902+\x8a\xc7\xa8\x9b\x10\x01\x11\x902\xd3; \x02\
-\x22P\x14\x04\xa4\xcc\x8a\xe21\xea&D@\x04\xb2\xae\
-\xcc~\xfc\xf1GSZZj\x9a4ib>\xf9\xe4\
-\x13\x11\x17\x01\x11\x10\x81\xac\x10\xa8\x92\xcd\xe9L\xe5\xe5\
-\xe5\xe6\x94SN1\xcb\x97/\xb7\x95o\xd7\xae\x9d\x99\
-<yrVnD'\x15\x01\x11\x886\x81\xac)3\
-Zdm\xdb\xb65K\x97.\x8d!<\x7f\xfe|s\
-\xc8!\x87\xc4\x94iC\x04D@\x042%\x90\xb5n\
-\xe6u\xd7]\x97\xa0\xc8\xa8\xecSO=\x95i\x9d\xf5\
-{\x11\x10\x01\x11H \x90\x15eVVVf&L\
-\x98\x90p1\x0a\xe6\xce\x9d\x9b\xb4\x5c\x85\x22 \x02\x22\
-\x90\x09\x81\xac(\xb3\xfe\xfd\xfb{u\xaa^\xbd\xba\x19\
-:t\xa8\x991c\x86\xd9v\xdbm\xcd\xc7\x1f\x7fl\
-\xfe\xb5\xd3y\xfb\xb5\x22\x02\x22 \x02A\x10\x08\x5c\x99\
--[\xb6\xcc\xcc\x9e=\xdb\xab\xdb\xd3O?m\xe8r\
-b?c\x00\xe0\x8f?\xfe\xd0\xa8\xa6GG+\xf9&\
-\xc0\xc7\xb5[\xb7n\xf9\xae\x86\xae\x1f\x00\x81\xc0\x95\x99\
-\x7f\xb4\xb2{\xf7\xee\xa6C\x87\x0e^5\x9d\xe1\xff\xdb\
-o\xbf\xf5\xca\xb4\x22\x02\xf9$\xf0\xdbo\xbf\x99\xef\xbe\
-\xfb.\x9fU\xd0\xb5\x03\x22\x10\xb82s\xbed\xd5\xaa\
-U3\xd7_\x7f}L5\xe9f\x22\xeb\xd6\xad\x8b)\
-\xd7\x86\x08\x88\x80\x08dJ pe\xb6d\xc9\x12[\
-\xa7\xb3\xce:\xcb\xec\xb3\xcf>1\xf5s\xfb~\xfd\xf5\
-\xd7\x98rm\x88\x80\x08\x88@\xa6\x04\x02Wfk\xd7\
-\xae\xb5uj\xdd\xbauB\xdd\x16-Zd\xcb\xa4\xcc\
-\x12\xd0\xa8@\x04D C\x02\x81+\xb3?\xff\xfc\xd3\
-V\xe9\xa0\x83\x0e\x8a\xa9\x1a\x03\x03\x9f}\xf6\x99-\xab\
-Y\xb3f\xcc>m\x88\x80\x08\x88@\xa6\x04\x12f\x00\
-\xdcv\xdbm\xe6\xf5\xd7_O\xfb\xbc\x8c\x0em\xdc\xb8\
-\xd1\xb4l\xd9\xd2\xe0\x96\xe1\xe4\xeb\xaf\xbf6?\xfc\xf0\
-\x83\xddD\xd1I\xa192Z\xe6\x93\x00\xbd\x84\x8a\x8a\
-\x0as\xe0\x81\x07\xe6\xb3\x1a\xbav\x86\x04\x16/^l\
-\x12\x94\x19#\x8dk\xd6\xacI\xfb\xd4\xe7\x9e{\xae}\
-9\xdez\xeb-\xb3\xe3\x8e;\xda\xf3\xd0\xf5<\xfd\xf4\
-\xd3\xad\x92\xa3`\xfa\xf4\xe9\xa6N\x9d:i_C?\
-\x14\x81\xa0\x08|\xfa\xe9\xa7\xe6\xd1G\x1f5\x8f<\xf2\
-HP\xa7\xd4y\xf2@\xe0\xec\xb3\xcf6\xdb\xc4_w\
-\xaf\xbd\xf62\xfc\xa5+{\xee\xb9\xa7Uf\x8d\x1a5\
-2\xac#\xf8\x99\xd1ZC\x1a4h`JJJL\
-\x95*U\xec\xb6\xfe\x11\x81|\x12\xd8\xb0a\x83\xd9i\
-\xa7\x9dL\xf3\xe6\xcd\xf3Y\x0d];C\x02\xdbm\xb7\
-\x9d\x09\xdcf\xd6\xb0aC[\xad\x9f\x7f\xfe\xd9._\
-{\xed5\xfb\xe5su\xc5\xefL\x8a\xcc\xd1\xd0R\x04\
-D (\x02YSf\xbf\xfc\xf2\x8b\x9dh\xde\xa5K\
-\x17\xaf\xae(\xb1\x9e={z\xdbZ\x11\x01\x11\x10\x81\
-\xa0\x08dM\x99a\x90\xa3\x1f\xfb\xd3O?yu\xc5\
-\xf7\xacq\xe3\xc6\xde\xb6VD@\x04D (\x02\x09\
-6\xb3LO\xec\x1ce\xfb\xf4\xe9c\xb0G8\xa1U\
-v\xe3\x8d7\xbaM-E@\x04D P\x02\x81\xb7\
-\xcc\x9a6mj+\xe8Wd\x14t\xed\xda\xd5\x1cy\
-\xe4\x91\x81V^'\x13\x01\x11\x10\x01G \xa1e\xc6\
-\xc4[\x22[\xa4#\x8cX\xf6\xee\xdd;\xe1\xa7\xbb\xec\
-\xb2\x8bm\x95\xb9\xd9\x01\x09\x07\xa8@\x04\xf2D`\xfd\
-\xfa\xf5\xe6\xaf\xbf\xfe2z7\xf3\xf4\x00\x02\xba\xec\xdf\
-\x7f\xff\x9d\xe8gv\xed\xb5\xd7\x9a\x89\x13'\xa6|\x89\
-\x7f\xfe\xf9\xc7\xfa\xa7%S\x84(3\xbf\x03m\xca'\
-\xd7\x0fD K\x046m\xdad\x03\x1f\xc8\xef1K\
-\x80stZ\xc2\xf4'8\xcd\xa6sm\xben\x18\xfb\
-\xdf~\xfb\xed\x84\x9f\xf7\xeb\xd7\xcf0\xab@\x22\x02a\
-$@\xe4\xe3[n\xb9\xc5L\x9d:5\x8c\xd5S\x9d\
-\xb6\x92\xc0\x01\x07\x1c\x90\xb9\x9f\x19\x8a\xec\x9cs\xceI\
-\xaa\xc8\x8e;\xee8\xfb\xa2le}t\x98\x08\x88\x80\
-\x08\xa4M \xa3\x01\x00\xeckL_b\xeaR2i\
-\xdf\xbe\xbd!\xae\x99D\x04D@\x04\xb2M me\
-\x86\x8d\x0c\xf7\x8bY\xb3f%\xd4q\xbf\xfd\xf6\xb3e\
-.JF\xc2\x01!/X\xb8pa\xc8k\xa8\xea\x89\
-\x80\x08\xc4\x13H[\x99\x8d\x181\xc2\x10\xdf?^Z\
-\xb4ha\x15\x5c\xbdz\xf5\xbc\x90?\xf1\xc7\x84}\x9b\
-\x5c\x05J\xba\x12\xf6\xa7\xa4\xfa\x89@,\x81\xb4\x94\xd9\
-\xbcy\xf3\x12BbsZ\x14\x19\x86\xd4\xddv\xdb\xcd\
-&\xfa\xa5eF\x0bN\x22\x02\x22 \x02\xd9&\x90\xb2\
-2\xc3'\xa7G\x8f\x1e\x09\xbehD\x1d\x982e\x8a\
-\xc1\x0d\x03!y\x89\x8b\x15\x95\xed\x9b\xd0\xf9E@\x04\
-D \xc1i\xf6\xa3\x8f>2\xcb\x97/\xaf\x94\x0c\xf9\
-/]\xd2\x12w\x10a}\xfa\xf6\xedk\xde{\xef=\
-W\xe4-G\x8e\x1cYp\x9e\xff\xf8\xcaM\x9b6\xcd\
-\xe6\xf9\xf4nD+EI\xa0\xbc\xbc\xdc\xacZ\xb5\xca\
-\xbc\xfa\xea\xabEy\x7fQ\xb9)f\x1c%(3r\
-^\xbe\xfb\xee\xbb\x952 \xa4\x8f_\x98sI\x94\xce\
-W^y\xc5+\xa6\xf5\xe6\x8c\xe8w\xdey\xa7\x1d\xd1\
-$fT\xdd\xbau\xcd\xfe\xfb\xefov\xd8a\x07\xef\
-\xd80\xae\xa0\xcc\xc6\x8e\x1dk\xaaVM\xb9\xe1\x1a\xc6\
-\xdbQ\x9d\xfe%\x80\x878\x91\x8e\x09M\x85=\xb4V\
-\xadZ\xf6}$\xcc;\xe5\xa3G\x8f\x16\xa7\x02&@\
-/0%\xa7\xd9/\xbf\xfc\xd2\xc4\xc7\xf6\x1f0`\x80\
-\xb9\xf9\xe6\x9b=\x0ct5\x99\xd2TYnL\xd2\xcd\
-]y\xe5\x95f\xd8\xb0a\xa1m\xf9\x10T\x920\xdf\
-\x9a\xb5\xe0=\xd6\x82]AY\xdd\x7f\xff\xfd\xe6\xde{\
-\xef5x\x89\xfb\x85\x0f1\xb9]I\xb4#\xa7Y?\
-\x99\xc2[\xc7i6\xa1e\xb6\xb9\xdb \xc4\xb0_h\
-\x91\xddt\xd3M^\x11\xd3\xa0JKK\xed\x5c7\xaf\
-0n\x85\xe9#\x84(\xa6+;j\xd4\xa8\xd0*\xb4\
-\xb8jk\xb3\x00\x09\xd0}\xc4\x0f\x12/\x7f'\x07\x1f\
-|\xb0\xb9\xfa\xea\xab\x0d\xe1\xa8\x98\xb1r\xd9e\x97\x99\
-6m\xda\xb8\xddZ\x160\x81\x94\xfaQ.U\x9c\xbb\
-\xdf^\xbdz\x19\xc2\xd5\x22d\x85\xa6\xc5E\x17sk\
-\xe4\xa5\x97^2\xfc^\x22\x02\xd9 @\x8b\x8c\x99)\
-N\x911\x1b\x85D=\xf3\xe7\xcf\xb7\xca\x8c\xd6\xf7\xa9\
-\xa7\x9ej?\xa6\xc7\x1csL6\xaa\xa0s\xe6\x98@\
-J\xca\xcc\xdfL\xdfy\xe7\x9dM\xa7N\x9d\xbc\xea\xde\
-u\xd7]\x86\xe8\xb2~\xd9c\x8f=\xec\xe6\x85\x17^\
-h\xbf\x84.\xa4\xb6;\x06?\xb5\xb2\xb22\xb7\xa9\xa5\
-\x08\x04F\x00gn\x06\xa4\xb0\xd5>\xf0\xc0\x03\xd6\xc0\
-\x8f\xd2\xa2k\x89\xf0\xd1eN&\xf6QB\xb9K\x0a\
-\x9f@J\xca\xcc\x9f\xbc\xf7\xd8c\x8f55j\xd4\xb0\
-\x04\x08\xfdC\x97\xd1\xc9\xa1\x87\x1ej>\xf8\xe0\x03\xf3\
-\xd8c\x8f\xd9\x22\x9a\xf4\xe3\xc7\x8f\xb7N\xb4L:\xc7\
-n\xe6d\xf8\xf0\xe1nUK\x11\x08\x8c\x00\x03YM\
-\x9a4\xf1Zb\xfe\xc1\x1cz\x18\xb4\xd40w\xf0\xae\
-\xf2')|\x02))3\x7f\x17\x92QI'\x1f~\
-\xf8\xa1\xf5)c{\xdf}\xf7\xb5n\x0d\xd8&\x0e;\
-\xec0{\xc8\x82\x05\x0b\xec\x92.)Q4\x18\xe1t\
-Bw\xd3\xaf$]\xb9\x96\x22\x90\x09\x01\xece\x0cL\
-\xf1>:\xa1l\xc8\x90!\xa6U\xabV\xb6\xd5\xc6\xfb\
-x\xdf}\xf7i\xd4\xda\x01*\xf0eJ\xca\x8c\xe1l\
-'{\xef\xbd\xb7[5+V\xac\xf0\xd6\x07\x0e\x1c\xe8\
-\xe5\xc4\xc4.\x81;\x86Sf\xee\xa0k\xae\xb9\xc6\xfb\
-\x1a\x12u#\xdeo\xcd\x1d\xa7\xa5\x08\xa4K\x80\xf7\x13\
-\xfb\x18n\x18\xef\xbf\xff\xbe\xb5\xe7\x92\x7fb\xd0\xa0A\
-\xb6\x8c\xee\xe7\x981c\xcc\xd1G\x1f\x9d\xee%\xf4\xbb\
-\x90\x11H\x18\xcd\xe4\x01\xe38\x9bLx9\x9c\xbc\xf0\
-\xc2\x0b\xd6}\x81m\xdc\x18\x9c\xcc\x993\xc7\x90\xd5\xdc\
-\x09\x89\x80\x89\xaa\x11\x1f\xff\x9f\x97\xc9\xc9\xd0\xa1CM\
-\xb3f\xcd\xdcf\xde\x978\xe0\xf5\xef\xdf_\x11?\xf2\
-\xfe$\xd2\xaf\x00\x91cy\x97q\xcb\x88\x17Zk\x98\
-I\x18\xcdL\x16\x83/\xfexm\x87\x9f\xc0\xea\xd5\xab\
-\x13]3hM\xd1ZJ&|\xe5PV\x086\x08\
-\xd7\xd5\xc4v\xe6\xa2\xd3\x121\x83\xc1\x01'\x1c3s\
-\xe6L\xc3\x97\xd2\x8d|\xb2\x8f\xacM\xee\x5c$\x1dv\
-\xe7r\xbf\xcb\xe7\x92{\xc3\xde\xb2\xcd6\x09\xba>\x9f\
-\xd5\xd2\xb5S$\xc0\x94\xba\x95+W\xda\x08\xc88\xcd\
-\xf2^\xd6\xaf_\xdf\xf0\x81\x95\x14\x17\x01\xec\xf0)9\
-\xcd\xf2b\xb8\x11I\xben\x9f\x7f\xfe\xb97:t\xfc\
-\xf1\xc7\xdb\x99\x03xR_p\xc1\x05\x1e)<\xe9\xc9\
-\x9d\x89A\xd6\x9f\xd0\x04\xc3\xbfs\xcd`D\xb3e\xcb\
-\x96\xdeo\xf2\xbd\x22\xa7\xd9|?\x01]_\x04R#\
-\x90r\xa4Y\xc2\xfa\x5c|\xf1\xc5\xf6*K\x97.5\
-o\xbe\xf9\xa6wEf\x02\xd0\x92\xc1f\xe6\xb7\xa1\xb9\
-A\x007\xbd\xc9\xfd\xc0\xd9\xc9\x88\xbd\xae\xd1$GE\
-K\x11\x10\x81t\x09\xa44\x00\xc0E\x06\x0f\x1elj\
-\xd7\xaem\xafw\xc3\x0d7\x18\xa2\xcd\x22\xc4\x00\x1b7\
-n\x9cu\x9em\xdd\xba\xb5aB:B\xea\xb9\xed\xb7\
-\xdf>f\x10\x80&\xbf\x8bN{\xc5\x15W\xc86e\
-I\xe9\x1f\x11\x10\x81L\x08\xa4\xac\xcc\x88\x90\xf1\xdcs\
-\xcf\xd9V\x18\xa3\x94\x9d;w\xf6\x92\xfd\x9ey\xe6\x99\
-\xd6\x97\xec\xaa\xab\xae\xf2&\xab\xd3Z\xc3v\xe1\x1f\xd1\
-\xc40\x8b\xaf\x0fq\xcf\xc8\x06%\x11\x01\x11\x10\x81L\
-\x09\xa4d3\xf3_\x8c\x90)(2\xbc\xfe\x99|\xfe\
-\xec\xb3\xcf&LBw\xc7\xf7\xec\xd9\xd3L\x9a4\xc9\
-TTT\x18B\xae\x9cx\xe2\x89\xd6(K\xd9\x09'\
-\x9c\xe0\x0e\x0b\xcdR6\xb3\xd0<\x0aUD\x04\xb6\x8a\
-@\xca63\xffYO;\xed4;\x15\x89\xe8\xb2D\
-\x94\xa5k\xc9\x04^\xbf\xfb\x86;\x1e\x9b\x18\x83\x07\xb7\
-\xdf~\xbb)))\xb1\x09WQ~aTd\xae\xce\
-Z\x8a\x80\x08\x14\x16\x81\xb4[f\xee6\x99\x15\xf0\xe2\
-\x8b/\x9a;\xee\xb8\xc3\x8ba\x86\xab\x05\xae\x0d\x0c\x83\
-\xe3u\xfd\xc5\x17_\x18\xc2\x07!\x8cz\x12\x8e\x85\x88\
-\x1ba\x15\xb5\xcc\xc2\xfadT/\x11HN\x80\x96Y\
-\x822c\xf2\xad3\xde'\xffY\xe5\xa58\x9b\xd2\xed\
-\xc4O\x8dP?\x18\xfa\xf1\xff\xe0\x0f\xa5\x86r\xe3/\
-\xec\x82\xd30\xa3\xb0nRr\xd8\xeb\xab\xfa\x89@\xd4\
-\x09\x10\x9e,A\x99\x11g\x8ch\x9cA\x0b\x83\x03\x87\
-\x1f~\xb8\x9dN\x12\xf4\xb9\x83>\x1f\xde\xe1D\xd4\xf5\
-;\xf9\x06}\x0d\x9dO\x04D 8\x02\x04\x83MP\
-f\xc1\x9d>\xf6L8\xd2\x12\xf3ls!\xb9c\x7f\
-\x91\xbf-u3\xf3\xc7^W\x16\x81t\x09\xa4\xec\x9a\
-\x91\xee\x85\x88\xa2\xc1\x8c\x01\xa5\x9eK\x97\xa0~'\x02\
-\x22\xb09\x029\x9b|\x88\xaf\x1965\xe6d\xe2_\
-\x16\x06a\xf0\x02\x05K\x8b\x910D\xb4\xc8\x5c6\xf6\
-0\xd4Ou\x10\x01\x11\xd8z\x02\x81)3\xa2\xd0\x92\
-\xe5\x86\x91L\x97;\xd3_\x0d\x172\x88\x08\x1b\xf9V\
-f[Jr\x11\xf6\xecQ~\xaeZ\x17\x01\x11\xf8?\
-\x81\x8c\xbb\x99\x0c\x16\x5ct\xd1E\xa6Q\xa3Fv\x22\
-9\xa1\xb2\xdb\xb7oo\x15\x9b\x1f\xf2\xee\xbb\xefn7\
-\xfd\xe1\x82\xfc\xfbs\xb5\xce\xa8*\xfem\x84\xf8qa\
-\xc0\xe9\x02\x13Z\x99\xba=\xf3\xcc3\xb6\x05\x19\x1f\x02\
-<W\xf5\xd3uD@\x04\xd2#\x90\x912\xc3\xf5\x82\
-\xf8\xfe\xc46c\xdd\x09\x89#:v\xech\xdd3\x5c\
-\x19A\x1a\x91l\x8c\x94\xbakliI\x08\xa3\xadI\
-r\xc1y\xf2\xadt\xb7t/\xda/\x02\x22\x10K \
-\xa3n&\x81\xed\xdex\xe3\x8d\xd83\xfe\xb7EV\x9c\
-w\xdey\xc7:\xc9RD\xd7\x0d\xbf\xadj\xd5\xaa%\
-=>\x1b\x85\xd8\xc2\xb0\x899y\xf9\xe5\x97m\xb8d\
-&\xbew\xed\xda\xd5\xb6 \x99(\x8f\xf2EP\xc8O\
-<\xf1\x84]_\xbcx\xb1\x9d\xa9\xc0\x06\xae\x1a\xfe\xbc\
-\x05\xf6\x00\xfd#\x02\x22\x10*\x02\x19)\xb3\xf8\xec\xe6\
-\xf1w\xf6\xcd7\xdfxEt\xdb\x18\xc9\xcce\xc0\xc3\
-\xc9\x93'\xdb\x84\xc4^%\xfe[A\x81\x91\xcc\x82\xbf\
-\xca\xa4[\xb7n\xde\xae\xef\xbf\xff\xde\xec\xba\xeb\xae\xde\
-\xb6VD@\x04\xc2G #e\xb6\xa5D$\xfe\x80\
-\x8bn\xce&\x8e\xb3\xb9\x12ly\xe4Ft\x82W?\
-\xf3C\xcf8\xe3\x0cWd\xbb\xbd\xcc\x13E\xb1\x91v\
-\x8c\x16\x18v3\x7f \xc9d\x03\x1a\xde\x09\xb4\x22\x02\
-\x22\x10\x0a\x02\x19)\xb3\xcd\x05U<\xe2\x88#L\xf3\
-\xe6\xcd\xbd\x9b$\xed\x1c#\x9d\x18\xdbs%\x84I\xf6\
-\x87\xf0FAa\x0bc0\x82\xe0\x90t)\x9f\x7f\xfe\
-y/&\x1by\x09F\x8e\x1ci\x98\xad \x11\x01\x11\
-(,\x02\x19\xcd\x00\xa0e\x86\xff\x18S\xa0\xfc\xd2\xb6\
-m[\x1b\xf3\x8c\xae\x19v(&\xa1\x93/\x93\x11D\
-\xe6~\xe6K\xe6\xcd\x9bg[ek\xd6\xac\x89\xa9\x02\
-\xb6<ZpL\x80\xf7\xa7&\x8b9H\x1b\x22 \x02\
-\xa1&\x90\x912\xe3\xce\xc8\x99I\xb7\x0dgX\x94\x02\
-\x81\x19KKK\xed\xbcF\xb24\xd1\x22cy\xf2\xc9\
-'\x9b\x09\x13&\x98\xea\xd5\xab\xe7\x15\x08\xee\x18\x18\xfc\
-\xe9\xf6\xe2o\x86\x93,-1\xe7\x07\x97\xd7\xca\xe9\xe2\
-\x22 \x02i\x13\xc8X\x99qe\x14\xc4=\xf7\xdcc\
-\x08\xd8\xe8\x1f=d\x1fq\xce\xc8\x93\xd9\xa1C\x87\x9c\
-\x1a\xff\xb9\xb6D\x04D :\x04\x02Qf~\x5c\x8c\
-\xfc\x91\xec\x84.&\x8e\xb4J\xeb\xe5\xa7\xa3u\x11\x10\
-\x81l\x11\x08\x5c\x99e\xab\xa2:\xaf\x08\x88\x80\x08l\
-\x8e@F3\x006wb\xed\x13\x01\x11\x10\x81\x5c\x12\
-\x902\xcb%m]K\x04D k\x04\xa4\xcc\xb2\x86\
-V'\x16\x01\x11\xc8%\x01)\xb3\x5c\xd2\xd6\xb5D@\
-\x04\xb2F@\xca,khub\x11\x10\x81\x5c\x12\xc8\
-h:S.+\x1a\xe4\xb5\x98\x83\x89\xb3oYY\x99\
-\xcd\xe7\xd9\xb8qc\x1bA\x83\x10A\xd3\xa7O7\x97\
-_~\xb9\xa2d\x04\x09<\x04\xe7\x22\xc8\xc1\xe0\xc1\x83\
-\xcdQG\x1de\xc8\xf9*)>\x02\x91s\xcdX\xb4\
-h\x919\xef\xbc\xf3l.O\x1e'\xb3\x16x\xd1\x99\
-\xc3I6\xa6\xd5\xabW\xdb\xcc\xeb\xf5\xea\xd5K\xfa\xb4\
-\x99\xe10u\xeaT\xb3l\xd92\xa5\xa2KJ(\x9c\
-\x85\x84\xaab\xca\x1a3>\x16.\x5c\xb8U\xcf\x0e\x07\
-p\xc2?\x0d\x1a4\xc8\xf4\xe8\xd1#\x9c7\xa6Zy\
-\x04\x22\xd5\xcd$\xbe\x1a\xf3FIJL\x90F\x12\x13\
-\xaf]\xbb\xd6L\x9c8\xd1\xb6\xc4Pd\xc8\xbau\xeb\
-<@\xfe\x15&\xa53\x11\x9d\x00\x93(AI\xe1\x10\
-\x181b\x84\xad,\xcf|\xe6\xcc\x99[\xac8\xad\xf4\
-K/\xbd\xd4\xe6\x81\xddRt\x98-\x9eL\x07\xe4\x84\
-@d\x94\x19]\xcb\xee\xdd\xbb[\xe5\xd5\xaaU+3\
-z\xf4h\x1b\xc5\x83\xd6\x18_lb\x9f\xb9<\x99\xc9\
-\x94\x19-\xb1^\xbdz\xd9\x87\x92\xef\xf9\xa59y3\
-\x8a\xe8\x22\xcc\x1b\xe6\x83\xe5\xe4\xf1\xc7\x1fw\xab\x95.\
-\x09\x8a@bYD\xcf\xbbRL\xa1\xda\x11\x19e\xc6\
-\x84\xf7%K\x96X\xf8\x04^\x8c\x8f\x1cK\xc8\xa2N\
-\x9d:\xd9\xfd\xb4\xd6\xfcB\x16\xa7\xce\x9d;\xdb\xaf4\
-\xe5U\xabF\x06\x9b\x1fC\xc1\xae\x13\xaf\x8e\x8f\x99\x13\
->\x5c\xf1\x91^\xdc>\x96\xd3\xa6M3\x0f?\xfc\xb0\
-W\xa4\xe7\xed\xa1\x08\xf5Jd\xfeW\xba\xd0\xd8<\x0d\
-\x7f\xc0F\xff\xd3!\xdaG2\x192d\x88\x993g\
-\x8e\xa9_\xbf~\xb2\xdd*\x0b9\x81'\x9f|\xd2\xd4\
-\xa9S\xc7\x0c\x1f>\xdc\xd6\x94h)\x94%\x93\x95+\
-W\x1a>v5k\xd64\xc4\xb7\x93\x14\x0e\x81\xc8(\
-3\x17\xcd\x03[We\xa9\xee0\xf6bW+))\
-\xf1\x9e\xe0\xec\xd9\xb3m<\xb6\x16-Z\x18\x94\x9a\xa4\
-\xb0\x08\xf0\xfc\x18\xf4\xe1CE\xcb\xdb\x85?\xc7\x86F\
-\x8b\xdb/\x0c\x04\xa1\xc8\x88\x02C\xe4a\x85\x85\xf2\xd3\
-\x09\xffzd\x94\x19\xd1<\x10\xbe\xb6\x95%U!?\
-\x01C\xf7N0\xf4w\xe9\xd2\xc5\x90\x00e\xd4\xa8Q\
-\xb2\x9d80\x05\xb4t-0\x12\xd8`\xfb\xba\xe4\x92\
-Kl\xedIv3e\xca\x94\x98;y\xe8\xa1\x87<\
-\xd7\x9c\xf3\xcf??f\x9f6\xc2O 2\xca\xcc\xb9\
-Z\xac_\xbf>&\x05^\xfc#\xda\xb8q\xa3W\x84\
-\xc1\x9f\xa4,\xc4jk\xda\xb4\xa9W\xae\x95\xc2 \xc0\
-\xc7\x884\x88\x08\xcf\x10\x85FK\xcd\x89\x7f \x80\x00\
-\xa2\x03\x06\x0c0\xcd\x9a5\xb3\xc7\xbac\xb4,\x1c\x02\
-\x91q\x9a\xc51\x96\xaf1]\x092\xaf7l\xd80\
-\xe1)\xa1\xc8\xb0\x8b\xf5\xe9\xd3\xc7\x9ct\xd2If\xfc\
-\xf8\xf1\xf6\x18R\xea\xf1\xe7\xb2Mm\xd8\xb0\xc1vG\
-\xd8I\xf2`\xd9V\x12P\x86\xa2`\xdc\xb8q\x86g\
-J\xce\x07\xcc\x07Nj\xd4\xa8a\xddof\xcc\x98a\
-c\xef\x11*\xbd_\xbf~\x06w\x0cF\xb4{\xf7\xee\
-m\x0f\xe5}A\xc6\x8e\x1dk\x9d\xac\xdb\xb5kg\xbb\
-\xab\xb6P\xff\x84\x8e@d\x94\x19\x91nQH\x08\xc3\
-\xf4\xce\xcd\xc2\xffD\xf0\xfeGQ\x91Aj\xd3\xa6M\
-\x9em\x8d\xd1-\xc4e@g\x9f+c]\x12N\x02\
-\xd8\xc5\xe8Z\x92\xbc\xa6v\xed\xda^%\x19\xdd\xa4\x95\
-\xc6\x87\x8dA\x01l\xa1$\xdaY\xb0`\x81\xfd\xd0\xf1\
-\xb1C\x5cV{ln\xb8\xe64h\xd0\xc0;\x87V\
-\xc2G 23\x00\xf0\x1d\xe3\x85]\xb1b\x85\xf5\x02\
-G\xb19c0\x8f\x85\xfddoZ\xb5j\x95\xfdZ\
-\xf3\xf5\x8e\x17\xba,\xa4\xaf\xabU\xab\x96\x9d\x06\x15\xbf\
-_\xdb\xe1!\xc0\x07\xabc\xc7\x8e\x86\xd6\x14\xae\x18~\
-!o*\xad1\x9c\xa4\xeb\xd6\xadk\xca\xcb\xcbc\xb2\
-x\xb9c\x19\xf4a\xe0\xe8\xee\xbb\xef\xf6Zkn\x9f\
-\x96\xe1#Pm\xe0\xc0\x81\xb7\x86\xafZ\xc1\xd7\x88/\
-4\xde\xfft=\x18~\xe7eG)\xe1\xdd=k\xd6\
-,\xeb\xed\xfd\xf5\xbfi\xe8H?\x87\xcfY\xbcL\x9a\
-4\xc9z\xff\xe3\xabFk\x8c\xc1\x02FF\x09\x0d.\
-\x09\x17\x01r\xa3\xdez\xeb\xad\xb6\x95\x8d\xdd\x8c\xee#\
-\xca\x8b\xe7\xfd\xd5W_Y;\xda\xdc\xb9s\xed\x07\x8c\
-\x968\xce\xb1(5L\x11\x08]R>\x5c<s\x9e\
-5\xc7\xa0\x00\xf9\x18\xc6\xfb'\x86\xeb\xce\xa3]\x9b\xc8\
-\xb4\xcc\xdcc\xe6e\xee\xdb\xb7\xaf!\x1b;/\xb9\x13\
-lh\xc3\x86\x0d\xb3\x89W\x5c\x99[\xd2\xedH6L\
-\xcf<\xcd\x07\x1f|\xd0\x1d\xa6eH\x08\x90\xcf\x95\xd6\
-\x96_\x98\x9b\xd9\xa6M\x1b\xfb\xdc\xfdI\xa0\xdd1\xcc\
-\xd7\x1d3f\x8c\xddd \x80\xd6X\xbcTTT\x18\
-7\x90\x14\xbfO\xdb\xf9'\x109e\xe6\x90\xe38\xc9\
-\x0bO\xb7\x92\xc9\xc7\xb2\x8782Z\x8a@a\x12\x88\
-\xac2+\xcc\xc7\xa5Z\x8b\x80\x08TF 2~f\
-\x95\x01P\xb9\x08\x88@q\x10\x902+\x8e\xe7\xa8\xbb\
-\x10\x81\xc8\x13\x902\x8b\xfc+ \x00\x22P\x1c\x04\xa4\
-\xcc\x8a\xe39\xea.D \xf2\x04\xa4\xcc\x22\xff\x0a\x08\
-\x80\x08\x14\x07\x01)\xb3\xe2x\x8e\xba\x0b\x11\x88<\x01\
-)\xb3\xc8\xbf\x02\x02 \x02\xc5A@\xca\xac8\x9e\xa3\
-\xeeB\x04\x22O@\xca,\xf2\xaf\x80\x00\x88@q\x10\
-\x902+\x8e\xe7\xa8\xbb\x10\x81\xc8\x13\x902\x8b\xfc+\
- \x00\x22P\x1c\x04\xfe\x07Q:^\xf5\xde\x14\x89\xbd\
-\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00`\xe0\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\xe8\x00\x00\x01/\x08\x06\x00\x00\x00\x8e\xbdR\x00\
-\x00\x00\x00\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\
-\x01\xc7o\xa8d\x00\x00\x00\x19tEXtSof\
-tware\x00www.inksca\
-pe.org\x9b\xee<\x1a\x00\x00 \x00ID\
-ATx\xda\xec\xddwx\x14\xd5\xfe\x06\xf0wfk\
-6\x9d\x16BH\x08\x1d\xe9\xbd\x89R,\xd7r\xbd\x80\
-\x0dP\x9a(\xc6\x8b\xa2\xa0  \x08\x88\xca\xb5\x22\x88\
-HSDED\x11A\xe9=tH\x80PCI \
-\x84\x04\x92@\x02Iv\x93\xed3\xbf?\x86lXC\
-\xd3kv'\xf7\xf7~\x9e'\x8ffw\x91w\xce\x9e\
-9\xdf9g\xce\xaeB~~\xbe\x0c\x22\x22\x22R\x15\
-\x91M@DD\xc4\x02MDDD,\xd0DDD\
-,\xd0DDD\xf47\xd1\xfa\xf3/o\xdf\xbe\xfdM\
-\x9fKHHPu\xc3U\xd4\xecls\xe6fv\xf6\
-\x17f\xaf\x18\xb9\xb5\xfen\x98\xb9s\xe7\x96y,.\
-.\xaeB\x5c\xddT\xd4\xecls\xe6fv\xe6fv\
-\xf5\xe7\xe6\x127\x11\x11\x91\x0a\xb1@\x13\x11\x11\xb1@\
-\x13\x11\x11\x11\x0b4\x11\x11\x11\x0b4\x11\x11\x11\xb1@\
-\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b4\x11\x11\x11\x0b4\
-\x11\x11\x11\xb1@\x13\x11\x11\x11\x0b4\x11\x11\x11\x0b4\
-\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b4\
-\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11\x11\x0b4\
-\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\
-\x11\x11\x91o\x08\xf9\xf9\xf9\xb2\xaf\xfe\xb2\xa4\xa4\xa4\xbf\
-\xfcg[\xb5j\xe5\xd7\x86\xaa5=\xf4/\xff\xd9\xf4\
-\x11\x05\xcc\xcd6g\x9b3;\xdb\x9cm\xce\x194\x11\
-\x11QE\xa7\xf5\xc7_\xda\xad[\xb7;~m||\
-\xbc\xaa\x1a,\x7f\xd2\x9d\xbf6\xec\x1d\xe6f\x9b\xb3\xcd\
-\x99\x9dm\xce6\xe7\x0c\x9a\x88\x88\xe8\x7f\x06\x0b4\x11\
-\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11UP~\xd9\
-$\xa6\xb6\x8d_\x7f\x86\xda6g\xfc\xaf\xe7f\x9b3\
-;\xfb\x0b\xb3\xff\x7f\xcd\xcd\x194\x11\x11\x91\x0a\xf9\xf4\
-\x8bJ\xfe\xa8}\xfb\xf6\x98;wn\x99\xc7\xe3\xe2\xe2\
-\x90\x90\x90\xa0\xea\x86\xab\xa8\xd9\xd9\xe6\xcc\xcd\xec\xec/\
-\xcc^1rs\x06MDD\xa4B,\xd0DDD\
-,\xd0DDD\xc4\x02MDD\xc4\x02MDDD\
-,\xd0DDD,\xd0DDD\xc4\x02MDD\xc4\
-\x02MDDD,\xd0DDD\xc4\x02MDD\xc4\
-\x02MDDD,\xd0DDD,\xd0DDD\xc4\
-\x02MDD\xc4\x02MDDD,\xd0DDD\xc4\
-\x02MDD\xc4\x02MDDD,\xd0DDD,\
-\xd0DDD\xe4\x1bZ\x7f\x07\x88\x8b\x8b\xab\xb0\x8dW\
-Q\xb3\xb3\xcd\x99\x9b\xd9\x99\x9b\xd9\xd5\x9f[\xc8\xcf\xcf\
-\x97y\x9dBDD\xa4.\x5c\xe2\xa6\x0a\xc1-\x01\xd9\
-\x85\x22r-\x02\x1b\x83\x88\xfe_\xf0\xcb\x12\xb7\xd3\x0d\
-\xecN\xd3\xe2b\x81\x88\xf0\x00\x09\x1db\xdd\x087y\
-O\xe4\xb3\x0b\x05\x9c\xbb\xa2\xc1]\x11n\x84\x06\xa8k\
-\x92\x9f\x96'b\xffy\x0d\x04\x01h\x14!\xa1i\xa4\
-\xbb\xcckl.\x01{\xd34h\x1e\xe5F%\x93\xff\
-\xf3\x9f\xc8\xd1\xe0\xc8\x05\x11\x06-\xd0$\xd2\x8d\xfaU\
-%\xaf\xe7\x0bm\x02\x8egi\x10b\x94\xd1\xb8\xba\x1b\
-\x82J\xea\xa0,\x03\xf3w\xeb\xf1\xc9\x16#.\x99\x95\
-P\xd5C$L~\xc4\x8e\xbe\xad\x1d\x00\x803\xb9\x22\
-^\xfb%\x00\x89\xe7\xb5\x88\x08\x960\xf51\x1b\xfe\xd9\
-\xd4\xe9\xd7\xdc\x856\x01\xbb\xcej\x91o\x15P#T\
-B\xe7\xda.\xe84e_w\xa5X\xc0\x91\x0b\x1a\xb4\
-\x89q#\xd8\xa0\x9e~\x9e](`_\xba\x16V\x07\
-P\xa7\x8a\x84v1\xde}\x22\xbbP\x80\xcdU\xfa@\
-\xa0^F\xd5 \xf5\xe4?\x91\xa3\xc1\xd1\x0b\x22t\x1a\
-\xa5\xbf7\xa8\xe6\xdd\xdf%\x19H\xb9$\xa2\xc0&\xa0\
-UM\xf7\x0d\xdf\x1b_\x8f\x89\xbb\xcej\x91U\xa8\x8c\
-\x89\x9dj\x97\x8e{\x16\xbb\x80\xdc\xa2\xb2'd\xf5\x10\
-\x19F\xad\xff\xdb\xdc-)\xe3yf\xbe\x88p\x93\x8c\
-\xb6\xd1.T\xf9C_H\xbf\x22\x22#_D\xdd*\
-\x12\x22C$\xd5\xf4\x13I\x06\x12\xd2\xb58wED\
-X\x80\x8cV5]\x88\x08\xf6\xce\x9e\x99/\x223_\
-@\x93H\xc9\xe7\xe7\xa8\xcf\x97\xb8\x8f^\xd4`\xd0\x22\
-\x13\xce\xe6\x8a^'\xf7\xe7OZ\xf1DKeP]\
-r@\x87\xe1\xbf\x98\xe0t\x03!F\x19\x8b\x07\x17\xa3\
-K\x1d\x97\xdf\xdfL\xa7\x1bxcy\x00\xbeK\xd0{\
-=\xfepc'\x16\xf6/\x86\xe1\xba\xcb\x9d\xf1+\x8d\
-\x98\xb5\xc3\x80\xa5C\x8a\xf0@#\xffe\xb7\xd8\x05\xbc\
-\xf4S\x00V\x1d\xd3\x95\xbe\xe9\x020\xa0\x9d\x03\xd3\x9f\
-\xb0B\x14\x80\x0d'\xb5\x18\xf2\x83\x09\x16\xbb2\x08t\
-\xae\xed\xc2\xafC\x8bUq\xf2\x7f\xb9\xc3\x80\xb7V\x1a\
-\xd1\x22\xca\x8d\xfe\xed\x1c\x90d`\xe66\x03.\x14\x88\
-X\x15W\x84\xbb\xeb\xb8\xf0\xccB\x13\x12\xcfk1\xf9\
-\x11\x1b\xbe\xdd\xa7\xc7\xe1\x0b\x1a\x1c{\xab\xd0o\x05\xe3\
-\xe7\x83:\x8c\xfc5\x00E\x8e\xd2A5:\x5c\xc2/\
-C\x8a\xd00B\xf2\xba\xf8\xe8\xf3M 6\x9c\xd4b\
-\xcbp\x0bZG\xbbU1h}\xbc\xd9\x80\x0f7\x1a\
-\xe1\xban\x1cmU\xd3\x8d_\x9e/B\xe5@\xa5M\
-;~\x1a\x84\x939\xa5U\xadOk'\xe6\xf6-\xf6\
-{\xf6\x22\x87\x80\x97\x96\x04`\xe5\x1f\xfa\xfb\xb3m\x1d\
-\xf8\xfcI\xa5\xbf\xe7[\x05\x0c\xf8\xce\x84\x1dg\x94\x13\
-\xb6I\xa4\x1bk\xff]\x84\x10\xa3\x7f\xfaKR\xa6\x06\
-\x83\x17\x99\x90~\xa5tL\x0c2\xc8\xf8\xf2i+\xfe\
-\xd5\xcc\x89\x1f\xf6\xeb\xf1\xf2\xcf\x01e\xfe\xdc\xca\xb8\x22\
-\xdcS\xd7\xbf\xe3\xe2\xc9\x1c\x11\x03\xbf\x0f\xc4\xe9K\xa5\
-\xd9\x03t2>\xe9m\xc3\xb3m\x95\x0b\xe8\xf7\xd7\x1b\
-\xf1\xc9\x16\x03d\x19\xd0\x8a\xc0\xfb\x8fY\x11w\xb7C\
-\x15\x13\xad\x81\xdf\x9bp\xf4bi?6h\x81w\x1f\
-\xb5\xe2\xc5k\xf9>\xd8h\xc0G\x9b\x8c\x90d ,\
-@\xc6\xc2\xfe\xc5\xe8V\xdfwm\xee\xd3%n\x8b]\
-@\x9foL\xb8d\x160\xebi+\x0e\x8d5c\xd9\
-\xf3E\x084\x00//5\xe1J\xb1rU>zE\
-\x00Z\xd6tc\xcf\x1b\x16\x04\xeae\x8cZnT\xc5\
-\xc0\xf5\xd1&#\xbeK\xd0\xe3\x89\x96N\xec\x1ci\xc1\
-\xfe\xd1f<\xde\xc2\x89\xb5\xc9:|\xb9\xc3\x00\x00\xc8\
-\xb8*b\xc0w&\xcc\xba\xf6\xbb\xbf\xbd\xf9\x9b\x11\xab\
-\x8e\xe9\x10w\xb7\x03{\xdf0c\xf7\xeb\x16t\xad\xe7\
-\xc2w\x09z,MR\x06\xb1\xb1\xbf\x07\xa0Z\xb0\x8c\
-\xfd\xa3\xcdx\xff1\x1bv\xa7i\xb1\xe4\x80\xce\xef\xd9\
-mN\xe0\xa3M\x06\xc4\x84KX?\xcc\x82\xa1\x9d\x1d\
-\x88\xbb\xdb\x81%\xcf\x15\xe3\xb9\x0e\x0e\xcf\x8c\xee\x85\xce\
-\x0e|\xf5L1\x9em\xeb@\x8f\x06N\xd8]@^\
-\x91\x7f\x96\x00\x0edh0\xecg\x13\xa2\xc2d,\x1f\
-Z\x84\xa3\xe3\xcc\xf8\xa8\xa7\x15\x17\x0bD\xbc\xbc\xd4\xe4\
-\xf5\xda\xef\x12\xf4\xd8pR\x0b5\xf9\xe9\xa0\x0e\xef\xaf\
-7\xa2C\xac\x0b\x1b_\xb6\xe0\xf0X3^\xb9\xd7\x8e\
-\xa4L\x0d\xde^m\xf4\xac\x0e\xa5^\xd6\xe0\x91\xc6N\
-L\x7f\xc2\x8a\xe9OX\xd1\xbf\x9dC\x15\xf9\xc7\xfcf\
-\xc4\xcac:\xbcx]\x7f\xefV\xcf\x85E\x89z\xfc\
-\x9c\xa4\xf7\x14\x8c\x9dg\xb5\xf8yH\x11\xe6\xf4)\xc6\
-\x99\x5c\x0d\xd6\x1c\xf7\xcf\xfbP`\x15\xd0oa \xae\
-\x16\x0b\x98\xd3\xd7\x8a\xc3c\xcd\xf8yH\x11\x8c: \
-nI\x00\x0a\xac\x02\xda\xd7ry\xday\xfa\x13VT\
-\x0f\x91qW\x84\x1b-k\xfa\xf7\x82\xce\xe6R\xb2g\
-\xe6\x0b\x98\xfe\x842\x9e\xff\xf6b\x11\xc2M2^\xfb\
-%\x00\xd9\x85\x22\x8a\x1c\x02>\xddb\xc0\x13-\x9cH\
-\x7f\xa7\x10\xdd\x1b\xb8\xf0\xde:#d?_\xfb\xbb$\
-\xe0\x99\x85&\x9c\xba\xa4\xc1\x07\xff\xb2\xe1\xe0\x9bf\xac\
-~\xa9\x085B%\x8c\xf9=\x00grE\x9c\xcc\x11\
-\xf1\xe1&#\x9e\xef\xe4\xc0\xde7,\x08\x0b\x90\xf1\xe2\
-\x12e\xe2\xe8+>\xed\x95+\x8e\xe8p\xb1@\xc4\x94\
-GK\xaf\xaeb+IX4\xb0\x08\x16\xbb\x00\xa3\x16\
-8\x99-\xc2l\x17\xf0@C'\xee\x8ap\xa3{\x03\
-\x17\x16\xef\xd7\xa3\xd0&\xf8\xed\x0a\x17\x00\x1c.e\xa9\
-5\xb6\x92\x849}\x8a=Kb3\x9f\xb2\xe2\xa1\xbb\
-\x9chWKy\xd7~<\xa0\xc3\xc1\x0c\x0d\x9e\xeb\xe8\
-\xc07{\xf5~\xed\x84\xb9\x16\x01?\x1f\xd4\xa3C\xac\
-\x1b\x1f\xf6\xb4z\x1e\x9f\xdb\xb7\x18{\xd2\xb4h_\xcb\
-\x0dI\x06\xde\xfb\xa7\x0d\xa1F\x19\xf5\xaaJ\xb0\xd8]\
-\x9e\x99\x88\xbf\x1d\xcf\xd6 \xdf*\xe0\xa9VN\x18\xaf\
-\xbb^h\x1a\xe9\xc6\xb4\xc7K\x8f\xa7G\x03%\xf3\xb8\
-\xdf\x8dX\xb8O\x8fW\xbb\xda\xd1(\xc2?\xcbh\xf3\
-v\x19\xe0\x92\x80\xf9\xfd\x8a\xd1\x22J\xe9\x13/\xde\xed\
-@\xcdp\x19\x95M\x92\xd7\x92\xdf\xf8UF\xb4\xac\xe9\
-\xc6\xa1L\x0d\xd4\xe2\xcb\x1d\x06\x98\xf42\xbe\x1bP\xec\
-\x99-\xbf\xfb\xa8\x0d\xcdk\xb8\xd1$R\xc9\x9f\x9c%\
-\xc2%\x01\xcd\xa2$\x98t2\xda\xc7\xba\x11[\xc9\xff\
-\xcb\x96yE\x02~:\xa8G\xfbZn|t]\x7f\
-\x9f\xd3\xb7\x18\xbb\xcfj\xd1!Vy?\xb6\x9c\xd6\xa2\
-Y\xa4\x1b\xadk\xba\x91[$\xe0\xc2\xbb\x05\xd0\xf8i\
-7\xce\xb2\xc3:d\x17\x0a\xf8\xe0_6\xcf-\x9bZ\
-\xd7\xc6D\xabS\x80^\x0b\xd4\xaf*\xa1~U\xe5\xb9\
-\x1f\xf6\xeb\x91k\x11\xf0\xcb\xf3V\xbf\xdf\x12Ys\x5c\
-\x8b\xb4<\x11c\x1f\xb0ap\x87\xeb\xc7\xf3b\x5c)\
-\x16\x10d\x90!\x0a\x80A+#4@F\x88QF\
-\x90A\xf6:\x97\xfde\xebi-N\xe4h0\xec\x1e\
-;^\xeab\x07\xa0\xdc\xca\xf9~`12\xaf\x0a\xa8\
-\x12(c\xd3)-d\x19x\xac\xa9\x13\x8d\x22\xdc\xe8\
-\xd9\xdc\x89\x19\xf1\x06\x9c\xcc\xd1\xa0Y\x0d\xdfTi\x9f\
-\x16\xe8cY\xca@\xd41V\x19P/[\x94\xfb\x9e\
-\x00<KO\xd9f\xe5L)\x19\x1cJ\xee\xdff\x17\
-\xfa\xb7@g\xe6\x8b\xc8\xb7\x0ax\xa0Q\xe9\xbd\xc4=\
-iZ\xd8]@\xb5`\x19\x97-\x02jW\x06\x9en\
-\xed\xc4k\xdd\xecX~X\xe7\xf7\x02}\xf2\x92\x06.\
-\x09\xe8P\xcb\xe5YR\xdd\x96\xaa\xbc\xe5a\x012r\
-\x8b\x04\xd4\x08\x05\x1ei\xec\xf4\x5c\x84\xbc\xb7\xde\x08\x9d\
-\x06x\xb0\x91\xd3\xef'\x91\xd9&x\x96\xfbJ\xf2\x87\
-\x8f\x09\xf5<\xdf\xad\xbe\x0b+\x86\x16y~\xb7\xbb\x04\
-D\x86\xca\xd8~F\x8b\xecB\x01\xd5C|\xdf_\x8e\
-\x5c\x10a\xd2\xcbh~\xed\x04>}I\xc4\xc5\x02\x11\
-&\x9d\x0c\xabS\x80\xd5)\xc0\xa0\x95\xf1\xef\x9f\x02\xd0\
-\x22\xca\x8d>\xad\x9dx\xf5\x97\x00U\x14gI\x06\x92\
-\xb35h\x1a\xe9\xf6\x9c\x7f\x872\x95\x8b\xa4j\xc1\xb2\
-\xe7>h\xc9\x92\xe0\xa7\x9b\x0d\xd0\x88\xca\x12\xf2\xc2\xfe\
-\xc5x\xe8.\xff\xf6\x99S\x974p\xba\x81\x0e\xb1e\
-\xfb{\xb8I9Gk\x84\x02\x17\x0b\x04\x84\x06\x00M\
-\xff\x13\x02\x9b\x13h_\xcb\x8d\xe5C\x8b\x10\xa8\xf7}\
-\x7f9v\xd1{L\xcc1\x0b8\x91\xad<&\x5c\x9b\
-a\x07\xe8d\xcf\x8a\xd2\x94\xb5F\xf4k\xe3\xb8\xe1\xbe\
-\x17\x9fg\xbf6vw\xaa\xed\xf6\x5c \x95\xf4\x0d\xad\
-\x08\x5c-\x16\x10\x1d.a\xe6SV\xbc\xf8\xa3\x09K\
-\x0e\xe8`w\x09\xf8aP\x91\xdf\xf7\xb8\xfc1{\x81\
-U@\xd2\xb5\x0be\xa3N\xd9\x1b\x12\x15&_\xebW\
-\x22\xee\xad\x07\x9c\xcbSj\xd3\xc5\x02\x01\xcdj\xfc\x0f\
-\xce\xa0%\xb9\xe4\x9f\xca\xbb\xb3;M\x8bA\xdf\x97.\
-\xfb}\xda\xdb\x8aj\xd7n\xd0\x97\x14\xc1\x92+[\x97\
-$\xf8}\xf0\xba\xfe\x9f\x00\xf0\xdc\x0f&d\x17*\xb9\
-\x1aEH\xd8\xfb\x86Y\x153\x09Of\xa9l\xf6^\
-\xf3\x03\xbdf\x9e\xbf\xbe\xa0\x148\xa7[9\x9eM\xa7\
-\xb4x\xef\x9f\xb62\x9b\xc8\xfc!\xb6\xb2\x92\xe1d\x8e\
-\xd2\x09\x04\x01\x98\xfc\x88\x0d\x92\x04LYW\xf6\xb6\xc7\
-\xb4\xc7\xad8\x99\xa3A\xc7O\x830o\xb7\x01\x13\x1f\
-\xb2\xf9<\xb3|]\xff\x06\x80\xb9\xbb\x0c\xf8zO\xe9\
-\x85\xda\xfe\xd1f\xac;\xa1\xc7\xa1\x0b\x1a\xec\x1ca\xc1\
-\xae4\xf5,q\xcb\xb2\xf2\xe3\xbe\xee\xad\x1f\xbf\xca\x88\
-]g\xb5\x9eA7\xf7\x83\x02\xb4\xac\xe9\xc6\xa4\x87m\
-\xe8\xdf\xce\x01\xad\x08t\x9e\x16\x84\x89\xab\x8d~/\xd0\
-\x9e~.\x95\xbe\x17\xd7\xf7\xf7\xee\xf5]X\xf6B\x11\
-\x9cn\x01\xf9V\x01;F\x98\x91W$\xe2\xe1\xd9\x81\
-\x98\xbdC\x8fQ\xf7\xd9\xfd\x96\xd9}\xed\x9f\xdbS\xb5\
-\x18\xfac\xe9\x988\xf3)+\x06\x5c\xbb}\xb0\xf4\x90\
-\x1e9f\x01\xaf\xdckW\xd5\xf8R\xd2_\x0edh\
-\xf0\xf4\x82\xd2\xf6~\xef\x9f6\xbc\xd0\xc9\x8e\x8f7\x1b\
-Q\xaf\xaa\x84\x81\xed\x1d\xf8j\xb7\x1e\xef\xac5\xa2{\
-}\x0b\xf4Z\xff\xf7\x95\x92\xec'rD\xaf\xbe2\xe6\
-\x01;\xc6\xdeo\xc3?\xeer\xe1\xad\x95\x01\xf8j\x8f\
-\x01\x99W\x85k\xfd\xcaw\xb5\xc8\xa7\x0b;M\xaa+\
-W+\xfb\xce)\xd5\xb7k=\x17\xe2_\xb5x\x0d\xa4\
-U\x83\x94\x16\xbbR,x\xae\xca\x00 \x22\xd8\xbf\x05\
-#:\x5c\xd9\xc1\xb7\xff\xbc\xc6s\x0fb\xd9\xf3E\x88\
-\x7fU\xb97\xa1F\x8d\x22\xdc\xd0\x88\xc0\xbet\xadg\
-\x95\x22\xfeU\x0b6\xbcl\xf1z\x9dK\x02\x86\xfc`\
-\xc2\xea\xe3:Lz\xd8\xa6\x9a\x01 \xb6\x92\x84v\xb5\
-\xdcX\x7fB\x87\x8d\xd7\xee\xd5\x8e\xe8f\xf7\xda\x18\xe3\
-\x96\x80\x9e\xf3\x02\xf1\xd6J\xe3\xb5Y4<\xb3\x0f\x7f\
-h\x12)\xc1\xe6\x04\x0e]P\xfa\xf8\xc8\xeev\xc4\xbf\
-j\xf1\xdaU>k\xbb\x1e\xb2\x0c<\xfeU \xdeY\
-\xab\xe4~\xf6[\x13\xf6\x9e\xf3o\xb1\xd6\x88@\xc3\x08\
-7R.\x8b\x9e\xf3n\xc6\x13V\xc4\xbfj\xf1Z\xd2\
-k\x11\xe5\xc6\x88nvT\x0d\x92\x11n\x92\xd1\xa2\xa6\
-\x84\xb4<\xd1\xef\xf7\x15\x1bV\xbbq\x7f\xdf\xf4Ji\
-\x7f\x17\x05e\x8c\x89\x09\x97P\xbf\xaa\x84\x8e\xb1.\x84\
-\x1ae\x1c\xcf\xd6\xf8\xa9\xbf(\xed\x9ap-\xf3\xfd\x0d\
-\x951q\xdc\x03e/.W\x1c\xd1\xa1qu\xb7\xd7\
-FC\x7f\xfac\xf6\x8e\xb1n\xc4\xbfj\xc1\x7f\xfeU\
-\x9a}\xd7Y-N\xe5(\xcb\xe0\xaf\xdck\xc7\x9b\xf7\
-\xdb\x91\x9c\xad\xc1\x1e?\xf7\xf5?\xd6\xa2f5$\xc4\
-\xbfj\xc1\x8c'Jo\x8d\x08\x02\xb0xP\x11\xbe\x1d\
-P\x8c\xd1\xf7\xd90\xa2\xbb2.\xd6\x08\xf5]\xfb\xfb\
-\xb4@\xf7j\xeeD\xb5`\x19\xd3\xb6\x1a\xb0\xf2\x98\x0e\
-:\x8d2S.9\xa1\x00\xe5~\x8bF\x04\x12\xd35\
-pK\xca\x12[\xf5\x10\xc9\xef\x1fU2h\x81A\x1d\
-\x1cH\xbf\x22b\xe4\xaf\xca\x06\x88\x88`\x09\x0724\
-(v\xaa\xf3\xb3\xb9\xd5\x82e\xf4l\xe6Db\xba\x06\
-\xef\xac5\x22\xafH@D\x88\x8c\x9dg\xbcO\x8e\xff\
-lP6\xd6<\xde\xc2\x89\xee\xf5]8\x94\xa9AV\
-\xa1:>\x22\xff\xf9\x93VT\x0d\x92\xf1\xf47\x81\xe8\
-\xf8i\x10\xda~\x1c\x8c\x07\xbf\x0c\x82 (\xcb\x82\x1a\
-\x11\xa8\x19&a\xceN\x03\xfa.\x0cD\xdfoL\x08\
-\xd4\xcbx\xa6\xad\x7f6-\xbd\xd0\xc9\x01Q\x00^Y\
-\x1a\x80C\x99\x1a\x84\x9bd\x5c\xb5\x0a^;\x9e\x9fj\
-\xe5D\x9f\xd6Nt\xab\xefB\xc3j\xca@\xd1&\xc6\
-\x8d\xb0\x00\xff\x0f\xbc/vv\xc0\xea\x14\xf0\xe2\x12\x13\
-\xce\xe4\x8a\xa8\x16,\xe3l\x9e\xb2L_b\xec\xef\x01\
-\x88\x9c\x10\x8a\xf4+\xca&\xa0\xa3\x17DU|4\xaf\
-j\x90\x8c\xde\xcd\x9d\xd8\x7f^\xe9\xef\xb9\x16\xe56\xc7\
-\x8e?\xf4\xf7\x16Qn\xa4_\x11\x91zY\xc4\xb9+\
-\x22\x0am\x02b\xc2\xfd\xd3\xf6O\xb4t\xa2r\xa0\x8c\
-\x8f6\x19\xb0&Y\x07\xbdV\xb9PJ<\xef\x9d\xd9\
-\xe1R\x8a\xdd\xddu\xdc\xaa\x19_\x1em\xe2BT\xa8\
-\x84\x99\xdb\xf4\xf8\xf5\xb0\x0e\xa2\xa0,\x0f\xefI+\xed\
-\xeba\xd7\xc6\xed\x92\xfe\x9fr\xd9\xfb\x16\xa6\xbf\xf4h\
-\xe0B\xdd*\x12\xbe\xd9g\xc0\x8f\x07\xf4\x90d \xd0\
- {]8\x5c\xb6\x08x\xfa\x9b@\x9c\xcd\x15\xd1\xab\
-\xb9\x13\x9bOi\x11b\x94\xcb|d\xaf<\xf9\xfcc\
-V\xfb\xcei0hQ\xa0gi\xb8D\xe7\xda.\xcc\
-\xe9kEL\xb8\x84\xc9k\x8c\x98\x1eo@\x80N\x86\
-\xcd%\xe0\xf3'K\x97y\xfc\xc9\xe6\x12\x10\xf7c\x00\
-~;\xea\xbd\xcb\xa1r\xa0\x8cw\x1e\xb1y\xedd]\
-r@\x87\x97~2\xf9\xfdcVW\x8b\x05\x0c\xfc\xde\
-Tf\x90\xaa\x11*\xe1\xd3\xde6t\xae\xedB\xc3\xf7\
-\x94{q\xd7{\xa3\x87\x1do\xfba\x89\xf8F.[\
-\x04|\x9f\xa0GR\xa6\xb2z\xd18R\xc2\x93-\x9d\
-h|\xed*\xd8\xee\x02\xbe\xdac\xc0\xae3\x1aD\x84\
-\xc8\xf8w\x17\xbbOO\xa2?\xfaj\xb7\x1eo\xad\x0a\
-\x80\xe3\xba\xb7]+\x02\xcf\xb6s\xe0\xc3\x7fY\xbd6\
-\xc9|\x9f\xa8\xc7\xf0\xa5\x01\xaa\xf9\x98\x95,+\xcb\xda\
-\xb3w\x1a\xbcf\xc4&\xbd\x8cW\xbb\xda1\xf6\x01e\
-\x06\xf4\x8fY\x81p\xcb\x80^\xa3\x9c\x17??W\x84\
-{\xeb\xf9\xff\xa3\x90W\x8b\x05\x0cZd\xc2\xf6\xd4\xb2\
-\xfd\xfd\x93\xde6<\xd2\xd8\x89\xe3Y\x1a\xf4\x9a\x1f\x88\
-\x02\x9b\x00\x112\xc2L\xcaL\xbb\xba\x9f>\x9f[r\
-\xab\xef\xf2\x1f\xbe\x84\xe7\xdez.\xcc\xeecET\xa8\
-\x84\xf4+\x22Z|\x10\x8c\x0f{\xaa\xe3#J%\x92\
-25\xe8\xff\xad\x09\x17\x0a\xbc/\xe8\xdb\xd7rcv\
-\x9fb\xd4\xae,\xe1\x99o\x03\xb1.Y\x8b\x1a\xa1\x12\
-.\x16\x88\xf8gS'\x16\x0d\xf4\xffG\xf2N\xe4h\
-\xd0\xef\x1b\x13\xce]\xf1\xce\xde\xbc\x86\x1bs\xfaZ\xd1\
-\xb8\xba\x1b\x8f\xcc\x0e\xc4\xee4\xa50\xdb\x5c\x02>\x7f\
-\xa2\x18}\xdb\xf8\xeeV\x8e_\xbe\xea\xd3\xe6\x046\x9d\
-\xd2!\xfd\xaa\x88\x00\x9d\x8c\x8e\xb1n\xcf`[b[\
-\xaa\x16'\xb2E\xb4\xab\xe5F\x9bh\xf5\x5c5\x02\xca\
-\x06\x83}\xe74\xb0\xb9\x04\xd4\xad\xecF\xd7\xfan\xcf\
-F\x8e\x12\x19WE\x1c\xc8\xd0\xa0S\xed\xb2\x1f|\xf7\
-\x87\x84t\x0d\x9225\x90d\x01\x8d\x22\xdc\xb8\xbb\xb6\
-\x0bz\xad2\xa0mK-\xbb\xdc\xd40B\xc2]\x11\
-\xeaj\xf7\x8a\xe4\x92Y\xc0\x96\xd3Zd\x9bED\x86\
-H\xe8Z\xcf}\xc3\x02\x90~EDR\xa6\x06]\xeb\
-\xb9\xca|Y\x8f?\xa5\xe5\x89\xd8qF\x8b\x02\xab\x80\
-\x98J\x12\xba\xd6sy\xdd\xca\xc91\x0bX\x9b\xac\x83\
-\xdd\x05<\xd8\xc8\x85\xda\x95%U\xb5\x7fb\xba\x06\x07\
-o\xd0\xdfKd\x17\x0a\xd8xJ\x07\x01\xc0\xa3M\x9c\
-~o{\x9bK\xc0\xc6\x93Z\xa4_\x11\x11\xa8\x97\xd1\
-\xa9\xb6\x1b\x8d\xae;\xff\xf2\xad\x02\xe2S\xb4h\x1d\xed\
-\xf6\xdbl\xfff\xec.`\xcbi\x1d\xce\xe6\x890j\
-e\xb4\xaf\xe5\xf6\xba%\x22\xc9\xc0\x86\x13Z\xa4\xe6j\
-P\xa7\x8a\x84\x87\xeerBT\xc9\xa2\xa3\xd3\xad\xec\xea\
-?\x93\xab\x81V\x94\xd1&F\xd9\xdd_\xb2\x1ads\
-\x09X~X\x07\x8b\x1d\xb8\xa7\xae\xcb\xe7\x9f\x0e\xe1w\
-q\x13\x11\x11\xa9\x90f\xec\xd8\xb1\x93}\xfd\x97\x16\x17\
-\x17#77\x17\x16\x8b\x05:\x9d\x0eZm\xe9\xa5m\
-AA\x01\x8a\x8a\x8a`\xb5Z=?\xa2(z\xbd\xc6\
-_RSS\xb1w\xef^\xa4\xa4\xa4x~rss\
-\x11\x1d\x1d]:#JO\xc7\xe2\xc5\x8b\x91\x97\x97\x87\
-\x98\x98\x18h4\xfe\xfb\x8c\xab\xcb\xe5\xc2\xc6\x8d\x1b!\
-\x08\x02*U\xaat\xc7\x19\xfd}\x0c'N\x9c\xc0\xb2\
-e\xcbp\xf0\xe0A\x84\x87\x87#<<\xfcO\xe5\xf3\
-w\xfem\xdb\xb6!99\x19u\xea\xd4\x81(\x96.\
-\x9fY,\x16\xfc\xf6\xdbo\xd8\xb7o\x1fj\xd6\xac\x89\
-\xc0\xc0@\xaf?w\xbb\xe7\xcb\xd3\xe1\xc3\x87\xb1v\xed\
-Z\xa4\xa5\xa5!<<\x1cAAA\x7f*\x9b?\xb3\
-geea\xc7\x8e\x1d\xa8Y\xb3&t\xba\x1b\x7f\xc8\
-\xd6n\xb7c\xcb\x96-X\xbe|9\xccf3\xea\xd6\
-\xad\x0b\xe1\xda4\xa9o\xdf\xbeh\xd8\xb0!\x22\x22\x22\
-|\x96w\xfd\xfa\xf5HHH\x80V\xabE\xb5j\xd5\
-\xfe\xd49|\xabq(!!\x01\xe3\xc7\x8fG\xaf^\
-\xbd\xcao\xc6|\x8b\xb6\xfc\xb3\xc7\xeb\xab\xb6\xbfQ\x1f\
-q\xbb\xdd\xd8\xbau+\x96/_\x8e\xac\xac,\xc4\xc4\
-\xc4@\xaf\xd7\xff\xa5\xb1\xbf\xbc\x8e\xc3\xe73\xe8\x9c\x9c\
-\x1c\x9c9s\x06\xa1\xa1\xa1p:\x9d\xb0Z\xad\xb8\xeb\
-\xae\xbb\x10\x16\x16\x06\x00\xd8\xbf\x7f?$I\xf2\x1aT\
-k\xd6\xac\xe9\xb3\x93\xe7V&M\x9a\x84\x05\x0b\x16\xa0\
-J\x95*\x9e\xc7\x9a5k\x86\xef\xbe\xfb\x0e\x00\xb0|\
-\xf9r<\xf7\xdcsh\xd5\xaa\x15\xd2\xd2\xd2\x10\x19\x19\
-\x89\xed\xdb\xb7\xdft\xd0(O\x19\x19\x19\x182d\x08\
-\x12\x13\x131a\xc2\x04\x8c\x1a5\xea\x8e2\xfa\xfb\x18\
-\x16/^\x8c\xd7^{\x0d\x9d;wF~~>N\
-\x9d:\x85%K\x96\xa0[\xb7n\x15\x22\xff\xa6M\x9b\
-\xf0\xe4\x93Oz.\x14BC\x95\xcfm\xe7\xe6\xe6\xa2\
-C\x87\x0e0\x18\x0c\x08\x09\x09Ajj*6m\xda\
-\x84\x96-[\xde\xd1\xf3\xe5i\xec\xd8\xb1\xf8\xfa\xeb\xaf\
-\xd1\xb6m[\xe4\xe5\xe5!++\x0b?\xfc\xf0\x03\xee\
-\xbd\xf7^\xd5g_\xbbv-\x86\x0d\x1b\x86\xabW\xaf\
-\xe2\xc0\x81\x03\xa8[\xb7n\x99\xd7\x98\xcdfO\x7fj\
-\xdb\xb6-\xf6\xed\xdb\x87\xee\xdd\xbb\xe3\x87\x1f~\x00\x00\
-T\xa9R\x05K\x97.E\xf7\xee\xdd\xcb=\xef\xd6\xad\
-[1`\xc0\x00DGG#44\x14\x89\x89\x89\x18\
-7n\x9c\xe7\xfc\xbc\x93s\xf8V\xe3\xd0\xaaU\xab0\
-l\xd80\x9c?\x7f\xbe\x5c\xf2\xdf\xae-\xff\xec\xf1\xfa\
-\xa2\xedo\xd4G\x5c.\x17\x06\x0f\x1e\x8c]\xbbv\xa1\
-C\x87\x0eHJJB\xe5\xca\x95\xb1z\xf5\xea2\x13\
-\x82;\x19\xfb\xcb\xeb8|\xbeU\xf7\xfc\xf9\xf3\x88\x89\
-\x89A\x93&M\xd0\xb2eK\x84\x84\x84 ++\xcb\
-\xf3\xbc\xd3\xe9D\x93&M\xd0\xa6M\x1b\xcf\x8f\x1a\x8a\
-3\x00\x5c\xbat\x09C\x87\x0eERR\x92\xe7\xa7\xe4\
-\x0d2\x9b\xcd\x183f\x0cF\x8f\x1e\x8d\xad[\xb7\xe2\
-\xd0\xa1C\xc8\xca\xca\xc2\x8c\x193|\x9e\xf3\xcc\x993\
-\xe8\xd2\xa5\x0b\x22\x22\x22P\xbbvm\xaf\x93\xebV\x19\
-\xd5p\x0c\xef\xbe\xfb.\xc6\x8e\x1d\x8b\xdf~\xfb\x0d\xf1\
-\xf1\xf1\xe8\xd8\xb1#f\xcf\x9e]!\xf2\xdbl6\x8c\
-\x1a5\x0a\xf7\xdf\x7f\x7f\x99\xe7&L\x98\x80\xaaU\xab\
-\xe2\xc8\x91#\xd8\xbbw/\x1e{\xec1\x0c\x1f>\x1c\
-\xf2\xb5\x9dX\xb7{\xbe\xbcdggc\xee\xdc\xb9\x98\
-7o\x1e\xd6\xae]\x8b\xbd{\xf7\xa2K\x97.\xf8\xec\
-\xb3\xcfT\x9f\xfd\xab\xaf\xbe\xc2\xa0A\x83\xd0\xa7O\x9f\
-[\xben\xc2\x84\x09\x08\x0c\x0cDJJ\x0a\x96/_\
-\x8e\xd5\xabWc\xed\xda\xb5\xd8\xb1c\x87\xcf\xcf\xcd\xa9\
-S\xa7\xe2\xf1\xc7\x1f\xc7\x9e={\xb0n\xdd:L\x9a\
-4\x093f\xcc\x80\xcb\xe5\xba\xa3s\xf8v\xe3Py\
-\xfb\xb3my\xa7\xc7\xeb\xeb>r\xe0\xc0\x01\xacY\xb3\
-\x06\xeb\xd7\xaf\xc7\x92%K\x10\x1f\x1f\x8f\xb3g\xcfb\
-\xdd\xbau\x7fz\xec/O>-\xd0n\xb7\x1bU\xab\
-VE\xd5\xaaU=\x8f\x05\x07\x07\xc3f\xb3y\x9e\x97\
-$\x09:\x9d\xae\xdcO\xee\xbf\xe2\xf2\xe5\xcb\x9e\x8b\x85\
-?v\xb0\xfd\xfb\xf7\xe3\xca\x95+\x18>|8\x00 \
-,,\x0cC\x86\x0c\xc1\x9a5k|\x9e\xb3\xa0\xa0\x00\
-c\xc6\x8c\xc1\xa2E\x8b\xbc\x96\x1ao\x97\xd1\xdf\xc7P\
-\x5c\x5c\x8c>}\xfa\xe0\x99g\x9eQ\x96w\x04\x01\xed\
-\xda\xb5\xf3\xcc\x06\xd4\x9e\xff\xb3\xcf>\x83(\x8a7\x9c\
-\x0d\xadY\xb3\x06\xaf\xbe\xfa\xaa\xe7V\xcd\xc8\x91#q\
-\xf4\xe8Qdff\xde\xd1\xf3\xe5\xa5\xa8\xa8\x08\xb2,\
-\xa3i\xd3\xa6\xca\x80 \x8ah\xd2\xa4\x09,\x16\x8b\xea\
-\xb3\xdb\xedv\xac]\xbb\x16C\x87\x0e\xbd\xe5\xeb\x96-\
-[\x86\xb1c\xc7\xc2h4\xc2f\xb3\xa1U\xabV8\
-{\xf6,:t\xe8P\xe6\xb5\xbbv\xedB\xabV\xad\
-\xb0v\xed\xdar\xc9<l\xd80\xbc\xf5\xd6[\x9e\xdf\
-\xeb\xd4\xa9\x03\xbb\xdd^f<\xb9\xd99|\xbbq\xe8\
-\x8f\xa6L\x99\x82\x1e=z ;;\xfbo\xc9\xffg\
-\xda\xf2\xcf\x1coy\xb5\xfd\xcd\xfa\x88(\x8a\x988q\
-\x22\x1a4h\x00\x00\x88\x8c\x8cDtt\xf4MW\x1e\
-\xfeL\x9b\xff\x9d\xc7\xe1\xd3\x02\xad\xd1h\x10\x1b\x1b\x0b\
-\x83A\xf9\x1fIH\x92\x84\xcb\x97/{\x96\xb7\x9dN\
-e\xfb\xfa\xb9s\xe7\xb0g\xcf\x1e\xec\xdb\xb7\x0fg\xce\
-\x9cQM\xb1\xce\xc9\xc9\xc1\xd6\xad[Q\xa7N\x1dD\
-EE\xe1\xb1\xc7\x1e\xc3\xb9s\xe7\x00\x00)))\x88\
-\x8a\x8aBHH\x88\xe7\xf5\x8d\x1b7FJJ\x8a\xcf\
-s\xb6n\xdd\x1a\xc3\x86\x0d+\xf3\xf8\xed2\xfa\xfb\x18\
-L&\x13&O\x9e\x8c\xc8\xc8H\x00\x80\xd5j\xc5\xb2\
-e\xcbp\xdf}\xf7\xa9>\xff\xc9\x93'1}\xfat\
-|\xfe\xf9\xe7\x08\x08\x08(s\xf5]XX\x88\xbb\xee\
-\xba\xcb\xf3X\xa3F\x8d \x8a\x22N\x9f>}\xdb\xe7\
-\xcbS\xdd\xbau\xd1\xbf\x7f\x7f\x0c\x180\x00s\xe6\xcc\
-\xc1\xbb\xef\xbe\x8b\xf9\xf3\xe7\xe3\xe5\x97_V}\xf6\x97\
-_~\x19m\xda\xb4\xb9\xe5k\xb2\xb2\xb2`\xb1X\x90\
-\x91\x91\x81F\x8d\x1a!22\x12\x9d:uBbb\
-b\x99\xfb\x8d;v\xec@\x9f>}0j\xd4(<\
-\xfc\xf0\xc3\xe5\x92\xb9w\xef\xde\x08\x0d\x0d\xc5\xa6M\x9b\
-\xb0p\xe1B\x8c\x193\x06#G\x8e\x84\xd1h\xbc\xa3\
-s\xf8v\xe3\xd0\xf5\xde~\xfbm\xfc\xf4\xd3O\x987\
-o\x1e\xaaW\xaf\xfe_g\xff3m\xf9g\x8f\xb7\xbc\
-\xda\xfef}\xa4]\xbbv\x181b\x84\xe7\xf7={\
-\xf6\xe0\xcc\x993\xe8\xd1\xa3\xc7\x7f\xd5\xe6\x7f\xf7q\xf8\
-\xed\xdb(dY\xc6\xa9S\xa7 \x08\x02bbb\x00\
-\x00\x0e\x87\xf2\xf9>\xa3\xd1\x88\xd6\xad[\xa3^\xbdz\
-\xb8|\xf92\xd2\xd3\xd3U3\x83.**\xc2\xf2\xe5\
-\xcb\xb1~\xfdzH\x92\x84\x9e={B\x96edg\
-g\xa3r\xe5\xca^\xaf\xafR\xa5\x0a\xccf3\x8a\x8b\
-\x8bU\x91\xffv\x19\xd5t\x0c.\x97\x0b\xcf=\xf7\x1c\
-t:\x1d\xc6\x8c\x19\xa3\xea\xfc\xb2,c\xc4\x88\x11x\
-\xfa\xe9\xa7\xd1\xa5K\x97\x1b\x9e\xdc%YJ\xe8\xf5z\
-\x04\x07\x07#''\xe7\xb6\xcf\x97\xb7z\xf5\xea\xe1\xdc\
-\xb9s\x983g\x0e\x16,X\x80\xaaU\xabz.\x92\
-\xd4\x9e\xfdvJ\xc6\x8e\x993gb\xe6\xcc\x99HL\
-LD\xe7\xce\x9d\xd1\xbf\x7f\x7f\xa4\xa6\xa6z^\xb7m\
-\xdb6\xf4\xee\xdd\x1b_|\xf1\x05\x9e}\xf6\xd9r\xcd\
-\x94\x9b\x9b\x8b\xc9\x93'c\xe2\xc4\x89\x08\x09\x09A\xc7\
-\x8e\x1d\xff\xb6q\xa8\xc4\xf8\xf1\xe3\xb1t\xe9R\xac[\
-\xb7\x0e\xf5\xea\xd5\xf3i[\xfe\xd9\xe3\xf5e\xdb\xdfH\
-ZZ\x1a\x06\x0e\x1c\x88\xb8\xb88\xb4k\xd7\xee/\xb7\
-yy\x1c\x87\xdf\xb6F\xa7\xa4\xa4\xc0b\xb1\xa0y\xf3\
-\xe6\x9e\x0daAAAh\xd3\xa6\x8d\xe7\xea\xaad\x19\
-%;;\x1b\xb1\xb1\xb1~?\xd9\xd7\xacY\x83\x1a5\
-jx\xf2}\xf9\xe5\x97h\xd1\xa2\x05\x92\x93\x93Q\xab\
-V-\xaf{\xe9%W\x9cU\xaaT\x81\xc9dRE\
-\x81\xbe]F\xb5\x1c\x83,\xcbx\xe5\x95Wp\xf4\xe8\
-Ql\xd8\xb0\x01\xc1\xc1\xc1\xaa\xce\xbfh\xd1\x22\x9c:\
-u\x0a\x0b\x17.\x84\xddn\xf7\x5chZ\xadV\x04\x05\
-\x05y.@\xb3\xb2\xb2<\xbb>\xadV+\x0a\x0a\x0a\
-P\xabV\xad\xdb>_\x9e~\xfb\xed7L\x9d:\x15\
-\xbf\xff\xfe;:v\xec\x08Y\x961n\xdc8\xf4\xe9\
-\xd3\x07'O\x9eTu\xf6;Qr;\xadg\xcf\x9e\
-x\xe0\x81\x07\x00\x00\x9f~\xfa)V\xae\x5c\x89\xcd\x9b\
-7\xa3^\xbdzp\xb9\x5c\x98>}\xba\xe7b\xa5\xbc\
-EGGc\xe7\xce\x9dp:\x9d\x983g\x0e\xfa\xf6\
-\xed\x8b\x13'Nx}\xd2\xe2\xaf\x8eC\x00PXX\
-\x88Y\xb3f!::\xfa\x96;\xc4\xcb\xa3-\xff\xec\
-\xf1\xfa\xba\xedo\xb4*\xd0\xabW/\xdcs\xcf=x\
-\xff\xfd\xf7\xffR\x9b7i\xd2\xa4\xdc\x8e\xc3/3\xe8\
-3g\xce ??\x1f\xcd\x9a5\xf3,w\x03\xca=\
-\xc8\xcb\x97/{\x07\x14\xd5\xf1\x95\x936\x9b\x0d\x0b\x17\
-.\xc4\xa5K\x97<\x8f\x95dw\xbb\xddh\xd0\xa0\x01\
-\xb2\xb3\xb3\x91\x91\x91\xe1y~\xdf\xbe}\xa8_\xbf>\
-\xd4\xe2v\x19\xd5r\x0co\xbe\xf9&\xe2\xe3\xe3\xb1r\
-\xe5JDEE\xa9>\xff\xe6\xcd\x9bq\xf5\xeaU4\
-j\xd4\x08\x11\x11\x11\x9e\xc1\xabQ\xa3FX\xbat)\
-BCCQ\xadZ5$$$x\xe5\x02\x80\xfa\xf5\
-\xeb\xdf\xf6\xf9\xf2\x94\x94\x94\x84\xda\xb5k{f5\x82\
- \xa0o\xdf\xbe\xc8\xcf\xcf\xc7\xb9s\xe7T\x9d\xfdN\
-\xc4\xc4\xc4@\x10\x044l\xd8\xb0\xcc\xb8r\xfd\xecg\
-\xd4\xa8Qx\xf4\xd1G\xd1\xaf_?\xe4\xe5\xe5\x95K\
-\x96\xabW\xafb\xc2\x84\x09\x9e1D\xa7\xd3\xe1\xf9\xe7\
-\x9f\x87\xc3\xe1\xc0\xf6\xed\xdb\xff\x96q\xe8\xfa\xa5V\x9b\
-\xcd\x86\x91#G\xfa\xbc-\xff\xec\xf1\xfa\xa2\xedo$\
-//\x0f\xbdz\xf5B\xd3\xa6M1o\xde\xbc\x9b\xd6\
-\x9a;m\xf3\xf28\x0e\x9fW\xbf\xf4\xf4tdgg\
-\xa3N\x9d:\x90$\x09\xc5\xc5\xc5\x9e\xe5G\xadV\x8b\
-\xf3\xe7\xcf\xe3\xe2\xc5\x8b\x90$\x09EEE\xc8\xcc\xcc\
-\xbc\xe1\xb6w_3\x1a\x8d\xd8\xb6m\x1b\xdex\xe3\x0d\
-\x5c\xbe|\x19\xb9\xb9\xb9\x187n\x1c\xaaW\xaf\x8e\xa6\
-M\x9b\xa2]\xbbvh\xde\xbc9F\x8d\x1a\x85\x9c\x9c\
-\x1cl\xd8\xb0\x01\x8b\x16-\xc2\x8b/\xbe\xa8\x9a\x02}\
-\xbb\x8cj8\x86)S\xa6`\xfe\xfc\xf9\xf8\xf0\xc3\x0f\
-a\xb3\xd9\x90\x9c\x9c\xec\x99\x19\xa85\xff\xb4i\xd3p\
-\xfc\xf8q\xcf\xcf\x92%K\x00(\xf7\xb5J>\x8f:\
-t\xe8P|\xf6\xd9gHJJBZZ\x1a&N\
-\x9c\x88\x9e={zf8\xb7{\xbe\xbct\xed\xda\x15\
-\xa7O\x9f\xc6\xec\xd9\xb3\x91\x97\x97\x873g\xce\xe0\xbd\
-\xf7\xdeCDD\x84g\x03\x8dZ\xb3\xdf\xcc\xd4\xa9S\
-\xb1`\xc1\x02OQx\xe9\xa5\x97\xf0\xd9g\x9f\xe1\xf0\
-\xe1\xc3\xb0X,\x982e\x0arss={\x1b\xb4\
-Z-\xee\xbe\xfbn\xcc\x9d;\x17\x81\x81\x81\x188p\
-`\xb9\xec2\x0e\x0b\x0b\xc3\xea\xd5\xab\xf1\xc6\x1bo \
-##\x03yyy\xf8\xf8\xe3\x8f!\x8a\x22:v\xec\
-\x88\xbc\xbc<\xbc\xf0\xc2\x0b8z\xf4\xe8_\x1e\x87\x00\
- $$\xc4\xf3\x11\xa0\xa5K\x97b\xce\x9c9\x7fK\
-\xfe;i\xcb\xeb\x8f\xe1v\xc7\xeb\xcb\xb6\xff#\xb3\xd9\
-\x8c\x9e={\xe2\xd4\xa9S\x18=z4N\x9f>\x8d\
-\xe4\xe4d\xcf\xc6\xc6\xeb\xfb\xd0\x9d\xb4yy\x1d\x87O\
-\x97\xb8\xddn\xb7\xa7\x01N\x9d:\xe5\xf5\x5c\xe7\xce\x9d\
-a4\x1aQ\xbf~}\x9c={\x16iii\x9e\x0f\
-\xe7\xabay\x1b\x00\x16,X\x80g\x9f}\xd633\
-\xa8S\xa7\x0eV\xacX\x01Q\x14!\x8a\x22\xe6\xce\x9d\
-\x8b\xe7\x9f\x7f\x1e\x0d\x1b6\x84\xc9d\xc2K/\xbd\x84\
-\xde\xbd{\xfb5\xb3 \x08\x9e/\x11\xd0j\xb5\xb7\xcc\
-x\xbb\xe7\xcb[QQ\x11\xa6M\x9b\x06\x00\x184h\
-\x90\xd7s\x97.]\x82^\xafWe\xfe?.M\x96\
-\xac\x02]\xbf$6r\xe4H$''\xe3\xc1\x07\x1f\
-\x84\xd3\xe9D\xc7\x8e\x1d=\xc7z'\xcf\x97\x97\xee\xdd\
-\xbbc\xda\xb4i\xf8\xcf\x7f\xfe\x83q\xe3\xc6A\x14E\
-\xb4h\xd1\x02\xbf\xfd\xf6\x9bgF\xa1\xd6\xec\xd7\xf7\xf1\
-\xeb\xad^\xbd\x1au\xea\xd4\xc1\x90!C\x00(\xf7c\
-\xb3\xb3\xb3\xd1\xb5kW\x00@\xe5\xca\x95\xb1p\xe1B\
-\xaf\x19\xbe \x08\x08\x0a\x0a\xc2\xe2\xc5\x8b\xd1\xbd{w\
-L\x980\x01\x1f|\xf0\xc1\xdf\x9e\xf3\xa7\x9f~B\x5c\
-\x5c\x1cZ\xb4h\x01I\x92\x10\x13\x13\x83\xa5K\x97\xa2\
-z\xf5\xeaHNN\xc6\xaaU\xab\xf0\xd0C\x0f\xa1Y\
-\xb3f7<\x87o7\x0e\x09\x82\xe0y\xdf:u\xea\
-\x84\x0f>\xf8\x00o\xbe\xf9&\x9a6mz\xc3\xfd\x11\
-\x7f\xd6\xed\xda2''\xc7\xeb\x18nu\xbc\xben\xfb\
-\xeb\xfd\xfe\xfb\xef8v\xec\x18\x00x\xbec\x01\x00\x1e\
-~\xf8a\xfc\xf8\xe3\x8fe\xfa\xd0\xad\xda\xbc<\x8fC\
-\x95_\xf5)\xcb2l6\x1b\xf4z\xbd_\xbf\x89\xeb\
-f.\x5c\xb8\x00\x00^\xcb\xaf\xd7;\x7f\xfe<\xaaU\
-\xabVf\xa7\xa2\x9a\xdc.\xa3\xda\x8f\xa1\xa2\xe6\xcf\xcf\
-\xcf\x87\xcdf\xbb\xe9\xae\xda\xdb=_\x9e.]\xba\x84\
-\xa0\xa0\xa0\x9b\xde\xafWs\xf6\xebI\x92T\xa6\xa8\x01\
-\xcaf\xa5\xfc\xfc\xfc\xdb~\xf3\x95\xaf.Fm6[\
-\x99M\x8dn\xb7\xfb\x8e\xc7\xbc\xdb\x8dC\xe5\xe9Vm\
-y\xa3c\xb8\xd9\xf1\xaa\xd5\xcd\xfa\x90\xaf\xdb\x9c\xdf\xc5\
-MDD\xa4B\x22\x9b\x80\x88\x88\x88\x05\x9a\x88\x88\x88\
-X\xa0\x89\x88\x88X\xa0\x89\x88\x88\x88\x05\x9a\x88\x88\x88\
-\x05\x9a\x88\x88\x88X\xa0\x89\x88\x88X\xa0\x89\x88\x88\x88\
-\x05\x9a\x88\x88\x88X\xa0\x89\x88\x88X\xa0\x89\x88\x88\x88\
-\x05\x9a\x88\x88\xe8\x7f\x94v\xc5\x8a\x15l\x05\x22\x22\x22\
-\x95\xe1\xff\xcd\x8a\x88\x88H\x85\xb8\xc4MDD\xc4\x02\
-MDDD,\xd0DDD,\xd0DDD\xf4w\
-\xd1\xfa\xf3/o\xdf\xbe\xfdM\x9fKHHPu\xc3\
-U\xd4\xecls\xe6fv\xf6\x17f\xaf\x18\xb9\xb5\xfe\
-n\x98\xb9s\xe7\x96y,..\xaeB\x5c\xddT\xd4\
-\xecls\xe6fv\xe6fv\xf5\xe7\xe6\x127\x11\x11\
-\x91\x0a\xb1@\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b4\x11\
-\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\x11\
-\x11\x11\x83\xa8=\xed\x00\x00 \x00IDAT\x0b4\
-\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11\x11\x0b4\
-\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\
-\x11\x11\x11\x0b4\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\
-\x11\x11\x11\x0b4\x11\x11\x11\x0b4\x11\x11\x11\xb1@\x13\
-\x11\x11\xb1@\x13\x11\x11\x91o\x08\xf9\xf9\xf9\xb2\xaf\xfe\
-\xb2Z\xd3C\xff\xf2\x9fM\x1fQ\xe0\xd7\x86\xaa\xa8\xd9\
-\xd9\xe6\xcc\xcd\xec\xec/\xcc^1ss\x06MDD\
-\xa4BZ\x7f\xfc\xa5\xf9\x93\xee\xfc\xb5a\xef\xa8\xab\xc1\
-*jv\xb69s3;\xfb\x0b\xb3W\xac\xdc\x9cA\
-\x13\x11\x11\xa9\x10\x0b4\x11\x11\x11\x0b4\x11\x11\x11\xb1\
-@\x13\x11\x11UP~\xd9$\xa6\xb6\x0d\x0e\xff\x1f\xb2\
-\xb3\xcd\x99\x9b\xd9\x99\x9b\xd9+Vn\xce\xa0\x89\x88\x88\
-T\xc8\xa7_T\xf2G\xed\xdb\xb7\xc7\xdc\xb9s\xcb<\
-\x1e\x17\x17\x87\x84\x84\x04U7\x5cE\xcd\xce6gn\
-fg\x7fa\xf6\x8a\x91\x9b3h\x22\x22\x22\x15b\x81\
-&\x22\x22b\x81&\x22\x22\x22\x16h\x22\x22\x22\x16h\
-\x22\x22\x22b\x81&\x22\x22b\x81&\x22\x22\x22\x16h\
-\x22\x22\x22\x16h\x22\x22\x22b\x81&\x22\x22\x22\x16h\
-\x22\x22\x22\x16h\x22\x22\x22b\x81&\x22\x22b\x81&\
-\x22\x22\x22\x16h\x22\x22\x22\x16h\x22\x22\x22b\x81&\
-\x22\x22\x22\x16h\x22\x22\x22\x16h\x22\x22\x22b\x81&\
-\x22\x22b\x81&\x22\x22\x22\xdf\xd0\xfa;@\x5c\x5c\x5c\
-\x85m\xbc\x8a\x9a\x9dm\xce\xdc\xcc\xce\xdc\xcc\xae\xfe\xdc\
-B~~\xbe\xcc\xeb\x14\x22\x22\x22u\xe1\x127\x11\x11\
-\x91\x0a\xf9|\x89\xfbJ\xb1\x80\xcf\xe3\x0d\xa5W\x08\x22\
-\x10\x1e \xe3\x81F.4\x8ap{\x1e?\x93+b\
-\xf9a\x1d\xf4Z\xa0Ok\x07\x22\x82\xfd?\xd1\xdf\x9d\
-\xa6EB\xba\xc6\xeb\xb1\xe80\x09\x0f7v\xc1\xa4\xf7\
-\xce\xb7-U\x8b\xf8\x14-&=l\xf3k\xe6\x8c\xab\
-\x22\x96\x1d\xd6y=\x16j\x94\xf1pc\x17\xaa\x87H\
-\x9e\xc7\x12\xd25\xd8\x9e\xaaE\xa0\x01\xe8\xd9\xcc\x89\x1a\
-\xa1\x92\xdf2\xef?\xaf\xc1\xaac\xa5\x99\x05\x01\xa8\x1e\
-\x22\xa1Ws\xa7\xa7\x1f\xb8%`\xe51\x1d\x0eej\
-P\xab\x92\x84g\xda:`\xd0\xaa\xe3\xa4\xca.\x14\xb1\
-\xe4\xa0w\x9b\x07\x1bd<\xd4\xd8\x85\xa8\x1b\xb4\xeb\xd2\
-$\x1d\xd2\xaf\x88\x18u\x9f]5\x03\xc3\xb4-\x06\x9c\
-\xbf\xaa\x5c\xbf\xeb4@\x88QF\x93H7\xfe\xd5\xcc\
-\x09\xed\xb5\xcb\xfa\xc4t\x0dv\xa5\x956\xbaQ\x0b\xbc\
-\xd4\xc5\xbf\xc7\xb04I\x87\x0b\x05\xa5\xf3\x0e\xad\x084\
-\x8ap\xa3G\x03\x17D\xc1\xfb\x5c\xde\x93\xa6AT\x98\
-\x8c'Z8\xa0\xd3\xf8\xb7\xbd\x97\x1c\xd4#\xbbP\xf0\
-\xca\xdd$\xd2\x8dn\xf5\x5c\x10\x04\xe0\xf0\x05\x0d\x922\
-\xcb\x86|\xa2\xa5\x13\xc1\x06\xff\x8f\x8d{\xd2\xb4X\x7f\
-B\xeb5\xae\xd7\xb8v\xceV\x09R\xf2\xb9$\xe0\x97\
-Cz\x1c\xbd \xa2F\x98\x8c\x01\xed\x1c\x081\xfa/\
-\xfb\x92\x03:\x9c\xcc)mS\x83\x0e\xa8[\xd9\x8d\x9e\
-\xcd\x9d\x9e\xb1\xa4\xc0*`\xd1~=\xae\x14\x09x\xa0\
-\x91\x13\x1dc\xdd>\xcd\xe8\xf3%\xee\xb4<\x11\xad>\
-\x0cF\xb0AF\x98I\x86\xd9&\xc0l\x17\xa0\x11\x81\
-\xdf_\xb4\xa0c\xac\x1bgrEt\xff<\x08\x1a\x11\
-p\xb8\x94\xc1a\xd7\xeb\x16T2\xf9\xb7#\xbe\xb7\xde\
-\x88O6\x1b\x10d\x90\xa1\x15\x01\xa7\x1b(r\x08h\
-\x1d\xed\xc6\xc6\x97-\xd0\x5c\x1b\x17N_\x12\xf1\xd8\xdc\
- \x5c\xb6\x08\xb8\xf2a\x81_3oK\xd5\xa2\xe7\xbc\
-@\x18\xb52\x8c:@\xbe\xd6\xe9\xc2M2\xb6\xbej\
-Al%\x09\xdf\xec\xd5c\xe4\xaf\x01\xa8\x16,\xc3b\
-\x07D\x01\xd8\xfa\xaa\x05\xf5\xab\xfa\xa7H/\xd8\xab\xc7\
-\xeb\xd7\xf2\x98t2\xacN\x019f\x01Q\xa1\x12v\
-\xbdnAX\x80\x8c\xb7V\x1a\xf1\xe5\x0e\x03\x9aD\xba\
-q*G\x83\xbb\xeb\xb8\xb0bh\x11\x04\xc1\xff\xc5-\
-1]\x83\x07f\x05\xc1\xa8\x03\x8cZ\xa5\xcf\xe6[\x05\
-\x04\x1bdlz\xc5\x82\x86\x11\xa5\xed\x9a\x94\xa9\xc1\x83\
-\xb3\x82P9P\xc6\xc9\x09\x85\xaa)\xd0\xf7\xcd\x0cB\
-R\xa6\x061\xe1J\xd6\x02\x9b\x80\xab\xc5\x02^\xe8\xec\
-\xc0'\xbd\xac\x00\x80\xd7\x96\x05\xe0\xdb}z\xcf\x9f\x09\
-7\xc9H\x9b\xec\xdfcxdv v\xa7i\x11\x16\
-\xa0\xb4\xbb\xcd%\xc0\xe6T.\x1c>\xf8\x97r\xb1\xfc\
-\xc1F\x03>\xd8hD\xf5\x10\x09\xd9\x85\x22\x9eh\xe9\
-\xc4\xd7\xcf\x14\xfb\xbd\xbd\x0ffj\x10z\xad`Y\x9d\
-\x02\xec.`D7;&?b\xc3\x87\x1b\x0d\xf8\xcf\
-Fc\x99?wd\x9c\xd9\xf3\x1e\xf9\xd3\x17\xdb\x0d\x98\
-\xb0\xca\x88\x88`\x19\x01:\x19E\x0e\x01\x97-\x02b\
-+)\xe7l\xa0^\xc6\x88e\x01\xf86A\x8f\xf6\xb5\
-\xdc8zQD\xed\xca\x12\xb6\xbfV:n\xfaZ\xff\
-\xefLXuL\x87\x98p\x09\xa2\x00\x5c\xb6\x08(r\
-\x08\xf8W3'\xbe\x1bP\x8cb\x87\x80{\xa6\x07!\
-\xc7, \xd4(#\xabP\xc4\x17OY\xf1L[\x87\
-\xcf2\xfam\x89\xfb\xc9VN\x1c\x1dg\xc6\xb9w\x0a\
-\xb1\xfa%\x0b\x1c.\xe0\xd7\xc3\xca\xc9\xfe\xf5\x1e=\x0a\
-m\x02\xd6\xfd\xdb\x82o\x07\x14#\xabP\xc4\xcf\x07\xf5\
-\xaa\x19\xbcV\x0c-\xc2\xb9w\x0aq~J!\xfa\xb6\
-v\xe0`\x86\x06\xc9\xd9\xca\x95\xd8\xccm\x06\xdc;]\
-)\xcej\xf2\xe6\xfdv\x9c{\xa7\x10\xe9\xef\x14\xe2\x8b\
-\xa7\xac\xb8Z,`\xf5qe\x967k\x87\x01\x8d\x22\
-$$\x8f/\xc4\xda\x7f\x17\xc1b\x17\xf0\xe3\x01\xff\xb7\
-\xf7\xc7\xbd\xac84\xd6\x8cSo\x17\xe2\xad\x07m\xb8\
-P bO\x9a\x16\xb2\x0c\x9c\xcb\x13\xf1\xf2=v\xec\
-\x1ai\xc1\x90N\x0elK\xd5\x22\xc7\xac\xae;6\xc3\
-\xefU\xda\xfc\xdc;\x85X\xf0l1\xccv\x01\xbf\x1d\
--\x9dY\xdb\x9c\xc0\xbf\x7f2\xc1\xe9\x86*\x05\xeae\
-\x1c\x1ak\xc6\xa1\xb1f\x9c\x9cP\x88F\x11\x12~=\
-T\x9a\xff\xc8\x05\x0d:\xd5vy\x8e\xf1\xd0\x18\xb3*\
-r\xeb\xb5\xf0dJ\x9dX\x88F\x11n,JT\xfa\
-\xf3\x85\x02\x11\x1fm2\xa2Ok'NN0\xe3\xad\
-\x07mpKP\xc5{\x10\xa4\x97KsO*D\xdd\
-*\x12\x16\xedWr\xc7uqx\xde\x8b\xcd\xc3-\x08\
-2\xc8\x88\xbb\xdb\xa1\x8a\xe2\xecU\xa8\x9f*\xc6\xa1\xb1\
-f\xa4L,\xc4\x88nv\x9c\xbb\x22b\xffyel\
-\x5c\x93\xac\xc3?\x9b8\xb1~\x98\x05\x93\x1f\xb6\xe1x\
-\x96\x06iy\xfe?gw\xbfn\xc1\xa1\xb1J-\xba\
-\xbb\x8e\x0b\xab\x8f\xeb`u\x0aX~D\x873\xb9\x22\
-~\x18T\x8c\x83c\xcc\xa8[E\xc2;k\x8d\x90}\
-8O\xf4\xdb\xa2\xa0\xd9&\xe0\xdc\x15\xf1\xda\xf2\xaa\x12\
-\xa3Iu\xf7\xb5\x19\xa8\x06z-\xd0\xa0\x9a\x84\xf0k\
-\xb3\xe6\x939\xea\x19|-v\x01\xf9V\x01yE\x02\
-\xb2\xcd\x22\x02\xf5\xb2gIx\xcbi-Fv\xb7#\
-9[\x83\x95\xc7t\xaa\xc9lw+\x99\xadN\x01\xa9\
-\x97\x95\xb6\xac_Ui\xef-\xc3-(v(\xcbj\
-%3\xd0 \xbd\xff\x97\xcd.\x99\x95>bw\x02G\
-.*}\xa2a57\x04\x01X<X\x99\xf1\xec?\
-\xaf\xc1\xae\xb3\x1a4\x8a\x90P%H]\x83\x95\xd5\xa9\
-\xcc\x9cmN\x01\xa7/)m\xde\xa0Zi\xc6w\xd7\
-\x19Q`\x05:\xd7v\xe1l\x9e\x06j#\xc9\xc0\xb9\
-+\x22\x1c.\xe0\xfcU\x119f\x01\xadj\xba=\xcb\
-\x95'r4\xa8_\xd5\x8d\xd7\x7f\x0d@T\x98\x84\xd7\
-\xbb\xabg\x89>\xdf*(\x17rWD\x14X\x05O\
-\xbb\x1f\xbe\xa0\x81$\x03mc\x5c\xf8j\xb7\x1e\x8d\xab\
-K\x18}\x9f]\x15+/\xf2\xb5\xdc\x92\xac\xac4\x9a\
-\xed\x82\xe7\x1c\x0d\x0b\x90=\xab\x02\xef\xad3\xa1J\xa0\
-\x8cw\x1e\xb5\xa9\xae\xcf\x5c\xb2\x888wE\x84\xcd\x09\
-\x1c\xcf\xd6\xc0\xa8\x95=+q-\xa3\xdcH\xce\xd6x\
-n\xffU\x0b\x96\x11\x15\xe6\xffq\xe6\xfcU\x11&\xbd\
-\x8c\xcbf\x01\x17\x0bD\xd4\xaf*\xc1\xa8\x95q\xc9\xac\
-t\x8aZ\x95$\x18\xb4@\xb3\x1an\xfczX\x87\xdc\
-\x22\x01U\x83|\x93\xdbo\x05\xfa\x97C:\xfcr\xdd\
-\xd5x\x93H7\x9eh\xe9\x04\x00\xe4\x98\x05T2\xc9\
-\x10\x04x\x0at\x8eY=3\xd2^\xf3\x03\xbd~\x1f\
-\xff\x0f\x1b*\x07*9\x7f\x1eR\x04\x9d\x06x~\xb1\
-IU'\xce\x87\x1b\x0d\xf8pc\xe9\xbd\xff\xee\xf5]\
-\xe8\xd1\xc0\x05@\xb9\x85\x10bT\xf6\x07\xfc\xfb\xa7\x00\
-\x98\xf42\xfa\xb6q\xfa=\xf3\xe8\x15\x01^\xbf\x0fl\
-\xef@\xed\xca\xa5\x05N\x96\x81\x7f\xcd\x0b\x84\xd5)`\
-\xe6\x93V\xcf\xbdQ\xd5\xcc&\xb6\x1b\xf0\xc5\xf6\xd26\
-\xef\x18\xeb\xc2#\x8d\x95v\xdd\x9d\xa6\xc5\x9c]\x06,\
-\x19\x5c\x84o\xf6\xea\xa1FE\x0e\x01-?\x08\xf6\xfc\
-n\xd0*K\xae\x00\x90rY\x03\x9b\x13(v(\xb7\
-\xa7\xe6\xed2`\xc7\x19-6\xbf\xe2\xbf%\xcb\x12\x0e\
-\x17\x10;)\xc4\xf3\xbbN\x03\xcc\xeeS\x04\x00\xb8\x98\
-\xaf\x8c#\x93\xd6\x18\xd1$R\xc2\xc1\x0c\x0d\x9en\xe5\
-\xc0\xec>VU\x5c\xf8_\x9f\xdb\xa0\x05\xde~\xc8\xfb\
-\xa2\xe7d\x8e\x06\xcb\x0e\xeb0\xeb)\xab\xe7\xf6\x89\x9a\
-\xbc\xfc\xb3\xf79\xfbR\x17\x87g\xf2\xf2\xd6\x836<\
-<;\x10=\xe7)\xe3\xe7\x7f\xfeeC\x80\xce\xff\xc7\
-\xd0yZ\x90\xe7\xdfE\x01\xf8\xea\x99b\x08\x02\xd0:\
-Z\xb98Zr@\x87\xde\xcd\x9d\xd8{Ns\xad\x16\
-\x89\xa8\x1a\xe4\x9b%\x17\xbf\x15\xe8n\xf5]\x18\xdc\xc1\
-\x01\xa7\x1b8\x9b+\xe2\x93-F\xf4\xff\xce\x84\x15C\
-\x8b`\xd0*'\x19\x008\xdc\xca\x09eT\xcfd\x14\
-o?dCl%\x09yE\xca2\xf1\xd4\x0dF4\
-\xa8&\xa1g3\xa7\xdf7\x9b\xdc\xccS\xad\x9cx\xb4\
-\x89\x13\x05V\x01I\x99\x1a,\xdc\xa7\xc7\xd8\xdf\x03<\
-\xf7\x13\xf3\xad\x02z\xcf\x0f\xc4\xe9K\x1a|\xf3l\xb1\
-_7\x89\x95\x18\xf3\x80\x1d\xedc\x5c\xc8+\x12\xb05\
-E\x8b\xef\x12\xf4\x88\xad$\xe1\xf5\x1e\xa5\x83\xd6\xa11\
-f|\xbd\xd7\x80W\x96\x06 2D\xc2}\x0d]\xaa\
-i\xf3\xc7\x9a:\xf1DK'\x0am\x02\x8eei0\
-\x7f\xb7\x1e\xaf-\x0b\xc0'\xbdm\xf8\xf7O\x01\xe8\xd9\
-\xcc\x89v\xb5\xdc\x98\xb7[\x995\x15X\x05\x84\x06\xa8\
-g\xd0\x0d\xd0\xc9\xf8qp1\x1cn \xafH\xc4\xf4\
-x\x03\x9e^`\xc2\x9e7,hP\xd5\x8d\xc3c\xcd\
-\xa8v\xed\x9ec\xadJ\xca\xfe\x8c\xa3\x175hY\xd3\
-\xbf\xeb\xc5ZQ\x19d\xed.\xe0J\xb1\x88\xf9\xbb\xf5\
-x\xf6[\x13v\x8e\xb4@{\xed\xfc|\xbe\x93\x03\xef\
->j\xc3\xd4\x0dF|\xb4\xc9\x801\x0f\xd8\x11[\xc9\
-\xbf}\xde\xa8\x951\xa7\xaf\x15v\x17\x90[$b\xee\
-N=\xfa,0a\xef(\x8bgs\xe1\x9c\x9dz\x84\
-\x1ae<\xd9\xd2\xa1\xcaqf\xe2C64\x8fr#\
-\xafH\xc0\xc6\x93:\xcc\xd9\xa9Gl%7\x9e\xef\xe4\
-\xc0\xc0\xefM\xb8\xab\xba\x84/\x9f.\xc6\xc2}\x06\x8c\
-_iD\xfbZ.\xb4\x89\xf6o\x7fY\xf2\x9c\xb2\x1a\
-w\xa5H\xc0\xfc\xddz\xbc\xf8\xa3\x09\xb5*Y\xd0\xb5\
-\x9e\x0b\xc3\xbb\xda\xf1\xd1&#\xa6m5\xa2^\x157\
-.\x16(\xb7~|\xd6\x97\xfd\xd5(\xb5++;\xfc\
-J\xac:\xae\xc3\xf6T-\x9cn\xa0Z\x90\x84\xa4L\
-\x0d\xdc\x12\x90W\xa4\x14\xe8\xea\xc1\xeaY\xbe\xecZ\xcf\
-\x85\xb61J\xa7\xea\x10\xebF\xd7\x19AX{\x5c\x8b\
-\x9e\xcd\x9cP\xab\xbb\x22\xdc\x9e\xf6\x1e\xd4\x01X~D\
-\x87\xb5\xc7\xb5\xf8\xa4\x972S\xea5?\x10'r\x94\
-\xe2\xfc\xcf\xa6\xea8\x8e\xc6\xd5\xdd\x9e\x82\xdb\xa3\x81\x0b\
-?\x1e\xd0#>U\x8ba\xf7:\xb0\xf1\xa4\x161\xe1\
-\x12ZD\xb9\xf1\xcf&N|\xb8\xd1\x80\xfd\xe75\xaa\
-*\xd0\x8d\x22\xbc\xfb\xf8\xca\xa3Z\xac;\xa1\xc3\xd0\xce\
-\x0e\xa4_\x11\x91~E\xc4\xaf\xd7\xed\xb0o\xf8^\x08\
-\xb2\xdf/PM~\xad\xa8\x5cH\x97\xc81\x0b\x98\xbc\
-\xc6\x88\xc4t\x0d\x02\xf52N\xe6\x88\x086\xba\x11\xa0\
-\x03\xaa\x04*\xe7\xa7\xc5\xe1\xff\x95.Q\x84W\xbb\x0b\
-\x901\xf6\xf7\x00\xec8\xa3E\xe4\xb5O.\xd4\x0cS\
-\xfeY\xa7\xb2r\x1eg\x17\x0a\x88\xad\xe4\xdf\xdc:\x8d\
-wn\x97[\x99\xe9\xef<\xa3A\x9f\xd6\x12d\x19X\
-wB\x87\x7f\xdc\xe5\x82^\xab\xceq\xa6Y\x0d7\xee\
-\xbfv\x0ev\xaa\xed\xc6/\x87t\x88O\xd1\xe2\x1fw\
-\xb9p\xfe\xaa\x88\x01\xedmh\x14!\xa1_\x1b\x07\xe6\
-\xec\xd4#1]\xe3\xf7\x02\xdd\xa5\x8e\x0bA\xd7v\xc2\
-kD\x19qKL\xd8yF\x8b6\xd1n\x8c\xff\x87\
-\x1d\xafu\xb5\xc3\xa4W6E\x9e\xcc\xd1x\xfa\xd0\xff\
-t\x81>\x95#b\xe1\xb5\x1d\xa0grE$gk\
-\xd04\xd2\x0d\x9d\x06\xe8\x5c\xc7\x8d5\xc9:\xcc\xdei\
-\xf0\xdc\x07\xb8\xa7\x9ezv\xd2lK\xd5\x223_\xb9\
-\xb7Ur\x9f\xb9y\x94\x045;\x91\xa3\xc1\x8a#:\
-\x14;\x04\x1c\xbd\xa8d\xef\x14\xab\x9cHo\xad4\xe2\
-P\xa6\x06\x9dk\xbb\x90\x9a\xab\xcc\x94\x9aE\xba\xfd^\
-\xec\xe2S\xb4\xb8Z\xac\xdc\xc3\xdd\x96\xaaL}Z\xd7\
-tC+*;B\xab\x05I\xf8\xf4q\x9bg'q\
-\xfbXu\xed\xb6:\x99#b\xc5\x11e\xc3\xc9\xc9\x1c\
-\x11Y\x85\x22\xee\xad\xe7B\xed\xca\x12\x16\xf6/\xdd5\
-<#\xde\x80\xb4<\x113\x9f\xb2\xaa*\xbfS\x12\xb0\
-p\x9f\x1eN\xb7\xb2\xc2\xf2\xcd^=4\x22\xd0*\xda\
-\x8d\x94\xcb\x1a\xf4\xf9&\x10}[;0\xf4n\x07\x16\
-%\xeaQ%H\xf6\xdc\xa3\xf6'I\x02V\x1c\xd1\xc1\
--\x01W\x8b\x05,\xd8k\xf0\x14\x8f\xda\x95%\x98\xf4\
-2\xbeO\xd0\xa3Sm7V\x1c\xd5#@'\xa3a\
-5\xff\x9f\xbfNwi\xee+\xc5\x02\xbeM\xd0C\x10\
-\x80f5\x94l\xa9\xb9\x22\xb2\x0b\x05\xb4\x8dq\xa9v\
-\x9c\xd9tJ\xf9\x98\x9b\xd5)`\xf3)\xa5\xbc\xb4\x8e\
-v\xa3f\x98\x84`\x83\x8c\x15Gtx\xb0\x91\x0b\xdf\
-_\xdb\xb4\xd7\xb4\x86\xff\xdb}Q\xa2\x0eF\x9d\xb2/\
-\xaadS^\xebh7\x0eej\xd0\xed\xf3 \xf4o\
-\xe7\xc0cM\x9dX\x9b\xac\xc5}\x0d]>]\xcd\xf5\
-[\x81\xde\x9d\xa6\xc5\xee\xeb>C\xd9\xb8\xba\x1bs\xfb\
-Y=\xcbO;\xcfj1a\x95\xf2\xb1\x82g\xda:\
-\xf0\xf0]\xea\x99\x9d\xbe\xbb\xae\xf4\xe3\x0e\x1a\x11\xe8\xdd\
-\xc2\x89\xa1\x9d\xedP\xb3\xa5I:,M\xd2y]\xe9\
-~\xd2\xdb\x06\xb3]\xc0\xe2k\x9d\xf2\xfa\xf7\xe4\xb9\x8e\
-\x0e\xbf\x17\xe8\xeb\xef\xcd\xea\xb5\xc0?\x9b:1\xe6\x01\
-\xbbg\x093n\x89\x09\x8f\xcc\x0e\x84N\x03\x8c{\xc0\
-\x86\xee\xf5\xd55p\xad<\xa6\xf3\xda(\xd8(\xc2\x8d\
-\xe9\x8f[\x11n\x92\xbdfJ?\x1f\xd4!\xabP\xc4\
-cM\xd5\xb5\x02cs\x02#\x96\x95\xdeS\x8c\x0a\x95\
-0\xe3\x09+\xeaW\x95P\xbf\xaa\x84\xb1\x0f\xd8\xf1\xe9\
-\x16\x03\x96\x1c\xd4\xa3Z\xb0\x8c\xaf\xfa\x15\xfbt\xf9\xef\
-f\x5c\x120xQ\xe9\x1e\x90\x00\x9d\x8c\x89\x0f\xd9<\
-\x17\x0f\xf3\xfbY\xf1\xe2\x8f\x01\xb8wz\x10\x8cZ\x19\
-\xd3\x9f\xb4y\xf6\xba\xf8\xb5\xbd]\x82W\xee@\xbd\x8c\
-\xf7\xfeiC\xe3k\x9bg3\xf3\x95\x9b\xfbj\xdb\xb9\
-}\xbd\xb9\xbbJ\xcfY\xa3N\xf9\x9c\xf6k\xdd\xec\xd0\
-i\x94s\xf6\xe5\xa5&t\x9d\x11\x04Q\x00^\xedj\
-G\x97:\xfe?g\xc7\xfe^\xda\xc7C\x03d\x8c\xff\
-\x87\x0d\xf7\xd4uA\x96\x81\xfe\xed\x94\x8b\xcfE\x89z\
-t\x8cu\xe3\xf3'}{\x11\xed\xf3\xcfAK2P\
-h\x13\xbc\xde\xc4\x9bmv\xb8X B+\xca\xa8\x16\
-\xac\x8e\xfbr%\x9f\xa9\xbc\xde\xcd\xf2\x17;\x048\xdc\
-\xf0\xec\xbc\xf4\xe7`e\xb1{/;jEx\x96t\
-\xdc\x12`\xb6\x97]\x964h\xe1\xb7\x0d\x1cv\x97\xf2\
-9\xd0\x92e\xbf\x9b\x0d\xfaN\xb72hE\x04\xcbe\
-\xbe(Fmm\xae\x11q\xd3/\x94(r\x08pK\
-\xf0\xeb\x976\xfcU%\x9fQ\xaf\x19&\xa9b\x93\x9e\
-\xc5.\xc0\xf5\x87\xfa\x15\xa8\x97\xcb\xec\x0d\xb1:\x05\x9c\
-\xc9\x15\x11\x13.\xa9\xa2\xddo\x94\xbb\xe4\xfb\x16J8\
-\x5c@\xb1S(\xf3\xb8Z.\xe6l\xae\xdb\x9f\xb3%\
-\x9f\x08\xa8\x16,\xfb\xbd\xdd\x8b\x1c\x82\xe7\xe3u%\xdf\
-\x13q#\xd9\x85JcW\x0f\xf1\xfd\x85\x11\xbf\x8b\x9b\
-\x88\x88H\x854c\xc7\x8e\x9d\xec\x8f\xbf8++\x0b\
-\xeb\xd7\xafGBB\x02\xb4Z-\xaaU\xab\xe6=\x0b\
-q\xb9\xb0q\xe3F\x08\x82\x80J\x95*\xa9\xa6\xc1.\
-]\xba\x84e\xcb\x96a\xf7\xee\xdd\x08\x0a\x0aB\xd5\xaa\
-U\xff\xd4q\xf9t&w\x936<q\xe2\x04\x96-\
-[\x86\x83\x07\x0f\x22<<\x1c\xe1\xe1\xe1\x9e\xe7v\xee\
-\xdc\x89c\xc7\x8e!%%\xc5\xf3\xa3\xd3\xe9\x10\x16\x16\
-\xe6\xb3\xdc\xffm\xbe\xf4\xf4t,^\xbc\x18yyy\
-\x88\x89\x89\x81FS\xfe[\xebSSS\xb1w\xef^\
-\xaf\x5c\xb9\xb9\xb9\x88\x8e\x8e\xbe\xe3\x5c\xfe\xc8}'\xe7\
-\xe9\x8e\x1d;P\xb3fM\xe8t:$$$`\xfc\
-\xf8\xf1\xe8\xd5\xab\x97j\x075\xb7\xdb\x8d\xad[\xb7b\
-\xf9\xf2\xe5\xc8\xca\xcaBLL\x0c\xf4ze\xe9\xb5o\
-\xdf\xbeh\xd8\xb0!\x22\x22\x22T\x9b\xff\xf4\xe9\xd3\xd8\
-\xb7o\x1f\x02\x02\x02\x10\x12\x12R!rgeea\
-\xc3\x86\x0dHHH\x80F\xa3\xf1\xca\xa9\xb6\xec7\x1b\
-\x17\xedv;\xb6l\xd9\x82\xe5\xcb\x97\xc3l6\xa3n\
-\xdd\xba\x10\xae}@\xde_\xc7\xe0\x97\x19\xf4\xd6\xad[\
-1`\xc0\x00DGG#44\x14\x89\x89\x89\x187\
-n\x1cF\x8d\x1a\x05\x00\xc8\xc8\xc8\xc0\x90!C\x90\x98\
-\x98\x88\x09\x13&x\x1e\xf7\xb7\xad[\xb7\xe2\x89'\x9e\
-@\xed\xda\xb5Q\xa5J\x15\x1c8p\x00_|\xf1\x05\
-\xfa\xf6\xed{G\xc7\xe5K7k\xc3\xc5\x8b\x17\xe3\xb5\
-\xd7^C\xe7\xce\x9d\x91\x9f\x9f\x8fS\xa7Na\xc9\x92\
-%\xe8\xd6\xad\x1b\x00\xa0E\x8b\x16\xb0\xdb\xed\x08\x08(\
-\xbd/\xf3\xfa\xeb\xafc\xc0\x80\x01>\xc9\xfd\xdf\xe6[\
-\xbe|9\x9e{\xee9\xb4j\xd5\x0aiii\x88\x8c\
-\x8c\xc4\xf6\xed\xdb\xa1\xd3\x95\xef\xce\x8eI\x93&a\xc1\
-\x82\x05\xa8R\xa5\x8a\xe7\xb1f\xcd\x9a\xe1\xbb\xef\xbe\xbb\
-\xa3\x5c\xfe\xca}+k\xd7\xae\xc5\xb0a\xc3p\xf5\xea\
-U\x1c8p\x00u\xeb\xd6\xc5\xaaU\xab0l\xd80\
-\x9c?\x7f^\x95\x85\xc2\xe5ra\xf0\xe0\xc1\xd8\xb5k\
-\x17:t\xe8\x80\xa4\xa4$T\xae\x5c\x19\xabW\xafF\
-xx8\xaaT\xa9\x82\xa5K\x97\xa2{\xf7\xee\xaa\xcc\
-_XX\x88\x8e\x1d;\xe2\xe2\xc5\x8b\x981c\x06\x06\
-\x0d\x1a\x04\x00\xaa\xce\xbdi\xd3&\x0c\x1a4\x08\xd1\xd1\
-\xd1\x08\x0b\x0b\xc3\xfe\xfd\xfb\xf1\xf2\xcb/\xe3\x9dw\xde\
-Q]\xf6\x9b\x8d\x8bf\xb3\xd93\xe6\xb4m\xdb\x16\xfb\
-\xf6\xedC\xf7\xee\xdd\xf1\xc3\x0f?\xf8\xf5\x18\xfcr'\
-c\xea\xd4\xa9x\xfc\xf1\xc7\xb1g\xcf\x1e\xac[\xb7\x0e\
-\x93&M\xc2\x8c\x193\xe0r\xb9p\xe6\xcc\x19t\xe9\
-\xd2\x05\x11\x11\x11\xa8]\xbb\xb6j:\xa1\xc5b\xc1+\
-\xaf\xbc\x82\xe1\xc3\x87\xe3\xc0\x81\x03X\xbf~=\x86\x0f\
-\x1f\x8e\xc9\x93'\xc3\xe5r\xdd\xf6\xb8|\xe9Vm\xf8\
-\xee\xbb\xefb\xec\xd8\xb1\xf8\xed\xb7\xdf\x10\x1f\x1f\x8f\x8e\
-\x1d;b\xf6\xec\xd9^+\x04?\xff\xfc3\x92\x92\x92\
-<?\xbe*\xce\xffm>\xb3\xd9\x8c1c\xc6`\xf4\
-\xe8\xd1\xd8\xbau+\x0e\x1d:\x84\xac\xac,\xcc\x981\
-\xc3'++C\x87\x0e\xf5\xcaUR\x9co\x97\xcb\x9f\
-\xb9o\xe6\xab\xaf\xbe\xc2\xa0A\x83\xd0\xa7O\x9f\x0a\xb5\
-$x\xe0\xc0\x01\xacY\xb3\x06\xeb\xd7\xaf\xc7\x92%K\
-\x10\x1f\x1f\x8f\xb3g\xcfb\xdd\xbau\x15\x22\xff\xd4\xa9\
-S\x11\x12\x12\x82\xa8\xa8\xa8\x0a\xd3\xe6\x9f~\xfa)\xee\
-\xbf\xff~\xcf\xb8\xf7\xc5\x17_`\xe6\xcc\x99\xb8r\xe5\
-\x8a\xaar\xdej\x5c\x9c0a\x02\x02\x03\x03\x91\x92\x92\
-\x82\xe5\xcb\x97c\xf5\xea\xd5X\xbbv-v\xec\xd8\xe1\
-\xd7\xcc~)\xd0\xc3\x86\x0d\xc3[o\xbd\xe5\xf9\xbdN\
-\x9d:\xb0\xdb\xedp\xb9\x5c(((\xc0\x981c\xb0\
-h\xd1\x22\x04\x06\x06\xaa\xe6\xcd\xdd\xbbw/\xf2\xf3\xf3\
-\xf1\xe6\x9boB\x92$8\x1c\x0e\x8c\x1f?\x1e\xbbw\
-\xef\x86V\xab\xbd\xedq\xf9\xd2\xcd\xda\xb0\xb8\xb8\x18}\
-\xfa\xf4\xc13\xcf<\xa3,\x9f\x08\x02\xda\xb5k\xe7\x99\
-\x0dY,\x16X\xadVDDD\xc0\xedvC\x96}\
-\xbb\xb8\xf2\xdf\xe6\xdb\xbf\x7f?\xae\x5c\xb9\x82\xe1\xc3\x87\
-\x03\x00\xc2\xc2\xc20d\xc8\x10\xacY\xb3\xa6\xdc\xb3_\
-\xbe|\xd9\xb3\xfc\xf5\xc7\xf7\xfbv\xb9\xfc\x99\xfbf\xec\
-v;\xd6\xae]\x8b\xa1C\x87\xde\xf2uS\xa6LA\
-\x8f\x1e=\x90\x9d\x9d\xad\x8a\xf3T\x14EL\x9c8\x11\
-\x0d\x1a4\x00\x00DFF\x22::\xfa\x863\xfe]\
-\xbbv\xa1U\xabVX\xbbv\xad*\xb2\x1f=z\x14\
-_\x7f\xfd5\xa6O\x9f~\xcb\x95\x13\xb5\xe5\xb6X,\
-h\xd2\xa4\x89g9\xb8i\xd3\xa6\x90e\x19\xc5\xc5\xc5\
-\xaa\xca~\xab\xda\xb2l\xd92\x8c\x1d;\x16F\xa3\x11\
-6\x9b\x0d\xadZ\xb5\xc2\xd9\xb3g\xd1\xa1C\x07\xbf\x1e\
-\x83_\x0at\xef\xde\xbd\x11\x1a\x1a\x8aM\x9b6a\xe1\
-\xc2\x85\x183f\x0cF\x8e\x1c\x09\xa3\xd1\x88\xd6\xad[\
-c\xd8\xb0a\xaa\xbbJLIIA\x83\x06\x0d0a\
-\xc2\x04\xd4\xa8Q\x03111\xe8\xdb\xb7\xaf\xd7`|\
-\xab\xe3\xf2\xa5\x9b\xb5\xa1\xc9d\xc2\xe4\xc9\x93\x11\x19\x19\
-\x09\x00\xb0Z\xadX\xb6l\x19\xee\xbb\xef>\xcf,\x10\
-\x00&N\x9c\x88\x88\x88\x08\xd4\xaf_\x1f\xa3G\x8f\xf6\
-\xd9\x05\xc6\x7f\x9b/%%\x05QQQ\x9e\xfbv\x00\
-\xd0\xb8qc\xa4\xa4\xa4\x94{\xf6\x9c\x9c\x1cl\xdd\xba\
-\x15u\xea\xd4ATT\x14\x1e{\xec1\x9c;w\xee\
-\x8er\xf93\xf7\xcd\xbc\xfc\xf2\xcbh\xd3\xa6\xcd-_\
-\xf3\xf6\xdbo\xe3\xa7\x9f~\xc2\xbcy\xf3P\xbdzu\
-U\x9c\xa7\xed\xda\xb5\xc3\x88\x11#<\xbf\xef\xd9\xb3\x07\
-g\xce\x9cA\x8f\x1e=\xbc^\xb7c\xc7\x0e\xf4\xe9\xd3\
-\x07\xa3F\x8d\xc2\xc3\x0f?\xec\xf7\xdcn\xb7\x1b\xc3\x87\
-\x0f\xc7\xe0\xc1\x83\xd1\xb1c\xc7\x9b\xbeNm\xb9\x01`\
-\xf4\xe8\xd1\x98?\x7f>\xa6N\x9d\x8a\xd9\xb3g\xe3\xb9\
-\xe7\x9eC\x9f>}P\xb3fMUe\xbf\xd9\xb8\x98\
-\x95\x95\x05\x8b\xc5\x82\x8c\x8c\x0c4j\xd4\x08\x91\x91\x91\
-\xe8\xd4\xa9\x13\x12\x13\x13={\x17\xfcu\x0c~\xdb\xac\
-\x9f\x9b\x9b\x8b\xc9\x93'c\xe2\xc4\x89\x08\x09\x09\xb9e\
-\xa7T\x83\xf4\xf4t$%%!##\x03\x9b7o\
-\xc6\xaaU\xabp\xf1\xe2E\xf4\xeb\xd7\xafB\x1e\x97\xcb\
-\xe5\xc2s\xcf=\x07\x9dN\x871c\xc6x\x15\xc0Z\
-\xb5j!11\x113f\xcc\xc0\xd2\xa5K1e\xca\
-\x94\x0a\x91/;;\x1b\x95+W\xf6\xfa\xefT\xa9R\
-\x05f\xb3\xf9\x86W\xf3\x7f\xf7\x0c\xba\xa8\xa8\x08\xcb\x97\
-/\xc7\xfa\xf5\xeb!I\x12z\xf6\xec\x09Y\x96o\x9b\
-\xcb\x9f\xb9\xff\xaa\xf1\xe3\xc7c\xe9\xd2\xa5X\xb7n\x1d\
-\xea\xd5\xab\xa7\xca\x8ciii\x188p \xe2\xe2\xe2\
-\xd0\xae];\xcf\xe3\xdb\xb6mC\xef\xde\xbd\xf1\xc5\x17\
-_\xe0\xd9g\x9fUE\xd6y\xf3\xe6\xe1\xd2\xa5K\x98\
-4i\xd2M_\xa3\xc6\xdc\x00P\xb9re\x04\x07\x07\
-\xe3\xab\xaf\xbe\xc2\x9c9s\x90\x91\x91\x81\xe6\xcd\x9bW\
-\x88\xec%c;\x00\xcc\x9c9\x133g\xceDbb\
-\x22:w\xee\x8c\xfe\xfd\xfb#55\xd5\xaf\xc7\xe0\xb7\
-/*\x89\x8e\x8e\xc6\xce\x9d;\xe1t:1g\xce\x1c\
-\xf4\xed\xdb\x17'N\x9cP\xd5\x8e\xed\xeb\x95\xec\xd6\x9e\
-;w\xaeg0\xfd\xe4\x93O\xf0\xc8#\x8f ;;\
-\xdb3\x83\xa8\x08\xc7%\xcb2^y\xe5\x15\x1c=z\
-\x14\x1b6l@p\xb0\xf2?Dh\xd9\xb2%\x0e\x1e\
-<\x88:u\xea\x00\x00j\xd7\xae\x8d\xd4\xd4T|\xff\
-\xfd\xf7>-\xd2\x7f5_\xadZ\xb5\x90\x95\x95U\xe6\
-\xea\xb8J\x95*0\x99\xca\xf7\x7f^\xb2f\xcd\x1a\xd4\
-\xa8Q\xc3\xb3Z\xf2\xe5\x97_\xa2E\x8b\x16HNN\
-\xbem.\x7f\xe6\xfe+\x0a\x0b\x0b1k\xd6,DG\
-G\xfb\xf5S\x0a\xb7\x92\x95\x95\x85^\xbdz\xe1\x9e{\
-\xee\xc1\xfb\xef\xbf\xefu\xe17}\xfat\x00P\xcd\x85\
-EVV\x16\xde{\xef=\xcc\x981\x03:\x9d\x0ev\
-\xbb\x1d\xb2,\xc3\xe1p\xc0\xe9tB\xa7\xd3\xa927\
-\xa0,o\xf7\xed\xdb\x17C\x86\x0c\xc1\xe4\xc9\x93!\x08\
-\x02v\xee\xdc\x89\x9e={\xa2N\x9d:x\xe8\xa1\x87\
-T\x9b\xfd\x8fc{\xcf\x9e=\xf1\xc0\x03\x0f\x00P\xee\
-\xab\xaf\x5c\xb9\x12\x9b7oF\xbdz\xf5\xfcv\x0c>\
-\x9fA_\xbdz\x15\x13&L\xf0\xcc\x86t:\x1d\x9e\
-\x7f\xfey8\x1c\x0el\xdf\xbe]\xb53\xe8\x927E\
-\x14K\x9b\xec\xfa\x7f\xafH\xc7\xf5\xe6\x9bo\x22>>\
-\x1e+W\xae\xf4\xda\x8cr\xfc\xf8q\xfc\xf2\xcb/^\
-\xaf5\x18\x0cp\xbb\xdd\x15\x22_\x83\x06\x0d\x90\x9d\x9d\
-\x8d\x8c\x8c\x0c\xcf\xf3\xfb\xf6\xedC\xfd\xfa\xf5\xcb5\xaf\
-\xcdf\xc3\xc2\x85\x0b=\xef}I\xae\x92\xa5\xcb\xdb\xe5\
-\xf2W\xee\xff\xc6\x8e\x1d;`\xb3\xd90r\xe4H\xd5\
-e\xcb\xcb\xcbC\xaf^\xbd\xd0\xb4iS\xcc\x9b7\xcf\
-\xeb<\x05\x80Q\xa3F\xe1\xd1G\x1fE\xbf~\xfd\x90\
-\x97\x97\xe7\xf7\xbc\xfb\xf6\xedCQQ\x11^x\xe1\x05\
-DDD \x22\x22\x02\xe9\xe9\xe9\x18=z\xb4\xd7\x06\
-M\xb5\xe5\x06\x94\x8f\x17\x9a\xcdf\xf4\xeb\xd7\xcfs\x0f\
-\xbaK\x97.\x88\x8e\x8e\xc6\xa1C\x87T\x9d\xbdDL\
-L\x0c\x04A@\xc3\x86\x0d\xbd\x8b\xa3(z\xeds\xf1\
-\xc71\xf8\xbc@\x87\x85\x85a\xf5\xea\xd5x\xe3\x8d7\
-\x90\x91\x91\x81\xbc\xbc<|\xfc\xf1\xc7\x10EQ\xd5\xcb\
-\xdc\x0f=\xf4\x10bcc1r\xe4H\xe4\xe6\xe6\xe2\
-\xfc\xf9\xf3\x980a\x02Z\xb4h\x81\xea\xd5\xabW\x98\
-\xe3\x9a2e\x0a\xe6\xcf\x9f\x8f\x0f?\xfc\x106\x9b\x0d\
-\xc9\xc9\xc9HNN\x06\x00T\xaaT\xc9s\x1f\xc9f\
-\xb3\xe1\xc8\x91#\xf8\xe2\x8b/\xf0\xe0\x83\x0fV\x88|\
-\xed\xda\xb5C\xf3\xe6\xcd1j\xd4(\xe4\xe4\xe4`\xc3\
-\x86\x0dX\xb4h\x11^|\xf1\xc5r\xcdl4\x1a\xb1\
-m\xdb6\xbc\xf1\xc6\x1b\xb8|\xf92rss1n\
-\xdc8T\xaf^\x1dM\x9b6\xbdm.\x7f\xe5\xfe\xab\
-BBB<\x1f![\xbat)\xe6\xcc\x99\xa3\x9al\
-f\xb3\x19={\xf6\xc4\xa9S\xa70z\xf4h\x9c>\
-}\x1a\xc9\xc9\xc9\xc8\xcc\xccT\x96\x0c\xb5Z\xdc}\xf7\
-\xdd\x98;w.\x02\x03\x031p\xe0@\x9fo\xe2\xbc\
-\xd1\xd8r\xfc\xf8q\xaf\x9f\x1a5j`\xd2\xa4I\x98\
-5k\x96js\x03\xca\x86\xb0J\x95*a\xf2\xe4\xc9\
-HKKCnn.f\xcc\x98\x81s\xe7\xce\xe1\xde\
-{\xefUu\xf6\x12:\x9d\x0e/\xbd\xf4\x12>\xfb\xec\
-3\x1c>|\x18\x16\x8b\x05S\xa6LAnn\xaeg\
-\xff\x8b\xbf\x8e\xc1\xe7\x05Z\x10\x04\xfc\xf4\xd3O\xc8\xcc\
-\xccD\x8b\x16-P\xb7n],[\xb6\x0cK\x97.\
--\xb3\xd1D\x10\x04\xcfU\x99\xbf\x19\x0c\x06|\xfb\xed\
-\xb78z\xf4(\xea\xd5\xab\x87\xe6\xcd\x9b\xc3\xe5r\xe1\
-\xc7\x1f\x7f\xfc\xd3\xc7\xe5\xeb\xf6.i\xc3\xa2\xa2\x22L\
-\x9b6\x0d\x000h\xd0 t\xee\xdc\xd9\xf3\xe3p8\
-P\xbbvm\xcc\x993\x07\xef\xbd\xf7\x1e\x22##\xd1\
-\xbd{w\xb4n\xdd\xda\xf3y\xc6\xf2\xf6\xdf\xe6\xd3j\
-\xb5\x98;w.233\xd1\xb0aC\x0c\x1e<\x18\
-/\xbd\xf4\x12z\xf7\xee]\xee\xd9\x17,X\x80\x8c\x8c\
-\x0c\xd4\xaf_\x1f\xf5\xea\xd5\xc3\xe1\xc3\x87\xb1b\xc5\x0a\
-\x88\xa2x\xdb\x5c\xfe\xcc}'\xfd\xe7\x8f\xbf\x97\xccH\
-;u\xea\x84\x0f>\xf8\x00\xe3\xc7\x8f\xc7\xce\x9d;U\
-q\x9e\xfe\xfe\xfb\xef8v\xec\x18\x00\xa0[\xb7n\x9e\
-\xfe3z\xf4h\xafc\x08\x0a\x0a\xc2\xe2\xc5\x8bq\xec\
-\xd81L\x980\xc1\xaf\x99\x8dF#\xa2\xa2\xa2\xbc~\
-t:\x1d*U\xaa\xe4\xb57Am\xb9K\xfa\xee\xca\
-\x95+q\xf1\xe2E\xb4i\xd3\x06\xf5\xea\xd5\xc3\x97_\
-~\x89Y\xb3f\xa1s\xe7\xce\xaa\xcd\xfe\xc7\xda2~\
-\xfcx\xb4o\xdf\x1e]\xbbvE\xcd\x9a5\xf1\xed\xb7\
-\xdfb\xe1\xc2\x85^\xabX\xfe8\x06\xbf~\xd5gQ\
-Q\x11l6[\x99\x0d2j&\xcb2\xce\x9d;\x07\
-\x93\xc9t\xd3o\x95\xa9\x88\xc7u=\xb7\xdb\x8d\xd4\xd4\
-TDEE!((\xa8B\xe6;\x7f\xfe<\xaaU\
-\xab\xe6\xf3\x1d\xf4\x17.\x5c\x00\x80\x9b~\x8e\xf5v\xb9\
-\xfc\x95\x9b\xe8\xef\x18\xcf\x8b\x8b\x8b\xcb|\xbbbE\x92\
-\x9b\x9b\x8b\xfc\xfc|\xafo\x11\xf3\xeb\x85\x04\xbf\x8b\x9b\
-\x88\x88H}D6\x01\x11\x11\x11\x0b4\x11\x11\x11\xb1\
-@\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b4\x11\x11\x11\x0b\
-4\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b\
-4\x11\x11\x11\xb1@\x13\x11\x11\xb1@\x13\x11\x11\x11\x0b\
-4\x11\x11\xd1\xff(\xed\x8a\x15+\xd8\x0aDDD*\
-\xc3\xff\x9b\x15\x11\x11\x91\x0aq\x89\x9b\x88\x88\x88\x05\x9a\
-\x88\x88\x88X\xa0\x89\x88\x88X\xa0\x89\x88\x88\xe8\xef\xa2\
-\xf5\xe7_\xde\xbe}\xfb\x9b>\x97\x90\x90\xa0\xea\x86\xab\
-\xa8\xd9\xd9\xe6\xcc\xcd\xec\xec/\xcc^1rk\xfd\xdd\
-0s\xe7\xce-\xf3X\x5c\x5c\x5c\x85\xb8\xba\xa9\xa8\xd9\
-\xd9\xe6\xcc\xcd\xec\xcc\xcd\xec\xea\xcf\xcd%n\x22\x22\x22\
-\x15b\x81&\x22\x22b\x81&\x22\x22\x22\x16h\x22\x22\
-\x22\x16h\x22\x22\x22b\x81&\x22\x22b\x81&\x22\x22\
-\x22\x16h\x22\x22\x22\x16h\x22\x22\x22b\x81&\x22\x22\
-\x22\x16h\x22\x22\x22\x16h\x22\x22\x22b\x81&\x22\x22\
-b\x81&\x22\x22\x22\x16h\x22\x22\x22\x16h\x22\x22\x22\
-b\x81&\x22\x22\x22\x16h\x22\x22\x22\x16h\x22\x22\x22\
-b\x81&\x22\x22b\x81&\x22\x22\x22\xdf\x10\xf2\xf3\xf3\
-e_\xfde\xb5\xa6\x87\xfe\xe5?\x9b>\xa2\xc0\xaf\x0d\
-UQ\xb3\xb3\xcd\x99\x9b\xd9\xd9_\x98\xdd[RR\xd2\
-_\xfe\xb3\xadZ\xb5\xe2\x0c\x9a\x88\x88\xe8\xff3\xad?\
-\xfe\xd2\xfcIw\xfe\xda\xb0w\xd4\xd5`\x155;\xdb\
-\x9c\xb9\x99\x9d\xfd\x85\xd9\xbdu\xeb\xd6\xed\x8e_\x1b\x1f\
-\x1f\xef\xf3|\x9cA\x13\x11\x11\xa9\x10\x0b4\x11\x11\x11\
-\x0b4\x11\x11\x11\xb1@\x13\x11\x11UP~\xd9$\xa6\
-\xb6\x0d\x0e\xff\x1f\xb2\xb3\xcd\x99\x9b\xd9\x99\x9b\xd9\xbd\xf9\
-c\xe3\x17g\xd0DDD\x15\x9cO\xbf\xa8\xe4\x8f\xda\
-\xb7o\x8f\xb9s\xe7\x96y<..\x0e\x09\x09\x09\xaa\
-n\xb8\x8a\x9a\x9dm\xce\xdc\xcc\xce\xfe\xc2\xec\x15#7\
-g\xd0DDD*\xc4\x02MDD\xc4\x02MDD\
-D,\xd0DDD,\xd0DDD\xc4\x02MDD\
-\xc4\x02MDDD,\xd0DDD,\xd0DDD\
-\xc4\x02MDDD,\xd0DDD,\xd0DDD\
-\xc4\x02MDD\xc4\x02MDDD,\xd0DDD\
-,\xd0DDD\xc4\x02MDDD,\xd0DDD\
-,\xd0DDD\xc4\x02MDD\xc4\x02MDDD\
-\xbe\xa1\xf5w\x80\xb8\xb8\xb8\x0a\xdbx\x155;\xdb\x9c\
-\xb9\x99\x9d\xb9\x99]\xfd\xb9\x85\xfc\xfc|\x99\xd7)D\
-DD\xea\xc2%n\x22\x22\x22\x15\xf2\xe9\x12w|\x8a\
-\x16\xd3\xe3\x0d\xca\x95\x81\x00T\x0b\x96Q\xb7\x8a\x1b/\
-tr \xdcT:\x91\xff\xf9\xa0\x0e\xf3\xf7\x18\xb0\xf1\
-e\x0b\xfa|\x13\x88\x8e\xb1.\x8c\xecn\xf7<\xff\xee\
-:#.\x99\x05\xcc|\xca\xaa\x8aF\xb4\xd8\x05\x5c)\
-\x16\x10\x13.!\xabP\x84^#\xa3r\xa0\xff\x16&\
-z\xce\x0bD\x81M\x00\x00\x98t2\xa2\xc2d\xf4n\
-\xe1\xc4#\x8d\x9d\x9e\xd7\xb8%\xa0\xc9\xd4\x10L{\xdc\
-\x8a\x22;\xf0\xf6j#\x8e\xbfe\x86K\x02>\xdbj\
-\xc0\xce3Z\x84\x9bd\xbc\xde\xc3\x8eV5\xdd\xaa\xea\
-\xb4W\x8b\x05\xd8]\x02\xaa\x87H8\x7fUD\xb8I\
-F\xb0\xa1b,\x04\x9d\xbf*\xa2\x92I\x86 \x00\x97\
--\x02j\x85K\x10\x04\xff\xe5Y~X\x87o\x13\xf4\
-\x9e\xdf\xc3M2\xee\x8ap\xe3\xdf\xf78\xbc\xdat\xd6\
-\x0e\x03v\x9d\xd1`\xf1\xe0bt\xff<\x08/tv\
-\xe0\xd9\xb6\x0e\xd8]\xc0\xf4\xad\x06$\x9c\xd7\xa2F\x88\
-\x84\xb7\xfeaGd\x88\xe4\xb3\xfcI\x99\x1a\xbc\xb3\xd6\
-\x08\x00\x10\x00T\x0d\x96\x11[I\xc2\x90\x8evT\x0f\
-)\xcd\xbf\xf9\x94\x16\xe3V\x06`\xf7\xebf\xbc\xf2s\
-\x00\xaa\x06\xcb\xe8\xd7\xc6\x89y\xbb\xf4e\xfe\x9b\x83;\
-8\xd0\xb2\x1c\xfb\xfc\x8f\x07\xf4\xf8\xe9\xa0\xce\xf3{\xe5\
-@\x19M\xaa\xbb\xf1R\x17\x07L\xfa\xd2\xcc\x1fo6\
-\xe0T\x8e\x06\xf3\xfa\x15\xa3\xf3\xb4 \xbcy\xbf\x1d\x8f\
-\xb7pb\xef9-\xe6\xec\xd4\xa3\xc0*\xa0C\xac\x1b\
-#\xba\xdba\xd4\xfa\xae\xff_,\x101\xec\xe7\x00\xaf\
-\xfc5\xc3$\x0cl\xef@\xdd*\xa5\xef\xfd\x89\x1c\x0d\
-\xfa}c\xc2\xbaa\x16\xcc\xdfm\xc0\xb9+\x22\xbe~\
-\xa6\x18\xf9V\x01\xd3\xb6\x18\x90rYD\x9bh7\x86\
-w\xb5\xc3P\xce\x95\xe8\x92Y\xc0\x8bKL^\x99\xa3\
-B%\x0ch\xef@\xfd\xaa\xa5\x99S/\x8bx\xf2\xeb\
-@\xac\x8c+\xc2\x0f\xfbu8\x9e\xa5\xc1\xf7\x03\x8b=\
-\xcf/;\xa4\xc3\xf7\x89z,\x1aX\x8c\xa0k\xe7G\
-\xaeE\xc0'[\x8c\xc8\xcc\x17p_\x03\x17\x06\x1c\xb1\
-\x06\xa0\x00\x00 \x00IDATwp\xfcm\xe7\xb4\
-Og\xd0\xd9\x85\x02\xe2S\xb4\xc8.\x14P\xec\x00\x12\
-\xd35x\x7f\xbd\x11\x0f\xce\x0a\x82\xd9^zD\xbb\xd3\
-\xb4\x08\x0f\x90\xe1p)E\xbdf\x98\xd2\x80\x92\x0c\xcc\
-\xdcf\xc0\xb4\xad\x06$\x9e\xd7\x94{\xde\x1f\xf6\xeb\x11\
-;)\xc4\xf3\xd3\xf8\xfd`<\xf1u \x0e_\xf0\xfe\
-\xbb\xbf\xdc\xa1G\xdfo\x947\xbf\xc7\xe7\x81X\x94\xa8\
-\xf7\xbc\x99m?\x0eF\xe4\xf8\x10\xdc73\x08\x072\
-4>i\xe7cY\x1a\xa4\xe5\x89\x88\xad$A\xaf\x05\
-6\x9c\xd4\xe2\x99\x85&|\xb3\xb7t0:}Y\x83\
-\xecB\x01wE\xb8\xb1\xff\xbc\x161\xe124\x22\xf0\
-\xe9\x16#>\xdadDL%\x09\xc9\xd9\x1a\xfcsN\
- \xb2\x0b}SA\xc6\xfenD\xd8\x9b\xa1\x08{3\
-\x14\x95\xc6\x84\xa2\xe1\xbb!xzA \xd2\xf2\xbc\xbb\
-\xe9\x1b\xcb\x030~\x95\x11\x05V\x01->\x08\xc6\xee\
-\xb3\xde\xed\xfa\x9f\x8d\xca\x7fgO\x9a\xef\xae?\x1b\xbe\
-[\xdaO\xea\xbe\x13\x82\xce\xd3\x820#\xde\x00\xe9\xba\
-q\xb3\xd0\xa6\xe4=\x98\xa1\xc1\x82=z<\xf4e \
-\x04\x01pI@\xbb\x8f\x83\xd1\xf2\x83\xd2\x9f\xc5\xfb\xf5\
->\xbb`\x88O\xd1\xe2J\x91\xf2\x1e\x1f\xca\xd4`\xea\
-\x06#\x1e\x9d\x1d\x08[\xe9\xf5\x1c\xb6\xa7jQ%H\
-Fv\xa1\x88\xa4L\x0db+I\x90e\xa0\xef7\x81\
-\xf8,\xde\x88\xb0\x00\x19+\x8e\xe80\xf0{\x93O/\
-0\xae\x14)cJ\xc6U\x116\x17p\xf8\x82\x06\x1f\
-m2\xa0\xdb\xe7A^\xfdv\xef9-Lz\x19Z\
-\x11\xd8\x92\xa2C\x8dP\x19\xd9\x85\x02V\x1c\xd1y~\
-~<\xa0\xc7\xc2}z\x5c\xb5\x96o\x7f?wEi\
-\xf3\xc2k\x17\xd1\xfb\xcfk0e\x9d\x11\xbd\xe6\x07\xc2\
-\xe9\xf6\x9e\xd0T\x0d\x92p6W\xc4\xc9\x1c\x0d\xeaT\
-\x96p\xa1@D\xafy&\x9c\xca\x11\x11\x1d.\xe1\xe3\
-\xcd\x06\xbc\xb3\xc6\xe0\xd36/r(\xd9N_\x12\xe1\
-t\x03'sD|\xbe\xcd\x80n3\x82p2\xa7\xf4\
-\x5c\xdc\x7f^\x03\xb3]@\xf5\x10\xd9s,n\x09x\
-\xfc\xab@\xcfE\xe1\xd4\x0dF\xf4\xff.\xb0\xdc3\xdb\
-\x5cJ?9\x95\xa3d>\x95#b\xe6v\x03\xba\xce\
-\x08\xc2\x91\x8b\xa5\x99\x0fdh\x90W$ *L\xc2\
-\xf6T-\xaa\x06\x95\x9e\xc0[S\xb4\x18\xb1,\x00\xf1\
-)Z\xcf\xfb$\xc9@\xcf\xf9\x81X\xbc_\x87\x02\xab\
-\x80\x91\xbf\x06`\xe6\xf6\xbf\xef\xfd\xf0\xcb&\xb1\xd7\xba\
-9\xd0\xaf\x8d\x03\x00\xf0\xc1F#>\xd8h\xc0\xfc]\
-zt\x88uc\xe3I-6\x9dR\x1a\xe6\xcd\xdf\x02\
-`w)\x83\xc3S\xad\x9cx\xe8\xcb \x1c\xba\xa0\x81\
-I\xe7\x9b\xabE\xbb\x0b\xc8\xb7\x0ax\xba\xb5\x131\xe1\
-\x12\xb2\x0b\x05\xfc\x92\xa4\xc3cs\x03\xb1\xe7\x0d\x0b\xa2\
-B%\xcfU|\xab\x9an\x5c2\x0b\xc8*\x14\xd1:\
-\xda\x8d\xd4\xcb\x22\xe2\x96\x98\xd06\xc6\x85\xb8\xbb\x9d\x98\
-\xb6\xc5\x80g\xbf5!y\xbc\x19\xa2\x0f\xea]L\xb8\
-\x84\x85\xfd\x95+\xbf\xcb\x16\x01\x9d\xa6\x05\xe3\xbd\xf5F\
-\xf4k\xe3\xc0K?\x99\x90](B\x10\x80\xc9k\x8c\
-\xd8\x97\xae\x85V\x94\xff\xaf\xbd3\x8f\xaf\xe9\xce\xff\xff\
-\xf3\x9c\xbbf\x8f$Dd\x91\x10\xb1\x0bZEi\x8b\
-\xaanc\xd0\x8dN\x07\xa5\xebh\xcd\xd0R\x94\xa2\xa8\
-\xdft\xda\xb1tL-U\xd5V\x8d2F\xed\xb4\x8c\
-}/\xb1G\x08\x09A,\x89D\x92\xbb\xdf{\xce\xef\
-\x8f\x93\x9cJ\xd5\xd2\xc7pof\xbe\x9f\xe7\xe3q\x1f\
-\x0f\xf7\xde\x1c\xde\x9fw\xde\xe7\xf3\xfe\xbc_\x9f\xf7\xe7\
-\xe0\xdf\xc7\x8d\xc4\x86)\xbc\xf7\x98\x93\xc1\x1d]|\xf3\
-\xa3\x997\x16\x06q\xf4\x82\x81\x9a\xe1^\xbf\xc5\xc7\x80\
-\x07\x5cT\x0bV9Y``\xf1~\x13\xddf\x85\xb0\
-\xf3\xed2\xbd\xba\xc88k\xe0\xa5\xb6n\x0e\x9e7\xa0\
-\xaaT\xaa\xf0\xf7\xe5\x19\xf8\xebz\x8b\xdfc\xfa\xaaS\
-\xa2F\xa8\xb6\x22/qJ\xfcp\xcc\xc4\x98UV\xdc\
->\x18\xfa\xb0KO~\x00\xcd\x13||\xb9\xdb\xac\xdb\
-}\xfc\x92\x81\x13\x97e\xda$\xfb\xa8Y^}\xc6\x84\
-*~\xb5\x7f\xec\x13N:\xa5yQU\x18\xb1\xdc\xca\
-\x8c\xad\x16\x16f\x98\x09\xb7j\x93\xeb\xce\x5c\x03\xa91\
-\x12\x83\xff\xa5U\xab\xcb\x0f\x1b\x091\xabl8ad\
-\xf8#.\x86?\xe2d\xe5\x11\x13yE\x12\x1e\x1f\x98\
-\x0c\xfe\xf5\x7f\xdf\xd6n\xfe\xf8\x90\xe6\xe7\xd9\xdb\xcd\x0c\
-\xf9.\x88)\x1b-<\x7f\x8f\x87%\x07L\xac:j\
-B\x96`\xc42M}\xdb\x95k\xa0\x7f\x1b\x17\xb9\xef\
-\x97\xe8*\xd8\xfd\x93By(\xd5K\xc7z\xfe\x89\xf5\
-\xff\xd7\xd5A\xebd\x1f\x8a\x0a\x83\x16\x07\xf1\xd5n3\
-K\x0f\x99\xf0)\xb0#\xc7H\xc6Y\x03>Eb\xc4\
-r\xcd\x99+\x8e\x98h\x95\xe4\xc5\xe9\x95\x98\xf8['\
-\x1d\xeby9~\xc9\xc0\x9e3\x81\xe9\xf5}\xb2\xb1\x97\
-\x8f\xbak*\xe6\xdaL#=\xbf\x08a\xfc\x1a\x0b\x1f\
-tu2w\xa7\x99\xad\xa7\x8c\x98\x0d*cWY9\
-r\xc1@D\x90\xca\xfa\xe3F\xf6\xe5\x19\xf8K7\x07\
-\xaf\xb6s3\xe4\xbb fo7\x93y\xd1@\xc3\xd8\
-\xbb\xaf\xd4=\xd2\xc0\xcb'\xcf8\xf4\x05P\x8f\xd9!\
-\x8c[me\xca\xd3\x0efo7\xb3#\xd7H\xb0\x19\
-\xc6\xad\xb6r\xe0\x9c\x01\x93AS\x0cfn33u\
-\xa3\xa5\x92\xd2[\xb1\x089\x92o`t\xf9\x9c\xd9\xfa\
-\xafa|\xb9\xcb\xac\xc7\xe2\x7fe\x82\xbe\x96\x97\xdb\xba\
-\xf8\xf3\x0f\x166e\x1bI\x89V\xd8}\xda\xc0\xd9b\
-\x99\xea\xa1>6\x9f4b5\xaa\x5c,\xd5*\xa8\xb8\
-p\x85\x0f\xbb9\x18\xb8(\x08\xaf\xe2\xcf@\xf4\xd0\xad\
-\xa9VN\xb4\xaf\xe3\xe5\xf5o\x83\x99\xb3\xc3Lb5\
-\x85\xb9\xbb\xcc\x1c\xbb \x13\x19\xac\xb2\xe7L(\x00\x1f\
-\xac\xb5\xf2AW\x07O7\xf7\xf0\xe6\x83.\x9a\xd6\xf2\
-\x91S(\xf3\xe9\x16\x0b\x856\xa9\xd2\xaa\xcc\x1fT\x0f\
-U\xe9\x9c\xe6a\xc1>\xb3\xbe\xc2=[,\x11\x17\xae\
-\xa0\xa8\x9a\xb2\xd1&Ys\xe8Km\xdd\xe5\x13\xb0\x89\
-O6Yh\x9e\xe0\xa3M\xb2\x7f%\xee>\xf7yh\
-P~\xb3\xd6\x8e\xb2\xf2\xe1\x0f\x16\xbe;h\xe2\xc09\
-\x03k3\x8d\x9c.\xd2V\xec\xaa\x0a\x92\x04\xc3\x96\x05\
-\xf1\xc5\x0bv\x9c^\x89?,\x0c&*D\xe5R\xa9\
-\xffu\xe3Z\x11\x8a\x9e\x8c\xdf\xed\xe2\xe2\x9e\xbf\x84\xf2\
-\xb7M\x16^n\xeb\xa6\xc7\xec\x10\xae\xd8$d\x09~\
-;+\x84\x13\x97d\x82\xcd\x9a\xbaQQ\xbd~\xd8\xcd\
-A\xdd\x18E\x97\xce\x02\x81$A\xdf\xd6\x1efl\xb5\
-\xb0\xe5\xa4\x91\x87\xeb{9S$s\xd5!\x11\x15\xa2\
-r\xfc\x92\x81\xa8`\x15\x9f\x22q\xe2\xb2v_\xba}\
-\xf0\xe2\xbc`\xe2\xc2\x15\x86vv\xf9=9\xff\x9c~\
-m\xdc\x8cX\x1e\xc4\xa6\x13F\x1em\xe8e\xff9m\
-\x01\xd4\xa8\xa6\x8f\x0d'L\x18dm\xe1\xad\xa8\x12\xa0\
-\xf9z\xfc\x1a+v\x8f\xc4\x84\xdf8\xfdn\xaf,A\
-\xefVn\xbe\xdamf\xebI#\xcd\x13|\x9c*\x94\
-\xb1\xbb%\x22\x83\x142/\x1a\xa8\x11\xa6\xe2\xf4\xc0}\
-\xb5}\xc4\x85+L\xd9`a_\x9e\x81\xfd\xe7\x0c\x8c\
-\xec\xe2\x0c\xf44\xce\xa3\x0d\xbd\xd4\x8e\xd2\xaa\xce2\x97\
-\xc4\xfes\x06\x0e\x9f\x97\x89\x8f\xd4\x16qN\x8fV\xf0\
-\x14\x94i1\x13\x11\xa4\xf9=%Z\xd1\xa5e\x7f$\
-\xe8k\xe9P\xcfK\xbd\xea\x0a[O\xfdd\xf3\xa1\xf3\
-25\xc3U6\x9f4bsK\xb8}\x9ab\xa0\xaa\
-\xf0\xc5\x0bvv\xe6\x1a\x99y\xcd\xb6Hn\xb9\xba\x97\
-\x1c\xadmU\xd5\x89QX\x9feDQ\xb9#\x85X\
-\xc0\x9b\xc4\xa2C4\xd9\xa9\xc0&\xd1#\xdd\xc3\xf8\xf2\
-\x1b\xe4\x9b\xbev:\xa4zi\x9d\xecca\x7f\x1b\x00\
-_\xf6\xb6\x07|?\xb4c\x9aW\xaf\xd4\x1a\xc4*<\
-PW[\xd1>\x95\xee\xa1F\xa8B\x5c\xb8B\xf7f\
-n\xeeI\xf41\xb3\x97\x9d\xa6\xb5|\x94\xba\xb4\x8a*\
-\xa9\x9a\xe2\xf7\xe4\xac'\xe90U\x97Y\xe7\xfe\xdeN\
-\xcdp\x95g[x\x18\xf9\xa8\xe6\xef)O\xdb\xe9\x94\
-\xf6S\xe5\xf0\xf5n3g\x8b$\x92\xa3\x14\xbf.\x86\
-~\xce\x03u5\x9b\xf6\x9f3\xf0P=/mR|\
-H\xc0\xeb\xed\x5cD\x85\xa84\xab\xe5\xe3\xf1\x86\xda\xe2\
-i\xdcj\x0b%\x0e\x18\xd2)\xf0\x13V\x90I\xa5M\
-\xb2\x8f\x12\xa7\xc4\x99\x22\x99\xee\xcd<X\x8c\x90\x1e\xef\
-\xa3s}/6\xb7D\xd7&\x1e\x92\xaa\xa9\x1c*\x97\
-\xd8\x9e\x98\x1eB\xe2\xe8pz}\x11\x8c\xcd\x1d\xb8\x8d\
-\xe9\x1a\xe5\xd5{\xa1M\xa2WK7/\xb5uc2\
-\xc0\xbc>6\xd2j\xf8\xe8\xd2P\xab\x9c.\x95O\xb6\
-_\xed6S;J\xe1\x9f\xfb\xcd<7'\xa4\x92\xac\
-\x1f\x08\x0c2D\x87(\x5c\xb1\xcbt\xac\xe7\xe5o\xcf\
-8PU\xf8\xf49\x07\xdd\x9byH\xab\xee\xe3\xbbW\
-l\x04\x95+q\x97J%\xbe\xdcm\xe6\x8d\x07\x5cz\
-\xe2\xf07\xb1\xe5\xfb\xe5\x856\x89\x17[k\xfb\xfb!\
-f\x95\xf9/\xda\xa9\x1d\xa5\xd0\xb5\x89\x87\x09\xbfq\x12\
-\x11\xa4\xf2hC/\x9b\xb2\x8d|\xb4\xceB\xb0I\xe5\
-\xbe\xda^\xaa\x02\xb1a*\xa5.\x89z\xd5}|\xdb\
-\xcf\x86\x82\xc4\xd8'\x9c\xbc\xda\xceM\xb8Ue\xf9k\
-6\xba6\xf5\x10\x1d\xa2\xf2\xf9\x0e\x0b\xeb\xb2\x8c|\xb3\
-\xc7\xa4\xab|\x81\xb1Y\xc1\xe9\xd1\x16\xd7\x8b_\xb2\x95\
-/\xae\x9d\x0cx@\xdb\xd7_\xfe\x9a\x8dz\xd5\x15\xc6\
-=\xe9\xa4G\xba\xe7\xba\xeb/\xdb\xb4{\xa0\xa2\xb2\x8e\
-\xb0\xaax|Z\x9f\xcc\x1dY\xbc\x05\xfa\x97Z\xea\x92\
-\xf0*\x10f\x81m\xa7\x8c|\xb4\xde\x8aQ\x86Y\xdb\
-\xcc\xfc\x90e\xa4\xc8.1a\xad\x95\xaaBd\xf9\x0d\
-\x5c\xe6\x96h\x93\xec\xa5]\x1d\x1fF\x19F?\xee\x22\
-2X\xa5}]\xad\xd9\xa3\x02\xbb[\xe2\xd9\xcf\x839\
-Y \xf3a\xb7\xc0%\x8e\xc2\xf2*-\xd8\xac2h\
-q\x10\x87\xce\x1b\xd8s\xda\xc0\xc8\x15Z\xb3\xc7\xa7[\
-,l;\xf5\x93\xa0\xb2\xb0\xbf\x8du\x03m|w\xd0\
-\xc4\xc7\x01\x90\x8c+\x88\xb0j\xfe\xb6\xb9\xe0\x89F\x1e\
-\xea\xd7\xf0Q'F\xe1\xadN.|\x0a\xfc\xb6\xa9\x87\
-\xe7Zz\xd8v\xca\xc8\x8c\xad\x16\xa6>\xe3\xd0\x7fG\
-U%V<>\x18\xd4\xc1\x85\xdb\x07=\x9ayt\x09\
-\xf5\xdd.N\x1a\xc4\xfa\x88\x08Ry\xb8\xbe\x97/{\
-\xdb\x19\xf3\xb8\x935\x99&&\xfd\xdb\x12\xf0X\x09\xb3\
-h\xfb\xcaS6Z\xb0\x18U\x86-\x0dbG\x8e\xb6\
-\x8f7~\x8dUo\x22\x1b\xdc\xd1\xc5\xfbO8\x19\xd4\
-\xd1\xc5\x8fg\x0c\x9c\xb8\x14\xd8iEU\xa1\xd8.\x11\
-bQ9p\xce\xc0\x98U\xda\xfc\xf1\xed>m\xaf\xd9\
-\xa3H\x8c]e\xc5U\x9e\xd7\xe6\xed1\xe3\xf1\xc1\xef\
-\xeeu\x07\xde\xe7V\x95o\xf7\x99\x98\xbe\xd5\x82\xd9\x08\
-o\xfd+\x88\xbdg\x0c\x1c<o\xe0\xc3\x1f,,\xde\
-ob\xee.3_\xf5\xb6sf\x5c\x09i5|\xf4\
-\xf9:\x04\x9f\x12\xf8x/\xb2K\x98\x8d\x9a$\xfc\xce\
-\xd2 \xdc^M\xfa\x9e\xbb\xcbL\x90I\x93\x8d\xedn\
-\xf8\xba\x8f\x9dR'\x0cX\x18LR\x94\x16C\xd5\x02\
-t\xcf\x16\xd9%\x0c\xb2\xe6\xffw\x96\x06awK\xac\
-\xcf22{\xbb\x99\x10\x0bLXc\xe5\xfc\xd5\x1b\xc7\
-sh\xf9\xb6\x9b\xbd|A]\xe6\xd2T\xa8;\xd5\xb4\
-\x1ap\x89{S\xb6fB\xab\xda^.\x95J\xfcx\
-\xc6@L\xa8\xca\x8fg\x0c\xe4\x15\xc9D\x87\xf88x\
-\xce@U\xa1Bn\xaf\x1e\xa2\xc9\xdb\x1f\xad\xb3 I\
-\xf0\xd8\xa7!d]\x94\x09\xb7j\x12\xe6\xb2Wm\xd8\
-\xdd\x12\xcf\xcd\x09f\xf7i#S\x9fq\xf0x#O\
-@lvz%6g\x1b\x89\x0cRiTS\xe1\xc4\
-e\x19\x97WK \x87\xf3\x0d\xd4\x0cW(qJ\xb8\
-\xbc\xf0\xe1\x0f\x16\x22\x82T^o\xef&1R\x93m\
-.\x94\x06n\xc2=\x7fU\xd2+\x8c\xf7W[\xf9z\
-\x8f\x19\x97\x07:|\x12\xca\xa9\x02\x99\xafv\x9b\xc9-\
-\x949p\xce@d\x90\xca\xaa#&N\x95\xcbN\x9f\
-l2\x13fUi\x12\x17\x18\xd5%\xbf\xbcI)\xc8\
-\xa4\xd9{\xa6H\xe6\xf3\x1df>\xdb\xae\xc9_\xcf\xcc\
-\x09\xe1\xdd.N\xde\xe9\xec\x024i\xbcs}/\x9f\
-l\xb4\xb0='p1\xff\xef\xe3\xda=\xd96\xc5\xc7\
-\x15\xbb\xc4\xb1\x0bZ\xe7\xf9\xd1\x0b\x06\x8a\x1d\xda$|\
-\xb6X\xa6]\x1d-\xc3U$\x87\x8a\xde\x10\xb7O\x0a\
-\xe8=\xba\xeb\xb4\x01\xa7W\xe2\xbe$\x0fW\xec\x12;\
-r\x0c\xba\xfd\xc7/\xc94\x88\xf5\xb1\xff\x9cA\x97\xb8\
-\xd7\x1e3\xd12\xd1Gl\x98ZE|.s\xfc\x92\
-Ll\x98\xa6\xae\xd8\xdc\x12FY\xe5|\x89\x8c\x8a\xe6\
-\xdb\xe6\x09>\xccFh\x16\xaf\xb03\xd7\x88\xdd#\x05\
-\xf4$\xc3\xe9+2\xb9WdZ%i\xea\xd0\x96\x93\
-F\x82L*g\x8be\x0e\x9f\x97\x89\x8bP\xd9\x7f\xce\
-@\xa9S\x22*X\xe5\x1f\xfd\xec$G)L\xd9h\
-a\xcdQ#IQJ\x00\xe6\x16\x99\xec\x02\xad\x7f\xc8\
-\xed\xd5r\x91\xd5\x04\xf9%2\x87\xce\x1b\xa8\x1e\xaa\xd9\
-ls\xdf\xbc\x02\xbfV\x01\xb8\x5c&S=T\xc5|\
-\x872k@\x12\xf4w\x07M\x1c>/s\xd9&\xb3\
-\xe2\xb0v\x9c\xe7\x0f\xed\xdd\xd4\x8aP\xf8\xeb\xbf-<\
-\xd1\xd8K\xd7&\x1e\x1e\x98\x12\xca\x97\xbf\xd7$\x9e\xaa\
-\x80\xaa\xc2\xe7;\xb4\xfd\x87\xce\x0d\xbc4\x88U0\x19\
-\xa0e\xa2\x8f\xb6\xc9^\xf6\x9f\xb5\xd0\xb7\xb5\x9b\xe4(\
-\x1f\xaa\x0a/\xcf\x0fb[\x8e\x91\xbf?\xeb\xf0\xfb\xea\
-\xfc\x5c\xb1\xcc\xa0\xc5A\x5cuj\x8b\x9e\xb3\xc52\x7f\
-\xfe\xad\x83`\xb3J\xaf{<\x1c\xc97\xf0M_;\
-O\xcc\x08\xa1E\x82\x8f\x89]\x9d\xba\x5c\xb9\xea\xa8\x89\
-b\x87\xd6\xad\xab\xaa\xf0\x9b\xc6\x01ZXx\xe0\x8b]\
-Z%\xd9\xa5\x81\x87+v\x99\x99\xdb\xa0S\x9a\x97p\
-\xabV\x1d\xf5n\xe5&\xa9\x9a\xc2\xc9\x02Yoh\xaa\
-\x90\x873\xce\x1a\xf4\xca\xc4\xdfd_\x96\xd9\x94m$\
-\xad\x86B\xdd\x18\x1f\x0db\x15\x0e\x9c3\xd0\xe7>7\
-\x0b3\xcc4\x8b\xf7\xd1\xbd\x99&q\xbf\xbb\xdc\x8aO\
-\x91\xf8\xb0\x9b\x03\x9b[\xc2\xee\xd1&1\x7f2c\xab\
-\x85e\x87L\xe4\x97\xc8\xac\xcf2\x92\x1c\xa5\xf0B+\
-\xed\xa8\xd5\xc4\xef\xad\x0c\xee\xe8\x22>R\xe1wsC\
-ty\xd8\xe9\xd1\xfaB\xa6m\xb6`2\xc0\x17;\xcd\
-$US\xa8_\xc3\xff\x0b\xa2\x1f\x8e\x19\xb9\x5c&Q\
-P&\xb1\xea\xa8\x89 \x93\xca\xa0\x8e.\x1a\xc4*4\
-\x88UH\x8eV\x18\xd6\xd9I\x83\x09\xe1|\xf2\x8c\x83\
-{\x934\x1b\x15U\xdb\xae\xea\xd7\xc6\xff\xd5\xf3\xd4\x8d\
-\x16j\x84iI\xec\xdf\xc7\x8d\xd4\x8fUx\xb6\x85\x07\
-\x93\xac2a\x8d\x85\xe1\x8f81\x1b`\xc0\xc2 \x96\
-\xbff\xc3(k\x0d\xb3\x92da\xf8R+\x8f6\xf4\
-\xf2\xcf\x0c\x13\xcd\x13|\x01I\xce\xbbOk\xeaD\xa1\
-Mb]\x96\xd6\xdc6\xfc\x11\x17M\xe2|<P\xd7\
-\xcb\xb9b\x99\x05\xfdl$\xbe\x17\xce{\x8fj\x12\xb1\
-\xc7\x07i\xe3\xc3\xa9\x1e\xaa2\xe0\x01\x173\xb6\x9a\xa9\
-\x1f\xab\xf8m\xebro\x9ef\xf3\x15\x9b\xc4\xfa\xe3F\
-\x5c^\x18\xd6\xd9I\xfdX\x85Ni^\x8e\xe6\xcb,\
-y\xd9F\xed1\xe1\x0c\xef\xe2\xa2W\xcb\x9b\xc7E\xdb\
-\x14\xcd\xf73\xb7\x9a)sis\xed\x0bwp\xae\xf7\
-k\x82\x0e\xb3Br\x94B\xd6E\x99\xac\x8b2\xa1\x16\
-\x95'\x1b{y\xbb\x93\x93Z\x11\x0aN\xaf\xc4\xb1\x8b\
-\x06F>\xea\xe2\xc09\x03\xd1!\xea/&\xe7\xf8H\
-\xd5\xaf\xfb\xa2cVZ\xf9x\xbd\x85\xcbe2\x17J\
-\xb4\xb3\x87/\xdc\xeb\xc6b\x04\x87G\xe2\xd9\xe6.R\
-\xa2\x15\xfe\xb6\xd9\xc2{\x8f9\x091\xab\xac>\xaau\
-\x8e\x1ae\xf8\xcb:\x0b\x7fY\xa7%\x9a\x15\xaf\xdb\xf4\
-ccw\x8b&q>\xae:\xb5\xa6\x07\x93\x01\x9a\xc7\
-\xfb\x18\xff\xa4\x93\xee\xcd\xb4D{\xfc\x92\xcc\xfd)Z\
-\xf5\x93W$\xf3Z\xbb\x9f\x02j\xf2S\x0e\x82L*\
-swi\x1d\xbc\x93\x9fr\xf0\xdb\xa6\xfeM\xd0O\xcd\
-\x0e\xc6l\x80Ke\x12v\xb7D\x9f\xfb\xdc\xb4I\xf6\
-QhS\xb0\xbb%\xfe\xd0\xde\xcd\x81s\x06jWS\
-\x18R\xde\x94\xf5\x5c\xcb\x9fl\x5c\xb8\xcf\xc4\xab\x0b\x82\
-\xf9\xe2\x05\x07mS\xfc\xb7?w\xe8\xbc\x81\x0e\x9f\x84\
-bsI\x9c.\x92\x91\x80\x8f\xba\xdb\xb1\x9a \xad\xba\
-\x8f\xba1\x06\xde\xea\xe4b\xc1>3\xdd\x9az\x18\xd4\
-A\xb3\xdd(\x9b\xf8t\x8b\x99\x0b%\x12\xe7K\xb4c\
- \xd7n\x93\xdc\xd5-\x84 \xed\xdc\xf0\xf1K2'\
-.\xcb\xc4\x86)\xf4o\xeb\xe6\xad\x8e.\xc2,*y\
-E2\x05e\x12\xcd\x13|\xac\xcb2\x92V\xc3\xa7\xef\
-\xddZM\xb0\xf4U\x1b\x83\x16\x07\xf1\xc1Z\x0b\x8d\xe3\
-\x14>\xee\xee\xb8c\xd5\xc3\xed\x10l\xd6\xe6\x94\xbc\x22\
-\x99\xbc\x22\x99 \x93J\x87T\xaf\x9e\x9cUU\xeb_\
-\xe8\x91\xeea\xffY\xed~\xb8VQ)\xb2K\xc4G\
-(\xa4U\xf7\xdf\xa2\x22\xb2\xdc\xe7G/\x188vI\
-\xdb\xf3\x7f\xad\x9d\x8b\xb7:i\xfb\x9e\xc7.jUs\
-\x8b\x04\x1f\xf3\x7f4\xd3\xb4\x96\x82\xb1\x5c\xc4z0\xd5\
-\xcb\xa4\x1e\x0e\xa6l\xb4\xb01\xdbH\xab$\x1f\x93\x9e\
-\xf2\xef\xf3 L\x06\xcd\xe7W\x1d\x12K\x0f\x9a\xb0\x9a\
-\xb4\x8a\xfe\xb5v.\x1eL\xd5\xee\xb7\x8c<\x03]\x1a\
-z9q\xd9\x80\xc3#\xe9\xe7\xcaM\x06\x98\xfe\x9c\x9d\
-\xb7\x96\x041|Y\x10\xf7\xa7h]\xd5w\xfbd\x8b\
-Q\xd6l\xb6\xb94\x9b-&h\x12\xa70\xe5i\x07\
-\x8f4\xf0\xea\x0b\xfa6\xc9^N\x15\xca\x948%\x9a\
-\xc7_?wT\x0bVH\x8eRt{#\x82\xb4>\
-\x81\xb7\xfe\x15\xc4\xf85V\x1em\xe8\xe1\xfd'\xef\xdc\
-V\xa6x\xd4\xe7M\xd8\x9ecd\xe15\x0f\x14\x086\
-\xab4\x89Sx\xba\xb9\x96\x9c\xaf\xd8%\x9e\x9a\x1d\xc2\
-\xb4g\x1d\x1c>/\xb3\xe2\x88\x89y\xe5\x87\xda\x97\x1c\
-0\xe9\xf2\xfd\xb5\x8cz\xd4IL\xa8p\xf9/\xf1\xaf\
-\x03&6\x97\xfbL\x92\xb4\xa6\x93{\x12\xbdt\xae\xef\
-E\x92\xb4\xf3\xdd\xa3VX\xf9\xba\x8f\x9d/w\x99)\
-qJ\xbc\xfb\x0b\x1d\xac{\xf3\x0c|\xbd[;\xeaP\
-'\xc6?+\xb9\xa1\xdf\x05\xe9g#\x0d2\xe5\xcd\x82\
-\x1eR\xcb\x1f\x820~\x8d\x15\xaf\x02#\xbb8yl\
-z(\x13\xbb:\xf4\xeex\xaf\x02\xb3\xb6YX\x7f\x5c\
-;\xb5\xd0\xbf\x8d\x9b\x87\xeb{E@\x08\x04\xff\xc7\x11\
-\x09Z \x10\x08\x04\x82*\x88a\xf8\xf0\xe1c\x03\xf5\
-\x8fo\xda\xb4\x89\xa3G\x8fR\xa7N\x1dd\xf9\xa7F\
-\xa4\xb2\xb22\x96.]\xca\xae]\xbbHHH $\
-$\xa4\xca8\xec\xc0\x81\x03\xac^\xbd\x9a\x9c\x9c\x1c\xaa\
-U\xabFhhh\xa5\xef\xab\x92\xed\xf9\xf9\xf9l\xd9\
-\xb2\x85\x84\x84\x04L\xa6\x9f\x94\x80K\x97.\xb1x\xf1\
-b\xb6o\xdfNhh(\xd5\xabW\xaft\xdd\xe9\xd3\
-\xa7\x99?\x7f>\x85\x85\x85$%%a0\x18\x02b\
-\xfb\xda\xb5k\xd9\xbd{7F\xa3\x91\x1a5jT\xfa\
-\xde\xeb\xf5\xf2\xc3\x0f? I\x12QQQ\x00l\xdd\
-\xba\x95\xc3\x87\x0fs\xe2\xc4\x09\xfde2\x99\x88\x8c\x8c\
-\xf4\x8b\xcd\xb7\xf2\xeb\xad\xc6\x14\x88\xd8\xf9%?\xfe\x9c\
-\xcc\xccL\x16/^\xcc\xbe}\xfb\xa8V\xad\x1a\xd5\xaa\
-U\xd3\xbf\xcb\xce\xcef\xe7\xce\x9d\x95|^PP@\
-bb\x22\xbbw\xeff\xe4\xc8\x91t\xef\xde\xfd\xae\xd8\
-\xee\xf3\xf9\xd8\xb0a\x03K\x96,!??\x9f\xa4\xa4\
-$\xcc\xe6_~\x02\xdb\xcd\xec\x04\xe8\xd5\xab\x17\xf5\xeb\
-\xd7'666 \xf7jU\xb7\xef\xd7\xc4\xce\xcd\xe2\
-8\xd0\xe3PU\x95\xe2\xe2b\x0a\x0b\x0bq\xb9\x5cX\
-\xad\xd6J\xb9\xc7\xe7\xf3QXXHii)\x16\x8b\
-\xa5\xd2\xdc\x97\x99\x99Ipp\xf0\x0dc\xec\x7f\xaa\x82\
-^\xb7n\x1d\xcf<\xf3\x8c\x9e\x10\x22\x22\x22\x00((\
-(\xa0u\xeb\xd6X,\x16\xc2\xc3\xc3\xc9\xce\xcef\xdd\
-\xbau4o\xde<\xe0\x019|\xf8p>\xff\xfcs\
-\xee\xbd\xf7^\x0a\x0b\x0b\xc9\xcf\xcf\xe7\x9bo\xbe\xe1\xc1\
-\x07\x1f\xacr\xb6\xaf^\xbd\x9a\x01\x03\x06PTT\xc4\
-\xde\xbd{\xa9[\xb7.\x00\x1b6l\xe0\xe9\xa7\x9f&\
-%%\x85\x98\x98\x18\xf6\xee\xdd\xcb\xb4i\xd3\xe8\xd5\xab\
-\x17\x00K\x96,\xa1_\xbf~\xb4h\xd1\x82\x9c\x9c\x1c\
-\xe2\xe2\xe2\xd8\xbcys\xa5\x04\x7f\xb7\xd9\xb0a\x03\xbd\
-{\xf7&11\x91\x88\x88\x08\xf6\xec\xd9\xc3\x88\x11#\
-\x182d\x08\x00yyy\xf4\xef\xdf\x9f={\xf60\
-j\xd4(\xfd\xf3\xf4\xf4t\x5c.\x17AA?='\
-\xf8\xad\xb7\xde\xa2w\xef\xde~\xb1\xf9f~\xbd\xd5\x98\
-\x02\x11;7\xf2\xe3\xb5\xcc\x9f?\x9f?\xfd\xe9O\xdc\
-\x7f\xff\xfd\x14\x17\x17\x93\x95\x95\xc5\x82\x05\x0b\xe8\xd0\xa1\
-\x03\x00c\xc6\x8ca\xce\x9c9\xc4\xc4\xc4\xe8\xd74m\
-\xda\x94\xaf\xbe\xfa\x8a\x15+V0`\xc0\x00\xce\x9c9\
-sW\x92\xc3\x8b/\xbe\xc8\xb6m\xdbh\xdd\xba5\x19\
-\x19\x19DGG\xb3r\xe5\xcaJ\x0b\x88\x0anf'\
-@LL\x0c\x8b\x16-\xa2c\xc7\x8e\x01\x99[\xaa\xba\
-}\xb7\x1b;\xb7\x8a\xe3@\x8eCUU\xb2\xb2\xb2(\
-..&\x22\x22\x82\xd2\xd2RL&\x13M\x9b6\xc5\
-h4\xe2\xf1x\xd8\xb7o\x1f\xb2,c0\x18p:\
-\x9d4k\xd6L/\xc2\xb6o\xdfN\xa3F\x8d\xfc\xb6\
-\xe0\x87\x00\x9d\x83v:\x9d\x0c\x192\x84\xce\x9d;_\
-\xf7\xdd\xa8Q\xa3\xa8^\xbd:\x07\x0f\x1ed\xe7\xce\x9d\
-t\xed\xda\x95\x81\x03\x07\xa2\xaa\x81U\xe2/\x5c\xb8\xc0\
-\xcc\x993\x995k\x16\xabW\xaff\xe7\xce\x9d\xb4o\
-\xdf\x9e\xc9\x93'W9\xdbg\xcf\x9eM\xdf\xbe}\xe9\
-\xd9\xb3\xe7u\x15\xda\x9bo\xbe\xc9\xc0\x81\x03\xd9\xbbw\
-/k\xd7\xaee\xe0\xc0\x81\x8c\x1d;\x16\xaf\xd7Ki\
-i)\xc3\x86\x0dc\xe8\xd0\xa1l\xd8\xb0\x81\xfd\xfb\xf7\
-\x93\x9f\x9f\xcf\xd4\xa9S\xfdj\xff\xc4\x89\x13y\xea\xa9\
-\xa7\xd8\xb1c\x07k\xd6\xaca\xcc\x981L\x9d:\x15\
-\xaf\xd7\xcb\xc9\x93'i\xdf\xbe=\xb1\xb1\xb1\xa4\xa4\xa4\
-\x5cW\xc1.\x5c\xb8\x90\x8c\x8c\x0c\xfd\xe5\x8f\xe4|+\
-\xbf\xdejL\x81\x88\x9d\x9b\xf9\xf1Z\xc6\x8f\x1f\xcf\xf0\
-\xe1\xc3Y\xbat)\x1b7n\xa4M\x9b6L\x9f>\
-\xbd\x92\xcf_y\xe5\x95J>\xafH*w\x93\xbd{\
-\xf7\xb2j\xd5*\xd6\xae]\xcb\x82\x05\x0b\xd8\xb8q#\
-\xa7N\x9db\xcd\x9a57T7\x02a\xe7\xafQ_\
-\xaa\xb2}\xb7\x1b;Uu\xfe\xae\xb8O\x0b\x0b\x0bI\
-OO\xa7a\xc3\x86\xa4\xa7\xa7\xe3t:\xb9r\xe5\x0a\
-\x00999\x98\xcdf\xee\xbd\xf7^Z\xb6lIT\
-T\x14\xd9\xd9\xd9\x01\xb59 \x09z\xf2\xe4\xc9\xc8\xb2\
-\xfc\x8b+\xf6U\xabV\xf1\xc7?\xfe\x11\xa3Qk\x16\
-\x1a<x0\x87\x0e\x1d\xe2\xec\xd9\xb3\x01u\x94\xcdf\
-CUU\x9a4i\xa29N\x96i\xdc\xb81ee\
-eU\xcev\x97\xcb\xc5\xea\xd5\xaby\xe5\x95W*}\
-\xbes\xe7N\x8a\x8b\x8by\xe7\x9dwP\x14\x05\xb7\xdb\
-\xcd\xc8\x91#\xd9\xbe};F\xa3\x91\x1f\x7f\xfc\x91+\
-W\xae0p\xe0@\x00\x22##\xe9\xdf\xbf?\xabV\
-\xad\xf2\xab\xfd\x03\x06\x0c\xe0\xddw\xdf\xd5\xdf\xd7\xa9S\
-\x07\x97\xcb\x85\xd7\xeb\xe5\xea\xd5\xab\x0c\x1b6\x8cy\xf3\
-\xe6U\x92\xce\xca\xca\xcap8\x1c\xc4\xc6\xc6\xe2\xf3\xf9\
-\xfc:!\xdc\xca\xaf\xb7\x1aS b\xe7F~\xbc\x16\
-\xbb\xddN\xcf\x9e=\xf9\xdd\xef~\xa7\xc9m\x92D\xab\
-V\xad*U\xc4\x97/_\xd6\xe5\xca\x8a\xb1\xdc\x88q\
-\xe3\xc6\xd1\xa9S'.\x5c\xb8\xf0\x9fO\x5c\xb2\xcc\xe8\
-\xd1\xa3IKK\x03 ..\x8e\xc4\xc4\xc4\x1bV\xeb\
-\xbf\xc6\xcem\xdb\xb6\xd1\xa2E\x0bV\xaf^\xed\xb7\x18\
-\xaa\xea\xf6\xddn\xec\xfc\x9a8\x0e\xc48\x92\x93\x93u\
-\x85\xcdb\xb1`\xb1Xp\xb9\xb4\xd3\x14W\xae\x5c\xa1\
-V\xadZH\xe5\xff\x15Ubb\x226\x9b\x0d\xa7\xd3\
-\xf9\x8b>\xd8\xbbw\xaf\x9e\xdc\xffg\x12\xf4\xb1c\xc7\
-\x982e\x0a\x9f|\xf2I%)\xb2b\x15YRR\
-B\xc3\x86\x0d\xf5\xcf\x1a4h\x80,\xcb\x1c?~<\
-\xa0\x09\xban\xdd\xba\xfc\xfe\xf7\xbf\xa7w\xef\xde\xcc\x98\
-1\x83\xf1\xe3\xc7\xf3\xd9g\x9f\xf1\xc6\x1boT9\xdb\
-\xdfx\xe3\x0d\xee\xb9\xe7\x9e\xeb>?q\xe2\x04ii\
-i\x8c\x1a5\x8aZ\xb5j\x91\x94\x94D\xaf^\xbd\xf4\
-\x09\xe1\xc4\x89\x13\xc4\xc7\xc7\x13\x1e\x1e\xae_\xd3\xa8Q\
-#N\x9c8\xe1W\xfb{\xf4\xe8ADD\x04\xeb\xd6\
-\xadc\xee\xdc\xb9\x0c\x1b6\x8c\xc1\x83\x07c\xb5Zi\
-\xd9\xb2%\x03\x06\x0c\xf8\xc5\x0a\x04`\xf4\xe8\xd1\xc4\xc6\
-\xc6R\xaf^=\x86\x0e\x1dz\xcb\xc9\xeeNp+\xbf\
-\xdejL\x81\x88\x9d\x1b\xf9\xf1Z\x82\x83\x83\x19;v\
-,qqq\x008\x1c\x0e\x16/^\xcc\xc3\x0f?\xac\
-\xff\xcc\xc5\x8b\x17\xd9\xb0a\x03u\xea\xd4!>>\x9e\
-\xae]\xbb\x92\x9b\x9b{\xdd\xdf\xf5\xde{\xef\xf1\xed\xb7\
-\xdf2k\xd6,j\xd6\xac\xf9\x1f\xdb\xdf\xaaU+\x06\
-\x0d\x1a\xa4\xbf\xdf\xb1c\x07'O\x9e\xa4S\xa7N\xbf\
-\xf8\xf3\xb7k\xe7\x96-[\xe8\xd9\xb3'C\x86\x0c\xe1\
-\xf1\xc7\x1f\xf7[\xccWu\xfbn'v~M\x1c\x07\
-b\x1caaa\xc4\xc7\xc7\xeb\xefKJJp8\x1c\
-DFF\xe2v\xbb\xf1\xf9|\x95\x16\x1c\xc1\xc1\xc1z\
-\xdc\xff<9gff\x92\x90\x90p\xc3\xbe\x8d\xff\xca\
-\x04\xad\xaa*\x83\x06\x0d\xe2\xb9\xe7\x9e\xa3}\xfb\xf6\xbf\
-\x18\xa4@\xa5}\x18\xb3\xd9LXX\x98\xfe] I\
-MM%77\x97\x193f0g\xce\x1c\xaaW\xaf\
-\xaeO^U\xddv\xd0\xf6\xfa322\xc8\xcb\xcbc\
-\xfd\xfa\xf5\xacX\xb1\x82\xf3\xe7\xcf\xf3\xfc\xf3\xcf\x03\x9a\
-\x8c\x1f\x1d\x1d]\xe9\x9a\x98\x98\x18JKK\xb1\xdb\xed\
-~\xb5\xb5\xa0\xa0\x80\xb1c\xc72z\xf4h\xc2\xc3\xc3\
-i\xd3\xa6\xcd-%B\x80\xda\xb5k\xb3g\xcf\x1e\xa6\
-N\x9d\xca\xa2E\x8b\x187n\x5c\xc0\xfdz\xab1\xfd\
-7\xc4\x8e\xd7\xeb\xa5_\xbf~\x98L&\x86\x0d\x1bV\
-\xa9\xf2\xb3\xd9l,Y\xb2\x84\xb5k\xd7\xa2(\x0a\xdd\
-\xbau\xab\xa4`\x8c\x1c9\x92E\x8b\x16\xb1f\xcd\x1a\
-RSS\xef\xb8m999\xf4\xe9\xd3\x87\xd7^{\
-\x8dV\xadZ\xdd\xb0B\xbd\x95\x9d\x9b6m\xa2G\x8f\
-\x1eL\x9b6\x8d\x17^x\xc1\xaf\xfe\xad\xea\xf6\xdd\xee\
-\x22\xe3v\xe2\xb8*\x8c\xc3\xe9t\x92\x99\x99I\xadZ\
-\xb5\x08\x0b\x0b\xc3\xe3\xd1\x9e\xa3PQ\xf9W(F\x06\
-\x83\x01\xb7\xfb\xa7g\x12\x14\x17\x17s\xe4\xc8\x11RS\
-S\xfd\xd2\xe8\xe6\xd7\x07\x95\xcc\x9b7\x8f\xac\xac,\xe6\
-\xce\x9d\x8b\xcb\xe5\xd2\x07\xeep8\x08\x0d\x0d%))\
-\x09\xd0\xba]+\xba\x17\x1d\x0e\x07W\xaf^\xa5v\xed\
-\xda\x01\x0d\xbe\xa5K\x972q\xe2D\x96-[F\x9b\
-6mPU\x95\x11#F\xd0\xb3gO\x8e\x1d;V\
-\xa5m\xaf\xa0\xa2\xabx\xe6\xcc\x99z\x22\xfe\xf8\xe3\x8f\
-y\xe2\x89'\xb8p\xe1\x02\xb5k\xd7&??\xbf\xd2\
-5\xf9\xf9\xf9\xc4\xc4\xc4\xe8\xabI\x7f\x91\x98\x98\xc8\xd6\
-\xad[\xf1x<\xcc\x981\x83^\xbdz\x91\x99\x99y\
-\xc3\x15k\xf3\xe6\xcd\xd9\xb7o\x1fu\xea\xd4\x01 %\
-%\x85\xec\xecl\xbe\xfe\xfa\xeb\xbb\x9e\xa4o\xe5\xd7\x8a\
-\x8a\xf1Fc\xaa\xea\xb1\xa3\xaa*o\xbe\xf9&\x87\x0e\
-\x1d\xe2\xfb\xef\xbf',,\xac\x92\xa4Y\xabV-\xac\
-V\xedy\xd7\x9f~\xfa)\xe9\xe9\xe9\x1c=zT\xaf\
-R\xfe\xfe\xf7\xbf\x93\x98\x98x]\xd7\xfa\x9d ??\
-\x9f\xee\xdd\xbb\xf3\xc0\x03\x0f\xf0\xc1\x07\x1f\xdc\xf0\xe7n\
-fg\xe3\xc6\x8d\xf1z\xbdL\x992E_\x88\xfb\x9b\
-\xaan\xdf\xedp;q\x5c\x15\xc6\xe1r\xb98|\xf8\
-0\x11\x11\x11\xfa\x1e\xba\xc5\xa2=H\xca\xe3\xf1\xe8\xbf\
-\x03EQ\xf0\xf9|\xfa{UU9w\xee\x1c\xc0u\
-\xea\xef\xffD\x05\xbd~\xfdz\x8a\x8a\x8ah\xd0\xa0\x01\
-\xb1\xb1\xb1<\xf2\xc8#\xba\x0c\xb2h\xd1\x22\x22\x22\x22\
-\xa8Q\xa3\x06\xbbw\xef\xd6\xaf\xd9\xb5k\x17\x00\xf5\xea\
-\xd5\x0bh\xf0edd\x90\x92\x92\xa2W=\x92$\xd1\
-\xabW/\x8a\x8b\x8b\xc9\xcd\xcd\xad\xd2\xb6_\xab\x00\x00\
-\x95\x8e\x15\x5c\xfb\xe7\xb4\xb44.\x5c\xb8@^^^\
-\xa51\xf8\xd3\xfe\xa2\xa2\x22F\x8d\x1a\xa5W\xc4&\x93\
-\x89\x97^z\x09\xb7\xdb\xcd\xe6\xcd\x9box\xdd\x91#\
-G\xf8\xe7?\xffY\xe93\x8b\xc5\x82\xcf\xe7\x0b\xb8_\
-o5\xa6\xaa\x1e;\xef\xbc\xf3\x0e\x1b7nd\xf9\xf2\
-\xe5\x95$B\xa7\xd3\xc9\xdc\xb9s\xf5q];\xd1]\
-\xeb\xf7-[\xb6\xe0t:\x19<x\xf0\x1d\xb5\xab\xb0\
-\xb0\x90\xee\xdd\xbb\xd3\xa4I\x13f\xcd\x9aU\xc9\xe7?\
-\xaf\x96n\xc7\xce!C\x86\xf0\xe4\x93O\xf2\xfc\xf3\xcf\
-SXX\xe8\xd7j\xae*\xdbw\xbb\xdcn\x1c\x07r\
-\x1c\x1e\x8f\x87#G\x8e\x10\x1a\x1aJ\xfd\xfa\xf5\x7f\xaa\
-T\x8dFL&\x13\xa5\xa5\xa5\xfag%%%\xd7%\
-\xe3\x84\x84\x04\xa2\xa3\xa3\xc9\xcc\xcc\xd4\xab\xee\xff\x99\x04\
-=i\xd2$\x8e\x1c9\xa2\xbf\x16,X\x00h\xfbG\
-\x15g%_y\xe5\x15&O\x9eLFF\x0699\
-9\x8c\x1e=\x9an\xdd\xba\xdd\x95\xd5\xf7\xaf\xe1\xa1\x87\
-\x1e\xe2\xf8\xf1\xe3L\x9f>\x9d\xc2\xc2BN\x9e<\xc9\
-\x84\x09\x13\x88\x8d\x8d\xd5\x1bU\xaa\xaa\xed\x15<\xf6\xd8\
-c$''3x\xf0`\x0a\x0a\x0a8s\xe6\x0c\xa3\
-F\x8d\x22==\x9d\x9a5k\xd2\xaaU+\x9a5k\
-\xc6\x90!C\xb8x\xf1\x22\xdf\x7f\xff=\xf3\xe6\xcd\xe3\
-\xd5W_\xf5\x9b\x8d\x91\x91\x91\xac\x5c\xb9\x92\xb7\xdf~\
-\x9b\xbc\xbc<\x0a\x0b\x0b\xf9\xe8\xa3\x8f\x90e\xf9\xa62\
-wTT\x14\x13'Nd\xfa\xf4\xe98\x9dN\x0e\x1e\
-<\xc8\xb4i\xd3\xe8\xd2\xa5K\xc0\xfdz;c\xaa*\
-\xb1SXX\xc8\xcb/\xbf\xcc\xa1C\x87\x00\xad\xb1\xeb\
-\xb3\xcf>\xe3\xc3\x0f?\xc4\xe9tr\xf4\xe8Q\xbd:\
-\xb6Z\xadl\xda\xb4\x89\xb7\xdf~\x9b\xcb\x97/SP\
-P\xc0\x88\x11#\xa8Y\xb3\xa6\xdeL\x19\x1e\x1e\xae\x1f\
-\x17Z\xb4h\x113f\xcc\xb8#v\x96\x96\x96\xd2\xad\
-[7\xb2\xb2\xb2\x18:t(\xc7\x8f\x1f\xe7\xe8\xd1\xa3\
-z3\xd2\xc4\x89\x13\x993g\xcem\xdbi4\x1ai\
-\xd7\xae\x1d3g\xce$$$\x84>}\xfa\xf8\xa5\x7f\
-\xe1\xbf\xc1\xbe_\xc3\xad\xe28\x90\xe3\xf0\xf9|\x1c9\
-r\x04\x87\xc3ABB\x02\x0e\x87\x03\xbb\xdd\xae7\x89\
-\xc5\xc5\xc5\x91\x97\x97GYY\x19N\xa7\x93\xdc\xdc\x5c\
-\xa2\xa3\xa3\xf5s\xcf\x92$\x11\x11\x11A\xbdz\xf5\x90\
-e\x99\xac\xac\xac\xbb\xde\x8c\xea\xd7\x04\x1d\x15\x15E|\
-|\xbc\xfe\xaa\x90\xfe\xae\x95v\x06\x0f\x1e\xcc\x83\x0f>\
-H\x97.]h\xd1\xa2\x05\xc1\xc1\xc1L\x9a4)\xe0\
-\x81\xd7\xb1cG&M\x9a\xc4\xe4\xc9\x93\xa9[\xb7.\
-\xadZ\xb5\xa2\xb0\xb0\x90\xa5K\x97\xea+\xf7\xaaf{\
-E7\xe2\xb5\xab\xf2/\xbf\xfc\x92C\x87\x0e\x91\x9a\x9a\
-J\xb3f\xcd\xf0z\xbd\xfc\xe3\x1f\xff\xd0o\x9e\x993\
-gr\xf6\xecY\xea\xd7\xaf\xcf\x8b/\xbe\xc8\xeb\xaf\xbf\
-N\x8f\x1e=\xfcj\xf3\xb7\xdf~\xcb\xd9\xb3gIO\
-O\xa7n\xdd\xba,^\xbc\x98E\x8b\x16]\xd7\x5c$\
-I\x92>\xc6\x94\x94\x14f\xcc\x98\xc1\x84\x09\x13\x88\x8b\
-\x8b\xa3c\xc7\x8e\xb4l\xd9\x92\xf7\xdf\x7f\xff\xae\xdb|\
-+\xbf\xde\xce\x98\x02\x19;\xd7\xfa\xf1\xe2\xc5\x8b\xacX\
-\xb1\x82\xac\xac,l6\x9bnC\xdf\xbe}\xb9\xff\xfe\
-\xfb\xf5W\xc5\xf6\xd4\x9c9s\xc8\xcb\xcb\xa3^\xbdz\
-\xa4\xa6\xa6r\xe0\xc0\x01\xbe\xfb\xee;dYF\x92$\
-\xfd\xdeh\xdb\xb6-\x7f\xfe\xf3\x9f\x199r$[\xb7\
-n\xfd\x8fm^\xb6l\x19\x87\x0f\x1f\x06\xa0C\x87\x0e\
-\xba]C\x87\x0e\x05`\xe5\xca\x95l\xd8\xb0A\xff\xf9\
-\x9b\xd9y\xad\x1fBCC\x99?\x7f>\x87\x0f\x1ff\
-\xd4\xa8Q~\x8b\xfb\xaan\xdf\xed\xc4\xce\xed\xc6q\xa0\
-\xc6QPP\x80\xcd\xa6\xfd\x9f\xcf\x07\x0e\x1c\xd0\x8f\xb3\
-\x9d:uJ\xaf\x8e#\x22\x228x\xf0 {\xf7\xee\
-\xc5`0\xe8\xcf\x8f\xb8\x16\x83\xc1@\xa3F\x8d(+\
-+#''\xe7\xee\xfa\xb7\xaa>\xea\xb3\xb8\xb8\x18\xa7\
-\xd3yG:>\xef4\x97.]\x2244\xf4\x86\xfb\
-\xb2U\xd9v\xd0\xf6Rrss\x09\x0e\x0e\xbea\xa3\
-\xc3\x993g\xa8Q\xa3\x86\xbep\x0a\x04\x15G\x1c~\
-\xde\xb8v\xabUrvv6\xf1\xf1\xf1\xd7=\xe5\xad\
-*\xf8\xf5Vc\xaa\x0a\xb1\xe3\xf3\xf9~\xf5\xd3\xe3*\
-\xf6\xe6\xae\x95\xc0\x03\x89\xa2(\xd7%\x8f\xaahgU\
-\xf7\xe3\xff\xe2\xfc}+\xbc^/\x8a\xa2\xf8\xf5\x89a\
-\xffu\x09Z \x10\x08\x04\x82\xff\xcb\xc8\xc2\x05\x02\x81\
-@ \x10\x88\x04-\x10\x08\x04\x02\x81@$h\x81@\
- \x10\x08D\x82\x16\x08\x04\x02\x81@ \x12\xb4@ \
-\x10\x08\x04\x22A\x0b\x04\x02\x81@ \x10\x09Z \x10\
-\x08\x04\x02\x91\xa0\x05\x02\x81@ \x10\x88\x04-\x10\x08\
-\x04\x02\x81@$h\x81@ \x10\x08D\x82\x16\x08\x04\
-\x02\x81@ \x12\xb4@ \x10\x08\x04\x22A\x0b\x04\x02\
-\x81@ \x10\x09Z \x10\x08\x04\xab\xc11\xd1\x00\x00\
-\x00IIDAT\x02\x91\xa0\x05\x02\x81@ \x10\x88\
-\x04-\x10\x08\x04\x02\x81@$h\x81@ \x10\x08D\
-\x82\x16\x08\x04\x02\x81@ \x12\xb4@ \x10\x08\x04\x22\
-A\x0b\x04\x02\x81@ \x10\x09Z \x10\x08\x04\x02\x91\
-\xa0\x05\x02\x81@ \x10T\x19\xfe?\x90\xabN\x83\x86\
-\xc6-R\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x05%\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\x81\x00\x00\x00\x12\x08\x06\x00\x00\x00|R\xbd\xbd\
-\x00\x00\x04xIDATx^\xbd\x99\x81\x91\x5c5\
-\x10D\x8f\x0c \x05\xc8\x00R\x80\x0c\xec\x14\xec\x0c\x8e\
-\x14 \x03H\x012\xc0)\x98\x0c \x05\xc8\xc0\xa0\xe7\
-\xda6\xed\xde\xd6\xfe\xd9_k\xaa^W\xed~\xcdH\
-\xfa\xd2\xccH{\xf7\xf4\xf4t\xc5\xab\xa5\xdf\x96\xde]\
-\xf4\xcb\xd2\xaf\xa6\xdf\x97\xde,}\xbd\xe4\xfc\xb0\xf4v\
-\x09\x9f\xbf\x96\xe8\xe3\xdb%A?<\xa7\xfd\x8f\xcb\xf7\
-\xcf\x97\xe0\xb3\xa5\x97K\x7f.\xfd\xb3\xf4\xf7\xd2\xeb%\
-\x9e\xff_j\xa4\xcd\xcfK\xbc'\xd2\xdc!\xedP\xd2\
-l\xce\xea\x1e~Z\xf29\xd7\xfe\xae\x1e\x5c\xd0FB\
-\xda\x10\x0clf\x06\x02\x9b\xces\x06\x84\xf4\xfbq\x89\
-v\x0f\x0eP\xfbwK\xf4\xcd\xe7\x09\xf2s5\x9a]\
-\xaa\xe1\xed\xcc\x9d\xb9\xf1\xce\xac\xcd\x8b%\xe1v\xd2\x84\
-\xe6\xd7\x944\x9b&\xf6\x81d\xf397\xbb\xfa\xf0\xab\
-%2\xf2\xfb\xcb\xf7\x84M\xa4\x9d\xcch~\xf9\x5cb\
-!ig\xb3\xfd\xb9P\xf0\x80\xb7\xa7\x9d\x98\xd8L9\
-\xeaK\x8b\xc8\xbb\x93\x1c^\x09\xcer4\xe6=\xb4\xbe\
-\xa8\xa8TX\xd6\x9b\xea\xfd\xc5R\xa59S\x8a\xd9\xac\
-o.\xdf\x13\x8e\x0c2\xfa\xf9\xfd\xb7\xff`\x10\xfc\x94\
-\xcd)\x8e\x12\xfc\xf0whc\xa2\x19\x1c\xa9db\x03\
-S\xbb\x1d\xaap\xdbr:\xa0\xf955\x9a]*Q\
-\xa2\xb2'\xcd\xdeu\xfd`A\x09\xe1\xa5E\xda\xb0\x99\
-d\xc6\x97K\x0em\x0cL{\xfaPU\x08\xae\x16<\
-\xb4S%\xdc\xbe\xe1\xed;\x9bF\xfa55\xd4\xc6\xdc\
-\xb8\xaf\xb8\xbdk\xc2Y?8\xe3GUms\x1e\xe3\
-\xf7\x01\x87L @\xb8\xd8\xe5}\x00\x18\x84\x12\xa4\xc1\
-\x05\xc1B)\xc5\x87 \xc9\x0d'88J\xfcY\xc3\
-\xdbwj4\xbbT\x83yQ\xd5\xf4N|\xe6\xa25\
-a\xd2\x7f\xda\xec\x94\xdc\xb2\xa1\xca\xea\x12\xae9\xef\x8e\
-g\xe9\xea\x01G\x00\x1b\xc5\x19B\xf6\x222\x97\x8e\xb9\
-\xfd\xab\x94\xa7\x9f\xc4\xc0,\x1a\x9f\x85\xcez\x82\x81\xbe\
-}R\x94+\xdd=\x8e\xe4\xb0\x19\x8c\x95\x22@w\xe2\
-\x1d\xc4\xad\xbe\x85\xda\x98\xf3t\x8e\xf7\xe8S\xd2*\xee\
-\x18\x1c\xe9 K=\x90\xcdDX\x9e\xe9\x8e~&\x02\
-/\xca\xc5Dw\x0b6\x9c6\xaf2~\x19t|\xb1\
-\xa4\x09\xcd\xaf)\xd9\xd9\xb0\x0e\xcc\xb9U>\xb1\xf3=\
-b\xea\xd7\xecnI\x17t\xad\xfb\x91\xae\x1eP\x01\x94\
-\xc9\x92\xc3\xa6\xed\x16E\xfeL@7\xd1\x8cF\xdat\
-g\xd0e\xf0,>\xc7{\x954\x1bD\x103g}\
-\x17\x1c\x8d\xac\x05\xa2\xc2 \xff\xc5\xe0}\xa4\x1f\x89B\
-ej\x95\xac)7\xb3\xe1\xed\x9as\x83\xf1Ib\xe6\
-\xf0\x01wF8\xe7\xed\xde\xa1\x03\x82\xa0\x95G\xa0L\
-\xd3N\x06\x11\x00\xbe0@%a\x01@U \xfb\x99\
-j\xcaY_\xecv\x97\xc2<g\xf9\xeev\x13\xdc\xff\
-\x1e\x1d\xc1\xba\xb2\xc6\xe9G0\xe9\x88\xdf\xce\x95\xecf\
-\x03\xb3\xdc{G\x04\x08\x81\x92\x7f\xf0\x01\xda\xf5\xb7\x00\
-.UD\xa4\xfb\x22&\xa7#E\x01\x926\xa8\xe1\xed\
-,:}\xa5\x94=M\x1e\xdc\x13\xb0\xa3\xb2eR \
-\xdeQ?i!\x8f\x8d\xb4ojL\xec\x8el8n\
-\xa9L;;\x8eu\xd6\xaaB\xe6\xf2r\xbb\x9b\xba\x82\
-\xe4\xa3Rb`K\x94\xd1\x07\x8b\xe7}H\xba3x\
-\xa05\xbb\xa6\x09\xcd\xef\xac\x80\x80m\x17,\x0fb8\
-\xba;\xec\xfa\x7f\x14\xde/\xc79\xfb\xd0\xa0\x9d\xe4$\
-)d\xff\x11l\x10/\xdd \xf3i\xc3&K\xbc\xa0\
-C\xfd\xa1)\x03I\x228|\x02\xe8S\xe3c\xdd3\
-\xa66\xd6\xab\xde\xae/\x95`\xd1\xec&j4\xbb\x94\
-hsv\xb0\xadA@\xe9\xa0\x84\xe0\x8ct\xd1\x91\xf4\
-O\xa3V\xde]\xc0\xe0\xb7\xcez\x8e\x8b\xa3\xbf\x0c\xee\
-4a\xea\xd7\xecR\xba`\xb56\x17\xd9O\x00xr\
-\xa4\xcd\x94\xf4\x9bJP\xea\xd9\xc3\x1d\xd8^\x05\x81>\
-<Bg\x99\xf6\xd5\xec&j4\xbb\x14\xf7\x8e[\x97\
-d \xf3\xda\xff\x12\xdc\xa7\xf9=\x1a\x8d\xe3sn\xf0\
-\xfc\xe6q\xb0C\xc6GJ&6\xd0\xec\x9a\x1eI\xeb\
-\x1f\xb1@ZD\x8e>2k\x07\x01\xc0\xaf!\xf9r\
-\x04\xee\x8e\xc1\xa6)G~\xcc\x91\x8a\x0d>\xe7\xf4\x93\
-\xef\xcd\x8b!4\xc7\xa9\x92\x89\x0dL\xed\x92\xe6\xd7\xd4\
-\xd8\xd9\xb08\xcal\x16t\x87*\x00G\x01?\xbd\x10\
-Y\xa8\x7f\xd8$9\xdeN\x8df\xe7\x22\xab9\xae\x19\
-\xbb\xfd\xdf\xc6\x05\x0f\x0b\x82G\xd2\xfa\x9f\xa8\xd1\xec&\
-\x12\xdc\xfa\xf95@\x86\xb7\xac\x16\x5c\x92u\x87\xe2\xde\
- \xa5\xdd\xbd\xf8X\xd3\xbe\x983\xbf\x06\x08B\x9fs\
-B\xe0r_#\xb8\x997\x9f\x9f\xff\x05m\xa3\x07!\
-5P\x8d%\x00\x00\x00\x14tEXtlate\
-x\x00BW = f_2 - f_1\
-\xf8x\x89\xfd\x00\x00\x00\x0etEXtreso\
-lution\x00150\x8aF?\xe6\x00\x00\
-\x00\x0ctEXtcolor\x000000\
-00\xc2\x9f\xf6\xa1\x00\x00\x00\x16tEXtSo\
-ftware\x00latex2png\
-.comJ\x05\xa9\x0a\x00\x00\x00\x00IEND\
-\xaeB`\x82\
-\x00\x00\x07\x9f\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00l\x00\x00\x000\x08\x06\x00\x00\x00\xf4*\x9fA\
-\x00\x00\x06\xe2IDATx^\xed\x9a\x0d\x91$E\
-\x10\x85\x0f\x07`\x01\x1c\x80\x05p\x00\x16\xc0\x01X\x00\
-\x07`\x01\x1c\x80\x05p\x00\x16\xc0\x01\xd0\xdf\xec\xe5E\
-\xee7\xd9\xfd\xa6\xb6go#\x0e\x22\xbe\x17\xb7W\xf9\
-\xaa\xa6\xbb\xb3\xebw\xe6\xd5\xabW\x91\xf7\x82\xcc\xe49\
-Rb\xaa\xb3\xa23|\xbc\xe9\xbbM\xff\x1c\xe8\xef\xa0\
-\xa9N\x97\xfd\xd3=tE\xa6J]f\xf2\x1c)1\
-\xd5Y\xd1\x19~\xde\xf4\xc9\xa6\xa9\xddRb\xaa\xd3e\
-&O\xd7X\xd8eR\xdc<\xb7\xdf\xa4\xfa\x8e\xef\x89\
-D\xfd\xa22t\x96\xd5\xf6\xae\xfc.\xb0L\x8a\x9b\xe7\
-\xf6\x9bT\xdf\xf1=\xfd\xb4\xe93\x95\xa1\xb3\xac\xb6w\
-\xe5w\x81eR\xdc<\xb7\xdf\xa4\xfa\x8eO\xfah\xd3\
-o*+\xdd\xca\xa7\x9b\x18R\x99\x97\xbe\xa4\xe05\xb4\
-\xc1\x8b@\xfb\xe8\xebMG\x5c}\xfeU\x81x\xe9\xb8\
-\xb1\xdfJ\xdc\xe2\xff~\x13\x0f\x1c\x92\xff(N2~\
-\xdc\xf4\xe7\xe5\x7f\x0f\x94\xef\x9bM\xbc\x18\x89\xde6\xba\
-.\x10/\x1d7\xf6[\x89\xe4\x7f\x7f\xd3\xaf\x0f\x7f^\
-\xe8^\x1e0\xc9Dx\xa6EI\x07\x1f\xed\xf5^V\
->V\x9f\xf6O\x94\xbft] ^:n\xec\xb7\x12\
-\xc9\xcfC\xfe\xfc\xe1\xcf\x0b\xe5#Y,B:\xdfn\
-bi\xde\xe7\xba\x0eq\xa0\xcd\xdf\x1f\xfe|\xe3{r\
-\xc2\x12\xae`\x9d%\xb5\x97\xe2\xe6\x8c\xff\x83M\xf5`\
-\x0dC\xdb\x87\x0f\x7f>\x82\xe1n\x1a\xf2\xe8y_P\
-\xb0Q\xbd\xac^\x04\xf6w\xfd\xa58\xa2_\x1f\x8a\xb8\
-\x82u\x96\xd4^\x8a\x9b3~\xde\xfa\xbe@\xe8\x90\x14\
-\x1e:\x0f\xbfC\x22)\xafdV[\xccQ\xbc\x00E\
-\xefe\xccmng\x8f~}\xe8\xaa\xc02\xab\xf1U\
-\x99\xc9\xd3e&\x0f\xe2m\x9f\x96\xe9]\x7fl2\x15\
-c\x99O\xbc\xfbQ%\x8c^\x03U\xfe\xc3\xeb\x7f\x0b\
-\x12\x8a\x8fk\xa8\xe1pRd\xaa\xd4eV\xe3\xab2\
-\x93\xa7\xcbL\x1e\xde\xf6\xbf6\xed-\xd5\x11\x1ed&\
-o\x17\xbd\x86D\x14U>\xcdQ$\x97k\xf8?a\
-\x0d\xc7\x99K\x18\x9axH,\x10\xf6\x8e\x9a\xaa\xf7\x18\
-\xfb\xbah\x8bd\xf5\xbdT\x95\xd3\xa3\xf9\xbbC/\xe3\
-\x1a*6)\x92*8n\x9de\xb5\xbd\xa7\xfaI\x1a\
-\x0f\x8b\xa1\xcd\xf5\x99\xb7\xd2\x06\xb6\xe8uI\xb2\xdb\xa3\
-\x1dz\x1dK\xfe\x1a&;\xf8\xb9\x96^gE\xd7\x05\
-\xc2q\xeb,\xab\xed\x9d\xf13\xaf\x904\x96\xe8\xbd>\
-\x0fxu\x11@[O9k\xb4\x7fU\xd7\x05\xc2q\
-\xeb,\xab\xed\x9d\xf1\x93(\x12V\x0b\x02\xc4\xf2\xba\xf6\
-K\xb7@\x9d\xaf6\xb9g\x95\x12S\x9d\x15ER\x85\
-\xd5\xb8e&O\x97\x99<]\x86^A\xd2jXb\
-\x11\xd0\x87(S\xe5\xa5)\xc1\xccM^\xd6\x97\x8c\xe3\
-\xd6iR\x83\xabq\xcbL\x9e.3y\xba\x0c\xcbj\
-\x12\xc6\x8a\x90\xc9\xbf\xf7\xb6\xc9\xdfc,&\xa6\xde\xd8\
-\xf7U\xdd\x8f\x8c\xe3\xd62S#\xf7T\x22\xf9\x1dO\
-\x9a\xe0\x1c\x90\x8d0\xff\xf6\xf9l\xcf\x0f\xf4 \xe6:\
-\x12lM\xfb\xb3\x92\x99<]\xcbL\x8d\xdcS\x89\xe4\
-w<i\x82a\x8d\xe58\xfb\xa2[\xfcP\xfb-z\
-\xa7u\xb4\xbf3\x93\xa7k\x19*\xf1\xd6\xb1o\xe1\xed\
-\xe1_\xc4$\xcbd\xeb\x0fXU\x22\xf9\x1dO\xda\x83\
-\xdeE\xaf\xb9\xd5_\xd8\x9fd&O\xd72$\x877\
-f\xda`\x92\xb4\xfe\xd5\x03\xd8c\xce\xc6\xcf\x92\xdaw\
-\xdc2\x93\xa7k\x95\xa9\x8d#\xbd\x81I\x93dL{\
-\x8b.\xc6~\x0e2\x0b\xc7\xcd\xd9\xf8YR\xfb\x8e[\
-f\xf2t\xad2\xb5q\xa47\x90,\xc6\xe9\xc9\xd4U\
-\x87\x9d\x85\xe3\xe6l\xfc,\xa9}\xc7-3y\xbaV\
-\x99\xda8\xd2\x05z\x0cI\xe0(e2u\xb1\xac-\
-/L\x9e\xae\xb3\xa4\xf6R\xdc$\xbf\xe3I\x89\xa9\xce\
-\x91\x22L\xbc$\x80\xb3/\x98\x1a\xe9\xaa\xe4\xee\xfd\xe6\
-\xc1:Kj/\xc5M\xf2;\x9e\x94\x98\xea\x1c)\xc2\
-J\x90\xa5\xe9\xd1\x09r\x17C'\x09\xab\x9d\xbd\xe9\xde\
-\xda\xa3\xach\xef\xc8\xe7V\x99\xd5\xb8\x95H\xfe\xbb\xc7\
-yH$\xec\x96\x13d<$\xab\x7f%n\xa6zo\
-Sf5n%\x92\xff\xeeq\x92\xc5\x97{\x0eLb\
-\x1fF\xc2\xf6\xbeF\x87\xa9\xdes\xa86\xad\x16\xd7\xd7\
-\xb5\x1a\xb7\xec\xb7\x92\xff\xde\xf1\xcb\xca\x10%X\xf6\xd7\
-q\xce\x11\xd3\xc3\xedZ\xe5\xa5\xeb\x9b\xd4\x9e\xe3\x96I\
-\xf1+\xbcL\x07\x16\x14\xfeU\x0f\x8b\x0d\x12\xb67w\
-\x15\xfd\xc3\xa79\xac^\x90=q=\x9d\xde\x1eZ\xe5\
-l}\x93\xdas\xdc2)~\x05\xcbs\x12V\x09b\
-\xb8\xa3\x8c\xc4\xd4\xd0\xc7R\xfe\x96d\x81/\xc0Z\xe5\
-\xa5\xeb\x9b\xd4\x9e\xe3\x96I\xf1+0\xd5\x8fT8C\
-\xe4\xef\xaa\xcc1\x15o<z\xea\xd7\x07\xc6\xf1$\xb3\
-\x1a\xef\xe2\xab\x15\xff\xde\xbd\xc78\x92c\xc8\xf7o4\
-\x8e\x94\x98\xea\x1c\xc9\x5c\xc5\xeb\x0f\xce\x0eYRs4\
-U\x07\xbe\x0ca\xb5\xdf*|\xc6hz\xec\x96x\x92\
-Y\x8d[$\x83\x17\xb0V\xba=\xc6\xcb\xeaQ\xa4\xc7\
-'%\xa6:G2)\xfe\x08\xde\xc6\xfe[\xbe\xe9\x86\
-V\xe9\x1f\x8eVq}F\x05\xe6JD\x0f\xf1\x8f_\
-\xec\xc7\xc7\xf6\x84\x15\x97\xbf}\xe0%\xed\xff\xbfE\x89\
-\xe4\xdf\x8bs\x0f\xcc\xe9\xden\x1d\xc2\xcd\xd7F\x96\x8d\
-5\x0f\xe4,\xfd\xc3\xe3\x05\x0c\xf4\xba$\xcb\x87\xd5u\
-t\xb6w\x12SI\xa9\x05\xd1\x14[Q\x22\xf9{\x8c\
-\xe4\xd0\xfbY\xe0\xd5\x01\xc5R\xc2\xa8\xd8\xf7\x00\x0c\x87\
-g\xe9\x1f\x1e/`\xa0\xd7\xe5e\x9a\xbe1f\xb8\x9b\
-\x86<\xae\xbfNt\xaa\x97\xd5\xff{lE\x89\xe4\xdf\
-\x8b3t\x8f\x09\xeb\xff\xb9\x144\xe8\x96\xbc\x85,H\
-\xf6n\xc6\xac\xc6\xadD\xf7r]<\xf4~S\xc0[\
-\xca\xcdz\xf8\xee\xbf\xbd\x00^\xc8\xeae\x0c\xf7\xb4\xb3\
-J}\xee\x9eL\x8a\x17\x95\xb0~\xbd\x17R\x03\x8e[\
-f5n%\xba\x97\x1e\xe6a\x0d*a}.\x03\x12\
-\xd4!\xa1$\xbc\xff\xde}\x95\xfe\xd9\x93L\x8a\x17\xef\
-d\xc2&\x01\x9357k\xa6_<\x91t\xe6\xe6\xff\
-L\xc2\xacUR}\xc7-C\xaf\xe2F\xb9\xe1\x0e\xe5\
-\x1c\x0e\xb8>s`\x9f\xcb\x8c\xfd&\xc5M\xf2W9\
-C\xb4\x87\xfb\x8b\xbf\xff\xe7R \x1cOZ%\xd5w\
-\xdc2\xd3\xf1\x16\xc9\xa3\x9cU\xaf\xf7\x91\x88^V\x0f\
-\xc6\xd8kR\xdc$\x7f\x95?9a\xab\xa4\xf6\x1c\xbf\
-\xa7X\xaa\xa7\xdf\xa4\x98\xc9\xd3e\xaa\x9c\x07\xc9P\xca\
-\x8bp\xab\xe8\xe5\xbdmd\xaa\xbc\x12\xb6<$\xae\x92\
-\xdas\xfc^:\xfa\xbd{\x97\x99<]&\xc5\x13\xa9\
-~\x95\xbf\xd3\x09c\xfe\xf1\xa6\x97\xb9\xc9{4d\x1c\
-\xb7L\x8a'R\xfd*\xdfM\x98\xe9\x8d\xa1\xc4Y\xbf\
-\xb5\x0asROV\xc1\xbc\x15o\xf6\x0e\xf4k\x9fd\
-&OWQ\xab\xc4\xab9\xcc\xf4\xe0h\x10g\xfd\xd6\
-\x0a\xec\xa3\xd8\x87\xd5Y\x22b\xaf\x85\x983\xde\x06\xd3\
-=t\x99\xc9\xd3U\xd4\x11\xdbt\x92\xf3\x88\x1e\x1c\x0d\
-\xe2\xac\xdfZ\x81\xa40ltq\x93(}3~/\
-\xa6{\xe82\x93\xa7\x8b\x15.\xe2h\x8d\xfb`a\xc3\
-\xdc|9\xa8\xfe\x17\xf6<\x80~\x17\x00le\x00\x00\
-\x00$tEXtlatex\x00Q = \
-\x5cfrac{\x5csqrt{2^N}\
-}{2^N - 1}y\x0c\x84c\x00\x00\
-\x00\x0etEXtresolution\
-\x00150\x8aF?\xe6\x00\x00\x00\x0ctEXt\
-color\x00000000\xc2\x9f\xf6\xa1\
-\x00\x00\x00\x16tEXtSoftware\
-\x00latex2png.comJ\x05\
-\xa9\x0a\x00\x00\x00\x00IEND\xaeB`\x82\
-\x00\x00\x08#\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00\xc0\x00\x00\x00\x15\x08\x06\x00\x00\x00\x10/\xe1\x9b\
-\x00\x00\x07nIDATx^\xcd\x98\x8d\xb1#E\
-\x0c\x84\x8f\x0c \x05\xc8\x00R\x80\x0c \x05\xc8\x00R\
-\x80\x0c \x05\xc8\x00R\x80\x0c \x05\xc8\x00\xd8\xef\xdd\
-\xf5U[\xaf\xa5\x9d\xdd\xb5_\xbd\xaa\xee\xb2=\xa3\x91\
-\xe6G\xd2h\xfc\xe6\xcd\x9b\x11\x1f\x0c\x9c\x90\xe4\xafr\
-B\x92\x17\xf7\x90\xc6\xacpB\x92_\xe1#\x90\xec\xac\
-\xf2\x93\xd0&>\x02\xe8\xedlNH\xf2\xa2\xe3\xe3w\
-\x9f7H\x83\xc4\x09I^<\x8b\xa4k\x85W\x90\xf4\
-\x89\x8f@\xb2\xb3\xc2\xb3H\xba\x9c\x1d\xbe\xdd\xf8\xe5\xdb\
-\xaf\x11I\x978!\xc9;\xff\xd8\xf8Qi\x83\x13\xaa\
-l\xc7/6~W\xdan~\xc0o6\xfe\xb6\xf1\xbf\
-\x8d\xffn\xfc\xb9\xf0\xf7\x8d\xbfn\xfcl\xa3\xc6\xfc\xb0\
-\x91\x893\xe6\x9f\x8d\x8c\xc7\x98\xfa\x7f\xd9H;\xfd\x7f\
-nD\xcf\x87\x1b\x056\x9av\xec\xfd\xbd\xf1\xeb\x8d\x15\
-\xd2u\x94W\x90\xf4\xadp\x15\xdfo\xd4\xba?\xa5a\
-@\xb2#NH\xf2\xce\x04\xce\x83\xb9%y\xd1\xf1\xe3\
-F\xe4\xa1\x9fkB\xd2%\xe2S\xf8J\xea\xabX\xb5\
-Y\xf5\x10\x00\xf8\xb8~\xb7\xc0\x11q\xf4\x04\x1c\x18g\
-\xf6 \xc0\xe1i#\x18\xd4\xe6\xa4\x9d\xfe\xcf7&\xd0\
-\x8e\xde\x97\x00\x1b\x86\xe3q%\xa6\xb9\xaepB\x92\xef\
-\xc8a\xb0/\xa9\xef\x1e<\x0a\xf6\x86$\xb7\x07\xe9\xe7\
-\x5cqZ|\x81$\xf7\xd5\xc6\xb3\xf8i\xa3'N\xa7\
-\x03\xa7\xc7WH\x1a\xf8)6\xd3\x18\x98\xc0\xfa\xc6@\
-\xc51\xc8J\xf5\xba\x10\xe5\xecLXm\xd4n\xb5\xcd\
-\xb9\x17\x00,\xea,\x92=1\x81\x0c\xc7\xfa\xaed\xab\
-\x09I^\xac \x93\xad8\xdc\x84dG<\x0a\xe6\xa3\
-\x1b8\xe9\xab\x94\xd3\xe3\x13\xdc\xfc\x94/\x13\x92\x0e\xf1\
-\xaf\xd0\x96\x98l&\xb9\x8e$\x1d\xf9\xe9\xb3N\xa8\xac\
-\xd4]\xcbl\x10\x0eD\x9d(\xe0L\xb4\x11\x99I\xa7\
-J$\xbf~D\x16\xd2E\xfe#\xc8\xe2W6\xfb,\
-\x92.\xb1\x82\x9b\xc8\xf7\xb1C\xd2%\xde\x13dT!\
-\xd9r*\x11\x1eq\xc0\x0e$%\x82o\x0f$\xd0\x9a\
-\xbc\x92\x1d\xb1\x03\xeb|\xd2\x91\x06q\xa5\xb1\xb0\x0ed\
-,\x14\xd4W5\x13\xa3\xaf\xeaS\xdd\x85\xcet\xabt\
-e\xd3\xa3\x88\xf3\xaf\xd8<\x8b\xa4Kt\xe8\xa6\xdd\xab\
-\xffA\xd2%\xde\x0b8\xa1\xdfF\xc9\x96\x93=\x5c\xcd\
-\xdab\x07\x954{\xa0R i8\x92\x1d\xb1\x03\xeb\
-Lo\xcd't\xf5?\x11\xc3D\x99@\x9a,\xe3\xe8\
-\xf3\x09P\x1aq]Q#\x12\x00\xd5\xf1\x08\x8c\xe9\xef\
-6'c\x09 H\x90\xea\xd6\xa8`\x93\xc8\xaa\x10\xfd\
-\xd8F\x961z\xe0\xf3\xc9\xef\xae\xcc\xbb\xc2\x09.\xa7\
-\xa40\x8d\xf3\xb5\xb0\xf7]\x09\xa9\x87\xabd\x09.\x0e\
-\xd8\xed%:\xf4\xb0\x14\x92<d\xde\xccE\xe7\xcdw\
-\xcf\xdei\xccDn\x10*\x84\x09\xd8\xe4\xbc(\x7f\x08\
-:\xbew\xe5\xb6\xb3\x03\xebd\xde\xcf\x80c\x93\x95\x08\
-\x009\x9b\x1c\x8eI2\x91d\x0821&\xe8\xd0\x86\
-*\xdb\xf9F\x11P\x1c\xd6\x1e\x18\x8bn/\x93\xf4\xe6\
-\xe0S@\x8e\x03\xc1\x19\x04\xecy0\xab\xfe_\x05\xe3\
-\xd1y\x84qc\xdf\xc1\xf7K\x01\xe9m\x22\xeb\x9a\xd6\
-\xec\xb2\xec\xb1gn\xf6AI\xcc\xe5\xf6\xb8w\xbe\x95\
-\xcc%%\x90\x09U\x16b\x13=\x13$\x9bl\x9e\x01\
-\xc9\xe1i\xcf\x5c\x11Dyu,\x01\xe7ac\xbb\xcc\
-\xa2:_@^7\x85\xde\x08~\xe0\xab\xa5\x0f\x8e\x90\
-\x02\x05g\xe3\xf0]\xae\xead\xbe>\x16\x87vg\x99\
-\xe0z\xeeEG\x9d\x9b\x83\xb5y\x9f\xc6\xd75r\xbb\
-\xb2\xe7\xb5\x0e\x97\xa3\x1c\x016=y\xb8\xbeJ%\xb4\
-\x95\xb2\xc5\x91t\xe17{\xef\x08\xd0\xd9L\xf2{d\
-\xdf\x9e\x92u\xed\xc0A\xe9\xe0{\x02\x0e\xd7-\x9c\x8c\
-C\x9f\x16S#\x95Ca\xb1|'\xb3yv\xeb\xc8\
-5\xc7\xb8\xd4\xc7<\xc9\xa2\x00\xc7\xc6\xb6?\x8e\x12\x14\
-4\x8fD\x9a\xab(\xe8\xa6\xe5P\x05\xc9\xa45\x0b\x04\
-\x8d\xdf0\xf57\xa8\xba\xd9\x13\xd6\x0c\x91\x85\xda'\xb7\
-\xc1~\xfa\x99LP\xe0\xf9x\xc8\xd9\x13\xa0\x90\xb3\x81\
-\xee\xdc\x15\xccQ7\xb4\xeb\xa9\x04\xdd\xedM?6\xb8\
-I\xe4_{TI\xfe\xac\x83F&]\xdbE\x8c \
-\x932\x97\x9c\x90E\xd1_\x9d\x91\xc3\xc2\x01\xc1\xaa\x13\
-2&]\xe5*\x07\x14d\x1c^WN\x88l\x12c\
-V\x02\xef\x0aW\xc0\xfe\xb06\x87\xc6\xa7\xb5\x00e@\
-\xed\xbd\x1c\xdd\xb36p\xdd\x8c\xad\xb5r\xf7/X\x0d\
-\x80\x89\x9c\x9f\xce\xd2\x81\x0f8TB\x0aU\x0f\x81B\
-0\xf1}\x0f\x9dM\xf6\x815\xc3\xda_\xed\x89\xac\x93\
-\xf5\xde4**\xa6:\x90\xe0@&=\xc6\x98 \x07\
-B\x89T\x0f\x0509\x8c\xa2\xdf\xb3BG9l\xba\
-\xcae\x0b\xa7p\xb9\xaa\xc3\x912\xc84\x0f\xa0\x03<\
-\xc2)\x81\x888\xb8\xe44\x07\xa0RQN.\xd0\x8f\
-\xb3\xb0N\xbd\x01\x94\x8c\xea\x9b\xc0uCd\xdc\xb1\x95\
-<8o\xb5A\x82B\xce\x08'\x90\x94\xd2[\x87\xb9\
-\xbbo(hS\xc5\x00\xd8/\xc1\xe7R\x09:\x9b\x02\
-\xe7\xeb\xfa@\xd2\x05Y'\xeb\xbdi\xc4\x81\xd2\x86\x8a\
-\x0a\x10\xae\x99\x04\x0e\x8d\xc5\xeaJ\xab\xa0\xf6f\xfc\x14\
-`\x95\x92\xaf \xc3\xe9\x16q\xb9:\x1e\xe8@pf\
-\xaf\xff\xd9\xb0\xea\x04\xce\xb3H\xba*}\xbe\xaa\xe9\x05\
-\xf6\xb0\xfeEG?\xc9C\xb2P\x01\xa0\xdfP\xc9\xc0\
-\xf7\x82\xef\x1e\xe8]\x00\x108\x9eD&\xb0\xff5H\
-\x01\xf3\xf6\x9b\x7f\x0a\x00\xce\xc5o\x0c\x9fK%\xe8l\
-\x0aG\x02\x80=a\xbd7\x8d86\x9b\xecm\xa2\xae\
-\x0c=X\x12X<\x8b\xed\x02\x08\x83u\x82\x8e4\x86\
-\xeb\x9al\xe6 \xc0\xea\xc6!\x87\xfe:\x9e \xd1\xe6\
-\xab\xfe\x05\x1c\xd2\xb4\x99{\xa8v\x8e\x12\x07dO\xd9\
-K9\x9d\xc0\xdaj\xa6cm\xb5\x94\x91\xb3\xe3d\x02\
-\xe38\x83T\xe3\x8b\x04Q*\x81h_\xb9\xbd\x14@\
-]\xb9\xe4\xe8\xca\x16\xc0\x5c\xbb\x9b\xa1B\x81\x94*\x0f\
-\xd9UV\xf7\xb9td/Y\xef\x13\x98\x08N\x85\x01\
-\xc8o'Y\x93~/k\x92R6\xe4\xbd\xd2\x006\
-\xa3\xdb\xb4\x89\xe8d,\x0e\x8bs\xa4M\x00\xc8@\x02\
-\x11\x22_3\x1f\x8eD\xf4{\x86<\xc3\x09I\xbe\x12\
-\xfb:\x04\xb59\xb4\x96\xbd5\xd3\x8e\xd3\x12D\xe8B\
-\xa7;A\x05\x0e\x87C\xd6\xf7\x19P\xdf\x1eR)\xe9\
-\x90mn\x18\xe6\xe2g\xe0\xac\xce:\xa1{t\xfb\xb8\
-t\x03t@\xae\xdb\xd3\xf7H\xc6\xc4\xd7\x844\xbf{\
-pB\x92\x17\xcf\x22\xe9:Jnh\xbf)\x1cdQ\
-\x12Yr~\x01\xc7PVv\xbdN\xf4O7\x05\xe8\
-lI\x86\x04\x90\xdel\x1d\xd3\xadX\xb1Z\x02\x91\x08\
-\x15|\xcf:W9!\xc9\x8b\x13\x92\xfc\x0a\xaf \xe9\
-[\xe1\x84$/NH\xf2b\x05N\x8aC\xe0`\x92\
-\xd1\x1b\xcdk{\x01\x87\xf4\xb2\x91\xdf\xb0\x82\x9bSr\
-\xd2\x01\xc9\xc0rz\x82\xcc\x1f\xcb\x95+\xb6\xa8*\xa6\
-@\x048\xb4\x9c~\xb2)\xac\x06\x00\x01\xac\x0a\xe0Y\
-\xe7*\xcf\x22\xe9\xba\xca\x09I\xfe\x1e<\x8b\xa4k\x85\
-\x158\x06\x8fB9\x11\x9f8U}\xd70V\xa5\x1f\
-\x81!\xe2\x04\xdd[\x8e\xcc]\x1d\x16\xc7RF\xf7?\
-\x12*\x18\x87\x1c\x01*\x12\x0c\x9a\xa7\xcf\xc7\xd7\x07+\
-Vm\x0a+%\x90\xe6w\x19u\xf2\xce\xd7\x844?\
-\xe7Y$]\xe2K\x80\xfa\x95 \xc0\xe1U\xfbw\xef\
-+\xfe\xbc\xe0f\xa8L\xb2\x90\xc0\xa8\x0e\xaa\x92\x05;\
-8\xb0\xf79Wl1\xdf\xe9\x06\x11Wm\xe2\xd4\xbc\
-\x97\x08\x12\xde&z;\x81*\xcb\xba\x5c\xd7i\xb8\xd2\
-\xca\xd7\x844?\xe7Y$]\xe2K#\xcd\xe1*q\
-\x92#5\xfa\x11\xae\xfc\xd3t\x84\x13\x5c\x8e\xf5\xdc\x04\
-\xd2\xff\x9aU\xe3)&n\xb7c\x00\x00\x00\x1ctE\
-Xtlatex\x00BWoct = \
-log_2(f_2/f_1)\x86\x15\
-9u\x00\x00\x00\x0etEXtresolu\
-tion\x00150\x8aF?\xe6\x00\x00\x00\x0c\
-tEXtcolor\x00000000\
-\xc2\x9f\xf6\xa1\x00\x00\x00\x16tEXtSoft\
-ware\x00latex2png.c\
-omJ\x05\xa9\x0a\x00\x00\x00\x00IEND\xaeB\
-`\x82\
-\x00\x00\x05v\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x00p\x00\x00\x00\x15\x08\x06\x00\x00\x00\x9e\xd9j\xa2\
-\x00\x00\x04\xcbIDATx^\xad\x98\x8d\x91\x5c5\
-\x10\x84\x8f\x0c \x05\xc8\x00R\x80\x0c \x05\xc8\x00\xa7\
-`g`\xa7`g`R\xb03\x80\x14\xec\x0cl\xf4\
--\xd7[Mo\xebI\xfb\xee\xaa\xba\xab\xf64?\x1a\
-\x8dF#\xbd{xx\xb8\xc17\xc1\xc4S\xe5 u\
-\x9e\xca\x1d\xaclR\x0e\x7f\xb0\xdf+\xb8\xdd\x8c\x89\x95\
-<\x91\xfa\xd5\xa6)9Wh6\xc9\x15\xee\xd5O\xa4\
-}c\xa2\xc9?\x0c~\xfb\xdf\xcf\x1b\xf9\x19&\x9a\xce\
-\x11\xb7\xf1\xfd\xe0\xcb\xc1\xd7\x83\xaf\x1e\xf9n\xf0\x8f\xc1\
-\xe6\xd8y\x06\xcd\x8fs\x17\xc4K\xdc\xc4\xfb\xdd`\xf3\
-5c\xe2\xa7A\xd6\xdc\xe4\xbf\x0f\xbe\x1f\xfc\xf2\xc8\xb7\
-\x83\xe8\x8a\x1f\x07\xff\x1a\xfcq\xd0Al\x14\x056\x9f\
-\x06\xf1\xf1\xf3\xa0\x80\x1f\xc6\x91\xff=\x88/_\xc7\xaf\
-\x83\x8c\xcb\x9e8\xaeB\x91\xc5\x13\x00\x0b\xe0o\x07\x13\
- s\xfd3p\xfb3>\xd2\x1e\xaa\xc8\x88\xfb\xf3\xe0\
-o\x83MOL\xa4\xfc\xcd\xe0/1\xe6\x04\xda\x04\x90\
-rb\xf9:\xa8<\x8a\xf8d\x9cx\x13\xc8\x19G\x8e\
-^B\xf6\xf8\x96\xbf+h\x15T\x07\x95#a#\xc9\
-aq\xfa{\x05\xb7\x9d\xd94\x1dg\xa2\xc9I&\x15\
-JE\x93T\xb5\xbe]\xa4O*\xfd\x08\xdc\x8f$\xfa\
-\xc5\xa0bp\x10\x07'\x85\xae\xe0\xa0\xbbi<\xe7\x04\
-\x9cR\xe4\xd8\xcf\xe4\x15l\xde*h\xa0\xcaJ\xe7\xf7\
-0\xd1t\x8e\x98P\xb2\x9e\xeb\xbe\xe2\xf4f\xe2\x13\xb4\
-/\xe6T\x9bL\x1f\x5c7\xbe\xc1\x10\x10#vt3\
-\xd7\x97\x5c-\xf6\xd2\x1e\x03\x9c\xbe\xec\x0a\x17\x10\xac\x07\
-s\x04\x1d\xf1l\x0d\xf70\xd1t\x8e\x98\xa0*\xbd\xf8\
-\x9a\xcd=\xa4HW\xb9`\x03\xc8\x99\x90>\xb8j\xe8\
-V\xed%\x8b\x1d\x1b\xe5\xfa\xf0\xcfA\x15\x06\xbf\x13\xe4\
->m\xae\xad`\xd6:\x13\xb4O\xf4\xb3\x12flh\
-z\xce]\xb0X\x12I\xa2\xfe\x19$\xf1\xc4\xd7\xb0;\
-\x87\xae\x92\xd4O2g\xcb\x19\x8f\x0e\xe2 \x9eY\x11\
-\xd0\xee)8\xb7c\x1f\xb8\x02\xb0a\x03\xb3U\xb2V\
-\xda\xef\x0d\xb4!\xba\xf4\x13>\x09\xd4\x11\xaf\xce\x06\x5c\
-\x17\xdf\x04\x9adqN\x97\xb5\xd6\xb2b\xb6\xaa\xc6D\
-\xd3\x81\xb4\xbe\xe6\xcb\xa1$s\xd7rRDb'?\
-\xad\xfd\x01\xf9b\xcd\x14\x80\xfb\xd7\xa3\xc6\xefH\x81\xa2\
-\xc2\xbf\xeb\x8b\x97\xa4a\xb0s\xe9\xa3C\xb2|\xf2\x15\
-|\xb2\x19\x13+\xb9\x83\x05\x13\x93\xb7\xf4\xa7\x80\x0d`\
-\x9d>\x7f\xfa$\x99\xcc\xe9\xedQ\xe4 \x90\x1f\x0a!\
-!\x1d\xda+\xf6n\xa3\xf89\xc1\xc8\xfct\xb7\xd6)\
-^6\x8f#-4%\x91\xa0\xd0\xf7\x0akz\xce\x1d\
-4;\xe7\x11h;\x9e\x0c'\x0b\x87\x9c\xa8\xe9\xeb\xed\
-\x11\xe8\xb3!J\x5c\xc2\xfd\xa2\x93'\xc8\xa1\x97d\xb6\
-P\xb7'f}\xe3\xe5\x89G\xa6\xcf\xb5\xf6pq^\
-\xdb\xd8u \xa0q&#h*\xd4!\xf9=\x5c\xa1\
-\xd9\xcc\xc8\x06\xd1E\x1c\x8cg+\xd4\xe7\x85\xa0q\x11\
-\x90x\x0ab\x056\x87v\xe9p_\xed\x05\x0a\x05=\
-\x1a\xe9\x1e\x9c\xe6\xec~\xba#\xc1\xaa\xf0n>\x0b\x00\
-\x8b\xcd\x850)\x8e\xf3\xee\xf3\x00e/`\xa3\x02\xd9\
-%\xf1$\x8e\xe6`S\xb0I9\xb1\xe6\x09P\xd2\x80\
-\xeb\x8b\xcc\xaf\xdf3\xe8\xfec\x93\xdc\xd6\xa1\x17*y\
-l\xd0\x09\xc5\x87\xff\xc3A`\xf3\x88\x1f\xb9\xff'\xa6\
-\xf1\xd2{\xd9@9\xa2=\x12$\x0bU\xabd\xc2\xb6\
-y\xe0\xc6a \xe5;L\x1c\xc9\x89++\x9d8I\
-P\xabl\x15\xa6\xebC\xda\xd4\xce?(81\xf8\xce\
-\xfbO\xd0\x06g\xa7r\xc8G\xbeb\x05=\x14\xb3H\
-\x1a/\xc0\xa16\x88\xdf\x02\x1bGuCU\xc2s \
-\x83H&\x9a\x0e\xd4'PV\xba\x8a2\xab\x97\x136\
-K\x0ak<z\x08i\x5c\xdfw\xfa[\x04\xc4A\x1e\
-g\x0f!\x91\x18\x88/\x0f\x84\xe4l,\xb1&\xdc\x87\
-x\xfdA\xf0,\x82\x96\xc4\xc6A\x8erK\x8e;H\
-\xee\xa0\xd9\x1dq\x06N\x13\x95\x9ah\x1b\x08H\xae\x0a\
-\xd4\xfd\xc3v\x8f:i\x8b\xe4\x86\xf9 \x7f;\xd9X\
-\x12\xdfZ\xa2\xa0qN{{Y\x0a\xe4~\xd6~o\
-\x90N\x9c\x04\xe4/ Z\xd5\xacjfl\xd8\xd19\
-\x82\xechy\x14]B'3O cJ\xb0\x83\xab\
-\xc2;O\x83\xfbI{\x90\xf2\xa6\xb3\xc2\xca>\xe5M\
-\xe7\x7f\xf0\x07\x02\x0b\xd7\xd3\xf6\x1e\xee`e\xe32\xe2\
-PL\xc4\xc3\xdf\x09d\xb4\xb9\xec\x16l\xa0\xee.\x87\
-Z\x9e\xc3\xed\x1a\xcf\xe09|\xdc\xe0\xc8)\xafH\x16\
--\xb6\xf6\xb9B\xea7\xae\xe0\xba\xdc\x0d\x14\x16\x09\x9f\
-=\x14\xd0\xa3[\xe4g\x04\xadN\xd0\xb8\x7f\xfb9\x13\
-)O64\xbd#\xaePm\xda\xa0\xc8\x86\xe9I;\
-{\xbd\x9d\xc1\xca\xc7\x91\x9cv\xc7\xc6\xd0>\xf3%\x98\
-\xf4\x0fy\x8a\xd1O\x99\xeb\xccN\xf1\x11\x13gt\x12\
-)\xdfa\x1dt&V\xf2\x1d\xac|\xdc+\xdfaB\
-\xe3j\xc7\x09\xc9gL\x9c\xd1I\xa4|\xc9\x7f\x01h\
-C\x1d\x7fzb\xa1\xe7\x00\x00\x00\x12tEXtl\
-atex\x00Q = f_0 / B\
-W\xdc\xc6\xfc\xba\x00\x00\x00\x0etEXtres\
-olution\x00150\x8aF?\xe6\x00\
-\x00\x00\x0ctEXtcolor\x00000\
-000\xc2\x9f\xf6\xa1\x00\x00\x00\x16tEXtS\
-oftware\x00latex2pn\
-g.comJ\x05\xa9\x0a\x00\x00\x00\x00IEN\
-D\xaeB`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x08\
-\x06\x94\xcb#\
-\x00F\
-\x00o\x00r\x00m\x00u\x00l\x00a\x00s\
-\x00\x0f\
-\x0d\xc97\x14\
-\x00G\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00_\x00S\x00t\x00a\x00r\x00t\x00e\x00d\
-\x00\x0a\
-\x066~3\
-\x00H\
-\x00e\x00l\x00p\x00_\x00I\x00c\x00o\x00n\x00s\
-\x00\x04\
-\x00\x04\xa8\xa1\
-\x00D\
-\x00a\x00t\x00a\
-\x00\x06\
-\x05\x03}\xc3\
-\x00I\
-\x00m\x00a\x00g\x00e\x00s\
-\x00\x0d\
-\x01\xde\xa2G\
-\x00l\
-\x00i\x00g\x00h\x00t\x00b\x00u\x00l\x00b\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x05(-G\
-\x00s\
-\x00e\x00t\x00t\x00i\x00n\x00g\x00s\x00_\x001\x006\x00.\x00p\x00n\x00g\
-\x00\x1a\
-\x0bd\xff'\
-\x00m\
-\x00e\x00d\x00i\x00a\x00-\x00s\x00k\x00i\x00p\x00-\x00b\x00a\x00c\x00k\x00w\x00a\
-\x00r\x00d\x00_\x001\x006\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x0b\x85\x83\x07\
-\x00c\
-\x00l\x00e\x00a\x00r\x00.\x00p\x00n\x00g\
-\x00\x0e\
-\x0f\xde\x06'\
-\x00y\
-\x00o\x00u\x00t\x00u\x00b\x00e\x00_\x001\x006\x00.\x00p\x00n\x00g\
-\x00*\
-\x08\xc8dG\
-\x00a\
-\x00r\x00r\x00o\x00w\x00s\x00-\x00r\x00i\x00g\x00h\x00t\x00-\x00a\x00n\x00d\x00-\
-\x00l\x00e\x00f\x00t\x00-\x00f\x00i\x00l\x00l\x00e\x00d\x00-\x00t\x00r\x00i\x00a\
-\x00n\x00g\x00l\x00e\x00s\x00.\x00p\x00n\x00g\
-\x00\x19\
-\x09%+G\
-\x00m\
-\x00e\x00d\x00i\x00a\x00-\x00s\x00k\x00i\x00p\x00-\x00f\x00o\x00r\x00w\x00a\x00r\
-\x00d\x00_\x001\x006\x00.\x00p\x00n\x00g\
-\x00\x1e\
-\x02g\x80\xa7\
-\x00E\
-\x00Q\x00_\x00F\x00r\x00e\x00q\x00u\x00e\x00n\x00c\x00i\x00e\x00s\x00_\x00H\x00e\
-\x00l\x00p\x00_\x00Q\x00R\x00c\x00o\x00d\x00e\x00.\x00p\x00n\x00g\
-\x00\x14\
-\x01|@'\
-\x00B\
-\x00e\x00l\x00l\x00F\x00i\x00l\x00t\x00e\x00r\x00S\x00c\x00h\x00e\x00m\x00e\x00.\
-\x00p\x00n\x00g\
-\x00\x13\
-\x07\xb7\xe9\xc7\
-\x00D\
-\x00r\x00i\x00l\x00l\x00_\x00s\x00t\x00r\x00u\x00c\x00t\x00u\x00r\x00e\x00.\x00p\
-\x00n\x00g\
-\x00\x0c\
-\x0f\x01\x05\xc7\
-\x00T\
-\x00e\x00s\x00t\x00M\x00o\x00d\x00e\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0c\x8em\xe7\
-\x00T\
-\x00r\x00a\x00n\x00s\x00p\x00o\x00r\x00t\x00P\x00a\x00n\x00e\x00l\x00.\x00p\x00n\
-\x00g\
-\x00\x0d\
-\x00\xd9p\x07\
-\x00L\
-\x00e\x00a\x00r\x00n\x00M\x00o\x00d\x00e\x00.\x00p\x00n\x00g\
-\x00\x10\
-\x09ET\x07\
-\x00n\
-\x00e\x00x\x00t\x00-\x00e\x00x\x00a\x00m\x00p\x00l\x00e\x00.\x00p\x00n\x00g\
-\x00\x17\
-\x0d\xde\xd2g\
-\x00s\
-\x00e\x00q\x00u\x00e\x00n\x00t\x00i\x00a\x00l\x00-\x00p\x00l\x00a\x00y\x00b\x00a\
-\x00c\x00k\x00.\x00p\x00n\x00g\
-\x00\x0f\
-\x0c:\x99\xe7\
-\x00P\
-\x00r\x00e\x00v\x00i\x00e\x00w\x00M\x00o\x00d\x00e\x00.\x00p\x00n\x00g\
-\x00\x09\
-\x03G\xda\x07\
-\x00C\
-\x004\x00_\x00A\x004\x00.\x00p\x00n\x00g\
-\x00\x12\
-\x0dR\xf1'\
-\x00F\
-\x00r\x00e\x00q\x00u\x00e\x00n\x00c\x00y\x00-\x00N\x00o\x00t\x00e\x00.\x00p\x00n\
-\x00g\
-\x00\x0b\
-\x06\x03\xfc\xe7\
-\x00B\
-\x00W\x00_\x00f\x00o\x00r\x00m\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x02\x89\xb7\xe7\
-\x00Q\
-\x00_\x00f\x00r\x00o\x00m\x00_\x00B\x00W\x00_\x00f\x00o\x00r\x00m\x002\x00.\x00p\
-\x00n\x00g\
-\x00\x0e\
-\x0a=\x0d\x07\
-\x00B\
-\x00W\x00o\x00c\x00t\x00_\x00f\x00o\x00r\x00m\x00.\x00p\x00n\x00g\
-\x00\x13\
-\x02\x90\xb7\xe7\
-\x00Q\
-\x00_\x00f\x00r\x00o\x00m\x00_\x00B\x00W\x00_\x00f\x00o\x00r\x00m\x001\x00.\x00p\
-\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00:\x00\x02\x00\x00\x00\x01\x00\x00\x00\x17\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x11\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x16\x00\x02\x00\x00\x00\x01\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00T\x00\x02\x00\x00\x00\x01\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00b\x00\x02\x00\x00\x00\x0b\x00\x00\x00\x06\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02\xa2\x00\x00\x00\x00\x00\x01\x00\x01k#\
-\x00\x00\x01\x87\xef\xe7\x93\x17\
-\x00\x00\x02\x00\x00\x00\x00\x00\x00\x01\x00\x00\x10\x9b\
-\x00\x00\x01\x87\x9d\xd9\x17\x98\
-\x00\x00\x01\xbe\x00\x00\x00\x00\x00\x01\x00\x00\x0e\xd7\
-\x00\x00\x01\x88i\x87\x93T\
-\x00\x00\x03@\x00\x00\x00\x00\x00\x01\x00\x01\xa5{\
-\x00\x00\x01\x87\xdb*\xfb\xd7\
-\x00\x00\x02.\x00\x00\x00\x00\x00\x01\x00\x00\xa6\xb8\
-\x00\x00\x01\x87v\x11h(\
-\x00\x00\x02\xc2\x00\x00\x00\x00\x00\x01\x00\x01\x84\x04\
-\x00\x00\x01\x87\xf0Y\xc6z\
-\x00\x00\x03\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x8b\xf3\
-\x00\x00\x01\x87\xf0\x07=\x83\
-\x00\x00\x02x\x00\x00\x00\x00\x00\x01\x00\x01\x0d\x0d\
-\x00\x00\x01\x87\xf0\xc0\x15r\
-\x00\x00\x03X\x00\x00\x00\x00\x00\x01\x00\x01\xbc\xac\
-\x00\x00\x01\x87\xdcc\x930\
-\x00\x00\x02\xe8\x00\x00\x00\x00\x00\x01\x00\x01\x86\xb8\
-\x00\x00\x01\x87\xf0Di~\
-\x00\x00\x02Z\x00\x00\x00\x00\x00\x01\x00\x00\xf4\x91\
-\x00\x00\x01\x87\xef\xe9\x05^\
-\x00\x00\x00T\x00\x02\x00\x00\x00\x01\x00\x00\x00\x12\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00b\x00\x02\x00\x00\x00\x04\x00\x00\x00\x13\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\x9e\x00\x00\x00\x00\x00\x01\x00\x02\x22\xb9\
-\x00\x00\x01\x87\x9e\x0bod\
-\x00\x00\x03\xec\x00\x00\x00\x00\x00\x01\x00\x022\x83\
-\x00\x00\x01\x87\x9e\x05\xf5-\
-\x00\x00\x03\x82\x00\x00\x00\x00\x00\x01\x00\x02\x1d\x90\
-\x00\x00\x01\x87\x9e\x04\x84M\
-\x00\x00\x03\xca\x00\x00\x00\x00\x00\x01\x00\x02*\x5c\
-\x00\x00\x01\x87\x9e\x00U\x9a\
-\x00\x00\x00T\x00\x02\x00\x00\x00\x01\x00\x00\x00\x18\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00b\x00\x02\x00\x00\x00\x07\x00\x00\x00\x19\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00t\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x87\xd9\x0a\x04\x92\
-\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x03\xb5\
-\x00\x00\x01\x88\xa71\x83\xca\
-\x00\x00\x01,\x00\x00\x00\x00\x00\x01\x00\x00\x0a\xf7\
-\x00\x00\x01\x87\xd9?\xc0K\
-\x00\x00\x01\x86\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x07\
-\x00\x00\x01\x87\xd9@\xd3\x15\
-\x00\x00\x00\xb8\x00\x00\x00\x00\x00\x01\x00\x00\x05[\
-\x00\x00\x01\x87\xd9A\x0c5\
-\x00\x00\x00\xf2\x00\x00\x00\x00\x00\x01\x00\x00\x08/\
-\x00\x00\x01\x87\xd9>\x03\x0f\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x09\xa2\
-\x00\x00\x01\x8dR98\x0b\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
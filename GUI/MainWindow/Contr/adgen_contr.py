@@ -14,6 +14,8 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from GUI import globals as gb
+from GUI.Misc.qt_signal_adapter import QtSignalAdapter
 from GUI.Misc.tracked_proc import ProcTrackControl
 from Model.audiodrill_gen import AudioDrillGen
 from Utilities.Q_extract import Qextr
@@ -23,6 +25,7 @@ from definitions import PN
 class ADGenContr:
     def __init__(self, parent):  # parent: MainWindowContr
         self.parent = parent
+        self.normLevelAdapter = None
 
     def setAudioDrillGen(self, resetExGen=True):
         if self.parent.ADGen is None and self.parent.SourceAudio is not None \
@@ -49,13 +52,15 @@ class ADGenContr:
                                        'Q': Qextr(self.parent.EQSetContr.EQSetView.BWBox.currentText()),
                                        'order': self.parent.freqOrder(),
                                        'boost_cut_priority': self.parent.boostCutPriority,
-                                       'disableAdjacent': EQP['DisableAdjacentFiltersMode']})
+                                       'disableAdjacent': EQP['DisableAdjacentFiltersMode'],
+                                       'lookahead': gb.drill_lookahead,
+                                       'lazy': gb.lazy_slice_decoding})
         ADG.exec()
         self.parent.isErrorInProcess(ADG)
         self.parent.ADGen = ADG.return_obj or None
         if self.parent.ADGen is not None:
-            self.parent.ADGen.audiochunk.signals.showNormalizationLevel.connect(
-                self.parent.mw_view.status.showNormalization)
+            self.normLevelAdapter = QtSignalAdapter(self.parent.ADGen.audiochunk.signals.showNormalizationLevel,
+                                                    self.parent.mw_view.status.showNormalization)
 
     def _adjustADGenCropRange(self):
         SR = self.parent.SourceRange
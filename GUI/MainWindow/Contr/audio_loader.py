@@ -18,7 +18,8 @@ from GUI.Modes.PreviewMode import PreviewMode
 from GUI.Playlist.plsong import PlSong
 from Model.AudioEngine.preview_audio import PreviewAudioCrop
 from Model.globals import MinAudioDuration
-from definitions import Settings, PN
+from GUI.qt_runtime import Settings
+from definitions import PN
 from pathlib import Path
 
 
@@ -31,8 +32,7 @@ class AudioLoad:
     def _songCanBeLoaded(self, Song: PlSong):
         if self.parent.CurrentSourceMode.name != 'Audiofile':
             return False
-        if hasattr(Song, 'file_properties'):
-            Song.__delattr__('file_properties')
+        Song.resetMetadata()
         self._showNoLoadReasons(Song)
         return bool(
             Song.duration >= MinAudioDuration
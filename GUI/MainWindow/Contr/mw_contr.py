@@ -19,8 +19,9 @@ import platform
 import threading
 import darkdetect
 from typing import Union
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import QObject, QTimer, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QActionGroup
+from GUI import globals as gb
 from GUI.MainWindow.View import dark_theme
 from GUI.UpdateChecker.update_checker_contr import UpdCheckContr
 from GUI.EQ.eq_contr import EQContr
@@ -32,6 +33,7 @@ from GUI.MainWindow.Contr.adgen_contr import ADGenContr
 from GUI.MainWindow.Contr.audio_loader import AudioLoad
 from GUI.MainWindow.Contr.sourcerange_contr import SourceRangeContr
 from GUI.MainWindow.View.mw_view import MainWindowView
+from GUI.Misc.file_hash_run import FileHashRun
 from GUI.Misc.tracked_proc import ProcTrackControl
 from GUI.Modes.LearnMode import LearnMode
 from GUI.Modes.PreviewMode import PreviewMode
@@ -47,10 +49,12 @@ from GUI.Help.HelpActions import HelpActions
 from GUI.SupportApp.supportapp_contr import SupportAppContr
 from Model.AudioEngine.preview_audio import PreviewAudioCrop
 from Model.audiodrill_gen import AudioDrillGen
-from Model.file_hash import filehash
+from Model.file_hash import lookup_filehash
 from Utilities.Q_extract import Qextr
 from Utilities.exceptions import InterruptedException
-from definitions import app, Settings, PN
+from Utilities.startup_trace import tracer
+from GUI.qt_runtime import app, Settings
+from definitions import PN
 
 
 class MW_Signals(QObject):
@@ -63,20 +67,24 @@ class MainWindowContr(QObject):
     BoostCutOrderActionGroup: Union[QActionGroup, QActionGroup]
     SourceAudio: PlSong or None
     SourceRange: PreviewAudioCrop or None
-    ADGen: AudioDrillGen or None
     CurrentSourceMode: PinkNoiseMode or AudioFileMode
     signals = MW_Signals()
 
     def __init__(self):
         super().__init__()
-        self.mw_view = MainWindowView()
+        self._ADGen = None
+        with tracer.phase('Main window view'):
+            self.mw_view = MainWindowView()
         if platform.system() == 'Windows':
             self.mw_view.win_os_settings()
         self.CurrentAudio = None
         self.LoadedFileHash = None
         self.LoadedFilePath = None
         self.LastSourceAudio = None
-        self.UpdCheckContr = UpdCheckContr(self)
+        self.hashThreadpool = QThreadPool()
+        self.FileHashRun = None
+        with tracer.phase('Update checker'):
+            self.UpdCheckContr = UpdCheckContr(self)
         self.EQContr = EQContr(self)
         self.EQSetContr = EQSetContr(self)
         self.setShufflePBMode()
@@ -102,6 +110,7 @@ class MainWindowContr(QObject):
         self.setPlaybackButtons()
         self.setNextExampleBut()
         self.mw_view.signals.appClose.connect(self.onAppClose)
+        app.aboutToQuit.connect(self._closeADGen)
         QTimer.singleShot(10, self.mw_view.show)
         self.setSourceButtons()
         self.mw_view.VolumeSlider.setValue(60)
@@ -111,8 +120,10 @@ class MainWindowContr(QObject):
         QTimer.singleShot(10, self._restoreAudioSource)
 
     def _restoreAudioSource(self):
-        self.PlaylistContr.loadCurrentPlaylist()
-        self.PlaylistContr.restoreLastAudioSource()
+        with tracer.phase('Playlist restore'):
+            self.PlaylistContr.loadCurrentPlaylist()
+        with tracer.phase('Last audio source restore'):
+            self.PlaylistContr.restoreLastAudioSource()
         self.signals.audioSourcesRestored.emit()
 
     def setFileMenuActions(self):
@@ -209,6 +220,17 @@ class MainWindowContr(QObject):
         if self.LearnFreqOrderActionGroup.checkedAction() == self.mw_view.actionShuffleEQ:
             return 'shuffle'
 
+    @property
+    def ADGen(self) -> AudioDrillGen or None:
+        return self._ADGen
+
+    @ADGen.setter
+    def ADGen(self, ADGen: AudioDrillGen or None):
+        # The replaced generator is closed, so its drill render threads and cached drills don't outlive it
+        if self._ADGen is not None and self._ADGen is not ADGen:
+            self._ADGen.close()
+        self._ADGen = ADGen
+
     @property
     def boostCutPriority(self):
         if self.BoostCutOrderActionGroup.checkedAction() == self.mw_view.actionEach_Band_Boosted_then_Cut:
@@ -263,11 +285,38 @@ class MainWindowContr(QObject):
             self.mw_view.actionPreview_Mode.setChecked(True)
 
     def hashAudioFile(self):
+        # Files not hashed yet are hashed in the background: training and the saved source range become available
+        # once the hash is ready (see _onAudioFileHashed)
         if self.SourceAudio is None:
             return
-        _hash = filehash(self.SourceAudio.path)
+        try:
+            self.LoadedFileHash = lookup_filehash(self.SourceAudio.path, fast=gb.fast_file_hash)
+        except OSError:
+            self.LoadedFileHash = None
+        if self.LoadedFileHash is None:
+            self.FileHashRun = FileHashRun(self.SourceAudio.path, fast=gb.fast_file_hash)
+            self.FileHashRun.signals.finished.connect(self._onAudioFileHashed)
+            self.FileHashRun.signals.error.connect(self._onAudioFileHashError)
+            self.hashThreadpool.start(self.FileHashRun)
+        return self.LoadedFileHash
+
+    def _onAudioFileHashed(self, filepath: str, _hash: str):
+        if self.SourceAudio is None or self.SourceAudio.path != filepath or self.LoadedFileHash is not None:
+            return
         self.LoadedFileHash = _hash
-        return _hash
+        if self.CurrentMode.name == 'Preview' and self.SourceRange is not None:
+            self.SRC.applySavedSourceRange()
+            self.setTrainingActionsEnabled(True)
+
+    def _onAudioFileHashError(self, filepath: str, message: str):
+        # Without the hash the source range can't be saved, so Learn/Test stay disabled: the file remains available
+        # for preview
+        if self.SourceAudio is None or self.SourceAudio.path != filepath:
+            return
+        self.LoadedFileHash = None
+        self.setTrainingActionsEnabled(False)
+        self.pushBackToPreview(ignoreADGen=True)
+        self.mw_view.error_msg(f'Error reading "{self.SourceAudio.name}"! {message}')
 
     def setPlaybackButtons(self):
         self.mw_view.MW_PlayPause.setDefaultAction(self.mw_view.actionPlayPause)
@@ -294,6 +343,9 @@ class MainWindowContr(QObject):
         self.PlaylistContr.saveCurrentPlaylist()
         self.mw_view.storeWindowView()
 
+    def _closeADGen(self):
+        self.ADGen = None
+
     @property
     def normHeadroomChanged(self):
         gain_range_gui = self.EQSetContr.EQSetView.GainRangeSpin.value()
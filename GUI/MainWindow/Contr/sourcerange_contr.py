@@ -42,6 +42,11 @@ class SourceRangeContr:  # parent: MainWindowContr
             return
         self.setSourceRange(range_params, reset=reset)
 
+    def applySavedSourceRange(self):
+        range_params = SourceRangeManager().get(self.parent.LoadedFileHash)
+        if range_params is not None:
+            self.setSourceRange(range_params, reset=False)
+
     def setSourceRange(self, params, reset=True):
         if reset:
             self.parent.SourceRange = PreviewAudioCrop(self.parent.SourceAudio.duration, params[0],
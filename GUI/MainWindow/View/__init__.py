@@ -17,6 +17,5 @@
 import sys
 
 from GUI.Playlist import playlistview
-from GUI import icons_rc
 
 sys.modules["playlistview"] = playlistview
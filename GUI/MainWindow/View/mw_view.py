@@ -37,7 +37,8 @@ from GUI.About.about_dialog_view import AboutDialogView
 from GUI.MainWindow.View.dark_theme import green_color
 from Utilities.str2bool import str2bool
 from Utilities.checkMimeData import checkDroppedMimeData
-from definitions import Settings
+from GUI import qt_runtime
+from GUI.qt_runtime import Settings
 
 
 class MW_Signals(QObject):
@@ -180,7 +181,7 @@ class MainWindowView(QMainWindow, Ui_MainWindow):
         self.Eq_Settings.hide()
         self.SupportProject.hide()
         self.TransportPanel.hide()
-        av_geom = definitions.app.primaryScreen().availableGeometry()
+        av_geom = qt_runtime.app.primaryScreen().availableGeometry()
         width = min(self.width(), 1100, av_geom.width() - 10)
         height = min(self.height(), 700, av_geom.height() - 30)
         self.resize(width, height)
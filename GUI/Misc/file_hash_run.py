@@ -0,0 +1,40 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+from Model.file_hash import filehash_with_cache
+
+
+class FileHashSignals(QObject):
+    finished = pyqtSignal(str, str)  # file path, hash
+    error = pyqtSignal(str, str)  # file path, message
+
+
+class FileHashRun(QRunnable):
+    def __init__(self, filepath: str, fast=False):
+        super().__init__()
+        self.signals = FileHashSignals()
+        self.filepath = filepath
+        self.fast = fast
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            _hash = filehash_with_cache(self.filepath, fast=self.fast)
+        except Exception as e:
+            self.signals.error.emit(self.filepath, str(e))
+            return
+        self.signals.finished.emit(self.filepath, _hash)
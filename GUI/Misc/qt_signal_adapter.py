@@ -0,0 +1,40 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from Model.observer import Signal
+
+
+class QtSignalAdapter(QObject):
+    # Forwards a Model signal to slot through a Qt signal: when the Model signal is emitted from a worker thread,
+    # slot is still called in the GUI thread (queued connection)
+    relay = pyqtSignal(tuple)
+
+    def __init__(self, signal: Signal, slot):
+        super().__init__()
+        self.signal = signal
+        self.slot = slot
+        self.relay.connect(self._call)
+        self.signal.connect(self._emit)
+
+    def _emit(self, *args):
+        self.relay.emit(args)
+
+    def _call(self, args: tuple):
+        self.slot(*args)
+
+    def disconnect_signal(self):
+        self.signal.disconnect(self._emit)
@@ -17,7 +17,8 @@
 import contextlib
 from pathlib import Path
 from PyQt6.QtCore import QTimer
-from Model.audiodrill_gen import create_temp_wavefile
+from GUI import globals as gb
+from Model.audiodrill_gen import create_temp_wavefile, create_memory_wavefile
 from definitions import TEMP_AUDIO_DIR
 
 
@@ -88,7 +89,7 @@ class UniMode:
         self.view.actionLoop_Sequence.setVisible(False)
 
     def updateCurrentAudio(self):
-        self.parent.CurrentAudio = create_temp_wavefile()
+        self.parent.CurrentAudio = create_memory_wavefile() if gb.in_memory_playback else create_temp_wavefile()
 
     def enableTimeSettingsChanges(self, arg: bool):
         self.view.TransportPanelView.AudioSliderView.Cursor.setMovable(arg)
@@ -124,7 +125,7 @@ class UniMode:
 
     def cleanTempAudio(self):
         with contextlib.suppress(AttributeError, PermissionError):
-            if self.parent.LoadedFilePath is not None \
+            if isinstance(self.parent.LoadedFilePath, str) \
                     and Path(self.parent.LoadedFilePath).parent == Path(TEMP_AUDIO_DIR):
                 Path(self.parent.LoadedFilePath).unlink(missing_ok=True)
 
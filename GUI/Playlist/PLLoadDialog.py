@@ -14,40 +14,44 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from multiprocessing import Process, Manager
+from multiprocessing import Pipe, Process
 from PyQt6.QtCore import QObject, Qt, QRunnable, pyqtSignal, pyqtSlot, QThreadPool
 from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QLabel, QVBoxLayout
-from Model.FileLinksParser import pathsResolve
+from Model.FileLinksParser import pathsResolveToPipe
 
 
 class PLLoadSignals(QObject):
+    resolved = pyqtSignal(list)  # batch of audio file paths
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
 
 class PLLoadChecker(QRunnable):
-    signals = PLLoadSignals()
-
-    def __init__(self, process):
+    # Relays the resolver process' messages; recv() blocks until a message arrives or the process closes the pipe
+    def __init__(self, conn):
         super().__init__()
-        self.process = process
-        self._killed = False
+        self.signals = PLLoadSignals()
+        self.conn = conn
 
     @pyqtSlot()
     def run(self):
-        while self.process.is_alive() and not self._killed:
+        try:
+            while True:
+                kind, data = self.conn.recv()
+                if kind == 'paths':
+                    self.signals.resolved.emit(data)
+                else:
+                    self.signals.error.emit(data)
+        except (EOFError, OSError):
             pass
-        if self._killed:
-            return
         self.signals.finished.emit()
 
-    def kill(self):
-        self._killed = True
-
 
 class PLProcDialog(QDialog):
+    # pathsResolved is emitted with each batch of found audio file paths while the dialog is open
     threadpool: QThreadPool
     process_check_run: PLLoadChecker
+    pathsResolved = pyqtSignal(list)
 
     def __init__(self, paths: list[str]):
         super().__init__()
@@ -62,25 +66,42 @@ class PLProcDialog(QDialog):
         self.layout.addWidget(self.label)
         self.layout.addWidget(self.buttonBox)
         self.setLayout(self.layout)
-        self.return_dict = Manager().dict()
-        self.process = Process(target=pathsResolve, args=(self.paths, self.return_dict), daemon=True)
-        self.start_process()
+        self.found_count = 0
+        self.cancelled = False
+        self.errors = []
+        self.conn, child_conn = Pipe(duplex=False)
+        self.process = Process(target=pathsResolveToPipe, args=(self.paths, child_conn), daemon=True)
+        self.start_process(child_conn)
 
-    def start_process(self):
+    def start_process(self, child_conn):
         self.process.start()
-        self.process_check_run = PLLoadChecker(self.process)
-        self.process_check_run.signals.finished.connect(self.on_finished, type=Qt.ConnectionType.SingleShotConnection)
+        child_conn.close()  # the process holds the only write end, so recv() gets EOF when it exits
+        self.process_check_run = PLLoadChecker(self.conn)
+        self.process_check_run.signals.resolved.connect(self.on_resolved)
+        self.process_check_run.signals.error.connect(self.errors.append)
+        self.process_check_run.signals.finished.connect(self.on_finished)
         self.threadpool = QThreadPool()
         self.threadpool.setMaxThreadCount(1)
         self.threadpool.start(self.process_check_run)
 
+    def on_resolved(self, paths: list[str]):
+        if self.cancelled:  # already queued before cancelling
+            return
+        self.found_count += len(paths)
+        self.label.setText(f"Adding audiofile(s) to playlist... {self.found_count} found")
+        self.pathsResolved.emit(paths)
+
     def on_finished(self):
+        if self.cancelled:
+            return
+        self.process.join()
+        self.conn.close()
         self.accept()
 
     def reject(self):
-        self.process_check_run.kill()
-        if self.threadpool.activeThreadCount() > 0:
-            self.threadpool.waitForDone()
+        self.cancelled = True
         self.process.terminate()
         self.process.join()
+        self.threadpool.waitForDone()
+        self.conn.close()
         super(PLProcDialog, self).reject()
@@ -14,12 +14,16 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import copy
 import random
 from GUI.Playlist.plsong import PlSong
 
 
 class PlNavi:
+    # Songs are looked up by identity (PlSong compares by identity) in position maps, so navigation doesn't scan the
+    # playlist. The maps are rebuilt once after the playlist has changed (see dataSync), on the next call.
+    # Shuffle order is a random permutation of the songs not played yet (shuffleQueue, consumed from the end);
+    # songs added later are swapped into random positions
+
     def __init__(self, playlistdata: list[PlSong], currentSong=None, shuffle=False, repeat_playlist=True):
         self.playlistdata = playlistdata
         self.playedSongs = []
@@ -28,6 +32,13 @@ class PlNavi:
         self._currentSong = currentSong
         self._shuffle = shuffle
         self._repeat_playlist = repeat_playlist
+        self._order = []
+        self._positions = {}
+        self._played_positions = {}
+        self._prev_positions = {}
+        self._prev_played_positions = {}
+        self.shuffleQueue = []
+        self._outdated = True
 
     @property
     def maxId(self):
@@ -38,10 +49,44 @@ class PlNavi:
         return self.currentSong().path if self.currentSong() is not None else None
 
     def dataSync(self, newPlData):
+        # Should be called after every change of the playlist: insertion, removal or reordering
         self.playlistdata = newPlData
-        self.playedSongs = [S for S in self.playedSongs if S in self.playlistdata]
+        self._outdated = True
+
+    def _sync(self):
+        if not self._outdated:
+            return
+        self._outdated = False
+        old_order, old_positions = self._order, self._positions
+        old_played, old_played_positions = self.playedSongs, self._played_positions
+        self._order = list(self.playlistdata)
+        self._positions = {S: ind for ind, S in enumerate(self._order)}
+        self.playedSongs = [S for S in self.playedSongs if S in self._positions]
+        self._played_positions = {S: ind for ind, S in enumerate(self.playedSongs)}
+        current = self._currentSong
+        # The previous order is kept while the current song is missing, to find its former neighbours
+        if current in old_positions and current not in self._positions:
+            self.prev_playlistdata, self._prev_positions = old_order, old_positions
+        if current in old_played_positions and current not in self._played_positions:
+            self.prev_playedSongs, self._prev_played_positions = old_played, old_played_positions
+        self._updShuffleQueue(old_positions)
+
+    def _updShuffleQueue(self, old_positions: dict):
+        if len(self.shuffleQueue) > 2 * len(self._order):  # dropping removed songs from time to time
+            self.shuffleQueue = [S for S in self.shuffleQueue if S in self._positions]
+        for S in self._order:
+            if S not in old_positions and S not in self._played_positions:
+                self.shuffleQueue.append(S)
+                j = random.randrange(len(self.shuffleQueue))
+                self.shuffleQueue[j], self.shuffleQueue[-1] = self.shuffleQueue[-1], self.shuffleQueue[j]
+
+    def indexOf(self, Song: PlSong):
+        # Position of Song in the playlist or None
+        self._sync()
+        return self._positions.get(Song)
 
     def findCurrentSong(self, availableOnly=True, avoidActualCurrentSong=False):
+        self._sync()
         if len(self.playlistdata) == 0:
             return None
         #   When current song is in playlist
@@ -57,37 +102,37 @@ class PlNavi:
         return None
 
     def next(self):
+        self._sync()
         if len(self.playlistdata) == 0 or self.currentSong() is None:
             return None
         if self.shuffle():
             return self._nextShuffle()
-        if self.currentSong() == self.playlistdata[-1]:
+        if self.currentSong() is self._order[-1]:
             return self.findCurrentSong(availableOnly=False, avoidActualCurrentSong=True) if self.repeat_playlist() \
                 else None
         if not self.currentSongInside():
             return self._findNextToDeletedCurrentSong()
-        next_song_id = self.playlistdata.index(self._currentSong) + 1
-        return self.playlistdata[next_song_id]
+        return self._order[self._positions[self._currentSong] + 1]
 
     def _nextShuffle(self):
         if len(self.playlistdata) == 0:
             return None
         if len(self.playedSongs) > 0 and self.currentSong() != self.playedSongs[-1]:
-            for ind, S in enumerate(self.playedSongs):
-                if S == self.currentSong():
-                    return self.playedSongs[ind + 1]
+            ind = self._played_positions.get(self.currentSong())
+            if ind is not None:
+                return self.playedSongs[ind + 1]
         return self._getShuffled()
 
     def _findNextToDeletedCurrentSong(self):
         if len(self.playlistdata) == 0 or len(self.prev_playlistdata) == 0 or self.currentSong() is None \
-                or self.currentSong() not in self.prev_playlistdata:
+                or self.currentSong() not in self._prev_positions:
             return None
-        start_ind = self.prev_playlistdata.index(self.currentSong())
+        start_ind = self._prev_positions[self.currentSong()]
         return next(
             (
                 self.prev_playlistdata[i]
                 for i in range(start_ind, len(self.prev_playlistdata))
-                if self.prev_playlistdata[i] in self.playlistdata
+                if self.prev_playlistdata[i] in self._positions
             ),
             self.findCurrentSong(availableOnly=False)
             if self.repeat_playlist()
@@ -95,53 +140,60 @@ class PlNavi:
         )
 
     def prev(self):
+        self._sync()
         if len(self.playlistdata) == 0 or self.currentSong() is None:
             return None
         if self._shuffle:
             return self._prevShuffle()
         if not self.currentSongInside():
-            prevSong = self._findPrevToDeletedCurrentSong(self.playlistdata, self.prev_playlistdata)
+            prevSong = self._findPrevToDeletedCurrentSong(self._positions, self.prev_playlistdata,
+                                                          self._prev_positions)
             return prevSong if prevSong is not None else self.findCurrentSong(availableOnly=False)
-        prev_song_id = max(self.playlistdata.index(self._currentSong) - 1, 0)
-        return self.playlistdata[prev_song_id]
+        prev_song_id = max(self._positions[self._currentSong] - 1, 0)
+        return self._order[prev_song_id]
 
     def _prevShuffle(self):
         if len(self.playedSongs) == 0 or self.currentSong() is None:
             return None
-        if self.currentSong() not in self.playedSongs:
-            prev_song = self._findPrevToDeletedCurrentSong(self.playedSongs, self.prev_playedSongs)
+        if self.currentSong() not in self._played_positions:
+            prev_song = self._findPrevToDeletedCurrentSong(self._played_positions, self.prev_playedSongs,
+                                                           self._prev_played_positions)
             return prev_song if prev_song is not None else self.playedSongs[0]
-        prev_song_id = max(self.playedSongs.index(self._currentSong) - 1, 0)
+        prev_song_id = max(self._played_positions[self._currentSong] - 1, 0)
         return self.playedSongs[prev_song_id]
 
-    def _findPrevToDeletedCurrentSong(self, curr_list: list, prev_list: list):
+    def _findPrevToDeletedCurrentSong(self, curr_positions: dict, prev_list: list, prev_positions: dict):
         if (
-                not curr_list
+                not curr_positions
                 or not prev_list
                 or self.currentSong() is None
-                or self.currentSong() not in prev_list
+                or self.currentSong() not in prev_positions
         ):
             return None
-        stop_ind = prev_list.index(self.currentSong())
+        stop_ind = prev_positions[self.currentSong()]
         return next(
             (
                 prev_list[i]
                 for i in reversed(range(stop_ind))
-                if prev_list[i] in curr_list
+                if prev_list[i] in curr_positions
             ),
             None,
         )
 
     def setCurrentSong(self, Song: PlSong or None):
+        self._sync()
         self._currentSong = Song
         if Song is None:
             return
-        if Song not in self.playedSongs and Song in self.playlistdata:
+        if Song not in self._played_positions and Song in self._positions:
+            self._played_positions[Song] = len(self.playedSongs)
             self.playedSongs.append(Song)
-        self.prev_playlistdata = copy.copy(self.playlistdata)
-        self.prev_playedSongs = copy.copy(self.playedSongs)
+        if Song in self._positions:
+            self.prev_playlistdata, self._prev_positions = [], {}
+            self.prev_playedSongs, self._prev_played_positions = [], {}
 
     def firstAvailable(self):
+        self._sync()
         if len(self.playlistdata) == 0:
             return None
         if self.shuffle():
@@ -157,18 +209,20 @@ class PlNavi:
         return {P.path for P in self.playlistdata}
 
     def _getShuffled(self):
+        # Next song of the shuffle order; it is consumed when it becomes the current song
+        self._sync()
         if len(self.playlistdata) == 0:
             return
-        playlist_paths = self.playlist_paths
-        playedSong_paths = {P.path for P in self.playedSongs}
-        if playlist_paths == playedSong_paths:
-            return self.playedSongs[0] if self.repeat_playlist() else None
-        not_played = playlist_paths - playedSong_paths
-        choice = random.choice(tuple(not_played))
-        return next((S for S in self.playlistdata if choice == S.path), None)
+        while self.shuffleQueue and (self.shuffleQueue[-1] in self._played_positions
+                                     or self.shuffleQueue[-1] not in self._positions):
+            self.shuffleQueue.pop()
+        if not self.shuffleQueue:
+            return self.playedSongs[0] if self.repeat_playlist() and self.playedSongs else None
+        return self.shuffleQueue[-1]
 
     def currentSongInside(self):
-        return None if self.currentSong() is not None and self.currentSong() not in self.playlistdata \
+        self._sync()
+        return None if self.currentSong() is not None and self.currentSong() not in self._positions \
             else self._currentSong
 
     def currentSong(self):
@@ -0,0 +1,67 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from Model.audio_metadata import metadata_cache
+
+
+class MetadataProbeSignals(QObject):
+    probed = pyqtSignal(list)  # [(path, metadata)]
+
+
+class MetadataProbeRun(QRunnable):
+    def __init__(self, paths: list[str], workers: int):
+        super().__init__()
+        self.signals = MetadataProbeSignals()
+        self.paths = paths
+        self.workers = workers
+        self.stopped = self.finished = False
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            for batch in metadata_cache.probe_many(self.paths, workers=self.workers, stopped=lambda: self.stopped):
+                if self.stopped:
+                    return
+                self.signals.probed.emit(batch)
+        finally:
+            self.finished = True
+
+
+class MetadataProber(QObject):
+    # Reads audio file metadata of playlist songs in the background; results arrive in batches via probed
+    probed = pyqtSignal(list)  # [(path, metadata)]
+
+    def __init__(self, workers=4):
+        super().__init__()
+        self.workers = workers
+        self.threadpool = QThreadPool()
+        self.threadpool.setMaxThreadCount(1)
+        self.runs = []
+
+    def probe(self, paths: list[str]):
+        if not paths:
+            return
+        run = MetadataProbeRun(paths, self.workers)
+        run.signals.probed.connect(self.probed)
+        self.runs = [r for r in self.runs if not r.finished] + [run]
+        self.threadpool.start(run)
+
+    def stop(self):
+        for run in self.runs:
+            run.stopped = True
+        self.runs.clear()
+        self.threadpool.clear()
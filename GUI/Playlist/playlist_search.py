@@ -0,0 +1,102 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import re
+from bisect import bisect_left, insort
+from GUI.Playlist.plsong import PlSong
+
+_word = re.compile(r'\w+')
+
+
+class PlaylistSearchIndex:
+    # Word prefix index of playlist songs' names and folder paths. A song matches a query if every query word is the
+    # beginning of some word of its name or folder path; queries without words fall back to substring search.
+    # Songs are identified by id(), so the index doesn't depend on row positions. Indexed songs are referenced until
+    # they are dropped by remove() or sync(), so their ids can't be reused meanwhile
+
+    def __init__(self):
+        self.words = []  # sorted unique words
+        self.word_songs = {}  # word: {song id}
+        self.song_words = {}  # song id: (song, words, lowercase text)
+
+    def sync(self, songs: list[PlSong]):
+        # Indexes added songs and drops removed ones; songs already indexed are not processed again
+        current = {id(S): S for S in songs}
+        for song_id in self.song_words.keys() - current.keys():
+            self._remove(song_id)
+        for song_id in current.keys() - self.song_words.keys():
+            self._add(song_id, current[song_id])
+
+    def add(self, song: PlSong):
+        if id(song) not in self.song_words:
+            self._add(id(song), song)
+
+    def remove(self, song: PlSong):
+        if id(song) in self.song_words:
+            self._remove(id(song))
+
+    def __contains__(self, song_id: int):
+        return song_id in self.song_words
+
+    def _add(self, song_id: int, song: PlSong):
+        text = f'{song.name}\n{song.dirPath}'.lower()
+        words = frozenset(_word.findall(text))
+        self.song_words[song_id] = (song, words, text)
+        for word in words:
+            if word not in self.word_songs:
+                self.word_songs[word] = set()
+                insort(self.words, word)
+            self.word_songs[word].add(song_id)
+
+    def _remove(self, song_id: int):
+        _, words, _ = self.song_words.pop(song_id)
+        for word in words:
+            song_ids = self.word_songs[word]
+            song_ids.discard(song_id)
+            if not song_ids:
+                del self.word_songs[word]
+                del self.words[bisect_left(self.words, word)]
+
+    def _prefix_matches(self, prefix: str):
+        matches = set()
+        for i in range(bisect_left(self.words, prefix), len(self.words)):
+            if not self.words[i].startswith(prefix):
+                break
+            matches |= self.word_songs[self.words[i]]
+        return matches
+
+    def search(self, query: str):
+        # set of matching song ids
+        query = query.lower()
+        query_words = _word.findall(query)
+        if not query_words:
+            return {song_id for song_id, (_, _, text) in self.song_words.items() if query in text}
+        matches = None
+        for word in sorted(set(query_words), key=len, reverse=True):  # longer words usually narrow down faster
+            word_matches = self._prefix_matches(word)
+            matches = word_matches if matches is None else matches & word_matches
+            if not matches:
+                break
+        return matches
+
+    def matches(self, song_id: int, query: str):
+        # Whether an indexed song matches the query, checked without the word list (for a single song)
+        _, words, text = self.song_words[song_id]
+        query = query.lower()
+        query_words = _word.findall(query)
+        if not query_words:
+            return query in text
+        return all(any(word.startswith(query_word) for word in words) for query_word in set(query_words))
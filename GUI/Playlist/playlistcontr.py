@@ -18,10 +18,9 @@ import contextlib
 import mimetypes
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, Qt, QModelIndex, QUrl
+from PyQt6.QtCore import QObject, Qt, QModelIndex, QUrl, QTimer
 from PyQt6.QtWidgets import QFileDialog, QWidget
 from PyQt6.QtGui import QAction, QKeySequence
-from GUI.FileMaker.make_playlist import saveCurrentPlaylist
 from GUI.Misc.error_message import error_message
 from GUI.Playlist.ContextMenu import PLContextMenu
 from GUI.Playlist.PLLoadDialog import PLProcDialog
@@ -29,11 +28,14 @@ from GUI.Playlist.PlaylistNavigation import PlNavi
 from GUI.Playlist.playlistmodel import PlaylistData, PlaylistModel, PLSortFilterProxyModel
 from GUI.Playlist.plsong import PlSong
 from Model.FileLinksParser import parseLinksFrom_M3U, AudioMimes
-from definitions import app, USER_DOCS_DIR, CURRENT_PLAYLIST_PATH, Settings, PN, launch_files_onstart
+from Model.playlist_store import playlist_store
+from GUI.qt_runtime import app, Settings, launch_files_onstart
+from definitions import USER_DOCS_DIR, CURRENT_PLAYLIST_PATH, PN
 
 
 class PlaylistContr(QObject):
     """@DynamicAttrs"""
+    autosaveInterval = 60000  # ms; only the changes since the last save are written (see PlaylistStore)
 
     def __init__(self, parent):
         super().__init__()
@@ -49,6 +51,10 @@ class PlaylistContr(QObject):
         self.selModel = self.PlaylistView.selectionModel()
         self._setUpActions()
         self.PlaylistView.customContextMenuRequested.connect(self._onCustomContextMenuRequested)
+        app.aboutToQuit.connect(self.playlistModel.metadataProber.stop)
+        self.autosaveTimer = QTimer(self)
+        self.autosaveTimer.timeout.connect(self.saveCurrentPlaylist)
+        self.autosaveTimer.start(self.autosaveInterval)
         self.plStatsLabUpd()
 
     def _setUpActions(self):
@@ -60,7 +66,9 @@ class PlaylistContr(QObject):
         self.MinusFilesBut.clicked.connect(self.removeTracks)
         self.PlusFilesBut.clicked.connect(lambda x: self.openFiles(mode='files'))
         self.PlaylistView.doubleClicked.connect(self.onDoubleClicked)
-        self.playlistModel.layoutChanged.connect(self.onLayoutChanged)
+        for signal in (self.playlistModel.layoutChanged, self.playlistModel.rowsInserted,
+                       self.playlistModel.rowsRemoved, self.playlistModel.modelReset):
+            signal.connect(self.onPlaylistChanged)
         self.mw_view.actionPrevious_Track.triggered.connect(self.onPreviousTrack_trig)
         self.mw_view.actionNext_Track.triggered.connect(self.onNextTrack_trig)
         self.mw_view.actionShuffle_Playback.triggered.connect(self.onShufflePlayback_trig)
@@ -101,40 +109,39 @@ class PlaylistContr(QObject):
         app.setOverrideCursor(Qt.CursorShape.BusyCursor)
 
         paths = [url.toLocalFile() for url in URLs]
+        _index = len(self.playlistModel.playlistdata) if index == -1 else index
+        added = []
+
+        def insertTracks(batch: list[str]):
+            # the playlist fills while the paths are resolved; tracks added before cancelling are kept
+            tracklist = list(map(lambda p: PlSong(p), batch))
+            self.playlistModel.insertSongs(_index + len(added), tracklist)
+            added.extend(tracklist)
 
         pl_audio_adding_dialog = PLProcDialog(paths)
-        paths = pl_audio_adding_dialog.return_dict['Paths'] if pl_audio_adding_dialog.exec() else []
-        if 'Errors' in pl_audio_adding_dialog.return_dict:
-            self.mw_view.error_msg(';\n'.join(pl_audio_adding_dialog.return_dict['Errors']))
+        pl_audio_adding_dialog.pathsResolved.connect(insertTracks)
+        pl_audio_adding_dialog.exec()
+        if pl_audio_adding_dialog.errors:
+            self.mw_view.error_msg(';\n'.join(pl_audio_adding_dialog.errors))
 
-        if not paths:
+        if not added:
             app.restoreOverrideCursor()
             return
-        tracklist = list(map(lambda p: PlSong(p), paths))
-        _index = len(self.playlistModel.playlistdata) if index == -1 else index
-        self.playlistModel.layoutAboutToBeChanged.emit()
-        self.playlistModel.playlistdata[_index:_index] = tracklist
-        self.playlistModel.updCanLoadData(changeLayout=False)
-        self.playlistModel.layoutChanged.emit()
-        if len(self.playlistModel.playlistdata) != len(paths):
-            self.PlaylistView.selectRows(_index, _index + len(paths) - 1)
-            self.onSelectionChanged()  # onSelectionChanged signal is not emitted after layoutChange
+        if len(self.playlistModel.playlistdata) != len(added):
+            self.PlaylistView.selectRows(_index, _index + len(added) - 1)
+            self.onSelectionChanged()
         app.restoreOverrideCursor()
 
     def removeTracks(self):
         sel_items = self.PlaylistView.selectedItems
         if not self.selModel.selectedRows():
             return
-        self.playlistModel.layoutAboutToBeChanged.emit()
-        for item in sel_items:
-            self.playlistModel.playlistdata.remove(item)
-        self.playlistModel.layoutChanged.emit()
+        self.playlistModel.removeSongs([self.playlistModel.rowOf(item) for item in sel_items])
         self.PlaylistView.clearSelection()
 
     def clearPL(self):
-        self.playlistModel.layoutAboutToBeChanged.emit()
-        self.playlistModel.playlistdata.clear()
-        self.playlistModel.layoutChanged.emit()
+        self.playlistModel.metadataProber.stop()
+        self.playlistModel.clear()
 
     def ondragDropFromPLFinished(self, action):
         if action == Qt.DropAction.MoveAction and self.PlaylistView.selectedIndexes():
@@ -210,10 +217,13 @@ class PlaylistContr(QObject):
 
     def setCurrentSongToPlaylistModel(self):
         rows = []
-        if self.playlistModel.currentSong in self.playlistModel.playlistdata:
-            rows.append(self.playlistModel.playlistdata.index(self.playlistModel.currentSong))
+        if self.PlNavi.indexOf(self.playlistModel.currentSong) is not None:
+            rows.append(self.PlNavi.indexOf(self.playlistModel.currentSong))
         self.playlistModel.currentSong = self.mw_contr.SourceAudio
-        rows.append(self.playlistModel.playlistdata.index(self.mw_contr.SourceAudio))
+        if self.PlNavi.indexOf(self.mw_contr.SourceAudio) is not None:
+            rows.append(self.PlNavi.indexOf(self.mw_contr.SourceAudio))
+        if not rows:
+            return
         rows.sort()
         self.playlistModel.dataChanged.emit(self.playlistModel.index(rows[0], 0),
                                             self.playlistModel.index(rows[-1], 0))
@@ -266,10 +276,9 @@ class PlaylistContr(QObject):
     def selectCurrentSong(self):
         if self.PlNavi.currentSong() is None:
             return
-        abs_ind = 0
-        try:
-            abs_ind = self.playlistModel.playlistdata.index(self.PlNavi.currentSong())
-        except ValueError:
+        abs_ind = self.PlNavi.indexOf(self.PlNavi.currentSong())
+        if abs_ind is None:
+            abs_ind = 0
             for ind, S in enumerate(self.playlistModel.playlistdata):
                 if self.PlNavi.currentSong().path == S.path:
                     abs_ind = ind
@@ -280,7 +289,7 @@ class PlaylistContr(QObject):
     def onShufflePlayback_trig(self):
         self.PlNavi.setShuffle(self.mw_view.actionShuffle_Playback.isChecked())
 
-    def onLayoutChanged(self):
+    def onPlaylistChanged(self):
         self.PlNavi.dataSync(self.playlistModel.playlistdata)
         self.plStatsLabUpd()
         self.onPlFullEmpty()
@@ -320,22 +329,19 @@ class PlaylistContr(QObject):
         return dialog
 
     def saveCurrentPlaylist(self):
-        saveCurrentPlaylist(self.playlistModel.playlistdata)
+        playlist_store.save(self.playlistModel.storedTracks())
 
     def loadCurrentPlaylist(self):
-        if not Path(CURRENT_PLAYLIST_PATH).is_file():
-            return
         with contextlib.suppress(Exception):
-            urls = [QUrl.fromLocalFile(link) for link in parseLinksFrom_M3U(CURRENT_PLAYLIST_PATH, encoding='utf-8')]
-            urls_to_ins = [QUrl.fromLocalFile(link) for link in launch_files_onstart] if launch_files_onstart is not None else None
-            if urls_to_ins is not None:
-                urls = urls_to_ins + urls
-            if urls:
-                self.addTracks(urls)
+            if playlist_store.exists():
+                self.playlistModel.restoreSongs(playlist_store.load())
+            elif Path(CURRENT_PLAYLIST_PATH).is_file():  # saved by previous versions
+                links = parseLinksFrom_M3U(CURRENT_PLAYLIST_PATH, encoding='utf-8')
+                self.addTracks([QUrl.fromLocalFile(link) for link in links])
+        if launch_files_onstart is not None:
+            self.addTracks([QUrl.fromLocalFile(link) for link in launch_files_onstart], index=0)
 
     def removeUnavaliable(self):
-        new_pl = [S for S in self.playlistModel.playlistdata if S.available]
-        self.playlistModel.layoutAboutToBeChanged.emit()
-        self.playlistModel.playlistdata = new_pl
-        self.playlistModel.layoutChanged.emit()
+        playlistdata = self.playlistModel.playlistdata
+        self.playlistModel.removeSongs([row for row, S in enumerate(playlistdata) if not S.available])
         self.PlaylistView.clearSelection()
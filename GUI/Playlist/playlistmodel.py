@@ -14,36 +14,63 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from collections import defaultdict, deque
 from pathlib import Path
 from PyQt6 import QtCore, QtGui
-from PyQt6.QtCore import Qt, QSortFilterProxyModel, QModelIndex
+from PyQt6.QtCore import Qt, QSortFilterProxyModel, QModelIndex, QTimer
 from PyQt6.QtGui import QImage
+from GUI.Playlist.metadata_prober import MetadataProber
+from GUI.Playlist.playlist_search import PlaylistSearchIndex
 from GUI.Playlist.plsong import PlSong
 from GUI.MainWindow.View.dark_theme import playlist_even_background_color
 from Model.globals import MinAudioDuration
+from definitions import PN
 
 PlaylistData = []
 
 
+def _contiguousRanges(rows: list[int]):
+    # sorted rows -> [(first, last)]
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1] = (ranges[-1][0], row)
+        else:
+            ranges.append((row, row))
+    return ranges
+
+
 class PlaylistModel(QtCore.QAbstractTableModel):
+    # Changes are notified with row insertions/removals and dataChanged of the affected rows. Songs are indexed by
+    # path, so updates for a path (canLoad, probed metadata) don't scan the playlist; row numbers of songs come from
+    # a map rebuilt after rows are inserted or removed (see rowOf)
+
     def __init__(self, playlistdata=None):
         super().__init__()
-        self.playlistdata = playlistdata or []
+        self.playlistdata = playlistdata if playlistdata is not None else []
         self.nonLoadedSong_paths = set()
+        self._songsByPath = defaultdict(set)
+        self._rows = None
+        self._indexSongs(self.playlistdata)
         self.CurName = None
         self.currentSong = None
         self.MimeTypes = 'text/uri-list'
         self.filtered = False
         self.SelectedRows = []
         self.lastInsertedRows = []
+        self.metadataProber = MetadataProber()
+        self.metadataProber.probed.connect(self._onMetadataProbed)
 
     def data(self, index, role: int):
         CurData = self.playlistdata[index.row()]
         if role == Qt.ItemDataRole.DisplayRole:
-            return [CurData.name, CurData.duration_str, CurData.dirPath][index.column()]
+            duration_str = CurData.duration_str if CurData.metadataKnown else '...'
+            return [CurData.name, duration_str, CurData.dirPath][index.column()]
         if role == Qt.ItemDataRole.ForegroundRole:
             if not CurData.exists:
                 return QtGui.QColor('red')
+            elif not CurData.metadataKnown:
+                return None
             elif index.column() == 1 and (not CurData.duration or
                                         (CurData.duration and CurData.duration < MinAudioDuration)):
                 return QtGui.QColor('red')
@@ -87,20 +114,22 @@ class PlaylistModel(QtCore.QAbstractTableModel):
         urls = data.urls()
         if not urls:
             return False
-        selected_songs = [self.playlistdata[ind] for ind in self.SelectedRows]
+        selected_songs = self.songsByPath(self.playlistdata[ind] for ind in self.SelectedRows)
         rows_count = len(urls)
         self.insertRows(row, rows_count, parent)
         for r in range(rows_count):
-            CurData = next(self.plSongsYielder(selected_songs, str(Path(urls[r].toLocalFile()).absolute())))
+            CurData = selected_songs[str(Path(urls[r].toLocalFile()).absolute())].popleft()
             self.setData(self.index(row + r, 0, parent), CurData)
 
         return True
 
     @staticmethod
-    def plSongsYielder(song_list: list[PlSong], song_path: str):
-        for ind, S in enumerate(song_list):
-            if S.path == song_path:
-                yield song_list.pop(ind)
+    def songsByPath(songs):
+        # {path: deque of songs in the given order}
+        songs_by_path = defaultdict(deque)
+        for S in songs:
+            songs_by_path[S.path].append(S)
+        return songs_by_path
 
     def supportedDropActions(self):
         return Qt.DropAction.MoveAction
@@ -108,7 +137,10 @@ class PlaylistModel(QtCore.QAbstractTableModel):
     def setData(self, index, value, role=Qt.ItemDataRole.DisplayRole):
         if role != Qt.ItemDataRole.DisplayRole:
             return False
+        self._unindexSongs([self.playlistdata[index.row()]])
         self.playlistdata[index.row()] = value
+        self._indexSongs([value])
+        self.dataChanged.emit(self.index(index.row(), 0), self.index(index.row(), 2))
         return True
 
     def insertRows(self, row: int, count: int, parent):
@@ -118,10 +150,10 @@ class PlaylistModel(QtCore.QAbstractTableModel):
             return False
         self.lastInsertedRows.clear()
         self.beginInsertRows(parent, row, row + count - 1)
-        for i in range(count):
-            row_ind = row + i
-            self.playlistdata.insert(row_ind, PlSong(''))
-            self.lastInsertedRows.append(row_ind)
+        placeholders = [PlSong('') for _ in range(count)]
+        self.playlistdata[row:row] = placeholders
+        self._indexSongs(placeholders)
+        self.lastInsertedRows.extend(range(row, row + count))
         self.endInsertRows()
         return True
 
@@ -130,11 +162,7 @@ class PlaylistModel(QtCore.QAbstractTableModel):
             return False
         if row < 0:
             return False
-        self.SelectedRows.sort()
-        for R in reversed(self.SelectedRows):
-            self.beginRemoveRows(parent, R, R)
-            self.playlistdata.pop(R)
-            self.endRemoveRows()
+        self.removeSongs(self.SelectedRows)
         if len(self.lastInsertedRows) != 0 and row < self.lastInsertedRows[0]:
             self.lastInsertedRows = list(map(lambda x: x - count, self.lastInsertedRows))
         return True
@@ -143,28 +171,179 @@ class PlaylistModel(QtCore.QAbstractTableModel):
         if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
             return ['Filename', 'Duration', 'Folder Path'][section]
 
-    def updCanLoadData(self, changeLayout=True):
-        if changeLayout:
-            self.layoutAboutToBeChanged.emit()
-        for S in self.playlistdata:
+    def insertSongs(self, row: int, songs: list[PlSong]):
+        if not songs:
+            return
+        if not self.playlistdata:  # the column count changes with the first rows
+            self.beginResetModel()
+        else:
+            self.beginInsertRows(QModelIndex(), row, row + len(songs) - 1)
+        self.playlistdata[row:row] = songs
+        self._indexSongs(songs)
+        if len(self.playlistdata) == len(songs):
+            self.endResetModel()
+        else:
+            self.endInsertRows()
+        self.probeMetadata(songs)
+
+    def removeSongs(self, rows: list[int]):
+        rows = sorted(set(rows))
+        if not rows:
+            return
+        if len(rows) == len(self.playlistdata):
+            self.clear()
+            return
+        for first, last in reversed(_contiguousRanges(rows)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            self._unindexSongs(self.playlistdata[first:last + 1])
+            del self.playlistdata[first:last + 1]
+            self.endRemoveRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.playlistdata.clear()
+        self._songsByPath.clear()
+        self._rows = None
+        self.endResetModel()
+
+    def rowOf(self, Song: PlSong):
+        if self._rows is None:
+            self._rows = {S: row for row, S in enumerate(self.playlistdata)}
+        return self._rows.get(Song)
+
+    def _indexSongs(self, songs: list[PlSong]):
+        for S in songs:
+            self._songsByPath[S.path].add(S)
             S.canLoad = S.path not in self.nonLoadedSong_paths
-        if changeLayout:
-            self.layoutChanged.emit()
+        self._rows = None
+
+    def _unindexSongs(self, songs: list[PlSong]):
+        for S in songs:
+            path_songs = self._songsByPath.get(S.path)
+            if path_songs is not None:
+                path_songs.discard(S)
+                if not path_songs:
+                    del self._songsByPath[S.path]
+        self._rows = None
+
+    def _songsChanged(self, songs):
+        rows = [self.rowOf(S) for S in songs]
+        rows = sorted(row for row in rows if row is not None)
+        for first, last in _contiguousRanges(rows):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, 2))
+
+    def setCanLoad(self, path: str, canLoad: bool):
+        if canLoad:
+            self.nonLoadedSong_paths.discard(path)
+        else:
+            self.nonLoadedSong_paths.add(path)
+        songs = self._songsByPath.get(path, ())
+        for S in songs:
+            S.canLoad = canLoad
+        self._songsChanged(songs)
+
+    def probeMetadata(self, songs: list[PlSong]):
+        self.metadataProber.probe(list({S.path for S in songs if S.needsMetadata}))
+
+    def _onMetadataProbed(self, batch: list):
+        changed = []
+        for path, metadata in batch:
+            for S in self._songsByPath.get(path, ()):
+                if S.needsMetadata or S.knownMetadata != metadata:
+                    S.setMetadata(metadata)
+                    changed.append(S)
+        self._songsChanged(changed)
+
+    def storedTracks(self):
+        # see Model.playlist_store
+        return [(S.path, S.knownMetadata, S.canLoad) for S in self.playlistdata]
+
+    def restoreSongs(self, tracks: list[tuple[str, dict or None, bool]]):
+        songs = []
+        for path, metadata, canLoad in tracks:
+            S = PlSong(path)
+            S.__dict__['path'] = path  # stored as resolved by PlSong.path
+            if metadata is not None:
+                S.setMetadata(metadata)
+            if not canLoad:
+                self.nonLoadedSong_paths.add(S.path)
+            songs.append(S)
+        self.insertSongs(len(self.playlistdata), songs)
+        # the stored metadata is shown at once; the files modified since are read again in the background
+        self.metadataProber.probe(list({S.path for S in songs if not S.needsMetadata and S.inputPath != PN}))
 
 
 class PLSortFilterProxyModel(QSortFilterProxyModel):
+    # Filtering looks up the search index (see PlaylistSearchIndex) after typing pauses for filterDelay ms. The index
+    # is built with the first filtering, then only the inserted and removed rows are indexed or dropped; it's built
+    # again after a model reset. Rows inserted while filtering are matched one by one in filterAcceptsRow
+    filterDelay = 150
+
     def __init__(self, parent, **kwargs):
         super().__init__()
         self.setSourceModel(parent.playlistModel)
         self._filter_string = ''
+        self._matches = set()
+        self.searchIndex = PlaylistSearchIndex()
+        self._indexOutdated = True
+        self.filterTimer = QTimer(self)
+        self.filterTimer.setSingleShot(True)
+        self.filterTimer.setInterval(self.filterDelay)
+        self.filterTimer.timeout.connect(self._applyFilter)
+        self.sourceModel().rowsInserted.connect(self._onRowsInserted)
+        self.sourceModel().rowsAboutToBeRemoved.connect(self._onRowsAboutToBeRemoved)
+        self.sourceModel().dataChanged.connect(self._onDataChanged)
+        self.sourceModel().modelReset.connect(self._onModelReset)
 
     def setFilter(self, pattern: str):
         self._filter_string = pattern.lower()
-        self.setFilterFixedString(self._filter_string)
         self.sourceModel().filtered = bool(pattern)
+        self.filterTimer.start()
+
+    def _onRowsInserted(self, parent, first: int, last: int):
+        if self._indexOutdated:
+            return
+        for S in self.sourceModel().playlistdata[first:last + 1]:
+            self.searchIndex.add(S)
+
+    def _onRowsAboutToBeRemoved(self, parent, first: int, last: int):
+        if self._indexOutdated:
+            return
+        for S in self.sourceModel().playlistdata[first:last + 1]:
+            self.searchIndex.remove(S)
+            self._matches.discard(id(S))
+
+    def _onDataChanged(self, topLeft, bottomRight):
+        # a song put in place of another one (see PlaylistModel.setData) is indexed with the next filtering
+        if self._indexOutdated:
+            return
+        songs = self.sourceModel().playlistdata[topLeft.row():bottomRight.row() + 1]
+        if any(id(S) not in self.searchIndex for S in songs):
+            self._indexOutdated = True
+
+    def _onModelReset(self):
+        self._indexOutdated = True
+        if self._filter_string:
+            self._applyFilter()
+
+    def _applyFilter(self):
+        if self._filter_string:
+            if self._indexOutdated:
+                self.searchIndex.sync(self.sourceModel().playlistdata)
+                self._indexOutdated = False
+            self._matches = self.searchIndex.search(self._filter_string)
+        self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row: int, source_parent):
-        index0 = self.sourceModel().index(source_row, 0, source_parent)
-        index2 = self.sourceModel().index(source_row, 2, source_parent)
-        return self._filter_string in self.sourceModel().data(index0, role=Qt.ItemDataRole.DisplayRole).lower() or \
-               self._filter_string in self.sourceModel().data(index2, role=Qt.ItemDataRole.DisplayRole).lower()
+        if not self._filter_string:
+            return True
+        S = self.sourceModel().playlistdata[source_row]
+        if id(S) in self._matches:
+            return True
+        if self._indexOutdated or id(S) in self.searchIndex:
+            return False
+        self.searchIndex.add(S)  # inserted while filtering
+        if self.searchIndex.matches(id(S), self._filter_string):
+            self._matches.add(id(S))
+            return True
+        return False
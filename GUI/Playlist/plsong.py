@@ -17,8 +17,9 @@
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import PurePath, Path
-from pedalboard.io import AudioFile
-from Model.globals import MinAudioDuration
+from Model.AudioEngine import pinknoise_gen
+from Model.audio_metadata import metadata_cache
+from Model.globals import MinAudioDuration, PinknoiseLength
 from Utilities.common_calcs import mmss
 from definitions import PN
 
@@ -46,27 +47,55 @@ class PlSong:
     def exists(self):
         return True if self.name == PN else Path(self.path).is_file()
 
+    @cached_property
+    def metadata(self):
+        # Read synchronously unless already set by the playlist's background metadata prober or restored from the
+        # playlist store (see setMetadata)
+        if self.name == PN or not self.exists:
+            return None
+        return metadata_cache.get(self.path)
+
     @cached_property
     def file_properties(self):
+        return self._properties_from(self.metadata)
+
+    @property
+    def metadataKnown(self):
+        return 'metadata' in self.__dict__ or self.name == PN or not self.exists
+
+    @property
+    def needsMetadata(self):
+        # Cheaper than metadataKnown: doesn't check the file's existence
+        return 'metadata' not in self.__dict__ and self.inputPath != PN
+
+    @property
+    def knownMetadata(self):
+        # The metadata if already read, without reading the file
+        return self.__dict__.get('metadata')
+
+    def setMetadata(self, metadata: dict or None):
+        self.__dict__['metadata'] = metadata
+        self.__dict__.pop('file_properties', None)
+
+    def resetMetadata(self):
+        self.__dict__.pop('metadata', None)
+        self.__dict__.pop('file_properties', None)
+
+    def _properties_from(self, metadata: dict or None):
         return_dict = self._default_dict
-        if not self.exists:
-            return return_dict
-        try:
-            with AudioFile(self.path) as f:
-                return_dict['duration'] = f.duration
-                num_channels = f.num_channels
-                if num_channels == 1:
-                    num_channels = 'Mono'
-                elif num_channels == 2:
-                    num_channels = 'Stereo'
-                else:
-                    num_channels = f'{num_channels} Channels'
-                return_dict['num_channels'] = num_channels
-                return_dict['samplerate'] = int(f.samplerate)
-        except Exception:
-            pass
-        finally:
+        if not metadata or metadata['duration'] is None:
             return return_dict
+        num_channels = metadata['num_channels']
+        if num_channels == 1:
+            num_channels = 'Mono'
+        elif num_channels == 2:
+            num_channels = 'Stereo'
+        else:
+            num_channels = f'{num_channels} Channels'
+        return_dict['duration'] = metadata['duration']
+        return_dict['num_channels'] = num_channels
+        return_dict['samplerate'] = metadata['samplerate']
+        return return_dict
 
     @property
     def duration(self):
@@ -99,6 +128,8 @@ class PlSong:
     @property
     def _default_dict(self):
         if self.name == PN:
-            return {'duration': 30, 'num_channels': 'Mono', 'samplerate': 44100}
+            samplerate, channels = pinknoise_gen.output_format
+            return {'duration': PinknoiseLength, 'num_channels': 'Mono' if channels == 1 else 'Stereo',
+                    'samplerate': samplerate}
         else:
             return {'duration': False, 'num_channels': None, 'samplerate': None}
@@ -15,7 +15,7 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from urllib import parse
-from definitions import app
+from GUI.qt_runtime import app
 import webbrowser
 
 
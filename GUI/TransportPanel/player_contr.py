@@ -15,12 +15,19 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import platform
-from PyQt6.QtCore import QUrl
+import time
+from io import BytesIO
+from PyQt6.QtCore import QUrl, QBuffer, QIODevice
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaMetaData
 from PyQt6.QtWidgets import QMessageBox
 from GUI.TransportPanel.volumeslider_contr import VolumeSliderContr
+from GUI import globals as gb
 from GUI.Misc.error_message import reformat_message
-from definitions import MediaDevices, PN, Settings
+from Model.AudioEngine.peak_index import prebuild_peak_index
+from Model.AudioEngine.pinknoise_gen import match_output_format
+from Model.audiodrill_gen import create_temp_wavefile
+from GUI.qt_runtime import MediaDevices, Settings
+from definitions import PN
 
 
 class PlayerContr(QMediaPlayer):
@@ -37,6 +44,9 @@ class PlayerContr(QMediaPlayer):
         self._connectSignals()
         self.playAfterAudioLoaded = False
         self.onceAudioLoaded = False
+        self.AudioBuffer = None
+        self._loadStartTime = None
+        self.lastLoadLatency = None  # in ms
         self.PlModel = self.mw_contr.PlaylistContr.playlistModel
 
     def _connectSignals(self):
@@ -50,22 +60,53 @@ class PlayerContr(QMediaPlayer):
         self.mw_view.AudioDevicesGroup.triggered.connect(self.onAudioDeviceChecked)
 
     def loadCurrentAudio(self, play_after=True):
-        filepath = self.mw_contr.CurrentAudio
+        if isinstance(self.mw_contr.CurrentAudio, BytesIO):
+            self._loadAudioBuffer(self.mw_contr.CurrentAudio)
+        else:
+            filepath = self.mw_contr.CurrentAudio
 
-        # Workaround for PyQt6 QMediaPlayer issue with remote files' playback on Windows:
-        filepath = f'file:{filepath}' if platform.system() == 'Windows' else filepath
+            # Workaround for PyQt6 QMediaPlayer issue with remote files' playback on Windows:
+            filepath = f'file:{filepath}' if platform.system() == 'Windows' else filepath
 
-        AudioToLoad = QUrl.fromLocalFile(filepath)
-        if self.source() == AudioToLoad:
-            return
-        self.clearSource()
-        self.setSource(AudioToLoad)
+            AudioToLoad = QUrl.fromLocalFile(filepath)
+            if self.source() == AudioToLoad:
+                return
+            self.clearSource()
+            self.setSource(AudioToLoad)
+        self._loadStartTime = time.perf_counter()
         self.onceAudioLoaded = True
         self.playAfterAudioLoaded = play_after
         self.mw_contr.playAudioOnPreview = False
 
+    def _loadAudioBuffer(self, audio: BytesIO):
+        self.clearSource()
+        self.AudioBuffer = QBuffer()
+        self.AudioBuffer.setData(audio.getvalue())
+        self.AudioBuffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        self.setSourceDevice(self.AudioBuffer, QUrl(audio.name))
+
+    def _fallbackToTempFile(self):
+        # Reloads the current in-memory drill from a temp WAV file if the playback backend fails to read the buffer
+        if not isinstance(self.mw_contr.CurrentAudio, BytesIO):
+            return False
+        filepath = create_temp_wavefile()
+        with open(filepath, 'wb') as f:
+            f.write(self.mw_contr.CurrentAudio.getvalue())
+        self.mw_contr.CurrentAudio = filepath
+        self.loadCurrentAudio(play_after=self.playAfterAudioLoaded)
+        return True
+
     def clearSource(self):
         self.setSource(QUrl())
+        if self.AudioBuffer is not None:
+            self.AudioBuffer.close()
+            self.AudioBuffer = None
+
+    def drillLatency(self):  # in ms: 'Processing' / 'Writing' / 'Loading' of the last loaded drill
+        ADGen = self.mw_contr.ADGen
+        timing = dict(ADGen.last_output_timing) if ADGen is not None else {}
+        timing['Loading'] = self.lastLoadLatency
+        return timing
 
     def loadMetaData(self):
         if not self.metaData():
@@ -120,6 +161,9 @@ class PlayerContr(QMediaPlayer):
     def _onLoadedMedia(self):
         if self.mw_contr.SourceAudio is None:
             return
+        if self._loadStartTime is not None:
+            self.lastLoadLatency = (time.perf_counter() - self._loadStartTime) * 1000
+            self._loadStartTime = None
         if self.onceAudioLoaded:
             self._onOnceAudioLoaded()
         self._playLoadedAudio()
@@ -137,9 +181,10 @@ class PlayerContr(QMediaPlayer):
         self.mw_contr.LoadedFilePath = self.mw_contr.CurrentAudio
         if self.mw_contr.CurrentMode.name == 'Preview' and self.mw_contr.CurrentSourceMode.name == 'Audiofile':
             self.mw_contr.hashAudioFile()
+            if gb.lazy_slice_decoding:
+                prebuild_peak_index(self.mw_contr.LoadedFilePath)
             if self.mw_contr.LoadedFilePath in self.PlModel.nonLoadedSong_paths:
-                self.PlModel.nonLoadedSong_paths.remove(self.mw_contr.LoadedFilePath)
-                self.PlModel.updCanLoadData()
+                self.PlModel.setCanLoad(self.mw_contr.LoadedFilePath, True)
 
     def _onEndofMedia(self):
         self.setPosition(int(self.startPos))
@@ -183,6 +228,7 @@ class PlayerContr(QMediaPlayer):
         if platform.system() == 'Windows' or anyplatform:
             self.audioOutput.setDevice(self.mw_view.AudioDevicesView.selectedOutput())
             self.setAudioOutput(self.audioOutput)
+        self._matchPinknoiseFormat()
         self.VolumeSliderContr.applyVolume(self.VolumeSlider.value())
 
     def _playLoadedAudio(self):
@@ -221,7 +267,15 @@ class PlayerContr(QMediaPlayer):
             self.mw_view.status.clearMessage()
             return
         source = PN if self.mw_contr.SourceAudio.name == PN else self.mw_contr.LastSourceAudio.name
-        self.mw_view.status.showMessage(f'{source}{self._get_slice_number_str()}: {self.PlayerView.pb_state2str(state)}', 0)
+        self.mw_view.status.showMessage(f'{source}{self._get_slice_number_str()}: '
+                                        f'{self.PlayerView.pb_state2str(state)}{self._get_drill_latency_str()}', 0)
+
+    def _get_drill_latency_str(self):
+        if self.mw_contr.CurrentMode.name not in ('Learn', 'Test') or self.lastLoadLatency is None:
+            return ''
+        timing = {stage: ms for stage, ms in self.drillLatency().items() if ms is not None}
+        stages = ', '.join(f'{stage.lower()} {ms:.0f}' for stage, ms in timing.items())
+        return f' (drill ready in {sum(timing.values()):.0f} ms: {stages})'
 
     def onPlayPause_triggered(self):
         if self.playbackState() == self.PlaybackState.PlayingState and self.mw_contr.CurrentMode.playPause_toggleable:
@@ -235,6 +289,13 @@ class PlayerContr(QMediaPlayer):
         if selected_out != self.audioOutput.device():
             self.audioOutput.setDevice(selected_out)
             self._translatePBStateToStatusBar(self.playbackState())
+        self._matchPinknoiseFormat()
+
+    def _matchPinknoiseFormat(self):
+        # Pink noise is generated at the device's native format; the running drill generator keeps its format until
+        # the audio source is reloaded
+        device_format = self.audioOutput.device().preferredFormat()
+        match_output_format(device_format.sampleRate(), device_format.channelCount())
 
     def onAudioOutputsChanged(self):
         checked_item = self.mw_view.AudioDevicesGroup.checkedAction()
@@ -243,9 +304,10 @@ class PlayerContr(QMediaPlayer):
         self.onAudioDeviceChecked()
 
     def onError(self, err, string):
+        if self.AudioBuffer is not None and self._fallbackToTempFile():
+            return
         sourcefile = self.mw_contr.SourceAudio
-        self.PlModel.nonLoadedSong_paths.add(sourcefile.path)
-        self.PlModel.updCanLoadData()
+        self.PlModel.setCanLoad(sourcefile.path, False)
         self._stopTrainingOnError()
         message = f'{err}: {string}'
         if not sourcefile.exists:
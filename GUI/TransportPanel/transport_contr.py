@@ -19,7 +19,7 @@ from PyQt6.QtCore import QObject, Qt
 from GUI.TransportPanel.player_contr import PlayerContr
 from GUI.globals import defaultSliceLenUpd
 from Model.calc import proc_unproc_len
-from definitions import Settings
+from GUI.qt_runtime import Settings
 
 
 class TransportContr(QObject):
@@ -135,7 +135,7 @@ class TransportContr(QObject):
         if self.parent.CurrentMode.name != 'Preview' or self.parent.CurrentSourceMode.name != 'Audiofile':
             return
         self.TransportView.setHeader(self.PlayerContr.sourceAudioData())
-        self.parent.setTrainingActionsEnabled(True)
+        self.parent.setTrainingActionsEnabled(self.parent.LoadedFileHash is not None)
         duration_s = self.parent.SourceAudio.duration
         self.TransportView.setDurationLabValue(duration_s)
         self.TransportView.AudioSliderView.setNewDataLength(duration_s)
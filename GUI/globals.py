@@ -14,11 +14,35 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from definitions import Settings
+from Model.AudioEngine import pinknoise_gen
+from Model.AudioEngine.decoded_cache import decoded_cache
+from Utilities.str2bool import str2bool
+from GUI.qt_runtime import Settings
 
 default_pn_slice_length = None
 default_audio_slice_length = None
 
+# Learn/Test drills are played from memory; temp WAV files are only used as a fallback
+in_memory_playback = str2bool(Settings.value('GlobalVars/InMemoryPlayback', True))
+# Number of upcoming Learn/Test drills rendered in the background
+drill_lookahead = int(Settings.value('GlobalVars/DrillLookahead', 3))
+# Learn/Test modes read audio file slices on demand instead of the whole crop range
+lazy_slice_decoding = str2bool(Settings.value('GlobalVars/LazySliceDecoding', True))
+# Disk space for decoded crop ranges of compressed audio files, in MB (0 disables the cache)
+decoded_cache.max_bytes = int(Settings.value('GlobalVars/DecodedAudioCacheSize', 2048)) * 1024 ** 2
+# Saved source ranges are keyed by a sampled BLAKE2 fingerprint instead of the MD5 of the whole file. Ranges saved
+# with the other mode are not found
+fast_file_hash = str2bool(Settings.value('GlobalVars/FastFileHash', False))
+# Processes rendering Learn/Test files (0 -- CPU count)
+export_workers = int(Settings.value('GlobalVars/ExportWorkers', 0))
+# Processes converting audio files to WAVE/AIFF (0 -- CPU count) and seconds of audio converted at a time
+convert_workers = int(Settings.value('GlobalVars/ConvertWorkers', 0))
+convert_block_s = float(Settings.value('GlobalVars/ConvertBlockSeconds', 10))
+# Pink noise synthesis: 'spectral' (inverse FFT of the whole length) or 'iir' (pinking filter, streamed in blocks)
+pinknoise_gen.default_method = Settings.value('GlobalVars/PinknoiseMethod', 'spectral')
+if pinknoise_gen.default_method not in pinknoise_gen.PN_METHODS:
+    pinknoise_gen.default_method = 'spectral'
+
 SliderAmplitude = 2
 
 def defaultSliceLenUpd():
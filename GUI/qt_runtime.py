@@ -0,0 +1,32 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Qt runtime objects of the application. The Model layer and definitions do not import Qt, so worker processes and
+# command line tools do not start a GUI runtime.
+
+import sys
+from PyQt6.QtCore import QSettings
+from PyQt6.QtMultimedia import QMediaDevices
+from PyQt6.QtWidgets import QApplication
+from GUI.resources import registerIcons
+from definitions import SETTINGS_PATH
+
+app = QApplication(sys.argv)
+MediaDevices = QMediaDevices()
+registerIcons()
+launch_files_onstart = sys.argv[1:] if len(sys.argv) > 1 else None
+
+Settings = QSettings(SETTINGS_PATH, QSettings.Format.IniFormat)
@@ -0,0 +1,45 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Icons and help images are binary Qt resource files (.rcc, built from icons.qrc / help_img.qrc by gui_compile.py),
+# registered when first needed instead of being imported as compiled Python modules.
+
+import os
+from PyQt6.QtCore import QResource
+from definitions import ROOT_DIR
+
+ICONS_RCC = os.path.normpath(os.path.join(ROOT_DIR, 'GUI', 'icons.rcc'))
+HELP_IMAGES_RCC = os.path.normpath(os.path.join(ROOT_DIR, 'GUI', 'Help', 'help_img.rcc'))
+
+_registered = set()
+
+
+def registerResource(rcc_path: str):
+    if rcc_path in _registered:
+        return True
+    if not QResource.registerResource(rcc_path):
+        print(f'ERROR: Cannot register Qt resource file "{rcc_path}"')
+        return False
+    _registered.add(rcc_path)
+    return True
+
+
+def registerIcons():
+    return registerResource(ICONS_RCC)
+
+
+def registerHelpImages():
+    return registerResource(HELP_IMAGES_RCC)
@@ -14,11 +14,24 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+
+# Conversion of audio files to WAVE/AIFF. convert_files converts a batch across worker processes: the output names
+# are chosen up front so that parallel conversions never write to the same file, and the workers report the
+# progress of every block through a queue, aggregated into the progress of the whole batch.
+
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
+from queue import Empty
 from pedalboard.io import AudioFile
 from Utilities.exceptions import InterruptedException
 
+DEFAULT_BLOCK_S = 10  # seconds of audio read and written at a time
+
+_worker = {}  # per process: progress queue and abort event
+
 
 def get_target_samplerate(source_sr: int or float, sr_mode: str):
     if sr_mode == 'original':
@@ -32,9 +45,10 @@ def get_target_samplerate(source_sr: int or float, sr_mode: str):
     return float(ts)
 
 
-def avoid_same_name(audiofile_path: str):
+def avoid_same_name(audiofile_path: str, reserved=()):
+    # reserved: paths to avoid as well, though they don't exist yet
     result = Path(audiofile_path)
-    while result.exists():
+    while result.exists() or str(result) in reserved:
         name_noext = str(result.with_suffix(''))
         digit_end = re.search(r'(?<=__)\d+$', name_noext)
         if digit_end is not None:
@@ -46,14 +60,9 @@ def avoid_same_name(audiofile_path: str):
     return str(result)
 
 
-def convert_audio(audiofile_path: str, source_samplerate: int or float, audio_format='WAVE',
-                  target_samplerate_mode='original', callback=None):
-    # audio_format: WAVE / AIFF
-    # sampling_rate_mode: original / 44.1k / 48k / auto_div
-    def callback_out():
-        if callback is not None:
-            callback(out_stat)
-
+def conversion_target(audiofile_path: str, source_samplerate: int or float, audio_format='WAVE',
+                      target_samplerate_mode='original', reserved=()):
+    # (output path, target sample rate), or None if there's nothing to convert
     if not Path(audiofile_path).is_file():
         return None
     target_samplerate = get_target_samplerate(source_samplerate, target_samplerate_mode)
@@ -61,27 +70,152 @@ def convert_audio(audiofile_path: str, source_samplerate: int or float, audio_fo
     output_path = Path(audiofile_path).with_suffix(out_ext)
     if str(output_path) == audiofile_path and source_samplerate == target_samplerate:
         return None
-    if source_samplerate == target_samplerate:
-        input_af = AudioFile(audiofile_path, 'r')
-    else:
-        input_af = AudioFile(audiofile_path, 'r').resampled_to(target_samplerate)
+    if source_samplerate != target_samplerate:
         output_path = Path(f"{output_path.with_suffix('')} - Resampled{out_ext}")
-    output_path = Path(avoid_same_name(str(output_path)))
-    result = None
-    out_stat = {'State': f'Converting "{Path(audiofile_path).name}" to "{output_path.name}"', 'Percent': 0}
-    callback_out()
+    return avoid_same_name(str(output_path), reserved), target_samplerate
+
+
+def convert_audio(audiofile_path: str, source_samplerate: int or float, audio_format='WAVE',
+                  target_samplerate_mode='original', block_s=DEFAULT_BLOCK_S, callback=None):
+    # audio_format: WAVE / AIFF
+    # sampling_rate_mode: original / 44.1k / 48k / auto_div
+    def progress(fraction: float):
+        if callback is not None:
+            callback({'State': f'Converting "{Path(audiofile_path).name}" to "{Path(output_path).name}"',
+                      'Percent': int(fraction * 100)})
+
+    target = conversion_target(audiofile_path, source_samplerate, audio_format, target_samplerate_mode)
+    if target is None:
+        return None
+    output_path, target_samplerate = target
+    try:
+        return _convert(audiofile_path, output_path, source_samplerate, target_samplerate, block_s, progress)
+    except InterruptedException:
+        return None
+
+
+def _convert(audiofile_path: str, output_path: str, source_samplerate: int or float, target_samplerate: float,
+             block_s: int or float, progress):
+    # progress(fraction converted) is called after each block and may raise InterruptedException. If the conversion
+    # is interrupted, fails or the output is incomplete, the output file is removed
+    input_af = AudioFile(audiofile_path, 'r')
+    if source_samplerate != target_samplerate:
+        input_af = input_af.resampled_to(target_samplerate)
+    block_frames = max(int(target_samplerate * block_s), 1)
+    progress(0)
     with input_af as in_f:
-        with AudioFile(str(output_path), 'w', target_samplerate, in_f.num_channels) as out_f:
-            while in_f.tell() < in_f.frames:
-                ch = in_f.read(int(target_samplerate))
-                out_f.write(ch)
-                out_stat['Percent'] = int(out_f.frames / in_f.frames * 100)
-                try:
-                    callback_out()
-                except InterruptedException:
-                    out_f.close()
-                    output_path.unlink()
-                    return None
-            if in_f.frames == out_f.frames:
-                result = str(output_path)
-        return result
+        try:
+            with AudioFile(output_path, 'w', target_samplerate, in_f.num_channels) as out_f:
+                while in_f.tell() < in_f.frames:
+                    out_f.write(in_f.read(block_frames))
+                    progress(out_f.frames / in_f.frames)
+                complete = in_f.frames == out_f.frames
+        except BaseException:
+            Path(output_path).unlink(missing_ok=True)
+            raise
+    if not complete:
+        Path(output_path).unlink(missing_ok=True)
+        return None
+    return output_path
+
+
+def convert_files(jobs: list[tuple[str, int or float]], audio_format='WAVE', target_samplerate_mode='original',
+                  block_s=DEFAULT_BLOCK_S, workers=None, done=None, errors=None, callback=None):
+    # jobs: (audio file path, source sample rate)
+    # workers: number of processes (None -- CPU count); a single worker converts in the calling process
+    # callback({'State', 'Percent'}) reports the progress of the whole batch. If it raises InterruptedException, the
+    # conversions in progress are stopped, their output files removed and the exception re-raised.
+    # A file that fails to convert is reported in errors (list of messages) without stopping the others.
+    # Returns {job index: output path} of the converted files (also set in done if given, which keeps them on
+    # interruption).
+    done = {} if done is None else done
+    errors = [] if errors is None else errors
+    targets = {}
+    for ind, (audiofile_path, source_samplerate) in enumerate(jobs):
+        target = conversion_target(audiofile_path, source_samplerate, audio_format, target_samplerate_mode,
+                                   reserved={path for path, _ in targets.values()})
+        if target is not None:
+            targets[ind] = target
+    if not targets:
+        return done
+    progress = dict.fromkeys(targets, 0.0)
+
+    def progress_out():
+        if callback is not None:
+            finished = sum(1 for fraction in progress.values() if fraction >= 1)
+            callback({'State': f'Converting files ({finished}/{len(progress)})',
+                      'Percent': int(sum(progress.values()) / len(progress) * 100)})
+
+    def converted(ind: int, convert):
+        try:
+            result = convert()
+        except InterruptedException:
+            raise
+        except Exception as e:
+            errors.append(f'Error converting "{Path(jobs[ind][0]).name}"! {e}')
+            result = None
+        if result is not None:
+            done[ind] = result
+        progress[ind] = 1.0
+
+    workers = min(workers or os.cpu_count() or 1, len(targets))
+    if workers <= 1:
+        for ind, (output_path, target_samplerate) in targets.items():
+            def file_progress(fraction: float, ind=ind):
+                progress[ind] = fraction
+                progress_out()
+
+            converted(ind, lambda: _convert(jobs[ind][0], output_path, jobs[ind][1], target_samplerate, block_s,
+                                            file_progress))
+            progress_out()
+        return done
+
+    ctx = multiprocessing.get_context()
+    progress_queue, abort = ctx.Queue(), ctx.Event()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=_init_worker,
+                             initargs=(progress_queue, abort)) as pool:
+        futures = {pool.submit(_convert_job, ind, jobs[ind][0], output_path, jobs[ind][1], target_samplerate,
+                               block_s): ind for ind, (output_path, target_samplerate) in targets.items()}
+        pending = set(futures)
+        try:
+            while pending:
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                _read_progress(progress_queue, progress)
+                for future in finished:
+                    converted(futures[future], future.result)
+                progress_out()
+        except InterruptedException:
+            abort.set()
+            pool.shutdown(wait=True, cancel_futures=True)
+            # files finished before the workers were stopped are kept
+            for future in pending:
+                if not future.cancelled() and future.exception() is None and future.result() is not None:
+                    done[futures[future]] = future.result()
+            raise
+    return done
+
+
+def _init_worker(progress_queue, abort):
+    progress_queue.cancel_join_thread()  # progress left in the queue never blocks the worker from exiting
+    _worker['progress'] = progress_queue
+    _worker['abort'] = abort
+
+
+def _convert_job(ind: int, audiofile_path: str, output_path: str, source_samplerate: int or float,
+                 target_samplerate: float, block_s: int or float):
+    def progress(fraction: float):
+        if _worker['abort'].is_set():
+            raise InterruptedException('Conversion aborted by user!')
+        _worker['progress'].put((ind, fraction))
+
+    return _convert(audiofile_path, output_path, source_samplerate, target_samplerate, block_s, progress)
+
+
+def _read_progress(progress_queue, progress: dict):
+    while True:
+        try:
+            ind, fraction = progress_queue.get_nowait()
+        except Empty:
+            return
+        if progress[ind] < 1:
+            progress[ind] = fraction
@@ -0,0 +1,99 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Disk cache of decoded crop ranges (float32 .npy files in DecodedAudio_DIR). Cached ranges are opened as read-only
+# memory maps, so reopening a compressed source skips decoding and the OS page cache is shared between processes.
+# The least recently used files are removed when the total size exceeds max_bytes.
+
+import os
+import threading
+import numpy as np
+from Model.file_hash import file_fingerprint
+from definitions import DecodedAudio_DIR
+
+# Uncompressed sources are read fast enough: caching them would only duplicate the data on disk
+UNCACHED_EXTENSIONS = ('.wav', '.wave', '.aif', '.aiff')
+
+
+class DecodedAudioCache:
+    def __init__(self, cache_dir: str = DecodedAudio_DIR, max_bytes=2 * 1024 ** 3):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def cacheable(audiofile_path: str):
+        return not audiofile_path.lower().endswith(UNCACHED_EXTENSIONS)
+
+    def _path(self, audiofile_path: str, starttime: int or float, endtime: int or float, samplerate: int):
+        key = f'{file_fingerprint(audiofile_path)}_{starttime:.3f}_{endtime:.3f}_{samplerate}'
+        return os.path.join(self.cache_dir, f'{key}.npy')
+
+    def load(self, audiofile_path: str, starttime: int or float, endtime: int or float, samplerate: int):
+        if self.max_bytes <= 0 or not self.cacheable(audiofile_path):
+            return None
+        try:
+            path = self._path(audiofile_path, starttime, endtime, samplerate)
+            audio = np.load(path, mmap_mode='r')
+            os.utime(path)  # the modification time serves as the last access time for eviction
+        except (OSError, ValueError):
+            return None
+        return audio
+
+    def save(self, audiofile_path: str, starttime: int or float, endtime: int or float, samplerate: int,
+             audio: np.ndarray):
+        if self.max_bytes <= 0 or audio.nbytes > self.max_bytes or not self.cacheable(audiofile_path):
+            return
+        try:
+            path = self._path(audiofile_path, starttime, endtime, samplerate)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.asarray(audio, dtype=np.float32))
+            os.replace(tmp_path, path)  # readers never see a partially written file
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        with self._lock:
+            try:
+                entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith('.npy')]
+                entries = sorted(((e.stat().st_mtime, e.stat().st_size, e.path) for e in entries), reverse=True)
+            except OSError:
+                return
+            total = 0
+            for _, size, path in entries:
+                total += size
+                if total > self.max_bytes:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass  # still mapped on Windows: will be removed next time
+
+    def clear(self):
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for entry in os.scandir(self.cache_dir):
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+
+
+decoded_cache = DecodedAudioCache()
@@ -0,0 +1,101 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+class DrillCache:
+    # LRU cache of rendered drills limited by memory size. Upcoming drills are rendered in a worker pool, so that
+    # getting the next drill is mostly a lookup.
+    # render_func(*key) -> np.ndarray; key: (slice_id, freq, gain_depth, Q, proc_t_perc)
+
+    def __init__(self, render_func, max_bytes=256 * 1024 ** 2, workers=2):
+        self.render_func = render_func
+        self.max_bytes = max_bytes
+        self._items = OrderedDict()
+        self._pending = {}
+        self._nbytes = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='DrillRender')
+
+    def get(self, key: tuple):
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+            future = self._pending.get(key)
+            generation = self._generation
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass  # cancelled or failed in the background: rendering it once again below
+        audio = self.render_func(*key)
+        self._store(key, audio, generation)
+        return audio
+
+    def prefetch(self, keys: list[tuple]):
+        with self._lock:
+            for key in keys:
+                if key in self._items or key in self._pending:
+                    continue
+                self._pending[key] = self._pool.submit(self._render, key, self._generation)
+
+    def invalidate(self):
+        with self._lock:
+            self._generation += 1
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._items.clear()
+            self._nbytes = 0
+
+    def shutdown(self):
+        self.invalidate()
+        self._pool.shutdown(wait=False)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    def __contains__(self, key: tuple):
+        return key in self._items
+
+    def __len__(self):
+        return len(self._items)
+
+    def _render(self, key: tuple, generation: int):
+        audio = self.render_func(*key)
+        self._store(key, audio, generation)
+        return audio
+
+    def _store(self, key: tuple, audio: np.ndarray, generation: int):
+        with self._lock:
+            if generation != self._generation:
+                return  # rendered from data that has been changed since
+            self._pending.pop(key, None)
+            if key in self._items or audio.nbytes > self.max_bytes:
+                return
+            self._items[key] = audio
+            self._nbytes += audio.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._nbytes -= evicted.nbytes
@@ -0,0 +1,101 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Parallel rendering and encoding of drills to files. Worker processes render from a shared read-only memory map of
+# the normalized crop range, so the audio is neither pickled per job nor copied into every process.
+
+import os
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+import numpy as np
+from pedalboard.io import AudioFile
+from Model.AudioEngine.process import eq_proc
+from Utilities.exceptions import InterruptedException
+
+_source = {}  # per process: shared audio and output file parameters
+
+
+def _init_source(audio: np.ndarray or str, samplerate: int, slice_length_fr: int, bitrate=None):
+    # audio: array or path to the .npy file to memory-map
+    _source['audio'] = np.load(audio, mmap_mode='r') if isinstance(audio, str) else audio
+    _source['samplerate'] = samplerate
+    _source['slice_length_fr'] = slice_length_fr
+    _source['bitrate'] = bitrate
+
+
+def _export_drill(job: tuple):
+    filepath, slice_id, freq, gain_depth, Q, proc_t_perc = job
+    start = slice_id * _source['slice_length_fr']
+    cur_slice = _source['audio'][:, start:start + _source['slice_length_fr']]
+    freq1, freq2 = freq if isinstance(freq, tuple) else (freq, None)
+    audio = eq_proc(cur_slice, _source['samplerate'], freq1, freq2=freq2, gain_depth=gain_depth, Q=Q,
+                    proc_t_perc=proc_t_perc)
+    with AudioFile(filepath, 'w', samplerate=_source['samplerate'], num_channels=audio.shape[0],
+                   quality=_source['bitrate']) as f:
+        f.write(audio)
+    return filepath
+
+
+def export_drills(audio: np.ndarray, samplerate: int, slice_length_fr: int, jobs: list[tuple], bitrate=None,
+                  workers=None, tmp_dir=None, done=None, callback=None):
+    # jobs: (output file path, slice_id, freq, gain_depth, Q, proc_t_perc)
+    # workers: number of processes (None -- CPU count); a single worker renders in the calling process
+    # callback({'State', 'Percent'}) is called after each exported file. If it raises InterruptedException,
+    # the pending jobs are cancelled and the exception is re-raised.
+    # Returns the indexes of the exported jobs in completion order (also appended to done if given, which keeps them
+    # on interruption).
+    done = [] if done is None else done
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        _init_source(audio, samplerate, slice_length_fr, bitrate)
+        for ind, job in enumerate(jobs):
+            _export_drill(job)
+            done.append(ind)
+            _progress_out(callback, job[0], len(done), len(jobs))
+        return done
+
+    if tmp_dir is not None:
+        Path(tmp_dir).mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(suffix='.npy', delete=False, dir=tmp_dir) as f:
+        np.save(f, audio)
+        shared_path = f.name
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_source,
+                                 initargs=(shared_path, samplerate, slice_length_fr, bitrate)) as pool:
+            futures = {pool.submit(_export_drill, job): ind for ind, job in enumerate(jobs)}
+            pending = set(futures)
+            while pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    filepath = future.result()
+                    done.append(futures[future])
+                    try:
+                        _progress_out(callback, filepath, len(done), len(jobs))
+                    except InterruptedException:
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        # jobs already running when cancelled are completed
+                        done += [futures[f] for f in pending if not f.cancelled() and f.exception() is None]
+                        raise
+    finally:
+        os.remove(shared_path)
+    return done
+
+
+def _progress_out(callback, filepath: str, done_num: int, total: int):
+    if callback is not None:
+        callback({'State': f'Exporting "{Path(filepath).name}"', 'Percent': int(done_num / total * 100)})
@@ -17,28 +17,37 @@
 import copy
 import itertools
 import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 import numpy
 import numpy as np
-from PyQt6.QtCore import QObject, pyqtSignal
 from pedalboard.io import AudioFile
+from Model.AudioEngine.decoded_cache import decoded_cache
+from Model.AudioEngine.peak_index import cached_peak_index, get_peak_index
 from Model.AudioEngine.preview_audio import PreviewAudioCrop
 from Model.calc import find_divider
-from Model.globals import pinknoise, MinAudioDuration, PinknoiseLength
+from Model.AudioEngine import pinknoise_gen
+from Model.globals import MinAudioDuration, PinknoiseLength
+from Model.observer import Signal
 from Utilities.exceptions import InterruptedException
 from definitions import PN
 
 
-class AudioChunkSignals(QObject):
-    showNormalizationLevel = pyqtSignal(float)
+class AudioChunkSignals:
+    def __init__(self):
+        self.showNormalizationLevel = Signal()  # (norm_level: float)
 
 
-class AudioChunk(PreviewAudioCrop, QObject):
-    signals = AudioChunkSignals()
-
+class AudioChunk(PreviewAudioCrop):
     def __init__(self, audiofile_path: str, starttime: int or float, endtime: int or float,
-                 slice_length=15, norm_level=None, cropped=None, cropped_normalized=None, callback=None):
+                 slice_length=15, norm_level=None, cropped=None, cropped_normalized=None, pn_format=None,
+                 callback=None):
+        # pn_format: (samplerate, channels) of pink noise (default: pinknoise_gen.output_format)
+        self.signals = AudioChunkSignals()
         self.audiofile_path = audiofile_path
+        self.pn_format = pn_format or pinknoise_gen.output_format
         self._init_audiosource()
         self._check_source_length()
         super().__init__(audiofile_length=self.source_length,
@@ -51,12 +60,13 @@ class AudioChunk(PreviewAudioCrop, QObject):
             self.cycle = self.cycle_id_gen = self.cycle_id = self.current_slice = None
         self.callback = callback
         self.user_stopped = None
+        self.data_version = 0  # incremented whenever the slices' audio data changes
         self._reset(readcrop=(self.cropped is None), normalize=(self.cropped_normalized is None))
 
     def _init_pinknoise(self):
         self.audiofile = None
         self.source_length = PinknoiseLength
-        self.samplerate = 44100
+        self.samplerate = self.pn_format[0]
 
     def _init_audiofile(self):
         self.audiofile = AudioFile(self.audiofile_path)
@@ -81,29 +91,42 @@ class AudioChunk(PreviewAudioCrop, QObject):
 
     def _read_and_crop(self, callback=None):
         if self.audiofile_path == PN:
-            self.cropped = pinknoise
+            self.cropped = pinknoise_gen.get_pinknoise(PinknoiseLength, *self.pn_format)
             return
-        self._open_audiofile()  # makes no effect if audiofile is already opened
         self.user_stopped = False
-        self.cropped = np.empty((self.audiofile.num_channels, 0))
+        self.cropped = decoded_cache.load(self.audiofile_path, self.starttime, self.endtime, self.samplerate)
+        if self.cropped is not None:
+            self._callback_out({'State': 'Reading / cropping audiofile', 'Percent': 100}, callback=callback)
+            return
+        self._open_audiofile()  # makes no effect if audiofile is already opened
+        chunk_length_fr = self.chunk_length_fr
+        self.cropped = np.empty((self.audiofile.num_channels, chunk_length_fr), dtype=np.float32)
         output = {'State': 'Reading / cropping audiofile', 'Percent': 0}
         self._callback_out(output, callback=callback)
         self.audiofile.seek(int(self.sec2fr(self.starttime)))
-        prop_subchunk_length = int(self.chunk_length_fr / self._find_rc_divider())
+        prop_subchunk_length = int(chunk_length_fr / self._find_rc_divider())
         read_ch_samples = max(prop_subchunk_length, self.samplerate) if self.audiofile.exact_duration_known \
             else int(self.samplerate)
-        while self.cropped[0].size < self.chunk_length_fr:
-            ch = self.audiofile.read(read_ch_samples)
-            self.cropped = np.concatenate((self.cropped, ch), axis=1)
-            output['Percent'] = int(self.cropped[0].size / self.chunk_length_fr * 100)
+        filled = 0
+        while filled < chunk_length_fr:
+            ch = self.audiofile.read(min(read_ch_samples, chunk_length_fr - filled))
+            ch_length = min(ch.shape[1], chunk_length_fr - filled)
+            self.cropped[:, filled:filled + ch_length] = ch[:, :ch_length]
+            filled += ch_length
+            output['Percent'] = int(filled / chunk_length_fr * 100)
             try:
                 self._callback_out(output, callback=callback)
             except InterruptedException:
                 self._stop()
                 return
-            if self.audiofile.tell() == self.audiofile.frames:
+            if ch_length == 0 or self.audiofile.tell() == self.audiofile.frames:
                 break  # to avoid infinite loop for some 'broken' MP3 files
+        # The estimated length of VBR MP3 files may exceed the actual one: only the frames read are kept, so no
+        # silence gets into the drills or the decoded audio cache
+        if filled < chunk_length_fr:
+            self.cropped = self.cropped[:, :filled]
         self._close_audiofile()
+        decoded_cache.save(self.audiofile_path, self.starttime, self.endtime, self.samplerate, self.cropped)
 
     def _open_audiofile(self):
         if self.audiofile is None or not self.audiofile.closed:
@@ -124,8 +147,14 @@ class AudioChunk(PreviewAudioCrop, QObject):
             return
         self.audiofile.close()
 
+    def close(self):
+        # Closes the audio file; it's opened again if more audio has to be read
+        self._close_audiofile()
+
     def _stop(self):
         self.user_stopped = True
+        if isinstance(self.cropped_norm_split, LazySlices):
+            self.cropped_norm_split.close()
         self.cropped = self.cropped_normalized = self.cropped_norm_split = self.cycle = \
             self.cycle_id_gen = self.cycle_id = None
         self._close_audiofile()
@@ -186,7 +215,9 @@ class AudioChunk(PreviewAudioCrop, QObject):
     def split(self):
         target_length_fr = int(self.sec2fr(self.slice_length * self.slices_num))
         cropped_norm_adj = self.cropped_normalized[:, :target_length_fr]
-        self.cropped_norm_split = np.hsplit(cropped_norm_adj, self.slices_num)
+        # a crop range shorter than expected (see _read_and_crop) gives slices a few frames shorter
+        self.cropped_norm_split = np.array_split(cropped_norm_adj, self.slices_num, axis=1)
+        self.data_version += 1
         return self.cropped_norm_split
 
     def slice_iter(self, refresh=False):
@@ -197,6 +228,11 @@ class AudioChunk(PreviewAudioCrop, QObject):
         self.current_slice = next(self.cycle)
         return self.current_slice
 
+    def upcoming_slice_ids(self, num=1, refresh=False):
+        slices_num = len(self.cropped_norm_split)
+        start = 0 if self.cycle_id is None or refresh else self.cycle_id + 1
+        return [(start + i) % slices_num for i in range(num)]
+
     def _reslice(self):
         self.split()
         self.cycle = self.cycle_id = self.cycle_id_gen = None
@@ -235,3 +271,169 @@ class AudioChunk(PreviewAudioCrop, QObject):
     def _refresh_old_values(self):
         self._old_values = {'starttime': self.starttime, 'chunk_length': self.chunk_length,
                             'slices_num': self.slices_num, 'slice_length': self.slice_length}
+
+
+_slice_reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix='SliceReader')  # shared by all LazySlices
+
+
+class LazySlices:
+    # Sequence of audio slices read on demand by read_func(slice_id). Recently used slices are kept in memory,
+    # the next one may be prefetched in the background.
+    def __init__(self, read_func, slices_num: int, keep=3):
+        self.read_func = read_func
+        self.slices_num = slices_num
+        self.keep = keep
+        self._slices = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.slices_num
+
+    def __getitem__(self, slice_id: int):
+        if not 0 <= slice_id < self.slices_num:
+            raise IndexError(slice_id)
+        with self._lock:
+            if slice_id in self._slices:
+                self._slices.move_to_end(slice_id)
+                return self._slices[slice_id]
+            future = self._pending.get(slice_id)
+        return future.result() if future is not None else self._read(slice_id)
+
+    def prefetch(self, slice_id: int):
+        with self._lock:
+            if slice_id in self._slices or slice_id in self._pending:
+                return
+            self._pending[slice_id] = _slice_reader.submit(self._read, slice_id)
+
+    def close(self):
+        # Cancels the prefetches not started yet; slices are still read on demand
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+
+    def _read(self, slice_id: int):
+        audio = self.read_func(slice_id)
+        with self._lock:
+            self._pending.pop(slice_id, None)
+            self._slices[slice_id] = audio
+            while len(self._slices) > self.keep:
+                self._slices.popitem(last=False)
+        return audio
+
+
+class LazyAudioChunk(AudioChunk):
+    # Reads and normalizes only the slices about to be played instead of the whole crop range. The peak level for
+    # normalization comes from the file's peak index (see peak_index.py), so it is the same for every slice. Until
+    # the index of the whole file is ready, it comes from the start of the crop range only: the slices after it are
+    # attenuated if they would exceed the normalization level, and all slices are normalized again once it's ready.
+    # cropped is the memory-mapped crop range if it is already in the decoded audio cache, otherwise None;
+    # cropped_normalized stays None for audio files. Slices are read from one audio file kept open.
+
+    def __init__(self, *args, **kwargs):
+        self.peak_index = None
+        self._norm_gain = None
+        self._norm_peak = None  # the normalization level as sample value, None if not normalized
+        self._reader_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def _reset(self, readcrop=True, normalize=True, callback=None):
+        if self.audiofile_path == PN:
+            return super()._reset(readcrop=readcrop, normalize=normalize, callback=callback)
+        if readcrop or self.peak_index is None or not self.peak_index.covers(self.starttime, self.endtime):
+            self._close_audiofile()
+            self.user_stopped = False
+            try:
+                self.peak_index = get_peak_index(self.audiofile_path, self.starttime, self.endtime,
+                                                 callback=callback or self.callback)
+            except InterruptedException:
+                self._stop()
+                return
+            self.cropped = decoded_cache.load(self.audiofile_path, self.starttime, self.endtime, self.samplerate)
+        self._refresh_old_values()
+        self.cycle = self.cycle_id_gen = self.cycle_id = self.current_slice = None
+        if self.norm_level is None:
+            self._norm_gain = 1.0
+            self._norm_peak = None
+            self.split()
+        else:
+            self.normalize(norm_level=self.norm_level, resetAudio=True)
+
+    def close(self):
+        if isinstance(self.cropped_norm_split, LazySlices):
+            self.cropped_norm_split.close()
+        super().close()
+
+    def _close_audiofile(self):
+        with self._reader_lock:
+            super()._close_audiofile()
+
+    def _update_peak_index(self):
+        # Normalizes the slices again once the index of the whole file replaces the one of the range's start
+        if self.peak_index.covers(self.starttime, self.endtime):
+            return
+        index = cached_peak_index(self.audiofile_path)
+        if index is None:
+            return
+        self.peak_index = index
+        if self._norm_peak is not None:
+            self.normalize(resetAudio=True)
+
+    @property
+    def max_level(self):
+        if self.audiofile_path == PN:
+            return super().max_level
+        with np.errstate(divide='ignore'):
+            return 20 * np.emath.log10(self.peak_index.range_peak(self.starttime, self.endtime))
+
+    def normalize(self, resetAudio=False, norm_level=None, callback=None):
+        if self.audiofile_path == PN:
+            return super().normalize(resetAudio=resetAudio, norm_level=norm_level, callback=callback)
+        head_level = norm_level or self.norm_level or 0
+        if not resetAudio and self.last_norm_level == head_level and self._norm_gain is not None:
+            return
+        self._norm_gain = 10 ** ((head_level - self.max_level) / 20)
+        self._norm_peak = 10 ** (head_level / 20)
+        self.split()
+        if self.cycle_id is not None:
+            self.current_slice = self.cropped_norm_split[self.cycle_id]
+        self.last_norm_level = head_level
+
+    def split(self):
+        if self.audiofile_path == PN:
+            return super().split()
+        if isinstance(self.cropped_norm_split, LazySlices):
+            self.cropped_norm_split.close()
+        self.cropped_norm_split = LazySlices(self._read_slice, self.slices_num)
+        self.data_version += 1
+        return self.cropped_norm_split
+
+    def slice_iter(self, refresh=False):
+        if self.audiofile_path == PN:
+            return super().slice_iter(refresh=refresh)
+        self._update_peak_index()
+        self.cycle_id = self.upcoming_slice_ids(refresh=refresh)[0]
+        self.current_slice = self.cropped_norm_split[self.cycle_id]
+        self.cropped_norm_split.prefetch(self.upcoming_slice_ids()[0])
+        return self.current_slice
+
+    def _read_slice(self, slice_id: int):
+        # A slice at the end of a VBR file may be shorter than expected (see _read_and_crop): it isn't padded
+        slice_length_fr = self.sec2fr(self.slice_length)
+        start = slice_id * slice_length_fr
+        if self.cropped is not None:
+            audio = self.cropped[:, start:start + slice_length_fr]
+        else:
+            with self._reader_lock:
+                af = self._open_audiofile()
+                af.seek(min(self.sec2fr(self.starttime) + start, af.frames))
+                audio = af.read(slice_length_fr)
+        return audio * np.float32(self._slice_gain(slice_id, audio))
+
+    def _slice_gain(self, slice_id: int, audio: np.ndarray):
+        slice_start = self.starttime + slice_id * self.slice_length
+        if self._norm_peak is None or self.peak_index.covers(slice_start, slice_start + self.slice_length):
+            return self._norm_gain
+        peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+        return min(self._norm_gain, self._norm_peak / peak) if peak > 0 else self._norm_gain
@@ -0,0 +1,170 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Peak index: maximum absolute sample value (over all channels) per short block of an audio file. It gives the peak
+# level of any time range without decoding it again. Indexes are cached in memory and on disk (PeakIndex_DIR).
+# Until the index of the whole file is built (in the background), only the first range_scan_s of the requested range
+# are scanned, so the time it takes doesn't depend on the range length.
+
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import numpy as np
+from pedalboard.io import AudioFile
+from Model.file_hash import file_fingerprint
+from definitions import PeakIndex_DIR
+
+_indexes = {}
+_pending = {}
+_lock = threading.Lock()
+_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='PeakIndex')
+range_scan_s = 60
+
+
+class PeakIndex:
+    block_length_s = 0.1
+
+    def __init__(self, peaks: np.ndarray, samplerate: int or float, first_block=0, complete=True, to_end=True):
+        # first_block: block of the file the peaks start at; complete: the peaks cover the whole file;
+        # to_end: the peaks reach the end of the file
+        self.peaks = peaks
+        self.samplerate = samplerate
+        self.first_block = first_block
+        self.complete = complete
+        self.to_end = to_end
+
+    @property
+    def block_fr(self):
+        return int(self.samplerate * self.block_length_s)
+
+    def _blocks(self, starttime: int or float, endtime: int or float):
+        return int(starttime * self.samplerate) // self.block_fr, math.ceil(endtime * self.samplerate / self.block_fr)
+
+    def covers(self, starttime: int or float, endtime: int or float):
+        if self.complete:
+            return True
+        first, last = self._blocks(starttime, endtime)
+        return self.first_block <= first and (self.to_end or last <= self.first_block + self.peaks.size)
+
+    def range_peak(self, starttime: int or float, endtime: int or float):
+        # Blocks partially covered by the range are included, so the result may slightly exceed the exact peak
+        first, last = self._blocks(starttime, endtime)
+        peaks = self.peaks[max(first - self.first_block, 0):max(last - self.first_block, 0)]
+        return float(peaks.max()) if peaks.size else 0.0
+
+    def save(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, peaks=self.peaks, samplerate=self.samplerate)
+
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path) as data:
+            return cls(data['peaks'], float(data['samplerate']))
+
+    @classmethod
+    def build(cls, audiofile_path: str, callback=None, starttime=None, endtime=None):
+        # The whole file, or the blocks of the range from starttime to endtime (seconds). callback may raise
+        # InterruptedException to stop scanning
+        output = {'State': 'Scanning audio peaks', 'Percent': 0}
+        with AudioFile(audiofile_path) as af:
+            block_fr = int(af.samplerate * cls.block_length_s)
+            read_fr = block_fr * 100
+            complete = starttime is None and endtime is None
+            first_block = int((starttime or 0) * af.samplerate) // block_fr
+            start_fr = first_block * block_fr
+            end_fr = af.frames if endtime is None else min(math.ceil(endtime * af.samplerate), af.frames)
+            af.seek(min(start_fr, af.frames))
+            peaks = []
+            to_end = end_fr == af.frames
+            while af.tell() < end_fr:
+                ch = af.read(min(read_fr, end_fr - af.tell()))
+                if ch.shape[1] == 0:
+                    to_end = True
+                    break  # estimated length of VBR MP3 files may exceed the actual one
+                frame_peaks = np.abs(ch).max(axis=0)
+                frame_peaks = np.pad(frame_peaks, (0, -frame_peaks.size % block_fr))
+                peaks.append(frame_peaks.reshape(-1, block_fr).max(axis=1))
+                if callback is not None:
+                    output['Percent'] = int((af.tell() - start_fr) / max(end_fr - start_fr, 1) * 100)
+                    callback(output)
+            samplerate = af.samplerate
+        return cls(np.concatenate(peaks) if peaks else np.zeros(0, dtype=np.float32), samplerate,
+                   first_block=first_block, complete=complete, to_end=to_end)
+
+
+def _cached_index(key: str):
+    # called with _lock held
+    if key in _indexes:
+        return _indexes[key]
+    path = os.path.join(PeakIndex_DIR, f'{key}.npz')
+    if not os.path.isfile(path):
+        return None
+    try:
+        _indexes[key] = PeakIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        return None
+    return _indexes[key]
+
+
+def _build_and_save(audiofile_path: str, key: str, callback=None):
+    index = PeakIndex.build(audiofile_path, callback=callback)
+    index.save(os.path.join(PeakIndex_DIR, f'{key}.npz'))
+    with _lock:
+        _indexes[key] = index
+    return index
+
+
+def get_peak_index(audiofile_path: str, starttime: int or float, endtime: int or float, callback=None):
+    # The index of the whole file if it's ready. Otherwise only the first range_scan_s from starttime are scanned now
+    # (callback gets the progress and may raise InterruptedException), then the whole file is indexed in the
+    # background: see cached_peak_index
+    index = cached_peak_index(audiofile_path)
+    if index is not None:
+        return index
+    index = PeakIndex.build(audiofile_path, callback=callback, starttime=starttime,
+                            endtime=min(endtime, starttime + range_scan_s))
+    prebuild_peak_index(audiofile_path)  # after scanning, so that the file isn't decoded twice at the same time
+    return index
+
+
+def cached_peak_index(audiofile_path: str):
+    # The index of the whole file if it's already built, otherwise None
+    key = file_fingerprint(audiofile_path)
+    with _lock:
+        return _cached_index(key)
+
+
+def prebuild_peak_index(audiofile_path: str):
+    # Builds the index in the background (e.g. once a file is loaded for preview), so that it is ready for training
+    try:
+        key = file_fingerprint(audiofile_path)
+    except OSError:
+        return
+    with _lock:
+        if key in _pending or _cached_index(key) is not None:
+            return
+        future = _pool.submit(_build_and_save, audiofile_path, key)
+        _pending[key] = future
+
+    def done(_):
+        with _lock:
+            _pending.pop(key, None)
+
+    future.add_done_callback(done)
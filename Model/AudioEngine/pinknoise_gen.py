@@ -19,18 +19,41 @@
 #   Copyright (C) 2012-2023 Wilbert van Ham, Stichting Katholieke Universiteit, KVK 41055629, Nijmegen
 #   License: General Public License version 3 or later.
 
+#   Pink noise is generated on first use and cached in memory and as float32 .npy files in Pinknoise_DIR. The same
+#   seed always gives the same noise. 'spectral' method: random-phase 1/f spectrum of the whole length (inverse FFT);
+#   'iir': white noise through a pinking filter, synthesized block by block (see pinknoise_blocks) at any length.
+#   Pink noise drills are played at output_format, the audio output device's native sample rate and channel count,
+#   so the OS mixer doesn't resample them.
 
+import os
+import threading
 import numpy as np
+from scipy.signal import lfilter, lfilter_zi
+from definitions import Pinknoise_DIR
 
+PN_SEED = 20231001
+PN_METHODS = ('spectral', 'iir')
+PN_SAMPLERATES = (44100, 48000, 88200, 96000)
+PN_DEFAULT_FORMAT = (44100, 1)  # (samplerate, channels)
+default_method = 'spectral'
+output_format = PN_DEFAULT_FORMAT
+# Paul Kellet's pinking filter (-3 dB/octave within +-0.05 dB from 9 Hz at 44.1 kHz; the slope is shifted at
+# other sample rates and the output isn't band-limited)
+PINKING_B = np.array([0.049922035, -0.095993537, 0.050612699, -0.004408786])
+PINKING_A = np.array([1, -2.494956002, 2.017265875, -0.522189400])
 
-def spectrum_noise(spectrum_func, samples=1024, rate=44100):
+_pinknoise = {}
+_lock = threading.Lock()
+
+
+def spectrum_noise(spectrum_func, samples=1024, rate=44100, seed=None):
     """
     make noise with a certain spectral density
     """
     freqs = np.fft.rfftfreq(samples, 1.0 / rate)  # real-fft frequencies (not the negative ones)
     spectrum = np.zeros_like(freqs, dtype='complex')  # make complex numbers for spectrum
     spectrum[1:] = spectrum_func(freqs[1:])  # get spectrum amplitude for all frequencies except f=0
-    phases = np.random.uniform(0, 2 * np.pi, len(freqs) - 1)  # random phases for all frequencies except f=0
+    phases = np.random.default_rng(seed).uniform(0, 2 * np.pi, len(freqs) - 1)  # random phases for all f except 0
     spectrum[1:] *= np.exp(1j * phases)  # apply random phases
     noise = np.fft.irfft(spectrum)  # return the reverse fourier transform
     noise = np.pad(noise, (0, samples - len(noise)), 'constant')  # add zero for odd number of input samples
@@ -56,8 +79,72 @@ def pink_spectrum(f, f_min=0, f_max=np.inf, att=np.log10(2.0) * 10):
     return s
 
 
-def generate_pinknoise(length_s=30):
-    pn = spectrum_noise(lambda x: pink_spectrum(x, 20, 20000), samples=44100 * length_s)
-    pn = pn / max(abs(pn)) * 0.8  # adjusting gain level
-    pn.resize((1, 44100 * length_s))  # resizing/reshaping array to fit pedalboard requirements
+def generate_pinknoise(length_s=30, samplerate=44100, channels=1, seed=PN_SEED, method='spectral'):
+    length_fr = int(samplerate * length_s)
+    if method == 'iir':
+        pn = np.empty((channels, length_fr), dtype=np.float32)
+        filled = 0
+        for block in pinknoise_blocks(samplerate, channels=channels, seed=seed):
+            block_length = min(block.shape[1], length_fr - filled)
+            pn[:, filled:filled + block_length] = block[:, :block_length]
+            filled += block_length
+            if filled == length_fr:
+                break
+    else:
+        pn = np.stack([spectrum_noise(lambda x: pink_spectrum(x, 20, 20000), samples=length_fr, rate=samplerate,
+                                      seed=None if seed is None else seed + ch) for ch in range(channels)])
+    pn *= 0.8 / np.max(np.abs(pn))  # adjusting gain level
+    return pn.astype(np.float32, copy=False)  # (channels, frames) as pedalboard requires
+
+
+def pinknoise_blocks(samplerate=44100, channels=1, block_s=1, seed=PN_SEED):
+    # Endless pink noise in blocks of block_s, shape (channels, frames). Not peak-normalized: the level is about
+    # -18 dBFS RMS
+    rng = np.random.default_rng(seed)
+    block_fr = int(samplerate * block_s)
+    zi = None
+    while True:
+        white = rng.standard_normal((channels, block_fr))
+        if zi is None:
+            zi = lfilter_zi(PINKING_B, PINKING_A) * white[:, :1]  # starting in the steady state
+        block, zi = lfilter(PINKING_B, PINKING_A, white, axis=1, zi=zi)
+        yield (block * 1.5).astype(np.float32)
+
+
+def match_output_format(samplerate: int, channels: int):
+    # Sets output_format to the supported format closest to the output device's one
+    global output_format
+    samplerate = min(PN_SAMPLERATES, key=lambda sr: abs(sr - samplerate))
+    output_format = (samplerate, min(max(channels, 1), 2))
+    return output_format
+
+
+def get_pinknoise(length_s=30, samplerate=None, channels=None, seed=PN_SEED, method=None):
+    # Read-only (channels, frames) float32 array, in output_format by default
+    samplerate = samplerate or output_format[0]
+    channels = channels or output_format[1]
+    method = method or default_method
+    key = (length_s, samplerate, channels, seed, method)
+    with _lock:
+        if key not in _pinknoise:
+            _pinknoise[key] = _load_or_generate(*key)
+        return _pinknoise[key]
+
+
+def _load_or_generate(length_s, samplerate, channels, seed, method):
+    path = os.path.join(Pinknoise_DIR, f'pinknoise_{method}_{samplerate}_{channels}ch_{length_s}s_{seed}.npy')
+    try:
+        return np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        pass
+    pn = generate_pinknoise(length_s, samplerate=samplerate, channels=channels, seed=seed, method=method)
+    try:
+        os.makedirs(Pinknoise_DIR, exist_ok=True)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.save(f, pn)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    pn.flags.writeable = False
     return pn
@@ -14,18 +14,17 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-from PyQt6.QtCore import pyqtSignal, QObject
+from Model.observer import Signal
 
 
-class PreviewAudioCrop(QObject):
+class PreviewAudioCrop:
     min_slice_length = 10
     max_slice_length = 30
-    rangeChanged = pyqtSignal()
-    sliceLengthChanged = pyqtSignal(int)
 
     def __init__(self, audiofile_length: int or float, starttime: int or float, endtime: int or float,
                  slice_length=15, strictMode=False):
-        super().__init__()
+        self.rangeChanged = Signal()
+        self.sliceLengthChanged = Signal()  # (slice_length: int)
         self.source_length = audiofile_length
         self._strictMode = strictMode
         if strictMode:
@@ -100,3 +99,7 @@ class PreviewAudioCrop(QObject):
 
     def setStrictModeActive(self, arg: bool):
         self._strictMode = arg
+
+    def blockSignals(self, arg: bool):
+        self.rangeChanged.block(arg)
+        return self.sliceLengthChanged.block(arg)
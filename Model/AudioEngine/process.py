@@ -14,6 +14,7 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
 import numpy as np
 from pedalboard import PeakFilter, Pedalboard
 
@@ -21,41 +22,37 @@ from Model.calc import proc_unproc_len, rand_buffer
 
 
 def eq_proc(cur_sample, samplerate: int, freq1: int or float, freq2=None,
-            gain_depth=12, Q=1.41, proc_t_perc=40, eq_transition_len_s=0.035, fade_inout_len_s=0.005):
+            gain_depth=12, Q=1.41, proc_t_perc=40, eq_transition_len_s=0.035, fade_inout_len_s=0.005,
+            eq_preroll_len_s=0.2):
+    # Only the processed region is filtered, starting eq_preroll_len_s earlier to warm up the filters' state.
+    # Transition and fade curves are applied in place to the edge samples only.
     def sec2fr(sec: int or float):
         return int(samplerate * sec)
 
-    pre_eq, to_eq, post_eq = _eq_audio_parts(cur_sample, samplerate, proc_t_perc=proc_t_perc)
-    gain = gain_depth * -1 if freq1 < 0 else gain_depth
-    eq1 = PeakFilter(cutoff_frequency_hz=abs(freq1), gain_db=gain, q=Q)
-    if freq2:
-        gain2 = gain_depth * -1 if freq2 < 0 else gain_depth
-        eq2 = PeakFilter(cutoff_frequency_hz=abs(freq2), gain_db=gain2, q=Q)
-    else:
-        eq2 = None
-    chain = Pedalboard([eq1, eq2])
+    proc_start, proc_end = _eq_region(cur_sample, samplerate, proc_t_perc=proc_t_perc)
+    preroll_start = max(0, proc_start - sec2fr(eq_preroll_len_s))
+    bands = [freq1, freq2] if freq2 else [freq1]
+    freqs = [abs(f) for f in bands]
+    gains = [gain_depth * -1 if f < 0 else gain_depth for f in bands]
 
     crossfade_len_fr = sec2fr(eq_transition_len_s)
     fade_inout_len_fr = sec2fr(fade_inout_len_s)
 
-    equalized = _pb_process(to_eq, chain, samplerate)
+    to_eq = cur_sample[:, preroll_start:proc_end]
+    equalized = _pb_process(to_eq, _pb_chain(freqs, gains, Q), samplerate)
+    equalized = equalized[:, proc_start - preroll_start:]
 
     if proc_t_perc < 100:
-        pre_eq = pre_eq * fadeInCurveGen(pre_eq[0].size, fade_inout_len_fr)
-        post_eq = post_eq * fadeOutCurveGen(post_eq[0].size, fade_inout_len_fr)
-        eq_in_curve = eqGainCurveGen(0, 1, to_eq[0].size, crossfade_len_fr)
-        eq_out_curve = eqGainCurveGen(1, 0, to_eq[0].size, crossfade_len_fr)
-        eq_proc_in = equalized * eq_in_curve
-        eq_unproc_out = to_eq * eq_out_curve
-        equalized = eq_proc_in + eq_unproc_out
+        output = cur_sample.astype(equalized.dtype)
+        _crossfade_edges(output[:, proc_start:proc_end], equalized, crossfade_len_fr)
+        output[:, proc_start:proc_end] = equalized
     else:
-        equalized = equalized * fadeInCurveGen(equalized[0].size, fade_inout_len_fr) * \
-                fadeOutCurveGen(to_eq[0].size, fade_inout_len_fr)
-
-    return np.concatenate((pre_eq, equalized, post_eq), axis=1)
+        output = np.ascontiguousarray(equalized)
+    _fade_edges(output, fade_inout_len_fr)
+    return output
 
 
-def _eq_audio_parts(cur_sample: np.ndarray, samplerate: int, proc_t_perc=40):  # -> pre_eq / to_eq / post_eq
+def _eq_region(cur_sample: np.ndarray, samplerate: int, proc_t_perc=40):  # -> processed region's start / end frames
     def sec2fr(sec: int or float):
         return int(samplerate * sec)
 
@@ -63,7 +60,35 @@ def _eq_audio_parts(cur_sample: np.ndarray, samplerate: int, proc_t_perc=40):  #
     proc_len, unproc_len = proc_unproc_len(cur_sample_length, proc_t_perc)
     proc_len_fr = sec2fr(proc_len)
     unproc_len_fr = sec2fr(unproc_len)
-    return np.hsplit(cur_sample, [unproc_len_fr, unproc_len_fr + proc_len_fr])
+    return unproc_len_fr, min(unproc_len_fr + proc_len_fr, cur_sample[0].size)
+
+
+def _crossfade_edges(dry: np.ndarray, wet: np.ndarray, trans_len_fr: int):
+    # Modifies wet in place: fading from dry to wet over the first trans_len_fr frames and back over the last ones
+    trans_len_fr = min(trans_len_fr, wet[0].size // 2)
+    if trans_len_fr < 1:
+        return wet
+    ramp = rampCurve(trans_len_fr, dtype=wet.dtype.type)
+    for edge, curve in ((slice(0, trans_len_fr), ramp), (slice(wet[0].size - trans_len_fr, None), ramp[::-1])):
+        wet[:, edge] -= dry[:, edge]
+        wet[:, edge] *= curve
+        wet[:, edge] += dry[:, edge]
+    return wet
+
+
+def _fade_edges(audio: np.ndarray, fade_inout_len_fr: int):
+    # Modifies audio in place: fade-in at the start and fade-out at the end
+    fade_len_fr = min(fade_inout_len_fr, audio[0].size)
+    if fade_len_fr < 1:
+        return audio
+    ramp = rampCurve(fade_len_fr, dtype=audio.dtype.type)
+    audio[:, :fade_len_fr] *= ramp
+    audio[:, audio[0].size - fade_len_fr:] *= ramp[::-1]
+    return audio
+
+
+def _pb_chain(freqs: list, gains: list, Q: int or float):
+    return Pedalboard([PeakFilter(cutoff_frequency_hz=f, gain_db=g, q=Q) for f, g in zip(freqs, gains)])
 
 
 def _pb_process(audio_sample: np.ndarray, chain: Pedalboard, samplerate: int or float):
@@ -77,25 +102,14 @@ def _pb_process(audio_sample: np.ndarray, chain: Pedalboard, samplerate: int or
     return processed
 
 
-def eqGainCurveGen(value1: int or float, value2: int or float, duration_fr: int, trans_len_fr: int):
-    start = np.linspace(value1, value2, trans_len_fr)
-    end = np.linspace(value2, value1, trans_len_fr)
-    body = np.ndarray((duration_fr - trans_len_fr * 2, ))
-    body.fill(value2)
-    return np.concatenate((start, body, end))
-
+# Curves depend only on their arguments, so they are cached and returned as read-only arrays:
+# use them as multipliers or copy them before modifying.
 
-def fadeInCurveGen(duration_fr: int, fade_in_len_fr: int):
-    fade_in_len_fr = min(duration_fr, fade_in_len_fr)
-    start = np.linspace(0, 1, fade_in_len_fr)
-    body = np.ndarray((duration_fr - fade_in_len_fr, ))
-    body.fill(1)
-    return np.concatenate((start, body))
+def _read_only(curve: np.ndarray):
+    curve.flags.writeable = False
+    return curve
 
 
-def fadeOutCurveGen(duration_fr: int, fade_out_len_fr: int):
-    fade_out_len_fr = min(duration_fr, fade_out_len_fr)
-    body = np.ndarray((duration_fr - fade_out_len_fr, ))
-    body.fill(1)
-    end = np.linspace(1, 0, fade_out_len_fr)
-    return np.concatenate((body, end))
+@lru_cache(maxsize=64)
+def rampCurve(length_fr: int, dtype=np.float32):  # linear 0 -> 1 ramp; ramp[::-1] gives 1 -> 0 without copying
+    return _read_only(np.linspace(0, 1, length_fr, dtype=dtype))
@@ -14,10 +14,16 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import locale
 import mimetypes
+import os
 import platform
 import re
+import time
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path, PureWindowsPath, PurePath
 from urllib import parse, request
 
@@ -32,36 +38,118 @@ m3u_mimes = ('audio/x-mpegurl', 'audio/mpegurl', 'application/x-mpegurl', 'appli
 pls_mimes = ('audio/scpls', 'audio/x-scpls', 'application/pls+xml',)
 xspf_mimes = ('application/xspf+xml',)
 PLMimes = m3u_mimes + pls_mimes + xspf_mimes
+# Lowercase extensions of the MIME types above: folders are scanned by extension without calling guess_type per file
+PLExtensions = frozenset(ext for mime in PLMimes for ext in mimetypes.guess_all_extensions(mime, strict=False))
+SupportedExtensions = PLExtensions | frozenset(ext for mime in AudioMimes
+                                               for ext in mimetypes.guess_all_extensions(mime, strict=False))
 
 
 def pathsResolve(Paths: list[str], return_dict: dict):
     def make_error_list(msg):
         errors.append(str(msg))
 
-    paths = []
     errors = []
-    for path in Paths:
-        _Path = Path(path)
-        if _Path.is_file():
-            paths.append(path)
-        elif _Path.is_dir():
-            paths.extend(filesFromDir(_Path))
-            paths.sort()
-    paths = filePathsFilter(expandPlayLists(filePathsFilter(paths), callback=make_error_list))
-    return_dict['Paths'] = paths
+    return_dict['Paths'] = list(iterPathsResolve(Paths, callback=make_error_list))
     return_dict['Errors'] = errors
     return return_dict
 
 
+def iterPathsResolve(Paths: list[str], callback=None, workers=8, missing=None):
+    # Yields audio file paths from files, folders and playlists as soon as they are found, in the order of Paths.
+    # All folders are scanned concurrently by workers threads (see scanDir). missing(path) is called for the files
+    # linked in playlists that don't exist
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        listings = {path: pool.submit(_listDir, path) for path in Paths if os.path.isdir(path)}
+        for path in Paths:
+            if path in listings:
+                paths = _walk(pool, listings[path], callback)
+            elif os.path.isfile(path):
+                paths = filePathsFilter([path])
+            else:
+                continue
+            for _path in paths:
+                if _extension(_path) in PLExtensions:
+                    yield from filePathsFilter(files_from_PL(_path, callback, missing))  # streamed as it's read
+                else:
+                    yield _path
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def pathsResolveToPipe(Paths: list[str], conn, batch_size=256, interval=0.1):
+    # Sends ('paths', [paths]) batches and ('error', message) to conn (multiprocessing Connection) and closes it
+    def send_error(msg):
+        conn.send(('error', str(msg)))
+
+    batch = []
+    last_sent = time.perf_counter()
+    try:
+        for path in iterPathsResolve(Paths, callback=send_error):
+            batch.append(path)
+            if len(batch) >= batch_size or time.perf_counter() - last_sent >= interval:
+                conn.send(('paths', batch))
+                batch = []
+                last_sent = time.perf_counter()
+    except Exception as e:
+        send_error(e)
+    if batch:
+        conn.send(('paths', batch))
+    conn.close()
+
+
+def scanDir(dirpath: str, callback=None, workers=8):
+    # Yields supported files in dirpath and its subfolders, sorted by name within each folder. Hidden files and
+    # folders are skipped, symlinked folders aren't followed
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from _walk(pool, pool.submit(_listDir, dirpath), callback)
+
+
+def _walk(pool: ThreadPoolExecutor, listing, callback=None):
+    entries, error = listing.result()
+    if error is not None:
+        _cb(callback, error)
+    # subfolders are listed ahead in the pool while the files before them are consumed
+    sub_listings = {path: pool.submit(_listDir, path) for path, is_dir in entries if is_dir}
+    for path, is_dir in entries:
+        if is_dir:
+            yield from _walk(pool, sub_listings[path], callback)
+        else:
+            yield path
+
+
+def _listDir(dirpath: str):
+    # ([(path, is_dir)] sorted by name, error message or None)
+    entries = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        entries.append((entry.name, entry.path, True))
+                    elif _extension(entry.name) in SupportedExtensions and entry.is_file():
+                        entries.append((entry.name, entry.path, False))
+                except OSError:
+                    continue
+    except OSError as e:
+        return [], f'Cannot read folder "{dirpath}": {e}'
+    entries.sort()
+    return [(path, is_dir) for name, path, is_dir in entries], None
+
+
+def _extension(path: str):
+    return os.path.splitext(path)[1].lower()
+
+
 def filesFromDir(dirpath: Path):
-    dir_content = dirpath.glob('**/*')
-    return [str(el) for el in dir_content if el.is_file()]
+    return list(scanDir(str(dirpath)))
 
 
-def filePathsFilter(paths: list[str]):
-    MimeTypes = AudioMimes + PLMimes
-    return [path for path in paths if
-            mimetypes.guess_type(path, strict=False)[0] in MimeTypes and not Path(path).name.startswith('.')]
+def filePathsFilter(paths):
+    return (path for path in paths if
+            _extension(path) in SupportedExtensions and not os.path.basename(path).startswith('.'))
 
 
 def expandPlayLists(paths: list[str], callback=None):
@@ -75,46 +163,105 @@ def expandPlayLists(paths: list[str], callback=None):
     return paths_expanded
 
 
-def files_from_PL(pl_path: str, callback=None):
+def files_from_PL(pl_path: str, callback=None, missing=None):
+    # Yields the existing files linked in the playlist while it's read. Errors in single lines or tracks are reported
+    # to callback and skipped; an error that stops the parsing keeps the files yielded before it. Links to files that
+    # don't exist are passed to missing, if given
     mime = mimetypes.guess_type(pl_path, strict=False)[0]
-    err_mess = f'Error occurred while parsing "{pl_path}": '
     enc = 'utf-8' if Path(pl_path).suffix in ('.m3u8', '.xspf',) else None
     try:
         if mime in xspf_mimes:
-            pl_links = parseLinksFromXSPF(pl_path)
+            pl_links = parseLinksFromXSPF(pl_path, callback=callback)
         elif mime in m3u_mimes:
-            pl_links = parseLinksFrom_M3U(pl_path, encoding=enc)
+            pl_links = parseLinksFrom_M3U(pl_path, encoding=enc, callback=callback)
         elif mime in pls_mimes:
-            pl_links = parseLinksFrom_PLS(pl_path)
+            pl_links = parseLinksFrom_PLS(pl_path, callback=callback)
         else:
-            return []
+            return
+        if enc is not None:
+            pl_links = (parse.unquote(link, encoding=enc) for link in pl_links)
+        yield from linksToExistingFiles(pl_links, Path(pl_path).parent, callback=callback, missing=missing)
     except Exception as e:
-        _cb(callback, f'{err_mess}{e}')
-        return []
-    pl_links = [parse.unquote(link, encoding=enc) for link in pl_links] if enc is not None else pl_links
-    return linksToExistingFiles(pl_links, Path(pl_path).parent, callback=callback)
+        _cb(callback, f'Error occurred while parsing "{pl_path}": {e}')
+
+
+def _textLines(pl_path: str, encoding=None, callback=None):
+    # Yields (line number, line) with trailing whitespace stripped; lines that can't be decoded are reported
+    encoding = encoding or locale.getpreferredencoding(False)
+    with open(pl_path, 'rb') as f:
+        for num, line in enumerate(f, 1):
+            try:
+                line = line.decode(encoding)
+            except UnicodeDecodeError as e:
+                _cb(callback, f'"{pl_path}", line {num}: {e}')
+                continue
+            yield num, line.lstrip('\ufeff').rstrip() if num == 1 else line.rstrip()
+
+
+def parseLinksFrom_M3U(pl_path: str, encoding=None, callback=None):
+    for num, line in _textLines(pl_path, encoding, callback):
+        if line and not line.startswith('#'):
+            yield line
 
 
-def parseLinksFrom_M3U(pl_path: str, encoding=None):
-    with open(pl_path, 'r', encoding=encoding, errors='replace') as f:
-        pl_links = [line.rstrip() for line in f.readlines()]
-    return pl_links
+_PLSFileLine = re.compile(r'File\d+=(.*)', re.IGNORECASE)
+
+
+def parseLinksFrom_PLS(pl_path: str, callback=None):
+    for num, line in _textLines(pl_path, callback=callback):
+        match = _PLSFileLine.match(line.lstrip())
+        if match is not None:
+            yield match.group(1)
+
+
+def parseLinksFromXSPF(filepath: str, callback=None):
+    # Tracks are removed from the tree once read, so memory doesn't grow with the playlist
+    ns = '{http://xspf.org/ns/0/}'
+    trackList = None
+    num = 0
+    for event, elem in ET.iterparse(filepath, events=('start', 'end')):
+        if event == 'start':
+            if elem.tag == f'{ns}trackList':
+                trackList = elem
+            continue
+        if elem.tag != f'{ns}track' or trackList is None:
+            continue
+        num += 1
+        location = elem.find(f'{ns}location')
+        if location is None or not location.text:
+            _cb(callback, f'"{filepath}", track {num}: no location')
+        else:
+            yield location.text.strip()
+        trackList.clear()
 
 
-def parseLinksFrom_PLS(pl_path: str):
-    with open(pl_path, 'r', errors='replace') as f:
-        pl_lines = [re.sub('File\d+=', '', line.rstrip()) for line in f.readlines()]
-    return pl_lines
+def linksToExistingFiles(links, current_dir, callback=None, batch_size=64, workers=8, missing=None):
+    # Yields the links (iterable) to existing files as absolute paths, in order. Batches of batch_size paths are
+    # checked concurrently by workers threads, at most workers batches ahead of the consumer. missing(path) is called
+    # for the paths that don't exist
+    paths = _linksToPaths(links, current_dir, callback)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        checking = deque()
+        while True:
+            while len(checking) < workers and (batch := list(islice(paths, batch_size))):
+                checking.append((batch, pool.submit(_existingFiles, batch)))
+            if not checking:
+                return
+            batch, existing = checking.popleft()
+            existing = existing.result()
+            if missing is not None and len(existing) < len(batch):
+                found = set(existing)
+                for path in batch:
+                    if path not in found:
+                        missing(path)
+            yield from existing
 
 
-def parseLinksFromXSPF(filepath: str):
-    root = ET.parse(filepath).getroot()
-    NS = {'xspf': "http://xspf.org/ns/0/"}
-    return [tr.find('xspf:location', NS).text for tr in root.find('xspf:trackList', NS).findall('xspf:track', NS)]
+def _existingFiles(paths: list[str]):
+    return [path for path in paths if os.path.isfile(path)]
 
 
-def linksToExistingFiles(links: list[str], current_dir, callback=None):
-    files = []
+def _linksToPaths(links, current_dir, callback=None):
     for link in links:
         link = _windows_file_url_mod(link)
         try:
@@ -122,11 +269,8 @@ def linksToExistingFiles(links: list[str], current_dir, callback=None):
         except Exception as e:
             _cb(callback, f'Cannot parse URL "{link}"! {e}')
             continue
-        abs_path = path if Path(path).is_absolute() \
+        yield path if Path(path).is_absolute() \
             else str(PurePath.joinpath(current_dir, PureWindowsPath(path).as_posix()))
-        if Path(abs_path).is_file():
-            files.append(abs_path)
-    return files
 
 
 def _urlparse_func():
@@ -0,0 +1,139 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Duration, sample rate and channel count of audio files, cached in an SQLite database keyed by (path, size, mtime):
+# a file is only opened again after it has been modified. Files that can't be opened are cached too, with
+# duration, samplerate and num_channels set to None.
+
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pedalboard.io import AudioFile
+from definitions import AudioMetadataCache_PATH
+
+
+def _stat_key(path: str):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def read_metadata(path: str):
+    try:
+        with AudioFile(path) as f:
+            return {'duration': f.duration, 'samplerate': int(f.samplerate), 'num_channels': f.num_channels}
+    except Exception:
+        return {'duration': None, 'samplerate': None, 'num_channels': None}
+
+
+class AudioMetadataCache:
+    def __init__(self, db_path: str = AudioMetadataCache_PATH):
+        self.db_path = db_path
+        self._db = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS metadata (path TEXT PRIMARY KEY, size INTEGER, '
+                             'mtime_ns INTEGER, duration REAL, samplerate INTEGER, num_channels INTEGER)')
+        return self._db
+
+    def get_many(self, paths: list[str]):
+        # {path: metadata} for the paths cached with the current size and mtime
+        keys = {}
+        for path in paths:
+            try:
+                keys[path] = _stat_key(path)
+            except OSError:
+                pass
+        found = {}
+        with self._lock:
+            try:
+                db = self._connect()
+                for path, key in keys.items():
+                    row = db.execute('SELECT size, mtime_ns, duration, samplerate, num_channels FROM metadata '
+                                     'WHERE path = ?', (path,)).fetchone()
+                    if row is not None and tuple(row[:2]) == key:
+                        found[path] = {'duration': row[2], 'samplerate': row[3], 'num_channels': row[4]}
+            except sqlite3.Error:
+                pass
+        return found
+
+    def put_many(self, items: list[tuple[str, tuple[int, int], dict]]):
+        # items: (path, (size, mtime_ns), metadata)
+        rows = [(path, *key, md['duration'], md['samplerate'], md['num_channels']) for path, key, md in items]
+        with self._lock:
+            try:
+                with self._connect() as db:
+                    db.executemany('INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?, ?)', rows)
+            except sqlite3.Error:
+                pass
+
+    def get(self, path: str):
+        metadata = self.get_many([path]).get(path)
+        if metadata is None:
+            metadata = self.probe(path)
+        return metadata
+
+    def probe(self, path: str):
+        try:
+            key = _stat_key(path)
+        except OSError:
+            return None
+        metadata = read_metadata(path)
+        self.put_many([(path, key, metadata)])
+        return metadata
+
+    def probe_many(self, paths: list[str], workers=4, batch_size=64, stopped=None):
+        # Yields lists of (path, metadata) as the files are read; cached files come first, in one batch.
+        # stopped: callable returning True to stop probing
+        cached = self.get_many(paths)
+        if cached:
+            yield list(cached.items())
+        paths = [p for p in paths if p not in cached]
+        if not paths:
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for i in range(0, len(paths), batch_size):
+                if stopped is not None and stopped():
+                    return
+                batch = [result for result in pool.map(self._probe_uncached, paths[i:i + batch_size])
+                         if result is not None]
+                if batch:
+                    self.put_many(batch)
+                    yield [(path, md) for path, key, md in batch]
+
+    @staticmethod
+    def _probe_uncached(path: str):
+        try:
+            key = _stat_key(path)
+        except OSError:
+            return None
+        return path, key, read_metadata(path)
+
+    def clear(self):
+        with self._lock:
+            try:
+                with self._connect() as db:
+                    db.execute('DELETE FROM metadata')
+            except sqlite3.Error:
+                pass
+
+
+metadata_cache = AudioMetadataCache()
@@ -14,12 +14,17 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import time
+from io import BytesIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from pedalboard.io import AudioFile
-from Model.AudioEngine.load_audio import AudioChunk
+from Model.AudioEngine import pinknoise_gen
+from Model.AudioEngine.drill_cache import DrillCache
+from Model.AudioEngine.load_audio import AudioChunk, LazyAudioChunk
 from Model.AudioEngine.process import eq_proc
 from Model.exercise_gen import ExampleGenerator
+from Model.globals import PinknoiseLength
 from Utilities.exceptions import InterruptedException
 from definitions import TEMP_AUDIO_DIR, PN
 
@@ -34,23 +39,32 @@ def create_temp_wavefile():
         return f.name
 
 
+def create_memory_wavefile():
+    # In-memory replacement for create_temp_wavefile(): AudioFile infers the output format from the 'name' attribute
+    buffer = BytesIO()
+    buffer.name = 'drill.wav'
+    return buffer
+
+
 class AudioDrillGen:
     def __init__(self, freq_options: list[int], boost_cut='+-', DualBandMode=False,
                  audio_source_path=PN, cropped=None, cropped_normalized=None,
                  starttime=0, endtime=None, drill_length=15,
                  gain_depth=12, Q=4.32, order='asc', boost_cut_priority=1, disableAdjacent=1, inf_cycle=True,
-                 proc_t_perc=40, callback=None):
+                 proc_t_perc=40, lookahead=0, lazy=False, pn_format=None, callback=None):
         # order: 'asc', 'desc', 'shuffle', 'random'
         # boost_cut: '+', '-', '+-'
         # boost_cut_priority 1 (Each Band Boosted, then Cut) / 2 (All Bands Boosted, then All Bands Cut) -- ignored in random mode
         # disableAdjacent -- actual for DualBandMode
         # self.order, self.boost_cut_priority, self.Q, self.proc_t_perc are dynamically adjustable
         # with another EQ_Pattern on the same audio source use self.resetExGen
+        # lookahead: number of upcoming drills rendered in the background (0 -- rendering on demand only)
+        # lazy: reading audio file slices on demand instead of the whole crop range (see LazyAudioChunk)
+        # pn_format: (samplerate, channels) of pink noise (default: the output device's, see pinknoise_gen)
 
         if audio_source_path == PN:
-            self.af_duration = 30
-            self.af_samplerate = 44100
-            self.af_num_channels = 1
+            self.af_duration = PinknoiseLength
+            self.af_samplerate, self.af_num_channels = pn_format = pn_format or pinknoise_gen.output_format
         else:
             with AudioFile(audio_source_path) as af:
                 self.af_duration = af.duration
@@ -58,10 +72,12 @@ class AudioDrillGen:
                 self.af_num_channels = af.num_channels
         self._gain_depth = abs(gain_depth)
         self._DualBandMode = DualBandMode
-        self.audiochunk = AudioChunk(audio_source_path, cropped=cropped, cropped_normalized=cropped_normalized,
-                                     starttime=starttime,
-                                     endtime=endtime or self.af_duration,
-                                     slice_length=drill_length, norm_level=self.gain_headroom, callback=callback)
+        chunk_type = LazyAudioChunk if lazy else AudioChunk
+        self.audiochunk = chunk_type(audio_source_path, cropped=cropped, cropped_normalized=cropped_normalized,
+                                    starttime=starttime,
+                                    endtime=endtime or self.af_duration,
+                                    slice_length=drill_length, norm_level=self.gain_headroom, pn_format=pn_format,
+                                    callback=callback)
         if self.audiochunk.user_stopped:
             raise InterruptedException
         self._Q = Q
@@ -72,6 +88,10 @@ class AudioDrillGen:
                                              boost_cut_priority=boost_cut_priority, disableAdjacent=disableAdjacent,
                                              inf_cycle=inf_cycle)
         self._last_freq = None
+        self.last_output_timing = {}  # in ms: 'Processing' / 'Writing'
+        self.lookahead = lookahead
+        self.drill_cache = DrillCache(self._render_drill) if lookahead > 0 else None
+        self._drill_cache_version = self.audiochunk.data_version
 
     def gain_depth(self):
         return self._gain_depth
@@ -86,6 +106,7 @@ class AudioDrillGen:
         self.audiochunk.norm_level = self.gain_headroom
         if normalize_audio:
             self.audiochunk.normalize(callback=callback)
+        self._invalidate_drills()
 
     @property
     def Q(self):
@@ -93,6 +114,8 @@ class AudioDrillGen:
 
     @Q.setter
     def Q(self, value: int or float):
+        if value != self._Q:
+            self._invalidate_drills()
         self._Q = value
 
     @property
@@ -128,37 +151,81 @@ class AudioDrillGen:
         self._on_EQ_order_change()
 
     def output(self, force_freq=None, fromStart=False, audio_path=None):
+        # audio_path: file path or file-like object (see create_memory_wavefile)
         freq = self._freq_out(force_freq=force_freq)
-        audio = self._audio_out(fromStart=fromStart)
+        audio = self._timed_audio_out(fromStart=fromStart)
         if audio_path:
-            with AudioFile(audio_path, 'w', self.af_samplerate, self.af_num_channels) as o:
-                o.write(audio)
+            self._write_audio(audio, audio_path)
         return freq, audio
 
+    def next_drill(self):
+        # Advances to the next drill like output() without rendering it: -> (slice_id, freq, gain_depth, Q, proc_t_perc)
+        freq = self._freq_out()
+        self.audiochunk.slice_iter()
+        return self._drill_key(self.audiochunk.cycle_id, freq)
+
     def refresh_audio(self, filepath=None):
         if self._last_freq is None:
             return
-        audio = self._audio_out(renderCurrent=True, fromStart=False)
+        audio = self._timed_audio_out(renderCurrent=True, fromStart=False)
         if filepath is None:
             return audio
-        with AudioFile(filepath, 'w', self.af_samplerate, self.af_num_channels) as o:
-            o.write(audio)
+        self._write_audio(audio, filepath)
         return filepath
 
+    def _timed_audio_out(self, renderCurrent=False, fromStart=False):
+        start = time.perf_counter()
+        audio = self._audio_out(renderCurrent=renderCurrent, fromStart=fromStart)
+        self.last_output_timing = {'Processing': (time.perf_counter() - start) * 1000}
+        return audio
+
+    def _write_audio(self, audio, audio_path):
+        start = time.perf_counter()
+        with AudioFile(audio_path, 'w', self.af_samplerate, self.af_num_channels) as o:
+            o.write(audio)
+        self.last_output_timing['Writing'] = (time.perf_counter() - start) * 1000
+
     def _freq_out(self, force_freq=None):
         self._last_freq = self.exercise_gen.seqOut(force_freq)
         return self._last_freq
 
     def _audio_out(self, renderCurrent=False, fromStart=False):
-        if isinstance(self._last_freq, tuple):
-            freq1, freq2 = self._last_freq
-        else:
-            freq1, freq2 = self._last_freq, None
-        source = self.audiochunk.slice_iter(refresh=fromStart) \
-            if not renderCurrent or self.audiochunk.current_slice is None else self.audiochunk.current_slice
+        if not renderCurrent or self.audiochunk.current_slice is None:
+            self.audiochunk.slice_iter(refresh=fromStart)
         self.audiochunk.signals.showNormalizationLevel.emit(self.gain_headroom)
-        return eq_proc(source, self.audiochunk.samplerate, freq1, freq2=freq2,
-                       gain_depth=self.gain_depth(), Q=self.Q, proc_t_perc=self.proc_t_perc)
+        if self.drill_cache is None:
+            return self._render_drill(*self._drill_key(self.audiochunk.cycle_id, self._last_freq))
+        if self._drill_cache_version != self.audiochunk.data_version:  # crop range, slices or normalization changed
+            self._invalidate_drills()
+        audio = self.drill_cache.get(self._drill_key(self.audiochunk.cycle_id, self._last_freq))
+        self._prefetch_drills()
+        return audio
+
+    def _drill_key(self, slice_id: int, freq: int or tuple):
+        return slice_id, freq, self.gain_depth(), self.Q, self.proc_t_perc
+
+    def _render_drill(self, slice_id: int, freq: int or tuple, gain_depth: int, Q: float, proc_t_perc: int):
+        freq1, freq2 = freq if isinstance(freq, tuple) else (freq, None)
+        return eq_proc(self.audiochunk.cropped_norm_split[slice_id], self.audiochunk.samplerate, freq1, freq2=freq2,
+                       gain_depth=gain_depth, Q=Q, proc_t_perc=proc_t_perc)
+
+    def _prefetch_drills(self):
+        slice_ids = self.audiochunk.upcoming_slice_ids(self.lookahead)
+        freqs = self.exercise_gen.peek(self.lookahead)
+        self.drill_cache.prefetch([self._drill_key(s_id, freq) for s_id, freq in zip(slice_ids, freqs)])
+
+    def close(self):
+        # Stops rendering drills in the background, frees the cached ones and closes the audio file. The generator
+        # renders on demand and reopens the file if it's used after it
+        if self.drill_cache is not None:
+            self.drill_cache.shutdown()
+            self.drill_cache = None
+        self.audiochunk.close()
+
+    def _invalidate_drills(self):
+        if self.drill_cache is not None:
+            self.drill_cache.invalidate()
+        self._drill_cache_version = self.audiochunk.data_version
 
     def _on_EQ_order_change(self):
         self.exercise_gen.inf_cycle = True
@@ -0,0 +1,171 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Learn / Test exercise sets for many sources x EQ patterns without the GUI. Every (source, pattern) pair is a job
+# run in a worker process; jobs render their files serially to keep the number of processes fixed. The source range
+# of every source (which needs the file's hash) is found once in the parent process and passed to its jobs.
+
+import hashlib
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from pedalboard.io import AudioFile
+from Model.FileLinksParser import iterPathsResolve
+from Model.audiodrill_gen import EQ1_freq, EQ2_freq
+from Model.calc import optimal_range_length
+from Model.eq_patterns import EQPatterns
+from Model.file_hash import filehash_with_cache
+from Model.globals import MinAudioDuration
+from Model.make_learntest_files import makeLearnFiles, makeTestFiles
+from Model.sourcerange_manager import SourceRangeManager
+from Utilities.Q_extract import Qextr
+
+_forbidden_filename_chars = re.compile(r'[<>:"/\\|?*]')
+
+
+def find_patterns(names: list[str]):
+    # names: pattern names from eq_patterns.json or their numbers (starting from 1); empty list -- all patterns
+    patterns = EQPatterns().List
+    if not names:
+        return list(enumerate(patterns, 1))
+    found = []
+    for name in names:
+        if name.isdigit() and 1 <= int(name) <= len(patterns):
+            found.append((int(name), patterns[int(name) - 1]))
+            continue
+        matches = [(num, P) for num, P in enumerate(patterns, 1) if P['Name'].lower() == name.strip().lower()]
+        if not matches:
+            raise ValueError(f'Unknown EQ pattern: "{name}"')
+        found.extend(matches)
+    return found
+
+
+def resolve_sources(paths: list[str]):
+    # Audio files, folders and playlists -> (usable audio file paths, errors). Every given path that yields no audio
+    # file and every missing file linked in a playlist is reported as well. Paths found more than once are used once
+    errors = []
+    resolved = {}
+    for path in paths:
+        found = list(iterPathsResolve([path], callback=errors.append,
+                                      missing=lambda link: errors.append(f'"{link}": not found')))
+        if not found:
+            errors.append(f'"{path}": not found' if not os.path.exists(path) else
+                          f'"{path}": no supported audio files found')
+        resolved.update(dict.fromkeys(found))
+    sources = []
+    for path in resolved:
+        try:
+            with AudioFile(path) as af:
+                duration, samplerate = af.duration, af.samplerate
+        except Exception as e:
+            errors.append(f'Cannot open "{path}": {e}')
+            continue
+        if duration < MinAudioDuration:
+            errors.append(f'"{path}": audio file duration cannot be less than {MinAudioDuration}sec')
+        elif samplerate < 44100:
+            errors.append(f'"{path}": audio file sampling rate cannot be less than 44.1kHz')
+        else:
+            sources.append(path)
+    return sources, errors
+
+
+def source_range(path: str, slice_length: int):
+    # (starttime, endtime, drill length): the range saved in the GUI for this file if any, otherwise the same optimal
+    # range the GUI starts with
+    range_params = SourceRangeManager().get(filehash_with_cache(path))
+    if range_params is not None:
+        return range_params
+    with AudioFile(path) as af:
+        duration = af.duration
+    slice_length = int(min(duration, slice_length))
+    return 0, optimal_range_length(duration, slice_length), slice_length
+
+
+def source_folder_names(sources: list[str]):
+    # {source: output folder name}: the file name without extension, followed by a short hash of the path for the
+    # sources sharing it (e.g. "song.mp3" and "song.flac", or "01 Intro.flac" of two albums)
+    stems = [Path(source).stem for source in sources]
+    return {source: stem if stems.count(stem) == 1 else
+            f'{stem} [{hashlib.md5(os.path.abspath(source).encode()).hexdigest()[:8]}]'
+            for source, stem in zip(sources, stems)}
+
+
+def pattern_folder_name(num: int, pattern: dict):
+    return f'{num:02d} {_forbidden_filename_chars.sub("_", pattern["Name"])}'
+
+
+def generate_exercises(source: str, pattern_num: int, pattern: dict, output_dir: str, learn=True, test=True,
+                       order='asc', slice_length=12, range_params=None, folder_name=None, callback=None):
+    # range_params: source_range() of the source, if already known; folder_name: the source's output folder name
+    # (default: the file name without extension, see source_folder_names)
+    freqs = EQ1_freq if pattern['EQtype'] == 'EQ1' else EQ2_freq
+    starttime, endtime, drill_length = range_params or source_range(source, slice_length)
+    out_dir = Path(output_dir, folder_name or Path(source).stem, pattern_folder_name(pattern_num, pattern))
+    with AudioFile(source) as af:
+        audiodata = f'"{Path(source).name}" [{af.samplerate / 1000:g} kHz | {af.num_channels}]'
+    kwargs = {'audiodata': audiodata,
+              'EQPattern': pattern['Name'],
+              'boost_cut': pattern['EQ_boost_cut'],
+              'DualBandMode': pattern['DualBandMode'],
+              'starttime': starttime,
+              'endtime': endtime,
+              'drill_length': drill_length,
+              'gain_depth': pattern['Gain_depth'],
+              'Q': Qextr(pattern['BW_Q']),
+              'disableAdjacent': pattern['DisableAdjacentFiltersMode'],
+              'workers': 1,
+              'callback': callback}
+    freq_options = [f for f in freqs if pattern['ActiveFreqRange'][0] <= f <= pattern['ActiveFreqRange'][1]]
+    if learn:
+        makeLearnFiles(source, str(Path(out_dir, 'Learn')), freq_options, order=order, **kwargs)
+    if test:
+        makeTestFiles(source, str(Path(out_dir, 'Test')), freq_options, **kwargs)
+    return str(out_dir)
+
+
+def generate_batch(sources: list[str], patterns: list[tuple[int, dict]], output_dir: str, learn=True, test=True,
+                   order='asc', slice_length=12, workers=None, callback=None):
+    # callback(source, pattern name, output folder or None, error message or None) is called after each job
+    failed = 0
+    ranges = {}
+    for source in sources:
+        try:
+            ranges[source] = source_range(source, slice_length)
+        except Exception as e:
+            for _, P in patterns:
+                failed += 1
+                if callback is not None:
+                    callback(source, P['Name'], None, str(e))
+    folder_names = source_folder_names(sources)
+    jobs_args = [(source, num, P, output_dir, learn, test, order, slice_length, ranges[source], folder_names[source])
+                 for source in ranges for num, P in patterns]
+    if not jobs_args:
+        return 0, failed
+    workers = min(workers or os.cpu_count() or 1, len(jobs_args))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(generate_exercises, *args): args for args in jobs_args}
+        for future in as_completed(futures):
+            source, _, P = futures[future][:3]
+            try:
+                out_dir, error = future.result(), None
+            except Exception as e:
+                out_dir, error = None, str(e)
+                failed += 1
+            if callback is not None:
+                callback(source, P['Name'], out_dir, error)
+    return len(sources) * len(patterns) - failed, failed
@@ -17,6 +17,7 @@
 import copy
 import itertools
 import random
+from collections import deque
 from Utilities.common_calcs import findAdjacentEl as findAdj
 from Model.calc import abs_tuple
 
@@ -35,6 +36,7 @@ class ExampleGenerator:
         self._source_sequence = []
         self.full_sequence = []
         self._lastRandomChoice = None
+        self._randomQueue = deque()  # random choices already made by peek()
         self.cycle = None
         self.inf_cycle = inf_cycle if order != 'random' else True
         self._isLastItemInSeq = None
@@ -45,6 +47,7 @@ class ExampleGenerator:
 
     def seqGen(self, start_freq=None):
         self.cycle = None
+        self._randomQueue.clear()
         return self._dualBandSeqGen(start_freq) if self.DualBandMode else self._singleBandSeqGen(start_freq)
 
     def seqOut(self, start_freq=None):
@@ -65,8 +68,23 @@ class ExampleGenerator:
     def randOut(self):
         if not self.full_sequence:
             self.seqGen()
+        if self._randomQueue:
+            return self._randomQueue.popleft()
         return self._getRand(self.full_sequence)
 
+    def peek(self, num=1):
+        # Returns the next num outputs of seqOut() without consuming them
+        if not self.full_sequence:
+            self.seqGen()
+        if self.order == 'random':
+            while len(self._randomQueue) < num:
+                self._randomQueue.append(self._getRand(self.full_sequence))
+            return list(itertools.islice(self._randomQueue, num))
+        if not self.cycle:
+            return list(itertools.islice(itertools.cycle(self.full_sequence), num))
+        self.cycle, upcoming = itertools.tee(self.cycle)
+        return list(itertools.islice(upcoming, num))
+
     def _singleBandSeqGen(self, start_freq=None):
         self._genSourceSequence()
         start_freq = self._source_sequence[0] if start_freq is None else start_freq
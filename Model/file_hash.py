@@ -15,13 +15,62 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import hashlib
+import os
+import threading
 from functools import partial
 
+_hashes = {}
+_lock = threading.Lock()
 
-def filehash(filepath: str, buffer_size=1024 * 1024 * 50):
-    hash_obj = hashlib.md5
-    content = b''
+
+def filehash(filepath: str, buffer_size=1024 * 1024, fast=False):
+    # fast: BLAKE2 of the file size and a few sampled blocks instead of MD5 of the whole content
+    if fast:
+        return fast_filehash(filepath)
+    hash_obj = hashlib.md5()
     with open(filepath, 'rb') as f:
         for chunk in iter(partial(f.read, buffer_size), b''):
-            content = b''.join([content, chunk])
-    return hash_obj(content).hexdigest()
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+def fast_filehash(filepath: str, block_size=64 * 1024, blocks_num=16):
+    size = os.path.getsize(filepath)
+    hash_obj = hashlib.blake2b(str(size).encode(), digest_size=16)
+    with open(filepath, 'rb') as f:
+        if size <= block_size * blocks_num:
+            hash_obj.update(f.read())
+        else:
+            step = (size - block_size) // (blocks_num - 1)
+            for i in range(blocks_num):
+                f.seek(i * step)
+                hash_obj.update(f.read(block_size))
+    return hash_obj.hexdigest()
+
+
+def _hash_key(filepath: str, fast: bool):
+    stat = os.stat(filepath)
+    return os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns, fast
+
+
+def lookup_filehash(filepath: str, fast=False):
+    # Returns None if the file has not been hashed since it was last modified
+    with _lock:
+        return _hashes.get(_hash_key(filepath, fast))
+
+
+def filehash_with_cache(filepath: str, fast=False):
+    key = _hash_key(filepath, fast)
+    with _lock:
+        if key in _hashes:
+            return _hashes[key]
+    _hash = filehash(filepath, fast=fast)
+    with _lock:
+        _hashes[key] = _hash
+    return _hash
+
+
+def file_fingerprint(filepath: str):
+    # Cheap identity of a file's current content for local caches: no data is read
+    stat = os.stat(filepath)
+    return hashlib.md5(f'{os.path.abspath(filepath)}|{stat.st_size}|{stat.st_mtime_ns}'.encode()).hexdigest()
@@ -15,13 +15,18 @@
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 from pathlib import Path
-from pedalboard.io import AudioFile
+from Model.AudioEngine.drill_export import export_drills
+from Model.AudioEngine.pinknoise_gen import PN_DEFAULT_FORMAT
 from Model.audiodrill_gen import AudioDrillGen
 from Utilities.exceptions import InterruptedException
 from Utilities.freq2str import freqString
 from Model.get_version import version
+from definitions import TEMP_AUDIO_DIR
 
 
+# Pink noise files are always exported at 44.1 kHz mono: they are played on other devices, and MP3 doesn't support
+# sample rates above 48 kHz
+
 tag = [f'\nGenerated with EarQuiz Frequencies v{version()} (c) 2023-2024, Gdaliy Garmiza.\nWebsite: https://earquiz.org']
 
 
@@ -39,7 +44,8 @@ def makeLearnFiles(audiosource: str, output_dir: str, freq_options: list[int], a
                    filename_prefix='', extension='.wav', bitrate=None, boost_cut='+-', DualBandMode=False,
                    starttime=0, endtime=None,
                    drill_length=15, order='asc', gain_depth=12, Q=4.32, disableAdjacent=1, proc_t_perc=40,
-                   cropped=None, cropped_normalized=None, enumerate_examples=False, callback=None):
+                   cropped=None, cropped_normalized=None, enumerate_examples=False, workers=None, callback=None):
+    # workers: number of export processes (None -- CPU count)
     def makeInfoFile():
         tf_name = 'Info.txt'
         info_filename = f'{prefix}__{tf_name}' if prefix else tf_name
@@ -52,29 +58,23 @@ def makeLearnFiles(audiosource: str, output_dir: str, freq_options: list[int], a
     ADGen = AudioDrillGen(freq_options, audio_source_path=audiosource, boost_cut=boost_cut, DualBandMode=DualBandMode,
                           starttime=starttime, endtime=endtime, drill_length=drill_length, gain_depth=gain_depth, Q=Q,
                           disableAdjacent=disableAdjacent, proc_t_perc=proc_t_perc, order=order, inf_cycle=False,
-                          cropped=cropped, cropped_normalized=cropped_normalized,
+                          cropped=cropped, cropped_normalized=cropped_normalized, pn_format=PN_DEFAULT_FORMAT,
                           callback=callback)
-    count = 0
-    filename = ''
+    prefix = f'{filename_prefix}' if filename_prefix else ''
+    jobs = []
     while True:
         try:
-            freq, audio = ADGen.output()
-            prefix = f'{filename_prefix}' if filename_prefix else ''
-            ex_num = f'{count + 1}' if enumerate_examples else ''
-            full_prefix = f"{'.'.join([el for el in [prefix, ex_num] if el])}__" if prefix or ex_num else ''
-            filename = f'{full_prefix}{freqString(freq)}{extension}'
-            filepath = str(Path(output_dir, filename))
-            callback_out(callback, {'State': f'Exporting "{filename}"',
-                          'Percent': int(count / len(ADGen.exercise_gen.full_sequence) * 100)})
+            drill = ADGen.next_drill()
         except StopIteration:
             break
-        except InterruptedException:
-            return
-        with AudioFile(filepath, 'w', samplerate=ADGen.af_samplerate, num_channels=ADGen.af_num_channels,
-                       quality=bitrate) as f:
-            f.write(audio)
-        count += 1
-    callback_out(callback, {'State': f'Exporting "{filename}"', 'Percent': 100})
+        ex_num = f'{len(jobs) + 1}' if enumerate_examples else ''
+        full_prefix = f"{'.'.join([el for el in [prefix, ex_num] if el])}__" if prefix or ex_num else ''
+        filename = f'{full_prefix}{freqString(drill[1])}{extension}'
+        jobs.append((str(Path(output_dir, filename)),) + drill)
+    try:
+        _export(ADGen, jobs, bitrate, workers, callback)
+    except InterruptedException:
+        return
     makeInfoFile()
 
 
@@ -82,7 +82,7 @@ def makeTestFiles(audiosource: str, output_dir: str, freq_options: list[int], au
                   filename_prefix='', extension='.wav', bitrate=None, boost_cut='+-', DualBandMode=False,
                   starttime=0, endtime=None,
                   drill_length=15, gain_depth=12, Q=4.32, disableAdjacent=1, proc_t_perc=40,
-                  cropped=None, cropped_normalized=None, callback=None):
+                  cropped=None, cropped_normalized=None, workers=None, callback=None):
 
     def makeAnswersFile():
         answ_filename = f'{prefix}Answers.txt'
@@ -97,29 +97,25 @@ def makeTestFiles(audiosource: str, output_dir: str, freq_options: list[int], au
     ADGen = AudioDrillGen(freq_options, audio_source_path=audiosource, boost_cut=boost_cut, DualBandMode=DualBandMode,
                           starttime=starttime, endtime=endtime, drill_length=drill_length, gain_depth=gain_depth, Q=Q,
                           disableAdjacent=disableAdjacent, proc_t_perc=proc_t_perc, order='random',
-                          cropped=cropped, cropped_normalized=cropped_normalized,
+                          cropped=cropped, cropped_normalized=cropped_normalized, pn_format=PN_DEFAULT_FORMAT,
                           callback=callback)
-    filename = ''
+    prefix = f'{filename_prefix}__' if filename_prefix else ''
+    jobs = [(str(Path(output_dir, f'{prefix}Example{i + 1}{extension}')),) + ADGen.next_drill() for i in range(10)]
     answers = ['\n']
-    for i in range(10):
-        try:
-            freq, audio = ADGen.output()
-            prefix = f'{filename_prefix}__' if filename_prefix else ''
-            filename = f'{prefix}Example{i + 1}{extension}'
-            filepath = str(Path(output_dir, filename))
-            callback_out(callback, {'State': f'Exporting "{filename}"',
-                          'Percent': int(i * 10)})
-        except InterruptedException:
-            makeAnswersFile()
-            return
-        with AudioFile(filepath, 'w', samplerate=ADGen.af_samplerate, num_channels=ADGen.af_num_channels,
-                       quality=bitrate) as f:
-            f.write(audio)
-        answers.append(f'{i + 1}. {freqString(freq)}\n')
-    callback_out(callback, {'State': f'Exporting "{filename}"', 'Percent': 100})
+    done = []
+    try:
+        _export(ADGen, jobs, bitrate, workers, callback, done=done)
+    except InterruptedException:
+        pass
+    if len(done) < len(jobs):
+        # examples are exported in parallel: a cancelled export may miss any of them, not only the last ones
+        missing = ', '.join(str(i + 1) for i in range(len(jobs)) if i not in done)
+        answers += [f'Export cancelled: {len(done)} of {len(jobs)} examples exported (missing: {missing}).\n\n']
+    answers += [f'{i + 1}. {freqString(jobs[i][2])}\n' for i in sorted(done)]
     makeAnswersFile()
 
 
-def callback_out(callback, out_stat: dict):
-    if callback is not None:
-        callback(out_stat)
+def _export(ADGen: AudioDrillGen, jobs: list[tuple], bitrate, workers, callback, done=None):
+    split = ADGen.audiochunk.cropped_norm_split
+    return export_drills(ADGen.audiochunk.cropped_normalized, ADGen.af_samplerate, split[0].shape[1], jobs,
+                         bitrate=bitrate, workers=workers, tmp_dir=TEMP_AUDIO_DIR, done=done, callback=callback)
@@ -0,0 +1,48 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Qt-free signal for the Model layer. Slots are called synchronously in the emitting thread: GUI code receiving
+# signals emitted from worker threads should connect through GUI.Misc.qt_signal_adapter.QtSignalAdapter.
+
+
+class Signal:
+    def __init__(self):
+        self._slots = []
+        self._blocked = False
+
+    def connect(self, slot):
+        if slot not in self._slots:
+            self._slots.append(slot)
+
+    def disconnect(self, slot=None):
+        if slot is None:
+            self._slots.clear()
+            return
+        try:
+            self._slots.remove(slot)
+        except ValueError:
+            raise TypeError(f'{slot} is not connected') from None
+
+    def emit(self, *args):
+        if self._blocked:
+            return
+        for slot in list(self._slots):
+            slot(*args)
+
+    def block(self, arg: bool):
+        blocked, self._blocked = self._blocked, arg
+        return blocked
@@ -0,0 +1,104 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# The current playlist, stored in an SQLite database with the metadata and canLoad state of every track, so it's
+# restored in one query without resolving the paths or reading the files again. Saving only writes the rows that
+# differ from the last save: appending tracks inserts the new rows, a metadata or canLoad change updates one row,
+# and only an insertion or removal in the middle rewrites the rows after it.
+
+import os
+import sqlite3
+import threading
+from definitions import PlaylistStore_PATH
+
+# (path, metadata or None if not read yet, canLoad)
+Track = tuple[str, dict or None, bool]
+
+
+def _row(track: Track):
+    path, metadata, canLoad = track
+    if metadata is None:
+        return path, 0, None, None, None, int(canLoad)
+    return path, 1, metadata['duration'], metadata['samplerate'], metadata['num_channels'], int(canLoad)
+
+
+def _track(row: tuple):
+    path, probed, duration, samplerate, num_channels, canLoad = row
+    metadata = {'duration': duration, 'samplerate': samplerate, 'num_channels': num_channels} if probed else None
+    return path, metadata, bool(canLoad)
+
+
+class PlaylistStore:
+    def __init__(self, db_path: str = PlaylistStore_PATH):
+        self.db_path = db_path
+        self._db = None
+        self._saved = None  # rows as of the last save or load
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute('CREATE TABLE IF NOT EXISTS tracks (pos INTEGER PRIMARY KEY, path TEXT, probed INTEGER, '
+                             'duration REAL, samplerate INTEGER, num_channels INTEGER, can_load INTEGER)')
+        return self._db
+
+    def exists(self):
+        return os.path.isfile(self.db_path)
+
+    def load(self):
+        # [Track] in playlist order
+        with self._lock:
+            try:
+                rows = self._connect().execute('SELECT path, probed, duration, samplerate, num_channels, can_load '
+                                               'FROM tracks ORDER BY pos').fetchall()
+            except sqlite3.Error:
+                return []
+            self._saved = [tuple(row) for row in rows]
+        return [_track(row) for row in self._saved]
+
+    def save(self, tracks: list[Track]):
+        rows = [_row(track) for track in tracks]
+        with self._lock:
+            try:
+                db = self._connect()
+                if self._saved is None:
+                    self._saved = [tuple(row) for row in db.execute(
+                        'SELECT path, probed, duration, samplerate, num_channels, can_load FROM tracks ORDER BY pos')]
+                saved = self._saved
+                # rows keep their position up to the first path that moved; after it they're rewritten
+                n = min(len(rows), len(saved))
+                common = next((pos for pos in range(n) if rows[pos][0] != saved[pos][0]), n)
+                updated = [(*rows[pos][1:], pos) for pos in range(common) if rows[pos] != saved[pos]]
+                with db:
+                    db.executemany('UPDATE tracks SET probed = ?, duration = ?, samplerate = ?, num_channels = ?, '
+                                   'can_load = ? WHERE pos = ?', updated)
+                    if common < len(saved):
+                        db.execute('DELETE FROM tracks WHERE pos >= ?', (common,))
+                    db.executemany('INSERT INTO tracks VALUES (?, ?, ?, ?, ?, ?, ?)',
+                                   [(pos, *rows[pos]) for pos in range(common, len(rows))])
+                self._saved = rows
+            except sqlite3.Error:
+                self._saved = None
+                return False
+        return True
+
+    def clear(self):
+        self.save([])
+
+
+playlist_store = PlaylistStore()
@@ -0,0 +1,159 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+# Startup tracing: wall time of startup phases and of every module import, written as a JSON report.
+# Enabled with the --trace-startup[=report path] command line flag or the EARQUIZ_STARTUP_TRACE environment variable
+# (report path, or 1 for startup_trace.json in the current folder). Must be imported before the modules to trace.
+
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+
+TRACE_FLAG = '--trace-startup'
+QUIT_FLAG = '--quit-after-startup'
+DEFAULT_REPORT_PATH = 'startup_trace.json'
+
+
+class _LoaderProxy:
+    def __init__(self, loader, tracer):
+        self._loader = loader
+        self._tracer = tracer
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._tracer.importing(module.__name__):
+            self._loader.exec_module(module)
+
+
+class _ImportTimer(MetaPathFinder):
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = _LoaderProxy(spec.loader, self.tracer)
+                return spec
+        return None
+
+
+class StartupTracer:
+    def __init__(self, report_path: str):
+        self.report_path = report_path
+        self.start = time.perf_counter()
+        self.phases = []
+        self.imports = {}  # module: [cumulative s, self s]
+        self._import_stack = []
+        self._finder = _ImportTimer(self)
+        self.finished = False
+        sys.meta_path.insert(0, self._finder)
+
+    def now(self):
+        return time.perf_counter() - self.start
+
+    @contextmanager
+    def importing(self, module: str):
+        start = time.perf_counter()
+        self._import_stack.append(0.0)  # time spent in nested imports
+        try:
+            yield
+        finally:
+            nested = self._import_stack.pop()
+            elapsed = time.perf_counter() - start
+            self.imports[module] = [elapsed, elapsed - nested]
+            if self._import_stack:
+                self._import_stack[-1] += elapsed
+
+    @contextmanager
+    def phase(self, name: str):
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.phases.append({'Name': name, 'Start_ms': round(start * 1000, 2),
+                                'Duration_ms': round((self.now() - start) * 1000, 2)})
+
+    def mark(self, name: str):
+        self.phases.append({'Name': name, 'Start_ms': round(self.now() * 1000, 2), 'Duration_ms': 0})
+
+    def report(self):
+        imports = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)
+        return {'Total_ms': round(self.now() * 1000, 2),
+                'Python': platform.python_version(),
+                'Platform': platform.platform(),
+                'Phases': self.phases,
+                'Imports': [{'Module': module, 'Cumulative_ms': round(cumulative * 1000, 3),
+                             'Self_ms': round(self_time * 1000, 3)} for module, (cumulative, self_time) in imports]}
+
+    def finish(self, name='Startup finished'):
+        if self.finished:
+            return
+        self.finished = True
+        self.mark(name)
+        sys.meta_path.remove(self._finder)
+        with open(self.report_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=1)
+
+
+class _NoTracer:
+    finished = True
+
+    @contextmanager
+    def phase(self, name: str):
+        yield
+
+    def mark(self, name: str):
+        pass
+
+    def finish(self, name=''):
+        pass
+
+
+def _tracer_from_args():
+    # Removes the tracing flags from sys.argv: the remaining arguments are files to open
+    report_path = os.environ.get('EARQUIZ_STARTUP_TRACE') or None
+    for arg in list(sys.argv[1:]):
+        if arg == TRACE_FLAG or arg.startswith(f'{TRACE_FLAG}='):
+            report_path = arg.partition('=')[2] or DEFAULT_REPORT_PATH
+            sys.argv.remove(arg)
+    if report_path == '1':
+        report_path = DEFAULT_REPORT_PATH
+    return StartupTracer(os.path.abspath(report_path)) if report_path else _NoTracer()
+
+
+def _quit_after_startup():
+    if QUIT_FLAG in sys.argv:
+        sys.argv.remove(QUIT_FLAG)
+        return True
+    return False
+
+
+tracer = _tracer_from_args()
+quit_after_startup = _quit_after_startup()
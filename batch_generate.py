@@ -0,0 +1,84 @@
+#    EarQuiz Frequencies. Software for technical ear training on equalization.
+#    Copyright (C) 2023-2024, Gdaliy Garmiza.
+#
+#    This program is free software: you can redistribute it and/or modify
+#    it under the terms of the GNU General Public License as published by
+#    the Free Software Foundation, either version 3 of the License, or
+#    (at your option) any later version.
+#
+#    This program is distributed in the hope that it will be useful,
+#    but WITHOUT ANY WARRANTY; without even the implied warranty of
+#    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#    GNU General Public License for more details.
+#
+#    You should have received a copy of the GNU General Public License
+#    along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+# Headless Learn / Test exercise generation for every source x EQ pattern, e.g.:
+#   python batch_generate.py songs.m3u8 ~/Music/Mixes -p 7 -p "All ten 1-octave bands cut (-)" -o ~/Exercises -j 8
+# Sources: audio files, folders, M3U/PLS/XSPF playlists. Output: <output>/<source>/<NN pattern>/Learn|Test
+
+import argparse
+import sys
+from multiprocessing import freeze_support
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description='Generates EarQuiz Frequencies Learn / Test exercise files.')
+    parser.add_argument('sources', nargs='*', help='audio files, folders or playlists (M3U, PLS, XSPF)')
+    parser.add_argument('-p', '--pattern', action='append', default=[],
+                        help='EQ pattern name or number (repeatable; all patterns by default)')
+    parser.add_argument('-o', '--output', help='output folder (default: the EarQuiz Exercises folder)')
+    kind = parser.add_mutually_exclusive_group()
+    kind.add_argument('--learn-only', action='store_true', help='make Learn files only')
+    kind.add_argument('--test-only', action='store_true', help='make Test files only')
+    parser.add_argument('--order', choices=('asc', 'desc', 'shuffle'), default='asc', help='Learn files order')
+    parser.add_argument('--slice-length', type=int, default=12,
+                        help='drill length in sec for sources without a range saved in the app (default: 12)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--list-patterns', action='store_true', help='print the EQ patterns and exit')
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parse_args(args)
+    from Model.batch_generator import find_patterns, resolve_sources, generate_batch
+    from definitions import EXERCISE_DIR
+
+    if args.list_patterns:
+        for num, P in find_patterns([]):
+            print(f'{num:2d}. {P["Name"]}')
+        return 0
+    if not args.sources:
+        print('No sources given', file=sys.stderr)
+        return 2
+    try:
+        patterns = find_patterns(args.pattern)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    sources, errors = resolve_sources(args.sources)
+    for error in errors:
+        print(f'Skipped: {error}', file=sys.stderr)
+    total = len(sources) * len(patterns)
+    print(f'{len(sources)} source(s) x {len(patterns)} pattern(s): {total} job(s)')
+    done_num = 0
+
+    def report(source: str, pattern_name: str, out_dir: str or None, error: str or None):
+        nonlocal done_num
+        done_num += 1
+        if error is None:
+            print(f'[{done_num}/{total}] {out_dir}')
+        else:
+            print(f'[{done_num}/{total}] Failed: "{source}" / {pattern_name}: {error}', file=sys.stderr)
+
+    succeeded, failed = generate_batch(sources, patterns, args.output or EXERCISE_DIR,
+                                       learn=not args.test_only, test=not args.learn_only, order=args.order,
+                                       slice_length=args.slice_length, workers=args.jobs, callback=report)
+    print(f'Done: {succeeded} succeeded, {failed} failed, {len(errors)} source(s) skipped')
+    return 1 if failed or errors or not sources else 0
+
+
+if __name__ == '__main__':
+    freeze_support()
+    sys.exit(main())
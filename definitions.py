@@ -16,23 +16,17 @@
 
 import os
 import platform
-import sys
-from PyQt6.QtCore import QSettings
-from PyQt6.QtMultimedia import QMediaDevices
-from PyQt6.QtWidgets import QApplication
 
 app_name = 'EarQuiz Frequencies'
 
-app = QApplication(sys.argv)
-MediaDevices = QMediaDevices()
-launch_files_onstart = sys.argv[1:] if len(sys.argv) > 1 else None
-
 ROOT_DIR = os.path.normpath(os.path.dirname(os.path.abspath(__file__)))
-DATA_DIR = ''
 if platform.system() == 'Darwin':
     DATA_DIR = os.path.expanduser('~/Library/Application Support/EarQuiz/Frequencies')
 elif platform.system() == 'Windows':
     DATA_DIR = os.path.normpath(os.path.join(os.path.expandvars('%AppData%'), 'EarQuiz', 'Frequencies'))
+else:  # headless tools (batch_generate.py) on Linux servers
+    DATA_DIR = os.path.join(os.environ.get('XDG_DATA_HOME', os.path.expanduser('~/.local/share')), 'EarQuiz',
+                            'Frequencies')
 SETTINGS_PATH = os.path.normpath(os.path.join(DATA_DIR, 'config.ini'))
 TEMP_AUDIO_DIR = os.path.normpath(os.path.join(DATA_DIR, 'temp_audio'))
 CURRENT_PLAYLIST_PATH = os.path.normpath(os.path.join(DATA_DIR, 'Playlists', 'current.m3u8'))
@@ -45,7 +39,10 @@ SineWaveCalibrationFilename = '1kHz__10kHz__100Hz__15kHz__40Hz Sinus Tones.wav'
 SineWaveCalibrationPath = os.path.normpath(os.path.join(DATA_DIR, 'Audio', SineWaveCalibrationFilename))
 
 SourceRangeLib_DIR = os.path.normpath(os.path.join(DATA_DIR, 'SourceRangeLib'))
-
-Settings = QSettings(SETTINGS_PATH, QSettings.Format.IniFormat)
+PeakIndex_DIR = os.path.normpath(os.path.join(DATA_DIR, 'PeakIndex'))
+DecodedAudio_DIR = os.path.normpath(os.path.join(DATA_DIR, 'DecodedAudio'))
+Pinknoise_DIR = os.path.normpath(os.path.join(DATA_DIR, 'Pinknoise'))
+AudioMetadataCache_PATH = os.path.normpath(os.path.join(DATA_DIR, 'AudioMetadata.sqlite'))
+PlaylistStore_PATH = os.path.normpath(os.path.join(DATA_DIR, 'Playlists', 'current.sqlite'))
 
 PN = 'Pink noise'
@@ -22,12 +22,17 @@ from definitions import ROOT_DIR
 
 # replace with current virtual environment directory name:
 venv_dir = 'venv'
+# Qt Resource Compiler (part of any Qt 6 installation); replace with its full path if it is not on PATH:
+rcc_path = 'rcc'
 
 ui_files = ('GUI/MainWindow/View/mainwindow.ui',
             'GUI/ConvertToWAV_AIFF/convert_dialog_view.ui',
             'GUI/MakeLearnTestFiles/make_learn_test_dialog_view.ui',
             'GUI/About/AboutDialog.ui',)
 
+qrc_files = ('GUI/icons.qrc',
+             'GUI/Help/help_img.qrc',)
+
 script_dir = 'bin' if platform.system() == 'Darwin' else 'Scripts'
 script_path = os.path.normpath(os.path.join(ROOT_DIR, venv_dir, script_dir, 'pyuic6'))
 
@@ -35,3 +40,8 @@ for F in ui_files:
     full_ui_path = os.path.normpath(os.path.join(ROOT_DIR, F))
     py_file = F.replace('.ui', '.py')
     subprocess.run([script_path, full_ui_path, '-o', py_file])
+
+for F in qrc_files:
+    full_qrc_path = os.path.normpath(os.path.join(ROOT_DIR, F))
+    rcc_file = full_qrc_path.replace('.qrc', '.rcc')
+    subprocess.run([rcc_path, '-binary', full_qrc_path, '-o', rcc_file])
@@ -14,20 +14,18 @@
 #    You should have received a copy of the GNU General Public License
 #    along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+# Only the standard library is imported at module level: worker processes started with spawn (Windows, macOS, frozen
+# builds) import this module as __mp_main__ and must not create the GUI runtime. The application is built in run()
+
 from multiprocessing import freeze_support
 import multiprocessing as mp
 import shutil
 import platform
 import os
-from tendo.singleton import SingleInstance
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QTimer
-from GUI.MainWindow.Contr.mw_contr import MainWindowContr
-from GUI.Misc.StartScreen import StartLogo
-from definitions import app, app_name, TEMP_AUDIO_DIR
 
 
 def delTempAudio():
+    from definitions import TEMP_AUDIO_DIR
     shutil.rmtree(TEMP_AUDIO_DIR, ignore_errors=True)
 
 
@@ -38,18 +36,38 @@ def setAudioBackend():
         os.environ['QT_MEDIA_BACKEND'] = 'darwin'
 
 
+def run():
+    from Utilities.startup_trace import tracer, quit_after_startup  # first: traces the imports below
+
+    with tracer.phase('Imports'):
+        from tendo.singleton import SingleInstance
+        from PyQt6.QtGui import QIcon
+        from PyQt6.QtCore import QTimer
+        from GUI.qt_runtime import app  # the QApplication must exist before any widget is created
+        from GUI.MainWindow.Contr.mw_contr import MainWindowContr
+        from GUI.Misc.StartScreen import StartLogo
+        from definitions import app_name
+    with tracer.phase('SingleInstance'):
+        me = SingleInstance()
+    with tracer.phase('Application setup'):
+        QTimer.singleShot(0, StartLogo.show)
+        app.setWindowIcon(QIcon(":Logo/Icons/Logo/EarQuiz_Icon.png"))
+        app.setApplicationDisplayName(app_name)
+        app.setApplicationName(app_name)
+        app.setOrganizationDomain("earquiz.org")
+        setAudioBackend()
+        delTempAudio()
+    with tracer.phase('MainWindowContr'):
+        mw = MainWindowContr()
+    mw.signals.audioSourcesRestored.connect(lambda: tracer.finish('Audio sources restored'))
+    if quit_after_startup:
+        mw.signals.audioSourcesRestored.connect(app.quit)
+    app.aboutToQuit.connect(delTempAudio)
+    app.exec()
+
+
 if __name__ == '__main__':
     freeze_support()
     if platform.system() == 'Darwin':
         mp.set_start_method('fork')
-    me = SingleInstance()
-    QTimer.singleShot(0, StartLogo.show)
-    app.setWindowIcon(QIcon(":Logo/Icons/Logo/EarQuiz_Icon.png"))
-    app.setApplicationDisplayName(app_name)
-    app.setApplicationName(app_name)
-    app.setOrganizationDomain("earquiz.org")
-    setAudioBackend()
-    delTempAudio()
-    mw = MainWindowContr()
-    app.aboutToQuit.connect(delTempAudio)
-    app.exec()
+    run()
@@ -8,7 +8,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('Model/Version/version.json', 'Model/Version'), ('GUI/Help/Data/get_started.md', 'GUI/Help/Data'),
-    ('GUI/About/credits.md', 'GUI/About')],
+    ('GUI/About/credits.md', 'GUI/About'), ('GUI/icons.rcc', 'GUI'), ('GUI/Help/help_img.rcc', 'GUI/Help')],
     hiddenimports=['tendo'],
     hookspath=[],
     hooksconfig={},